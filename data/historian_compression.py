@@ -0,0 +1,296 @@
+"""
+Historian Compression
+
+PI-style data reduction for exported tag data. Every tag passes through the
+two stages a PI server applies before archiving:
+
+1. Exception test (deadband): a sample is reported only if it differs from the
+   last reported value by more than the exception deviation, or the exception
+   maximum time has elapsed. The sample preceding an exception is reported
+   with it so ramps keep their start point.
+2. Swinging-door compression: reported samples are archived only when a
+   straight line from the last archived point can no longer pass within the
+   compression deviation of every sample since (or the compression maximum
+   time has elapsed).
+
+Linear interpolation between archived points reconstructs the original series
+with an absolute error of at most ``2 * exception_deviation +
+compression_deviation`` per tag.
+
+The CompressionBank runs all tags in lockstep with NumPy arrays, so it can be
+fed one collection at a time (online, as a StateManager collection subscriber)
+or driven over an exported DataFrame (offline).
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, List, Mapping, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class CompressionSpec:
+    """Exception and compression settings of one tag (PI excdev/compdev/excmax/compmax)"""
+    exception_deviation: float = 0.0       # Engineering units
+    compression_deviation: float = 0.0     # Engineering units
+    exception_max_seconds: float = 600.0
+    compression_max_seconds: float = 28800.0
+
+    @property
+    def error_bound(self) -> float:
+        """Maximum absolute reconstruction error of linear interpolation"""
+        return 2.0 * self.exception_deviation + self.compression_deviation
+
+
+def _scalar_seconds(time: Any) -> float:
+    if isinstance(time, (int, float, np.number)):
+        return float(time)
+    return pd.Timestamp(time).value / 1e9
+
+
+def to_seconds(times: Any) -> np.ndarray:
+    """Convert datetimes (or numeric seconds) to float seconds"""
+    values = np.asarray(times)
+    if np.issubdtype(values.dtype, np.number):
+        return values.astype(np.float64)
+    return pd.to_datetime(values).to_numpy(dtype='datetime64[ns]').astype(np.int64) / 1e9
+
+
+class CompressionBank:
+    """
+    Exception + swinging-door compression of many numeric tags at once.
+    """
+
+    def __init__(self, specs: Mapping[str, CompressionSpec]):
+        """
+        Initialize compression bank.
+
+        Args:
+            specs: Compression settings per tag (tag order is kept)
+        """
+        self.tags: List[str] = list(specs)
+        self.specs = dict(specs)
+        n = len(self.tags)
+
+        self._excdev = np.array([specs[t].exception_deviation for t in self.tags], dtype=np.float64)
+        self._compdev = np.array([specs[t].compression_deviation for t in self.tags], dtype=np.float64)
+        self._excmax = np.array([specs[t].exception_max_seconds for t in self.tags], dtype=np.float64)
+        self._compmax = np.array([specs[t].compression_max_seconds for t in self.tags], dtype=np.float64)
+
+        # Exception stage: last reported and last seen (possibly unreported) samples
+        self._rep_t = np.full(n, np.nan)
+        self._rep_v = np.full(n, np.nan)
+        self._prev_t = np.full(n, np.nan)
+        self._prev_v = np.full(n, np.nan)
+        self._pending = np.zeros(n, dtype=bool)
+
+        # Compression stage: last archived point, held point and door slopes
+        self._arch_t = np.full(n, np.nan)
+        self._arch_v = np.full(n, np.nan)
+        self._held_t = np.full(n, np.nan)
+        self._held_v = np.full(n, np.nan)
+        self._has_held = np.zeros(n, dtype=bool)
+        self._upper = np.full(n, np.inf)
+        self._lower = np.full(n, -np.inf)
+
+        self.raw_counts = np.zeros(n, dtype=np.int64)
+        self._archive_t: List[List[float]] = [[] for _ in range(n)]
+        self._archive_v: List[List[float]] = [[] for _ in range(n)]
+
+    # ------------------------------------------------------------------
+    # Feeding
+    # ------------------------------------------------------------------
+
+    def update(self, time: Union[float, datetime, np.datetime64], values: Sequence[float]) -> None:
+        """
+        Offer one sample of every tag.
+
+        Args:
+            time: Sample time (datetime or seconds); must increase between calls
+            values: One value per tag in ``tags`` order (NaN = no sample)
+        """
+        t = _scalar_seconds(time)
+        v = np.asarray(values, dtype=np.float64)
+        sampled = ~np.isnan(v)
+        self.raw_counts += sampled
+
+        first = np.isnan(self._rep_t) & sampled
+        with np.errstate(invalid='ignore'):
+            exception = sampled & (first
+                                   | (np.abs(v - self._rep_v) > self._excdev)
+                                   | (t - self._rep_t >= self._excmax))
+
+        # Report the sample preceding an exception so ramps keep their start
+        previous = exception & self._pending
+        if previous.any():
+            self._compress(previous, self._prev_t, self._prev_v)
+        if exception.any():
+            self._compress(exception, t, v)
+            self._rep_t[exception] = t
+            self._rep_v[exception] = v[exception]
+
+        quiet = sampled & ~exception
+        self._prev_t[sampled] = t
+        self._prev_v[sampled] = v[sampled]
+        self._pending[exception] = False
+        self._pending[quiet] = True
+
+    def observe(self, time: Any, row: Mapping[str, Any]) -> None:
+        """
+        Offer one collected row (StateManager collection subscriber signature).
+
+        Args:
+            time: Collection timestamp
+            row: Mapping of tag name to value; missing or non-numeric tags are skipped
+        """
+        values = np.full(len(self.tags), np.nan)
+        for i, tag in enumerate(self.tags):
+            value = row.get(tag)
+            if isinstance(value, (int, float, np.number)):
+                values[i] = value
+        self.update(time, values)
+
+    __call__ = observe
+
+    def _archive(self, mask: np.ndarray, t: np.ndarray, v: np.ndarray) -> None:
+        for i in np.flatnonzero(mask):
+            self._archive_t[i].append(t[i])
+            self._archive_v[i].append(v[i])
+        self._arch_t[mask] = t[mask]
+        self._arch_v[mask] = v[mask]
+
+    def _compress(self, mask: np.ndarray, t: Union[float, np.ndarray], v: np.ndarray) -> None:
+        """Swinging-door step for the tags in ``mask`` receiving reported samples (t, v)."""
+        n = len(self.tags)
+        t = np.broadcast_to(np.asarray(t, dtype=np.float64), (n,))
+
+        first = mask & np.isnan(self._arch_t)
+        if first.any():
+            self._archive(first, t, v)
+            self._upper[first] = np.inf
+            self._lower[first] = -np.inf
+            self._has_held[first] = False
+
+        active = mask & ~first
+        if not active.any():
+            return
+
+        # The doors hold the slopes from the archived point that pass within the
+        # compression deviation of every sample since it. The new sample can replace
+        # the held point only if the line to it stays inside them.
+        with np.errstate(invalid='ignore', divide='ignore'):
+            dt = t - self._arch_t
+            slope = (v - self._arch_v) / dt
+            upper = np.minimum(self._upper, (v + self._compdev - self._arch_v) / dt)
+            lower = np.maximum(self._lower, (v - self._compdev - self._arch_v) / dt)
+            restart = active & self._has_held & ((slope > self._upper) | (slope < self._lower)
+                                                 | (dt > self._compmax))
+
+        if restart.any():
+            # Line leaves the doors: archive the held point and reopen from it
+            self._archive(restart, self._held_t, self._held_v)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                dt = t - self._arch_t
+                upper = np.where(restart, (v + self._compdev - self._arch_v) / dt, upper)
+                lower = np.where(restart, (v - self._compdev - self._arch_v) / dt, lower)
+
+        self._upper[active] = upper[active]
+        self._lower[active] = lower[active]
+        self._held_t[active] = t[active]
+        self._held_v[active] = v[active]
+        self._has_held[active] = True
+
+    def finish(self) -> None:
+        """Close the series: report pending samples and archive held points."""
+        pending = self._pending.copy()
+        if pending.any():
+            self._compress(pending, self._prev_t, self._prev_v)
+            self._pending[:] = False
+        held = self._has_held.copy()
+        if held.any():
+            self._archive(held, self._held_t, self._held_v)
+            self._has_held[:] = False
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    def archive(self, tag: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Archived (seconds, values) of one tag"""
+        i = self.tags.index(tag)
+        return np.asarray(self._archive_t[i]), np.asarray(self._archive_v[i])
+
+    def to_frame(self) -> pd.DataFrame:
+        """Archived points of every tag as a long DataFrame (tag, time, value)"""
+        frames = []
+        for i, tag in enumerate(self.tags):
+            if self._archive_t[i]:
+                frames.append(pd.DataFrame({
+                    'tag': tag,
+                    'time': pd.to_datetime(np.asarray(self._archive_t[i]) * 1e9),
+                    'value': self._archive_v[i],
+                }))
+        if not frames:
+            return pd.DataFrame(columns=['tag', 'time', 'value'])
+        return pd.concat(frames, ignore_index=True).sort_values(['time', 'tag'], kind='stable',
+                                                                ignore_index=True)
+
+    def reconstruct(self, tag: str, times: Any) -> np.ndarray:
+        """
+        Linearly interpolate a tag's archive at the requested times.
+
+        Args:
+            tag: Tag name
+            times: Datetimes or seconds
+
+        Returns:
+            Reconstructed values (NaN outside the archived time span)
+        """
+        arch_t, arch_v = self.archive(tag)
+        seconds = to_seconds(times)
+        if len(arch_t) == 0:
+            return np.full(len(seconds), np.nan)
+        return np.interp(seconds, arch_t, arch_v, left=np.nan, right=np.nan)
+
+    def compression_report(self) -> pd.DataFrame:
+        """
+        Per-tag compression statistics.
+
+        Returns:
+            DataFrame with tag, raw_points, archived_points, compression_ratio and error_bound
+        """
+        archived = np.array([len(a) for a in self._archive_t], dtype=np.int64)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ratio = np.where(archived > 0, self.raw_counts / np.maximum(archived, 1), np.nan)
+        return pd.DataFrame({
+            'tag': self.tags,
+            'raw_points': self.raw_counts,
+            'archived_points': archived,
+            'compression_ratio': ratio,
+            'error_bound': [self.specs[t].error_bound for t in self.tags],
+        })
+
+
+def compress_frame(data: pd.DataFrame, specs: Mapping[str, CompressionSpec],
+                   time_column: str = 'time') -> CompressionBank:
+    """
+    Compress the numeric columns of an exported DataFrame.
+
+    Args:
+        data: Wide DataFrame with a time column and one column per tag
+        specs: Compression settings per column to compress (others are ignored)
+        time_column: Name of the time column
+
+    Returns:
+        Finished CompressionBank holding the archive and per-tag report
+    """
+    tags = [tag for tag in specs if tag in data.columns]
+    bank = CompressionBank({tag: specs[tag] for tag in tags})
+    times = to_seconds(data[time_column].to_numpy())
+    values = data[tags].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+    for time, row in zip(times, values):
+        bank.update(time, row)
+    bank.finish()
+    return bank
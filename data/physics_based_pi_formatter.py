@@ -691,9 +691,12 @@ class PhysicsBasedPIFormatter(PIDataFormatter):
         else:
             return PIDataQuality.GOOD
     
-    def convert_to_pi_format(self, simulation_data: pd.DataFrame) -> pd.DataFrame:
+    def convert_to_pi_format(self, simulation_data: pd.DataFrame, compress: bool = False) -> pd.DataFrame:
         """
         Convert simulation data to PI format using physics-based quality determination
+        
+        With compress=True only the points kept by exception and swinging-door
+        compression are returned (physics validation still sees every row).
         """
         if self.tag_mapping is None or len(self.tag_mapping) == 0:
             sim_vars = [col for col in simulation_data.columns if col != 'time']
@@ -741,7 +744,10 @@ class PhysicsBasedPIFormatter(PIDataFormatter):
                         'PhysicsStatus': physics_validation['overall_status']
                     })
         
-        return pd.DataFrame(pi_records)
+        pi_data = pd.DataFrame(pi_records)
+        if compress:
+            pi_data = self._filter_to_archive(pi_data, self.compress_data(simulation_data))
+        return pi_data
     
     def generate_physics_validation_report(self, pi_data: pd.DataFrame) -> str:
         """Generate a detailed physics validation report"""
@@ -14,6 +14,8 @@ from enum import Enum
 import json
 import warnings
 
+from .historian_compression import CompressionBank, CompressionSpec, compress_frame
+
 
 class PIDataQuality(Enum):
     """PI Data Quality indicators matching OSIsoft PI standards"""
@@ -45,7 +47,12 @@ class PITagConfig:
                  alarm_low: Optional[float] = None,
                  alarm_high: Optional[float] = None,
                  system: str = "NUCLEAR",
-                 subsystem: str = "GENERAL"):
+                 subsystem: str = "GENERAL",
+                 compressing: bool = True,
+                 exception_deviation: Optional[float] = None,
+                 compression_deviation: Optional[float] = None,
+                 exception_max_seconds: float = 600.0,
+                 compression_max_seconds: float = 28800.0):
         self.tag_name = tag_name
         self.description = description
         self.units = units
@@ -58,6 +65,41 @@ class PITagConfig:
         self.alarm_high = alarm_high
         self.system = system
         self.subsystem = subsystem
+        
+        # Historian compression (PI compressing/excdev/compdev/excmax/compmax).
+        # Deviations default to 0.1% / 0.2% of the tag span like a PI server.
+        self.compressing = compressing
+        self.exception_deviation = exception_deviation
+        self.compression_deviation = compression_deviation
+        self.exception_max_seconds = exception_max_seconds
+        self.compression_max_seconds = compression_max_seconds
+    
+    def compression_spec(self) -> Optional[CompressionSpec]:
+        """
+        Resolve the tag's compression settings.
+        
+        Returns:
+            CompressionSpec, or None if the tag is not compressed
+        """
+        if not self.compressing or self.data_type not in ("Float16", "Float32", "Float64", "Int16", "Int32"):
+            return None
+        
+        span = None
+        if self.low_limit is not None and self.high_limit is not None:
+            span = abs(self.high_limit - self.low_limit)
+        exception_deviation = self.exception_deviation
+        if exception_deviation is None:
+            exception_deviation = 0.001 * span if span else 0.0
+        compression_deviation = self.compression_deviation
+        if compression_deviation is None:
+            compression_deviation = 0.002 * span if span else 0.0
+        
+        return CompressionSpec(
+            exception_deviation=exception_deviation,
+            compression_deviation=compression_deviation,
+            exception_max_seconds=self.exception_max_seconds,
+            compression_max_seconds=self.compression_max_seconds,
+        )
 
 
 class PIDataFormatter:
@@ -364,12 +406,97 @@ class PIDataFormatter:
         
         return PIAlarmState.NORMAL
     
-    def convert_to_pi_format(self, simulation_data: pd.DataFrame) -> pd.DataFrame:
+    def _tag_config_for(self, sim_var: str, pi_tag: str) -> PITagConfig:
+        tag_config = self.tag_configs.get(pi_tag)
+        if tag_config is None:
+            # Create default config for unmapped tags
+            tag_config = PITagConfig(pi_tag, f"Unmapped variable {sim_var}", "units")
+        return tag_config
+    
+    def compression_specs(self, simulation_variables: Optional[List[str]] = None) -> Dict[str, CompressionSpec]:
+        """
+        Compression settings keyed by simulation variable name.
+        
+        Args:
+            simulation_variables: Variables to include (default: all mapped variables)
+            
+        Returns:
+            Dictionary mapping simulation variable names to CompressionSpec
+        """
+        specs = {}
+        for sim_var, pi_tag in self.tag_mapping.items():
+            if simulation_variables is not None and sim_var not in simulation_variables:
+                continue
+            spec = self._tag_config_for(sim_var, pi_tag).compression_spec()
+            if spec is not None:
+                specs[sim_var] = spec
+        return specs
+    
+    def compress_data(self, simulation_data: pd.DataFrame) -> CompressionBank:
+        """
+        Apply exception and swinging-door compression to exported simulation data.
+        
+        Args:
+            simulation_data: DataFrame with simulation data (wide, with 'time')
+            
+        Returns:
+            Finished CompressionBank keyed by simulation variable name
+        """
+        if self.tag_mapping is None or len(self.tag_mapping) == 0:
+            sim_vars = [col for col in simulation_data.columns if col != 'time']
+            self.create_tag_mapping(sim_vars)
+        return compress_frame(simulation_data, self.compression_specs(list(simulation_data.columns)))
+    
+    def create_online_compressor(self, state_manager) -> CompressionBank:
+        """
+        Compress tags online while a simulation runs.
+        
+        The returned bank is subscribed to the state manager's collections; call
+        ``finish()`` at the end of the run, then ``compression_report()`` or
+        ``to_frame()``.
+        
+        Args:
+            state_manager: StateManager instance from simulation
+            
+        Returns:
+            CompressionBank keyed by simulation variable name
+        """
+        if self.tag_mapping is None or len(self.tag_mapping) == 0:
+            self.create_tag_mapping(state_manager.get_available_variables())
+        bank = CompressionBank(self.compression_specs())
+        state_manager.subscribe_to_collections(bank.observe)
+        return bank
+    
+    def compression_report(self, bank: CompressionBank) -> pd.DataFrame:
+        """
+        Per-tag compression ratio and reconstruction error bound.
+        
+        Args:
+            bank: Finished CompressionBank from compress_data or create_online_compressor
+            
+        Returns:
+            DataFrame with TagName, SimulationVariable, RawPoints, ArchivedPoints,
+            CompressionRatio and MaxError columns
+        """
+        report = bank.compression_report()
+        return pd.DataFrame({
+            'TagName': [self.tag_mapping.get(tag, tag) for tag in report['tag']],
+            'SimulationVariable': report['tag'],
+            'RawPoints': report['raw_points'],
+            'ArchivedPoints': report['archived_points'],
+            'CompressionRatio': report['compression_ratio'],
+            'MaxError': report['error_bound'],
+        })
+    
+    def convert_to_pi_format(self, simulation_data: pd.DataFrame, compress: bool = False) -> pd.DataFrame:
         """
         Convert simulation data to PI format.
         
         Args:
             simulation_data: DataFrame with simulation data
+            compress: Whether to keep only the points a PI archive would store
+                (exception + swinging-door compression per PITagConfig). Tags
+                that are not compressed keep every sample.
             
         Returns:
             DataFrame in PI format with columns: TagName, Timestamp, Value, Quality, Units, Description, AlarmState
@@ -379,6 +506,9 @@ class PIDataFormatter:
             sim_vars = [col for col in simulation_data.columns if col != 'time']
             self.create_tag_mapping(sim_vars)
         
+        if compress:
+            return self._convert_compressed(simulation_data)
+        
         pi_records = []
         
         for _, row in simulation_data.iterrows():
@@ -410,8 +540,62 @@ class PIDataFormatter:
         
         return pd.DataFrame(pi_records)
     
+    def _convert_compressed(self, simulation_data: pd.DataFrame) -> pd.DataFrame:
+        """PI records of archived points only (see convert_to_pi_format)."""
+        bank = self.compress_data(simulation_data)
+        compressed = set(bank.tags)
+        times = pd.to_datetime(simulation_data['time'])
+        
+        pi_records = []
+        for sim_var, pi_tag in self.tag_mapping.items():
+            if sim_var not in simulation_data.columns:
+                continue
+            tag_config = self._tag_config_for(sim_var, pi_tag)
+            if sim_var in compressed:
+                seconds, values = bank.archive(sim_var)
+                timestamps = pd.to_datetime(seconds * 1e9)
+            else:
+                timestamps, values = times, simulation_data[sim_var].to_numpy()
+            
+            for timestamp, value in zip(timestamps, values):
+                quality = self.determine_data_quality(value, tag_config)
+                alarm_state = self.determine_alarm_state(value, tag_config)
+                pi_records.append({
+                    'TagName': pi_tag,
+                    'Timestamp': timestamp.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
+                    'Value': value,
+                    'Quality': quality.value,
+                    'Units': tag_config.units,
+                    'Description': tag_config.description,
+                    'AlarmState': alarm_state.value,
+                    'System': tag_config.system,
+                    'Subsystem': tag_config.subsystem
+                })
+        
+        pi_data = pd.DataFrame(pi_records)
+        if not pi_data.empty:
+            pi_data = pi_data.sort_values('Timestamp', kind='stable', ignore_index=True)
+        return pi_data
+    
+    def _filter_to_archive(self, pi_data: pd.DataFrame, bank: CompressionBank) -> pd.DataFrame:
+        """Drop PI records of compressed tags that the archive did not keep."""
+        if pi_data.empty:
+            return pi_data
+        # Several simulation variables may feed one PI tag: keep the union
+        archived: Dict[str, set] = {}
+        for sim_var in bank.tags:
+            seconds, _ = bank.archive(sim_var)
+            stamps = pd.to_datetime(seconds * 1e9).strftime('%Y-%m-%d %H:%M:%S.%f').str[:-3]
+            archived.setdefault(self.tag_mapping.get(sim_var, sim_var), set()).update(stamps)
+        
+        keep = np.ones(len(pi_data), dtype=bool)
+        for pi_tag, stamps in archived.items():
+            rows = (pi_data['TagName'] == pi_tag).to_numpy()
+            keep[rows] = pi_data['Timestamp'][rows].isin(stamps).to_numpy()
+        return pi_data[keep].reset_index(drop=True)
+    
     def export_pi_data(self, simulation_data: pd.DataFrame, filename: str, 
-                      format_type: str = "csv") -> None:
+                      format_type: str = "csv", compress: bool = False) -> None:
         """
         Export simulation data in PI format.
         
@@ -419,8 +603,9 @@ class PIDataFormatter:
             simulation_data: DataFrame with simulation data
             filename: Output filename
             format_type: Export format ("csv", "json", "parquet")
+            compress: Whether to export only archived points (see convert_to_pi_format)
         """
-        pi_data = self.convert_to_pi_format(simulation_data)
+        pi_data = self.convert_to_pi_format(simulation_data, compress=compress)
         
         if format_type.lower() == "csv":
             pi_data.to_csv(filename, index=False)
@@ -455,7 +640,12 @@ class PIDataFormatter:
                 'AlarmLow': config.alarm_low,
                 'AlarmHigh': config.alarm_high,
                 'System': config.system,
-                'Subsystem': config.subsystem
+                'Subsystem': config.subsystem,
+                'Compressing': int(config.compressing),
+                'ExcDev': config.exception_deviation,
+                'CompDev': config.compression_deviation,
+                'ExcMax': config.exception_max_seconds,
+                'CompMax': config.compression_max_seconds
             })
         
         tag_db_df = pd.DataFrame(tag_db)
@@ -14,6 +14,9 @@ Usage:
     
     # Run scenarios
     runner = nuclear_simulator.ScenarioRunner()
+
+    # Only warnings and errors on the console (batch data generation)
+    nuclear_simulator.set_verbosity('quiet')
 """
 
 __version__ = "0.1.0"
@@ -25,6 +28,7 @@ from .systems.primary.reactor.heat_sources.reactor_heat_source import ReactorHea
 from .data_gen.runners.scenario_runner import ScenarioRunner
 from .data_gen.runners.maintenance_scenario_runner import MaintenanceScenarioRunner
 from .data_gen.config_engine.composers.comprehensive_composer import ComprehensiveComposer
+from .simulator.sim_logging import set_verbosity, get_verbosity, verbosity
 
 # Make submodules available for advanced users
 from . import simulator
@@ -42,6 +46,11 @@ __all__ = [
     "ScenarioRunner",
     "MaintenanceScenarioRunner",
     "ComprehensiveComposer",
+
+    # Console verbosity
+    "set_verbosity",
+    "get_verbosity",
+    "verbosity",
     
     # Submodules (for advanced users)
     "simulator",
@@ -26,6 +26,7 @@ sys.path.insert(0, str(project_root))
 
 # Import core simulator
 from simulator.core.sim import NuclearPlantSimulator, ControlAction
+from simulator.sim_logging import INFO, get_logger
 from systems.primary.reactor.heat_sources import ConstantHeatSource
 
 # Import secondary system components (use SecondaryReactorPhysics instead of individual components)
@@ -37,6 +38,8 @@ except ImportError:
 # Simple enums for work orders (no longer import from maintenance system)
 from enum import Enum
 
+logger = get_logger(__name__)
+
 class WorkOrderType(Enum):
     PREVENTIVE = "preventive"
     CORRECTIVE = "corrective"
@@ -94,19 +97,19 @@ class MaintenanceScenarioRunner:
         self.duration_hours = self.config['simulation_config']['duration_hours']
         
         # CRITICAL FIX: Validate target action consistency
-        print(f"SCENARIO RUNNER: 🎯 Target action from config: {self.target_action}")
-        print(f"SCENARIO RUNNER: 🏭 Target subsystem from config: {self.target_subsystem}")
-        print(f"SCENARIO RUNNER: 🔧 Subsystem modes: {self.subsystem_modes}")
+        logger.info("SCENARIO RUNNER: 🎯 Target action from config: %s", self.target_action)
+        logger.info("SCENARIO RUNNER: 🏭 Target subsystem from config: %s", self.target_subsystem)
+        logger.info("SCENARIO RUNNER: 🔧 Subsystem modes: %s", self.subsystem_modes)
         
         # Initialize simulator
         self._initialize_simulator()
         
         if self.verbose:
-            print(f"🔧 MaintenanceScenarioRunner initialized")
-            print(f"   Target action: {self.target_action}")
-            print(f"   Target subsystem: {self.target_subsystem}")
-            print(f"   Duration: {self.duration_hours} hours")
-            print(f"   Config validation: ✅ Target action preserved")
+            logger.info("🔧 MaintenanceScenarioRunner initialized")
+            logger.info("   Target action: %s", self.target_action)
+            logger.info("   Target subsystem: %s", self.target_subsystem)
+            logger.info("   Duration: %s hours", self.duration_hours)
+            logger.info("   Config validation: ✅ Target action preserved")
     
     def _load_config(self, config: Union[Dict[str, Any], str, Path]) -> Dict[str, Any]:
         """
@@ -126,7 +129,7 @@ class MaintenanceScenarioRunner:
         if isinstance(config, dict):
             # Already a dictionary - validate and return
             if self.verbose:
-                print(f"📄 Using provided configuration dictionary")
+                logger.info("📄 Using provided configuration dictionary")
             self._validate_config(config)
             return config
         
@@ -140,15 +143,15 @@ class MaintenanceScenarioRunner:
             raise ValueError(f"File must have .yaml or .yml extension: {yaml_path}")
         
         if self.verbose:
-            print(f"📄 Loading YAML configuration from: {yaml_path}")
+            logger.info("📄 Loading YAML configuration from: %s", yaml_path)
         
         try:
             with open(yaml_path, 'r') as f:
                 loaded_config = yaml.safe_load(f)
             
             if self.verbose:
-                print(f"   ✅ Successfully loaded YAML configuration")
-                print(f"   📊 Configuration sections: {len(loaded_config)}")
+                logger.info("   ✅ Successfully loaded YAML configuration")
+                logger.info("   📊 Configuration sections: %s", len(loaded_config))
             
             # Validate the loaded configuration
             self._validate_config(loaded_config)
@@ -202,10 +205,10 @@ class MaintenanceScenarioRunner:
             raise ValueError("simulation_config section missing 'duration_hours' field")
         
         if self.verbose:
-            print(f"   ✅ Configuration validation passed")
-            print(f"   🎯 Target action: {metadata['target_action']}")
-            print(f"   🏭 Target subsystem: {metadata['target_subsystem']}")
-            print(f"   ⏱️ Duration: {sim_config['duration_hours']} hours")
+            logger.info("   ✅ Configuration validation passed")
+            logger.info("   🎯 Target action: %s", metadata['target_action'])
+            logger.info("   🏭 Target subsystem: %s", metadata['target_subsystem'])
+            logger.info("   ⏱️ Duration: %s hours", sim_config['duration_hours'])
     
     def _initialize_simulator(self):
         """Initialize the nuclear plant simulator with maintenance system"""
@@ -247,13 +250,13 @@ class MaintenanceScenarioRunner:
             # by the ComprehensiveComposer, so no post-initialization degradation needed
             
             if self.verbose:
-                print(f"   ✅ Simulator initialized")
-                print(f"   🔥 Heat source: {thermal_power_mw} MW")
-                print(f"   ⏱️ Time step: {time_step_minutes} minutes")
-                print(f"   🔧 Maintenance system: {'Enabled' if self.maintenance_system else 'Disabled'}")
+                logger.info("   ✅ Simulator initialized")
+                logger.info("   🔥 Heat source: %s MW", thermal_power_mw)
+                logger.info("   ⏱️ Time step: %s minutes", time_step_minutes)
+                logger.info("   🔧 Maintenance system: %s", 'Enabled' if self.maintenance_system else 'Disabled')
         
         except Exception as e:
-            print(f"   ❌ Error initializing simulator: {e}")
+            logger.warning("   ❌ Error initializing simulator: %s", e)
             raise
     
     def _initialize_secondary_systems(self):
@@ -274,11 +277,11 @@ class MaintenanceScenarioRunner:
             }
             
             if self.verbose:
-                print(f"   🏭 Secondary systems initialized (simplified)")
+                logger.info("   🏭 Secondary systems initialized (simplified)")
         
         except Exception as e:
             if self.verbose:
-                print(f"   ⚠️ Secondary systems initialization skipped: {e}")
+                logger.warning("   ⚠️ Secondary systems initialization skipped: %s", e)
     
     def _initialize_maintenance_monitoring(self):
         """Initialize maintenance monitoring using the new state manager integration"""
@@ -293,7 +296,7 @@ class MaintenanceScenarioRunner:
                     
                     # NEW: Use the improved state manager integration
                     if self.verbose:
-                        print(f"   🔧 Using new state manager integration for maintenance monitoring")
+                        logger.info("   🔧 Using new state manager integration for maintenance monitoring")
                     
                     # Use the new setup method that leverages state manager as single source of truth
                     if hasattr(self.simulator, 'state_manager'):
@@ -311,39 +314,37 @@ class MaintenanceScenarioRunner:
                         self.maintenance_system = True
                         
                         if self.verbose:
-                            print(f"   ✅ Auto maintenance system configured via state manager")
+                            logger.info("   ✅ Auto maintenance system configured via state manager")
                             
                             # Get auto maintenance status
                             status = self.auto_maintenance_system.get_system_status()
-                            print(f"   📊 Auto maintenance check interval: {status['check_interval_hours']} hours")
-                            print(f"   🚀 Auto execution enabled: {status['auto_execute_enabled']}")
-                            print(f"   📋 Work orders created: {status['work_orders_created']}")
-                            print(f"   🔧 Work orders executed: {status['work_orders_executed']}")
+                            logger.info("   📊 Auto maintenance check interval: %s hours", status['check_interval_hours'])
+                            logger.info("   🚀 Auto execution enabled: %s", status['auto_execute_enabled'])
+                            logger.info("   📋 Work orders created: %s", status['work_orders_created'])
+                            logger.info("   🔧 Work orders executed: %s", status['work_orders_executed'])
                             
                             # Show state manager integration status
                             if 'state_manager_stats' in status:
                                 sm_stats = status['state_manager_stats']
-                                print(f"   🏭 Components registered: {sm_stats.get('registered_components', 0)}")
-                                print(f"   🎯 Maintenance thresholds: {sm_stats.get('maintenance_thresholds', 0)}")
-                                print(f"   🚨 Current violations: {sm_stats.get('threshold_violations', 0)}")
+                                logger.info("   🏭 Components registered: %s", sm_stats.get('registered_components', 0))
+                                logger.info("   🎯 Maintenance thresholds: %s", sm_stats.get('maintenance_thresholds', 0))
+                                logger.info("   🚨 Current violations: %s", sm_stats.get('threshold_violations', 0))
                     else:
                         self.maintenance_system = None
                         if self.verbose:
-                            print(f"   ⚠️ State manager not available")
+                            logger.warning("   ⚠️ State manager not available")
                 else:
                     self.maintenance_system = None
                     if self.verbose:
-                        print(f"   ⚠️ Auto maintenance system not available")
+                        logger.warning("   ⚠️ Auto maintenance system not available")
             else:
                 self.maintenance_system = None
                 if self.verbose:
-                    print(f"   ⚠️ Secondary system not available")
+                    logger.warning("   ⚠️ Secondary system not available")
         
         except Exception as e:
             if self.verbose:
-                print(f"   ⚠️ Maintenance monitoring initialization failed: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.warning("   ⚠️ Maintenance monitoring initialization failed: %s", e, exc_info=True)
             self.maintenance_system = None
     
     def run_scenario(self) -> Dict[str, Any]:
@@ -354,9 +355,9 @@ class MaintenanceScenarioRunner:
             Dictionary containing simulation results
         """
         if self.verbose:
-            print(f"\n🚀 Running maintenance scenario: {self.target_action}")
-            print(f"{'Time (min)':<10} {'Power (%)':<10} {'Maintenance Events':<18} {'Work Orders':<12}")
-            print("-" * 60)
+            logger.info("\n🚀 Running maintenance scenario: %s", self.target_action)
+            logger.info("%-10s %-10s %-18s %-12s", 'Time (min)', 'Power (%)', 'Maintenance Events', 'Work Orders')
+            logger.info("-" * 60)
         
         # PHASE 1 FIX: Calculate simulation parameters using actual dt
         duration_minutes = int(self.duration_hours * 60)
@@ -364,11 +365,11 @@ class MaintenanceScenarioRunner:
         num_steps = int(duration_minutes / dt_minutes)  # Calculate correct number of steps
         
         if self.verbose:
-            print(f"📊 Simulation parameters:")
-            print(f"   Duration: {self.duration_hours} hours ({duration_minutes} minutes)")
-            print(f"   Time step (dt): {dt_minutes} minutes")
-            print(f"   Number of steps: {num_steps}")
-            print(f"   Total simulation time: {num_steps * dt_minutes} minutes")
+            logger.info("📊 Simulation parameters:")
+            logger.info("   Duration: %s hours (%s minutes)", self.duration_hours, duration_minutes)
+            logger.info("   Time step (dt): %s minutes", dt_minutes)
+            logger.info("   Number of steps: %s", num_steps)
+            logger.info("   Total simulation time: %s minutes", num_steps * dt_minutes)
         
         # Generate power profile for correct number of steps
         power_profile = self._generate_power_profile(num_steps)
@@ -377,6 +378,10 @@ class MaintenanceScenarioRunner:
         maintenance_triggered = False
         work_orders_created = 0
         
+        # Table rows are only formatted when they will be written
+        print_interval = max(1, int(10.0 / dt_minutes))  # Print every ~10 minutes of sim time
+        log_rows = self.verbose and logger.isEnabledFor(INFO)
+
         # Run simulation
         start_time = time.time()
         
@@ -405,10 +410,9 @@ class MaintenanceScenarioRunner:
             self._collect_simulation_data(current_time_minutes, result, target_power, maintenance_events)
             
             # PHASE 3 FIX: Print status at appropriate intervals based on simulation time
-            print_interval = max(1, int(10.0 / dt_minutes))  # Print every ~10 minutes of sim time
-            if step % print_interval == 0 and self.verbose:
-                print(f"{current_time_minutes:<10.0f} {self.simulator.state.power_level:<10.1f} "
-                      f"{len(maintenance_events):<18} {work_orders_created:<12}")
+            if step % print_interval == 0 and log_rows:
+                logger.info("%-10.0f %-10.1f %-18d %-12d", current_time_minutes,
+                            self.simulator.state.power_level, len(maintenance_events), work_orders_created)
         
         end_time = time.time()
         execution_time = end_time - start_time
@@ -423,10 +427,10 @@ class MaintenanceScenarioRunner:
             actual_work_orders_executed = auto_status['work_orders_executed']
             
             if self.verbose:
-                print(f"\n🔧 Work Order Count Verification:")
-                print(f"   📊 Scenario runner tracked: {work_orders_created}")
-                print(f"   🎯 Auto maintenance actual: {actual_work_orders_created}")
-                print(f"   ✅ Auto maintenance executed: {actual_work_orders_executed}")
+                logger.info("\n🔧 Work Order Count Verification:")
+                logger.info("   📊 Scenario runner tracked: %s", work_orders_created)
+                logger.info("   🎯 Auto maintenance actual: %s", actual_work_orders_created)
+                logger.info("   ✅ Auto maintenance executed: %s", actual_work_orders_executed)
         
         # CRITICAL FIX: Filter maintenance events and work orders by tracking start time
         filtered_maintenance_events = [
@@ -468,21 +472,21 @@ class MaintenanceScenarioRunner:
         }
         
         if self.verbose:
-            print(f"\n📋 Scenario Results (Filtered by tracking_start_hours={self.tracking_start_hours}):")
-            print(f"   ✅ Success: {results['success']}")
-            print(f"   🔧 Work orders created (filtered): {filtered_work_orders_created}")
-            print(f"   ⚡ Work orders executed: {actual_work_orders_executed}")
-            print(f"   📊 Maintenance events (filtered): {len(filtered_maintenance_events)}")
-            print(f"   ⏱️ Execution time: {execution_time:.1f}s")
+            logger.info("\n📋 Scenario Results (Filtered by tracking_start_hours=%s):", self.tracking_start_hours)
+            logger.info("   ✅ Success: %s", results['success'])
+            logger.info("   🔧 Work orders created (filtered): %s", filtered_work_orders_created)
+            logger.info("   ⚡ Work orders executed: %s", actual_work_orders_executed)
+            logger.info("   📊 Maintenance events (filtered): %s", len(filtered_maintenance_events))
+            logger.info("   ⏱️ Execution time: %.1fs", execution_time)
             
             # Show filtering impact if tracking start time is used
             if self.tracking_start_hours > 0.0:
-                print(f"   📊 Total events before filter: {len(self.maintenance_events)} maintenance, {actual_work_orders_created} work orders")
-                print(f"   📊 Events filtered out: {len(self.maintenance_events) - len(filtered_maintenance_events)} maintenance, {actual_work_orders_created - filtered_work_orders_created} work orders")
+                logger.info("   📊 Total events before filter: %s maintenance, %s work orders", len(self.maintenance_events), actual_work_orders_created)
+                logger.info("   📊 Events filtered out: %s maintenance, %s work orders", len(self.maintenance_events) - len(filtered_maintenance_events), actual_work_orders_created - filtered_work_orders_created)
             
             # Show discrepancy if any
             if work_orders_created != actual_work_orders_created:
-                print(f"   ⚠️ Count discrepancy: scenario tracked {work_orders_created}, actual {actual_work_orders_created}")
+                logger.warning("   ⚠️ Count discrepancy: scenario tracked %s, actual %s", work_orders_created, actual_work_orders_created)
         
         # NEW: Add maintenance effectiveness verification if available
         if self.maintenance_system and hasattr(self, 'auto_maintenance_system') and actual_work_orders_executed > 0:
@@ -490,7 +494,7 @@ class MaintenanceScenarioRunner:
             results['maintenance_effectiveness'] = effectiveness_data
             
             if self.verbose and effectiveness_data:
-                print(f"   📊 Maintenance effectiveness: {effectiveness_data.get('average_effectiveness', 0):.1%}")
+                logger.info("   📊 Maintenance effectiveness: %.1f%%", 100 * effectiveness_data.get('average_effectiveness', 0))
         
         return results
     
@@ -547,7 +551,7 @@ class MaintenanceScenarioRunner:
                 
         except Exception as e:
             if self.verbose:
-                print(f"   ⚠️ Maintenance effectiveness verification failed: {e}")
+                logger.warning("   ⚠️ Maintenance effectiveness verification failed: %s", e)
         
         return effectiveness_data
     
@@ -738,8 +742,8 @@ class MaintenanceScenarioRunner:
                         self._processed_work_order_creations.add(work_order_id)
                         
                         if self.verbose:
-                            print(f"   📋 WORK ORDER CREATED: {work_order_id} for {new_work_order.component_id} at {creation_event['time_hours']:.2f}h")
-                            print(f"       Title: '{new_work_order.title}'")
+                            logger.info("   📋 WORK ORDER CREATED: %s for %s at %.2fh", work_order_id, new_work_order.component_id, creation_event['time_hours'])
+                            logger.info("       Title: '%s'", new_work_order.title)
             
             # Get recently completed work orders from auto maintenance system
             recent_work_orders = self.auto_maintenance_system.get_recent_work_orders(limit=10)
@@ -808,13 +812,11 @@ class MaintenanceScenarioRunner:
                             events.append(event)
                             
                             if self.verbose:
-                                print(f"   🔧 MAINTENANCE ACTION: {event['action_name']} on {event['component_id']} at {completion_time_hours:.2f}h")
+                                logger.info("   🔧 MAINTENANCE ACTION: %s on %s at %.2fh", event['action_name'], event['component_id'], completion_time_hours)
                 
         except Exception as e:
             if self.verbose:
-                print(f"   ⚠️ Warning: Maintenance action check failed: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.warning("Maintenance action check failed: %s", e, exc_info=True)
         
         return events
     
@@ -877,14 +879,14 @@ class MaintenanceScenarioRunner:
                         self._processed_work_order_creations.add(work_order_id)
                         
                         if self.verbose:
-                            print(f"   📋 WORK ORDER CREATED: {work_order_id} for {work_order_dict['component_id']} at {created_time_hours:.2f}h")
+                            logger.info("   📋 WORK ORDER CREATED: %s for %s at %.2fh", work_order_id, work_order_dict['component_id'], created_time_hours)
                 
                 # Update the work order count
                 self._last_work_order_count = current_work_orders
                 
         except Exception as e:
             if self.verbose:
-                print(f"   ⚠️ Warning: Work order creation check failed: {e}")
+                logger.warning("Work order creation check failed: %s", e)
     
     def _track_work_order_status_change(self, work_order_dict: dict, time_hours: float):
         """Track work order status changes"""
@@ -933,7 +935,7 @@ class MaintenanceScenarioRunner:
             self._work_order_status_tracker[work_order_id] = current_status
             
             if self.verbose:
-                print(f"   📋 WORK ORDER STATUS: {work_order_id} {status_change_event['old_status']} → {current_status} at {event_time_hours:.2f}h")
+                logger.info("   📋 WORK ORDER STATUS: %s %s → %s at %.2fh", work_order_id, status_change_event['old_status'], current_status, event_time_hours)
     
     def _get_parameter_threshold(self, component_id: str, parameter: str) -> Optional[float]:
         """Get threshold for a component parameter"""
@@ -997,11 +999,11 @@ class MaintenanceScenarioRunner:
         """Create visualization plots"""
         if not self.enable_plotting:
             if self.verbose:
-                print("📊 Plotting disabled - skipping plot creation")
+                logger.info("📊 Plotting disabled - skipping plot creation")
             return
             
         if not self.simulation_data:
-            print("No simulation data available for plotting")
+            logger.info("No simulation data available for plotting")
             return
         
         df = pd.DataFrame(self.simulation_data)
@@ -1064,7 +1066,7 @@ class MaintenanceScenarioRunner:
             filename = f'maintenance_scenario_{self.target_action}.png'
             plt.savefig(filename, dpi=300, bbox_inches='tight')
             if self.verbose:
-                print(f"📊 Plots saved to {filename}")
+                logger.info("📊 Plots saved to %s", filename)
         
         plt.show()
     
@@ -1088,7 +1090,7 @@ class MaintenanceScenarioRunner:
             time_range = (tracking_start_datetime, self.simulator.state_manager.current_datetime)
             
             if self.verbose:
-                print(f"📊 Applying time range filter: data from {self.tracking_start_hours} hours onwards")
+                logger.info("📊 Applying time range filter: data from %s hours onwards", self.tracking_start_hours)
         
         # Export simulation data using state manager with time range filtering
         filename = f"{filename_prefix}_simulation_data"
@@ -1096,21 +1098,21 @@ class MaintenanceScenarioRunner:
         self.simulator.state_manager.export_by_subcategory('secondary', 'feedwater_FWP-1', f"fwp.csv", time_range=time_range)
         exported_files.append(filename)
         if self.verbose:
-            print(f"📄 Simulation data exported to {filename}")
+            logger.info("📄 Simulation data exported to %s", filename)
         
         # Export maintenance actions (new)
         maintenance_file = self.export_maintenance_actions_csv(filename_prefix)
         if maintenance_file:
             exported_files.append(maintenance_file)
             if self.verbose:
-                print(f"📄 Maintenance actions exported to {maintenance_file}")
+                logger.info("📄 Maintenance actions exported to %s", maintenance_file)
         
         # Export work orders (new)
         work_orders_file = self.export_work_orders_csv(filename_prefix)
         if work_orders_file:
             exported_files.append(work_orders_file)
             if self.verbose:
-                print(f"📄 Work orders exported to {work_orders_file}")
+                logger.info("📄 Work orders exported to %s", work_orders_file)
         
         return exported_files
     
@@ -1151,7 +1153,7 @@ class MaintenanceScenarioRunner:
         # Check if any data remains after filtering
         if not maintenance_data:
             if self.verbose:
-                print(f"📊 No maintenance actions after {self.tracking_start_hours}h - skipping CSV export")
+                logger.info("📊 No maintenance actions after %sh - skipping CSV export", self.tracking_start_hours)
             return None
         
         # Export to CSV
@@ -1160,7 +1162,7 @@ class MaintenanceScenarioRunner:
         df.to_csv(filename, index=False)
         
         if self.verbose and self.tracking_start_hours > 0.0:
-            print(f"📊 Filtered maintenance actions: {len(maintenance_data)} events from {self.tracking_start_hours}h onwards")
+            logger.info("📊 Filtered maintenance actions: %s events from %sh onwards", len(maintenance_data), self.tracking_start_hours)
         
         return filename
 
@@ -1217,7 +1219,7 @@ class MaintenanceScenarioRunner:
         # Check if any data remains after filtering
         if not work_order_data:
             if self.verbose:
-                print(f"📊 No work order events after {self.tracking_start_hours}h - skipping CSV export")
+                logger.info("📊 No work order events after %sh - skipping CSV export", self.tracking_start_hours)
             return None
         
         # Export to CSV
@@ -1226,7 +1228,7 @@ class MaintenanceScenarioRunner:
         df.to_csv(filename, index=False)
         
         if self.verbose and self.tracking_start_hours > 0.0:
-            print(f"📊 Filtered work orders: {len(work_order_data)} events from {self.tracking_start_hours}h onwards")
+            logger.info("📊 Filtered work orders: %s events from %sh onwards", len(work_order_data), self.tracking_start_hours)
         
         return filename
 
@@ -1424,7 +1426,7 @@ class MaintenanceScenarioRunner:
                         })
         except Exception as e:
             if self.verbose:
-                print(f"   ⚠️ Steam generator monitoring error: {e}")
+                logger.warning("   ⚠️ Steam generator monitoring error: %s", e)
         
         return events
     
@@ -1467,7 +1469,7 @@ class MaintenanceScenarioRunner:
                         })
         except Exception as e:
             if self.verbose:
-                print(f"   ⚠️ Turbine monitoring error: {e}")
+                logger.warning("   ⚠️ Turbine monitoring error: %s", e)
         
         return events
     
@@ -1522,7 +1524,7 @@ class MaintenanceScenarioRunner:
                             })
         except Exception as e:
             if self.verbose:
-                print(f"   ⚠️ Feedwater monitoring error: {e}")
+                logger.warning("   ⚠️ Feedwater monitoring error: %s", e)
         
         return events
     
@@ -1562,7 +1564,7 @@ class MaintenanceScenarioRunner:
                     })
         except Exception as e:
             if self.verbose:
-                print(f"   ⚠️ Condenser monitoring error: {e}")
+                logger.warning("   ⚠️ Condenser monitoring error: %s", e)
         
         return events
     
@@ -14,12 +14,16 @@ Features:
 """
 
 import argparse
+import os
+import random
 import sys
 import time
 import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime
+import numpy as np
 import yaml
 
 # Add project root to path
@@ -37,9 +41,39 @@ from config_engine.composers.comprehensive_composer import (
 # Import simulation infrastructure
 from runners.maintenance_scenario_runner import MaintenanceScenarioRunner
 from simulator.core.sim import NuclearPlantSimulator
+from simulator.core.equilibrium_cache import configure_equilibrium_cache, get_equilibrium_cache
+from simulator.sim_logging import get_logger, set_verbosity
 
 # No longer import maintenance actions - use conditions files only
 
+logger = get_logger(__name__)
+
+# Scenario runner of a batch worker process (created once per worker by _init_batch_worker)
+_worker_runner = None
+
+
+def _seed_run(seed: Optional[int]) -> None:
+    """Seed the global RNGs used by the simulation models for one run"""
+    if seed is not None:
+        random.seed(seed)
+        np.random.seed(seed % 2**32)
+
+
+def _init_batch_worker(output_dir: str, enable_plotting: bool, equilibrium_cache_path: Optional[str] = None) -> None:
+    """Process pool initializer: one quiet ScenarioRunner per worker process"""
+    global _worker_runner
+    set_verbosity('quiet')
+    if equilibrium_cache_path is not None:
+        # Share steady-state solves with the parent and the other workers
+        configure_equilibrium_cache(equilibrium_cache_path)
+    _worker_runner = ScenarioRunner(output_dir=output_dir, verbose=False, enable_plotting=enable_plotting)
+
+
+def _run_batch_task(method_name: str, task_kwargs: Dict[str, Any], seed: Optional[int]) -> Dict[str, Any]:
+    """Run one batch scenario in a worker process"""
+    _seed_run(seed)
+    return getattr(_worker_runner, method_name)(**task_kwargs)
+
 
 class ScenarioRunner:
     """
@@ -68,9 +102,9 @@ class ScenarioRunner:
         self.results = []
         
         if self.verbose:
-            print("🚀 Scenario Runner Initialized")
-            print(f"   📁 Output directory: {self.output_dir}")
-            print(f"   🔧 Maintenance actions available: {len(self.maintenance_composer.list_available_actions())}")
+            logger.info("🚀 Scenario Runner Initialized")
+            logger.info("   📁 Output directory: %s", self.output_dir)
+            logger.info("   🔧 Maintenance actions available: %s", len(self.maintenance_composer.list_available_actions()))
     
     def generate_maintenance_scenario(
         self,
@@ -95,7 +129,7 @@ class ScenarioRunner:
             Complete configuration dictionary
         """
         if self.verbose:
-            print(f"🔧 Generating maintenance scenario for: {action}")
+            logger.info("🔧 Generating maintenance scenario for: %s", action)
         
         try:
             # Determine target subsystem for the action
@@ -114,13 +148,13 @@ class ScenarioRunner:
             )
             
             if self.verbose:
-                print(f"   ✅ Generated config with {len(config)} sections")
-                print(f"   🎯 Target subsystem: {config['metadata']['target_subsystem']}")
+                logger.info("   ✅ Generated config with %s sections", len(config))
+                logger.info("   🎯 Target subsystem: %s", config['metadata']['target_subsystem'])
             
             return config
             
         except Exception as e:
-            print(f"   ❌ Error generating maintenance scenario: {e}")
+            logger.warning("   ❌ Error generating maintenance scenario: %s", e)
             raise
     
     def generate_combined_maintenance_scenario(
@@ -149,7 +183,7 @@ class ScenarioRunner:
             Complete configuration dictionary with combined initial conditions (maximum values)
         """
         if self.verbose:
-            print(f"🔧 Generating combined maintenance scenario for: {actions}")
+            logger.info("🔧 Generating combined maintenance scenario for: %s", actions)
         
         try:
             # 1. Get initial conditions for each action with different seeds
@@ -162,13 +196,13 @@ class ScenarioRunner:
                 individual_conditions.append(conditions)
                 
                 if self.verbose:
-                    print(f"   📋 Action {i+1}/{len(actions)} ({action}): {len(conditions)} parameters")
+                    logger.info("   📋 Action %s/%s (%s): %s parameters", i+1, len(actions), action, len(conditions))
             
             # 2. Take maximum overlapping parameters
             maxed_conditions = self._max_initial_conditions(individual_conditions)
             
             if self.verbose:
-                print(f"   🔀 Maxed conditions: {len(maxed_conditions)} parameters")
+                logger.info("   🔀 Maxed conditions: %s parameters", len(maxed_conditions))
             
             # 3. Create combined configuration using maxed conditions
             combined_config = self._create_combined_config(
@@ -176,13 +210,13 @@ class ScenarioRunner:
             )
             
             if self.verbose:
-                print(f"   ✅ Generated combined config with {len(combined_config)} sections")
-                print(f"   🎯 Target actions: {actions}")
+                logger.info("   ✅ Generated combined config with %s sections", len(combined_config))
+                logger.info("   🎯 Target actions: %s", actions)
             
             return combined_config
             
         except Exception as e:
-            print(f"   ❌ Error generating combined maintenance scenario: {e}")
+            logger.warning("   ❌ Error generating combined maintenance scenario: %s", e)
             raise
     
     def _get_action_initial_conditions(
@@ -458,7 +492,7 @@ class ScenarioRunner:
                         applied_count += 1
                 
                 if self.verbose:
-                    print(f"   ✅ Applied {applied_count} averaged parameters to {primary_subsystem}")
+                    logger.info("   ✅ Applied %s averaged parameters to %s", applied_count, primary_subsystem)
         
         # Update metadata
         config['metadata'] = {
@@ -508,7 +542,8 @@ class ScenarioRunner:
         tracking_start_hours: float = 0.0,
         randomize: bool = False,
         randomization_seed: Optional[int] = None,
-        randomization_factor: float = 0.1
+        randomization_factor: float = 0.1,
+        run_name: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Generate and run a maintenance-targeted scenario
@@ -522,6 +557,7 @@ class ScenarioRunner:
             randomize: Enable randomization of initial conditions
             randomization_seed: Random seed for reproducibility (different seeds used for each action)
             randomization_factor: Randomization factor for parameter variation
+            run_name: Run name for output files (default: action(s) and timestamp)
             
         Returns:
             Simulation results
@@ -532,17 +568,18 @@ class ScenarioRunner:
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         primary_action = actions[0]  # Use first action for naming
-        if len(actions) == 1:
-            run_name = f"{primary_action}_{timestamp}"
-        else:
-            run_name = f"multi_action_{len(actions)}_{timestamp}"
+        if run_name is None:
+            if len(actions) == 1:
+                run_name = f"{primary_action}_{timestamp}"
+            else:
+                run_name = f"multi_action_{len(actions)}_{timestamp}"
         
         if self.verbose:
             if len(actions) == 1:
-                print(f"\n🎯 Running Maintenance Scenario: {primary_action}")
+                logger.info("\n🎯 Running Maintenance Scenario: %s", primary_action)
             else:
-                print(f"\n🎯 Running Multi-Action Maintenance Scenario: {actions}")
-            print("=" * 60)
+                logger.info("\n🎯 Running Multi-Action Maintenance Scenario: %s", actions)
+            logger.info("=" * 60)
         
         # Generate configuration (single or combined)
         if len(actions) == 1:
@@ -573,7 +610,7 @@ class ScenarioRunner:
             with open(config_file, 'w') as f:
                 yaml.dump(config, f, default_flow_style=False, sort_keys=False, indent=2)
             if self.verbose:
-                print(f"   💾 Saved config: {config_file}")
+                logger.info("   💾 Saved config: %s", config_file)
         
         # Create run directory
         run_dir = self.output_dir / run_name
@@ -638,9 +675,7 @@ class ScenarioRunner:
                 os.chdir(original_cwd)
                 
         except Exception as e:
-            print(f"   ❌ Error running simulation: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error("   ❌ Error running simulation: %s", e, exc_info=True)
             raise
     
     def run_operational_scenario(
@@ -667,7 +702,10 @@ class ScenarioRunner:
         actions: List[str],
         duration_hours: float = 2.0,
         count_per_action: int = 1,
-        aggressive_mode: bool = True
+        aggressive_mode: bool = True,
+        workers: int = 1,
+        seed: Optional[int] = None,
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None
     ) -> List[Dict[str, Any]]:
         """
         Run multiple maintenance scenarios in batch
@@ -677,49 +715,128 @@ class ScenarioRunner:
             duration_hours: Simulation duration for each run
             count_per_action: Number of runs per action
             aggressive_mode: Use aggressive thresholds
+            workers: Number of worker processes (1 runs serially in this process)
+            seed: Base random seed; run i is seeded with seed + i
+            on_result: Called with each run's results as soon as it completes
             
         Returns:
-            List of results for all runs
+            List of results for all successful runs, in run order
         """
         if self.verbose:
-            print(f"\n🔄 Running Batch Maintenance Scenarios")
-            print("=" * 60)
-            print(f"   Actions: {len(actions)}")
-            print(f"   Runs per action: {count_per_action}")
-            print(f"   Total runs: {len(actions) * count_per_action}")
-        
-        batch_results = []
-        total_runs = len(actions) * count_per_action
-        current_run = 0
-        
+            logger.info("\n🔄 Running Batch Maintenance Scenarios")
+            logger.info("=" * 60)
+            logger.info("   Actions: %s", len(actions))
+            logger.info("   Runs per action: %s", count_per_action)
+            logger.info("   Total runs: %s", len(actions) * count_per_action)
+        
+        batch_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        tasks = []
         for action in actions:
             for run_idx in range(count_per_action):
-                current_run += 1
-                if self.verbose:
-                    print(f"\n[{current_run}/{total_runs}] Running {action} (run {run_idx + 1})")
-                
-                try:
-                    result = self.run_maintenance_scenario(
-                        action=action,
-                        duration_hours=duration_hours,
-                        aggressive_mode=aggressive_mode
-                    )
-                    batch_results.append(result)
-                    
-                except Exception as e:
-                    print(f"   ❌ Failed: {e}")
-                    # Continue with next run
-                    continue
+                label = f"{action} (run {run_idx + 1})"
+                tasks.append((label, {
+                    'actions': action,
+                    'duration_hours': duration_hours,
+                    'aggressive_mode': aggressive_mode,
+                    'run_name': f"{action}_run{run_idx + 1}_{batch_timestamp}"
+                }))
+        
+        batch_results = self._run_batch('_run_maintenance_batch_task', tasks, workers, seed, on_result)
         
         if self.verbose:
             self._print_batch_summary(batch_results)
         
         return batch_results
     
+    def _run_maintenance_batch_task(self, **kwargs) -> Dict[str, Any]:
+        """Run one batch maintenance scenario and return only its results"""
+        results, _ = self.run_maintenance_scenario(**kwargs)
+        return results
+    
+    def _run_batch(
+        self,
+        method_name: str,
+        tasks: List[Tuple[str, Dict[str, Any]]],
+        workers: int = 1,
+        seed: Optional[int] = None,
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run batch tasks serially or over a process pool
+        
+        Every task gets its own seed (seed + task index) so a batch gives the
+        same results for any number of workers. Unseeded batches on worker
+        processes get fresh per-task seeds, since forked workers inherit the
+        parent's RNG state. A failing task is logged and left out of the
+        results without affecting the others.
+        
+        Args:
+            method_name: ScenarioRunner method that runs one task
+            tasks: (label, keyword arguments) per task
+            workers: Number of worker processes (1 runs serially in this process)
+            seed: Base random seed (None: unseeded serial runs, fresh seeds per worker run)
+            on_result: Called with each task's results as soon as it completes
+            
+        Returns:
+            Results of all successful tasks, in task order
+        """
+        task_seeds = [None if seed is None else seed + index for index in range(len(tasks))]
+        results_by_index = {}
+        
+        def finished(index: int, result: Dict[str, Any]) -> None:
+            results_by_index[index] = result
+            if on_result is not None:
+                on_result(result)
+        
+        if workers <= 1 or len(tasks) <= 1:
+            for index, (label, task_kwargs) in enumerate(tasks):
+                if self.verbose:
+                    logger.info("\n[%s/%s] Running %s", index + 1, len(tasks), label)
+                try:
+                    _seed_run(task_seeds[index])
+                    finished(index, getattr(self, method_name)(**task_kwargs))
+                except Exception as e:
+                    logger.warning("   ❌ Failed: %s: %s", label, e)
+        else:
+            workers = min(workers, len(tasks))
+            if seed is None:
+                task_seeds = [int(child.generate_state(1)[0])
+                              for child in np.random.SeedSequence().spawn(len(tasks))]
+            if self.verbose:
+                logger.info("\n⚙️  Distributing %s runs over %s worker processes", len(tasks), workers)
+            
+            cache_path = get_equilibrium_cache().path
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                     initargs=(str(self.output_dir.resolve()), self.enable_plotting,
+                                               str(cache_path) if cache_path is not None else None)) as executor:
+                futures = {
+                    executor.submit(_run_batch_task, method_name, task_kwargs, task_seeds[index]): index
+                    for index, (_, task_kwargs) in enumerate(tasks)
+                }
+                for completed, future in enumerate(as_completed(futures), 1):
+                    index = futures[future]
+                    label = tasks[index][0]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.warning("   ❌ [%s/%s] Failed: %s: %s", completed, len(tasks), label, e)
+                        continue
+                    finished(index, result)
+                    if self.verbose:
+                        logger.info("   ✅ [%s/%s] %s: %s work orders in %.1fs", completed, len(tasks), label,
+                                    result.get('work_orders', {}).get('total_created', 0),
+                                    result.get('execution_time_seconds', 0.0))
+            
+            # Serial runs record their results on this runner; do the same for worker runs
+            self.results.extend(results_by_index[index] for index in sorted(results_by_index))
+        
+        return [results_by_index[index] for index in sorted(results_by_index)]
+    
     def run_from_yaml_file(
         self,
         yaml_path: Union[str, Path],
-        save_results: bool = True
+        save_results: bool = True,
+        run_name: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         PHASE 2: Run scenario from YAML configuration file
@@ -727,6 +844,7 @@ class ScenarioRunner:
         Args:
             yaml_path: Path to YAML configuration file
             save_results: Save results and plots
+            run_name: Run name for output files (default: target action and timestamp)
             
         Returns:
             Simulation results dictionary
@@ -734,8 +852,8 @@ class ScenarioRunner:
         yaml_path = Path(yaml_path)
         
         if self.verbose:
-            print(f"\n📄 Running scenario from YAML file: {yaml_path}")
-            print("=" * 60)
+            logger.info("\n📄 Running scenario from YAML file: %s", yaml_path)
+            logger.info("=" * 60)
         
         try:
             # Create MaintenanceScenarioRunner with YAML file
@@ -747,8 +865,9 @@ class ScenarioRunner:
             duration_hours = simulation.duration_hours
             
             # Create run directory
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            run_name = f"{target_action}_yaml_{timestamp}"
+            if run_name is None:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                run_name = f"{target_action}_yaml_{timestamp}"
             run_dir = self.output_dir / run_name
             run_dir.mkdir(exist_ok=True)
             
@@ -803,16 +922,17 @@ class ScenarioRunner:
                 os.chdir(original_cwd)
                 
         except Exception as e:
-            print(f"   ❌ Error running YAML scenario: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error("   ❌ Error running YAML scenario: %s", e, exc_info=True)
             raise
     
     def run_batch_from_yaml_directory(
         self,
         yaml_dir: Union[str, Path],
         pattern: str = "*.yaml",
-        save_results: bool = True
+        save_results: bool = True,
+        workers: int = 1,
+        seed: Optional[int] = None,
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None
     ) -> List[Dict[str, Any]]:
         """
         PHASE 2: Run multiple scenarios from YAML files in a directory
@@ -821,9 +941,12 @@ class ScenarioRunner:
             yaml_dir: Directory containing YAML files
             pattern: File pattern to match (default: "*.yaml")
             save_results: Save results and plots for each scenario
+            workers: Number of worker processes (1 runs serially in this process)
+            seed: Base random seed; the i-th file (sorted by name) is seeded with seed + i
+            on_result: Called with each scenario's results as soon as it completes
             
         Returns:
-            List of results for all scenarios
+            List of results for all successful scenarios, in file order
         """
         yaml_dir = Path(yaml_dir)
         
@@ -831,32 +954,26 @@ class ScenarioRunner:
             raise FileNotFoundError(f"YAML directory not found: {yaml_dir}")
         
         # Find YAML files
-        yaml_files = list(yaml_dir.glob(pattern))
+        yaml_files = sorted(yaml_dir.glob(pattern))
         if not yaml_files:
-            print(f"⚠️ No YAML files found in {yaml_dir} matching pattern '{pattern}'")
+            logger.warning("⚠️ No YAML files found in %s matching pattern '%s'", yaml_dir, pattern)
             return []
         
         if self.verbose:
-            print(f"\n📁 Running batch scenarios from YAML directory: {yaml_dir}")
-            print("=" * 70)
-            print(f"   Pattern: {pattern}")
-            print(f"   Files found: {len(yaml_files)}")
-            print(f"   Save results: {save_results}")
+            logger.info("\n📁 Running batch scenarios from YAML directory: %s", yaml_dir)
+            logger.info("=" * 70)
+            logger.info("   Pattern: %s", pattern)
+            logger.info("   Files found: %s", len(yaml_files))
+            logger.info("   Save results: %s", save_results)
         
-        batch_results = []
+        batch_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        tasks = [(yaml_file.name, {
+            'yaml_path': str(yaml_file.resolve()),
+            'save_results': save_results,
+            'run_name': f"{yaml_file.stem}_yaml_{batch_timestamp}"
+        }) for yaml_file in yaml_files]
         
-        for i, yaml_file in enumerate(yaml_files, 1):
-            if self.verbose:
-                print(f"\n[{i}/{len(yaml_files)}] Processing: {yaml_file.name}")
-            
-            try:
-                result = self.run_from_yaml_file(yaml_file, save_results=save_results)
-                batch_results.append(result)
-                
-            except Exception as e:
-                print(f"   ❌ Failed to process {yaml_file.name}: {e}")
-                # Continue with next file
-                continue
+        batch_results = self._run_batch('run_from_yaml_file', tasks, workers, seed, on_result)
         
         if self.verbose:
             self._print_yaml_batch_summary(batch_results, yaml_dir)
@@ -876,63 +993,63 @@ class ScenarioRunner:
         yaml_path = Path(yaml_path)
         
         if self.verbose:
-            print(f"\n🔍 Validating YAML configuration: {yaml_path}")
+            logger.info("\n🔍 Validating YAML configuration: %s", yaml_path)
         
         try:
             # Try to create MaintenanceScenarioRunner (validation happens in constructor)
             simulation = MaintenanceScenarioRunner(yaml_path, verbose=False)
             
             if self.verbose:
-                print(f"   ✅ YAML configuration is valid")
-                print(f"   🎯 Target action: {simulation.target_action}")
-                print(f"   🏭 Target subsystem: {simulation.target_subsystem}")
-                print(f"   ⏱️ Duration: {simulation.duration_hours} hours")
+                logger.info("   ✅ YAML configuration is valid")
+                logger.info("   🎯 Target action: %s", simulation.target_action)
+                logger.info("   🏭 Target subsystem: %s", simulation.target_subsystem)
+                logger.info("   ⏱️ Duration: %s hours", simulation.duration_hours)
             
             return True
             
         except Exception as e:
             if self.verbose:
-                print(f"   ❌ YAML configuration is invalid: {e}")
+                logger.warning("   ❌ YAML configuration is invalid: %s", e)
             return False
     
     def _print_yaml_results(self, results: Dict[str, Any], simulation: MaintenanceScenarioRunner):
         """Print YAML scenario results"""
-        print(f"\n📋 YAML Scenario Results")
-        print("-" * 40)
-        print(f"   📄 YAML file: {Path(results['yaml_file']).name}")
-        print(f"   ⏱️ Execution time: {results['execution_time_seconds']:.1f}s")
-        print(f"   📁 Output directory: {results['run_directory']}")
-        print(f"   ✅ Success: {results['success']}")
-        print(f"   🔧 Work orders created: {results['work_orders']['total_created']}")
-        print(f"   ✅ Work orders completed: {results['work_orders']['completed']}")
-        print(f"   📊 Data points: {results['simulation_data_points']}")
-        print(f"   📊 Maintenance events: {results['maintenance_events']}")
-        print(f"   ⚡ Final power: {results['final_power_level']:.1f}%")
+        logger.info("\n📋 YAML Scenario Results")
+        logger.info("-" * 40)
+        logger.info("   📄 YAML file: %s", Path(results['yaml_file']).name)
+        logger.info("   ⏱️ Execution time: %.1fs", results['execution_time_seconds'])
+        logger.info("   📁 Output directory: %s", results['run_directory'])
+        logger.info("   ✅ Success: %s", results['success'])
+        logger.info("   🔧 Work orders created: %s", results['work_orders']['total_created'])
+        logger.info("   ✅ Work orders completed: %s", results['work_orders']['completed'])
+        logger.info("   📊 Data points: %s", results['simulation_data_points'])
+        logger.info("   📊 Maintenance events: %s", results['maintenance_events'])
+        logger.info("   ⚡ Final power: %.1f%%", results['final_power_level'])
     
     def _print_yaml_batch_summary(self, batch_results: List[Dict[str, Any]], yaml_dir: Path):
         """Print YAML batch execution summary"""
-        print(f"\n📊 YAML Batch Summary")
-        print("=" * 50)
-        print(f"   📁 Directory: {yaml_dir}")
-        print(f"   📄 Total YAML files processed: {len(batch_results)}")
+        logger.info("\n📊 YAML Batch Summary")
+        logger.info("=" * 50)
+        logger.info("   📁 Directory: %s", yaml_dir)
+        logger.info("   📄 Total YAML files processed: %s", len(batch_results))
         
         if batch_results:
             successful_runs = sum(1 for r in batch_results if r.get('success', False))
-            print(f"   ✅ Successful runs: {successful_runs}/{len(batch_results)} ({successful_runs/len(batch_results):.1%})")
+            logger.info("   ✅ Successful runs: %s/%s (%.1f%%)", successful_runs, len(batch_results), 100 * (successful_runs/len(batch_results)))
             
             total_work_orders = sum(r.get('work_orders', {}).get('total_created', 0) for r in batch_results)
-            print(f"   🔧 Total work orders: {total_work_orders}")
+            logger.info("   🔧 Total work orders: %s", total_work_orders)
             
             avg_execution_time = sum(r['execution_time_seconds'] for r in batch_results) / len(batch_results)
-            print(f"   ⏱️ Average execution time: {avg_execution_time:.1f}s")
+            logger.info("   ⏱️ Average execution time: %.1fs", avg_execution_time)
             
             # Show top performing scenarios
-            print(f"\n🏆 Top Performing Scenarios:")
+            logger.info("\n🏆 Top Performing Scenarios:")
             sorted_results = sorted(batch_results, key=lambda r: r.get('work_orders', {}).get('total_created', 0), reverse=True)
             for i, result in enumerate(sorted_results[:3]):
                 wo_count = result.get('work_orders', {}).get('total_created', 0)
                 yaml_name = Path(result['yaml_file']).name
-                print(f"   {i+1}. {yaml_name}: {wo_count} work orders")
+                logger.info("   %s. %s: %s work orders", i+1, yaml_name, wo_count)
     
     def run_all_actions(
         self,
@@ -941,7 +1058,10 @@ class ScenarioRunner:
         aggressive_mode: bool = True,
         subsystem_filter: Optional[str] = None,
         exclude_actions: Optional[List[str]] = None,
-        parallel: bool = False
+        parallel: bool = False,
+        workers: int = 1,
+        seed: Optional[int] = None,
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None
     ) -> List[Dict[str, Any]]:
         """
         Run ALL available maintenance actions
@@ -952,11 +1072,17 @@ class ScenarioRunner:
             aggressive_mode: Use aggressive thresholds
             subsystem_filter: Only run actions for specific subsystem
             exclude_actions: List of actions to skip
-            parallel: Run actions in parallel (future enhancement)
+            parallel: Use one worker process per CPU (unless workers is given)
+            workers: Number of worker processes (1 runs serially in this process)
+            seed: Base random seed; run i is seeded with seed + i
+            on_result: Called with each run's results as soon as it completes
             
         Returns:
             List of results for all runs
         """
+        if parallel and workers <= 1:
+            workers = os.cpu_count() or 1
+        
         # Get all available actions
         all_actions = self.list_available_actions()
         
@@ -964,7 +1090,7 @@ class ScenarioRunner:
         if subsystem_filter:
             all_actions = self.get_actions_by_subsystem(subsystem_filter)
             if not all_actions:
-                print(f"❌ No actions found for subsystem: {subsystem_filter}")
+                logger.warning("❌ No actions found for subsystem: %s", subsystem_filter)
                 return []
         
         # Apply exclusions if specified
@@ -972,32 +1098,34 @@ class ScenarioRunner:
             all_actions = [action for action in all_actions if action not in exclude_actions]
         
         if self.verbose:
-            print(f"\n🚀 Running ALL Available Maintenance Actions")
-            print("=" * 70)
-            print(f"   Total actions available: {len(self.list_available_actions())}")
+            logger.info("\n🚀 Running ALL Available Maintenance Actions")
+            logger.info("=" * 70)
+            logger.info("   Total actions available: %s", len(self.list_available_actions()))
             if subsystem_filter:
-                print(f"   Filtered to subsystem: {subsystem_filter}")
+                logger.info("   Filtered to subsystem: %s", subsystem_filter)
             if exclude_actions:
-                print(f"   Excluded actions: {len(exclude_actions)}")
-            print(f"   Actions to run: {len(all_actions)}")
-            print(f"   Runs per action: {count_per_action}")
-            print(f"   Total runs: {len(all_actions) * count_per_action}")
-            print(f"   Estimated duration: {len(all_actions) * count_per_action * duration_hours:.1f} simulation hours")
+                logger.info("   Excluded actions: %s", len(exclude_actions))
+            logger.info("   Actions to run: %s", len(all_actions))
+            logger.info("   Runs per action: %s", count_per_action)
+            logger.info("   Total runs: %s", len(all_actions) * count_per_action)
+            logger.info("   Estimated duration: %.1f simulation hours", len(all_actions) * count_per_action * duration_hours)
+            if workers > 1:
+                logger.info("   Worker processes: %s", workers)
             
             # Show actions by subsystem
-            print(f"\n📋 Actions by Subsystem:")
+            logger.info("\n📋 Actions by Subsystem:")
             for subsystem in ['steam_generator', 'turbine', 'feedwater', 'condenser']:
                 subsystem_actions = [a for a in all_actions if a in self.get_actions_by_subsystem(subsystem)]
                 if subsystem_actions:
-                    print(f"   {subsystem.upper()}: {len(subsystem_actions)} actions")
+                    logger.info("   %s: %s actions", subsystem.upper(), len(subsystem_actions))
         
         # Confirm with user for large runs
         if len(all_actions) * count_per_action > 20 and self.verbose:
-            print(f"\n⚠️  This will run {len(all_actions) * count_per_action} total scenarios.")
-            print("   This may take a significant amount of time.")
+            logger.warning("\n⚠️  This will run %s total scenarios.", len(all_actions) * count_per_action)
+            logger.info("   This may take a significant amount of time.")
             response = input("   Continue? (y/N): ").strip().lower()
             if response not in ['y', 'yes']:
-                print("   Cancelled by user.")
+                logger.info("   Cancelled by user.")
                 return []
         
         # Run all actions using batch processing
@@ -1006,7 +1134,10 @@ class ScenarioRunner:
             actions=all_actions,
             duration_hours=duration_hours,
             count_per_action=count_per_action,
-            aggressive_mode=aggressive_mode
+            aggressive_mode=aggressive_mode,
+            workers=workers,
+            seed=seed,
+            on_result=on_result
         )
         end_time = time.time()
         
@@ -1022,52 +1153,52 @@ class ScenarioRunner:
     def _print_all_actions_summary(self, results: List[Dict[str, Any]], 
                                  all_actions: List[str], total_time: float):
         """Print comprehensive summary for run-all-actions"""
-        print(f"\n🎉 ALL ACTIONS COMPLETE")
-        print("=" * 70)
-        print(f"   Total execution time: {total_time:.1f} seconds ({total_time/60:.1f} minutes)")
-        print(f"   Actions attempted: {len(all_actions)}")
-        print(f"   Scenarios completed: {len(results)}")
+        logger.info("\n🎉 ALL ACTIONS COMPLETE")
+        logger.info("=" * 70)
+        logger.info("   Total execution time: %.1f seconds (%.1f minutes)", total_time, total_time/60)
+        logger.info("   Actions attempted: %s", len(all_actions))
+        logger.info("   Scenarios completed: %s", len(results))
         
         if results:
             # Success rate analysis
             successful_runs = sum(1 for r in results if r.get('success', False))
             triggered_runs = sum(1 for r in results if r.get('work_orders', {}).get('total_created', 0) > 0)
             
-            print(f"   Success rate: {successful_runs}/{len(results)} ({successful_runs/len(results):.1%})")
-            print(f"   Trigger rate: {triggered_runs}/{len(results)} ({triggered_runs/len(results):.1%})")
+            logger.info("   Success rate: %s/%s (%.1f%%)", successful_runs, len(results), 100 * (successful_runs/len(results)))
+            logger.info("   Trigger rate: %s/%s (%.1f%%)", triggered_runs, len(results), 100 * (triggered_runs/len(results)))
             
             # Work order statistics
             total_work_orders = sum(r.get('work_orders', {}).get('total_created', 0) for r in results)
-            print(f"   Total work orders created: {total_work_orders}")
+            logger.info("   Total work orders created: %s", total_work_orders)
             
             # Performance statistics
             avg_execution_time = sum(r.get('execution_time_seconds', 0) for r in results) / len(results)
-            print(f"   Average execution time per scenario: {avg_execution_time:.1f}s")
+            logger.info("   Average execution time per scenario: %.1fs", avg_execution_time)
             
             # Subsystem breakdown
-            print(f"\n📊 Results by Subsystem:")
+            logger.info("\n📊 Results by Subsystem:")
             for subsystem in ['steam_generator', 'turbine', 'feedwater', 'condenser']:
                 subsystem_results = [r for r in results if r.get('action') in self.get_actions_by_subsystem(subsystem)]
                 if subsystem_results:
                     subsystem_triggered = sum(1 for r in subsystem_results if r.get('work_orders', {}).get('total_created', 0) > 0)
                     subsystem_work_orders = sum(r.get('work_orders', {}).get('total_created', 0) for r in subsystem_results)
-                    print(f"   {subsystem.upper()}: {len(subsystem_results)} runs, {subsystem_triggered} triggered, {subsystem_work_orders} work orders")
+                    logger.info("   %s: %s runs, %s triggered, %s work orders", subsystem.upper(), len(subsystem_results), subsystem_triggered, subsystem_work_orders)
             
             # Top performing actions
-            print(f"\n🏆 Top Performing Actions (Most Work Orders):")
+            logger.info("\n🏆 Top Performing Actions (Most Work Orders):")
             sorted_results = sorted(results, key=lambda r: r.get('work_orders', {}).get('total_created', 0), reverse=True)
             for i, result in enumerate(sorted_results[:5]):
                 wo_count = result.get('work_orders', {}).get('total_created', 0)
-                print(f"   {i+1}. {result.get('action', 'Unknown')}: {wo_count} work orders")
+                logger.info("   %s. %s: %s work orders", i+1, result.get('action', 'Unknown'), wo_count)
             
             # Failed actions
             failed_results = [r for r in results if not r.get('success', False)]
             if failed_results:
-                print(f"\n⚠️  Failed Actions ({len(failed_results)}):")
+                logger.warning("\n⚠️  Failed Actions (%s):", len(failed_results))
                 for result in failed_results[:5]:  # Show first 5
-                    print(f"   • {result.get('action', 'Unknown')}")
+                    logger.info("   • %s", result.get('action', 'Unknown'))
                 if len(failed_results) > 5:
-                    print(f"   ... and {len(failed_results) - 5} more")
+                    logger.info("   ... and %s more", len(failed_results) - 5)
     
     def _save_all_actions_results(self, results: List[Dict[str, Any]], 
                                 subsystem_filter: Optional[str], 
@@ -1114,10 +1245,10 @@ class ScenarioRunner:
                 f.write(f"{action},{subsystem},{success},{work_orders},{exec_time:.1f},{final_power:.1f}\n")
         
         if self.verbose:
-            print(f"\n💾 Comprehensive results saved:")
-            print(f"   📄 Detailed results: {results_file}")
-            print(f"   📊 Summary CSV: {summary_file}")
-            print(f"   📁 Results directory: {results_dir}")
+            logger.info("\n💾 Comprehensive results saved:")
+            logger.info("   📄 Detailed results: %s", results_file)
+            logger.info("   📊 Summary CSV: %s", summary_file)
+            logger.info("   📁 Results directory: %s", results_dir)
     
     def validate_action(self, action: str) -> bool:
         """Validate action against conditions files"""
@@ -1156,17 +1287,17 @@ class ScenarioRunner:
     
     def _print_maintenance_results(self, results: Dict[str, Any], simulation: MaintenanceScenarioRunner):
         """Enhanced maintenance scenario results with state manager integration"""
-        print(f"\n📋 Results Summary")
-        print("-" * 40)
-        print(f"   ⏱️ Execution time: {results['execution_time_seconds']:.1f}s")
-        print(f"   📁 Output directory: {results['run_directory']}")
-        print(f"   ✅ Success: {results['success']}")
+        logger.info("\n📋 Results Summary")
+        logger.info("-" * 40)
+        logger.info("   ⏱️ Execution time: %.1fs", results['execution_time_seconds'])
+        logger.info("   📁 Output directory: %s", results['run_directory'])
+        logger.info("   ✅ Success: %s", results['success'])
         
         if 'work_orders' in results:
             wo = results['work_orders']
-            print(f"   🔧 Work orders created: {wo['total_created']}")
-            print(f"   ✅ Work orders completed: {wo['completed']}")
-            print(f"   🔄 Work orders active: {wo['active']}")
+            logger.info("   🔧 Work orders created: %s", wo['total_created'])
+            logger.info("   ✅ Work orders completed: %s", wo['completed'])
+            logger.info("   🔄 Work orders active: %s", wo['active'])
         
         # NEW: Enhanced reporting with state manager data
         if hasattr(simulation, 'simulator') and hasattr(simulation.simulator, 'state_manager'):
@@ -1175,55 +1306,55 @@ class ScenarioRunner:
             # Show threshold violations
             violations = state_manager.get_current_threshold_violations()
             if violations:
-                print(f"   🚨 Active threshold violations: {len(violations)}")
+                logger.info("   🚨 Active threshold violations: %s", len(violations))
                 for component_id, component_violations in violations.items():
                     for param, violation in component_violations.items():
-                        print(f"      {component_id}.{param}: {violation.get('value', 'N/A'):.2f} {violation.get('comparison', '')} {violation.get('threshold', 'N/A')}")
+                        logger.info("      %s.%s: %.2f %s %s", component_id, param, violation.get('value', 'N/A'), violation.get('comparison', ''), violation.get('threshold', 'N/A'))
             
             # Show maintenance history
             maintenance_history = state_manager.get_maintenance_history()
             if maintenance_history:
-                print(f"   📝 Maintenance actions performed: {len(maintenance_history)}")
+                logger.info("   📝 Maintenance actions performed: %s", len(maintenance_history))
                 for record in maintenance_history[-3:]:  # Show last 3
                     success_icon = "✅" if record.get('success', False) else "❌"
-                    print(f"      {success_icon} {record.get('component_id', 'Unknown')}: {record.get('action_type', 'Unknown')}")
+                    logger.info("      %s %s: %s", success_icon, record.get('component_id', 'Unknown'), record.get('action_type', 'Unknown'))
         
         # Show maintenance effectiveness if available
         if 'maintenance_effectiveness' in results:
             effectiveness = results['maintenance_effectiveness']
             if effectiveness.get('verifications_performed', 0) > 0:
                 avg_eff = effectiveness.get('average_effectiveness', 0)
-                print(f"   📊 Maintenance effectiveness: {avg_eff:.1%} ({effectiveness['successful_verifications']}/{effectiveness['verifications_performed']} verified)")
+                logger.info("   📊 Maintenance effectiveness: %.1f%% (%s/%s verified)", 100 * avg_eff, effectiveness['successful_verifications'], effectiveness['verifications_performed'])
         
-        print(f"   📊 Data points: {results['simulation_data_points']}")
-        print(f"   📊 Maintenance events: {results['maintenance_events']}")
-        print(f"   ⚡ Final power: {results['final_power_level']:.1f}%")
+        logger.info("   📊 Data points: %s", results['simulation_data_points'])
+        logger.info("   📊 Maintenance events: %s", results['maintenance_events'])
+        logger.info("   ⚡ Final power: %.1f%%", results['final_power_level'])
     
     def _print_operational_results(self, results: Dict[str, Any], simulation_result: Dict[str, Any]):
         """Print operational scenario results"""
-        print(f"\n📋 Results Summary")
-        print("-" * 40)
-        print(f"   ⏱️ Execution time: {results['execution_time_seconds']:.1f}s")
-        print(f"   📁 Output directory: {results['run_directory']}")
-        print(f"   ✅ Success: {results['success']}")
-        print(f"   📊 Data points: {results['data_points']}")
-        print(f"   ⚡ Final power: {results['final_power_level']:.1f}%")
+        logger.info("\n📋 Results Summary")
+        logger.info("-" * 40)
+        logger.info("   ⏱️ Execution time: %.1fs", results['execution_time_seconds'])
+        logger.info("   📁 Output directory: %s", results['run_directory'])
+        logger.info("   ✅ Success: %s", results['success'])
+        logger.info("   📊 Data points: %s", results['data_points'])
+        logger.info("   ⚡ Final power: %.1f%%", results['final_power_level'])
     
     def _print_batch_summary(self, batch_results: List[Dict[str, Any]]):
         """Print batch execution summary"""
-        print(f"\n📊 Batch Summary")
-        print("=" * 40)
-        print(f"   Total runs: {len(batch_results)}")
+        logger.info("\n📊 Batch Summary")
+        logger.info("=" * 40)
+        logger.info("   Total runs: %s", len(batch_results))
         
         if batch_results:
             successful_runs = sum(1 for r in batch_results if r.get('work_orders', {}).get('total_created', 0) > 0)
-            print(f"   Successful triggers: {successful_runs}/{len(batch_results)} ({successful_runs/len(batch_results):.1%})")
+            logger.info("   Successful triggers: %s/%s (%.1f%%)", successful_runs, len(batch_results), 100 * (successful_runs/len(batch_results)))
             
             total_work_orders = sum(r.get('work_orders', {}).get('total_created', 0) for r in batch_results)
-            print(f"   Total work orders: {total_work_orders}")
+            logger.info("   Total work orders: %s", total_work_orders)
             
             avg_execution_time = sum(r['execution_time_seconds'] for r in batch_results) / len(batch_results)
-            print(f"   Average execution time: {avg_execution_time:.1f}s")
+            logger.info("   Average execution time: %.1fs", avg_execution_time)
 
 
 def create_cli_parser() -> argparse.ArgumentParser:
@@ -1270,6 +1401,9 @@ Examples:
   # Disable plotting for faster batch runs
   python scenario_runner.py --run-all-actions --no-plots --duration 1.0
   
+  # Spread a batch over 16 worker processes (run i is seeded with 42 + i)
+  python scenario_runner.py --batch-maintenance --actions oil_top_off,tsp_chemical_cleaning --count 8 --workers 16 --seed 42 --no-plots
+  
   # YAML-FIRST EXAMPLES:
   # Run scenario from YAML file
   python scenario_runner.py --yaml-file my_scenario.yaml
@@ -1311,6 +1445,8 @@ Examples:
     
     # Maintenance-specific parameters
     parser.add_argument('--count', type=int, default=1, help='Number of runs per action in batch mode')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for --batch-maintenance, --run-all-actions and --yaml-dir (default: 1)')
     parser.add_argument('--aggressive', action='store_true', help='Use aggressive thresholds (default: conservative)')
     parser.add_argument('--tracking-start', type=float, default=0.0, help='Start time for CSV data tracking in hours. Data before this time will not be saved to CSVs (default: 0.0)')
     
@@ -1605,7 +1741,9 @@ def main():
                 actions=actions,
                 duration_hours=args.duration,
                 count_per_action=args.count,
-                aggressive_mode=aggressive_mode
+                aggressive_mode=aggressive_mode,
+                workers=args.workers,
+                seed=args.seed
             )
         
         elif args.run_all_actions:
@@ -1620,7 +1758,9 @@ def main():
                 count_per_action=args.count,
                 aggressive_mode=aggressive_mode,
                 subsystem_filter=args.subsystem,
-                exclude_actions=exclude_actions
+                exclude_actions=exclude_actions,
+                workers=args.workers,
+                seed=args.seed
             )
         
         elif args.yaml_file:
@@ -1635,7 +1775,9 @@ def main():
             runner.run_batch_from_yaml_directory(
                 yaml_dir=args.yaml_dir,
                 pattern="*.yaml",
-                save_results=True
+                save_results=True,
+                workers=args.workers,
+                seed=args.seed
             )
         
         elif args.validate_yaml:
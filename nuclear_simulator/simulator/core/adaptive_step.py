@@ -0,0 +1,177 @@
+"""
+Adaptive Physics Time Step
+
+This module provides the step-size control used by NuclearPlantSimulator in
+adaptive mode.
+
+The simulator's dt stays the output interval: every step() advances the plant
+by dt and collects state once, so the state history is emitted on the same
+grid as before. Inside each interval the coupled physics is advanced with
+variable steps chosen by an AdaptiveStepController:
+- the local error of each (first-order) step is estimated from the change of
+  the plant signal rates between consecutive steps (embedded estimate, no
+  extra physics evaluations)
+- the step (the output interval halved a whole number of times) doubles
+  while the plant is quiet and is halved for ramps
+- discrete events (SCRAM, turbine trip, feedwater pumps starting or stopping)
+  and applied control actions cut the step to event_dt immediately
+
+Steps are never rejected (that would need a rollback of the whole plant);
+the estimate only sets the size of the next step.
+
+Usage:
+    simulator = NuclearPlantSimulator(dt=15.0, adaptive=True,
+                                      adaptive_config=AdaptiveStepConfig(min_dt=0.1))
+"""
+
+from dataclasses import dataclass
+from typing import Hashable, Optional, Sequence
+
+import numpy as np
+
+
+@dataclass
+class AdaptiveStepConfig:
+    """Settings for adaptive physics stepping (times in minutes)"""
+    min_dt: float = 0.1                 # Smallest physics step
+    max_dt: Optional[float] = None      # Largest physics step (None: the output interval)
+    tolerance: float = 1e-3             # Local error per step, relative to each signal's scale
+    grow_below: float = 0.2             # Double the step when the error stays below this...
+    grow_after: int = 3                 # ...for this many consecutive steps
+    event_dt: Optional[float] = None    # Step after events and under control actions (None: min_dt)
+
+
+class AdaptiveStepController:
+    """
+    Chooses physics step sizes from an embedded local error estimate
+
+    For a first-order step the local error is about h²/2 |y''|; y'' is
+    estimated from the rates (Δy / h) of the last two steps. Errors are
+    normalized by tolerance times the largest magnitude each signal has
+    had since the last reset, so signals decaying to zero after a SCRAM
+    do not force minimum steps forever.
+
+    Steps are the output interval halved `level` times, so they tile the
+    output grid exactly. The plant's quasi-steady operating point shifts
+    slightly with the step size, so the step is kept constant while the
+    plant is quiet: it doubles only after grow_after steps below
+    grow_below and is halved (as often as needed) when the error exceeds 1.
+    """
+
+    def __init__(self, config: Optional[AdaptiveStepConfig] = None):
+        """
+        Initialize the controller.
+
+        Args:
+            config: Step-size settings (defaults if None)
+        """
+        self.config = config if config is not None else AdaptiveStepConfig()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the signal history and restart from the smallest step"""
+        self.level = None
+        self.next_dt = self.config.min_dt
+        self.last_error = 0.0
+        self.steps_taken = 0
+        self._quiet_steps = 0
+        self._cap = self.config.min_dt
+        self._signals = None
+        self._rate = None
+        self._last_dt = None
+        self._scale = None
+        self._events = None
+
+    def restrict(self, dt: Optional[float] = None) -> None:
+        """Cap the next step (default event_dt) and drop the rate history"""
+        if dt is None:
+            dt = self.config.event_dt if self.config.event_dt is not None else self.config.min_dt
+        self._cap = dt if self._cap is None else min(self._cap, dt)
+        self._quiet_steps = 0
+        self._rate = None
+
+    def propose(self, remaining: float, output_dt: float) -> float:
+        """
+        Size of the next physics step
+
+        Args:
+            remaining: Time left until the next output point
+            output_dt: Output interval
+
+        Returns:
+            Step that does not overshoot the output point
+        """
+        config = self.config
+        max_dt = min(config.max_dt, output_dt) if config.max_dt is not None else output_dt
+        min_level = self._level_for(output_dt, max_dt)
+        max_level = max(min_level, int(np.floor(np.log2(output_dt / config.min_dt))))
+
+        level = max_level if self.level is None else self.level
+        if self._cap is not None:
+            level = max(level, self._level_for(output_dt, self._cap))
+            self._cap = None
+        self.level = int(np.clip(level, min_level, max_level))
+        self.next_dt = output_dt / 2 ** self.level
+        return min(self.next_dt, remaining)
+
+    @staticmethod
+    def _level_for(output_dt: float, dt: float) -> int:
+        """Fewest halvings of output_dt that give a step of at most dt"""
+        return max(0, int(np.ceil(np.log2(output_dt / dt) - 1e-9)))
+
+    def observe(self, signals: Sequence[float], events: Hashable, dt: float) -> float:
+        """
+        Record the plant after a step of dt and choose the next step size
+
+        Args:
+            signals: Continuous plant signals after the step
+            events: Discrete plant status (a change cuts the step to event_dt)
+            dt: Size of the step just taken
+
+        Returns:
+            Normalized error estimate of the step (1.0 = tolerance)
+        """
+        config = self.config
+        signals = np.asarray(signals, dtype=np.float64)
+        self.steps_taken += 1
+        previous, self._signals = self._signals, signals
+
+        if self._events is not None and events != self._events:
+            self._events = events
+            self.restrict()
+            return self.last_error
+        self._events = events
+
+        if previous is None or previous.shape != signals.shape or not np.all(np.isfinite(signals)):
+            self._rate = None
+            return self.last_error
+
+        magnitude = np.abs(signals)
+        if self._scale is None or self._scale.shape != signals.shape:
+            self._scale = magnitude
+        else:
+            self._scale = np.maximum(self._scale, magnitude)
+        rate = (signals - previous) / dt
+        previous_rate, previous_dt, self._rate, self._last_dt = self._rate, self._last_dt, rate, dt
+        if previous_rate is None:
+            return self.last_error
+
+        curvature = np.abs(rate - previous_rate) / ((dt + previous_dt) / 2.0)
+        error = float(np.max(0.5 * dt ** 2 * curvature / (config.tolerance * self._scale + 1e-300)))
+        self.last_error = error
+
+        if error > 1.0:
+            # Error scales with dt²: halve until it is back within tolerance
+            self.level += max(1, int(np.ceil(np.log(error) / np.log(4.0))))
+            self._quiet_steps = 0
+            self._rate = None
+        elif error < config.grow_below:
+            self._quiet_steps += 1
+            if self._quiet_steps >= config.grow_after:
+                # Rates across a step change are not comparable: estimate afresh
+                self.level -= 1
+                self._quiet_steps = 0
+                self._rate = None
+        else:
+            self._quiet_steps = 0
+        return error
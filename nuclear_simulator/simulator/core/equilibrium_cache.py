@@ -0,0 +1,302 @@
+"""
+Equilibrium Cache
+
+This module caches the steady-state operating point that is solved when the
+secondary side of a plant is started at equilibrium (SecondaryReactorPhysics).
+The primary equilibrium (create_equilibrium_state) is a closed-form solve that
+is cheaper than any lookup, so it is not cached.
+
+Entries are keyed by kind, thermal power and a stable hash of the inputs the
+solve reads, so a simulator built with the same configuration reuses the
+stored result instead of solving again. Hashing a large config costs more
+than the solve itself, so config digests are memoized per process
+(cached_config_hash). The cache holds at most max_entries solutions, evicting
+the least recently used.
+
+A cache can be backed by a pickle file so process-pool workers share their
+solves: misses re-read the file before computing and new entries are merged
+back into it under an exclusive lock, so concurrent writers do not drop each
+other's entries. Hits never touch the file.
+
+Usage:
+    configure_equilibrium_cache("equilibrium_cache.pkl")   # Process-wide, on disk
+    equilibrium = get_equilibrium_cache().get_or_compute(
+        "secondary", thermal_power_mw, stable_config_hash(cached_config_hash(config), state),
+        lambda: solve(thermal_power_mw))
+"""
+
+import copy
+import dataclasses
+import enum
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: writes stay atomic but are not serialized
+    fcntl = None
+
+
+def _canonical(value: Any) -> Any:
+    """JSON-serializable form of a config value that does not depend on object identity"""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            '__dataclass__': type(value).__qualname__,
+            'fields': {f.name: _canonical(getattr(value, f.name)) for f in dataclasses.fields(value)},
+        }
+    if isinstance(value, dict):
+        return {'__dict__': sorted((str(key), _canonical(item)) for key, item in value.items())}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted(_canonical(item) for item in value)
+    if isinstance(value, np.ndarray):
+        return {'__ndarray__': str(value.dtype), 'shape': list(value.shape), 'data': _canonical(value.tolist())}
+    if isinstance(value, enum.Enum):
+        return f"{type(value).__qualname__}.{value.name}"
+    if isinstance(value, (bool, type(None), str)):
+        return value
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        return repr(float(value))
+    return repr(value)
+
+
+def stable_config_hash(*configs: Any) -> str:
+    """
+    Hash of configuration objects that is stable across processes and runs
+
+    Dataclasses are hashed field by field (recursively), dicts independently
+    of insertion order and floats by their exact repr.
+
+    Args:
+        *configs: Config dataclasses, dicts or plain values
+
+    Returns:
+        Hex digest identifying the configuration
+    """
+    payload = json.dumps(_canonical(list(configs)), sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+# Digests of recently hashed configs, keyed by their pickle (equal configs pickle identically)
+_config_digests: 'OrderedDict[bytes, str]' = OrderedDict()
+_CONFIG_DIGEST_LIMIT = 64
+
+
+def cached_config_hash(config: Any) -> str:
+    """
+    stable_config_hash() of a single config, memoized per process
+
+    Simulators typically get their own copy of one config, so the digest is
+    looked up by the config's pickle (cheap) instead of re-walking it.
+    Unpicklable configs are hashed directly.
+
+    Args:
+        config: Config dataclass, dict or plain value
+
+    Returns:
+        Hex digest identifying the configuration
+    """
+    try:
+        fingerprint = pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return stable_config_hash(config)
+
+    digest = _config_digests.get(fingerprint)
+    if digest is None:
+        digest = stable_config_hash(config)
+        _config_digests[fingerprint] = digest
+        if len(_config_digests) > _CONFIG_DIGEST_LIMIT:
+            _config_digests.popitem(last=False)
+    else:
+        _config_digests.move_to_end(fingerprint)
+    return digest
+
+
+@contextmanager
+def _exclusive_file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on a sidecar file next to path"""
+    if fcntl is None:
+        yield
+        return
+    with open(path.with_name(path.name + '.lock'), 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+CacheKey = Tuple[str, float, str]
+
+
+class EquilibriumCache:
+    """
+    Steady-state solutions keyed by (kind, thermal power, config hash)
+
+    Stored values are deep-copied on the way in and out, so callers may
+    mutate what they get back. At most max_entries solutions are kept; the
+    least recently used are evicted first.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, power_digits: int = 6,
+                 max_entries: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Pickle file shared between processes (None: memory only)
+            power_digits: Decimal places thermal power is rounded to in keys
+            max_entries: Largest number of solutions kept (in memory and in the file)
+        """
+        self.path = Path(path) if path is not None else None
+        self.power_digits = power_digits
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[CacheKey, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+        if self.path is not None:
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, kind: str, thermal_power: float, config_hash: str) -> CacheKey:
+        """Cache key for a solve"""
+        return (kind, round(float(thermal_power), self.power_digits), config_hash)
+
+    def get(self, kind: str, thermal_power: float, config_hash: str) -> Optional[Any]:
+        """Copy of a stored solution, or None"""
+        key = self.key(kind, thermal_power, config_hash)
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+        return copy.deepcopy(value) if value is not None else None
+
+    def put(self, kind: str, thermal_power: float, config_hash: str, value: Any) -> None:
+        """Store a solution (and merge it into the backing file, if any)"""
+        key = self.key(kind, thermal_power, config_hash)
+        with self._lock:
+            self._entries[key] = copy.deepcopy(value)
+            self._entries.move_to_end(key)
+            self._evict()
+        if self.path is not None:
+            self.save()
+
+    def get_or_compute(self, kind: str, thermal_power: float, config_hash: str,
+                       compute: Callable[[], Any]) -> Any:
+        """
+        Stored solution, solving and storing it on a miss
+
+        Args:
+            kind: Which equilibrium ('secondary', 'primary', ...)
+            thermal_power: Thermal power the equilibrium is solved for
+            config_hash: stable_config_hash() of everything else the solve depends on
+            compute: Solves the equilibrium
+
+        Returns:
+            Copy of the (possibly just computed) solution
+        """
+        value = self.get(kind, thermal_power, config_hash)
+        if value is None and self.path is not None:
+            # Another process may have solved it since we last looked
+            self.load()
+            value = self.get(kind, thermal_power, config_hash)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value = compute()
+        self.put(kind, thermal_power, config_hash, value)
+        return value
+
+    def load(self) -> None:
+        """Merge the entries of the backing file into memory"""
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            with open(self.path, 'rb') as f:
+                entries = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return
+        with self._lock:
+            # Entries only in the file count as least recently used here
+            missing = [(key, value) for key, value in entries.items() if key not in self._entries]
+            for key, value in reversed(missing):
+                self._entries[key] = value
+                self._entries.move_to_end(key, last=False)
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop the least recently used entries beyond max_entries (caller holds _lock)"""
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def save(self) -> None:
+        """
+        Write all entries (merged with the file's) to the backing file atomically
+
+        The re-read, merge and replace run under an exclusive lock on a sidecar
+        file, so entries another process writes in between are not lost.
+        """
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with _exclusive_file_lock(self.path):
+            self.load()
+            with self._lock:
+                entries = dict(self._entries)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+
+    def clear(self) -> None:
+        """Drop the in-memory entries (the backing file is left alone)"""
+        with self._lock:
+            self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_default_cache = EquilibriumCache()
+
+
+def get_equilibrium_cache() -> EquilibriumCache:
+    """Process-wide equilibrium cache used by the plant systems"""
+    return _default_cache
+
+
+def configure_equilibrium_cache(path: Optional[Union[str, Path]] = None) -> EquilibriumCache:
+    """
+    Replace the process-wide cache
+
+    Args:
+        path: Pickle file to share solves through (None: a fresh in-memory cache)
+
+    Returns:
+        The new process-wide cache
+    """
+    global _default_cache
+    _default_cache = EquilibriumCache(path)
+    return _default_cache
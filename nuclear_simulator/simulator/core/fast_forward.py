@@ -0,0 +1,74 @@
+"""
+Steady-State Fast-Forward
+
+This module provides the settings and steady-state detection used by
+NuclearPlantSimulator.fast_forward().
+
+Maintenance scenarios spend most of their horizon at constant power while
+fouling, wear and oil degradation creep. Once the plant is quasi-steady, the
+fast thermal-hydraulic and kinetics state can be frozen and only the slow
+degradation models integrated with large steps. The simulator drops back to
+full physics whenever:
+- the monitored plant signals drift (load or power change, transients)
+- a maintenance threshold is predicted to be crossed within the look-ahead
+- a scheduled work order is about to execute, or maintenance just executed
+
+Usage:
+    simulator = NuclearPlantSimulator(fast_forward_config=FastForwardConfig(macro_dt=60.0))
+    summary = simulator.fast_forward(30 * 24 * 60.0)   # One month
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+
+@dataclass
+class FastForwardConfig:
+    """Settings for steady-state fast-forward"""
+    macro_dt: float = 60.0              # Degradation-only step while fast-forwarding (minutes)
+    steady_window: int = 15             # Full-physics steps observed before fast-forwarding
+    steady_tolerance: float = 1e-3      # Max relative spread of each plant signal over the window
+    threshold_lookahead: float = 2.0    # Full physics when a threshold is predicted within this many macro steps
+
+
+class SteadyStateDetector:
+    """
+    Detects quasi-steady plant operation from a sliding window of signals
+
+    The plant is steady once the window is full and every signal's spread
+    (max - min) is within the relative tolerance of its mean.
+    """
+
+    def __init__(self, window: int = 15, tolerance: float = 1e-3):
+        """
+        Initialize the detector.
+
+        Args:
+            window: Number of observations that must agree
+            tolerance: Relative spread allowed for each signal
+        """
+        self.window = window
+        self.tolerance = tolerance
+        self._history = deque(maxlen=window)
+
+    def observe(self, signals: Sequence[float]) -> None:
+        """Record the plant signals of one full-physics step"""
+        self._history.append(np.asarray(signals, dtype=np.float64))
+
+    def is_steady(self) -> bool:
+        """True when the last `window` observations are steady"""
+        if len(self._history) < self.window:
+            return False
+        history = np.vstack(self._history)
+        if not np.all(np.isfinite(history)):
+            return False
+        spread = history.max(axis=0) - history.min(axis=0)
+        scale = np.maximum(np.abs(history.mean(axis=0)), 1e-12)
+        return bool(np.all(spread <= self.tolerance * scale))
+
+    def reset(self) -> None:
+        """Forget the observations (after a transient or maintenance)"""
+        self._history.clear()
@@ -0,0 +1,221 @@
+"""
+Multi-Rate Subsystem Scheduler
+
+This module lets plant subsystems run at their own natural update rates
+instead of all advancing at the simulator time step.
+
+Each subsystem is registered with its owner object and update method name
+(looked up on every call, so wrapped methods and pickled owners keep working),
+or without an owner when the caller drives the update loop itself through
+steps(). Each subsystem declares:
+- dt_unit: the time unit its update expects ('seconds', 'minutes' or 'hours');
+  the scheduler converts from plant minutes, so callers no longer hand-convert
+- period: natural update period in plant minutes. Slow models (chemistry,
+  fouling, wear) accumulate dt and update once per period with the accumulated
+  dt; between updates their last result is held for coupling.
+- max_substep: longest single update in plant minutes. Fast loops (kinetics,
+  level control) sub-cycle when the plant step is longer.
+- slow: the update is a slow degradation model. Its last coupling inputs are
+  held so advance_degradation() can integrate it with large steps while the
+  fast plant state is frozen (steady-state fast-forward).
+
+Scheduling is off by default (every subsystem updates once per step with the
+plant dt), so existing runs are unchanged until a simulator enables it.
+
+Usage:
+    scheduler = MultiRateScheduler(enabled=True)
+    scheduler.add('chemistry', chemistry, 'update', dt_unit='hours', period=60.0)
+    result = scheduler.run('chemistry', dt=1.0, system_conditions=conditions)
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+# Time units a subsystem update can declare
+DT_UNITS = ('seconds', 'minutes', 'hours')
+
+
+def convert_dt(dt_minutes: float, dt_unit: str) -> float:
+    """Convert a plant time step (minutes) to a subsystem time unit"""
+    if dt_unit == 'seconds':
+        return dt_minutes * 60.0
+    if dt_unit == 'hours':
+        return dt_minutes / 60.0
+    return dt_minutes
+
+
+@dataclass
+class ScheduledSubsystem:
+    """A subsystem update registered with the scheduler"""
+    name: str
+    owner: Any = None                 # Object providing the update method (None: caller-driven)
+    method: Optional[str] = None      # Update method name, called with dt as keyword dt_arg
+    dt_unit: str = 'minutes'          # Time unit the update expects
+    dt_arg: str = 'dt'                # Keyword the update takes its time step as
+    period: float = 0.0               # Natural update period (plant minutes); 0 = every step
+    max_substep: Optional[float] = None  # Longest single update (plant minutes)
+    hold_result: bool = True          # Return the last result on skipped steps (else None)
+    slow: bool = False                # Slow degradation model (replayed by advance_degradation)
+
+    # Runtime state
+    pending_dt: float = 0.0           # Plant minutes accumulated since the last update
+    last_result: Any = None
+    last_inputs: Optional[Dict[str, Any]] = None  # Coupling inputs of the last update
+    update_count: int = 0
+
+
+class MultiRateScheduler:
+    """
+    Runs registered subsystems at their declared update rates
+
+    Subsystems are run explicitly, in the caller's order, with run(); the
+    scheduler decides whether the call sub-cycles, updates once, or is skipped.
+    """
+
+    def __init__(self, enabled: bool = False):
+        """
+        Initialize the scheduler.
+
+        Args:
+            enabled: Use the declared periods and sub-steps. If False, every
+                subsystem updates once per run() with the plant dt.
+        """
+        self.enabled = enabled
+        self.subsystems: Dict[str, ScheduledSubsystem] = {}
+
+    def add(self, name: str, owner: Any = None, method: Optional[str] = None, dt_unit: str = 'minutes',
+            dt_arg: str = 'dt', period: float = 0.0, max_substep: Optional[float] = None,
+            hold_result: bool = True, slow: bool = False) -> ScheduledSubsystem:
+        """
+        Register a subsystem update.
+
+        Args:
+            name: Subsystem name used by run() and configure()
+            owner: Object providing the update method (None if only steps() is used)
+            method: Update method name
+            dt_unit: Time unit the update expects
+            dt_arg: Keyword argument the update takes its time step as
+            period: Natural update period in plant minutes (0 updates every step)
+            max_substep: Longest single update in plant minutes (None never sub-cycles)
+            hold_result: Return the last result on skipped steps instead of None
+            slow: Slow degradation model, advanced at held inputs by advance_degradation()
+
+        Returns:
+            The registered ScheduledSubsystem
+        """
+        if dt_unit not in DT_UNITS:
+            raise ValueError(f"Invalid dt_unit '{dt_unit}'. Must be one of: {list(DT_UNITS)}")
+        subsystem = ScheduledSubsystem(
+            name=name, owner=owner, method=method, dt_unit=dt_unit, dt_arg=dt_arg,
+            period=period, max_substep=max_substep, hold_result=hold_result, slow=slow
+        )
+        self.subsystems[name] = subsystem
+        return subsystem
+
+    def configure(self, enabled: Optional[bool] = None,
+                  periods: Optional[Dict[str, float]] = None,
+                  max_substeps: Optional[Dict[str, Optional[float]]] = None) -> None:
+        """
+        Enable/disable scheduling and override declared rates.
+
+        Names that are not registered here are ignored, so one settings dict
+        can be passed down to nested schedulers.
+
+        Args:
+            enabled: New enabled state (unchanged if None)
+            periods: Update periods in plant minutes by subsystem name
+            max_substeps: Sub-step limits in plant minutes by subsystem name
+        """
+        if enabled is not None:
+            self.enabled = enabled
+        for name, period in (periods or {}).items():
+            if name in self.subsystems:
+                self.subsystems[name].period = period
+        for name, max_substep in (max_substeps or {}).items():
+            if name in self.subsystems:
+                self.subsystems[name].max_substep = max_substep
+
+    def steps(self, name: str, dt: float) -> List[float]:
+        """
+        Time steps a subsystem advances by for one plant step.
+
+        Args:
+            name: Registered subsystem name
+            dt: Plant time step (minutes)
+
+        Returns:
+            Update time steps in plant minutes: one or more sub-steps when the
+            subsystem is due, empty while a slow subsystem accumulates dt
+        """
+        subsystem = self.subsystems[name]
+        if not self.enabled:
+            step_dts = [dt]
+        else:
+            subsystem.pending_dt += dt
+            if subsystem.update_count and subsystem.pending_dt < subsystem.period * (1.0 - 1e-9):
+                return []
+            step_dt, subsystem.pending_dt = subsystem.pending_dt, 0.0
+            substeps = 1
+            if subsystem.max_substep:
+                substeps = max(1, math.ceil(step_dt / subsystem.max_substep - 1e-9))
+            step_dts = [step_dt / substeps] * substeps
+        subsystem.update_count += len(step_dts)
+        return step_dts
+
+    def run(self, name: str, dt: float, **kwargs) -> Any:
+        """
+        Advance a subsystem by one plant step.
+
+        Args:
+            name: Registered subsystem name
+            dt: Plant time step (minutes)
+            **kwargs: Coupling inputs passed to the update method
+
+        Returns:
+            The update result (the last one when sub-cycling), or the held
+            result / None when the subsystem is not due this step
+        """
+        subsystem = self.subsystems[name]
+        step_dts = self.steps(name, dt)
+        if not step_dts:
+            return subsystem.last_result if subsystem.hold_result else None
+
+        update = getattr(subsystem.owner, subsystem.method)
+        if subsystem.slow:
+            subsystem.last_inputs = dict(kwargs)
+        for step_dt in step_dts:
+            kwargs[subsystem.dt_arg] = convert_dt(step_dt, subsystem.dt_unit)
+            subsystem.last_result = update(**kwargs)
+        return subsystem.last_result
+
+    def advance_degradation(self, dt: float) -> None:
+        """
+        Advance every slow subsystem by dt at its last coupling inputs.
+
+        Used while the plant is fast-forwarded at steady state: the fast state
+        is frozen, so the inputs of the last full update still hold. Subsystems
+        that have not run yet are skipped; accumulated dt is left untouched.
+
+        Args:
+            dt: Time step (plant minutes)
+        """
+        for subsystem in self.subsystems.values():
+            if not subsystem.slow or subsystem.last_inputs is None:
+                continue
+            kwargs = dict(subsystem.last_inputs)
+            kwargs[subsystem.dt_arg] = convert_dt(dt, subsystem.dt_unit)
+            subsystem.last_result = getattr(subsystem.owner, subsystem.method)(**kwargs)
+            subsystem.update_count += 1
+
+    def get_update_counts(self) -> Dict[str, int]:
+        """Number of updates each subsystem has run"""
+        return {name: subsystem.update_count for name, subsystem in self.subsystems.items()}
+
+    def reset(self) -> None:
+        """Drop accumulated dt and held results"""
+        for subsystem in self.subsystems.values():
+            subsystem.pending_dt = 0.0
+            subsystem.last_result = None
+            subsystem.last_inputs = None
+            subsystem.update_count = 0
@@ -1,7 +1,10 @@
 import warnings
 import sys
 import os
-from typing import Dict, List, Optional, Tuple
+import pickle
+import random
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
 import pandas as pd
 
 import matplotlib.pyplot as plt
@@ -19,21 +22,105 @@ from systems.secondary import SecondaryReactorPhysics
 from systems.primary.reactor.reactivity_model import create_equilibrium_state
 
 # Import the enhanced state management system
-from simulator.state import StateManager, StateProvider, StateVariable, StateCategory
+from simulator.state import StateManager, StateProvider, StateVariable, StateCategory, SimulationContext
+from simulator.core.scheduler import MultiRateScheduler
+from simulator.core.fast_forward import FastForwardConfig, SteadyStateDetector
+from simulator.core.adaptive_step import AdaptiveStepConfig, AdaptiveStepController
+from simulator.sim_logging import get_logger
 
 warnings.filterwarnings("ignore")
 
+logger = get_logger(__name__)
+
+# Checkpoint payload layout version. Bumped once per release whose pickled
+# layout differs from the previous release, not for every change within one.
+CHECKPOINT_FORMAT = 2
+
 
 class NuclearPlantSimulator:
     """Physics-based nuclear power plant simulator with integrated primary and secondary systems"""
 
     def __init__(self, dt: float = 1.0, heat_source=None, enable_secondary: bool = True, 
                  enable_state_management: bool = True, max_state_rows: int = 100000,
-                 secondary_config=None, secondary_config_file: str = None):
-        self.dt = dt  # Time step in minutes
+                 secondary_config=None, secondary_config_file: str = None,
+                 state_spill_dir: str = None, context: Optional[SimulationContext] = None,
+                 multirate: bool = False, subsystem_periods: Optional[Dict[str, float]] = None,
+                 max_substeps: Optional[Dict[str, Optional[float]]] = None,
+                 fast_forward_config: Optional[FastForwardConfig] = None,
+                 adaptive: bool = False, adaptive_config: Optional[AdaptiveStepConfig] = None,
+                 balance_validation: Optional[Dict[str, Any]] = None):
+        self.dt = dt  # Time step in minutes (output interval in adaptive mode)
         self.enable_state_management = enable_state_management
         self.enable_secondary = enable_secondary
         
+        # Registries owned by this plant: components built below register into this
+        # context only, so several simulators can be built in one process (or thread pool)
+        self.context = context if context is not None else SimulationContext()
+        with self.context.activate():
+            self._build_plant(heat_source, max_state_rows, secondary_config,
+                              secondary_config_file, state_spill_dir)
+        
+        # Integration parameters for primary-secondary coupling
+        self.primary_loops = 3  # Number of primary loops
+        self.thermal_power_split = [1/3, 1/3, 1/3]  # Equal split between loops
+        
+        # Control parameters for secondary system
+        self.load_demand = 100.0  # % rated electrical load
+        self.cooling_water_temp = 25.0  # °C
+        
+        # Expose state for backward compatibility
+        self.state = self.primary_physics.state
+
+        self.state_df = pd.DataFrame()
+        
+        # Multi-rate subsystem scheduling (off unless multirate=True): coupled
+        # primary/secondary physics sub-cycles in steps of at most 1 minute and
+        # slow secondary models (chemistry, fouling, tube wear) update hourly with
+        # the accumulated dt. Maintenance already checks at its own interval.
+        self.scheduler = MultiRateScheduler()
+        self.scheduler.add('physics', max_substep=1.0)
+        self.configure_scheduling(enabled=multirate, periods=subsystem_periods,
+                                  max_substeps=max_substeps)
+        
+        # Steady-state fast-forward settings (see fast_forward)
+        self.fast_forward_config = fast_forward_config if fast_forward_config is not None else FastForwardConfig()
+        
+        # Adaptive physics stepping (off unless adaptive=True): each step() still
+        # advances dt and collects state once, but the physics inside it takes
+        # error-controlled steps (replaces the multi-rate 'physics' sub-steps).
+        # The SG lags then use their exact forms, so a step size change does not
+        # excite a transient
+        self.adaptive = adaptive
+        self.step_controller = AdaptiveStepController(adaptive_config)
+        if adaptive and self.secondary_physics is not None:
+            self.secondary_physics.configure_exact_lags(True)
+        
+        # Energy/chemistry balance audit rates ({'energy': ..., 'chemistry': ...}
+        # ValidationPolicy configs); audited every step unless configured
+        if balance_validation and self.secondary_physics is not None:
+            self.secondary_physics.configure_balance_validation(**balance_validation)
+
+    def configure_scheduling(self, enabled: Optional[bool] = None,
+                             periods: Optional[Dict[str, float]] = None,
+                             max_substeps: Optional[Dict[str, Optional[float]]] = None) -> None:
+        """
+        Configure multi-rate subsystem scheduling for the whole plant.
+        
+        Args:
+            enabled: Enable declared update periods and sub-steps (None leaves it unchanged)
+            periods: Update periods in minutes by subsystem name ('chemistry',
+                'tsp_fouling', 'tube_interior_fouling', 'tube_degradation',
+                'condenser_fouling')
+            max_substeps: Sub-step limits in minutes by subsystem name ('physics')
+        """
+        self.scheduler.configure(enabled=enabled, periods=periods, max_substeps=max_substeps)
+        if self.enable_secondary and self.secondary_physics is not None:
+            self.secondary_physics.configure_scheduling(
+                enabled=enabled, periods=periods, max_substeps=max_substeps)
+
+    def _build_plant(self, heat_source, max_state_rows: int, secondary_config,
+                     secondary_config_file: Optional[str], state_spill_dir: Optional[str]):
+        """Build the physics systems and state management (with this plant's context active)"""
         # Initialize primary reactor physics system
         self.primary_physics = PrimaryReactorPhysics(
             rated_power_mw=3000.0,
@@ -61,30 +148,23 @@ class NuclearPlantSimulator:
 
         # Initialize state management system with component discovery
         if self.enable_state_management:
-            self.state_manager = StateManager(max_rows=max_state_rows, auto_manage_memory=True)
+            # Optional spill directory streams history chunks to disk (bounded memory, no lost rows)
+            self.state_manager = StateManager(max_rows=max_state_rows, auto_manage_memory=True,
+                                              spill_dir=state_spill_dir, context=self.context)
             
             # Discover and register components that used @auto_register decorator
             self.state_manager.discover_registered_components()
-            print(f"State management initialized with component discovery: {self.state_manager}")
+            
+            # Optional per-category logging policies (state_logging section)
+            if secondary_config is not None:
+                self.state_manager.load_logging_policies(secondary_config)
+            logger.info("State management initialized with component discovery: %s", self.state_manager)
             
             # Initialize automatic maintenance system
             self._initialize_maintenance_system(secondary_config)
         else:
             self.state_manager = None
             self.maintenance_system = None
-        
-        # Integration parameters for primary-secondary coupling
-        self.primary_loops = 3  # Number of primary loops
-        self.thermal_power_split = [1/3, 1/3, 1/3]  # Equal split between loops
-        
-        # Control parameters for secondary system
-        self.load_demand = 100.0  # % rated electrical load
-        self.cooling_water_temp = 25.0  # °C
-        
-        # Expose state for backward compatibility
-        self.state = self.primary_physics.state
-
-        self.state_df = pd.DataFrame()
 
     def _initialize_maintenance_system(self, secondary_config):
         """Initialize automatic maintenance system with component discovery"""
@@ -121,10 +201,10 @@ class NuclearPlantSimulator:
                 aggressive_mode=aggressive_mode
             )
             
-            print(f"Automatic maintenance system initialized ({'aggressive' if aggressive_mode else 'conservative'} mode)")
+            logger.info("Automatic maintenance system initialized (%s mode)", 'aggressive' if aggressive_mode else 'conservative')
             
         except Exception as e:
-            print(f"Warning: Failed to initialize maintenance system: {e}")
+            logger.warning("Failed to initialize maintenance system: %s", e)
             self.maintenance_system = None
 
     def step(
@@ -136,61 +216,26 @@ class NuclearPlantSimulator:
         if load_demand is not None:
             self.load_demand = load_demand
         if cooling_water_temp is not None:
+            if self.adaptive and cooling_water_temp != self.cooling_water_temp:
+                self.step_controller.restrict()
             self.cooling_water_temp = cooling_water_temp
         
         # Convert single action to control inputs format for primary physics
         control_inputs = self._convert_action_to_control_inputs(action, magnitude)
         
-        # Update primary physics system
-        primary_result = self.primary_physics.update_system(
-            control_inputs=control_inputs,
-            dt=self.dt
-        )
-        
-        # TODO: This is awful code
-        self.state = self.primary_physics.state
-        
-        # Initialize secondary result for backward compatibility
-        secondary_result = None
-        
-        # Update secondary physics system if enabled
-        if self.enable_secondary and self.secondary_physics is not None:
-            # Calculate primary-to-secondary coupling
-            primary_conditions = self._calculate_primary_to_secondary_coupling()
-            
-            self.load_demand = self.state.power_level
-
-            # Prepare secondary control inputs
-            secondary_control_inputs = {
-                'load_demand': self.load_demand,
-                'feedwater_temp': 227.0,  # Typical feedwater temperature
-                'cooling_water_temp': self.cooling_water_temp,
-                'cooling_water_flow': 45000.0,  # Design cooling water flow
-                'vacuum_pump_operation': 1.0
-            }
-            
-            # Update secondary system
-            secondary_result = self.secondary_physics.update_system(
-                primary_conditions=primary_conditions,
-                control_inputs=secondary_control_inputs,
-                dt=self.dt
-            )
-            
-            # Apply secondary-to-primary feedback (simplified)
-            self._apply_secondary_to_primary_feedback(secondary_result)
+        # Update coupled primary and secondary physics (sub-cycled when multi-rate
+        # is enabled, error-controlled steps in adaptive mode)
+        if self.adaptive:
+            steps_before = self.step_controller.steps_taken
+            if action is not None and action != ControlAction.NO_ACTION:
+                self.step_controller.restrict()
+            primary_result, secondary_result = self._advance_adaptive(control_inputs)
+        else:
+            for physics_dt in self.scheduler.steps('physics', self.dt):
+                primary_result, secondary_result = self._advance_physics(control_inputs, physics_dt)
         
         # Advance time using StateManager
-        if self.enable_state_management and self.state_manager is not None:
-            current_datetime = self.state_manager.advance_time(self.dt)
-            # Get elapsed time in minutes for legacy compatibility
-            elapsed_minutes = self.state_manager.get_elapsed_time().total_seconds() / 60.0
-        else:
-            # Fallback for when state management is disabled
-            if not hasattr(self, 'time'):
-                self.time = 0.0
-            self.time += self.dt
-            current_datetime = None
-            elapsed_minutes = self.time
+        current_datetime, elapsed_minutes = self._advance_time(self.dt)
         
         # Get observation for RL
         observation = self.get_observation()
@@ -204,6 +249,9 @@ class NuclearPlantSimulator:
             "reactivity": primary_result['total_reactivity_pcm'],
             "reactivity_components": primary_result['reactivity_components'],
         }
+        if self.adaptive:
+            info["physics_steps"] = self.step_controller.steps_taken - steps_before
+            info["next_physics_dt"] = self.step_controller.next_dt
         
         # Update maintenance system if available
         if hasattr(self, 'maintenance_system') and self.maintenance_system is not None:
@@ -257,6 +305,219 @@ class NuclearPlantSimulator:
             "info": info,
         }
     
+    def _advance_physics(self, control_inputs: dict, dt: float) -> Tuple[Dict, Optional[Dict]]:
+        """Advance the coupled primary and secondary physics by dt (minutes)"""
+        # Update primary physics system
+        primary_result = self.primary_physics.update_system(
+            control_inputs=control_inputs,
+            dt=dt
+        )
+        
+        # TODO: This is awful code
+        self.state = self.primary_physics.state
+        
+        # Initialize secondary result for backward compatibility
+        secondary_result = None
+        
+        # Update secondary physics system if enabled
+        if self.enable_secondary and self.secondary_physics is not None:
+            # Calculate primary-to-secondary coupling
+            primary_conditions = self._calculate_primary_to_secondary_coupling()
+            
+            self.load_demand = self.state.power_level
+
+            # Prepare secondary control inputs
+            secondary_control_inputs = {
+                'load_demand': self.load_demand,
+                'feedwater_temp': 227.0,  # Typical feedwater temperature
+                'cooling_water_temp': self.cooling_water_temp,
+                'cooling_water_flow': 45000.0,  # Design cooling water flow
+                'vacuum_pump_operation': 1.0
+            }
+            
+            # Update secondary system
+            secondary_result = self.secondary_physics.update_system(
+                primary_conditions=primary_conditions,
+                control_inputs=secondary_control_inputs,
+                dt=dt
+            )
+            
+            # Apply secondary-to-primary feedback (simplified)
+            self._apply_secondary_to_primary_feedback(secondary_result)
+        
+        return primary_result, secondary_result
+
+    def _advance_adaptive(self, control_inputs: dict) -> Tuple[Dict, Optional[Dict]]:
+        """Advance the coupled physics by one output interval with error-controlled steps"""
+        controller = self.step_controller
+        remaining = self.dt
+        while remaining > 1e-9:
+            physics_dt = controller.propose(remaining, self.dt)
+            primary_result, secondary_result = self._advance_physics(control_inputs, physics_dt)
+            signals, events = self._adaptive_signals(primary_result, secondary_result)
+            controller.observe(signals, events, physics_dt)
+            remaining -= physics_dt
+        return primary_result, secondary_result
+
+    def _adaptive_signals(self, primary_result: Dict, secondary_result: Optional[Dict]) -> Tuple[List[float], tuple]:
+        """Continuous plant signals for the error estimate and the discrete plant status"""
+        state = self.primary_physics.state
+        signals = [primary_result['thermal_power_mw'], state.fuel_temperature,
+                   state.coolant_temperature, state.coolant_pressure]
+        events = [bool(primary_result['scram_activated'])]
+        if secondary_result is not None:
+            # Feedwater flow is left out: its level controller hunts around the setpoint
+            signals.extend(secondary_result[key] for key in (
+                'electrical_power_mw', 'total_steam_flow', 'sg_avg_pressure', 'sg_avg_temperature',
+                'condenser_pressure'))
+            protection = getattr(self.secondary_physics.turbine, 'protection_system', None)
+            events.extend([secondary_result['feedwater_num_running_pumps'],
+                           bool(getattr(protection, 'trip_active', False))])
+        return signals, tuple(events)
+
+    def _elapsed_minutes(self) -> float:
+        """Simulated time since the start (minutes)"""
+        if self.enable_state_management and self.state_manager is not None:
+            return self.state_manager.get_elapsed_time().total_seconds() / 60.0
+        return getattr(self, 'time', 0.0)
+
+    def _advance_time(self, dt: float):
+        """Advance the simulation clock by dt minutes; returns (datetime or None, elapsed minutes)"""
+        if self.enable_state_management and self.state_manager is not None:
+            current_datetime = self.state_manager.advance_time(dt)
+            # Get elapsed time in minutes for legacy compatibility
+            return current_datetime, self._elapsed_minutes()
+        
+        # Fallback for when state management is disabled
+        if not hasattr(self, 'time'):
+            self.time = 0.0
+        self.time += dt
+        return None, self.time
+
+    def fast_forward(self, duration: float, action: Optional[ControlAction] = None,
+                     magnitude: float = 1.0, cooling_water_temp: float = None) -> Dict:
+        """
+        Advance the plant by duration minutes, skipping through quasi-steady operation.
+        
+        Full-physics steps of self.dt are taken until the plant signals (thermal
+        and electrical power, steam flow, SG pressure and temperature, feedwater
+        flow and pump power, condenser pressure) have been steady for a window
+        of steps. The thermal-hydraulic and kinetics state is then frozen and
+        only the slow degradation models (pump and turbine lubrication and
+        wear, SG fouling, condenser tube wear and fouling, vacuum ejectors,
+        water chemistry) are integrated in macro steps, with maintenance
+        checks and state collection after each one.
+        
+        Full physics resumes when a maintenance threshold is predicted to be
+        crossed within the look-ahead, a scheduled work order is due, or
+        maintenance executes (the plant then has to settle again). A control
+        action other than NO_ACTION keeps the whole call at full physics.
+        
+        Args:
+            duration: Time to advance (minutes; full-physics steps round up to dt)
+            action: Control action applied on every full-physics step
+            magnitude: Control action magnitude
+            cooling_water_temp: Condenser cooling water temperature (°C)
+            
+        Returns:
+            Dictionary with the elapsed time, step counts, maintenance work
+            orders and whether the reactor scrammed
+        """
+        config = self.fast_forward_config
+        detector = SteadyStateDetector(config.steady_window, config.steady_tolerance)
+        can_fast_forward = action is None or action == ControlAction.NO_ACTION
+        if cooling_water_temp is not None:
+            self.cooling_water_temp = cooling_water_temp
+        
+        remaining = duration
+        physics_steps = fast_forward_steps = 0
+        fast_forward_minutes = 0.0
+        work_orders = []
+        done = False
+        threshold_values = None
+        near_threshold = False
+        
+        while remaining > 1e-9 and not done:
+            macro_dt = min(config.macro_dt, remaining)
+            executed_before = getattr(self.maintenance_system, 'work_orders_executed', 0)
+            
+            if (can_fast_forward and macro_dt > self.dt and not near_threshold
+                    and detector.is_steady() and not self._maintenance_due_within(macro_dt)):
+                # Degradation-only macro step with the fast state frozen
+                step_dt = macro_dt
+                work_orders.extend(wo.to_dict() for wo in self._advance_degradation(step_dt))
+                fast_forward_steps += 1
+                fast_forward_minutes += step_dt
+            else:
+                step_dt = self.dt
+                result = self.step(action, magnitude)
+                info = result['info']
+                work_orders.extend(info.get('maintenance_work_orders', []))
+                detector.observe(self._steady_state_signals(info))
+                physics_steps += 1
+                done = result['done']
+            remaining -= step_dt
+            
+            # Maintenance changed the plant: settle at full physics before skipping again
+            if getattr(self.maintenance_system, 'work_orders_executed', 0) != executed_before:
+                detector.reset()
+            
+            # Stay at full physics while a threshold is predicted within the look-ahead
+            if self.enable_state_management and self.state_manager is not None:
+                previous_values, threshold_values = threshold_values, self.state_manager.get_threshold_values()
+                if previous_values is not None:
+                    minutes_to_threshold = self.state_manager.estimate_minutes_to_threshold(
+                        previous_values, threshold_values, step_dt)
+                    near_threshold = minutes_to_threshold < config.threshold_lookahead * config.macro_dt
+        
+        return {
+            "time": self._elapsed_minutes(),
+            "physics_steps": physics_steps,
+            "fast_forward_steps": fast_forward_steps,
+            "fast_forward_minutes": fast_forward_minutes,
+            "maintenance_work_orders": work_orders,
+            "done": done,
+        }
+
+    def _steady_state_signals(self, info: Dict) -> List[float]:
+        """Plant signals that must settle before fast-forwarding (from step info)"""
+        signals = [info['thermal_power']]
+        secondary_result = info.get('secondary_system')
+        if secondary_result is not None:
+            signals.extend(secondary_result[key] for key in (
+                'electrical_power_mw', 'total_steam_flow', 'sg_avg_pressure', 'sg_avg_temperature',
+                'feedwater_total_flow', 'feedwater_total_power', 'condenser_pressure'))
+        return signals
+
+    def _maintenance_due_within(self, dt: float) -> bool:
+        """True if a scheduled work order starts within the next dt minutes"""
+        if getattr(self, 'maintenance_system', None) is None:
+            return False
+        next_start = self.maintenance_system.get_next_scheduled_start()
+        return next_start is not None and next_start <= self._elapsed_minutes() + dt
+
+    def _advance_degradation(self, dt: float) -> List:
+        """Advance only the slow degradation models by dt minutes; returns maintenance work orders"""
+        if self.enable_secondary and self.secondary_physics is not None:
+            self.secondary_physics.advance_degradation(dt)
+        
+        current_datetime, elapsed_minutes = self._advance_time(dt)
+        
+        work_orders = []
+        if getattr(self, 'maintenance_system', None) is not None:
+            try:
+                work_orders = self.maintenance_system.update(elapsed_minutes, dt)
+            except Exception as e:
+                warnings.warn(f"Maintenance system update failed: {e}")
+        
+        if self.enable_state_management and self.state_manager is not None:
+            try:
+                self.state_manager.collect_states(current_datetime)
+            except Exception as e:
+                warnings.warn(f"State collection failed: {e}")
+        
+        return work_orders
+
     def _convert_action_to_control_inputs(self, action: Optional[ControlAction], magnitude: float) -> dict:
         """Convert single action to control inputs format for primary physics"""
         control_inputs = {
@@ -307,25 +568,25 @@ class NuclearPlantSimulator:
         
         # Add secondary system observations if available
         if self.enable_secondary and self.secondary_physics is not None:
-            # Get secondary system state
-            secondary_state = self.secondary_physics.get_system_state()
+            # Read the secondary system directly (get_system_state builds every component state dict)
+            secondary = self.secondary_physics
             
             secondary_obs = [
-                secondary_state['electrical_power_output'] / 1100,  # Normalized electrical power
-                secondary_state['thermal_efficiency'] / 0.35,  # Normalized efficiency
-                secondary_state['total_steam_flow'] / 1665,  # Normalized steam flow
-                secondary_state['load_demand'] / 100,  # Normalized load demand
-                secondary_state['feedwater_temperature'] / 250,  # Normalized feedwater temp
-                secondary_state['cooling_water_temperature'] / 35,  # Normalized cooling water temp
+                secondary.electrical_power_output / 1100,  # Normalized electrical power
+                secondary.thermal_efficiency / 0.35,  # Normalized efficiency
+                secondary.total_steam_flow / 1665,  # Normalized steam flow
+                secondary.load_demand / 100,  # Normalized load demand
+                secondary.feedwater_temperature / 250,  # Normalized feedwater temp
+                secondary.cooling_water_temperature / 35,  # Normalized cooling water temp
             ]
             
-            # Add feedwater pump observations
-            feedwater_state = secondary_state.get('feedwater_state', {})
+            # Add feedwater pump observations (read from the system; its full state dict is not needed)
+            feedwater = self.secondary_physics.feedwater_system
             feedwater_obs = [
-                feedwater_state.get('feedwater_total_flow', 0.0) / 1665,  # Normalized feedwater flow
-                feedwater_state.get('feedwater_total_power', 0.0) / 40,  # Normalized pump power (4 pumps * 10MW each)
-                float(feedwater_state.get('feedwater_system_availability', False)),  # System availability (0 or 1)
-                feedwater_state.get('feedwater_total_flow', 0.0) / 1665,  # Normalized target flow (using actual flow as proxy)
+                feedwater.total_flow_rate / 1665,  # Normalized feedwater flow
+                feedwater.total_power_consumption / 40,  # Normalized pump power (4 pumps * 10MW each)
+                float(feedwater.system_availability),  # System availability (0 or 1)
+                feedwater.total_flow_rate / 1665,  # Normalized target flow (using actual flow as proxy)
             ]
             
             return np.array(primary_obs + secondary_obs + feedwater_obs)
@@ -569,6 +830,8 @@ class NuclearPlantSimulator:
         
         self.state = self.primary_physics.state
         self.time = 0.0
+        self.scheduler.reset()
+        self.step_controller.reset()
         
         # Reset state management system
         if self.enable_state_management and self.state_manager is not None:
@@ -580,14 +843,99 @@ class NuclearPlantSimulator:
         
         return self.get_observation()
 
+    def save_checkpoint(self, path: Optional[Union[str, Path]] = None, include_rng: bool = True) -> bytes:
+        """
+        Capture the complete plant state as a binary checkpoint.
+        
+        The whole simulator object graph is pickled in one pass: the primary
+        ReactorState and physics, every secondary subsystem (steam generators,
+        TSP deposits, turbine stages, bearings, lubrication, condenser, vacuum,
+        feedwater pumps, chemistry), the maintenance system with its work orders
+        and the StateManager (simulation time, history, thresholds and cooldowns).
+        References shared between components are preserved.
+        
+        Call state_manager.clear_data() first to checkpoint a warmed-up plant
+        without its collected history.
+        
+        Args:
+            path: Optional file to write the checkpoint to
+            include_rng: Also capture the global ``random`` and NumPy RNG states
+            
+        Returns:
+            Checkpoint bytes (for load_checkpoint / from_checkpoint)
+        """
+        payload = {
+            'format': CHECKPOINT_FORMAT,
+            'state': self.__dict__,
+            'rng': (random.getstate(), np.random.get_state()) if include_rng else None,
+        }
+        checkpoint = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+        if path is not None:
+            Path(path).write_bytes(checkpoint)
+        return checkpoint
+
+    def load_checkpoint(self, checkpoint: Union[bytes, str, Path], restore_rng: bool = True) -> None:
+        """
+        Restore the complete plant state from a checkpoint.
+        
+        Every load builds fresh component objects, so many scenario variants can
+        be forked from one checkpoint without sharing state. History spilling is
+        detached on load (the spill directory belongs to the checkpointed run);
+        re-enable it with a fresh directory. Checkpoints are pickles: only load
+        files from trusted sources.
+        
+        Args:
+            checkpoint: Bytes from save_checkpoint, or a checkpoint file path
+            restore_rng: Restore the global RNG states captured with the checkpoint
+        """
+        if not isinstance(checkpoint, (bytes, bytearray, memoryview)):
+            checkpoint = Path(checkpoint).read_bytes()
+        payload = pickle.loads(checkpoint)
+        if not isinstance(payload, dict) or payload.get('format') != CHECKPOINT_FORMAT:
+            raise ValueError("Not a NuclearPlantSimulator checkpoint or unsupported checkpoint format")
+        
+        self.__dict__.clear()
+        self.__dict__.update(payload['state'])
+        
+        # The spill dataset belongs to the checkpointed run: forks must not append to it
+        state_manager = self.__dict__.get('state_manager')
+        if state_manager is not None and state_manager._spill is not None:
+            directory = state_manager._spill.directory
+            spilled = state_manager.detach_spill()
+            logger.warning("Checkpoint was spilling history to %s; the restored simulator leaves its "
+                           "%s spilled rows there and keeps history in memory. Call "
+                           "state_manager.enable_spill() with a fresh directory to spill again.",
+                           directory, spilled)
+        if restore_rng and payload['rng'] is not None:
+            python_state, numpy_state = payload['rng']
+            random.setstate(python_state)
+            np.random.set_state(numpy_state)
+
+    @classmethod
+    def from_checkpoint(cls, checkpoint: Union[bytes, str, Path],
+                        restore_rng: bool = True) -> 'NuclearPlantSimulator':
+        """
+        Create a simulator from a checkpoint without running the constructor.
+        
+        Args:
+            checkpoint: Bytes from save_checkpoint, or a checkpoint file path
+            restore_rng: Restore the global RNG states captured with the checkpoint
+            
+        Returns:
+            Simulator in the checkpointed state
+        """
+        simulator = cls.__new__(cls)
+        simulator.load_checkpoint(checkpoint, restore_rng=restore_rng)
+        return simulator
+
     def plot_parameters(self, parameters: List[str] = None, time_window: int = None, save: bool = False):
         """Plot selected parameters over time using state management data"""
         if not self.enable_state_management or self.state_manager is None:
-            print("State management is not enabled. Cannot plot parameters.")
+            logger.warning("State management is not enabled. Cannot plot parameters.")
             return
         
         if self.state_manager.data.empty:
-            print("No simulation data to plot")
+            logger.info("No simulation data to plot")
             return
 
         if parameters is None:
@@ -616,7 +964,7 @@ class NuclearPlantSimulator:
             data = self.state_manager.get_time_series(['time'] + parameters, time_range)
             
             if data.empty:
-                print("No data available for plotting")
+                logger.info("No data available for plotting")
                 return
             
             # Create plots
@@ -628,7 +976,6 @@ class NuclearPlantSimulator:
                 if param in data.columns:
                     # Create readable labels
                     ylabel = " ".join(param.split('.')[1:])
-                    print(ylabel)
                     ylabel = ylabel.replace('_', ' ').replace('.', '').title()
                     if 'temperature' in param.lower():
                         ylabel += " (°C)"
@@ -649,19 +996,19 @@ class NuclearPlantSimulator:
                     axes[i].grid(True, alpha=0.3)
                     axes[i].set_title(ylabel)
                 else:
-                    print(f"Parameter {param} not found in data")
+                    logger.warning("Parameter %s not found in data", param)
 
             axes[-1].set_xlabel("Time (s)")
             plt.tight_layout()
 
             if save:
                 plt.savefig(f"simulation_parameters.png")
-                print(f"Saved plot to simulation_parameters.png")
+                logger.info("Saved plot to simulation_parameters.png")
             plt.show()
 
             
         except Exception as e:
-            print(f"Error plotting parameters: {e}")
+            logger.warning("Error plotting parameters: %s", e)
 
 
     # State Management Methods
@@ -676,7 +1023,7 @@ class NuclearPlantSimulator:
             variables: Optional list of variables to include (default: all)
         """
         if not self.enable_state_management or self.state_manager is None:
-            print("State management is not enabled. Cannot export state data.")
+            logger.warning("State management is not enabled. Cannot export state data.")
             return
         
         self.state_manager.export_to_csv(filename, time_range, variables)
@@ -692,7 +1039,7 @@ class NuclearPlantSimulator:
             time_range: Optional time range filter
         """
         if not self.enable_state_management or self.state_manager is None:
-            print("State management is not enabled. Cannot export state data.")
+            logger.warning("State management is not enabled. Cannot export state data.")
             return
         
         self.state_manager.export_by_category(category, filename, time_range)
@@ -709,7 +1056,7 @@ class NuclearPlantSimulator:
             time_range: Optional time range filter
         """
         if not self.enable_state_management or self.state_manager is None:
-            print("State management is not enabled. Cannot export state data.")
+            logger.warning("State management is not enabled. Cannot export state data.")
             return
         
         self.state_manager.export_by_subcategory(category, subcategory, filename, time_range)
@@ -722,7 +1069,7 @@ class NuclearPlantSimulator:
             filename: Output CSV filename for summary statistics
         """
         if not self.enable_state_management or self.state_manager is None:
-            print("State management is not enabled. Cannot export summary statistics.")
+            logger.warning("State management is not enabled. Cannot export summary statistics.")
             return
         
         self.state_manager.export_summary_statistics(filename)
@@ -781,7 +1128,7 @@ class NuclearPlantSimulator:
             pandas Series with the variable's time series data
         """
         if not self.enable_state_management or self.state_manager is None:
-            print("State management is not enabled. Cannot retrieve variable history.")
+            logger.warning("State management is not enabled. Cannot retrieve variable history.")
             return None
         
         return self.state_manager.get_variable_history(variable_name, time_range)
@@ -799,7 +1146,7 @@ class NuclearPlantSimulator:
             pandas DataFrame with time and selected variables
         """
         if not self.enable_state_management or self.state_manager is None:
-            print("State management is not enabled. Cannot retrieve time series.")
+            logger.warning("State management is not enabled. Cannot retrieve time series.")
             return None
         
         return self.state_manager.get_time_series(variable_names, time_range)
@@ -0,0 +1,183 @@
+"""
+Step Result
+
+This module provides the result object returned by the plant system updates.
+
+A system update produces a handful of scalars that the simulator reads every
+step (power, efficiency, flows, pressures) and detailed component states
+(nested get_state_dict() dictionaries, array copies) that only some callers
+look at. StepResult is a dict holding the scalars, with the detailed entries
+registered as factories that run on first access and are cached in the
+result. Callers that never read them no longer pay to serialize the plant
+every step.
+
+Lazy entries describe the plant at the step that produced the result, so
+they can only be built until the plant moves on. The owning system records
+the results it hands out in a StepResultLog (weak references) and expires
+them when it starts the next update: entries not read by then are dropped,
+not built, and reading them afterwards raises KeyError. A caller that keeps
+results across steps reads the entries it needs, or calls materialize(),
+before the next update. Enumerating a result (keys, items, len, copying,
+pickling, comparison) computes all of its pending entries first.
+
+Usage:
+    result = StepResult({'thermal_power_mw': power},
+                        lazy={'turbine_state': self.turbine.get_state_dict})
+    result['thermal_power_mw']      # Stored value
+    result['turbine_state']         # Calls get_state_dict once, then cached
+"""
+
+import weakref
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional
+
+
+class StepResult(dict):
+    """
+    Dictionary of one step's results with detailed entries built on first access
+
+    Behaves as a plain dict of all its entries. Entries registered in `lazy`
+    are computed by calling their factory the first time they are read, until
+    the result expires.
+    """
+
+    def __init__(self, values: Mapping[str, Any] = (), lazy: Optional[Dict[str, Callable[[], Any]]] = None):
+        """
+        Build the result.
+
+        Args:
+            values: Entries known when the step completes
+            lazy: Factories (no arguments) of the entries computed on first access
+        """
+        super().__init__(values)
+        self._lazy = dict(lazy) if lazy else {}
+        self._expired = set()
+
+    def __missing__(self, key):
+        if key in self._expired:
+            raise KeyError(f"'{key}' expired unread: the system has advanced past this result's step")
+        value = self._lazy.pop(key)()
+        dict.__setitem__(self, key, value)
+        return value
+
+    def __contains__(self, key) -> bool:
+        return dict.__contains__(self, key) or key in self._lazy
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    @property
+    def pending(self) -> List[str]:
+        """Lazy entries not computed yet"""
+        return list(self._lazy)
+
+    @property
+    def expired(self) -> List[str]:
+        """Lazy entries dropped unread when the result expired"""
+        return sorted(self._expired)
+
+    def materialize(self) -> 'StepResult':
+        """Compute every pending entry"""
+        for key in list(self._lazy):
+            self[key]
+        return self
+
+    def expire(self) -> None:
+        """Drop pending entries unbuilt (the plant is about to move on from this step)"""
+        self._expired.update(self._lazy)
+        self._lazy.clear()
+
+    # Whole-dict operations see every entry
+
+    def __iter__(self) -> Iterator[str]:
+        return dict.__iter__(self.materialize())
+
+    def __len__(self) -> int:
+        return dict.__len__(self) + len(self._lazy)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, StepResult):
+            other.materialize()
+        return dict.__eq__(self.materialize(), other)
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return dict.__repr__(self.materialize())
+
+    def keys(self):
+        return dict.keys(self.materialize())
+
+    def values(self):
+        return dict.values(self.materialize())
+
+    def items(self):
+        return dict.items(self.materialize())
+
+    def copy(self) -> Dict[str, Any]:
+        return dict.copy(self.materialize())
+
+    def pop(self, key, *default):
+        if key in self._lazy:
+            self[key]
+        return dict.pop(self, key, *default)
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        dict.__setitem__(self, key, default)
+        return default
+
+    def __delitem__(self, key) -> None:
+        if self._lazy.pop(key, None) is None:
+            dict.__delitem__(self, key)
+
+    def __setitem__(self, key, value) -> None:
+        self._lazy.pop(key, None)
+        self._expired.discard(key)
+        dict.__setitem__(self, key, value)
+
+    def clear(self) -> None:
+        self._lazy.clear()
+        self._expired.clear()
+        dict.clear(self)
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __reduce__(self):
+        return (type(self), (dict.copy(self.materialize()),))
+
+
+class StepResultLog:
+    """
+    Results a system handed out since its last update
+
+    Holds weak references, so results the caller has already dropped cost
+    nothing to expire. A pickled log restores empty: the results it referred
+    to belong to the process that received them.
+    """
+
+    def __init__(self):
+        self._refs: List[weakref.ref] = []
+
+    def __len__(self) -> int:
+        return sum(ref() is not None for ref in self._refs)
+
+    def append(self, result: StepResult) -> None:
+        """Record a result handed out by the system"""
+        self._refs.append(weakref.ref(result))
+
+    def expire(self) -> None:
+        """Expire the results still held by callers and forget them all"""
+        for ref in self._refs:
+            result = ref()
+            if result is not None:
+                result.expire()
+        self._refs.clear()
+
+    def __reduce__(self):
+        return (type(self), ())
@@ -0,0 +1,150 @@
+"""
+Simulator Logging
+
+This module provides the logging layer used for simulator console output in
+place of bare ``print`` calls.
+
+All loggers live under the ``nuclear_simulator`` logger hierarchy and share
+one global verbosity level. Messages use lazy %-style arguments
+(``logger.info("Applied %d thresholds to %s", n, component_id)``) so a
+disabled message costs a level check and is never formatted or written;
+hot paths that build expensive arguments can guard them with
+``logger.isEnabledFor(DEBUG)``.
+
+At the default ``normal`` verbosity every INFO message is written to stdout
+unformatted, so console output matches the previous print-based output.
+Batch data generation can switch to ``quiet`` (warnings and errors only) or
+``silent``, either with set_verbosity(), the ``verbosity()`` context manager
+or the ``NUCLEAR_SIM_VERBOSITY`` environment variable.
+
+Usage:
+    from simulator.sim_logging import get_logger, set_verbosity
+
+    logger = get_logger(__name__)
+    logger.info("STATE MANAGER: Loaded %d logging policies", len(policies))
+
+    set_verbosity('quiet')
+"""
+
+import logging
+import os
+import sys
+from contextlib import contextmanager
+from typing import Iterator, Union
+
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+ERROR = logging.ERROR
+SILENT = logging.CRITICAL + 10
+
+ROOT_LOGGER = 'nuclear_simulator'
+VERBOSITY_ENV = 'NUCLEAR_SIM_VERBOSITY'
+
+VERBOSITY_LEVELS = {
+    'debug': DEBUG,
+    'verbose': DEBUG,
+    'normal': INFO,
+    'info': INFO,
+    'quiet': WARNING,
+    'warning': WARNING,
+    'error': ERROR,
+    'silent': SILENT,
+}
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """Stream handler bound to the current sys.stdout (follows redirection)"""
+
+    def __init__(self):
+        super().__init__(sys.stdout)
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+def _parse_level(level: Union[int, str]) -> int:
+    if isinstance(level, str):
+        name = level.strip().lower()
+        if name in VERBOSITY_LEVELS:
+            return VERBOSITY_LEVELS[name]
+        if name.lstrip('-').isdigit():
+            return int(name)
+        raise ValueError(f"Unknown verbosity '{level}'. Use one of {sorted(VERBOSITY_LEVELS)}")
+    return int(level)
+
+
+def _root() -> logging.Logger:
+    """Package logger, configured with the console handler on first use"""
+    root = logging.getLogger(ROOT_LOGGER)
+    if not any(getattr(handler, '_nuclear_sim_console', False) for handler in root.handlers):
+        handler = _StdoutHandler()
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        handler._nuclear_sim_console = True
+        root.addHandler(handler)
+        # Console output is the simulator's own; don't duplicate it through the root logger
+        root.propagate = False
+        root.setLevel(_parse_level(os.environ.get(VERBOSITY_ENV, 'normal')))
+    return root
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get a simulator logger.
+
+    Args:
+        name: Module name (usually ``__name__``); placed under the package hierarchy
+
+    Returns:
+        logging.Logger sharing the global verbosity level
+    """
+    _root()
+    if name != ROOT_LOGGER and not name.startswith(ROOT_LOGGER + '.'):
+        name = f"{ROOT_LOGGER}.{name}"
+    return logging.getLogger(name)
+
+
+def set_verbosity(level: Union[int, str]) -> int:
+    """
+    Set the global simulator verbosity.
+
+    Args:
+        level: 'debug', 'normal', 'quiet', 'silent' (or any logging level)
+
+    Returns:
+        The previous level
+    """
+    root = _root()
+    previous = root.level
+    root.setLevel(_parse_level(level))
+    return previous
+
+
+def get_verbosity() -> int:
+    """Current global simulator verbosity as a logging level"""
+    return _root().level
+
+
+def is_enabled(level: int = INFO) -> bool:
+    """Whether messages at ``level`` are currently written"""
+    return _root().isEnabledFor(level)
+
+
+@contextmanager
+def verbosity(level: Union[int, str]) -> Iterator[None]:
+    """
+    Temporarily change the global simulator verbosity.
+
+    Args:
+        level: Verbosity for the duration of the block
+    """
+    previous = set_verbosity(level)
+    try:
+        yield
+    finally:
+        set_verbosity(previous)
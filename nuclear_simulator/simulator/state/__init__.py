@@ -6,7 +6,14 @@ including time series storage, CSV export, and hierarchical organization of
 physics state variables.
 
 Key Components:
-- StateManager: Core pandas-based state collection and storage
+- StateManager: Core state collection and storage
+- StateHistoryBuffer: Preallocated columnar ring buffer backing StateManager history
+- StateSpillSink: Chunked Parquet/Arrow dataset that StateManager can spill history to
+- StateCollectionPlan: Precompiled per-step provider collection used by StateManager
+- ThresholdPlan: Maintenance thresholds compiled for vectorized per-step evaluation
+- OnlineStatistics: Streaming per-variable statistics over every collected row
+- LoggingPolicy: Decimation/deadband/aggregation policy for slowly varying variables
+- SimulationContext: Per-simulator registries that component registration is scoped to
 - StateRegistry: Metadata management and validation
 - StateProvider: Interface for physics components to provide state data
 - StateVariable: Metadata container for individual state variables
@@ -46,6 +53,13 @@ from .interfaces import (
 
 from .state_registry import StateRegistry
 from .state_manager import StateManager
+from .state_history import StateHistoryBuffer
+from .state_spill import StateSpillSink
+from .collection_plan import StateCollectionPlan
+from .threshold_plan import ThresholdPlan
+from .online_statistics import OnlineStatistics
+from .logging_policy import LoggingPolicy
+from .simulation_context import SimulationContext, current_context
 from .auto_register import auto_register, get_registered_info, is_auto_registered
 from .component_metadata import (
     ComponentMetadata,
@@ -60,11 +74,19 @@ __all__ = [
     # Core classes
     'StateManager',
     'StateRegistry',
+    'StateHistoryBuffer',
+    'StateSpillSink',
+    'StateCollectionPlan',
+    'ThresholdPlan',
+    'OnlineStatistics',
+    'LoggingPolicy',
+    'SimulationContext',
     
     # New decorator system
     'auto_register',
     'get_registered_info',
     'is_auto_registered',
+    'current_context',
     
     # Component metadata classes
     'ComponentMetadata',
@@ -23,6 +23,7 @@ from .component_metadata import (
     infer_equipment_type_from_class_name, infer_capabilities_from_state_variables,
     extract_design_parameters_from_config
 )
+from .simulation_context import current_context
 
 
 def auto_register(
@@ -53,7 +54,8 @@ def auto_register(
             - None (auto-detect common patterns)
         allow_no_id: If True, components without IDs get auto-generated IDs
         use_global: If True, register with global StateManager. If False (default),
-                   register with current local StateManager (sim.py pattern)
+                   queue in the active SimulationContext for the simulator's own
+                   StateManager to discover (sim.py pattern)
         equipment_type: Optional explicit equipment type (auto-inferred if not provided)
         description: Optional human-readable description
         design_parameters: Optional dict of design parameters (auto-extracted if not provided)
@@ -137,11 +139,8 @@ def auto_register(
                         )
                     else:
                         # Register with current local state manager (sim.py pattern)
-                        # Add to pending registration list for discovery
-                        if not hasattr(StateManager, '_pending_registrations'):
-                            StateManager._pending_registrations = []
-                        
-                        StateManager._pending_registrations.append({
+                        # Queue in the active simulation context for discovery
+                        current_context().add_pending_registration({
                             'instance': self,
                             'instance_id': instance_id,
                             'category': cat_enum,
@@ -215,9 +214,7 @@ def _extract_instance_id(instance: Any, id_source: Optional[str], component_code
     
     # 4. Generate ID if allowed
     if allow_no_id:
-        # Import here to avoid circular imports
-        from .state_manager import StateManager
-        counter = StateManager.get_next_instance_number(component_code)
+        counter = current_context().next_instance_number(component_code)
         return f"{component_code}-{counter:03d}"
     
     # 5. No ID found and not allowed
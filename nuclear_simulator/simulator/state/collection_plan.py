@@ -0,0 +1,193 @@
+"""
+State Collection Plan
+
+This module compiles the StateManager's provider list into a reusable
+collection plan. Protocol probing (get_current_state vs get_state_dict), the
+hierarchical ``category.variable`` names and the history buffer column slots
+are resolved once; every later step only calls the bound provider methods and
+copies their values straight into the history buffer.
+
+A provider keeps its fast path as long as it returns the same keys with the
+same value types as when it was bound. Anything else (new variables, a float
+turning into a status string, a missing value) is written through the
+buffer's regular type-promoting path and the provider is rebound for the next
+step. The plan is recompiled when providers register or unregister and when
+the buffer schema is dropped.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import warnings
+
+import numpy as np
+
+from .state_history import StateHistoryBuffer
+
+
+class _ProviderEntry:
+    """Compiled collection state of one provider"""
+
+    __slots__ = ('provider', 'category', 'method', 'prefix', 'keys', 'types', 'names',
+                 'fast', 'num_pos', 'obj_pos', 'obj_cols', 'stage_start', 'stage_stop')
+
+    def __init__(self, provider: Any, category: str, method: Callable[[], Dict[str, Any]],
+                 prefix: Optional[str]):
+        self.provider = provider
+        self.category = category
+        self.method = method
+        self.prefix = prefix          # None: keys are already full variable names
+        self.keys: Tuple[str, ...] = ()
+        self.types: Tuple[type, ...] = ()
+        self.names: Tuple[str, ...] = ()
+        self.fast = False
+        self.num_pos: Optional[Tuple[int, ...]] = None  # None: every value is numeric
+        self.obj_pos: Tuple[int, ...] = ()
+        self.obj_cols = np.empty(0, dtype=np.intp)
+        self.stage_start = 0
+        self.stage_stop = 0
+
+    def full_names(self, keys: Tuple[str, ...]) -> Tuple[str, ...]:
+        if keys == self.keys:
+            return self.names
+        if self.prefix is None:
+            return keys
+        return tuple(f"{self.prefix}.{key}" for key in keys)
+
+
+class StateCollectionPlan:
+    """
+    Precompiled per-step collection from a list of (provider, category) pairs.
+    """
+
+    def __init__(self, providers: List[Tuple[Any, str]], history: StateHistoryBuffer):
+        """
+        Compile the provider protocol of every provider.
+
+        Args:
+            providers: StateManager provider list of (provider, category) pairs
+            history: History buffer the plan writes into
+        """
+        self.history = history
+        self.entries: List[_ProviderEntry] = []
+        for provider, category in providers:
+            # Try StateProvider protocol first (get_current_state), then fall back
+            # to get_state_dict for auto-registered components
+            method = getattr(provider, 'get_current_state', None)
+            prefix = None
+            if not callable(method):
+                method = getattr(provider, 'get_state_dict', None)
+                prefix = category
+            if not callable(method):
+                warnings.warn(f"Provider {category} does not implement StateProvider protocol or get_state_dict method")
+                continue
+            self.entries.append(_ProviderEntry(provider, category, method, prefix))
+
+        self._schema_version = None       # Buffer schema the column slots belong to
+        self._stage = np.empty(0, dtype=np.float64)
+        self._stage_cols = np.empty(0, dtype=np.intp)
+
+    @property
+    def bound(self) -> bool:
+        """Whether column slots are resolved for the buffer's current schema"""
+        return self._schema_version == self.history.schema_version
+
+    def collect(self, time: Any) -> int:
+        """
+        Collect one row from every provider into the history buffer.
+
+        Args:
+            time: Collection timestamp
+
+        Returns:
+            Physical row position of the collected row
+        """
+        history = self.history
+        pos = history.new_row(time)
+        rebind_all = not self.bound
+        if rebind_all:
+            for entry in self.entries:
+                entry.fast = False
+
+        stage = self._stage
+        deferred = []
+        for entry in self.entries:
+            try:
+                state = entry.method()
+            except Exception as e:
+                warnings.warn(f"Failed to collect state from provider {entry.category}: {e}")
+                if entry.fast:
+                    stage[entry.stage_start:entry.stage_stop] = np.nan
+                continue
+
+            values = tuple(state.values())
+            if (rebind_all or not entry.fast or tuple(state) != entry.keys
+                    or tuple(map(type, values)) != entry.types):
+                deferred.append((entry, state))
+                if entry.fast:
+                    stage[entry.stage_start:entry.stage_stop] = np.nan
+                continue
+
+            if entry.num_pos is None:
+                stage[entry.stage_start:entry.stage_stop] = values
+            else:
+                stage[entry.stage_start:entry.stage_stop] = [values[i] for i in entry.num_pos]
+                history.write_objects(pos, entry.obj_cols, [values[i] for i in entry.obj_pos])
+
+        if not rebind_all and stage.size:
+            history.write_numeric(pos, self._stage_cols, stage)
+
+        if deferred:
+            # Type-promoting path; may add or move columns, so rebind afterwards
+            write = history.write_value
+            for entry, state in deferred:
+                for name, value in zip(entry.full_names(tuple(state)), state.values()):
+                    write(pos, name, value)
+            for entry, state in deferred:
+                self._bind(entry, state)
+            self._layout()
+        return pos
+
+    def _bind(self, entry: _ProviderEntry, state: Dict[str, Any]) -> None:
+        """Resolve the column slots of one provider from the state it just returned."""
+        history = self.history
+        keys = tuple(state)
+        values = tuple(state.values())
+        names = entry.full_names(keys)
+
+        num_pos, obj_pos = [], []
+        for i, name in enumerate(names):
+            is_object, _ = history.column_slot(name)
+            (obj_pos if is_object else num_pos).append(i)
+
+        entry.keys = keys
+        entry.names = names
+        entry.types = tuple(map(type, values))
+        # Duplicate names would make positional writes ambiguous
+        entry.fast = len(set(names)) == len(names)
+        entry.num_pos = None if not obj_pos else tuple(num_pos)
+        entry.obj_pos = tuple(obj_pos)
+        entry.obj_cols = np.array([history.column_slot(names[i])[1] for i in obj_pos], dtype=np.intp)
+
+    def _layout(self) -> None:
+        """Rebuild the numeric staging vector from the bound entries."""
+        history = self.history
+        cols = []
+        offset = 0
+        for entry in self.entries:
+            if not entry.fast:
+                entry.stage_start = entry.stage_stop = offset
+                continue
+            positions = range(len(entry.names)) if entry.num_pos is None else entry.num_pos
+            slots = [history.column_slot(entry.names[i]) for i in positions]
+            if any(slot is None or slot[0] for slot in slots):
+                # Column moved by another provider writing the same name
+                entry.fast = False
+                entry.stage_start = entry.stage_stop = offset
+                continue
+            entry.stage_start = offset
+            cols.extend(slot[1] for slot in slots)
+            offset = len(cols)
+            entry.stage_stop = offset
+
+        self._stage_cols = np.array(cols, dtype=np.intp)
+        self._stage = np.full(len(cols), np.nan, dtype=np.float64)
+        self._schema_version = history.schema_version
@@ -18,8 +18,11 @@ from enum import Enum
 import warnings
 import inspect
 
+from ..sim_logging import get_logger
 from .interfaces import StateVariable, StateCategory
 
+logger = get_logger(__name__)
+
 
 class EquipmentType(Enum):
     """Equipment type classification based on nuclear plant components"""
@@ -64,20 +67,38 @@ class ComponentMetadata:
     registration_time: Optional[float] = None            # When component was registered
 
 
+class _registry_method:
+    """Registry method that, accessed on the class, binds to the active context's registry"""
+    
+    def __init__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+        self.__name__ = func.__name__
+    
+    def __get__(self, instance, owner):
+        if instance is None:
+            from .simulation_context import current_context
+            instance = current_context().component_registry
+        return self.func.__get__(instance, owner)
+
+
 class ComponentRegistry:
     """
     Registry for tracking all nuclear plant components at runtime
     
-    Provides centralized access to component metadata, instances, and relationships
+    Provides centralized access to component metadata, instances, and relationships.
+    Each SimulationContext owns one registry; methods called on the class itself
+    act on the registry of the active context.
     """
     
-    _components: Dict[str, Dict[str, Any]] = {}
-    _equipment_types: Dict[EquipmentType, Set[str]] = {}
-    _systems: Dict[str, Set[str]] = {}
-    _capabilities: Dict[str, Set[str]] = {}
+    def __init__(self):
+        self._components: Dict[str, Dict[str, Any]] = {}
+        self._equipment_types: Dict[EquipmentType, Set[str]] = {}
+        self._systems: Dict[str, Set[str]] = {}
+        self._capabilities: Dict[str, Set[str]] = {}
     
-    @classmethod
-    def register_component(cls, component, metadata: ComponentMetadata) -> None:
+    @_registry_method
+    def register_component(self, component, metadata: ComponentMetadata) -> None:
         """
         Register a component with the registry
         
@@ -87,63 +108,63 @@ class ComponentRegistry:
         """
         component_id = metadata.component_id
         
-        if component_id in cls._components:
+        if component_id in self._components:
             warnings.warn(f"Component '{component_id}' is already registered. Overwriting.")
         
         # Store component information
-        cls._components[component_id] = {
+        self._components[component_id] = {
             'instance': component,
             'metadata': metadata,
             'state_variables': component.get_state_variables() if hasattr(component, 'get_state_variables') else {}
         }
         
         # Update equipment type index
-        if metadata.equipment_type not in cls._equipment_types:
-            cls._equipment_types[metadata.equipment_type] = set()
-        cls._equipment_types[metadata.equipment_type].add(component_id)
+        if metadata.equipment_type not in self._equipment_types:
+            self._equipment_types[metadata.equipment_type] = set()
+        self._equipment_types[metadata.equipment_type].add(component_id)
         
         # Update system index
-        if metadata.system not in cls._systems:
-            cls._systems[metadata.system] = set()
-        cls._systems[metadata.system].add(component_id)
+        if metadata.system not in self._systems:
+            self._systems[metadata.system] = set()
+        self._systems[metadata.system].add(component_id)
         
         # Update capabilities index
         for capability_type, capabilities in metadata.capabilities.items():
             for capability in capabilities:
-                if capability not in cls._capabilities:
-                    cls._capabilities[capability] = set()
-                cls._capabilities[capability].add(component_id)
+                if capability not in self._capabilities:
+                    self._capabilities[capability] = set()
+                self._capabilities[capability].add(component_id)
     
-    @classmethod
-    def get_component(cls, component_id: str) -> Optional[Dict[str, Any]]:
+    @_registry_method
+    def get_component(self, component_id: str) -> Optional[Dict[str, Any]]:
         """Get component information by ID"""
-        return cls._components.get(component_id)
+        return self._components.get(component_id)
     
-    @classmethod
-    def get_all_components(cls) -> Dict[str, Dict[str, Any]]:
+    @_registry_method
+    def get_all_components(self) -> Dict[str, Dict[str, Any]]:
         """Get all registered components"""
-        return cls._components.copy()
+        return self._components.copy()
     
-    @classmethod
-    def get_components_by_type(cls, equipment_type: EquipmentType) -> Dict[str, Dict[str, Any]]:
+    @_registry_method
+    def get_components_by_type(self, equipment_type: EquipmentType) -> Dict[str, Dict[str, Any]]:
         """Get all components of a specific equipment type"""
-        component_ids = cls._equipment_types.get(equipment_type, set())
-        return {cid: cls._components[cid] for cid in component_ids if cid in cls._components}
+        component_ids = self._equipment_types.get(equipment_type, set())
+        return {cid: self._components[cid] for cid in component_ids if cid in self._components}
     
-    @classmethod
-    def get_components_by_system(cls, system: str) -> Dict[str, Dict[str, Any]]:
+    @_registry_method
+    def get_components_by_system(self, system: str) -> Dict[str, Dict[str, Any]]:
         """Get all components in a specific system"""
-        component_ids = cls._systems.get(system, set())
-        return {cid: cls._components[cid] for cid in component_ids if cid in cls._components}
+        component_ids = self._systems.get(system, set())
+        return {cid: self._components[cid] for cid in component_ids if cid in self._components}
     
-    @classmethod
-    def get_components_with_capability(cls, capability: str) -> Dict[str, Dict[str, Any]]:
+    @_registry_method
+    def get_components_with_capability(self, capability: str) -> Dict[str, Dict[str, Any]]:
         """Get all components that have a specific capability"""
-        component_ids = cls._capabilities.get(capability, set())
-        return {cid: cls._components[cid] for cid in component_ids if cid in cls._components}
+        component_ids = self._capabilities.get(capability, set())
+        return {cid: self._components[cid] for cid in component_ids if cid in self._components}
     
-    @classmethod
-    def update_component_description(cls, component_id: str, description: str) -> bool:
+    @_registry_method
+    def update_component_description(self, component_id: str, description: str) -> bool:
         """
         Update the description of a registered component
         
@@ -154,40 +175,40 @@ class ComponentRegistry:
         Returns:
             True if successful, False if component not found
         """
-        if component_id in cls._components:
-            cls._components[component_id]['metadata'].description = description
+        if component_id in self._components:
+            self._components[component_id]['metadata'].description = description
             return True
         return False
     
-    @classmethod
-    def find_components_with_description(cls) -> Dict[str, str]:
+    @_registry_method
+    def find_components_with_description(self) -> Dict[str, str]:
         """Get all components that have descriptions"""
         components_with_desc = {}
-        for cid, info in cls._components.items():
+        for cid, info in self._components.items():
             desc = info['metadata'].description
             if desc:
                 components_with_desc[cid] = desc
         return components_with_desc
     
-    @classmethod
-    def get_component_count(cls) -> int:
+    @_registry_method
+    def get_component_count(self) -> int:
         """Get total number of registered components"""
-        return len(cls._components)
+        return len(self._components)
     
-    @classmethod
-    def clear(cls) -> None:
+    @_registry_method
+    def clear(self) -> None:
         """Clear all registered components"""
-        cls._components.clear()
-        cls._equipment_types.clear()
-        cls._systems.clear()
-        cls._capabilities.clear()
+        self._components.clear()
+        self._equipment_types.clear()
+        self._systems.clear()
+        self._capabilities.clear()
     
-    @classmethod
-    def generate_component_summary(cls) -> str:
+    @_registry_method
+    def generate_component_summary(self) -> str:
         """Generate a summary report of all registered components"""
-        total = cls.get_component_count()
-        type_counts = {eq_type.value: len(components) for eq_type, components in cls._equipment_types.items() if components}
-        system_counts = {system: len(components) for system, components in cls._systems.items() if components}
+        total = self.get_component_count()
+        type_counts = {eq_type.value: len(components) for eq_type, components in self._equipment_types.items() if components}
+        system_counts = {system: len(components) for system, components in self._systems.items() if components}
         
         summary = f"Component Registry Summary\n"
         summary += f"========================\n"
@@ -269,22 +290,22 @@ def infer_equipment_type_from_class_name(class_name: str) -> EquipmentType:
     """
     class_name_lower = class_name.lower()
     
-    print(f"EQUIPMENT TYPE DETECTION: Analyzing class '{class_name}' (lowercase: '{class_name_lower}')")
+    logger.debug("EQUIPMENT TYPE DETECTION: Analyzing class '%s' (lowercase: '%s')", class_name, class_name_lower)
     
     for equipment_type, keywords in EQUIPMENT_TYPE_KEYWORDS.items():
         if all(keyword in class_name_lower for keyword in keywords):
-            print(f"  ✅ ALL keywords match for {equipment_type}: {keywords}")
+            logger.debug("  ✅ ALL keywords match for %s: %s", equipment_type, keywords)
             return equipment_type
     
     # Single keyword fallback
     for equipment_type, keywords in EQUIPMENT_TYPE_KEYWORDS.items():
         if any(keyword in class_name_lower for keyword in keywords):
             matching_keywords = [kw for kw in keywords if kw in class_name_lower]
-            print(f"  ✅ SOME keywords match for {equipment_type}: {matching_keywords} (from {keywords})")
+            logger.debug("  ✅ SOME keywords match for %s: %s (from %s)", equipment_type, matching_keywords, keywords)
             return equipment_type
     
-    print(f"  ❌ NO keywords matched for '{class_name}' - returning UNKNOWN")
-    print(f"  Available keyword sets: {list(EQUIPMENT_TYPE_KEYWORDS.values())}")
+    logger.debug("  ❌ NO keywords matched for '%s' - returning UNKNOWN", class_name)
+    logger.debug("  Available keyword sets: %s", list(EQUIPMENT_TYPE_KEYWORDS.values()))
     return EquipmentType.UNKNOWN
 
 
@@ -5,7 +5,7 @@ This module defines the interfaces and protocols for the state management system
 All physics components that want to provide state data should implement StateProvider.
 """
 
-from typing import Dict, Any, Protocol, Optional, Tuple
+from typing import Dict, Any, Mapping, Protocol, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -71,8 +71,8 @@ class StateCollector(Protocol):
         """Register a state provider with the collector"""
         ...
     
-    def collect_states(self, timestamp: float) -> Dict[str, Any]:
-        """Collect current state from all registered providers"""
+    def collect_states(self, timestamp: float) -> Mapping[str, Any]:
+        """Collect current state from all registered providers (a read-only copy of the row)"""
         ...
 
 
@@ -0,0 +1,407 @@
+"""
+State Logging Policies
+
+This module lets the StateManager record slowly varying variables at a lower
+rate than the simulator time step. A LoggingPolicy is attached to a variable
+name pattern (a category/subcategory prefix such as ``secondary.steam_generator``,
+a full variable name, or an fnmatch glob such as ``*.oil_quality*``):
+
+- ``every``: record every collection (default for unmatched variables)
+- ``decimate``: record every ``interval``-th collection
+- ``deadband``: record when any variable of the policy moved by more than
+  ``deadband`` since it was last recorded
+- ``aggregate``: record the mean/min/max of each variable over a window of
+  ``interval`` collections (min/max as ``<name>_min``/``<name>_max``); a
+  partial window left at the end of a run is recorded when the StateManager
+  exports or flushes
+
+Variables sharing a policy pattern are stored together in a PolicyChannel,
+each with its own history buffer (and spill sink), so a decimated category
+holds only its logged rows. The most specific matching pattern wins. Merged
+frames keep each channel at its own cadence: a variable has values only at
+the times its channel recorded and NaN in between.
+
+Example YAML (same file that feeds ``StateManager.load_maintenance_config``)::
+
+    state_logging:
+      policies:
+        secondary.steam_generator:
+          mode: decimate
+          interval: 60
+        "*.oil_quality":
+          mode: deadband
+          deadband: 0.001
+        secondary.condenser:
+          mode: aggregate
+          interval: 15
+          stats: [mean, max]
+"""
+
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .state_history import StateHistoryBuffer, KIND_FLOAT, KIND_OBJECT, selection_index
+from .state_spill import StateSpillSink
+
+
+POLICY_MODES = ('every', 'decimate', 'deadband', 'aggregate')
+AGGREGATE_STATS = ('mean', 'min', 'max')
+
+
+@dataclass
+class LoggingPolicy:
+    """How often the variables matching one pattern are recorded"""
+    mode: str = 'every'
+    interval: int = 1               # Decimation factor / aggregation window (collections)
+    deadband: float = 0.0           # Absolute change that triggers a deadband record
+    stats: Tuple[str, ...] = AGGREGATE_STATS
+
+    def __post_init__(self):
+        if self.mode not in POLICY_MODES:
+            raise ValueError(f"Unknown logging policy mode '{self.mode}'. "
+                             f"Expected one of {list(POLICY_MODES)}")
+        self.interval = max(1, int(self.interval))
+        self.deadband = abs(float(self.deadband))
+        self.stats = tuple(self.stats)
+        unknown = [s for s in self.stats if s not in AGGREGATE_STATS]
+        if unknown or not self.stats:
+            raise ValueError(f"Unknown aggregate stats {unknown}. "
+                             f"Expected a subset of {list(AGGREGATE_STATS)}")
+
+    @classmethod
+    def from_config(cls, config: Any) -> 'LoggingPolicy':
+        """
+        Build a policy from a config entry.
+
+        Args:
+            config: LoggingPolicy, dict of fields, or an int (decimation interval)
+
+        Returns:
+            LoggingPolicy
+        """
+        if isinstance(config, cls):
+            return config
+        if isinstance(config, int):
+            return cls(mode='decimate', interval=config)
+        return cls(**{k: v for k, v in dict(config).items() if k in cls.__dataclass_fields__})
+
+
+def match_policy(name: str, patterns: Iterable[str]) -> Optional[str]:
+    """
+    Find the most specific policy pattern for a variable.
+
+    A pattern matches a variable equal to it, any variable below it in the
+    dotted hierarchy (including instance subcategories registered as
+    ``<subcategory>_<instance_id>``), or any variable its fnmatch glob
+    matches. Longer patterns are more specific.
+
+    Args:
+        name: Full variable name
+        patterns: Policy patterns
+
+    Returns:
+        Matching pattern, or None
+    """
+    best = None
+    for pattern in patterns:
+        if (name == pattern or name.startswith((pattern + '.', pattern + '_'))
+                or fnmatchcase(name, pattern)):
+            if best is None or len(pattern) > len(best):
+                best = pattern
+    return best
+
+
+class PolicyChannel:
+    """
+    History buffer (and optional spill sink) recording one group of variables
+    under a LoggingPolicy.
+    """
+
+    def __init__(self, pattern: Optional[str], policy: LoggingPolicy, history: StateHistoryBuffer,
+                 spill: Optional[StateSpillSink] = None):
+        """
+        Initialize channel.
+
+        Args:
+            pattern: Policy pattern (None for the StateManager's default channel)
+            policy: Logging policy
+            history: Buffer the channel records into
+            spill: Optional spill sink for full buffers
+        """
+        self.pattern = pattern
+        self.policy = policy
+        self.history = history
+        self.spill = spill
+        self.names: List[str] = []  # Source variables routed to this channel
+        self.reset()
+
+    def set_policy(self, policy: LoggingPolicy) -> None:
+        """Replace the policy; recording state is rebuilt on the next offered row."""
+        if policy != self.policy:
+            self.policy = policy
+            self._source_version = None
+
+    def reset(self) -> None:
+        """Forget routed variables and policy state (after the source schema is dropped)."""
+        self.names = []
+        self._source_version = None
+        self._src_num = np.empty(0, dtype=np.intp)
+        self._src_obj = np.empty(0, dtype=np.intp)
+        self._dst_num: Dict[str, np.ndarray] = {}
+        self._dst_obj = np.empty(0, dtype=np.intp)
+        self._reset_window()
+
+    def _reset_window(self) -> None:
+        self._count = 0
+        self._last_time = None
+        self._last_numeric: Optional[np.ndarray] = None
+        self._last_objects: Optional[List[Any]] = None
+        self._sum = self._min = self._max = self._valid = None
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def _bind(self, source: StateHistoryBuffer) -> None:
+        """Resolve source and destination slots for the routed variables."""
+        history = self.history
+        numeric, objects = [], []
+        for name in self.names:
+            is_object, _ = source.column_slot(name)
+            (objects if is_object else numeric).append(name)
+
+        self._src_num = np.array([source.column_slot(n)[1] for n in numeric], dtype=np.intp)
+        self._src_obj = np.array([source.column_slot(n)[1] for n in objects], dtype=np.intp)
+
+        if self.policy.mode == 'aggregate':
+            suffixes = {'mean': '', 'min': '_min', 'max': '_max'}
+            self._dst_num = {}
+            for stat in self.policy.stats:
+                # Means are fractional; min/max keep the reported dtype
+                self._dst_num[stat] = np.array(
+                    [history.ensure_column(n + suffixes[stat],
+                                           KIND_FLOAT if stat == 'mean' else source.column_kind(n))[1]
+                     for n in numeric], dtype=np.intp)
+        else:
+            self._dst_num = {'value': np.array(
+                [history.ensure_column(n, source.column_kind(n))[1] for n in numeric], dtype=np.intp)}
+        self._dst_obj = np.array([history.ensure_column(n, KIND_OBJECT)[1] for n in objects],
+                                 dtype=np.intp)
+        self._source_version = source.schema_version
+        if self.policy.mode != 'decimate':
+            self._reset_window()  # Window/deadband state refers to the old column set
+
+    def make_room(self) -> None:
+        """Flush a full buffer to the spill sink before the next row is recorded."""
+        if self.spill is not None and len(self.history) >= min(self.spill.rows_per_chunk,
+                                                               self.history.max_rows):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the in-memory tail to the spill sink."""
+        if self.spill is None or self.history.empty:
+            return
+        self.spill.write_chunk(self.history.to_frame())
+        self.history.reset_rows()
+
+    def _record(self, time: Any, numeric: Dict[str, np.ndarray], objects: List[Any]) -> None:
+        self.make_room()
+        history = self.history
+        pos = history.new_row(time)
+        for key, values in numeric.items():
+            history.write_numeric(pos, self._dst_num[key], values)
+        history.write_objects(pos, self._dst_obj, objects)
+
+    def offer(self, source: StateHistoryBuffer, pos: int, time: Any) -> bool:
+        """
+        Offer one collected row; record it if the policy says so.
+
+        Args:
+            source: Buffer holding the collected row
+            pos: Physical row position in the source
+            time: Collection timestamp
+
+        Returns:
+            True if a row was recorded
+        """
+        if not self.names:
+            return False
+        if self._source_version != source.schema_version:
+            self._bind(source)
+
+        policy = self.policy
+        mode = policy.mode
+        self._count += 1
+
+        if mode == 'decimate' and (self._count - 1) % policy.interval:
+            return False
+
+        values = source.read_numeric(pos, self._src_num)
+        objects = source.read_objects(pos, self._src_obj)
+
+        if mode == 'deadband':
+            last = self._last_numeric
+            if last is not None and objects == self._last_objects:
+                with np.errstate(invalid='ignore'):
+                    moved = np.abs(values - last) > policy.deadband
+                moved |= np.isnan(values) != np.isnan(last)
+                if not moved.any():
+                    return False
+            self._last_numeric = values
+            self._last_objects = objects
+
+        elif mode == 'aggregate':
+            valid = ~np.isnan(values)
+            if self._sum is None:
+                self._sum = np.where(valid, values, 0.0)
+                self._valid = valid.astype(np.int64)
+                self._min = values.copy()
+                self._max = values.copy()
+            else:
+                self._sum += np.where(valid, values, 0.0)
+                self._valid += valid
+                np.fmin(self._min, values, out=self._min)
+                np.fmax(self._max, values, out=self._max)
+            self._last_time = time
+            self._last_objects = objects
+            if self._count < policy.interval:
+                return False
+            self._record_window()
+            return True
+
+        self._record(time, {'value': values}, objects)
+        return True
+
+    def _record_window(self) -> None:
+        """Record the statistics of the current aggregation window and start a new one."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            stats = {'mean': self._sum / self._valid, 'min': self._min, 'max': self._max}
+        self._record(self._last_time, {stat: stats[stat] for stat in self.policy.stats},
+                     self._last_objects)
+        self._reset_window()
+
+    def flush_window(self) -> bool:
+        """
+        Record a partially filled aggregation window (e.g. at the end of a run).
+
+        The row is stamped with the time of the window's latest collection.
+
+        Returns:
+            True if a row was recorded
+        """
+        if self.policy.mode != 'aggregate' or self._sum is None:
+            return False
+        self._record_window()
+        return True
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def has_column(self, name: str) -> bool:
+        """Whether the variable is held in memory or in spilled chunks"""
+        return name in self.history or (self.spill is not None and self.spill.has_column(name))
+
+    def columns(self) -> List[str]:
+        """All variable names across spilled chunks and the in-memory tail"""
+        if self.spill is None or not self.spill.chunks:
+            return self.history.columns
+        columns = self.spill.columns()
+        seen = set(columns)
+        columns.extend(c for c in self.history.columns if c not in seen)
+        return columns
+
+    @property
+    def total_rows(self) -> int:
+        """Rows recorded in memory and on disk"""
+        return len(self.history) + (self.spill.total_rows if self.spill is not None else 0)
+
+    @property
+    def version(self) -> Tuple[int, int]:
+        """Changes whenever recorded rows change (cache invalidation)"""
+        return self.history.version, len(self.spill.chunks) if self.spill is not None else 0
+
+    def time_bounds(self) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """(earliest, latest) recorded timestamps, or None if empty"""
+        bounds = [b for b in (self.spill.time_bounds() if self.spill is not None else None,
+                              self.history.time_bounds()) if b is not None]
+        if not bounds:
+            return None
+        return min(b[0] for b in bounds), max(b[1] for b in bounds)
+
+    def read(self, columns: Optional[List[str]] = None,
+             time_range: Optional[Tuple[Any, Any]] = None) -> pd.DataFrame:
+        """
+        Materialize recorded rows across spilled chunks and the in-memory tail.
+
+        Args:
+            columns: Variables to include (default: all recorded variables)
+            time_range: Optional (start_time, end_time) filter
+
+        Returns:
+            DataFrame with 'time' first, indexed by global row number
+        """
+        rows = None if time_range is None else self.history.time_selection(*time_range)
+        tail = self.history.to_frame(columns, rows)
+        if rows is not None and not tail.empty:
+            tail.index = selection_index(rows)
+
+        if self.spill is None or not self.spill.chunks:
+            return tail
+
+        start_time, end_time = time_range if time_range is not None else (None, None)
+        frames = [frame.set_axis(chunk_rows) for frame, chunk_rows
+                  in self.spill.read(columns, start_time, end_time)]
+        if not tail.empty:
+            tail.index = tail.index + self.spill.total_rows
+            frames.append(tail)
+
+        ordered = ['time'] + (self.columns() if columns is None
+                              else [c for c in columns if self.has_column(c)])
+        if not frames:
+            return pd.DataFrame(columns=ordered)
+        return pd.concat(frames).reindex(columns=ordered)
+
+    def clear(self) -> None:
+        """Drop recorded rows (memory and disk) and routed variables."""
+        self.history.clear()
+        if self.spill is not None:
+            self.spill.clear()
+        self.reset()
+
+
+def merge_channel_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Align channel frames recorded at different rates on one time axis.
+
+    The result has one row per distinct timestamp of any channel. Each
+    channel's values appear only at the times it recorded and are missing
+    (NaN) in between, so decimated, deadbanded and aggregated channels keep
+    their own cadence.
+
+    Args:
+        frames: Channel frames with a 'time' column, each in chronological order
+
+    Returns:
+        DataFrame with 'time' first and a fresh RangeIndex
+    """
+    frames = [f for f in frames if not f.empty]
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0].reset_index(drop=True)
+
+    times = np.unique(np.concatenate([f['time'].to_numpy(dtype='datetime64[ns]') for f in frames]))
+    index = pd.DatetimeIndex(times)
+    parts = [pd.Series(times, name='time')]
+    seen = {'time'}
+    for frame in frames:
+        frame = frame.drop_duplicates('time', keep='last').set_index('time')
+        frame = frame[[c for c in frame.columns if c not in seen]]
+        seen.update(frame.columns)
+        parts.append(frame.reindex(index).reset_index(drop=True))
+    return pd.concat(parts, axis=1)
@@ -0,0 +1,395 @@
+"""
+Online Statistics
+
+This module provides streaming per-variable statistics for the StateManager.
+
+Every collected row updates a set of accumulators held in flat NumPy arrays
+(one slot per variable): count, mean and variance by Welford's algorithm,
+min/max, the last value, and P² (Jain & Chlamtac) estimates of a few
+quantiles. The accumulators cover every row ever collected, so run
+summaries stay correct after the history buffer wraps or spills, and are
+available in O(1) even when history storage is disabled.
+
+Like ThresholdPlan, rows collected into a history buffer are read with one
+fancy-indexed gather using column bindings that are refreshed when the
+buffer schema changes; plain mappings fall back to a name lookup.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .state_history import KIND_FLOAT, KIND_OBJECT, RowView, StateHistoryBuffer, value_kind
+
+
+DEFAULT_QUANTILES = (0.25, 0.5, 0.75)
+
+# P² keeps five markers per quantile: min, p/2, p, (1+p)/2 and max
+P2_MARKERS = 5
+
+
+def quantile_label(q: float) -> str:
+    """Row label of a quantile in summary frames (describe() style, e.g. '25%')"""
+    return f"{q * 100:g}%"
+
+
+class OnlineStatistics:
+    """
+    Streaming per-variable statistics over every collected row.
+    """
+
+    def __init__(self, quantiles: Sequence[float] = DEFAULT_QUANTILES):
+        """
+        Initialize accumulators.
+
+        Args:
+            quantiles: Quantiles to estimate with P² (each strictly between 0 and 1)
+        """
+        quantiles = tuple(float(q) for q in quantiles)
+        if any(not 0.0 < q < 1.0 for q in quantiles):
+            raise ValueError(f"Quantiles must lie strictly between 0 and 1, got {quantiles}")
+        self.quantiles = quantiles
+
+        # Desired position of middle marker i after n observations is 1 + (n - 1) * step[i]
+        p = np.array(quantiles, dtype=np.float64).reshape(1, -1, 1)
+        self._desired_step = np.concatenate([p / 2, p, (1 + p) / 2], axis=0)
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop all variables and accumulated statistics."""
+        self.names: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._kinds: List[str] = []
+        self.rows = 0
+        self.first_time: Optional[pd.Timestamp] = None
+        self.last_time: Optional[pd.Timestamp] = None
+
+        self._count = np.zeros(0, dtype=np.int64)
+        self._mean = np.zeros(0, dtype=np.float64)
+        self._m2 = np.zeros(0, dtype=np.float64)
+        self._min = np.zeros(0, dtype=np.float64)
+        self._max = np.zeros(0, dtype=np.float64)
+        self._last = np.zeros(0, dtype=np.float64)
+        self._last_objects: Dict[int, Any] = {}
+
+        # P² state as (marker, quantile, variable). Only the three middle marker
+        # positions are stored: the outer markers sit at 1 and at the count.
+        k = len(self.quantiles)
+        self._markers = np.zeros((P2_MARKERS, k, 0), dtype=np.float64)
+        self._positions = np.zeros((P2_MARKERS - 2, k, 0), dtype=np.float64)
+
+        # Column bindings against a history buffer schema
+        self._buffer: Optional[StateHistoryBuffer] = None
+        self._schema_version = -1
+        self._num_slots = np.empty(0, dtype=np.intp)   # Statistic slots of numeric columns
+        self._num_index: Any = self._num_slots         # ... as a slice when consecutive
+        self._num_cols = np.empty(0, dtype=np.intp)    # ... and their column indices
+        self._obj_slots = np.empty(0, dtype=np.intp)
+        self._obj_cols = np.empty(0, dtype=np.intp)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    # ------------------------------------------------------------------
+    # Updating
+    # ------------------------------------------------------------------
+
+    def _slot(self, name: str, kind: str) -> int:
+        """Statistic slot of a variable, adding it on first sight."""
+        slot = self._index.get(name)
+        if slot is not None:
+            if kind == KIND_OBJECT:
+                self._kinds[slot] = KIND_OBJECT
+            return slot
+        slot = len(self.names)
+        self.names.append(name)
+        self._index[name] = slot
+        self._kinds.append(kind)
+        return slot
+
+    def _grow(self) -> None:
+        """Extend the accumulator arrays to cover newly added variables."""
+        extra = len(self.names) - len(self._count)
+        if extra <= 0:
+            return
+        self._count = np.concatenate((self._count, np.zeros(extra, dtype=np.int64)))
+        self._mean = np.concatenate((self._mean, np.zeros(extra)))
+        self._m2 = np.concatenate((self._m2, np.zeros(extra)))
+        self._min = np.concatenate((self._min, np.full(extra, np.inf)))
+        self._max = np.concatenate((self._max, np.full(extra, -np.inf)))
+        self._last = np.concatenate((self._last, np.full(extra, np.nan)))
+        k = len(self.quantiles)
+        self._markers = np.concatenate((self._markers, np.zeros((P2_MARKERS, k, extra))), axis=2)
+        self._positions = np.concatenate((self._positions, np.zeros((P2_MARKERS - 2, k, extra))), axis=2)
+
+    def _bind(self, buffer: StateHistoryBuffer) -> None:
+        """Resolve the statistic slot of every buffer column."""
+        num_slots, num_cols, obj_slots, obj_cols = [], [], [], []
+        for name in buffer.columns:
+            is_object, index = buffer.column_slot(name)
+            kind = buffer.column_kind(name) or KIND_FLOAT
+            if is_object:
+                obj_slots.append(self._slot(name, KIND_OBJECT))
+                obj_cols.append(index)
+            else:
+                num_slots.append(self._slot(name, kind))
+                num_cols.append(index)
+        self._grow()
+
+        self._buffer = buffer
+        self._schema_version = buffer.schema_version
+        self._num_slots = np.asarray(num_slots, dtype=np.intp)
+        self._num_cols = np.asarray(num_cols, dtype=np.intp)
+        first = num_slots[0] if num_slots else 0
+        if np.array_equal(self._num_slots, np.arange(first, first + len(num_slots))):
+            # Usual case: accumulators are updated through views instead of gather/scatter
+            self._num_index = slice(first, first + len(num_slots))
+        else:
+            self._num_index = self._num_slots
+        self._obj_slots = np.asarray(obj_slots, dtype=np.intp)
+        self._obj_cols = np.asarray(obj_cols, dtype=np.intp)
+
+    def update(self, row_data: Mapping[str, Any], time: Any = None) -> None:
+        """
+        Add one collected row to the statistics.
+
+        Args:
+            row_data: Row just collected (a RowView takes the vectorized path)
+            time: Collection timestamp (defaults to the row's 'time' value)
+        """
+        if isinstance(row_data, RowView):
+            buffer, pos = row_data._buffer, row_data._pos
+            if pos < 0:
+                return
+            if buffer is not self._buffer or buffer.schema_version != self._schema_version:
+                self._bind(buffer)
+            num_slots = self._num_slots
+            index = self._num_index
+            values = buffer.read_numeric(pos, self._num_cols)
+            obj_slots = self._obj_slots
+            objects = buffer.read_objects(pos, self._obj_cols)
+            if time is None:
+                time = buffer._times[pos]
+        else:
+            num_slots, values, obj_slots, objects = [], [], [], []
+            for name, value in row_data.items():
+                if name == 'time':
+                    continue
+                kind = value_kind(value)
+                if kind == KIND_OBJECT:
+                    obj_slots.append(self._slot(name, kind))
+                    objects.append(value)
+                else:
+                    num_slots.append(self._slot(name, kind or KIND_FLOAT))
+                    values.append(np.nan if value is None else float(value))
+            self._grow()
+            num_slots = index = np.asarray(num_slots, dtype=np.intp)
+            values = np.asarray(values, dtype=np.float64)
+            if time is None:
+                time = row_data.get('time')
+
+        self.rows += 1
+        if time is not None:
+            stamp = pd.Timestamp(time)
+            if self.first_time is None:
+                self.first_time = stamp
+            self.last_time = stamp
+
+        for slot, value in zip(obj_slots, objects):
+            if value is not None:
+                self._count[slot] += 1
+                self._last_objects[slot] = value
+
+        valid = ~np.isnan(values)
+        if not valid.all():
+            index = num_slots[valid]
+            values = values[valid]
+        if not len(values):
+            return
+
+        # Welford update of mean and sum of squared deviations
+        count = self._count[index] + 1
+        self._count[index] = count
+        mean = self._mean[index]
+        delta = values - mean
+        mean += delta / count
+        self._mean[index] = mean
+        self._m2[index] += delta * (values - mean)
+        self._min[index] = np.minimum(self._min[index], values)
+        self._max[index] = np.maximum(self._max[index], values)
+        self._last[index] = values
+
+        if self.quantiles:
+            self._update_quantiles(index, values, count)
+
+    def _update_quantiles(self, index: Any, values: np.ndarray, count: np.ndarray) -> None:
+        """
+        P² marker update for every quantile of the given variables.
+
+        Args:
+            index: Statistic slots (array, or slice of consecutive slots)
+            values: New values aligned with index
+            count: Observation counts including the new values
+        """
+        filling = count <= P2_MARKERS
+        if filling.any():
+            # The first five observations are stored as-is and sorted once complete
+            slots = np.arange(len(self._count))[index]
+            fill_slots = slots[filling]
+            self._markers[count[filling] - 1, :, fill_slots] = values[filling, np.newaxis]
+            ready = fill_slots[count[filling] == P2_MARKERS]
+            if len(ready):
+                self._markers[:, :, ready] = np.sort(self._markers[:, :, ready], axis=0)
+                self._positions[:, :, ready] = np.arange(2.0, P2_MARKERS).reshape(-1, 1, 1)
+            if filling.all():
+                return
+            index = slots[~filling]
+            values = values[~filling]
+            count = count[~filling]
+
+        # Work on C-contiguous copies so every marker row ravels into a flat view
+        if isinstance(index, slice):
+            q = self._markers[:, :, index].copy()
+            n = self._positions[:, :, index].copy()
+        else:
+            q = np.take(self._markers, index, axis=2)
+            n = np.take(self._positions, index, axis=2)
+
+        # Extend the extreme markers and shift the positions of markers above x
+        np.minimum(q[0], values, out=q[0])
+        np.maximum(q[4], values, out=q[4])
+        for i in (1, 2, 3):
+            n[i - 1] += values < q[i]
+
+        # Move the three middle markers toward their desired positions
+        count = count.astype(np.float64)
+        desired = 1.0 + (count - 1.0) * self._desired_step
+        # Outer markers sit at positions 1 and count
+        outer = np.empty_like(n[:2])
+        outer[0] = 1.0
+        outer[1] = count
+        positions = (outer[0], n[0], n[1], n[2], outer[1])
+        for i in (1, 2, 3):
+            ni = positions[i]
+            n_lo, n_hi = positions[i - 1], positions[i + 1]
+            offset = desired[i - 1] - ni
+            up = (offset >= 1) & (n_hi - ni > 1)
+            move = np.flatnonzero(up | ((offset <= -1) & (n_lo - ni < -1)))
+            if not len(move):
+                continue
+            d = np.where(up.ravel()[move], 1.0, -1.0)
+            q_i, q_lo, q_hi = q[i].ravel()[move], q[i - 1].ravel()[move], q[i + 1].ravel()[move]
+            n_i, lo, hi = ni.ravel()[move], n_lo.ravel()[move], n_hi.ravel()[move]
+            parabolic = q_i + d / (hi - lo) * ((n_i - lo + d) * (q_hi - q_i) / (hi - n_i) +
+                                               (hi - n_i - d) * (q_i - q_lo) / (n_i - lo))
+            linear = np.where(d > 0, q_i + (q_hi - q_i) / (hi - n_i), q_i - (q_lo - q_i) / (lo - n_i))
+            q[i].ravel()[move] = np.where((q_lo < parabolic) & (parabolic < q_hi), parabolic, linear)
+            ni.ravel()[move] = n_i + d
+
+        self._markers[:, :, index] = q
+        self._positions[:, :, index] = n
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _quantile_estimates(self) -> np.ndarray:
+        """(quantiles, variables) estimates; exact for variables with at most 5 values"""
+        estimates = self._markers[2].copy()
+        for slot in np.flatnonzero(self._count <= P2_MARKERS):
+            count = self._count[slot]
+            if count == 0 or self._kinds[slot] == KIND_OBJECT:
+                estimates[:, slot] = np.nan
+            else:
+                estimates[:, slot] = np.quantile(self._markers[:count, 0, slot], self.quantiles)
+        return estimates
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Statistics of one variable.
+
+        Args:
+            name: Variable name
+
+        Returns:
+            Dictionary of statistics, or None if the variable was never seen
+        """
+        slot = self._index.get(name)
+        if slot is None:
+            return None
+        count = int(self._count[slot])
+        if self._kinds[slot] == KIND_OBJECT:
+            return {'count': count, 'null_count': self.rows - count,
+                    'last': self._last_objects.get(slot), 'data_type': KIND_OBJECT}
+        numeric = count > 0
+        stats = {
+            'count': count,
+            'mean': float(self._mean[slot]) if numeric else np.nan,
+            'std': float(np.sqrt(self._m2[slot] / (count - 1))) if count > 1 else np.nan,
+            'variance': float(self._m2[slot] / (count - 1)) if count > 1 else np.nan,
+            'min': float(self._min[slot]) if numeric else np.nan,
+            'max': float(self._max[slot]) if numeric else np.nan,
+            'last': float(self._last[slot]),
+            'null_count': self.rows - count,
+            'data_type': self._kinds[slot],
+        }
+        if self.quantiles:
+            estimates = self._quantile_estimates()[:, slot] if count <= P2_MARKERS \
+                else self._markers[2, :, slot]
+            for q, estimate in zip(self.quantiles, estimates):
+                stats[quantile_label(q)] = float(estimate)
+        return stats
+
+    def summary(self, names: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Summary frame in the layout of DataFrame.describe().
+
+        Rows are count, mean, std, min, the quantiles and max, followed by
+        last, count_non_null, null_count and data_type; one column per variable.
+
+        Args:
+            names: Variables to include (default: all, in first-seen order)
+
+        Returns:
+            Summary DataFrame (empty if no variables were seen)
+        """
+        if names is None:
+            names = self.names
+        names = [name for name in names if name in self._index]
+        if not names:
+            return pd.DataFrame()
+
+        slots = np.array([self._index[name] for name in names], dtype=np.intp)
+        count = self._count[slots]
+        numeric = np.array([self._kinds[slot] != KIND_OBJECT for slot in slots]) & (count > 0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            std = np.where(count > 1, np.sqrt(self._m2[slots] / (count - 1)), np.nan)
+
+        def numeric_only(values: np.ndarray) -> np.ndarray:
+            return np.where(numeric, values, np.nan)
+
+        rows: List[Tuple[str, Any]] = [
+            ('count', count.astype(np.float64)),
+            ('mean', numeric_only(self._mean[slots])),
+            ('std', numeric_only(std)),
+            ('min', numeric_only(self._min[slots])),
+        ]
+        if self.quantiles:
+            estimates = self._quantile_estimates()[:, slots]
+            rows.extend((quantile_label(q), numeric_only(estimates[i]))
+                        for i, q in enumerate(self.quantiles))
+        rows.append(('max', numeric_only(self._max[slots])))
+        last = [self._last_objects.get(slot) if self._kinds[slot] == KIND_OBJECT else self._last[slot]
+                for slot in slots]
+        rows.extend([
+            ('last', last),
+            ('count_non_null', count),
+            ('null_count', self.rows - count),
+            ('data_type', [self._kinds[slot] for slot in slots]),
+        ])
+        return pd.DataFrame({label: list(values) for label, values in rows},
+                            index=names, dtype=object).T
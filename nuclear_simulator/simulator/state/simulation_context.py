@@ -0,0 +1,125 @@
+"""
+Simulation Context
+
+This module provides the SimulationContext, which owns the registries that
+component construction writes into: the @auto_register pending list, the
+component metadata registry, auto-generated instance counters and the
+maintenance orchestrator/registry.
+
+Each NuclearPlantSimulator builds its own context and activates it while its
+components are constructed, so registration is scoped to one simulator. Several
+plants can then be built back to back, or concurrently in threads, in one
+process without stealing each other's components.
+
+Key Features:
+1. One SimulationContext per simulator, threaded through construction
+2. Active context tracked per thread/task (contextvars), so threads don't interfere
+3. Process default context for standalone StateManagers and components
+4. Maintenance orchestrator and registry created lazily per context
+
+Usage:
+    context = SimulationContext()
+    with context.activate():
+        pump = FeedwaterPump("FWP-1A")   # Registers into context only
+
+    state_manager = StateManager(context=context)
+    state_manager.discover_registered_components()
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from .component_metadata import ComponentRegistry
+
+
+class SimulationContext:
+    """
+    Registries scoped to one simulated plant
+
+    Components decorated with @auto_register record themselves in the active
+    context; the StateManager built with the same context discovers them.
+    """
+
+    def __init__(self, name: Optional[str] = None):
+        """
+        Initialize an empty simulation context.
+
+        Args:
+            name: Optional label used in logs and repr
+        """
+        self.name = name
+        self.pending_registrations: List[Dict[str, Any]] = []
+        self.component_registry = ComponentRegistry()
+        self.instance_counters: Dict[str, int] = {}
+        self._maintenance_orchestrator = None
+        self._maintenance_registry = None
+
+    @contextmanager
+    def activate(self) -> Iterator['SimulationContext']:
+        """Make this the active context for the current thread/task"""
+        token = _active_context.set(self)
+        try:
+            yield self
+        finally:
+            _active_context.reset(token)
+
+    def add_pending_registration(self, registration: Dict[str, Any]) -> None:
+        """Queue an @auto_register instance for StateManager discovery"""
+        self.pending_registrations.append(registration)
+
+    def take_pending_registrations(self) -> List[Dict[str, Any]]:
+        """Return and clear the queued @auto_register instances"""
+        pending = self.pending_registrations
+        self.pending_registrations = []
+        return pending
+
+    def next_instance_number(self, component_code: str) -> int:
+        """Get the next auto-generated instance number for a component code"""
+        counter = self.instance_counters.get(component_code, 0) + 1
+        self.instance_counters[component_code] = counter
+        return counter
+
+    @property
+    def maintenance_orchestrator(self):
+        """Maintenance orchestrator for this plant (created on first use)"""
+        if self._maintenance_orchestrator is None:
+            from systems.maintenance.maintenance_orchestrator import MaintenanceOrchestrator
+            self._maintenance_orchestrator = MaintenanceOrchestrator()
+        return self._maintenance_orchestrator
+
+    @property
+    def maintenance_registry(self):
+        """Component maintenance registry for this plant (created on first use)"""
+        if self._maintenance_registry is None:
+            from systems.maintenance.component_registry import ComponentMaintenanceRegistry
+            self._maintenance_registry = ComponentMaintenanceRegistry()
+        return self._maintenance_registry
+
+    def clear(self) -> None:
+        """Drop all registrations, counters and maintenance state"""
+        self.pending_registrations = []
+        self.component_registry.clear()
+        self.instance_counters.clear()
+        self._maintenance_orchestrator = None
+        self._maintenance_registry = None
+
+    def __repr__(self) -> str:
+        label = f"'{self.name}', " if self.name else ""
+        return (f"SimulationContext({label}components={self.component_registry.get_component_count()}, "
+                f"pending={len(self.pending_registrations)})")
+
+
+# Used when no simulator has activated a context (standalone StateManagers/components)
+_default_context = SimulationContext(name='default')
+_active_context: ContextVar[SimulationContext] = ContextVar('simulation_context', default=_default_context)
+
+
+def current_context() -> SimulationContext:
+    """Get the active simulation context (the process default when none is active)"""
+    return _active_context.get()
+
+
+def get_default_context() -> SimulationContext:
+    """Get the process default simulation context"""
+    return _default_context
@@ -0,0 +1,710 @@
+"""
+State History Buffer
+
+This module provides the columnar history store used by the StateManager.
+
+Collected rows are written into preallocated NumPy arrays instead of being
+concatenated onto a pandas DataFrame. Numeric, boolean and integer variables
+share one float64 block (stored column-major, one contiguous array per
+variable) and everything else (status strings, etc.) goes into an object
+block. Appending a row is O(1) regardless of how much history exists; once
+``max_rows`` rows are held the buffer wraps in place and overwrites the
+oldest row. A DataFrame is only materialized when a caller asks for one.
+
+While timestamps arrive in non-decreasing order (the normal case) the ring
+doubles as a sorted time index: time-range queries binary-search the two
+physical segments and return chronological slices, so window reads cost
+O(log n + k) and the selected rows come back as views where possible.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+
+# Value kinds tracked per column so materialized frames keep the dtypes the
+# providers reported (bool flags stay bool, counters stay int64).
+KIND_FLOAT = 'float64'
+KIND_INT = 'int64'
+KIND_BOOL = 'bool'
+KIND_OBJECT = 'object'
+
+_NUMERIC_KINDS = (KIND_FLOAT, KIND_INT, KIND_BOOL)
+
+
+def value_kind(value: Any) -> Optional[str]:
+    """
+    Classify a provider value for columnar storage.
+
+    Args:
+        value: Value reported by a state provider
+
+    Returns:
+        One of the KIND_* constants, or None for a missing value
+    """
+    if value is None:
+        return None
+    if isinstance(value, (bool, np.bool_)):
+        return KIND_BOOL
+    if isinstance(value, (int, np.integer)):
+        return KIND_INT
+    if isinstance(value, (float, np.floating)):
+        return KIND_FLOAT
+    return KIND_OBJECT
+
+
+def _numeric_scalar(value: float, kind: str) -> Any:
+    """Python scalar of the given kind for a value read from the float64 block"""
+    if np.isnan(value):
+        return value
+    if kind == KIND_BOOL:
+        return bool(value)
+    if kind == KIND_INT:
+        return int(value)
+    return float(value)
+
+
+def _merge_kinds(current: str, new: str) -> str:
+    """Return the column kind able to hold both ``current`` and ``new`` values"""
+    if current == new:
+        return current
+    if current in _NUMERIC_KINDS and new in _NUMERIC_KINDS:
+        return KIND_FLOAT
+    return KIND_OBJECT
+
+
+def to_datetime64(value: Union[datetime, np.datetime64, pd.Timestamp, None]) -> np.datetime64:
+    """Convert a collection timestamp to ``datetime64[ns]`` (NaT for None)"""
+    if value is None:
+        return np.datetime64('NaT', 'ns')
+    return np.datetime64(value, 'ns')
+
+
+def selection_index(rows: Union[slice, np.ndarray]) -> pd.Index:
+    """Index of chronological row positions for a time_selection result"""
+    if isinstance(rows, slice):
+        return pd.RangeIndex(rows.start, rows.stop)
+    return pd.Index(rows)
+
+
+class StateHistoryBuffer:
+    """
+    Preallocated columnar ring buffer for collected state rows.
+
+    Capacity grows geometrically up to ``max_rows``. With ``wrap=True`` the
+    buffer then overwrites its oldest row on every append; with ``wrap=False``
+    it keeps growing and never drops history.
+    """
+
+    def __init__(self, max_rows: int = 100000, wrap: bool = True, initial_capacity: int = 1024):
+        """
+        Initialize history buffer.
+
+        Args:
+            max_rows: Maximum number of rows held before wrapping
+            wrap: Whether to overwrite the oldest rows once max_rows is reached
+            initial_capacity: Number of rows preallocated on first append
+        """
+        self.max_rows = max(1, int(max_rows))
+        self.wrap = wrap
+        self.initial_capacity = max(1, int(initial_capacity))
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop all rows and the column schema."""
+        self._capacity = 0
+        self._times = np.empty(0, dtype='datetime64[ns]')
+        self._numeric = np.empty((0, 0), dtype=np.float64, order='F')
+        self._objects = np.empty((0, 0), dtype=object)
+
+        # Column schema: name -> (is_object, column index within its block)
+        self._columns: List[str] = []
+        self._slots: Dict[str, Tuple[bool, int]] = {}
+        self._kinds: Dict[str, str] = {}
+        self._num_numeric = 0
+        self._num_objects = 0
+
+        # Ring state
+        self._start = 0
+        self._size = 0
+        self._last_pos = -1
+        self._sorted = True        # Timestamps held are non-decreasing
+        self._descent_row = -1     # Row number of the newest row earlier than its predecessor
+
+        # Bookkeeping
+        self.total_rows = 0        # Rows ever appended
+        self.overwritten_rows = 0  # Rows lost to wrapping
+        # Bumped on every mutation (cache invalidation); never reset
+        self.version = getattr(self, 'version', -1) + 1
+        # Bumped whenever a column slot is added, moved or dropped; never reset
+        self.schema_version = getattr(self, 'schema_version', -1) + 1
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle support: unused preallocated rows are not written"""
+        state = self.__dict__.copy()
+        if self._start == 0 and self._size < self._capacity:
+            # Unwrapped rows occupy [0, size): trimming keeps every physical position
+            state['_times'] = self._times[:self._size].copy()
+            state['_numeric'] = np.asfortranarray(self._numeric[:self._size])
+            state['_objects'] = self._objects[:self._size].copy()
+            state['_capacity'] = self._size
+        return state
+
+    def reset_rows(self) -> None:
+        """Drop all rows but keep the column schema and allocated arrays."""
+        self._start = 0
+        self._size = 0
+        self._last_pos = -1
+        self._sorted = True
+        self._descent_row = -1
+        self.version += 1
+
+    # ------------------------------------------------------------------
+    # Schema
+    # ------------------------------------------------------------------
+
+    @property
+    def columns(self) -> List[str]:
+        """Variable names in first-seen order (excludes 'time')"""
+        return list(self._columns)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._slots
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def empty(self) -> bool:
+        return self._size == 0
+
+    def column_kind(self, name: str) -> Optional[str]:
+        """Storage kind of a column, or None if unknown"""
+        return self._kinds.get(name)
+
+    def column_slot(self, name: str) -> Optional[Tuple[bool, int]]:
+        """Return (is_object, block index) for a column, or None if unknown"""
+        return self._slots.get(name)
+
+    def add_column(self, name: str, kind: str = KIND_FLOAT) -> Tuple[bool, int]:
+        """
+        Add a column to the schema (existing rows read as missing).
+
+        Args:
+            name: Variable name
+            kind: Initial storage kind
+
+        Returns:
+            (is_object, block index) slot of the column
+        """
+        slot = self._slots.get(name)
+        if slot is not None:
+            return slot
+
+        if kind == KIND_OBJECT:
+            slot = (True, self._num_objects)
+            self._num_objects += 1
+            self._ensure_column_capacity()
+        else:
+            slot = (False, self._num_numeric)
+            self._num_numeric += 1
+            self._ensure_column_capacity()
+
+        self._columns.append(name)
+        self._slots[name] = slot
+        self._kinds[name] = kind
+        self.schema_version += 1
+        return slot
+
+    def ensure_column(self, name: str, kind: str) -> Tuple[bool, int]:
+        """
+        Add a column or widen its kind so it can hold values of ``kind``.
+
+        Args:
+            name: Variable name
+            kind: Kind of the values about to be stored
+
+        Returns:
+            (is_object, block index) slot of the column
+        """
+        slot = self._slots.get(name)
+        if slot is None:
+            return self.add_column(name, kind)
+
+        current = self._kinds[name]
+        if kind != current:
+            merged = _merge_kinds(current, kind)
+            if merged == KIND_OBJECT and not slot[0]:
+                slot = self._convert_to_object(name)
+            elif merged != current:
+                self._kinds[name] = merged
+                self.schema_version += 1
+        return slot
+
+    def _ensure_column_capacity(self) -> None:
+        """Grow the column dimension of either block (doubling) when full."""
+        rows = self._capacity
+        if self._num_numeric > self._numeric.shape[1]:
+            new_cols = max(16, 2 * self._numeric.shape[1], self._num_numeric)
+            block = np.full((rows, new_cols), np.nan, dtype=np.float64, order='F')
+            block[:, :self._numeric.shape[1]] = self._numeric
+            self._numeric = block
+        if self._num_objects > self._objects.shape[1]:
+            new_cols = max(4, 2 * self._objects.shape[1], self._num_objects)
+            block = np.empty((rows, new_cols), dtype=object)
+            block[:, :self._objects.shape[1]] = self._objects
+            self._objects = block
+
+    def _convert_to_object(self, name: str) -> Tuple[bool, int]:
+        """Move a numeric column into the object block, preserving history."""
+        _, old_index = self._slots[name]
+        kind = self._kinds[name]
+        stored = self._numeric[:self._capacity, old_index].copy()
+        self._numeric[:, old_index] = np.nan  # Slot is retired
+
+        slot = (True, self._num_objects)
+        self._num_objects += 1
+        self._ensure_column_capacity()
+        column = self._objects[:self._capacity, slot[1]]
+        cast = bool if kind == KIND_BOOL else int if kind == KIND_INT else float
+        for i, value in enumerate(stored):
+            column[i] = None if np.isnan(value) else cast(value)
+
+        self._slots[name] = slot
+        self._kinds[name] = KIND_OBJECT
+        self.schema_version += 1
+        return slot
+
+    # ------------------------------------------------------------------
+    # Appending
+    # ------------------------------------------------------------------
+
+    def _grow_rows(self) -> None:
+        """Grow the row dimension (doubling, capped at max_rows unless unbounded)."""
+        if self._capacity == 0:
+            new_capacity = self.initial_capacity
+        else:
+            new_capacity = 2 * self._capacity
+        if self.wrap:
+            new_capacity = min(new_capacity, self.max_rows)
+
+        order = self._chronological_index()
+        times = np.empty(new_capacity, dtype='datetime64[ns]')
+        times[:self._size] = self._times[order]
+        numeric = np.full((new_capacity, self._numeric.shape[1]), np.nan,
+                          dtype=np.float64, order='F')
+        numeric[:self._size] = self._numeric[order]
+        objects = np.empty((new_capacity, self._objects.shape[1]), dtype=object)
+        objects[:self._size] = self._objects[order]
+
+        self._times = times
+        self._numeric = numeric
+        self._objects = objects
+        self._capacity = new_capacity
+        self._start = 0
+        if self._size:
+            self._last_pos = self._size - 1
+
+    def new_row(self, time: Any) -> int:
+        """
+        Claim the next row slot, stamp it with ``time`` and clear its values.
+
+        Args:
+            time: Collection timestamp
+
+        Returns:
+            Physical row position to write values into
+        """
+        stamp = to_datetime64(time)
+        if self._size and stamp < self._times[self._last_pos]:
+            # Out-of-order timestamp: range queries fall back to a full scan
+            self._sorted = False
+            self._descent_row = self.total_rows
+
+        if self._size < self._capacity:
+            pos = (self._start + self._size) % self._capacity
+            self._size += 1
+        elif self._capacity < self.max_rows or not self.wrap:
+            self._grow_rows()
+            pos = self._size
+            self._size += 1
+        else:
+            # Full: overwrite the oldest row in place
+            pos = self._start
+            self._start = (self._start + 1) % self._capacity
+            self.overwritten_rows += 1
+
+        self._times[pos] = stamp
+        if self._num_numeric:
+            self._numeric[pos, :self._num_numeric] = np.nan
+        if self._num_objects:
+            self._objects[pos, :self._num_objects] = None
+
+        self._last_pos = pos
+        self.total_rows += 1
+        if not self._sorted and self._descent_row <= self.total_rows - self._size:
+            # The row before the last out-of-order one was overwritten: order is restored
+            self._sorted = True
+        self.version += 1
+        return pos
+
+    def write_value(self, pos: int, name: str, value: Any) -> None:
+        """
+        Write one value into a claimed row, extending the schema if needed.
+
+        Args:
+            pos: Physical row position returned by new_row()
+            name: Variable name
+            value: Value to store
+        """
+        kind = value_kind(value)
+        if kind is None:
+            if name not in self._slots:
+                self.add_column(name, KIND_FLOAT)
+            return  # Missing value stays NaN/None
+
+        slot = self.ensure_column(name, kind)
+        if slot[0]:
+            self._objects[pos, slot[1]] = value
+        else:
+            self._numeric[pos, slot[1]] = value
+
+    def write_numeric(self, pos: int, indices: np.ndarray, values: Sequence[float]) -> None:
+        """
+        Bulk-write numeric values into a claimed row.
+
+        No schema or kind checks are made: callers must hold slots from
+        column_slot() taken at the current schema_version.
+
+        Args:
+            pos: Physical row position returned by new_row()
+            indices: Numeric block indices
+            values: Values aligned with indices
+        """
+        self._numeric[pos, indices] = values
+
+    def write_objects(self, pos: int, indices: np.ndarray, values: Sequence[Any]) -> None:
+        """Write object values into a claimed row (see write_numeric)."""
+        # Element-wise so list/dict values are stored as-is, not broadcast
+        objects = self._objects
+        for index, value in zip(indices, values):
+            objects[pos, index] = value
+
+    def read_numeric(self, pos: int, indices: np.ndarray) -> np.ndarray:
+        """Copy of the numeric values at ``indices`` of a physical row"""
+        return self._numeric[pos, indices]
+
+    def read_objects(self, pos: int, indices: np.ndarray) -> List[Any]:
+        """Object values at ``indices`` of a physical row"""
+        return self._objects[pos, indices].tolist() if len(indices) else []
+
+    def append(self, time: Any, row: Mapping[str, Any]) -> int:
+        """
+        Append one row of collected state.
+
+        Args:
+            time: Collection timestamp
+            row: Mapping of variable name to value ('time' key is ignored)
+
+        Returns:
+            Physical row position of the new row
+        """
+        pos = self.new_row(time)
+        write = self.write_value
+        for name, value in row.items():
+            if name != 'time':
+                write(pos, name, value)
+        return pos
+
+    def set_latest(self, name: str, value: Any) -> bool:
+        """
+        Overwrite a value in the most recent row.
+
+        Returns:
+            True if a row exists and was updated
+        """
+        if self._size == 0:
+            return False
+        self.write_value(self._last_pos, name, value)
+        self.version += 1
+        return True
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _chronological_index(self) -> Union[slice, np.ndarray]:
+        """Index that reorders physical rows oldest-first."""
+        if self._start == 0:
+            return slice(0, self._size)
+        return np.concatenate((np.arange(self._start, self._capacity),
+                               np.arange(0, self._start)))
+
+    def _select(self, array: np.ndarray, rows: Optional[Union[slice, np.ndarray]]) -> np.ndarray:
+        """Take chronological rows from a physical array (views when possible)."""
+        if isinstance(rows, slice) and self._start != 0:
+            return self._select_wrapped(array, rows)
+        order = self._chronological_index()
+        if isinstance(order, slice):
+            ordered = array[order]
+            return ordered if rows is None else ordered[rows]
+        if rows is None:
+            return array[order]
+        return array[order[rows]]
+
+    def _select_wrapped(self, array: np.ndarray, rows: slice) -> np.ndarray:
+        """Chronological slice of a wrapped ring without building the full row order."""
+        first, stop, step = rows.indices(self._size)
+        if step != 1:
+            return array[self._chronological_index()[rows]]
+        stop = max(first, stop)
+        split = self._capacity - self._start  # Chronological length of the older segment
+        if stop <= split:
+            return array[self._start + first:self._start + stop]
+        if first >= split:
+            return array[first - split:stop - split]
+        return np.concatenate((array[self._start + first:], array[:stop - split]))
+
+    @staticmethod
+    def _restore(values: np.ndarray, kind: str) -> np.ndarray:
+        """Convert stored float64 values back to the column's reported dtype."""
+        if kind in (KIND_BOOL, KIND_INT) and values.size and not np.isnan(values).any():
+            return values.astype(bool if kind == KIND_BOOL else np.int64)
+        return values
+
+    def times(self, rows: Optional[Union[slice, np.ndarray]] = None) -> np.ndarray:
+        """Chronological datetime64[ns] timestamps"""
+        return self._select(self._times, rows)
+
+    def column_values(self, name: str, rows: Optional[Union[slice, np.ndarray]] = None) -> np.ndarray:
+        """
+        Chronological values of one column.
+
+        Args:
+            name: Variable name
+            rows: Optional chronological row selection
+
+        Returns:
+            NumPy array restored to the column's dtype
+        """
+        is_object, index = self._slots[name]
+        if is_object:
+            return self._select(self._objects[:, index], rows)
+        return self._restore(self._select(self._numeric[:, index], rows), self._kinds[name])
+
+    def to_frame(self, columns: Optional[Iterable[str]] = None,
+                 rows: Optional[Union[slice, np.ndarray]] = None,
+                 include_time: bool = True) -> pd.DataFrame:
+        """
+        Materialize (part of) the history as a DataFrame.
+
+        Args:
+            columns: Variables to include (default: all, unknown names are skipped)
+            rows: Optional chronological row selection
+            include_time: Whether to include the 'time' column first
+
+        Returns:
+            DataFrame in chronological order with a fresh RangeIndex
+        """
+        names = self._columns if columns is None else [c for c in columns if c in self._slots]
+
+        numeric_names = [n for n in names if not self._slots[n][0]]
+        data: Dict[str, Any] = {}
+        if include_time:
+            data['time'] = self.times(rows)
+        if numeric_names:
+            indices = np.fromiter((self._slots[n][1] for n in numeric_names),
+                                  dtype=np.intp, count=len(numeric_names))
+            block = self._select(self._numeric, rows)[:, indices]
+            for j, name in enumerate(numeric_names):
+                data[name] = self._restore(block[:, j], self._kinds[name])
+        for name in names:
+            if self._slots[name][0]:
+                data[name] = self._select(self._objects[:, self._slots[name][1]], rows)
+
+        ordered = (['time'] if include_time else []) + list(names)
+        if not data:
+            return pd.DataFrame()
+        return pd.DataFrame(data, columns=ordered)
+
+    def value_at(self, pos: int, name: str) -> Any:
+        """Value of a known column at a physical row, as a Python scalar"""
+        is_object, index = self._slots[name]
+        if is_object:
+            return self._objects[pos, index]
+        return _numeric_scalar(self._numeric[pos, index], self._kinds[name])
+
+    def latest(self, name: str) -> Any:
+        """Most recent value of a column (None if no rows or unknown column)"""
+        if self._size == 0 or name not in self._slots:
+            return None
+        return self.value_at(self._last_pos, name)
+
+    def row_view(self, pos: Optional[int] = None) -> 'RowView':
+        """Read-only mapping over one physical row (default: the most recent)"""
+        return RowView(self, self._last_pos if pos is None else pos)
+
+    def row_snapshot(self, pos: Optional[int] = None) -> 'RowSnapshot':
+        """Read-only copy of one physical row (default: the most recent)"""
+        return RowSnapshot(self, self._last_pos if pos is None else pos)
+
+    def latest_row(self) -> Dict[str, Any]:
+        """Most recent row as a dict (empty if no rows)"""
+        if self._size == 0:
+            return {}
+        row = {'time': pd.Timestamp(self._times[self._last_pos])}
+        for name in self._columns:
+            row[name] = self.latest(name)
+        return row
+
+    def time_bounds(self) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """(earliest, latest) timestamps held, or None if empty"""
+        if self._size == 0:
+            return None
+        if self._sorted:
+            return pd.Timestamp(self._times[self._start]), pd.Timestamp(self._times[self._last_pos])
+        times = self.times()
+        return pd.Timestamp(times.min()), pd.Timestamp(times.max())
+
+    @property
+    def time_sorted(self) -> bool:
+        """Whether held timestamps are non-decreasing (range queries use binary search)"""
+        return self._sorted
+
+    def _count_before(self, stamp: np.datetime64, side: str) -> int:
+        """Number of held rows with time < stamp (side='left') or <= stamp (side='right')."""
+        if self._start == 0:
+            return int(np.searchsorted(self._times[:self._size], stamp, side=side))
+        return int(np.searchsorted(self._times[self._start:self._capacity], stamp, side=side) +
+                   np.searchsorted(self._times[:self._start], stamp, side=side))
+
+    def time_slice(self, start: Any = None, end: Any = None) -> slice:
+        """
+        Chronological row slice whose time lies in [start, end], by binary search.
+
+        Requires ``time_sorted``; both segments of a wrapped ring are searched
+        separately, so no reordering or copying happens.
+
+        Args:
+            start: Inclusive range start (None = from the oldest row)
+            end: Inclusive range end (None = to the newest row)
+
+        Returns:
+            slice of chronological row positions
+        """
+        first = 0 if start is None else self._count_before(to_datetime64(start), 'left')
+        stop = self._size if end is None else self._count_before(to_datetime64(end), 'right')
+        return slice(first, max(first, stop))
+
+    def time_selection(self, start: Any, end: Any) -> Union[slice, np.ndarray]:
+        """
+        Chronological row positions whose time lies in [start, end].
+
+        Args:
+            start: Range start (datetime-like, None = open)
+            end: Range end (datetime-like, None = open)
+
+        Returns:
+            slice of chronological rows when timestamps are sorted (O(log n)),
+            otherwise an integer array of chronological row positions
+        """
+        if self._sorted:
+            return self.time_slice(start, end)
+        times = self.times()
+        mask = np.ones(len(times), dtype=bool)
+        if start is not None:
+            mask &= times >= to_datetime64(start)
+        if end is not None:
+            mask &= times <= to_datetime64(end)
+        return np.flatnonzero(mask)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the preallocated arrays"""
+        return (self._times.nbytes + self._numeric.nbytes +
+                self._objects.size * np.dtype(object).itemsize)
+
+
+class RowView(Mapping):
+    """
+    Read-only mapping over one physical row of a StateHistoryBuffer.
+
+    Handed to the per-row consumers inside StateManager.collect_states so they
+    can look up the values of the row just collected without building a dict
+    of every variable. Values read from the buffer on access, so the view
+    reflects later overwrites of the same physical row; use RowSnapshot for a
+    row that is kept.
+    """
+
+    __slots__ = ('_buffer', '_pos')
+
+    def __init__(self, buffer: StateHistoryBuffer, pos: int):
+        self._buffer = buffer
+        self._pos = pos
+
+    def __getitem__(self, name: str) -> Any:
+        if self._pos < 0:
+            raise KeyError(name)
+        if name == 'time':
+            return pd.Timestamp(self._buffer._times[self._pos])
+        if name not in self._buffer._slots:
+            raise KeyError(name)
+        return self._buffer.value_at(self._pos, name)
+
+    def __contains__(self, name: object) -> bool:
+        return self._pos >= 0 and (name == 'time' or name in self._buffer._slots)
+
+    def __iter__(self) -> Iterator[str]:
+        if self._pos < 0:
+            return iter(())
+        return iter(['time'] + self._buffer._columns)
+
+    def __len__(self) -> int:
+        return 0 if self._pos < 0 else len(self._buffer._columns) + 1
+
+
+class RowSnapshot(Mapping):
+    """
+    Read-only copy of one physical row of a StateHistoryBuffer.
+
+    Returned by StateManager.collect_states. The row's numeric and object
+    blocks are copied as arrays (no per-variable work), so a retained
+    snapshot keeps its values when the ring buffer wraps and the physical
+    row is overwritten, or when columns are added or moved later.
+    """
+
+    __slots__ = ('_time', '_numeric', '_objects', '_columns', '_slots', '_kinds')
+
+    def __init__(self, buffer: StateHistoryBuffer, pos: int):
+        if pos < 0:
+            self._time = None
+            self._numeric = self._objects = None
+            self._columns, self._slots, self._kinds = [], {}, {}
+            return
+        self._time = buffer._times[pos]
+        self._numeric = buffer._numeric[pos, :buffer._num_numeric].copy()
+        self._objects = buffer._objects[pos, :buffer._num_objects].copy()
+        self._columns = list(buffer._columns)
+        self._slots = dict(buffer._slots)
+        self._kinds = dict(buffer._kinds)
+
+    def __getitem__(self, name: str) -> Any:
+        if name == 'time' and self._time is not None:
+            return pd.Timestamp(self._time)
+        is_object, index = self._slots[name]
+        if is_object:
+            return self._objects[index]
+        return _numeric_scalar(self._numeric[index], self._kinds[name])
+
+    def __contains__(self, name: object) -> bool:
+        return (name == 'time' and self._time is not None) or name in self._slots
+
+    def __iter__(self) -> Iterator[str]:
+        if self._time is None:
+            return iter(())
+        return iter(['time'] + self._columns)
+
+    def __len__(self) -> int:
+        return 0 if self._time is None else len(self._columns) + 1
@@ -1,51 +1,102 @@
 """
 State Manager
 
-This module provides the core state management functionality using pandas DataFrames
-for efficient time series storage and CSV export capabilities.
+This module provides the core state management functionality. Collected rows are
+stored in a preallocated columnar history buffer and exposed as pandas DataFrames
+on demand for analysis and CSV export.
 """
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional, Tuple, Union
+from typing import Dict, Any, List, Mapping, Optional, Tuple, Union
 import warnings
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
 import random
+import re
 
 from .interfaces import StateProvider, StateCollector, StateVariable, StateCategory
 from .state_registry import StateRegistry
+from .state_history import StateHistoryBuffer, RowSnapshot, selection_index
+from .state_spill import StateSpillSink
+from .collection_plan import StateCollectionPlan
+from .threshold_plan import ThresholdPlan, lookup_parameter, parameter_candidates
+from .online_statistics import DEFAULT_QUANTILES, OnlineStatistics
+from .logging_policy import LoggingPolicy, PolicyChannel, match_policy, merge_channel_frames
+from .simulation_context import SimulationContext, current_context
+from ..sim_logging import get_logger
 from .component_metadata import (
     ComponentMetadata, EquipmentType, ComponentRegistry,
     infer_equipment_type_from_class_name, infer_capabilities_from_state_variables,
     extract_design_parameters_from_config
 )
 
+logger = get_logger(__name__)
+
 
 class StateManager(StateCollector):
     """
-    Core state management system using pandas DataFrames for time series storage.
+    Core state management system for time series storage.
     
     This class collects state data from multiple StateProvider components and stores
-    it in a pandas DataFrame for efficient analysis and CSV export.
+    it in a columnar history buffer (see StateHistoryBuffer). The history is exposed
+    as a pandas DataFrame through the ``data`` property for analysis and CSV export.
     """
     
-    def __init__(self, max_rows: int = 100000, auto_manage_memory: bool = True, config=None):
+    def __init__(self, max_rows: int = 100000, auto_manage_memory: bool = True, config=None,
+                 spill_dir: Optional[str] = None, spill_rows: int = 10000,
+                 spill_format: str = 'parquet', record_history: bool = True,
+                 online_statistics: bool = True, statistics_quantiles=DEFAULT_QUANTILES,
+                 context: Optional[SimulationContext] = None):
         """
         Initialize state manager.
         
         Args:
             max_rows: Maximum number of rows to keep in memory
-            auto_manage_memory: Whether to automatically manage memory by removing old data
+            auto_manage_memory: Whether to wrap the history in place (overwriting the
+                oldest rows) once max_rows is reached. If False, history grows unbounded.
             config: Optional configuration dict/object for maintenance and other settings
+            spill_dir: Optional directory to stream history chunks to. When set, rows are
+                flushed to disk instead of being overwritten, so no history is lost.
+            spill_rows: Number of rows per spilled chunk
+            spill_format: Spill chunk format ('parquet', 'arrow' or 'pickle')
+            record_history: Whether to keep collected rows. If False only the latest
+                row is held (run summaries come from the online statistics).
+            online_statistics: Whether to maintain streaming per-variable statistics
+            statistics_quantiles: Quantiles estimated by the online statistics
+            context: Simulation context holding this plant's component registrations
+                and maintenance orchestrator (defaults to the active context)
         """
         self.max_rows = max_rows
         self.auto_manage_memory = auto_manage_memory
+        self.record_history = record_history
+        self.context = context if context is not None else current_context()
         
         # Core components
         self.registry = StateRegistry()
-        self.data = pd.DataFrame()
+        if record_history:
+            self._history = StateHistoryBuffer(max_rows=max_rows, wrap=auto_manage_memory)
+        else:
+            self._history = StateHistoryBuffer(max_rows=1, wrap=True, initial_capacity=1)
+        self._data_cache = None
+        self._data_cache_version = None
+        self._spill: Optional[StateSpillSink] = None
+        self._spill_settings: Optional[Tuple[str, int, str]] = None
+        
+        # Logging policies: variables matching a policy pattern are recorded by
+        # their own channel; everything else goes to the default channel (_history)
+        self._main_channel = PolicyChannel(None, LoggingPolicy(), self._history)
+        self.logging_policies: Dict[str, LoggingPolicy] = {}
+        self._channels: Dict[str, PolicyChannel] = {}
+        self._routes: Dict[str, PolicyChannel] = {}  # variable -> channel (sticky until clear_data)
+        self._routes_version = None
+        self._live: Optional[StateHistoryBuffer] = None  # Latest full row when policies are active
         self.providers: List[Tuple[StateProvider, str]] = []
+        self._plan: Optional[StateCollectionPlan] = None  # Compiled on first collection
+        
+        # Streaming statistics over every collected row (unaffected by wrapping/spilling)
+        self._statistics: Optional[OnlineStatistics] = (
+            OnlineStatistics(statistics_quantiles) if online_statistics else None)
         
         # Datetime tracking - NEW
         self.start_datetime = self._generate_random_start_date()
@@ -67,18 +118,56 @@ class StateManager(StateCollector):
         self.maintenance_history = []     # List of maintenance actions and results
         self.maintenance_config = None    # Parsed maintenance configuration
         self.threshold_event_subscribers = []  # Callbacks for threshold events
+        self.collection_subscribers = []       # Callbacks for every collected row
         
         # THRESHOLD COOLDOWN TRACKING
         self.threshold_last_violation_times = {}  # component_id -> {param: timestamp}
+        self._cooldown_version = 0  # Bumped when cooldowns are reset outside threshold checks
+        self._threshold_plan: Optional[ThresholdPlan] = None  # Compiled on the next check
         
         # Cache orchestrator for performance
         self._maintenance_orchestrator = None
         
-        print(f"STATE MANAGER: Initialized with maintenance capabilities")
-        print(f"STATE MANAGER: Simulation start time: {self.start_datetime.isoformat()}")
+        logger.info("STATE MANAGER: Initialized with maintenance capabilities")
+        logger.info("STATE MANAGER: Simulation start time: %s", self.start_datetime.isoformat())
         if config:
-            print(f"STATE MANAGER: Configuration provided - will load maintenance settings")
-    
+            logger.info("STATE MANAGER: Configuration provided - will load maintenance settings")
+        
+        if spill_dir is not None:
+            self.enable_spill(spill_dir, rows_per_chunk=spill_rows, file_format=spill_format)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle support (simulator checkpoints): derived caches are rebuilt on demand"""
+        state = self.__dict__.copy()
+        state['_data_cache'] = None
+        state['_data_cache_version'] = None
+        state['_maintenance_orchestrator'] = None  # Looked up again from the context
+        return state
+
+    @property
+    def data(self) -> pd.DataFrame:
+        """
+        Collected state history as a DataFrame.
+
+        The frame is materialized from the history buffer (and any spilled chunks)
+        on first access after new rows arrive and cached until the next collection.
+        """
+        version = tuple(channel.version for channel in self._all_channels())
+        if self._data_cache is None or self._data_cache_version != version:
+            self._data_cache = self._read_frame()
+            self._data_cache_version = version
+        return self._data_cache
+
+    @property
+    def history(self) -> StateHistoryBuffer:
+        """Underlying columnar history buffer"""
+        return self._history
+
+    @property
+    def statistics(self) -> Optional[OnlineStatistics]:
+        """Online per-variable statistics over every collected row (None if disabled)"""
+        return self._statistics
+
     def _generate_random_start_date(self) -> datetime:
         """
         Generate a random simulation start date.
@@ -141,6 +230,7 @@ class StateManager(StateCollector):
         """
         # Register the provider
         self.providers.append((provider, category))
+        self._plan = None
         
         # Register all state variables from this provider
         try:
@@ -149,55 +239,79 @@ class StateManager(StateCollector):
         except Exception as e:
             warnings.warn(f"Failed to register state variables from provider {category}: {e}")
     
-    def collect_states(self, current_datetime: datetime) -> Dict[str, Any]:
+    def unregister_provider(self, provider: Any) -> bool:
+        """
+        Remove a provider (registered directly or as an instance) from collection.
+
+        Already collected history for its variables is kept.
+
+        Args:
+            provider: Provider or component instance to remove
+
+        Returns:
+            True if the provider was registered
         """
-        Collect current state from all registered providers and add to DataFrame.
+        remaining = [(p, category) for p, category in self.providers if p is not provider]
+        if len(remaining) == len(self.providers):
+            return False
+        self.providers[:] = remaining
+        self._plan = None
+        return True
+
+    def collect_states(self, current_datetime: datetime) -> RowSnapshot:
+        """
+        Collect current state from all registered providers into the history buffer.
+
+        The first collection compiles a StateCollectionPlan (provider protocol,
+        variable names and buffer column slots); later collections reuse it until
+        a provider registers or unregisters.
         
         Args:
             current_datetime: Current simulation datetime
             
         Returns:
-            Dictionary of collected state data
+            Read-only copy of the collected row (variable name -> value) that
+            later collections do not change
         """
         import time
         start_time = time.time()
         
-        # Start with datetime
-        row_data = {'time': current_datetime}
-        
-        # Collect from all providers
-        for provider, category in self.providers:
-            try:
-                # Try StateProvider protocol first (get_current_state)
-                if hasattr(provider, 'get_current_state') and callable(getattr(provider, 'get_current_state')):
-                    current_state = provider.get_current_state()
-                    row_data.update(current_state)
-                # Fall back to get_state_dict for auto-registered components
-                elif hasattr(provider, 'get_state_dict') and callable(getattr(provider, 'get_state_dict')):
-                    state_dict = provider.get_state_dict()
-                    # Convert state_dict to hierarchical names using category
-                    for var_name, value in state_dict.items():
-                        # Create hierarchical name: category.variable
-                        full_name = f"{category}.{var_name}"
-                        row_data[full_name] = value
-                else:
-                    warnings.warn(f"Provider {category} does not implement StateProvider protocol or get_state_dict method")
-            except Exception as e:
-                warnings.warn(f"Failed to collect state from provider {category}: {e}")
-        
-        # Validate collected data (skip validation for now to avoid blocking)
-        # is_valid, errors = self.registry.validate_state_data(row_data)
-        # if not is_valid:
-        #     warnings.warn(f"State validation errors: {errors}")
-        
-        # Add to DataFrame
-        self._add_row(row_data)
+        if self._plan is None:
+            target = self._live if self._live is not None else self._history
+            self._plan = StateCollectionPlan(self.providers, target)
+
+        if self._live is None:
+            # Values are written straight into the history buffer
+            self._main_channel.make_room()
+            pos = self._plan.collect(current_datetime)
+            collected = self._history
+        else:
+            # Collect the full row once, then let each channel record it per its policy
+            pos = self._plan.collect(current_datetime)
+            self._route_live_row(pos, current_datetime)
+            collected = self._live
+        # Consumers below read the live row; callers get a copy they may keep
+        row_data = collected.row_view(pos)
+
+        self.row_count += 1
+        if self._statistics is not None:
+            self._statistics.update(row_data, current_datetime)
+        if self.record_history and self._history.overwritten_rows == 1:
+            warnings.warn(f"Memory management: history reached {self.max_rows} rows, "
+                          f"oldest rows are now overwritten in place")
         
         # PHASE 1: Check maintenance thresholds during state collection
         # Convert datetime to minutes for maintenance threshold checking (legacy compatibility)
         elapsed_minutes = (current_datetime - self.start_datetime).total_seconds() / 60.0
         self._check_maintenance_thresholds(elapsed_minutes, row_data)
         
+        # Streaming consumers (e.g. historian compression) see every collected row
+        for callback in self.collection_subscribers:
+            try:
+                callback(current_datetime, row_data)
+            except Exception as e:
+                warnings.warn(f"Collection subscriber failed: {e}")
+        
         # Update tracking
         self.current_datetime = current_datetime
         self.last_collection_time = current_datetime
@@ -208,112 +322,337 @@ class StateManager(StateCollector):
         if len(self._collection_times) > 1000:
             self._collection_times = self._collection_times[-100:]  # Keep last 100
         
-        return row_data
+        return collected.row_snapshot(pos)
     
-    def _add_row(self, row_data: Dict[str, Any]) -> None:
+    def enable_spill(self, directory: str, rows_per_chunk: int = 10000,
+                     file_format: str = 'parquet') -> StateSpillSink:
         """
-        Add a row of data to the DataFrame with memory management.
-        
+        Stream collected history to a chunked on-disk dataset.
+
+        Memory stays bounded at rows_per_chunk rows while every row is kept on disk.
+        Queries and exports read transparently across spilled chunks and the
+        in-memory tail.
+
         Args:
-            row_data: Dictionary of state variable values
+            directory: Dataset directory for the chunk files (must not hold chunks already)
+            rows_per_chunk: Number of rows per chunk
+            file_format: 'parquet', 'arrow' or 'pickle'
+
+        Returns:
+            The spill sink
+        """
+        self._spill = StateSpillSink(directory, rows_per_chunk=rows_per_chunk, file_format=file_format)
+        self._spill_settings = (directory, rows_per_chunk, file_format)
+        self._main_channel.spill = self._spill
+        for channel in self._channels.values():
+            channel.spill = self._channel_spill(channel.pattern)
+        logger.info("STATE MANAGER: Spilling history to %s every %s rows (%s)",
+                    self._spill.directory, self._spill.rows_per_chunk, self._spill.file_format)
+        return self._spill
+
+    def detach_spill(self) -> int:
         """
-        # Create new row DataFrame
-        new_row = pd.DataFrame([row_data])
-        
-        # Concatenate with existing data
-        if self.data.empty:
-            self.data = new_row
+        Stop spilling without touching the dataset on disk.
+
+        Used when a simulator is restored from a checkpoint: the checkpoint's
+        sink still belongs to the run that wrote it, so forks must not append
+        chunks to (or clear) its directory. Rows already spilled stay on disk
+        but are no longer part of this manager's history; call enable_spill()
+        with a fresh directory to spill again.
+
+        Returns:
+            Number of spilled rows left behind
+        """
+        if self._spill is None:
+            return 0
+        spilled = self.spilled_rows
+        self._spill = None
+        self._spill_settings = None
+        for channel in self._all_channels():
+            channel.spill = None
+        self._data_cache = None
+        return spilled
+
+    def flush_spill(self) -> None:
+        """Write the in-memory tail to the spill dataset (e.g. at the end of a run)."""
+        self.flush_logging_windows()
+        for channel in self._all_channels():
+            channel.flush()
+
+    def flush_logging_windows(self) -> int:
+        """
+        Record partially filled aggregation windows of the logging policies.
+
+        Called before exports and spill flushes so the collections since the
+        last complete window are not lost at the end of a run; the next window
+        starts with the following collection.
+
+        Returns:
+            Number of channels that recorded a row
+        """
+        return sum(channel.flush_window() for channel in self._channels.values())
+
+    @property
+    def spilled_rows(self) -> int:
+        """Number of history rows held on disk"""
+        return sum(channel.spill.total_rows for channel in self._all_channels()
+                   if channel.spill is not None)
+
+    # ------------------------------------------------------------------
+    # Logging policies
+    # ------------------------------------------------------------------
+
+    def set_logging_policy(self, pattern: str, policy: Union[LoggingPolicy, Dict[str, Any], int]) -> LoggingPolicy:
+        """
+        Record variables matching a pattern at a reduced rate.
+
+        Args:
+            pattern: Category/subcategory prefix, full variable name or fnmatch glob
+            policy: LoggingPolicy, dict of its fields, or an int decimation interval
+
+        Returns:
+            The applied policy
+        """
+        policy = LoggingPolicy.from_config(policy)
+        if self.row_count and pattern not in self.logging_policies:
+            warnings.warn(f"Logging policy '{pattern}' added after collection started; "
+                          f"it applies to variables not yet recorded")
+        self.logging_policies[pattern] = policy
+
+        channel = self._channels.get(pattern)
+        if channel is None:
+            channel = PolicyChannel(pattern, policy,
+                                    StateHistoryBuffer(max_rows=self.max_rows, wrap=self.auto_manage_memory),
+                                    self._channel_spill(pattern))
+            self._channels[pattern] = channel
         else:
-            self.data = pd.concat([self.data, new_row], ignore_index=True)
-        
-        self.row_count += 1
-        
-        # Memory management
-        if self.auto_manage_memory and len(self.data) > self.max_rows:
-            self._manage_memory()
-    
-    def _manage_memory(self) -> None:
-        """Manage memory by removing old data when limit is exceeded."""
-        if len(self.data) > self.max_rows:
-            # Keep most recent 80% of data
-            keep_rows = int(self.max_rows * 0.8)
-            rows_to_remove = len(self.data) - keep_rows
-            
-            self.data = self.data.tail(keep_rows).reset_index(drop=True)
-            
-            warnings.warn(f"Memory management: Removed {rows_to_remove} old rows, keeping {keep_rows} recent rows")
-    
-    def get_variable_history(self, variable_name: str, 
+            channel.set_policy(policy)
+
+        if self._live is None:
+            self._live = StateHistoryBuffer(max_rows=1, wrap=True, initial_capacity=1)
+            self._plan = None
+            for name in self._history.columns:
+                # Already recorded by the default channel: keep it there
+                self._routes[name] = self._main_channel
+                self._main_channel.names.append(name)
+        self._routes_version = None
+        return policy
+
+    def load_logging_policies(self, config_source: Any) -> Dict[str, LoggingPolicy]:
+        """
+        Load logging policies from the ``state_logging`` section of a config.
+
+        Accepts the same sources as load_maintenance_config (dict, YAML file path,
+        or object with attributes). A missing section leaves policies unchanged.
+
+        Args:
+            config_source: Configuration containing ``state_logging.policies``
+
+        Returns:
+            All active logging policies
+        """
+        if isinstance(config_source, str):
+            import yaml
+            with open(config_source, 'r') as f:
+                config_source = yaml.safe_load(f) or {}
+
+        def section(source, key):
+            return source.get(key) if isinstance(source, dict) else getattr(source, key, None)
+
+        policies = section(section(config_source, 'state_logging') or {}, 'policies') or {}
+        for pattern, policy_config in policies.items():
+            try:
+                self.set_logging_policy(pattern, policy_config)
+            except (TypeError, ValueError) as e:
+                warnings.warn(f"Invalid logging policy '{pattern}': {e}")
+        if policies:
+            logger.info("STATE MANAGER: Loaded %s logging policies", len(policies))
+        return dict(self.logging_policies)
+
+    def _channel_spill(self, pattern: str) -> Optional[StateSpillSink]:
+        """Spill sink for a policy channel (subdirectory of the main spill dataset)"""
+        if self._spill_settings is None:
+            return None
+        directory, rows_per_chunk, file_format = self._spill_settings
+        name = re.sub(r'[^A-Za-z0-9_.-]+', '_', pattern).strip('_') or 'policy'
+        return StateSpillSink(Path(directory) / f"policy-{name}", rows_per_chunk=rows_per_chunk,
+                              file_format=file_format)
+
+    def _all_channels(self) -> List[PolicyChannel]:
+        return [self._main_channel] + list(self._channels.values())
+
+    def _route_live_row(self, pos: int, time: datetime) -> None:
+        """Offer the collected live row to every channel."""
+        live = self._live
+        if self._routes_version != live.schema_version:
+            patterns = list(self._channels)
+            for name in live.columns:
+                if name not in self._routes:
+                    pattern = match_policy(name, patterns)
+                    channel = self._main_channel if pattern is None else self._channels[pattern]
+                    self._routes[name] = channel
+                    channel.names.append(name)
+            self._routes_version = live.schema_version
+
+        for channel in self._all_channels():
+            channel.offer(live, pos, time)
+
+    def _latest_buffer(self) -> StateHistoryBuffer:
+        """Buffer holding the most recent complete row"""
+        return self._live if self._live is not None else self._history
+
+    def _data_channels(self) -> List[PolicyChannel]:
+        """Channels holding any recorded rows"""
+        return [c for c in self._all_channels() if c.total_rows]
+
+    def _has_variable(self, name: str) -> bool:
+        """Whether a variable exists in memory or in spilled chunks of any channel"""
+        return any(channel.has_column(name) for channel in self._all_channels())
+
+    def _known_columns(self) -> List[str]:
+        """All recorded variable names across channels, spilled chunks and memory"""
+        columns = self._main_channel.columns()
+        if not self._channels:
+            return columns
+        seen = set(columns)
+        for channel in self._channels.values():
+            for name in channel.columns():
+                if name not in seen:
+                    seen.add(name)
+                    columns.append(name)
+        return columns
+
+    def _resolve_time_range(self, time_range: Optional[Tuple[Any, Any]]) -> Optional[Tuple[Any, Any]]:
+        """
+        Normalize a time range to datetimes.
+
+        Bounds may be datetimes or numbers; numbers are elapsed simulation
+        minutes since ``start_datetime`` (the unit the maintenance system uses).
+        None leaves that side of the range open.
+        """
+        if time_range is None:
+            return None
+        start_time, end_time = time_range
+        return self._as_datetime(start_time), self._as_datetime(end_time)
+
+    def _as_datetime(self, value: Any) -> Any:
+        if isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool):
+            return self.start_datetime + timedelta(minutes=float(value))
+        return value
+
+    def _time_rows(self, time_range: Optional[Tuple[Any, Any]]) -> Optional[Union[slice, np.ndarray]]:
+        """Chronological row selection of the in-memory tail for an optional time filter"""
+        if time_range is None:
+            return None
+        start_time, end_time = self._resolve_time_range(time_range)
+        return self._history.time_selection(start_time, end_time)
+
+    def _read_frame(self, columns: Optional[List[str]] = None,
+                    time_range: Optional[Tuple[Any, Any]] = None) -> pd.DataFrame:
+        """
+        Materialize history across channels, spilled chunks and the in-memory tail.
+
+        Without logging policies the frame is indexed by global row number. With
+        policies, channels recorded at different rates are aligned on the union of
+        their timestamps (NaN where a channel did not record).
+
+        Args:
+            columns: Variables to include (default: all known variables)
+            time_range: Optional (start_time, end_time) filter
+
+        Returns:
+            DataFrame with 'time' first
+        """
+        time_range = self._resolve_time_range(time_range)
+        channels = self._data_channels()
+        if len(channels) <= 1:
+            channel = channels[0] if channels else self._main_channel
+            frame = channel.read(columns, time_range)
+            if not channels or channel is self._main_channel:
+                return frame
+            ordered = ['time'] + (self._known_columns() if columns is None else
+                                  [c for c in columns if self._has_variable(c)])
+            return frame.reindex(columns=ordered)
+
+        frames = []
+        for channel in channels:
+            wanted = None if columns is None else [c for c in columns if channel.has_column(c)]
+            if wanted == []:
+                continue
+            frames.append(channel.read(wanted, time_range))
+        ordered = ['time'] + (self._known_columns() if columns is None
+                              else [c for c in columns if self._has_variable(c)])
+        merged = merge_channel_frames(frames)
+        if merged.empty:
+            return pd.DataFrame(columns=ordered)
+        return merged.reindex(columns=ordered)
+
+    def get_variable_history(self, variable_name: str,
                            time_range: Optional[Tuple[float, float]] = None) -> pd.Series:
         """
         Get time series for a specific variable.
-        
+
         Args:
             variable_name: Name of the variable
-            time_range: Optional tuple of (start_time, end_time) to filter data
-            
+            time_range: Optional tuple of (start_time, end_time) to filter data;
+                datetimes or elapsed simulation minutes, inclusive, None = open
+
         Returns:
             pandas Series with the variable's time series data
         """
-        if variable_name not in self.data.columns:
+        if not self._has_variable(variable_name):
             warnings.warn(f"Variable '{variable_name}' not found in data")
             return pd.Series(dtype=float)
-        
-        if time_range is not None:
-            start_time, end_time = time_range
-            mask = (self.data['time'] >= start_time) & (self.data['time'] <= end_time)
-            return self.data.loc[mask, variable_name]
-        
-        return self.data[variable_name]
-    
+
+        if self._channels or (self._spill is not None and self._spill.chunks):
+            return self._read_frame([variable_name], time_range)[variable_name]
+
+        rows = self._time_rows(time_range)
+        values = self._history.column_values(variable_name, rows)
+        index = pd.RangeIndex(len(values)) if rows is None else selection_index(rows)
+        return pd.Series(values, index=index, name=variable_name, copy=False)
+
     def get_time_series(self, variable_names: List[str],
                        time_range: Optional[Tuple[float, float]] = None) -> pd.DataFrame:
         """
         Get time series DataFrame for multiple variables.
-        
+
         Args:
             variable_names: List of variable names to include
-            time_range: Optional tuple of (start_time, end_time) to filter data
-            
+            time_range: Optional tuple of (start_time, end_time) to filter data;
+                datetimes or elapsed simulation minutes, inclusive, None = open
+
         Returns:
             pandas DataFrame with time and selected variables
         """
         # Always include time column
-        columns = ['time'] + [name for name in variable_names if name in self.data.columns]
-        
+        columns = [name for name in variable_names if self._has_variable(name)]
+
         # Check for missing variables
-        missing = [name for name in variable_names if name not in self.data.columns]
+        missing = [name for name in variable_names if name != 'time' and not self._has_variable(name)]
         if missing:
             warnings.warn(f"Variables not found in data: {missing}")
-        
-        if time_range is not None:
-            start_time, end_time = time_range
-            mask = (self.data['time'] >= start_time) & (self.data['time'] <= end_time)
-            return self.data.loc[mask, columns]
-        
-        return self.data[columns]
-    
-    def export_to_csv(self, filename: str, 
+
+        return self._read_frame(columns, time_range)
+
+    def export_to_csv(self, filename: str,
                      time_range: Optional[Tuple[float, float]] = None,
                      variables: Optional[List[str]] = None) -> None:
         """
         Export data to CSV file.
-        
+
         Args:
             filename: Output CSV filename
             time_range: Optional tuple of (start_time, end_time) to filter data
             variables: Optional list of variables to include (default: all)
         """
+        self.flush_logging_windows()
+        
         # Determine which data to export
         if variables is not None:
             data_to_export = self.get_time_series(variables, time_range)
         else:
-            if time_range is not None:
-                start_time, end_time = time_range
-                mask = (self.data['time'] >= start_time) & (self.data['time'] <= end_time)
-                data_to_export = self.data[mask]
-            else:
-                data_to_export = self.data
+            data_to_export = self._read_frame(time_range=time_range)
         
         # Convert datetime column to ISO strings for CSV export
         if not data_to_export.empty and 'time' in data_to_export.columns:
@@ -322,7 +661,7 @@ class StateManager(StateCollector):
         
         # Export to CSV
         data_to_export.to_csv(filename, index=False)
-        print(f"Exported {len(data_to_export)} rows to {filename}")
+        logger.info("Exported %s rows to %s", len(data_to_export), filename)
     
     def export_by_category(self, category: str, filename: str,
                           time_range: Optional[Tuple[float, float]] = None) -> None:
@@ -335,23 +674,19 @@ class StateManager(StateCollector):
             time_range: Optional time range filter
         """
         # Get variables for this category
-        category_vars = [col for col in self.data.columns 
-                        if col.startswith(f'{category}.') or col == 'time']
+        category_vars = [col for col in self._known_columns()
+                        if col.startswith(f'{category}.')]
         
         if not category_vars:
             warnings.warn(f"No variables found for category '{category}'")
             return
         
         # Export filtered data
-        if time_range is not None:
-            start_time, end_time = time_range
-            mask = (self.data['time'] >= start_time) & (self.data['time'] <= end_time)
-            data_to_export = self.data.loc[mask, category_vars]
-        else:
-            data_to_export = self.data[category_vars]
+        self.flush_logging_windows()
+        data_to_export = self._read_frame(category_vars, time_range)
         
         data_to_export.to_csv(filename, index=False)
-        print(f"Exported {len(data_to_export)} rows of {category} data to {filename}")
+        logger.info("Exported %s rows of %s data to %s", len(data_to_export), category, filename)
     
     def export_by_subcategory(self, category: str, subcategory: str, filename: str,
                              time_range: Optional[Tuple[float, float]] = None) -> None:
@@ -366,45 +701,80 @@ class StateManager(StateCollector):
         """
         # Get variables for this subcategory
         prefix = f'{category}.{subcategory}.'
-        subcategory_vars = ['time'] + [col for col in self.data.columns if col.startswith(prefix)]
+        subcategory_vars = [col for col in self._known_columns() if col.startswith(prefix)]
         
-        if len(subcategory_vars) == 1:  # Only 'time' column
+        if not subcategory_vars:
             warnings.warn(f"No variables found for subcategory '{category}.{subcategory}'")
             return
         
         # Export filtered data
-        if time_range is not None:
-            start_time, end_time = time_range
-            mask = (self.data['time'] >= start_time) & (self.data['time'] <= end_time)
-            data_to_export = self.data.loc[mask, subcategory_vars]
-        else:
-            data_to_export = self.data[subcategory_vars]
+        self.flush_logging_windows()
+        data_to_export = self._read_frame(subcategory_vars, time_range)
         
         data_to_export.to_csv(filename, index=False)
-        print(f"Exported {len(data_to_export)} rows of {category}.{subcategory} data to {filename}")
+        logger.info("Exported %s rows of %s.%s data to %s", len(data_to_export), category, subcategory, filename)
     
     def export_summary_statistics(self, filename: str) -> None:
         """
         Export statistical summary of all variables.
         
+        With online statistics enabled the summary covers every collected row,
+        including rows already overwritten or spilled; otherwise it is computed
+        from the rows currently held.
+        
         Args:
             filename: Output CSV filename for summary statistics
         """
-        if self.data.empty:
+        self.flush_logging_windows()
+        if self._statistics is not None and self._statistics.rows:
+            summary = self.get_summary_statistics()
+        elif not self._data_channels():
             warnings.warn("No data available for summary statistics")
             return
-        
-        # Calculate summary statistics
-        summary = self.data.describe()
-        
-        # Add additional statistics
-        summary.loc['count_non_null'] = self.data.count()
-        summary.loc['null_count'] = self.data.isnull().sum()
-        summary.loc['data_type'] = self.data.dtypes.astype(str)
+        else:
+            # Calculate summary statistics
+            data = self.data
+            summary = data.describe()
+            
+            # Add additional statistics
+            summary.loc['count_non_null'] = data.count()
+            summary.loc['null_count'] = data.isnull().sum()
+            summary.loc['data_type'] = data.dtypes.astype(str)
         
         # Export summary
         summary.to_csv(filename)
-        print(f"Exported summary statistics to {filename}")
+        logger.info("Exported summary statistics to %s", filename)
+    
+    def get_summary_statistics(self, variable_names: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Summary statistics of every collected row from the online accumulators.
+        
+        Args:
+            variable_names: Variables to include (default: all)
+            
+        Returns:
+            DataFrame in DataFrame.describe() layout plus last, count_non_null,
+            null_count and data_type rows (empty if statistics are disabled)
+        """
+        if self._statistics is None:
+            warnings.warn("Online statistics are disabled for this state manager")
+            return pd.DataFrame()
+        return self._statistics.summary(variable_names)
+    
+    def get_variable_statistics(self, variable_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Online statistics of one variable (count, mean, std, variance, min, max,
+        quantile estimates, last value and null count).
+        
+        Args:
+            variable_name: Full variable name
+            
+        Returns:
+            Dictionary of statistics, or None if unknown or statistics are disabled
+        """
+        if self._statistics is None:
+            return None
+        return self._statistics.get(variable_name)
     
     def get_available_variables(self) -> List[str]:
         """
@@ -413,7 +783,7 @@ class StateManager(StateCollector):
         Returns:
             List of variable names
         """
-        return [col for col in self.data.columns if col != 'time']
+        return self._known_columns()
     
     def get_available_categories(self) -> List[str]:
         """
@@ -423,8 +793,8 @@ class StateManager(StateCollector):
             List of category names
         """
         categories = set()
-        for col in self.data.columns:
-            if col != 'time' and '.' in col:
+        for col in self._known_columns():
+            if '.' in col:
                 category = col.split('.')[0]
                 categories.add(category)
         return sorted(list(categories))
@@ -441,7 +811,7 @@ class StateManager(StateCollector):
         """
         subcategories = set()
         prefix = f'{category}.'
-        for col in self.data.columns:
+        for col in self._known_columns():
             if col.startswith(prefix) and col.count('.') >= 2:
                 parts = col.split('.')
                 if len(parts) >= 3:
@@ -456,7 +826,8 @@ class StateManager(StateCollector):
         Returns:
             Dictionary with dataset information
         """
-        if self.data.empty:
+        channels = self._data_channels()
+        if not channels:
             return {
                 'total_rows': 0,
                 'total_variables': 0,
@@ -465,18 +836,41 @@ class StateManager(StateCollector):
                 'memory_usage_mb': 0
             }
         
-        return {
-            'total_rows': len(self.data),
-            'total_variables': len(self.data.columns) - 1,  # Exclude 'time'
-            'time_range': (self.data['time'].min(), self.data['time'].max()),
+        statistics = self._statistics
+        if statistics is not None and statistics.first_time is not None:
+            # Whole run, including rows no longer held in memory
+            time_range = (statistics.first_time, statistics.last_time)
+        else:
+            time_bounds = [b for b in (c.time_bounds() for c in channels) if b is not None]
+            time_range = (min(b[0] for b in time_bounds), max(b[1] for b in time_bounds))
+        info = {
+            'total_rows': sum(c.total_rows for c in channels),
+            'collected_rows': self.row_count,
+            'total_variables': len(self._known_columns()),
+            'time_range': time_range,
             'categories': self.get_available_categories(),
-            'memory_usage_mb': self.data.memory_usage(deep=True).sum() / 1024 / 1024,
+            'memory_usage_mb': sum(c.history.nbytes for c in self._all_channels()) / 1024 / 1024,
+            'spilled_rows': self.spilled_rows,
+            'spilled_chunks': sum(len(c.spill.chunks) for c in self._all_channels() if c.spill is not None),
             'avg_collection_time_ms': np.mean(self._collection_times) * 1000 if self._collection_times else 0
         }
+        if self._channels:
+            # Rows recorded per logging policy (total_rows sums every channel)
+            info['logging_channels'] = {pattern: channel.total_rows
+                                        for pattern, channel in self._channels.items()}
+        return info
     
     def clear_data(self) -> None:
-        """Clear all collected data but keep registry and providers."""
-        self.data = pd.DataFrame()
+        """Clear all collected data but keep registry, providers and logging policies."""
+        for channel in self._all_channels():
+            channel.clear()
+        self._routes.clear()
+        self._routes_version = None
+        if self._live is not None:
+            self._live.clear()
+        if self._statistics is not None:
+            self._statistics.clear()
+        self._data_cache = None
         self.row_count = 0
         self.current_time = 0.0
         self.last_collection_time = None
@@ -554,13 +948,14 @@ class StateManager(StateCollector):
             provider_category = f"{category_str}.{subcategory}_{instance_id}"
         
         self.providers.append((instance, provider_category))
+        self._plan = None
         
         # Generate and register component metadata
         try:
             metadata = self._generate_component_metadata(
                 instance, instance_id, category, subcategory, registration_info
             )
-            ComponentRegistry.register_component(instance, metadata)
+            self.context.component_registry.register_component(instance, metadata)
             
             # Update the ComponentRegistry entry with the actual state variables
             if hasattr(instance, 'get_state_dict'):
@@ -587,7 +982,7 @@ class StateManager(StateCollector):
                         )
                     
                     # Update the ComponentRegistry with the state variables
-                    component_info = ComponentRegistry.get_component(instance_id)
+                    component_info = self.context.component_registry.get_component(instance_id)
                     if component_info:
                         component_info['state_variables'] = component_state_vars
                         
@@ -595,9 +990,7 @@ class StateManager(StateCollector):
                     warnings.warn(f"Failed to link state variables for {instance_id}: {e}")
                     
         except Exception as e:
-            warnings.warn(f"Failed to generate metadata for {instance_id}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error("Failed to generate metadata for %s: %s", instance_id, e, exc_info=True)
         
         # Track the instance
         self._registered_instances[instance_id] = {
@@ -617,16 +1010,9 @@ class StateManager(StateCollector):
             component_code: Component code (e.g., "FW", "TB", "SG")
             
         Returns:
-            Next available instance number
+            Next available instance number in the active simulation context
         """
-        # Use class-level counters for global instance numbering
-        if not hasattr(cls, '_global_instance_counters'):
-            cls._global_instance_counters = {}
-        
-        if component_code not in cls._global_instance_counters:
-            cls._global_instance_counters[component_code] = 0
-        cls._global_instance_counters[component_code] += 1
-        return cls._global_instance_counters[component_code]
+        return current_context().next_instance_number(component_code)
     
     def get_instances_by_class(self, target_class) -> Dict[str, Any]:
         """
@@ -699,7 +1085,7 @@ class StateManager(StateCollector):
         Returns:
             Dictionary mapping component_id to component info
         """
-        components = ComponentRegistry.get_components_by_type(equipment_type)
+        components = self.context.component_registry.get_components_by_type(equipment_type)
         return {comp_id: info for comp_id, info in components.items()}
     
     def get_components_with_capability(self, capability: str) -> Dict[str, Any]:
@@ -712,7 +1098,7 @@ class StateManager(StateCollector):
         Returns:
             Dictionary mapping component_id to component info
         """
-        components = ComponentRegistry.get_components_with_capability(capability)
+        components = self.context.component_registry.get_components_with_capability(capability)
         return {comp_id: info for comp_id, info in components.items()}
     
     def get_components_by_system(self, system: str) -> Dict[str, Any]:
@@ -725,7 +1111,7 @@ class StateManager(StateCollector):
         Returns:
             Dictionary mapping component_id to component info
         """
-        components = ComponentRegistry.get_components_by_system(system)
+        components = self.context.component_registry.get_components_by_system(system)
         return {comp_id: info for comp_id, info in components.items()}
     
     def get_component_metadata(self, component_id: str) -> Optional[ComponentMetadata]:
@@ -738,7 +1124,7 @@ class StateManager(StateCollector):
         Returns:
             ComponentMetadata instance or None if not found
         """
-        component_info = ComponentRegistry.get_component(component_id)
+        component_info = self.context.component_registry.get_component(component_id)
         if component_info:
             return component_info['metadata']
         return None
@@ -750,7 +1136,7 @@ class StateManager(StateCollector):
         Returns:
             Formatted summary string
         """
-        return ComponentRegistry.generate_component_summary()
+        return self.context.component_registry.generate_component_summary()
     
     def update_component_description(self, component_id: str, description: str) -> bool:
         """
@@ -763,7 +1149,7 @@ class StateManager(StateCollector):
         Returns:
             True if successful, False if component not found
         """
-        return ComponentRegistry.update_component_description(component_id, description)
+        return self.context.component_registry.update_component_description(component_id, description)
     
     def find_components_with_description(self) -> Dict[str, str]:
         """
@@ -772,7 +1158,7 @@ class StateManager(StateCollector):
         Returns:
             Dictionary mapping component_id to description
         """
-        return ComponentRegistry.find_components_with_description()
+        return self.context.component_registry.find_components_with_description()
     
     def _infer_unit(self, name: str, value: Any) -> str:
         """Infer units from variable names (copied from auto_provider for compatibility)"""
@@ -962,8 +1348,8 @@ class StateManager(StateCollector):
         from .auto_register import get_registered_info
         
         # Check for pending registrations from @auto_register decorator
-        if hasattr(self.__class__, '_pending_registrations'):
-            pending = self.__class__._pending_registrations
+        pending = self.context.take_pending_registrations()
+        if pending:
             registered_count = 0
             
             for registration in pending:
@@ -977,16 +1363,12 @@ class StateManager(StateCollector):
                     )
                     registered_count += 1
                 except Exception as e:
-                    warnings.warn(f"Failed to register component {registration['instance_id']}: {e}")
-                    import traceback
-                    traceback.print_exc()
-            
-            # Clear pending registrations after processing
-            self.__class__._pending_registrations = []
+                    logger.error("Failed to register component %s: %s", registration['instance_id'], e,
+                                 exc_info=True)
             
-            print(f"Component discovery complete: Registered {registered_count} @auto_register components")
+            logger.info("Component discovery complete: Registered %s @auto_register components", registered_count)
         else:
-            print("Component discovery complete: No @auto_register components found")
+            logger.info("Component discovery complete: No @auto_register components found")
     
     # PHASE 1: Maintenance Configuration Methods
     
@@ -1000,22 +1382,22 @@ class StateManager(StateCollector):
         Returns:
             Parsed maintenance configuration object
         """
-        print(f"STATE MANAGER: 🔍 Loading maintenance configuration...")
+        logger.info("STATE MANAGER: 🔍 Loading maintenance configuration...")
         
         # PRIORITY 1: Explicit config_source parameter
         if config_source:
-            print(f"STATE MANAGER: Using explicit config_source")
+            logger.info("STATE MANAGER: Using explicit config_source")
             self.maintenance_config = self._parse_maintenance_config(config_source)
             return self.maintenance_config
         
         # PRIORITY 2: Config passed to constructor
         if self.config:
-            print(f"STATE MANAGER: Using constructor config")
+            logger.info("STATE MANAGER: Using constructor config")
             self.maintenance_config = self._parse_maintenance_config(self.config)
             return self.maintenance_config
         
         # PRIORITY 3: Auto-discovery from registered components
-        print(f"STATE MANAGER: No explicit config found, using factory defaults")
+        logger.info("STATE MANAGER: No explicit config found, using factory defaults")
         self.maintenance_config = self._create_default_maintenance_config()
         return self.maintenance_config
     
@@ -1029,7 +1411,7 @@ class StateManager(StateCollector):
         Returns:
             Parsed maintenance configuration
         """
-        print(f"STATE MANAGER: 🔧 Parsing maintenance config from {type(config)}")
+        logger.info("STATE MANAGER: 🔧 Parsing maintenance config from %s", type(config))
         
         # Handle different config formats
         if isinstance(config, str):
@@ -1043,41 +1425,45 @@ class StateManager(StateCollector):
             # Object with attributes
             config_dict = self._convert_object_to_dict(config)
         
+        # Logging policies live next to the maintenance settings
+        if config_dict.get('state_logging'):
+            self.load_logging_policies(config_dict)
+        
         # CRITICAL FIX: Check for maintenance_system.component_configs FIRST
         if 'maintenance_system' in config_dict:
             maintenance_system = config_dict['maintenance_system']
-            print(f"STATE MANAGER: 🎯 Found maintenance_system section with keys: {list(maintenance_system.keys())}")
+            logger.info("STATE MANAGER: 🎯 Found maintenance_system section with keys: %s", list(maintenance_system.keys()))
             
             if 'component_configs' in maintenance_system:
-                print(f"STATE MANAGER: ✅ Found component_configs in maintenance_system - using comprehensive config!")
+                logger.info("STATE MANAGER: ✅ Found component_configs in maintenance_system - using comprehensive config!")
                 
                 # Show specific oil_level threshold for debugging
                 component_configs = maintenance_system['component_configs']
                 for subsystem, config_data in component_configs.items():
                     thresholds = config_data.get('thresholds', {})
-                    print(f"  📊 {subsystem}: {len(thresholds)} thresholds")
+                    logger.info("  📊 %s: %s thresholds", subsystem, len(thresholds))
                     
                     if 'oil_level' in thresholds:
                         oil_threshold = thresholds['oil_level']
-                        print(f"    🛢️ oil_level: {oil_threshold.get('threshold', 'unknown')}% {oil_threshold.get('comparison', 'unknown')} -> {oil_threshold.get('action', 'unknown')}")
+                        logger.info("    🛢️ oil_level: %s%% %s -> %s", oil_threshold.get('threshold', 'unknown'), oil_threshold.get('comparison', 'unknown'), oil_threshold.get('action', 'unknown'))
                 
                 return self._create_maintenance_config_from_comprehensive(maintenance_system)
             else:
-                print(f"STATE MANAGER: ⚠️ maintenance_system found but no component_configs")
+                logger.warning("STATE MANAGER: ⚠️ maintenance_system found but no component_configs")
         
         # FALLBACK: Check for maintenance.component_configs
         elif 'maintenance' in config_dict:
             maintenance_section = config_dict['maintenance']
-            print(f"STATE MANAGER: 🔍 Found maintenance section with keys: {list(maintenance_section.keys())}")
+            logger.info("STATE MANAGER: 🔍 Found maintenance section with keys: %s", list(maintenance_section.keys()))
             
             if 'component_configs' in maintenance_section:
-                print(f"STATE MANAGER: ✅ Found component_configs in maintenance section")
+                logger.info("STATE MANAGER: ✅ Found component_configs in maintenance section")
                 return self._create_maintenance_config_from_comprehensive(maintenance_section)
             else:
-                print(f"STATE MANAGER: ⚠️ maintenance section found but no component_configs")
+                logger.warning("STATE MANAGER: ⚠️ maintenance section found but no component_configs")
         
         # No recognized maintenance config found
-        print(f"STATE MANAGER: ⚠️ No recognized maintenance configuration format found")
+        logger.warning("STATE MANAGER: ⚠️ No recognized maintenance configuration format found")
         return self._create_default_maintenance_config()
     
     def _convert_object_to_dict(self, obj):
@@ -1100,7 +1486,7 @@ class StateManager(StateCollector):
         Returns:
             Maintenance configuration object
         """
-        print(f"STATE MANAGER: 🔧 Creating maintenance config from comprehensive format")
+        logger.info("STATE MANAGER: 🔧 Creating maintenance config from comprehensive format")
         
         # Map subsystem names to equipment types
         subsystem_to_equipment_mapping = {
@@ -1127,13 +1513,13 @@ class StateManager(StateCollector):
                     'thresholds': config_data.get('thresholds', {})
                 }
                 
-                print(f"STATE MANAGER: ✅ Mapped {subsystem_name} -> {equipment_type}")
+                logger.info("STATE MANAGER: ✅ Mapped %s -> %s", subsystem_name, equipment_type)
         
         return maintenance_config
     
     def _create_default_maintenance_config(self):
         """Create default maintenance configuration"""
-        print(f"STATE MANAGER: 🔄 Creating default maintenance configuration")
+        logger.info("STATE MANAGER: 🔄 Creating default maintenance configuration")
         
         return {
             'mode': 'conservative',
@@ -1165,7 +1551,8 @@ class StateManager(StateCollector):
             self.maintenance_thresholds[component_id] = {}
         
         self.maintenance_thresholds[component_id].update(thresholds)
-        print(f"STATE MANAGER: ✅ Applied {len(thresholds)} thresholds to {component_id}")
+        self._threshold_plan = None
+        logger.info("STATE MANAGER: ✅ Applied %s thresholds to %s", len(thresholds), component_id)
     
     def get_maintenance_thresholds_for_component(self, component_id: str) -> dict:
         """
@@ -1196,7 +1583,18 @@ class StateManager(StateCollector):
             callback: Function to call when threshold is violated
         """
         self.threshold_event_subscribers.append(callback)
-        print(f"STATE MANAGER: ✅ Added threshold event subscriber")
+        logger.info("STATE MANAGER: ✅ Added threshold event subscriber")
+    
+    def subscribe_to_collections(self, callback):
+        """
+        Subscribe to every collected row
+        
+        Args:
+            callback: Function called as callback(current_datetime, row_data) after each
+                collection; row_data is a read-only mapping of variable name to value
+                that is only valid during the call (copy what needs to be kept)
+        """
+        self.collection_subscribers.append(callback)
     
     def get_current_value(self, component_id: str, parameter: str) -> Optional[float]:
         """
@@ -1209,7 +1607,8 @@ class StateManager(StateCollector):
         Returns:
             Current parameter value or None if not found
         """
-        if self.data.empty:
+        latest = self._latest_buffer()
+        if latest.empty:
             return None
         
         # Try different naming patterns to find the parameter
@@ -1220,8 +1619,8 @@ class StateManager(StateCollector):
         ]
         
         for name in possible_names:
-            if name in self.data.columns:
-                return self.data[name].iloc[-1] if len(self.data) > 0 else None
+            if name in latest:
+                return latest.latest(name)
         
         return None
     
@@ -1246,16 +1645,17 @@ class StateManager(StateCollector):
                 except Exception as e:
                     warnings.warn(f"Failed to get live state from {component_id}: {e}")
         
-        # FALLBACK: Use DataFrame data if available
-        if self.data.empty:
+        # FALLBACK: Use collected history if available
+        latest = self._latest_buffer()
+        if latest.empty:
             return {}
         
         snapshot = {}
-        latest_row = self.data.iloc[-1]
+        latest_row = latest.latest_row()
         
         # Find all variables for this component
-        for col in self.data.columns:
-            if component_id in col and col != 'time':
+        for col in latest.columns:
+            if component_id in col:
                 # Extract parameter name
                 parts = col.split('.')
                 if len(parts) >= 2:
@@ -1304,9 +1704,13 @@ class StateManager(StateCollector):
         
         self.threshold_last_violation_times[component_id][param_name] = timestamp
     
-    def _check_maintenance_thresholds(self, timestamp: float, row_data: dict):
+    def _check_maintenance_thresholds(self, timestamp: float, row_data: Mapping[str, Any]):
         """
         Check maintenance thresholds during state collection with component-level batching
+
+        Thresholds are compiled once into a ThresholdPlan and evaluated for all
+        components in one vectorized pass; violations are then emitted as one
+        batched event per component.
         
         Args:
             timestamp: Current simulation time
@@ -1314,47 +1718,29 @@ class StateManager(StateCollector):
         """
         if not self.maintenance_thresholds:
             return  # No thresholds configured
+
+        plan = self._threshold_plan
+        if plan is None:
+            plan = self._threshold_plan = ThresholdPlan(
+                self.maintenance_thresholds,
+                skip_component=lambda component_id: "turbine_TB-LUB" in component_id or "t" in component_id)
+        if plan.cooldown_version != self._cooldown_version:
+            plan.sync_cooldowns(self.threshold_last_violation_times, self._cooldown_version)
+        if not len(plan):
+            return
         
         # Step 1: Collect ALL violations by component
-        component_violations = {}  # component_id -> [violation_data, ...]
-        
-        for component_id, thresholds in self.maintenance_thresholds.items():
-            violations = []
-            
-            for param_name, threshold_config in thresholds.items():
-                # NEW: Check threshold cooldown first
-                cooldown_hours = threshold_config.get('cooldown_hours', 24.0)
-                if self._is_threshold_in_cooldown(component_id, param_name, cooldown_hours, timestamp):
-                    continue  # Skip this threshold check
-
-                if "turbine_TB-LUB" in component_id or "t" in component_id:
-                    continue 
-                # Find the parameter value in row_data
-                param_value = self._find_parameter_in_row_data(component_id, param_name, row_data)
-                
-                if param_value is not None:
-                    # Check if threshold is violated
-                    if self._check_threshold_condition(param_value, threshold_config):
-                        # Record violation time
-                        self._record_threshold_violation_time(component_id, param_name, timestamp)
-                        
-                        violation_data = {
-                            'parameter': param_name,
-                            'value': param_value,
-                            'threshold': threshold_config.get('threshold'),
-                            'comparison': threshold_config.get('comparison'),
-                            'action': threshold_config.get('action'),
-                            'priority': threshold_config.get('priority', 'MEDIUM'),
-                            'component_id': threshold_config.get('component_id')  # CRITICAL FIX: Include component_id from threshold config
-                        }
-                        violations.append(violation_data)
-            
-            # Store violations for this component if any found
-            if violations:
-                component_violations[component_id] = violations
+        positions, values = plan.evaluate(timestamp, row_data)
+        if not len(positions):
+            return
+        component_violations = plan.group_violations(positions, values)
+        for i in positions:
+            # Record violation time
+            self._record_threshold_violation_time(
+                plan.component_ids[plan.components[i]], plan.params[i], timestamp)
         
         # Step 2: Process each component's violations through orchestrator
-        total_violations = sum(len(violations) for violations in component_violations.values())
+        total_violations = len(positions)
         
         for component_id, violations in component_violations.items():
             # Get orchestrated action for ALL violations of this component
@@ -1366,9 +1752,9 @@ class StateManager(StateCollector):
             self._emit_batched_threshold_violation(component_id, violations, optimal_action, timestamp)
         
         if total_violations > 0:
-            print(f"STATE MANAGER: 🚨 Found {total_violations} threshold violations across {len(component_violations)} components at time {timestamp:.2f}")
+            logger.info("STATE MANAGER: 🚨 Found %s threshold violations across %s components at time %.2f", total_violations, len(component_violations), timestamp)
     
-    def _find_parameter_in_row_data(self, component_id: str, param_name: str, row_data: dict) -> Optional[float]:
+    def _find_parameter_in_row_data(self, component_id: str, param_name: str, row_data: Mapping[str, Any]) -> Optional[float]:
         """
         Find parameter value in row data using various naming patterns
         
@@ -1380,34 +1766,7 @@ class StateManager(StateCollector):
         Returns:
             Parameter value or None if not found
         """
-        # FEEDWATER PARAMETER ALIASES - Map threshold names to actual physics parameter names
-        FEEDWATER_PARAMETER_ALIASES = {
-            'impeller_inspection_wear': 'impeller_wear',
-            # Add more aliases here as needed for other mismatches
-        }
-        
-        # Resolve parameter name using aliases
-        actual_param_name = FEEDWATER_PARAMETER_ALIASES.get(param_name, param_name)
-        
-        # Try different naming patterns with the resolved parameter name
-        possible_names = [
-            f"{component_id}.{actual_param_name}",
-            f"secondary.feedwater_{component_id}.{actual_param_name}",
-            f"secondary.feedwater.{actual_param_name}",
-            f"secondary.{component_id}.{actual_param_name}",
-            # Add steam generator patterns
-            f"secondary.steam_generator_{component_id}.{actual_param_name}",
-            f"secondary.turbine_{component_id}.{actual_param_name}",
-            f"secondary.condenser_{component_id}.{actual_param_name}",
-        ]
-        
-        for name in possible_names:
-            if name in row_data:
-                value = row_data[name]
-                if isinstance(value, (int, float)):
-                    return float(value)
-        
-        return None
+        return lookup_parameter(parameter_candidates(component_id, param_name), row_data)
     
     def _check_threshold_condition(self, value: float, threshold_config: dict) -> bool:
         """
@@ -1481,13 +1840,13 @@ class StateManager(StateCollector):
             try:
                 callback(violation_data)
             except Exception as e:
-                print(f"STATE MANAGER: ❌ Error in threshold event callback: {e}")
+                logger.warning("STATE MANAGER: ❌ Error in threshold event callback: %s", e)
         
         # Show orchestration result in log
         if optimal_action != original_action:
-            print(f"STATE MANAGER: 🚨 Threshold violation: {component_id}.{param_name} = {value:.2f} {threshold_config.get('comparison')} {threshold_config.get('threshold')} -> {original_action} ➜ {optimal_action} (orchestrated)")
+            logger.info("STATE MANAGER: 🚨 Threshold violation: %s.%s = %.2f %s %s -> %s ➜ %s (orchestrated)", component_id, param_name, value, threshold_config.get('comparison'), threshold_config.get('threshold'), original_action, optimal_action)
         else:
-            print(f"STATE MANAGER: 🚨 Threshold violation: {component_id}.{param_name} = {value:.2f} {threshold_config.get('comparison')} {threshold_config.get('threshold')} -> {optimal_action}")
+            logger.info("STATE MANAGER: 🚨 Threshold violation: %s.%s = %.2f %s %s -> %s", component_id, param_name, value, threshold_config.get('comparison'), threshold_config.get('threshold'), optimal_action)
     
     def _get_orchestrated_action(self, component_id: str, param_name: str, value: float, 
                                threshold_config: dict, original_action: str) -> str:
@@ -1507,8 +1866,7 @@ class StateManager(StateCollector):
         try:
             # Use cached orchestrator or create once
             if self._maintenance_orchestrator is None:
-                from systems.maintenance.maintenance_orchestrator import get_maintenance_orchestrator
-                self._maintenance_orchestrator = get_maintenance_orchestrator()
+                self._maintenance_orchestrator = self.context.maintenance_orchestrator
             
             # Create violation data for orchestrator
             violation_data = {
@@ -1531,7 +1889,7 @@ class StateManager(StateCollector):
             return decision.get('selected_action', original_action)
             
         except Exception as e:
-            print(f"STATE MANAGER: ⚠️ Orchestrator call failed for {component_id}: {e}")
+            logger.warning("STATE MANAGER: ⚠️ Orchestrator call failed for %s: %s", component_id, e)
             return original_action  # Fallback to original action
     
     def _get_orchestrated_action_for_violations(self, component_id: str, violations: List[dict], timestamp: float) -> str:
@@ -1549,8 +1907,7 @@ class StateManager(StateCollector):
         try:
             # Use cached orchestrator or create once
             if self._maintenance_orchestrator is None:
-                from systems.maintenance.maintenance_orchestrator import get_maintenance_orchestrator
-                self._maintenance_orchestrator = get_maintenance_orchestrator()
+                self._maintenance_orchestrator = self.context.maintenance_orchestrator
             
             # Determine primary action from violations (highest priority or first one)
             primary_action = violations[0]['action']  # Default to first violation's action
@@ -1567,7 +1924,7 @@ class StateManager(StateCollector):
             return decision.get('selected_action', primary_action)
             
         except Exception as e:
-            print(f"STATE MANAGER: ⚠️ Orchestrator call failed for {component_id}: {e}")
+            logger.warning("STATE MANAGER: ⚠️ Orchestrator call failed for %s: %s", component_id, e)
             # Fallback: return the action from the first violation
             return violations[0]['action'] if violations else 'routine_maintenance'
     
@@ -1615,14 +1972,14 @@ class StateManager(StateCollector):
             try:
                 callback(violation_data)
             except Exception as e:
-                print(f"STATE MANAGER: ❌ Error in threshold event callback: {e}")
+                logger.warning("STATE MANAGER: ❌ Error in threshold event callback: %s", e)
         
         # Show orchestration result in log
         original_actions = [v['action'] for v in violations]
         if optimal_action not in original_actions:
-            print(f"STATE MANAGER: 🚨 Batched threshold violations: {component_id} ({len(violations)} violations) -> {original_actions} ➜ {optimal_action} (orchestrated)")
+            logger.info("STATE MANAGER: 🚨 Batched threshold violations: %s (%s violations) -> %s ➜ %s (orchestrated)", component_id, len(violations), original_actions, optimal_action)
         else:
-            print(f"STATE MANAGER: 🚨 Batched threshold violations: {component_id} ({len(violations)} violations) -> {optimal_action}")
+            logger.info("STATE MANAGER: 🚨 Batched threshold violations: %s (%s violations) -> %s", component_id, len(violations), optimal_action)
     
     def get_current_threshold_violations(self) -> dict:
         """
@@ -1633,10 +1990,48 @@ class StateManager(StateCollector):
         """
         return self.threshold_violations.copy()
     
+    def get_threshold_values(self, row_data: Optional[Mapping[str, Any]] = None) -> np.ndarray:
+        """
+        Get the monitored value of every compiled maintenance threshold
+
+        Args:
+            row_data: Collected row (default: the most recent collection)
+
+        Returns:
+            Values aligned with the compiled thresholds (empty if none are checked yet)
+        """
+        if self._threshold_plan is None:
+            return np.empty(0)
+        if row_data is None:
+            row_data = self._latest_buffer().row_view()
+        return self._threshold_plan.values(row_data)
+
+    def estimate_minutes_to_threshold(self, previous_values: np.ndarray, current_values: np.ndarray,
+                                      dt: float) -> float:
+        """
+        Predict when the next maintenance threshold will be violated
+
+        Args:
+            previous_values: get_threshold_values() of the collection dt minutes earlier
+            current_values: get_threshold_values() of the latest collection
+            dt: Minutes between the two collections
+
+        Returns:
+            Minutes until the first predicted violation (inf if none is approaching,
+            0 if the thresholds were recompiled in between)
+        """
+        plan = self._threshold_plan
+        if plan is None or not len(plan):
+            return float('inf')
+        if len(previous_values) != len(plan) or len(current_values) != len(plan):
+            return 0.0
+        elapsed_minutes = self.get_elapsed_time().total_seconds() / 60.0
+        return plan.minutes_to_violation(elapsed_minutes, previous_values, current_values, dt)
+
     def clear_threshold_violations(self):
         """Clear all threshold violations"""
         self.threshold_violations.clear()
-        print(f"STATE MANAGER: ✅ Cleared all threshold violations")
+        logger.info("STATE MANAGER: ✅ Cleared all threshold violations")
     
     def record_maintenance_result(self, component_id: str, action_type: str, success: bool, 
                                 effectiveness: float = 1.0):
@@ -1673,32 +2068,32 @@ class StateManager(StateCollector):
                 if (violation_action == action_type or 
                     self._actions_are_related(violation_action, action_type)):
                     violations_to_clear.append(param_name)
-                    print(f"STATE MANAGER: 🔍 Marking violation {param_name} for clearing (action: {violation_action} matches {action_type})")
+                    logger.debug("STATE MANAGER: 🔍 Marking violation %s for clearing (action: %s matches %s)", param_name, violation_action, action_type)
             
             # Clear the violations
             for param_name in violations_to_clear:
                 del self.threshold_violations[component_id][param_name]
-                print(f"STATE MANAGER: 🗑️ Cleared violation {component_id}.{param_name}")
+                logger.info("STATE MANAGER: 🗑️ Cleared violation %s.%s", component_id, param_name)
             
             # Clean up empty component entries
             if not self.threshold_violations[component_id]:
                 del self.threshold_violations[component_id]
-                print(f"STATE MANAGER: 🗑️ Removed empty violation entry for {component_id}")
+                logger.info("STATE MANAGER: 🗑️ Removed empty violation entry for %s", component_id)
             
             if violations_to_clear:
-                print(f"STATE MANAGER: ✅ Cleared {len(violations_to_clear)} violations for {component_id} after successful {action_type}")
+                logger.info("STATE MANAGER: ✅ Cleared %s violations for %s after successful %s", len(violations_to_clear), component_id, action_type)
             else:
-                print(f"STATE MANAGER: ⚠️ No violations found to clear for {component_id} after {action_type}")
+                logger.warning("STATE MANAGER: ⚠️ No violations found to clear for %s after %s", component_id, action_type)
                 # Debug: Show what violations exist
                 if component_id in self.threshold_violations:
                     existing_violations = list(self.threshold_violations[component_id].keys())
-                    print(f"STATE MANAGER: 🔍 Existing violations for {component_id}: {existing_violations}")
+                    logger.debug("STATE MANAGER: 🔍 Existing violations for %s: %s", component_id, existing_violations)
         
         # NEW: Reset threshold cooldowns for parameters addressed by this maintenance
         if success:
             self._reset_threshold_cooldowns_for_maintenance(component_id, action_type)
         
-        print(f"STATE MANAGER: 📝 Recorded maintenance: {component_id} {action_type} {'✅' if success else '❌'} (effectiveness: {effectiveness:.2f})")
+        logger.info("STATE MANAGER: 📝 Recorded maintenance: %s %s %s (effectiveness: %.2f)", component_id, action_type, '✅' if success else '❌', effectiveness)
     
     def _force_state_collection_after_maintenance(self, component_id: str):
         """
@@ -1716,26 +2111,26 @@ class StateManager(StateCollector):
                 if hasattr(component, 'get_state_dict'):
                     # Get fresh state from component
                     fresh_state = component.get_state_dict()
-                    print(f"STATE MANAGER: 🔄 Forced fresh state collection for {component_id}")
+                    logger.info("STATE MANAGER: 🔄 Forced fresh state collection for %s", component_id)
                     
-                    # Update the latest row in our DataFrame if it exists
-                    if not self.data.empty:
-                        latest_row_index = len(self.data) - 1
+                    # Update the latest row in our history if it exists
+                    latest = self._latest_buffer()
+                    if not latest.empty:
                         provider_category = instance_info['provider_category']
                         
-                        # Update the DataFrame with fresh values
+                        # Update the history with fresh values
                         for var_name, value in fresh_state.items():
                             full_name = f"{provider_category}.{var_name}"
-                            if full_name in self.data.columns:
-                                self.data.at[latest_row_index, full_name] = value
-                                print(f"STATE MANAGER: 📊 Updated {full_name} = {value}")
+                            if full_name in latest:
+                                latest.set_latest(full_name, value)
+                                logger.debug("STATE MANAGER: 📊 Updated %s = %s", full_name, value)
                 else:
-                    print(f"STATE MANAGER: ⚠️ Component {component_id} has no get_state_dict method")
+                    logger.warning("STATE MANAGER: ⚠️ Component %s has no get_state_dict method", component_id)
             else:
-                print(f"STATE MANAGER: ⚠️ Component {component_id} not found in registered instances")
+                logger.warning("STATE MANAGER: ⚠️ Component %s not found in registered instances", component_id)
                 
         except Exception as e:
-            print(f"STATE MANAGER: ❌ Failed to force state collection for {component_id}: {e}")
+            logger.warning("STATE MANAGER: ❌ Failed to force state collection for %s: %s", component_id, e)
     
     def _actions_are_related(self, violation_action: str, performed_action: str) -> bool:
         """
@@ -1814,7 +2209,7 @@ class StateManager(StateCollector):
         addressed_parameters = maintenance_parameter_mapping.get(action_type, [])
         
         if not addressed_parameters:
-            print(f"STATE MANAGER: No specific parameters to reset cooldowns for {action_type}")
+            logger.info("STATE MANAGER: No specific parameters to reset cooldowns for %s", action_type)
             return
         
         # Reset cooldowns for addressed parameters
@@ -1823,14 +2218,17 @@ class StateManager(StateCollector):
             if param_name in addressed_parameters:
                 del self.threshold_last_violation_times[component_id][param_name]
                 cooldowns_reset += 1
-                print(f"STATE MANAGER: 🔄 Reset cooldown for {component_id}.{param_name}")
+                logger.info("STATE MANAGER: 🔄 Reset cooldown for %s.%s", component_id, param_name)
         
+        if cooldowns_reset > 0:
+            self._cooldown_version += 1
+
         # Clean up empty component entries
         if not self.threshold_last_violation_times[component_id]:
             del self.threshold_last_violation_times[component_id]
         
         if cooldowns_reset > 0:
-            print(f"STATE MANAGER: ✅ Reset {cooldowns_reset} threshold cooldowns for {component_id} after {action_type}")
+            logger.info("STATE MANAGER: ✅ Reset %s threshold cooldowns for %s after %s", cooldowns_reset, component_id, action_type)
 
     def get_maintenance_history(self, component_id: str = None) -> list:
         """
@@ -1870,11 +2268,11 @@ class StateManager(StateCollector):
                 record['action_type'] == action_type and 
                 record['success']):
                 
-                print(f"STATE MANAGER: ✅ Verified maintenance: {component_id} {action_type} was successfully completed")
+                logger.info("STATE MANAGER: ✅ Verified maintenance: %s %s was successfully completed", component_id, action_type)
                 return True
         
         # If no successful maintenance record found, it wasn't effective
-        print(f"STATE MANAGER: ❌ No successful maintenance record found for {component_id} {action_type}")
+        logger.warning("STATE MANAGER: ❌ No successful maintenance record found for %s %s", component_id, action_type)
         return False
     
     def reset(self) -> None:
@@ -1882,22 +2280,27 @@ class StateManager(StateCollector):
         self.clear_data()
         self.registry.clear()
         self.providers.clear()
+        self._plan = None
+        self.logging_policies.clear()
+        self._channels.clear()
+        self._live = None
         self._instance_counters.clear()
         self._registered_instances.clear()
         
         # Reset maintenance system state
         self.maintenance_thresholds.clear()
+        self._threshold_plan = None
         self.threshold_violations.clear()
         self.maintenance_history.clear()
         self.maintenance_config = None
         self.threshold_event_subscribers.clear()
+        self.collection_subscribers.clear()
         self._maintenance_orchestrator = None
         
         # Clear any pending registrations
-        if hasattr(self.__class__, '_pending_registrations'):
-            self.__class__._pending_registrations = []
+        self.context.pending_registrations = []
         
-        print(f"STATE MANAGER: ✅ Complete reset including maintenance system")
+        logger.info("STATE MANAGER: ✅ Complete reset including maintenance system")
     
     def __repr__(self) -> str:
         """String representation of state manager."""
@@ -0,0 +1,234 @@
+"""
+State Spill Sink
+
+This module streams collected state history to disk in fixed-size chunks so a
+long simulation can keep memory bounded without dropping rows. Each chunk is a
+row group written as one file of a partitioned dataset directory:
+
+    <directory>/part-000000.parquet
+    <directory>/part-000001.parquet
+    ...
+
+Parquet and Arrow IPC (Feather v2) chunks require pyarrow. Without pyarrow the
+sink falls back to pickled DataFrame chunks so history is never lost.
+
+A small in-memory manifest (row offsets, time bounds and columns of every
+chunk) lets readers skip chunks outside a requested time range and read only
+the columns they need.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import warnings
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+SPILL_FORMATS = {
+    'parquet': '.parquet',
+    'arrow': '.arrow',
+    'pickle': '.pkl',
+}
+
+
+@dataclass
+class SpillChunk:
+    """Manifest entry for one spilled chunk"""
+    path: Path
+    row_offset: int                      # Global row number of the chunk's first row
+    rows: int
+    start_time: np.datetime64
+    end_time: np.datetime64
+    columns: List[str] = field(default_factory=list)
+
+
+class StateSpillSink:
+    """
+    Chunked on-disk sink for StateManager history.
+    """
+
+    def __init__(self, directory: str, rows_per_chunk: int = 10000, file_format: str = 'parquet'):
+        """
+        Initialize spill sink.
+
+        Args:
+            directory: Dataset directory (created if missing)
+            rows_per_chunk: Number of rows flushed per chunk
+            file_format: 'parquet', 'arrow' or 'pickle'
+
+        Raises:
+            FileExistsError: If the directory already holds chunks of another sink
+        """
+        if file_format not in SPILL_FORMATS:
+            raise ValueError(f"Unknown spill format '{file_format}'. "
+                             f"Expected one of {sorted(SPILL_FORMATS)}")
+        if file_format != 'pickle' and not PYARROW_AVAILABLE:
+            warnings.warn(f"pyarrow not available for '{file_format}' spill chunks. "
+                          f"Install with: pip install pyarrow. Falling back to pickle chunks.")
+            file_format = 'pickle'
+
+        self.directory = Path(directory)
+        if any(self.directory.glob('part-*')):
+            # Chunk numbering restarts at zero: appending would overwrite the other sink's files
+            raise FileExistsError(f"Spill directory {self.directory} already holds chunks; "
+                                  f"use a fresh directory")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.rows_per_chunk = max(1, int(rows_per_chunk))
+        self.file_format = file_format
+        self.chunks: List[SpillChunk] = []
+        self._columns: Dict[str, None] = {}  # Ordered union of spilled columns
+
+    @property
+    def total_rows(self) -> int:
+        """Rows held on disk"""
+        return sum(chunk.rows for chunk in self.chunks)
+
+    def time_bounds(self) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """(earliest, latest) spilled timestamps, or None if nothing spilled"""
+        if not self.chunks:
+            return None
+        return (pd.Timestamp(min(c.start_time for c in self.chunks)),
+                pd.Timestamp(max(c.end_time for c in self.chunks)))
+
+    def columns(self) -> List[str]:
+        """Union of spilled variable names in first-seen order"""
+        return list(self._columns)
+
+    def has_column(self, name: str) -> bool:
+        """Whether any spilled chunk holds the variable"""
+        return name in self._columns
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def write_chunk(self, frame: pd.DataFrame) -> Optional[SpillChunk]:
+        """
+        Write one chunk of history rows.
+
+        Args:
+            frame: Chronological rows including the 'time' column
+
+        Returns:
+            Manifest entry of the written chunk (None for an empty frame)
+        """
+        if frame.empty:
+            return None
+
+        index = len(self.chunks)
+        path = self.directory / f"part-{index:06d}{SPILL_FORMATS[self.file_format]}"
+        frame = frame.reset_index(drop=True)
+
+        try:
+            self._write_frame(frame, path)
+        except Exception:
+            # Mixed-type object columns (e.g. int and str) are not representable
+            # in Arrow; store them as strings rather than lose the chunk
+            self._write_frame(self._stringify_objects(frame), path)
+
+        times = frame['time'].to_numpy(dtype='datetime64[ns]')
+        chunk = SpillChunk(
+            path=path,
+            row_offset=self.total_rows,
+            rows=len(frame),
+            start_time=times.min(),
+            end_time=times.max(),
+            columns=[c for c in frame.columns if c != 'time'],
+        )
+        self.chunks.append(chunk)
+        for name in chunk.columns:
+            self._columns.setdefault(name, None)
+        return chunk
+
+    def _write_frame(self, frame: pd.DataFrame, path: Path) -> None:
+        if self.file_format == 'parquet':
+            frame.to_parquet(path, index=False)
+        elif self.file_format == 'arrow':
+            frame.to_feather(path)
+        else:
+            frame.to_pickle(path)
+
+    @staticmethod
+    def _stringify_objects(frame: pd.DataFrame) -> pd.DataFrame:
+        frame = frame.copy()
+        for name in frame.columns:
+            if frame[name].dtype == object:
+                frame[name] = frame[name].map(lambda v: v if v is None or isinstance(v, str) else str(v))
+        return frame
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _read_frame(self, chunk: SpillChunk, columns: Optional[Sequence[str]]) -> pd.DataFrame:
+        if self.file_format == 'pickle':
+            frame = pd.read_pickle(chunk.path)
+            return frame if columns is None else frame[list(columns)]
+        if self.file_format == 'parquet':
+            return pd.read_parquet(chunk.path, columns=None if columns is None else list(columns))
+        return pd.read_feather(chunk.path, columns=None if columns is None else list(columns))
+
+    def read(self, columns: Optional[Sequence[str]] = None,
+             start_time: Any = None, end_time: Any = None) -> List[Tuple[pd.DataFrame, np.ndarray]]:
+        """
+        Read spilled rows, skipping chunks outside the time range.
+
+        Args:
+            columns: Variables to read (default: all); unknown names are skipped
+            start_time: Optional inclusive range start
+            end_time: Optional inclusive range end
+
+        Returns:
+            List of (frame, global row numbers) per chunk, oldest first. Frames
+            include 'time' and every requested column (missing ones as NaN).
+        """
+        start = None if start_time is None else np.datetime64(start_time, 'ns')
+        end = None if end_time is None else np.datetime64(end_time, 'ns')
+
+        parts = []
+        for chunk in self.chunks:
+            if start is not None and chunk.end_time < start:
+                continue
+            if end is not None and chunk.start_time > end:
+                continue
+
+            if columns is None:
+                read_columns = None
+            else:
+                present = set(chunk.columns)
+                read_columns = ['time'] + [c for c in columns if c in present]
+            frame = self._read_frame(chunk, read_columns)
+            rows = np.arange(chunk.row_offset, chunk.row_offset + chunk.rows)
+
+            if start is not None or end is not None:
+                times = frame['time'].to_numpy(dtype='datetime64[ns]')
+                mask = np.ones(len(times), dtype=bool)
+                if start is not None:
+                    mask &= times >= start
+                if end is not None:
+                    mask &= times <= end
+                frame = frame[mask]
+                rows = rows[mask]
+
+            if columns is not None:
+                frame = frame.reindex(columns=['time'] + list(columns))
+            parts.append((frame, rows))
+        return parts
+
+    def clear(self) -> None:
+        """Delete every chunk written by this sink."""
+        for chunk in self.chunks:
+            try:
+                chunk.path.unlink()
+            except FileNotFoundError:
+                pass
+        self.chunks.clear()
+        self._columns.clear()
@@ -0,0 +1,297 @@
+"""
+Maintenance Threshold Plan
+
+This module compiles the StateManager's maintenance thresholds into flat NumPy
+arrays so that every collection evaluates all of them in one vectorized pass.
+
+Each threshold gets a compiled entry: the history column holding its
+parameter (resolved once from the candidate naming patterns), its threshold
+value, a comparison opcode and a cooldown in minutes. Per step, the plan
+gathers the current values with one fancy-indexed read of the history
+buffer, masks out thresholds still in cooldown and returns the violated
+thresholds in configuration order. The StateManager turns those into the
+same per-component batched events as before.
+
+Column bindings are refreshed whenever the history schema changes; the plan
+is recompiled when thresholds are applied or the manager is reset.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from .state_history import RowView, StateHistoryBuffer
+
+
+# Map threshold parameter names to the physics parameter names they monitor
+PARAMETER_ALIASES = {
+    'impeller_inspection_wear': 'impeller_wear',
+    # Add more aliases here as needed for other mismatches
+}
+
+# Comparison opcodes
+OP_NEVER = 0
+OP_GREATER = 1
+OP_LESS = 2
+OP_GREATER_EQUAL = 3
+OP_LESS_EQUAL = 4
+OP_EQUALS = 5
+OP_NOT_EQUALS = 6
+
+COMPARISON_OPCODES = {
+    'greater_than': OP_GREATER,
+    'less_than': OP_LESS,
+    'greater_equal': OP_GREATER_EQUAL,
+    'less_equal': OP_LESS_EQUAL,
+    'equals': OP_EQUALS,
+    'not_equals': OP_NOT_EQUALS,
+}
+
+EQUALS_TOLERANCE = 0.001
+
+
+def parameter_candidates(component_id: str, param_name: str) -> Tuple[str, ...]:
+    """
+    Variable names a component parameter may be recorded under, in lookup order.
+
+    Args:
+        component_id: Component ID
+        param_name: Threshold parameter name (aliases are resolved)
+
+    Returns:
+        Tuple of candidate variable names
+    """
+    actual_param_name = PARAMETER_ALIASES.get(param_name, param_name)
+    return (
+        f"{component_id}.{actual_param_name}",
+        f"secondary.feedwater_{component_id}.{actual_param_name}",
+        f"secondary.feedwater.{actual_param_name}",
+        f"secondary.{component_id}.{actual_param_name}",
+        # Steam generator, turbine and condenser patterns
+        f"secondary.steam_generator_{component_id}.{actual_param_name}",
+        f"secondary.turbine_{component_id}.{actual_param_name}",
+        f"secondary.condenser_{component_id}.{actual_param_name}",
+    )
+
+
+def lookup_parameter(candidates: Tuple[str, ...], row_data: Mapping[str, Any]) -> Optional[float]:
+    """First numeric value among the candidate names present in row_data"""
+    for name in candidates:
+        if name in row_data:
+            value = row_data[name]
+            if isinstance(value, (int, float)):
+                return float(value)
+    return None
+
+
+def _opcode(threshold_config: Mapping[str, Any]) -> int:
+    threshold = threshold_config.get('threshold')
+    if threshold is None or not isinstance(threshold, (int, float)):
+        return OP_NEVER
+    return COMPARISON_OPCODES.get(threshold_config.get('comparison', 'greater_than'), OP_NEVER)
+
+
+class ThresholdPlan:
+    """
+    Maintenance thresholds compiled into arrays for one-pass evaluation.
+    """
+
+    def __init__(self, maintenance_thresholds: Mapping[str, Mapping[str, dict]],
+                 skip_component: Optional[Any] = None):
+        """
+        Compile thresholds.
+
+        Args:
+            maintenance_thresholds: component_id -> {param: threshold_config}
+            skip_component: Optional predicate; components it accepts are never checked
+        """
+        self.component_ids: List[str] = []
+        self.params: List[str] = []
+        self.configs: List[dict] = []
+        self.candidates: List[Tuple[str, ...]] = []
+        components: List[int] = []
+
+        for component_id, thresholds in maintenance_thresholds.items():
+            if skip_component is not None and skip_component(component_id):
+                continue
+            for param_name, threshold_config in thresholds.items():
+                components.append(len(self.component_ids))
+                self.params.append(param_name)
+                self.configs.append(threshold_config)
+                self.candidates.append(parameter_candidates(component_id, param_name))
+            if components and components[-1] == len(self.component_ids):
+                self.component_ids.append(component_id)
+
+        self.components = np.asarray(components, dtype=np.intp)
+        self.opcodes = np.array([_opcode(c) for c in self.configs], dtype=np.int8)
+        self.thresholds = np.array([float(c['threshold']) if op != OP_NEVER else np.nan
+                                    for c, op in zip(self.configs, self.opcodes)], dtype=np.float64)
+        self.cooldown_minutes = np.array([c.get('cooldown_hours', 24.0) * 60 for c in self.configs],
+                                         dtype=np.float64)
+        self.last_violation = np.full(len(self.configs), np.nan)
+        self.cooldown_version = -1
+
+        # Column bindings against a history buffer schema
+        self._buffer: Optional[StateHistoryBuffer] = None
+        self._schema_version = -1
+        self._num_pos = np.empty(0, dtype=np.intp)    # Entries read from numeric columns
+        self._num_cols = np.empty(0, dtype=np.intp)   # ... and their column indices
+        self._scan_pos: List[int] = []                # Entries resolved per step by name lookup
+
+    def __len__(self) -> int:
+        return len(self.configs)
+
+    def sync_cooldowns(self, last_violation_times: Mapping[str, Mapping[str, float]],
+                       version: int) -> None:
+        """
+        Reload last violation times (after cooldowns were reset externally).
+
+        Args:
+            last_violation_times: component_id -> {param: timestamp}
+            version: Cooldown version the times correspond to
+        """
+        for i, (component, param) in enumerate(zip(self.components, self.params)):
+            times = last_violation_times.get(self.component_ids[component])
+            self.last_violation[i] = np.nan if not times or param not in times else times[param]
+        self.cooldown_version = version
+
+    def _bind(self, buffer: StateHistoryBuffer) -> None:
+        """Resolve each threshold to the first candidate column of the buffer."""
+        num_pos, num_cols, scan_pos = [], [], []
+        for i, candidates in enumerate(self.candidates):
+            if self.opcodes[i] == OP_NEVER:
+                continue
+            for name in candidates:
+                slot = buffer.column_slot(name)
+                if slot is None:
+                    continue
+                is_object, index = slot
+                if is_object:
+                    # Status strings fall through to later candidates: look up by name
+                    scan_pos.append(i)
+                else:
+                    num_pos.append(i)
+                    num_cols.append(index)
+                break
+
+        self._buffer = buffer
+        self._schema_version = buffer.schema_version
+        self._num_pos = np.asarray(num_pos, dtype=np.intp)
+        self._num_cols = np.asarray(num_cols, dtype=np.intp)
+        self._scan_pos = scan_pos
+
+    def values(self, row_data: Mapping[str, Any]) -> np.ndarray:
+        """
+        Current parameter value of every threshold (NaN where not found).
+
+        Args:
+            row_data: Row just collected (a RowView takes the vectorized path)
+
+        Returns:
+            float64 array aligned with the compiled thresholds
+        """
+        values = np.full(len(self.configs), np.nan)
+        if isinstance(row_data, RowView):
+            buffer, pos = row_data._buffer, row_data._pos
+            if pos < 0:
+                return values
+            if buffer is not self._buffer or buffer.schema_version != self._schema_version:
+                self._bind(buffer)
+            if len(self._num_pos):
+                values[self._num_pos] = buffer.read_numeric(pos, self._num_cols)
+            scan = self._scan_pos
+        else:
+            scan = np.flatnonzero(self.opcodes != OP_NEVER)
+
+        for i in scan:
+            value = lookup_parameter(self.candidates[i], row_data)
+            if value is not None:
+                values[i] = value
+        return values
+
+    def evaluate(self, timestamp: float, row_data: Mapping[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate every threshold against a collected row.
+
+        Thresholds in cooldown are skipped; violated thresholds start a new
+        cooldown at ``timestamp``.
+
+        Args:
+            timestamp: Current simulation time in minutes
+            row_data: Row just collected
+
+        Returns:
+            (violated entry positions in configuration order, values of all entries)
+        """
+        values = self.values(row_data)
+        ops = self.opcodes
+        thresholds = self.thresholds
+        with np.errstate(invalid='ignore'):
+            in_cooldown = (timestamp - self.last_violation) < self.cooldown_minutes
+            deviation = np.abs(values - thresholds)
+            violated = (((ops == OP_GREATER) & (values > thresholds)) |
+                        ((ops == OP_LESS) & (values < thresholds)) |
+                        ((ops == OP_GREATER_EQUAL) & (values >= thresholds)) |
+                        ((ops == OP_LESS_EQUAL) & (values <= thresholds)) |
+                        ((ops == OP_EQUALS) & (deviation < EQUALS_TOLERANCE)) |
+                        ((ops == OP_NOT_EQUALS) & (deviation >= EQUALS_TOLERANCE)))
+        positions = np.flatnonzero(violated & ~in_cooldown)
+        self.last_violation[positions] = timestamp
+        return positions, values
+
+    def minutes_to_violation(self, timestamp: float, previous: np.ndarray, current: np.ndarray,
+                             dt: float) -> float:
+        """
+        Predict when the next threshold will be violated by linear extrapolation.
+
+        Only greater/less comparisons are extrapolated; thresholds in cooldown
+        and parameters that are not found are ignored.
+
+        Args:
+            timestamp: Current simulation time in minutes
+            previous: values() of the collection dt minutes earlier
+            current: values() of the latest collection
+            dt: Minutes between the two collections
+
+        Returns:
+            Minutes until the first predicted violation (0 if one is already
+            violated, inf if none is approaching)
+        """
+        ops = self.opcodes
+        if not len(ops) or dt <= 0:
+            return float('inf')
+        upper = (ops == OP_GREATER) | (ops == OP_GREATER_EQUAL)
+        lower = (ops == OP_LESS) | (ops == OP_LESS_EQUAL)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            in_cooldown = (timestamp - self.last_violation) < self.cooldown_minutes
+            gap = np.where(upper, self.thresholds - current, current - self.thresholds)
+            approach_rate = np.where(upper, current - previous, previous - current) / dt
+            eta = np.where(gap <= 0.0, 0.0, gap / np.where(approach_rate > 0.0, approach_rate, 0.0))
+        eta[~(upper | lower) | in_cooldown | np.isnan(eta)] = np.inf
+        return float(eta.min())
+
+    def group_violations(self, positions: np.ndarray, values: np.ndarray) -> Dict[str, List[dict]]:
+        """
+        Build per-component violation records for evaluated positions.
+
+        Args:
+            positions: Violated entry positions from evaluate()
+            values: Values from evaluate()
+
+        Returns:
+            component_id -> [violation_data, ...] in configuration order
+        """
+        component_violations: Dict[str, List[dict]] = {}
+        for i in positions:
+            threshold_config = self.configs[i]
+            component_id = self.component_ids[self.components[i]]
+            component_violations.setdefault(component_id, []).append({
+                'parameter': self.params[i],
+                'value': float(values[i]),
+                'threshold': threshold_config.get('threshold'),
+                'comparison': threshold_config.get('comparison'),
+                'action': threshold_config.get('action'),
+                'priority': threshold_config.get('priority', 'MEDIUM'),
+                'component_id': threshold_config.get('component_id')  # Component ID from threshold config
+            })
+        return component_violations
@@ -18,6 +18,9 @@ import time
 from .work_orders import WorkOrder, WorkOrderManager, WorkOrderType, Priority, WorkOrderStatus
 from .maintenance_actions import MaintenanceActionType, MaintenanceResult, get_maintenance_catalog
 from .maintenance_templates import MaintenanceConfigFactory
+from simulator.sim_logging import get_logger
+
+logger = get_logger(__name__)
 
 # Simple event class for state manager integration (replaces MaintenanceEvent)
 class StateManagerEvent:
@@ -93,7 +96,7 @@ class AutoMaintenanceSystem:
         self.work_order_cooldown_hours = 24.0  # Minimum time between same work orders (24 hours)
         
         # No more event subscriptions - state manager handles everything!
-        print("AUTO MAINTENANCE: 🚀 PHASE 3: Event bus removed - using state manager only")
+        logger.info("AUTO MAINTENANCE: 🚀 PHASE 3: Event bus removed - using state manager only")
     
     def setup_monitoring_from_state_manager(self, state_manager, aggressive_mode: bool = False):
         """
@@ -103,7 +106,7 @@ class AutoMaintenanceSystem:
             state_manager: StateManager instance with registered components
             aggressive_mode: If True, use aggressive thresholds for demos
         """
-        print(f"AUTO MAINTENANCE: 🚀 PHASE 2: Setting up monitoring via state manager")
+        logger.info("AUTO MAINTENANCE: 🚀 PHASE 2: Setting up monitoring via state manager")
         
         # Store reference to state manager
         self.state_manager = state_manager
@@ -112,11 +115,11 @@ class AutoMaintenanceSystem:
         maintenance_config = state_manager.load_maintenance_config()
         
         # CRITICAL DEBUG: Show what's actually in the maintenance config
-        print(f"AUTO MAINTENANCE: 🔍 Maintenance config structure:")
-        print(f"  Mode: {maintenance_config.get('mode', 'unknown')}")
-        print(f"  Component configs keys: {list(maintenance_config.get('component_configs', {}).keys())}")
+        logger.info("AUTO MAINTENANCE: 🔍 Maintenance config structure:")
+        logger.info("  Mode: %s", maintenance_config.get('mode', 'unknown'))
+        logger.info("  Component configs keys: %s", list(maintenance_config.get('component_configs', {}).keys()))
         for config_key, config_data in maintenance_config.get('component_configs', {}).items():
-            print(f"    {config_key}: {len(config_data.get('thresholds', {}))} thresholds")
+            logger.info("    %s: %s thresholds", config_key, len(config_data.get('thresholds', {})))
         
         # Subscribe to state manager's threshold events
         state_manager.subscribe_to_threshold_events(self._handle_state_manager_threshold)
@@ -127,33 +130,32 @@ class AutoMaintenanceSystem:
         # Get all registered components from state manager
         registered_instances = state_manager.get_registered_instance_info()
         
-        print(f"AUTO MAINTENANCE: 🔍 Found {len(registered_instances)} registered instances:")
+        logger.info("AUTO MAINTENANCE: 🔍 Found %s registered instances:", len(registered_instances))
         for instance_id, instance_info in registered_instances.items():
-            print(f"  - {instance_id}: {instance_info['class_name']}")
+            logger.info("  - %s: %s", instance_id, instance_info['class_name'])
         
         for instance_id, instance_info in registered_instances.items():
             try:
                 # CRITICAL FIX: Filter out standalone subsystem instances
                 if instance_id.endswith('-LUB') or 'lubrication' in instance_id.lower():
-                    print(f"AUTO MAINTENANCE: 🚫 Skipping lubrication system instance {instance_id}")
+                    logger.info("AUTO MAINTENANCE: 🚫 Skipping lubrication system instance %s", instance_id)
                     continue
                 
                 if any(suffix in instance_id for suffix in ['-CTRL', '-PROT', '-DIAG', '-MON']):
-                    print(f"AUTO MAINTENANCE: 🚫 Skipping subsystem instance {instance_id}")
+                    logger.info("AUTO MAINTENANCE: 🚫 Skipping subsystem instance %s", instance_id)
                     continue
                 
                 # Get component metadata
-                from simulator.state.component_metadata import ComponentRegistry
-                component_metadata = ComponentRegistry.get_component(instance_id)
+                component_metadata = state_manager.context.component_registry.get_component(instance_id)
                 if not component_metadata:
-                    print(f"AUTO MAINTENANCE: No metadata found for {instance_id}, skipping")
+                    logger.info("AUTO MAINTENANCE: No metadata found for %s, skipping", instance_id)
                     continue
                 
                 equipment_type = component_metadata['metadata'].equipment_type.value
                 
                 # CRITICAL FIX: The state manager already mapped subsystem to equipment type
                 # So we should look up by equipment_type directly, not by subsystem_name
-                print(f"AUTO MAINTENANCE: 🔄 Looking up config for equipment type '{equipment_type}'")
+                logger.info("AUTO MAINTENANCE: 🔄 Looking up config for equipment type '%s'", equipment_type)
                 
                 # Check if we have maintenance config for this equipment type
                 if equipment_type in maintenance_config.get('component_configs', {}):
@@ -165,23 +167,21 @@ class AutoMaintenanceSystem:
                         state_manager.apply_maintenance_thresholds(instance_id, thresholds)
                         components_configured += 1
                         
-                        print(f"AUTO MAINTENANCE: ✅ Configured {instance_id} ({equipment_type}) with {len(thresholds)} thresholds")
+                        logger.info("AUTO MAINTENANCE: ✅ Configured %s (%s) with %s thresholds", instance_id, equipment_type, len(thresholds))
                         
                         # Show specific oil_level threshold for debugging
                         if 'oil_level' in thresholds:
                             oil_threshold = thresholds['oil_level']
-                            print(f"    🛢️ oil_level: {oil_threshold.get('threshold')}% {oil_threshold.get('comparison')} -> {oil_threshold.get('action')}")
+                            logger.info("    🛢️ oil_level: %s%% %s -> %s", oil_threshold.get('threshold'), oil_threshold.get('comparison'), oil_threshold.get('action'))
                     else:
-                        print(f"AUTO MAINTENANCE: ⚠️ No thresholds found for {instance_id} ({equipment_type})")
+                        logger.warning("AUTO MAINTENANCE: ⚠️ No thresholds found for %s (%s)", instance_id, equipment_type)
                 else:
-                    print(f"AUTO MAINTENANCE: ⚠️ No maintenance config for equipment type '{equipment_type}'")
+                    logger.warning("AUTO MAINTENANCE: ⚠️ No maintenance config for equipment type '%s'", equipment_type)
                 
             except Exception as e:
-                print(f"AUTO MAINTENANCE: Failed to configure {instance_id}: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.error("AUTO MAINTENANCE: Failed to configure %s: %s", instance_id, e, exc_info=True)
         
-        print(f"AUTO MAINTENANCE: ✅ PHASE 2 Complete - configured {components_configured} components via state manager")
+        logger.info("AUTO MAINTENANCE: ✅ PHASE 2 Complete - configured %s components via state manager", components_configured)
         
         # Set execution delays based on mode
         if aggressive_mode:
@@ -189,13 +189,13 @@ class AutoMaintenanceSystem:
             self.high_priority_delay_hours = 0.0
             self.medium_priority_delay_hours = 0.0
             self.low_priority_delay_hours = 0.0
-            print("AUTO MAINTENANCE: Configured for aggressive mode (immediate execution)")
+            logger.info("AUTO MAINTENANCE: Configured for aggressive mode (immediate execution)")
         else:
             self.emergency_delay_hours = 0.0      # Keep emergency immediate
             self.high_priority_delay_hours = 1.0  # 1 hour delay
             self.medium_priority_delay_hours = 4.0 # 4 hour delay  
             self.low_priority_delay_hours = 24.0   # 24 hour delay
-            print("AUTO MAINTENANCE: Configured for realistic priority-based delays")
+            logger.info("AUTO MAINTENANCE: Configured for realistic priority-based delays")
 
     def update(self, current_time_minutes: float, dt: float) -> List[WorkOrder]:
         """
@@ -262,14 +262,14 @@ class AutoMaintenanceSystem:
             for violation in violations:
                 if violation.get('action') == action and violation.get('component_id'):
                     extracted_component_id = violation['component_id']
-                    print(f"AUTO MAINTENANCE: 🔍 Found component_id={extracted_component_id} for action={action} in batched violation")
+                    logger.info("AUTO MAINTENANCE: 🔍 Found component_id=%s for action=%s in batched violation", extracted_component_id, action)
                     break
         
         # PHASE 2 FIX: Check if we've already processed this exact violation recently
         violation_key = f"{component_id}:{parameter}:{action}:{timestamp}"
         if hasattr(self, '_processed_violations'):
             if violation_key in self._processed_violations:
-                print(f"AUTO MAINTENANCE: 🔄 Skipping already processed violation: {component_id}.{parameter}")
+                logger.info("AUTO MAINTENANCE: 🔄 Skipping already processed violation: %s.%s", component_id, parameter)
                 return
         else:
             self._processed_violations = set()
@@ -277,10 +277,10 @@ class AutoMaintenanceSystem:
         # Mark this violation as processed
         self._processed_violations.add(violation_key)
         
-        print(f"AUTO MAINTENANCE: 🚨 PHASE 2: State manager threshold violation: {component_id}.{parameter} = {value:.2f} {comparison} {threshold} -> {action}")
+        logger.info("AUTO MAINTENANCE: 🚨 PHASE 2: State manager threshold violation: %s.%s = %.2f %s %s -> %s", component_id, parameter, value, comparison, threshold, action)
         
         if not action:
-            print(f"AUTO MAINTENANCE: No action specified for {component_id} {parameter} threshold")
+            logger.info("AUTO MAINTENANCE: No action specified for %s %s threshold", component_id, parameter)
             return
         
         # Convert priority string to Priority enum
@@ -320,14 +320,14 @@ class AutoMaintenanceSystem:
             # Add the newly created work order to the current update list
             self.current_update_work_orders.append(work_order)
             formatted_time = work_order._format_simulation_time(work_order.created_date)
-            print(f"AUTO MAINTENANCE: ✅ PHASE 2: Created work order {work_order.work_order_id} for {component_id} - {action} at {formatted_time}")
+            logger.info("AUTO MAINTENANCE: ✅ PHASE 2: Created work order %s for %s - %s at %s", work_order.work_order_id, component_id, action, formatted_time)
             
             # Record maintenance result back to state manager if available
             if hasattr(self, 'state_manager') and self.state_manager:
                 # We'll record the result after execution, for now just log
-                print(f"AUTO MAINTENANCE: 📝 Will report maintenance result back to state manager")
+                logger.info("AUTO MAINTENANCE: 📝 Will report maintenance result back to state manager")
         else:
-            print(f"AUTO MAINTENANCE: ❌ PHASE 2: Failed to create work order for {component_id} - {action}")
+            logger.warning("AUTO MAINTENANCE: ❌ PHASE 2: Failed to create work order for %s - %s", component_id, action)
     
     def _create_automatic_work_order(self, component_id: str, action_type: str,
                                    priority: Priority, trigger_reason: str,
@@ -339,7 +339,7 @@ class AutoMaintenanceSystem:
             try:
                 action_enum = MaintenanceActionType(action_type)
             except ValueError:
-                print(f"AUTO MAINTENANCE: Unknown action type '{action_type}' for {component_id}")
+                logger.info("AUTO MAINTENANCE: Unknown action type '%s' for %s", action_type, component_id)
                 return None
         else:
             action_enum = action_type
@@ -353,8 +353,9 @@ class AutoMaintenanceSystem:
             time_since_last = current_time - last_trigger_time
             
             if time_since_last < self.work_order_cooldown_hours:
-                print(f"AUTO MAINTENANCE: Skipping duplicate work order for {component_id} - {action_type} "
-                      f"(last created {time_since_last:.2f} hours ago, cooldown: {self.work_order_cooldown_hours} hours)")
+                logger.info("AUTO MAINTENANCE: Skipping duplicate work order for %s - %s "
+                            "(last created %.2f hours ago, cooldown: %s hours)",
+                            component_id, action_type, time_since_last, self.work_order_cooldown_hours)
                 return None
         
         # Check for existing active work orders for the same component and action
@@ -364,19 +365,20 @@ class AutoMaintenanceSystem:
                 # Check if any action in the existing work order matches our action
                 for existing_action in existing_order.maintenance_actions:
                     if existing_action.action_type == action_type:
-                        print(f"AUTO MAINTENANCE: Skipping duplicate work order - {existing_order.work_order_id} "
-                              f"already has {action_type} for {component_id}")
+                        logger.info("AUTO MAINTENANCE: Skipping duplicate work order - %s "
+                                    "already has %s for %s",
+                                    existing_order.work_order_id, action_type, component_id)
                         return None
         
         # PHASE 3: Get component information from state manager instead of event bus
         if not self.state_manager:
-            print(f"AUTO MAINTENANCE: State manager not available")
+            logger.info("AUTO MAINTENANCE: State manager not available")
             return None
         
         # Get component from state manager
         registered_instances = self.state_manager.get_registered_instance_info()
         if component_id not in registered_instances:
-            print(f"AUTO MAINTENANCE: Component {component_id} not found in state manager")
+            logger.info("AUTO MAINTENANCE: Component %s not found in state manager", component_id)
             return None
         
         component_info = registered_instances[component_id]
@@ -414,7 +416,7 @@ class AutoMaintenanceSystem:
         # CRITICAL FIX: Include component_id in action if extracted from violation
         if extracted_component_id and action_type == "bearing_replacement":
             action_description += f" (component: {extracted_component_id})"
-            print(f"AUTO MAINTENANCE: 🔧 Adding bearing replacement with component_id={extracted_component_id}")
+            logger.info("AUTO MAINTENANCE: 🔧 Adding bearing replacement with component_id=%s", extracted_component_id)
         
         work_order.add_action(
             action_type=action_enum.value,
@@ -428,7 +430,7 @@ class AutoMaintenanceSystem:
             if not hasattr(work_order, 'metadata'):
                 work_order.metadata = {}
             work_order.metadata['extracted_component_id'] = extracted_component_id
-            print(f"AUTO MAINTENANCE: 📝 Stored extracted_component_id={extracted_component_id} in work order metadata")
+            logger.info("AUTO MAINTENANCE: 📝 Stored extracted_component_id=%s in work order metadata", extracted_component_id)
         
         # Set component metadata
         work_order.component_type = component_status['class_name']
@@ -445,9 +447,9 @@ class AutoMaintenanceSystem:
             # Record this trigger to prevent duplicates
             self.recent_work_order_triggers[trigger_key] = current_time
             
-            print(f"AUTO MAINTENANCE: Successfully created work order {work_order.work_order_id} for {component_id} - {action_type}")
+            logger.info("AUTO MAINTENANCE: Successfully created work order %s for %s - %s", work_order.work_order_id, component_id, action_type)
         else:
-            print(f"AUTO MAINTENANCE: ERROR - Work order {work_order.work_order_id} was not stored in manager!")
+            logger.error("AUTO MAINTENANCE: ERROR - Work order %s was not stored in manager!", work_order.work_order_id)
             return None
         
         return work_order
@@ -483,10 +485,19 @@ class AutoMaintenanceSystem:
                 else:
                     # Reschedule for later (convert 1 hour to minutes)
                     work_order.planned_start_date = current_time_minutes + 60.0  # Try again in 1 hour (60 minutes)
-                    print(f"AUTO MAINTENANCE: Rescheduled {work_order.work_order_id} - component not available")
+                    logger.info("AUTO MAINTENANCE: Rescheduled %s - component not available", work_order.work_order_id)
         
         return executed_orders
     
+    def get_next_scheduled_start(self) -> Optional[float]:
+        """Earliest planned start (minutes) of the scheduled work orders, or None if there are none"""
+        if not self.auto_execute_maintenance:
+            return None
+        starts = [work_order.planned_start_date
+                  for work_order in self.work_order_manager.get_work_orders_by_status(WorkOrderStatus.SCHEDULED)
+                  if work_order.planned_start_date is not None]
+        return min(starts) if starts else None
+
     def _can_perform_maintenance(self, component_id: str, work_order: WorkOrder) -> bool:
         """PHASE 3: Check if maintenance can be performed on component using state manager"""
         if not self.state_manager:
@@ -506,12 +517,12 @@ class AutoMaintenanceSystem:
         
         # Get component from state manager instead of event bus
         if not self.state_manager:
-            print(f"AUTO MAINTENANCE: State manager not available")
+            logger.info("AUTO MAINTENANCE: State manager not available")
             return False
             
         registered_instances = self.state_manager.get_registered_instance_info()
         if work_order.component_id not in registered_instances:
-            print(f"AUTO MAINTENANCE: Component {work_order.component_id} not found in state manager")
+            logger.info("AUTO MAINTENANCE: Component %s not found in state manager", work_order.component_id)
             return False
         
         component = registered_instances[work_order.component_id]['instance']
@@ -543,7 +554,7 @@ class AutoMaintenanceSystem:
                 self.maintenance_actions_performed += 1
                 
             except Exception as e:
-                print(f"AUTO MAINTENANCE: Error executing {action.action_type} on {work_order.component_id}: {e}")
+                logger.warning("AUTO MAINTENANCE: Error executing %s on %s: %s", action.action_type, work_order.component_id, e)
                 action.success = False
                 action.findings = f"Error: {str(e)}"
                 success = False
@@ -571,12 +582,12 @@ class AutoMaintenanceSystem:
                     effectiveness=effectiveness
                 )
                 
-                print(f"AUTO MAINTENANCE: 📝 Recorded maintenance result: {work_order.component_id} {action.action_type} {'✅' if action.success else '❌'}")
+                logger.info("AUTO MAINTENANCE: 📝 Recorded maintenance result: %s %s %s", work_order.component_id, action.action_type, '✅' if action.success else '❌')
         
         if success:
-            print(f"AUTO MAINTENANCE: Successfully executed {work_order.work_order_id} on {work_order.component_id}")
+            logger.info("AUTO MAINTENANCE: Successfully executed %s on %s", work_order.work_order_id, work_order.component_id)
         else:
-            print(f"AUTO MAINTENANCE: Failed to execute {work_order.work_order_id} on {work_order.component_id}")
+            logger.warning("AUTO MAINTENANCE: Failed to execute %s on %s", work_order.work_order_id, work_order.component_id)
         
         self.work_orders_executed += 1
         return success
@@ -589,14 +600,14 @@ class AutoMaintenanceSystem:
         if work_order and hasattr(work_order, 'metadata') and work_order.metadata:
             extracted_component_id = work_order.metadata.get('extracted_component_id')
             if extracted_component_id:
-                print(f"AUTO MAINTENANCE: 🔧 Using extracted component_id={extracted_component_id} for {action_type}")
+                logger.info("AUTO MAINTENANCE: 🔧 Using extracted component_id=%s for %s", extracted_component_id, action_type)
         
         # Check if component has perform_maintenance method
         if hasattr(component, 'perform_maintenance'):
             try:
                 # Determine how to call the maintenance method based on component type
                 component_class_name = component.__class__.__name__
-                print(f"AUTO MAINTENANCE: Attempting {action_type} on {component_class_name}")
+                logger.info("AUTO MAINTENANCE: Attempting %s on %s", action_type, component_class_name)
                 
                 # Prepare maintenance kwargs
                 maintenance_kwargs = {'maintenance_type': action_type}
@@ -604,7 +615,7 @@ class AutoMaintenanceSystem:
                 # CRITICAL FIX: Add component_id for bearing replacement
                 if extracted_component_id and action_type == "bearing_replacement":
                     maintenance_kwargs['component_id'] = extracted_component_id
-                    print(f"AUTO MAINTENANCE: 🔧 Passing component_id={extracted_component_id} to bearing_replacement")
+                    logger.info("AUTO MAINTENANCE: 🔧 Passing component_id=%s to bearing_replacement", extracted_component_id)
                 
                 if component_class_name == "FeedwaterPumpSystem":
                     # For pump systems, we need to determine which pump to maintain
@@ -618,14 +629,14 @@ class AutoMaintenanceSystem:
                     
                 elif hasattr(component, 'config') and hasattr(component.config, 'system_id'):
                     # For lubrication systems or other systems with system_id
-                    print(f"AUTO MAINTENANCE: Calling perform_maintenance on {component.config.system_id}")
+                    logger.info("AUTO MAINTENANCE: Calling perform_maintenance on %s", component.config.system_id)
                     result = component.perform_maintenance(**maintenance_kwargs)
                     
                 else:
                     # Standard maintenance method call
                     result = component.perform_maintenance(**maintenance_kwargs)
                 
-                print(f"AUTO MAINTENANCE: Maintenance result type: {type(result)}, content: {result}")
+                logger.info("AUTO MAINTENANCE: Maintenance result type: %s, content: %s", type(result), result)
                 
                 # Convert result to MaintenanceResult if needed
                 if isinstance(result, dict):
@@ -637,10 +648,10 @@ class AutoMaintenanceSystem:
                         recommendations=result.get('recommendations', []),
                         effectiveness_score=result.get('effectiveness_score', 1.0)
                     )
-                    print(f"AUTO MAINTENANCE: Converted to MaintenanceResult: success={maintenance_result.success}")
+                    logger.info("AUTO MAINTENANCE: Converted to MaintenanceResult: success=%s", maintenance_result.success)
                     return maintenance_result
                 elif isinstance(result, MaintenanceResult):
-                    print(f"AUTO MAINTENANCE: Already MaintenanceResult: success={result.success}")
+                    logger.info("AUTO MAINTENANCE: Already MaintenanceResult: success=%s", result.success)
                     return result
                 else:
                     # Assume success if method returns anything else
@@ -649,13 +660,12 @@ class AutoMaintenanceSystem:
                         duration_hours=1.0,
                         work_performed=f"Performed {action_type} on {component.__class__.__name__}"
                     )
-                    print(f"AUTO MAINTENANCE: Created default MaintenanceResult: success={maintenance_result.success}")
+                    logger.info("AUTO MAINTENANCE: Created default MaintenanceResult: success=%s", maintenance_result.success)
                     return maintenance_result
                     
             except Exception as e:
-                print(f"AUTO MAINTENANCE: Exception during maintenance on {component.__class__.__name__}: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.error("AUTO MAINTENANCE: Exception during maintenance on %s: %s",
+                             component.__class__.__name__, e, exc_info=True)
                 return MaintenanceResult(
                     success=False,
                     duration_hours=0.5,
@@ -664,7 +674,7 @@ class AutoMaintenanceSystem:
                 )
         else:
             # Component doesn't support maintenance
-            print(f"AUTO MAINTENANCE: Component {component.__class__.__name__} does not have perform_maintenance method")
+            logger.info("AUTO MAINTENANCE: Component %s does not have perform_maintenance method", component.__class__.__name__)
             return MaintenanceResult(
                 success=False,
                 duration_hours=0.0,
@@ -724,17 +734,17 @@ class AutoMaintenanceSystem:
     def enable_auto_execution(self):
         """Enable automatic work order execution"""
         self.auto_execute_maintenance = True
-        print("AUTO MAINTENANCE: Automatic execution enabled")
+        logger.info("AUTO MAINTENANCE: Automatic execution enabled")
     
     def disable_auto_execution(self):
         """Disable automatic work order execution"""
         self.auto_execute_maintenance = False
-        print("AUTO MAINTENANCE: Automatic execution disabled")
+        logger.info("AUTO MAINTENANCE: Automatic execution disabled")
     
     def set_check_interval(self, hours: float):
         """Set how often to check for maintenance needs"""
         self.check_interval_hours = max(0.1, hours)  # Minimum 6 minutes
-        print(f"AUTO MAINTENANCE: Check interval set to {self.check_interval_hours} hours")
+        logger.info("AUTO MAINTENANCE: Check interval set to %s hours", self.check_interval_hours)
     
     def reset(self):
         """PHASE 3: Reset the automatic maintenance system completely - no more event bus!"""
@@ -761,7 +771,7 @@ class AutoMaintenanceSystem:
         # Clear state manager reference
         self.state_manager = None
         
-        print("AUTO MAINTENANCE: ✅ PHASE 3: Complete system reset - event bus removed")
+        logger.info("AUTO MAINTENANCE: ✅ PHASE 3: Complete system reset - event bus removed")
     
     def _get_or_load_maintenance_config(self, state_manager, aggressive_mode: bool = False):
         """
@@ -776,12 +786,12 @@ class AutoMaintenanceSystem:
         """
         # If we have an explicitly set config, use it
         if hasattr(self, '_explicit_maintenance_config'):
-            print(f"AUTO MAINTENANCE: ✅ Using explicit maintenance configuration")
+            logger.info("AUTO MAINTENANCE: ✅ Using explicit maintenance configuration")
             return self._explicit_maintenance_config
         
         # If config was already loaded, reuse it
         if hasattr(self, '_loaded_maintenance_config') and self._loaded_maintenance_config:
-            print(f"AUTO MAINTENANCE: ✅ Using cached maintenance configuration")
+            logger.info("AUTO MAINTENANCE: ✅ Using cached maintenance configuration")
             return self._loaded_maintenance_config
         
         # Load config from available sources with PRIORITY ORDER
@@ -789,34 +799,34 @@ class AutoMaintenanceSystem:
         config_source = None
         config_source_name = "unknown"
         
-        print(f"AUTO MAINTENANCE: 🔍 Searching for maintenance configuration...")
+        logger.info("AUTO MAINTENANCE: 🔍 Searching for maintenance configuration...")
         
         # PRIORITY 1: Check for comprehensive config in state_manager.config (highest priority)
         if hasattr(state_manager, 'config') and state_manager.config:
             config_source = state_manager.config
             config_source_name = "state_manager.config"
-            print(f"AUTO MAINTENANCE: 📋 Found config source: {config_source_name}")
+            logger.info("AUTO MAINTENANCE: 📋 Found config source: %s", config_source_name)
         # PRIORITY 2: Check secondary_config passed from simulator
         elif hasattr(self, 'secondary_config') and self.secondary_config:
             config_source = self.secondary_config
             config_source_name = "secondary_config"
-            print(f"AUTO MAINTENANCE: 📋 Found config source: {config_source_name}")
+            logger.info("AUTO MAINTENANCE: 📋 Found config source: %s", config_source_name)
         # PRIORITY 3: Check simulator's secondary physics config
         elif hasattr(state_manager, 'simulator') and hasattr(state_manager.simulator, 'secondary_physics') and hasattr(state_manager.simulator.secondary_physics, 'config'):
             config_source = state_manager.simulator.secondary_physics.config
             config_source_name = "simulator.secondary_physics.config"
-            print(f"AUTO MAINTENANCE: 📋 Found config source: {config_source_name}")
+            logger.info("AUTO MAINTENANCE: 📋 Found config source: %s", config_source_name)
         
         if config_source:
-            print(f"AUTO MAINTENANCE: 🔧 Processing config from {config_source_name}")
+            logger.info("AUTO MAINTENANCE: 🔧 Processing config from %s", config_source_name)
             
             # CRITICAL FIX: Check for maintenance_system.component_configs FIRST (comprehensive composer format)
             if isinstance(config_source, dict) and 'maintenance_system' in config_source:
                 maintenance_system = config_source['maintenance_system']
-                print(f"AUTO MAINTENANCE: 🎯 Found maintenance_system section with keys: {list(maintenance_system.keys())}")
+                logger.info("AUTO MAINTENANCE: 🎯 Found maintenance_system section with keys: %s", list(maintenance_system.keys()))
                 
                 if 'component_configs' in maintenance_system:
-                    print(f"AUTO MAINTENANCE: ✅ Found component_configs in maintenance_system - using comprehensive config!")
+                    logger.info("AUTO MAINTENANCE: ✅ Found component_configs in maintenance_system - using comprehensive config!")
                     
                     # Create a temporary config object with the right structure for the YAML loader
                     temp_config = type('TempConfig', (), {})()
@@ -828,28 +838,28 @@ class AutoMaintenanceSystem:
                     temp_config.maintenance_work_order_cooldown_hours = maintenance_system.get('maintenance_work_order_cooldown_hours', 24.0)
                     
                     maintenance_config = self._create_maintenance_config_from_yaml(temp_config)
-                    print(f"AUTO MAINTENANCE: ✅ Successfully loaded comprehensive maintenance config from {config_source_name}")
+                    logger.info("AUTO MAINTENANCE: ✅ Successfully loaded comprehensive maintenance config from %s", config_source_name)
                     
                     # CRITICAL DEBUG: Show detailed threshold information
                     component_configs = maintenance_system['component_configs']
                     for subsystem, config_data in component_configs.items():
                         thresholds = config_data.get('thresholds', {})
-                        print(f"  📊 {subsystem}: {len(thresholds)} thresholds, {config_data.get('check_interval_hours', 'unknown')}h interval")
+                        logger.info("  📊 %s: %s thresholds, %sh interval", subsystem, len(thresholds), config_data.get('check_interval_hours', 'unknown'))
                         
                         # Show specific oil_level threshold for debugging
                         if 'oil_level' in thresholds:
                             oil_threshold = thresholds['oil_level']
-                            print(f"    🛢️ oil_level: {oil_threshold.get('threshold', 'unknown')}% {oil_threshold.get('comparison', 'unknown')} -> {oil_threshold.get('action', 'unknown')}")
+                            logger.info("    🛢️ oil_level: %s%% %s -> %s", oil_threshold.get('threshold', 'unknown'), oil_threshold.get('comparison', 'unknown'), oil_threshold.get('action', 'unknown'))
                 else:
-                    print(f"AUTO MAINTENANCE: ⚠️ maintenance_system found but no component_configs")
+                    logger.warning("AUTO MAINTENANCE: ⚠️ maintenance_system found but no component_configs")
             
             # FALLBACK: Check for maintenance.component_configs (alternative format)
             elif isinstance(config_source, dict) and 'maintenance' in config_source:
                 maintenance_section = config_source['maintenance']
-                print(f"AUTO MAINTENANCE: 🔍 Found maintenance section with keys: {list(maintenance_section.keys())}")
+                logger.info("AUTO MAINTENANCE: 🔍 Found maintenance section with keys: %s", list(maintenance_section.keys()))
                 
                 if 'component_configs' in maintenance_section:
-                    print(f"AUTO MAINTENANCE: ✅ Found component_configs in maintenance section")
+                    logger.info("AUTO MAINTENANCE: ✅ Found component_configs in maintenance section")
                     
                     temp_config = type('TempConfig', (), {})()
                     temp_config.maintenance_component_configs = maintenance_section['component_configs']
@@ -860,44 +870,44 @@ class AutoMaintenanceSystem:
                     temp_config.maintenance_work_order_cooldown_hours = maintenance_section.get('maintenance_work_order_cooldown_hours', 24.0)
                     
                     maintenance_config = self._create_maintenance_config_from_yaml(temp_config)
-                    print(f"AUTO MAINTENANCE: ✅ Loaded config from maintenance section")
+                    logger.info("AUTO MAINTENANCE: ✅ Loaded config from maintenance section")
                 else:
-                    print(f"AUTO MAINTENANCE: ⚠️ maintenance section found but no component_configs")
+                    logger.warning("AUTO MAINTENANCE: ⚠️ maintenance section found but no component_configs")
             
             # FALLBACK: Check for old format maintenance_component_configs
             elif hasattr(config_source, 'maintenance_component_configs') and config_source.maintenance_component_configs:
-                print(f"AUTO MAINTENANCE: 🔍 Found old format maintenance_component_configs")
+                logger.info("AUTO MAINTENANCE: 🔍 Found old format maintenance_component_configs")
                 maintenance_config = self._create_maintenance_config_from_yaml(config_source)
-                print(f"AUTO MAINTENANCE: ✅ Loaded config from maintenance_component_configs (old format)")
+                logger.info("AUTO MAINTENANCE: ✅ Loaded config from maintenance_component_configs (old format)")
             
             # FALLBACK: Check for aggressive mode indicators
             elif hasattr(config_source, 'maintenance_ultra_aggressive_mode') and config_source.maintenance_ultra_aggressive_mode:
                 maintenance_config = MaintenanceConfigFactory.create_ultra_aggressive()
-                print(f"AUTO MAINTENANCE: ✅ Loaded ultra-aggressive factory config")
+                logger.info("AUTO MAINTENANCE: ✅ Loaded ultra-aggressive factory config")
             else:
-                print(f"AUTO MAINTENANCE: ⚠️ Config source found but no recognized maintenance configuration format")
+                logger.warning("AUTO MAINTENANCE: ⚠️ Config source found but no recognized maintenance configuration format")
         else:
-            print(f"AUTO MAINTENANCE: ⚠️ No config source found")
+            logger.warning("AUTO MAINTENANCE: ⚠️ No config source found")
         
         # CRITICAL FIX: Fallback to factory defaults if no YAML config found
         if maintenance_config is None:
-            print(f"AUTO MAINTENANCE: 🔄 No comprehensive config found, using factory defaults")
+            logger.info("AUTO MAINTENANCE: 🔄 No comprehensive config found, using factory defaults")
             if aggressive_mode:
                 maintenance_config = MaintenanceConfigFactory.create_aggressive()
-                print(f"AUTO MAINTENANCE: ⚠️ Using aggressive factory config (fallback)")
+                logger.warning("AUTO MAINTENANCE: ⚠️ Using aggressive factory config (fallback)")
             else:
                 maintenance_config = MaintenanceConfigFactory.create_conservative()
-                print(f"AUTO MAINTENANCE: ⚠️ Using conservative factory config (fallback)")
+                logger.warning("AUTO MAINTENANCE: ⚠️ Using conservative factory config (fallback)")
         
         # Cache the loaded config for reuse
         self._loaded_maintenance_config = maintenance_config
         
         # CRITICAL DEBUG: Show final configuration summary
-        print(f"AUTO MAINTENANCE: 📊 Final configuration summary:")
-        print(f"  Mode: {maintenance_config.mode}")
-        print(f"  Equipment types: {len(maintenance_config.component_types)}")
+        logger.info("AUTO MAINTENANCE: 📊 Final configuration summary:")
+        logger.info("  Mode: %s", maintenance_config.mode)
+        logger.info("  Equipment types: %s", len(maintenance_config.component_types))
         for equipment_type, config in maintenance_config.component_types.items():
-            print(f"    {equipment_type}: {len(config.thresholds)} thresholds, {config.check_interval_hours}h interval")
+            logger.info("    %s: %s thresholds, %sh interval", equipment_type, len(config.thresholds), config.check_interval_hours)
         
         return maintenance_config
     
@@ -925,7 +935,7 @@ class AutoMaintenanceSystem:
         else:
             self._explicit_maintenance_config = maintenance_config
         
-        print(f"AUTO MAINTENANCE: ✅ Applied explicit maintenance configuration")
+        logger.info("AUTO MAINTENANCE: ✅ Applied explicit maintenance configuration")
         return self._explicit_maintenance_config
     
     def apply_explicit_config_override(self, config):
@@ -938,7 +948,7 @@ class AutoMaintenanceSystem:
         Args:
             config: Configuration dict containing maintenance_system section
         """
-        print(f"AUTO MAINTENANCE: 🔧 Applying post-discovery config override")
+        logger.info("AUTO MAINTENANCE: 🔧 Applying post-discovery config override")
         
         # Create explicit maintenance config from the provided config
         if isinstance(config, dict):
@@ -968,8 +978,7 @@ class AutoMaintenanceSystem:
         for component_id, component_info in self.event_bus.components.items():
             try:
                 # Get component metadata to determine equipment type
-                from simulator.state.component_metadata import ComponentRegistry
-                component_metadata = ComponentRegistry.get_component(component_id)
+                component_metadata = self.state_manager.context.component_registry.get_component(component_id)
                 
                 if not component_metadata:
                     continue
@@ -999,25 +1008,25 @@ class AutoMaintenanceSystem:
                             self.event_bus.update_component_monitoring(component_id, new_monitoring_config)
                             components_updated += 1
                             
-                            print(f"AUTO MAINTENANCE: ✅ Updated {component_id} ({equipment_type}) with {len(new_monitoring_config)} explicit thresholds")
+                            logger.info("AUTO MAINTENANCE: ✅ Updated %s (%s) with %s explicit thresholds", component_id, equipment_type, len(new_monitoring_config))
                         else:
-                            print(f"AUTO MAINTENANCE: ⚠️ No monitoring config generated for {component_id}")
+                            logger.warning("AUTO MAINTENANCE: ⚠️ No monitoring config generated for %s", component_id)
                     else:
-                        print(f"AUTO MAINTENANCE: ⚠️ Component {component_id} has no get_state_dict method")
+                        logger.warning("AUTO MAINTENANCE: ⚠️ Component %s has no get_state_dict method", component_id)
                         
             except Exception as e:
-                print(f"AUTO MAINTENANCE: ❌ Failed to update {component_id}: {e}")
+                logger.warning("AUTO MAINTENANCE: ❌ Failed to update %s: %s", component_id, e)
                 continue
         
         # Store the explicit config for future reference
         self._explicit_maintenance_config = explicit_config
         self._loaded_maintenance_config = explicit_config
         
-        print(f"AUTO MAINTENANCE: ✅ Post-discovery override complete - updated {components_updated} components")
+        logger.info("AUTO MAINTENANCE: ✅ Post-discovery override complete - updated %s components", components_updated)
         
         # Show final configuration status
         for equipment_type, config in explicit_config.component_types.items():
-            print(f"AUTO MAINTENANCE: 📋 {equipment_type}: {len(config.thresholds)} thresholds, {config.check_interval_hours}h interval")
+            logger.info("AUTO MAINTENANCE: 📋 %s: %s thresholds, %sh interval", equipment_type, len(config.thresholds), config.check_interval_hours)
         
         return explicit_config
     
@@ -1034,7 +1043,7 @@ class AutoMaintenanceSystem:
         if hasattr(self, '_subsystem_config_loaded'):
             delattr(self, '_subsystem_config_loaded')
         
-        print(f"AUTO MAINTENANCE: ✅ Reset maintenance configuration state")
+        logger.info("AUTO MAINTENANCE: ✅ Reset maintenance configuration state")
     
     def _create_maintenance_config_from_yaml(self, yaml_config):
         """
@@ -1045,7 +1054,7 @@ class AutoMaintenanceSystem:
         """
         from .config import MaintenanceConfig, MaintenanceMode, ComponentTypeConfig, ComponentThresholds
         
-        print(f"AUTO MAINTENANCE: 🔧 Creating maintenance config from YAML")
+        logger.info("AUTO MAINTENANCE: 🔧 Creating maintenance config from YAML")
         
         # Create base maintenance config
         maintenance_config = MaintenanceConfig()
@@ -1063,7 +1072,7 @@ class AutoMaintenanceSystem:
                 maintenance_config.mode = MaintenanceMode.CONSERVATIVE
             else:
                 maintenance_config.mode = MaintenanceMode.CUSTOM
-            print(f"AUTO MAINTENANCE: 📋 Set maintenance mode to {maintenance_config.mode}")
+            logger.info("AUTO MAINTENANCE: 📋 Set maintenance mode to %s", maintenance_config.mode)
         
         # CRITICAL FIX: Map subsystem names to equipment type names
         subsystem_to_equipment_mapping = {
@@ -1076,45 +1085,45 @@ class AutoMaintenanceSystem:
         # Load component-specific configurations from new subsystem-specific format
         if hasattr(yaml_config, 'maintenance_component_configs'):
             component_configs = yaml_config.maintenance_component_configs
-            print(f"AUTO MAINTENANCE: 📊 Processing {len(component_configs)} subsystem configs")
+            logger.info("AUTO MAINTENANCE: 📊 Processing %s subsystem configs", len(component_configs))
             
             for subsystem_name, config_data in component_configs.items():
-                print(f"AUTO MAINTENANCE: 🔍 Processing subsystem: {subsystem_name}")
-                print(f"AUTO MAINTENANCE: 📋 Config data keys: {list(config_data.keys())}")
+                logger.info("AUTO MAINTENANCE: 🔍 Processing subsystem: %s", subsystem_name)
+                logger.info("AUTO MAINTENANCE: 📋 Config data keys: %s", list(config_data.keys()))
                 
                 # Map subsystem name to equipment type name
                 equipment_type_name = subsystem_to_equipment_mapping.get(subsystem_name, subsystem_name)
-                print(f"AUTO MAINTENANCE: 🔄 Mapping {subsystem_name} -> {equipment_type_name}")
+                logger.info("AUTO MAINTENANCE: 🔄 Mapping %s -> %s", subsystem_name, equipment_type_name)
                 
                 # Create component type configuration
                 component_config = ComponentTypeConfig()
                 
                 # Set check interval directly from config (already calculated by ComprehensiveComposer)
                 component_config.check_interval_hours = config_data.get('check_interval_hours', 4.0)
-                print(f"AUTO MAINTENANCE: ⏰ Set check interval: {component_config.check_interval_hours}h")
+                logger.info("AUTO MAINTENANCE: ⏰ Set check interval: %sh", component_config.check_interval_hours)
                 
                 # CRITICAL FIX: Load thresholds directly (already calculated by ComprehensiveComposer)
                 if 'thresholds' in config_data:
                     thresholds = config_data['thresholds']
-                    print(f"AUTO MAINTENANCE: 🎯 {subsystem_name} has {len(thresholds)} thresholds in config_data")
+                    logger.info("AUTO MAINTENANCE: 🎯 %s has %s thresholds in config_data", subsystem_name, len(thresholds))
                     
                     thresholds_added = 0
                     for param_name, threshold_data in thresholds.items():
-                        print(f"AUTO MAINTENANCE: 🔧 Processing threshold {param_name}: {threshold_data}")
+                        logger.info("AUTO MAINTENANCE: 🔧 Processing threshold %s: %s", param_name, threshold_data)
                         
                         # CRITICAL FIX: Validate threshold data structure
                         if not isinstance(threshold_data, dict):
-                            print(f"AUTO MAINTENANCE: ❌ Invalid threshold data for {param_name}: {type(threshold_data)}")
+                            logger.warning("AUTO MAINTENANCE: ❌ Invalid threshold data for %s: %s", param_name, type(threshold_data))
                             continue
                             
                         # Skip thresholds without actions defined
                         if 'action' not in threshold_data:
-                            print(f"AUTO MAINTENANCE: ⚠️ Skipping {param_name} - no action defined")
+                            logger.warning("AUTO MAINTENANCE: ⚠️ Skipping %s - no action defined", param_name)
                             continue
                             
                         # CRITICAL FIX: Validate required threshold fields
                         if 'threshold' not in threshold_data:
-                            print(f"AUTO MAINTENANCE: ❌ Skipping {param_name} - no threshold value defined")
+                            logger.warning("AUTO MAINTENANCE: ❌ Skipping %s - no threshold value defined", param_name)
                             continue
                             
                         # Use thresholds directly (no multiplier calculations needed)
@@ -1129,35 +1138,35 @@ class AutoMaintenanceSystem:
                             
                             component_config.thresholds[param_name] = threshold_config
                             thresholds_added += 1
-                            print(f"AUTO MAINTENANCE: ✅ Added threshold {param_name}: {threshold_config.threshold} {threshold_config.comparison} -> {threshold_config.action}")
+                            logger.info("AUTO MAINTENANCE: ✅ Added threshold %s: %s %s -> %s", param_name, threshold_config.threshold, threshold_config.comparison, threshold_config.action)
                             
                         except Exception as e:
-                            print(f"AUTO MAINTENANCE: ❌ Failed to create threshold {param_name}: {e}")
+                            logger.warning("AUTO MAINTENANCE: ❌ Failed to create threshold %s: %s", param_name, e)
                             continue
                 else:
-                    print(f"AUTO MAINTENANCE: ⚠️ {subsystem_name} has no 'thresholds' key in config_data")
+                    logger.warning("AUTO MAINTENANCE: ⚠️ %s has no 'thresholds' key in config_data", subsystem_name)
                 
                 # CRITICAL FIX: Only store component config if it has thresholds
                 if len(component_config.thresholds) > 0:
                     # Store in maintenance config using equipment type name
                     maintenance_config.component_types[equipment_type_name] = component_config
-                    print(f"AUTO MAINTENANCE: ✅ Stored {subsystem_name} -> {equipment_type_name} with {len(component_config.thresholds)} thresholds")
+                    logger.info("AUTO MAINTENANCE: ✅ Stored %s -> %s with %s thresholds", subsystem_name, equipment_type_name, len(component_config.thresholds))
                 else:
-                    print(f"AUTO MAINTENANCE: ⚠️ Skipping {subsystem_name} -> {equipment_type_name} - no valid thresholds")
+                    logger.warning("AUTO MAINTENANCE: ⚠️ Skipping %s -> %s - no valid thresholds", subsystem_name, equipment_type_name)
         else:
-            print(f"AUTO MAINTENANCE: ❌ No maintenance_component_configs found in YAML config")
+            logger.warning("AUTO MAINTENANCE: ❌ No maintenance_component_configs found in YAML config")
         
-        print(f"AUTO MAINTENANCE: 📊 Final config has {len(maintenance_config.component_types)} equipment types")
+        logger.info("AUTO MAINTENANCE: 📊 Final config has %s equipment types", len(maintenance_config.component_types))
         
         # CRITICAL FIX: Enhanced debug output for verification
         for equipment_type, config in maintenance_config.component_types.items():
-            print(f"AUTO MAINTENANCE: 📋 {equipment_type}:")
-            print(f"  ⏰ Check interval: {config.check_interval_hours}h")
-            print(f"  🎯 Thresholds: {len(config.thresholds)}")
+            logger.info("AUTO MAINTENANCE: 📋 %s:", equipment_type)
+            logger.info("  ⏰ Check interval: %sh", config.check_interval_hours)
+            logger.info("  🎯 Thresholds: %s", len(config.thresholds))
             
             # Show specific thresholds for debugging
             for param_name, threshold in config.thresholds.items():
-                print(f"    - {param_name}: {threshold.threshold} ({threshold.comparison}) -> {threshold.action} (cooldown: {threshold.cooldown_hours}h, priority: {threshold.priority})")
+                logger.info("    - %s: %s (%s) -> %s (cooldown: %sh, priority: %s)", param_name, threshold.threshold, threshold.comparison, threshold.action, threshold.cooldown_hours, threshold.priority)
         
         return maintenance_config
 
@@ -142,10 +142,7 @@ class ComponentMaintenanceRegistry:
         self.components.clear()
 
 
-# Global registry instance
-_component_registry = ComponentMaintenanceRegistry()
-
-
 def get_component_registry() -> ComponentMaintenanceRegistry:
-    """Get the global component registry"""
-    return _component_registry
+    """Get the component registry of the active simulation context"""
+    from simulator.state.simulation_context import current_context
+    return current_context().maintenance_registry
@@ -18,6 +18,11 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Callable
 import time
 
+from simulator.sim_logging import get_logger
+from simulator.state.simulation_context import SimulationContext, current_context
+
+logger = get_logger(__name__)
+
 
 @dataclass
 class MaintenanceEvent:
@@ -53,7 +58,10 @@ class MaintenanceEventBus:
     without requiring any code changes to the components themselves.
     """
     
-    def __init__(self):
+    def __init__(self, context: Optional[SimulationContext] = None):
+        # Simulation context owning the component registry (active context by default)
+        self.context = context if context is not None else current_context()
+        
         # Event subscribers
         self.subscribers: Dict[str, List[Callable]] = defaultdict(list)
         
@@ -124,7 +132,7 @@ class MaintenanceEventBus:
                 callback(event)
                 self.events_processed += 1
             except Exception as e:
-                print(f"Error in event callback for {event_type}: {e}")
+                logger.warning("Error in event callback for %s: %s", event_type, e)
     
     def register_component(self, component_id: str, component: Any, 
                           monitoring_config: Dict[str, Dict[str, Any]]):
@@ -138,15 +146,14 @@ class MaintenanceEventBus:
         """
         # COMPREHENSIVE DUPLICATE DETECTION
         if component_id in self.components:
-            print(f"DUPLICATE PREVENTION: Component {component_id} already registered in EventBus, skipping")
+            logger.info("DUPLICATE PREVENTION: Component %s already registered in EventBus, skipping", component_id)
             return
         
-        # Check if component is registered in the global ComponentRegistry
+        # Check if component is registered in the plant's ComponentRegistry
         try:
-            from .component_registry import get_component_registry
-            component_registry = get_component_registry()
+            component_registry = self.context.maintenance_registry
             if component_id in component_registry.components:
-                print(f"DUPLICATE PREVENTION: Component {component_id} already in ComponentRegistry")
+                logger.info("DUPLICATE PREVENTION: Component %s already in ComponentRegistry", component_id)
                 # Don't return here - we still want to register in EventBus even if it's in ComponentRegistry
         except ImportError:
             pass  # ComponentRegistry not available
@@ -155,8 +162,8 @@ class MaintenanceEventBus:
         existing_monitors = [mid for mid in self.parameter_monitors.keys() 
                            if mid.startswith(f"{component_id}.")]
         if existing_monitors:
-            print(f"DUPLICATE PREVENTION: Component {component_id} has existing monitors: {existing_monitors}")
-            print(f"DUPLICATE PREVENTION: Clearing existing monitors for clean re-registration")
+            logger.info("DUPLICATE PREVENTION: Component %s has existing monitors: %s", component_id, existing_monitors)
+            logger.info("DUPLICATE PREVENTION: Clearing existing monitors for clean re-registration")
             # Remove existing monitors for clean re-registration
             for monitor_id in existing_monitors:
                 del self.parameter_monitors[monitor_id]
@@ -176,7 +183,7 @@ class MaintenanceEventBus:
             
             # Skip if monitor already exists (shouldn't happen after cleanup above)
             if monitor_id in self.parameter_monitors:
-                print(f"DUPLICATE PREVENTION: Monitor {monitor_id} already exists, skipping")
+                logger.info("DUPLICATE PREVENTION: Monitor %s already exists, skipping", monitor_id)
                 continue
             
             monitor = ParameterMonitor(
@@ -193,14 +200,13 @@ class MaintenanceEventBus:
             self.parameter_monitors[monitor_id] = monitor
             monitors_created += 1
         
-        print(f"EVENT BUS: ✅ Registered component {component_id} with {monitors_created} monitors")
+        logger.info("EVENT BUS: ✅ Registered component %s with %s monitors", component_id, monitors_created)
         
         # Also register in ComponentRegistry if available
         try:
-            from .component_registry import get_component_registry
-            component_registry = get_component_registry()
+            component_registry = self.context.maintenance_registry
             component_registry.register_component(component_id, component)
-            print(f"EVENT BUS: ✅ Also registered {component_id} in ComponentRegistry")
+            logger.info("EVENT BUS: ✅ Also registered %s in ComponentRegistry", component_id)
         except ImportError:
             pass  # ComponentRegistry not available
     
@@ -272,7 +278,7 @@ class MaintenanceEventBus:
                 monitor.last_value = current_value
                 
             except Exception as e:
-                print(f"Error checking monitor {monitor_id}: {e}")
+                logger.warning("Error checking monitor %s: %s", monitor_id, e)
     
     def _get_parameter_value(self, component: Any, attribute_path: str) -> Optional[float]:
         """
@@ -434,7 +440,7 @@ class MaintenanceEventBus:
             new_monitoring_config: New monitoring configuration
         """
         if component_id not in self.components:
-            print(f"EVENT BUS: ⚠️ Component {component_id} not found for monitoring update")
+            logger.warning("EVENT BUS: ⚠️ Component %s not found for monitoring update", component_id)
             return
         
         # Remove existing monitors for this component
@@ -465,7 +471,7 @@ class MaintenanceEventBus:
         # Update metadata
         self.component_metadata[component_id]['monitoring_config'] = new_monitoring_config
         
-        print(f"EVENT BUS: ✅ Updated {component_id} monitoring with {monitors_created} new monitors")
+        logger.info("EVENT BUS: ✅ Updated %s monitoring with %s new monitors", component_id, monitors_created)
     
     def clear_event_history(self):
         """Clear event history"""
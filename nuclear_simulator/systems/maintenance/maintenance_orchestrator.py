@@ -58,8 +58,6 @@ class MaintenanceOrchestrator:
     overlap by intelligently selecting optimal maintenance actions.
     """
     
-    _instance = None
-    
     def __init__(self):
         """Initialize the maintenance orchestrator"""
         self.hierarchy_configs = self._load_component_hierarchies()
@@ -73,10 +71,9 @@ class MaintenanceOrchestrator:
     
     @classmethod
     def get_instance(cls) -> 'MaintenanceOrchestrator':
-        """Get singleton instance of the orchestrator"""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        """Get the orchestrator of the active simulation context"""
+        from simulator.state.simulation_context import current_context
+        return current_context().maintenance_orchestrator
     
     def orchestrate_maintenance(self, component=None, violations: List[Dict] = None, 
                               requested_action: str = None, component_id: str = None,
@@ -648,5 +645,5 @@ class MaintenanceOrchestrator:
 
 # Convenience function for easy access
 def get_maintenance_orchestrator() -> MaintenanceOrchestrator:
-    """Get the global maintenance orchestrator instance"""
+    """Get the maintenance orchestrator of the active simulation context"""
     return MaintenanceOrchestrator.get_instance()
@@ -17,6 +17,10 @@ from enum import Enum
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
+from simulator.sim_logging import get_logger
+
+logger = get_logger(__name__)
+
 
 class WorkOrderType(Enum):
     """Types of maintenance work orders"""
@@ -280,7 +284,7 @@ class WorkOrderManager:
         
         # Double-check for duplicates before storing
         if wo_id in self.work_orders:
-            print(f"WORK ORDER MANAGER: ERROR - Duplicate work order ID {wo_id} detected!")
+            logger.error("WORK ORDER MANAGER: ERROR - Duplicate work order ID %s detected!", wo_id)
             # Generate a new ID with timestamp suffix
             import time
             timestamp_suffix = int(time.time() * 1000) % 10000  # Last 4 digits of timestamp
@@ -309,13 +313,13 @@ class WorkOrderManager:
             self.work_order_counter += 1
             
             if attempt > 0:  # Log after first collision
-                print(f"WORK ORDER MANAGER: ID collision detected for {wo_id}, trying next ID")
+                logger.warning("WORK ORDER MANAGER: ID collision detected for %s, trying next ID", wo_id)
         
         # Fallback: Use timestamp-based ID if we can't find a unique counter-based ID
         import time
         timestamp = int(time.time() * 1000)  # Millisecond timestamp
         fallback_id = f"WO-TS-{timestamp}"
-        print(f"WORK ORDER MANAGER: Using timestamp-based fallback ID: {fallback_id}")
+        logger.info("WORK ORDER MANAGER: Using timestamp-based fallback ID: %s", fallback_id)
         return fallback_id
     
     def get_work_order(self, work_order_id: str) -> Optional[WorkOrder]:
@@ -378,4 +382,4 @@ class WorkOrderManager:
         # Don't reset the counter or ID tracking to prevent duplicates across resets
         # self.work_order_counter = 1  # Keep incrementing from where we left off
         # self.all_created_ids.clear()  # Keep tracking all IDs ever created
-        print(f"WORK ORDER MANAGER: Reset complete. Next work order will be WO-{self.work_order_counter:06d}")
+        logger.info("WORK ORDER MANAGER: Reset complete. Next work order will be WO-%06d", self.work_order_counter)
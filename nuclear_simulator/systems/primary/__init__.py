@@ -20,6 +20,7 @@ import numpy as np
 
 # Import state management interfaces
 from simulator.state import auto_register 
+from simulator.core.step_result import StepResult, StepResultLog
 from .component_descriptions import PRIMARY_SYSTEM_DESCRIPTIONS
 
 warnings.filterwarnings("ignore")
@@ -85,15 +86,19 @@ class ReactorState:
     feedwater_pump_power: float = 10.0  # MW total power consumption
     feedwater_num_running_pumps: int = 3  # Number of running pumps
 
-    # Fission product poisons - start deeply subcritical
-    xenon_concentration: float = 2.8e15  # atoms/cm³
-    iodine_concentration: float = 1.5e16  # atoms/cm³
-    samarium_concentration: float = 1.0e15  # atoms/cm³
+    # Fission product poisons - start deeply subcritical (multiples of the
+    # full-power equilibrium of ReactivityModel.equilibrium_fission_products)
+    xenon_concentration: float = 7.4e4  # atoms/cm³ (2.8x equilibrium)
+    iodine_concentration: float = 2.2e4  # atoms/cm³ (1x equilibrium)
+    samarium_concentration: float = 6.7e5  # atoms/cm³ (2x equilibrium)
 
     # Burnable poisons and fuel depletion
     burnable_poison_worth: float = 0.0  # pcm
     fuel_burnup: float = 15000.0  # MWd/MTU
 
+    # Core reactivity bias: the imbalance boron cannot cancel (see create_equilibrium_state)
+    reactivity_bias: float = 0.0  # pcm
+
     # Safety parameters
     power_level: float = 100.0  # % rated power
     scram_status: bool = False
@@ -106,12 +111,16 @@ class ReactorState:
             )
 
 
+# The ensemble builds on ReactorState and ControlAction defined above
+from .ensemble import PrimaryReactorEnsemble
+
 __all__ = [
     'NeutronicsModel',
     'ThermalHydraulicsModel',
     'ScramSystem',
     'ReactorHeatSource',
     'PrimaryReactorPhysics',
+    'PrimaryReactorEnsemble',
     'ReactorState',
     'ControlAction'
 ]
@@ -175,6 +184,9 @@ class PrimaryReactorPhysics:
         self.max_valve_speed = 10.0  # %/s
         self.max_flow_change_rate = 1000.0  # kg/s/s
         
+        # Results handed out since the last update (their lazy states expire on the next one)
+        self._step_results = StepResultLog()
+        
     def update_system(self,
                      control_inputs: dict,
                      dt: float) -> dict:
@@ -191,11 +203,13 @@ class PrimaryReactorPhysics:
                 - 'boron_magnitude': Boron action magnitude (0-1)
                 - 'steam_valve_action': Steam valve action (ControlAction enum)
                 - 'steam_valve_magnitude': Steam valve action magnitude (0-1)
-            dt: Time step (s)
+            dt: Plant time step (minutes)
             
         Returns:
             Dictionary with complete primary system state and performance
         """
+        self._step_results.expire()
+        
         # Extract control inputs and apply actions
         self._apply_control_actions(control_inputs, dt)
         
@@ -242,7 +256,7 @@ class PrimaryReactorPhysics:
         self.scram_activated = self.scram_system.check_safety_systems(self.state)
         
         # Compile complete system results
-        system_result = {
+        system_result = StepResult({
             # Overall system performance
             'thermal_power_mw': self.thermal_power_mw,
             'power_level_percent': self.state.power_level,
@@ -251,7 +265,6 @@ class PrimaryReactorPhysics:
             
             # Neutronics performance
             'neutron_flux': self.state.neutron_flux,
-            'delayed_neutron_precursors': self.state.delayed_neutron_precursors.copy(),
             'xenon_concentration': self.state.xenon_concentration,
             'iodine_concentration': self.state.iodine_concentration,
             'samarium_concentration': self.state.samarium_concentration,
@@ -277,13 +290,16 @@ class PrimaryReactorPhysics:
             # Safety parameters
             'scram_status': self.state.scram_status,
             'scram_activated': self.scram_activated,
+        }, lazy={
+            'delayed_neutron_precursors': self.state.delayed_neutron_precursors.copy,
             
-            # Detailed component states
-            'heat_source_state': getattr(self.heat_source, 'get_state', lambda: {})(),
-            'neutronics_state': getattr(self.neutronics, 'get_state_dict', lambda: {})(),
-            'thermal_hydraulics_state': getattr(self.thermal_hydraulics, 'get_state_dict', lambda: {})(),
-            'safety_state': getattr(self.scram_system, 'get_state_dict', lambda: {})()
-        }
+            # Detailed component states (built on first access)
+            'heat_source_state': getattr(self.heat_source, 'get_state', lambda: {}),
+            'neutronics_state': getattr(self.neutronics, 'get_state_dict', lambda: {}),
+            'thermal_hydraulics_state': getattr(self.thermal_hydraulics, 'get_state_dict', lambda: {}),
+            'safety_state': getattr(self.scram_system, 'get_state_dict', lambda: {})
+        })
+        self._step_results.append(system_result)
         return system_result
     
     def _apply_control_actions(self, control_inputs: dict, dt: float):
@@ -14,6 +14,9 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List, Optional, Tuple
 import warnings
+from simulator.sim_logging import get_logger
+
+logger = get_logger(__name__)
 
 warnings.filterwarnings("ignore")
 
@@ -264,7 +267,7 @@ class BasePump:
         self.state.trip_active = True
         self.state.trip_reason = reason
         self.state.available = False
-        print(f"PUMP TRIP: {self.pump_id} - {reason}")
+        logger.info("PUMP TRIP: %s - %s", self.pump_id, reason)
     
     def start_pump(self) -> bool:
         """Start the pump if conditions permit"""
@@ -408,7 +411,7 @@ class ReactorCoolantPump(BasePump):
         self.state.trip_active = True
         self.state.trip_reason = reason
         self.state.available = False
-        print(f"PUMP TRIP: {self.pump_id} - {reason}")
+        logger.info("PUMP TRIP: %s - %s", self.pump_id, reason)
     
     def start_pump(self) -> bool:
         """Start the pump if conditions permit"""
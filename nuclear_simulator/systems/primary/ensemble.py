@@ -0,0 +1,373 @@
+"""
+Primary Reactor Ensemble
+
+This module provides a lockstep ensemble of N independent primary systems for
+uncertainty studies and reinforcement learning.
+
+The primary state of every member is held as structure-of-arrays NumPy buffers
+(one array per ReactorState field, precursors as an (N, 6) array) and each
+update advances control actions, fission products, reactivity, point kinetics,
+thermal hydraulics and SCRAM logic for all members in one vectorized call.
+Member for member, the result matches PrimaryReactorPhysics with the default
+ReactorHeatSource stepped with the same control inputs.
+"""
+
+from dataclasses import fields
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from . import ControlAction, ReactorState
+from .reactor.physics.point_kinetics import SECONDS_PER_MINUTE, PointKineticsModel
+from .reactor.physics.thermal_hydraulics import ThermalHydraulicsModel
+from .reactor.reactivity_model import ReactivityModel, ReactorConfig
+from .reactor.safety.scram_logic import ScramSystem
+from simulator.sim_logging import get_logger
+
+logger = get_logger(__name__)
+
+# Control input keys (as used by PrimaryReactorPhysics) and their action pairs
+CONTROL_CHANNELS = {
+    'control_rod': (ControlAction.CONTROL_ROD_INSERT, ControlAction.CONTROL_ROD_WITHDRAW),
+    'coolant_flow': (ControlAction.DECREASE_COOLANT_FLOW, ControlAction.INCREASE_COOLANT_FLOW),
+    'boron': (ControlAction.DILUTE_BORON, ControlAction.BORATE_COOLANT),
+    'steam_valve': (ControlAction.CLOSE_STEAM_VALVE, ControlAction.OPEN_STEAM_VALVE),
+}
+
+ActionInput = Union[ControlAction, int, Sequence, np.ndarray, None]
+
+
+def _clip(values, lower, upper):
+    """np.clip without its per-call overhead (the ensemble clips ~20 arrays per step)"""
+    return np.minimum(np.maximum(values, lower), upper)
+
+
+def _state_dtype(value: Any):
+    if isinstance(value, bool):
+        return bool
+    if isinstance(value, int):
+        return np.int64
+    return np.float64
+
+
+class PrimaryReactorEnsemble:
+    """
+    Lockstep vectorized ensemble of N primary reactor systems
+
+    Every ReactorState field is available as an attribute holding one value
+    per member (``ensemble.neutron_flux[i]``), so the ensemble can be passed
+    wherever a ReactorState is read, e.g. ReactivityModel.calculate_total_reactivity.
+
+    Control inputs use the PrimaryReactorPhysics keys ('control_rod_action',
+    'control_rod_magnitude', ...). Each action may be a single ControlAction
+    applied to all members or one action per member (ControlAction values or
+    their integer codes); magnitudes may be scalars or per-member arrays.
+    """
+
+    STATE_FIELDS = tuple(f.name for f in fields(ReactorState))
+
+    def __init__(self,
+                 num_members: Optional[int] = None,
+                 states: Optional[Sequence[ReactorState]] = None,
+                 rated_power_mw: Union[float, Sequence[float]] = 3000.0,
+                 reactor_config: Optional[ReactorConfig] = None,
+                 kinetics_method: str = 'euler'):
+        """
+        Initialize the ensemble
+
+        Args:
+            num_members: Number of plants (each starts from ReactorState())
+            states: Initial ReactorState per member (instead of num_members)
+            rated_power_mw: Rated thermal power, scalar or per member
+            reactor_config: Reactivity model configuration shared by all members
+            kinetics_method: Point kinetics integration method (see PointKineticsModel)
+        """
+        if states is None:
+            if num_members is None or num_members < 1:
+                raise ValueError("PrimaryReactorEnsemble needs num_members >= 1 or a list of states")
+            states = [ReactorState() for _ in range(num_members)]
+        states = list(states)
+        self.num_members = len(states)
+
+        # Physics models supply the constants; the kernels below are their vectorized form
+        self.reactivity_model = ReactivityModel(reactor_config)
+        self.point_kinetics = PointKineticsModel(kinetics_method)
+        self.thermal_hydraulics = ThermalHydraulicsModel()
+        self.scram_system = ScramSystem()
+
+        self.rated_power_mw = np.broadcast_to(
+            np.asarray(rated_power_mw, dtype=np.float64), (self.num_members,)).copy()
+        self.max_control_rod_speed = 5.0  # %/s
+        self.max_valve_speed = 10.0  # %/s
+        self.max_flow_change_rate = 1000.0  # kg/s/s
+
+        template = ReactorState()
+        for name in self.STATE_FIELDS:
+            if name == 'delayed_neutron_precursors':
+                values = np.array([np.asarray(s.delayed_neutron_precursors, dtype=np.float64) for s in states])
+            else:
+                values = np.array([getattr(s, name) for s in states], dtype=_state_dtype(getattr(template, name)))
+            setattr(self, name, values)
+
+        self.thermal_power_mw = np.zeros(self.num_members)
+        self.total_reactivity_pcm = np.zeros(self.num_members)
+        self.scram_activated = np.zeros(self.num_members, dtype=bool)
+
+    @classmethod
+    def from_primary_systems(cls, systems: Sequence['PrimaryReactorPhysics']) -> 'PrimaryReactorEnsemble':
+        """
+        Build an ensemble from the current state of existing primary systems
+
+        Args:
+            systems: PrimaryReactorPhysics instances (one per member)
+
+        Returns:
+            Ensemble whose members continue from those states
+        """
+        kinetics = getattr(systems[0].heat_source, 'point_kinetics', None)
+        ensemble = cls(states=[system.state for system in systems],
+                       rated_power_mw=[system.rated_power_mw for system in systems],
+                       kinetics_method=kinetics.method if kinetics is not None else 'euler')
+        ensemble.thermal_power_mw[:] = [system.thermal_power_mw for system in systems]
+        ensemble.total_reactivity_pcm[:] = [system.total_reactivity_pcm for system in systems]
+        return ensemble
+
+    def __len__(self) -> int:
+        return self.num_members
+
+    def initialize_fission_products(self) -> None:
+        """Set every member's iodine, xenon and samarium to equilibrium at its current flux"""
+        equilibrium = self.reactivity_model.equilibrium_fission_products(self.neutron_flux)
+        self.iodine_concentration = equilibrium['iodine']
+        self.xenon_concentration = equilibrium['xenon']
+        self.samarium_concentration = equilibrium['samarium']
+
+    def update_system(self, control_inputs: Optional[Dict[str, Any]], dt: float) -> Dict[str, np.ndarray]:
+        """
+        Update every member for one time step
+
+        Args:
+            control_inputs: Control inputs (PrimaryReactorPhysics keys, scalar or per member)
+            dt: Plant time step (minutes, as passed to PrimaryReactorPhysics)
+
+        Returns:
+            Dictionary of per-member arrays (copies) with the main primary results
+        """
+        self._apply_control_actions(control_inputs or {}, dt)
+
+        reactivity, total_pcm, components = self._update_neutronics(dt)
+        self.total_reactivity_pcm = total_pcm
+        self.reactivity = total_pcm / 100000.0
+
+        self._update_thermal_hydraulics(dt)
+        self._check_for_nan_values()
+        self._check_safety_systems()
+
+        return {
+            'thermal_power_mw': self.thermal_power_mw.copy(),
+            'power_level_percent': self.power_level.copy(),
+            'total_reactivity_pcm': self.total_reactivity_pcm.copy(),
+            'reactivity_components': components,
+            'neutron_flux': self.neutron_flux.copy(),
+            'delayed_neutron_precursors': self.delayed_neutron_precursors.copy(),
+            'xenon_concentration': self.xenon_concentration.copy(),
+            'iodine_concentration': self.iodine_concentration.copy(),
+            'samarium_concentration': self.samarium_concentration.copy(),
+            'fuel_temperature': self.fuel_temperature.copy(),
+            'coolant_temperature': self.coolant_temperature.copy(),
+            'coolant_pressure': self.coolant_pressure.copy(),
+            'coolant_flow_rate': self.coolant_flow_rate.copy(),
+            'steam_temperature': self.steam_temperature.copy(),
+            'steam_pressure': self.steam_pressure.copy(),
+            'steam_flow_rate': self.steam_flow_rate.copy(),
+            'feedwater_flow_rate': self.feedwater_flow_rate.copy(),
+            'control_rod_position': self.control_rod_position.copy(),
+            'steam_valve_position': self.steam_valve_position.copy(),
+            'boron_concentration': self.boron_concentration.copy(),
+            'scram_status': self.scram_status.copy(),
+            'scram_activated': self.scram_activated.copy(),
+        }
+
+    def _action_codes(self, action: ActionInput) -> np.ndarray:
+        """Per-member ControlAction codes from a scalar or per-member action input"""
+        if action is None:
+            return np.full(self.num_members, ControlAction.NO_ACTION.value)
+        if isinstance(action, ControlAction):
+            return np.full(self.num_members, action.value)
+        if np.isscalar(action):
+            return np.full(self.num_members, int(action))
+        return np.array([a.value if isinstance(a, ControlAction) else int(a) for a in action])
+
+    def _apply_control_actions(self, control_inputs: Dict[str, Any], dt: float) -> None:
+        """Vectorized PrimaryReactorPhysics._apply_control_actions"""
+        limits = {
+            'control_rod': ('control_rod_position', self.max_control_rod_speed, 0, 100),
+            'coolant_flow': ('coolant_flow_rate', self.max_flow_change_rate, 5000, 50000),
+            'boron': ('boron_concentration', 50.0, 0, 3000),
+            'steam_valve': ('steam_valve_position', self.max_valve_speed, 0, 100),
+        }
+        for channel, (decrease, increase) in CONTROL_CHANNELS.items():
+            action = control_inputs.get(f'{channel}_action')
+            if action is None or action is ControlAction.NO_ACTION:
+                continue
+            codes = self._action_codes(action)
+            magnitude = control_inputs.get(f'{channel}_magnitude', 1.0)
+            name, rate, lower, upper = limits[channel]
+
+            values = getattr(self, name)
+            change = rate * dt * np.asarray(magnitude, dtype=np.float64)
+            lowered = np.maximum(lower, values - change)
+            raised = np.minimum(upper, values + change)
+            setattr(self, name, np.where(codes == decrease.value, lowered,
+                                         np.where(codes == increase.value, raised, values)))
+
+    def _update_neutronics(self, dt: float):
+        """Vectorized ReactorHeatSource.update: fission products, reactivity and point kinetics"""
+        flux = self.neutron_flux
+
+        # Fission product poisons (exact at the current flux over the step, in seconds)
+        (self.iodine_concentration, self.xenon_concentration,
+         self.samarium_concentration) = self.reactivity_model.propagate_fission_products(
+            self.iodine_concentration, self.xenon_concentration, self.samarium_concentration, flux,
+            dt * SECONDS_PER_MINUTE)
+
+        # ReactivityModel is array-safe; the ensemble exposes ReactorState attribute names
+        total_pcm, components = self.reactivity_model.calculate_total_reactivity(self)
+        total_pcm = np.asarray(total_pcm, dtype=np.float64)
+        reactivity = np.where(self.scram_status, -0.5, total_pcm / 100000.0)
+
+        # Point kinetics (euler: members within 1000 pcm of critical are held steady)
+        kinetics = self.point_kinetics
+        precursors = self.delayed_neutron_precursors
+        if kinetics.method == 'euler':
+            clipped = _clip(reactivity, -0.9, 0.1)
+            active = np.abs(clipped) >= 0.01
+
+            flux_dot = (clipped - kinetics.BETA) / kinetics.LAMBDA_PROMPT * flux
+            for i in range(6):
+                flux_dot = flux_dot + kinetics.LAMBDA[i] * precursors[:, i]
+            max_flux_change = flux * 0.1
+            flux_dot = np.where(active, _clip(flux_dot, -max_flux_change, max_flux_change), 0.0)
+
+            precursor_dot = (kinetics.BETA / 6 / kinetics.LAMBDA_PROMPT * flux[:, None]
+                             - kinetics.LAMBDA * precursors)
+            precursor_dot[~active] = 0.0
+
+            self.neutron_flux = _clip(flux + flux_dot * dt, 1e8, 1e14)
+            self.delayed_neutron_precursors = _clip(precursors + precursor_dot * dt, 0, 1)
+        else:
+            self.neutron_flux, self.delayed_neutron_precursors = kinetics.propagate(
+                reactivity, flux, precursors, dt * SECONDS_PER_MINUTE)
+
+        power_fraction = self.neutron_flux / 1e13
+        self.thermal_power_mw = power_fraction * self.rated_power_mw
+        self.power_level = power_fraction * 100.0
+
+        return reactivity, total_pcm, components
+
+    def heat_transfer_coefficient(self) -> np.ndarray:
+        """Vectorized ThermalHydraulicsModel.calculate_heat_transfer_coefficient (W/K)"""
+        fuel_rod_diameter = 0.0095
+        heat_transfer_area = np.pi * fuel_rod_diameter * 3.66 * 50000
+        density = 700.0
+        viscosity = 9.0e-5
+        thermal_conductivity = 0.55
+
+        velocity = self.coolant_flow_rate / (density * 10.0)
+        reynolds = np.maximum(density * velocity * fuel_rod_diameter / viscosity, 1000)
+        prandtl = viscosity * 5200.0 / thermal_conductivity
+        nusselt = 0.023 * (reynolds ** 0.8) * (prandtl ** 0.4)
+        h = nusselt * thermal_conductivity / fuel_rod_diameter
+        return _clip(h * heat_transfer_area * 0.1, 10e6, 50e6)
+
+    def _update_thermal_hydraulics(self, dt: float) -> None:
+        """Vectorized ThermalHydraulicsModel thermal and steam cycle updates"""
+        th = self.thermal_hydraulics
+        near_full_power = np.abs(self.power_level - 100.0) < 5.0
+
+        # Fuel and coolant temperatures
+        heat_removal = self.heat_transfer_coefficient() * (self.fuel_temperature - self.coolant_temperature)
+        fuel_temp_dot = (self.thermal_power_mw * 1e6 - heat_removal) / (th.FUEL_MASS * th.FUEL_HEAT_CAPACITY)
+        fuel_limit = np.where(near_full_power, 1.0, 10.0)
+        fuel_temp_dot = _clip(fuel_temp_dot, -fuel_limit, fuel_limit)
+
+        target_hot_leg_temp = 293.0 + (34.0 * (self.power_level / 100.0))
+        target_avg_temp = (target_hot_leg_temp + 293.0) / 2.0
+        coolant_limit = np.where(near_full_power, 0.5, 5.0)
+        coolant_temp_dot = _clip(0.1 * (target_avg_temp - self.coolant_temperature),
+                                   -coolant_limit, coolant_limit)
+
+        # Pressurizer control
+        pressure_error = self.coolant_pressure - (15.5 + 0.002 * (self.coolant_temperature - 293.0))
+        pressure_dot = _clip(-0.01 * pressure_error, -0.05, 0.05)
+
+        # Steam cycle derivatives use the temperatures before this step's update
+        steam_generation = np.minimum(self.coolant_flow_rate * 0.05, self.steam_valve_position / 100 * 2000)
+        steam_temp_dot = 0.1 * (self.coolant_temperature - self.steam_temperature)
+        steam_pressure_dot = 0.05 * (steam_generation - self.steam_flow_rate)
+        steam_flow_dot = self.steam_valve_position / 100 * 20 - 10
+        feedwater_flow_dot = steam_generation - self.feedwater_flow_rate
+
+        self.fuel_temperature = _clip(self.fuel_temperature + fuel_temp_dot * dt, 200, 2000)
+        self.coolant_temperature = _clip(self.coolant_temperature + coolant_temp_dot * dt, 200, 400)
+        self.coolant_pressure = _clip(self.coolant_pressure + pressure_dot * dt, 10, 20)
+
+        self.steam_temperature = _clip(self.steam_temperature + steam_temp_dot * dt, 200, 400)
+        self.steam_pressure = _clip(self.steam_pressure + steam_pressure_dot * dt, 1, 10)
+        self.steam_flow_rate = _clip(self.steam_flow_rate + steam_flow_dot * dt, 0, 3000)
+        self.feedwater_flow_rate = _clip(self.feedwater_flow_rate + feedwater_flow_dot * dt, 0, 3000)
+
+    def _check_for_nan_values(self) -> None:
+        """Reset members with NaN temperatures, flux or pressure to safe values"""
+        invalid = (np.isnan(self.fuel_temperature) | np.isnan(self.neutron_flux)
+                   | np.isnan(self.coolant_temperature) | np.isnan(self.coolant_pressure))
+        if not invalid.any():
+            return
+        logger.warning("ENSEMBLE: NaN detected in %d member(s), resetting to safe values", invalid.sum())
+        self.neutron_flux[invalid] = 1e12
+        self.fuel_temperature[invalid] = 600.0
+        self.coolant_temperature[invalid] = 280.0
+        self.coolant_pressure[invalid] = 15.5
+        self.power_level[invalid] = 100.0
+
+    def _check_safety_systems(self) -> None:
+        """Vectorized ScramSystem.check_safety_systems (scram_activated marks new trips)"""
+        scram = self.scram_system
+        trip = ((self.fuel_temperature > scram.max_fuel_temp)
+                | (self.coolant_pressure > scram.max_coolant_pressure)
+                | (self.coolant_flow_rate < scram.min_coolant_flow)
+                | (self.power_level > scram.max_power_level))
+        self.scram_activated = trip & ~self.scram_status
+        if self.scram_activated.any():
+            members = np.flatnonzero(self.scram_activated)
+            logger.warning("ENSEMBLE: SCRAM in member(s) %s", members.tolist())
+            self.scram_status = self.scram_status | self.scram_activated
+            self.control_rod_position = np.where(self.scram_activated, 0.0, self.control_rod_position)
+
+    def member_state(self, index: int) -> ReactorState:
+        """
+        Get one member's state as a ReactorState
+
+        Args:
+            index: Member index
+
+        Returns:
+            ReactorState copy with plain Python values
+        """
+        values = {}
+        for name in self.STATE_FIELDS:
+            value = getattr(self, name)[index]
+            values[name] = value.copy() if name == 'delayed_neutron_precursors' else value.item()
+        return ReactorState(**values)
+
+    def get_state_arrays(self) -> Dict[str, np.ndarray]:
+        """Get copies of all per-member state arrays keyed by ReactorState field name"""
+        arrays = {name: getattr(self, name).copy() for name in self.STATE_FIELDS}
+        arrays['thermal_power_mw'] = self.thermal_power_mw.copy()
+        arrays['total_reactivity_pcm'] = self.total_reactivity_pcm.copy()
+        arrays['scram_activated'] = self.scram_activated.copy()
+        return arrays
+
+    def get_member_states(self) -> List[ReactorState]:
+        """Get every member's state as a list of ReactorState objects"""
+        return [self.member_state(i) for i in range(self.num_members)]
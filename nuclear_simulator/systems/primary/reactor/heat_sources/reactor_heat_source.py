@@ -9,18 +9,24 @@ from typing import Any, Dict
 
 import numpy as np
 
+from ..physics.point_kinetics import SECONDS_PER_MINUTE
 from .heat_source_interface import HeatSource
 
 
 class ReactorHeatSource(HeatSource):
     """Heat source based on reactor physics calculations"""
 
-    def __init__(self, rated_power_mw: float = 3000.0):
+    def __init__(self, rated_power_mw: float = 3000.0, kinetics_method: str = 'euler'):
         """
         Initialize reactor heat source
 
         Args:
             rated_power_mw: Rated thermal power in MW
+            kinetics_method: Point kinetics integration method ('euler',
+                'prompt_jump', 'exponential' or 'backward_euler'; see PointKineticsModel).
+                The stiff methods have no near-critical hold and follow any
+                reactivity imbalance, so start them from a critical state
+                (create_equilibrium_state)
         """
         super().__init__(rated_power_mw)
 
@@ -32,7 +38,7 @@ class ReactorHeatSource(HeatSource):
         from ..safety.scram_logic import ScramSystem
 
         self.reactivity_model = ReactivityModel()
-        self.point_kinetics = PointKineticsModel()
+        self.point_kinetics = PointKineticsModel(kinetics_method)
         self.thermal_hydraulics = ThermalHydraulicsModel()
         self.neutronics = NeutronicsModel()
         self.scram_system = ScramSystem()
@@ -42,7 +48,7 @@ class ReactorHeatSource(HeatSource):
         Update reactor physics and return heat source status
 
         Args:
-            dt: Time step in seconds
+            dt: Plant time step (minutes, as passed by the simulator)
             **kwargs: Additional parameters including reactor_state and control_action
 
         Returns:
@@ -61,9 +67,9 @@ class ReactorHeatSource(HeatSource):
                 "neutron_flux": 1e13,
             }
 
-        # Update fission product concentrations
+        # Update fission product concentrations (integrated in seconds over the plant step)
         fp_updates = self.reactivity_model.update_fission_products(
-            reactor_state, reactor_state.neutron_flux, dt
+            reactor_state, reactor_state.neutron_flux, dt * SECONDS_PER_MINUTE
         )
         reactor_state.xenon_concentration = fp_updates["xenon"]
         reactor_state.iodine_concentration = fp_updates["iodine"]
@@ -80,14 +86,8 @@ class ReactorHeatSource(HeatSource):
         if reactor_state.scram_status:
             reactivity = -0.5  # Large negative reactivity during scram
 
-        # Solve point kinetics equations using the physics model
-        flux_dot, precursor_dot = self.point_kinetics.solve_point_kinetics(reactivity, reactor_state)
-
-        # Update neutron flux using the physics model
-        self.point_kinetics.update_neutron_flux(reactor_state, flux_dot, dt)
-
-        # Update delayed neutron precursors using the physics model
-        self.point_kinetics.update_precursors(reactor_state, precursor_dot, dt)
+        # Integrate point kinetics (flux and delayed neutron precursors) over the step
+        self.point_kinetics.advance(reactivity, reactor_state, dt)
 
         # Calculate thermal power from neutron flux using the physics model
         thermal_power_mw, power_percent = self.point_kinetics.calculate_power_from_flux(
@@ -3,10 +3,57 @@ Point Kinetics Model
 
 This module implements the point kinetics equations for nuclear reactor physics,
 including delayed neutron precursor calculations.
+
+Integration methods (PointKineticsModel(method=...)):
+- 'euler': explicit Euler with the legacy stability limiters (default)
+- 'prompt_jump': prompt-jump approximation; precursors are propagated exactly
+  and the flux follows them algebraically
+- 'exponential': exact matrix-exponential propagator of the six-group equations
+- 'backward_euler': implicit (L-stable) backward Euler, sub-stepped to
+  max_substep because it is only first-order accurate. The sub-steps share one
+  propagator, so a step costs one implicit solve and O(log(dt / max_substep))
+  matrix products whatever its length
+
+The stiff methods hold reactivity constant over the step and stay stable and
+accurate at any dt, without the near-critical hold or flux-rate clipping of
+'euler'. They expect delayed_neutron_precursors in flux units (equilibrium
+C_i = beta_i * n / (lambda_i * LAMBDA_PROMPT), as set by
+create_equilibrium_state). Their constants are in seconds, so propagate()
+takes dt in seconds; advance() takes the plant step in minutes and converts.
 """
 
 import numpy as np
-from typing import Tuple
+from typing import Tuple, Union
+
+SECONDS_PER_MINUTE = 60.0
+
+# [6/6] Padé coefficients of exp(x)
+_PADE_COEFFICIENTS = (1.0, 1 / 2, 5 / 44, 1 / 66, 1 / 792, 1 / 15840, 1 / 665280)
+
+
+def _expm(matrix: np.ndarray) -> np.ndarray:
+    """
+    Matrix exponential of a square matrix or a stack of them
+
+    Scaling and squaring with a [6/6] Padé approximant (scipy is not a dependency).
+    """
+    norm = np.abs(matrix).sum(axis=-2).max()
+    squarings = int(np.ceil(np.log2(norm / 0.5))) if norm > 0.5 else 0
+    scaled = matrix / 2.0 ** squarings
+
+    identity = np.broadcast_to(np.eye(matrix.shape[-1]), matrix.shape)
+    power = identity
+    numerator = identity * _PADE_COEFFICIENTS[0]
+    denominator = identity * _PADE_COEFFICIENTS[0]
+    for k, coefficient in enumerate(_PADE_COEFFICIENTS[1:], start=1):
+        power = power @ scaled
+        numerator = numerator + coefficient * power
+        denominator = denominator + (-1) ** k * coefficient * power
+    result = np.linalg.solve(denominator, numerator)
+
+    for _ in range(squarings):
+        result = result @ result
+    return result
 
 
 class PointKineticsModel:
@@ -14,14 +61,164 @@ class PointKineticsModel:
     Point kinetics model for nuclear reactor neutron flux calculations
     """
 
-    def __init__(self):
-        """Initialize point kinetics model with physical constants"""
+    METHODS = ('euler', 'prompt_jump', 'exponential', 'backward_euler')
+
+    def __init__(self, method: str = 'euler', max_substep: float = 0.1):
+        """
+        Initialize point kinetics model with physical constants
+
+        Args:
+            method: Integration method (one of METHODS)
+            max_substep: Largest internal step of the backward Euler method
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown point kinetics method '{method}', expected one of {self.METHODS}")
+        self.method = method
+        self.max_substep = max_substep
+
         # Physical constants
         self.BETA = 0.0065  # Total delayed neutron fraction
         self.LAMBDA = np.array(
             [0.077, 0.311, 1.40, 3.87, 1.40, 0.195]
         )  # Decay constants
         self.LAMBDA_PROMPT = 1e-5  # Prompt neutron generation time
+        # Group fractions used by the stiff methods (same as create_equilibrium_state)
+        self.BETA_FRACTIONS = np.array(
+            [0.000215, 0.001424, 0.001274, 0.002568, 0.000748, 0.000273]
+        )
+
+    def advance(self, reactivity: float, reactor_state, dt: float) -> float:
+        """
+        Advance neutron flux and precursors over one plant time step
+
+        The stiff methods integrate dt * 60 seconds. 'euler' keeps the raw dt:
+        its limiters are tuned per plant step, as in the legacy model.
+
+        Args:
+            reactivity: Reactivity in delta-k/k (held constant over the step)
+            reactor_state: Current reactor state (updated in place)
+            dt: Plant time step (minutes)
+
+        Returns:
+            Updated neutron flux
+        """
+        if self.method == 'euler':
+            flux_dot, precursor_dot = self.solve_point_kinetics(reactivity, reactor_state)
+            self.update_neutron_flux(reactor_state, flux_dot, dt)
+            self.update_precursors(reactor_state, precursor_dot, dt)
+            return reactor_state.neutron_flux
+
+        flux, precursors = self.propagate(
+            reactivity, reactor_state.neutron_flux, reactor_state.delayed_neutron_precursors,
+            dt * SECONDS_PER_MINUTE)
+        reactor_state.neutron_flux = float(flux)
+        reactor_state.delayed_neutron_precursors = precursors
+        return reactor_state.neutron_flux
+
+    def propagate(self, reactivity: Union[float, np.ndarray], flux: Union[float, np.ndarray],
+                  precursors: np.ndarray, dt: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Integrate the six-group equations over dt with a stiff method
+
+        Works on a single state or on N states at once (reactivity and flux of
+        shape (N,), precursors of shape (N, 6)).
+
+        Args:
+            reactivity: Reactivity in delta-k/k (held constant over the step)
+            flux: Neutron flux (n/cm²/s)
+            precursors: Precursor concentrations in flux units
+            dt: Time step (seconds)
+
+        Returns:
+            Tuple of (flux, precursors) after dt
+        """
+        rho = np.clip(np.asarray(reactivity, dtype=np.float64), -0.9, 0.1)
+        flux = np.asarray(flux, dtype=np.float64)
+        precursors = np.asarray(precursors, dtype=np.float64)
+
+        if self.method == 'backward_euler':
+            flux, precursors = self._backward_euler(rho, flux, precursors, dt)
+        elif self.method == 'prompt_jump':
+            flux, precursors = self._prompt_jump(rho, flux, precursors, dt)
+        else:
+            flux, precursors = self._exponential(rho, flux, precursors, dt)
+
+        return np.clip(flux, 1e8, 1e14), np.maximum(precursors, 0.0)
+
+    def _kinetics_matrix(self, rho: np.ndarray) -> np.ndarray:
+        """Matrix A of dy/dt = A y for y = (flux, precursors), one per reactivity"""
+        beta = self.BETA_FRACTIONS.sum()
+        matrix = np.zeros(rho.shape + (7, 7))
+        matrix[..., 0, 0] = (rho - beta) / self.LAMBDA_PROMPT
+        matrix[..., 0, 1:] = self.LAMBDA
+        matrix[..., 1:, 0] = self.BETA_FRACTIONS / self.LAMBDA_PROMPT
+        matrix[..., np.arange(1, 7), np.arange(1, 7)] = -self.LAMBDA
+        return matrix
+
+    @staticmethod
+    def _apply(propagator: np.ndarray, flux: np.ndarray,
+               precursors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Apply a 7x7 propagator (or a stack of them) to (flux, precursors)"""
+        state = np.concatenate([flux[..., None], precursors], axis=-1)
+        state = (propagator @ state[..., None])[..., 0]
+        return state[..., 0], state[..., 1:]
+
+    def _exponential(self, rho: np.ndarray, flux: np.ndarray, precursors: np.ndarray,
+                     dt: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Exact solution y(t + dt) = expm(A dt) y(t) for constant reactivity"""
+        return self._apply(_expm(self._kinetics_matrix(rho) * dt), flux, precursors)
+
+    def _prompt_jump(self, rho: np.ndarray, flux: np.ndarray, precursors: np.ndarray,
+                     dt: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Prompt-jump approximation (dn/dt = 0 in the flux equation)
+
+        n = LAMBDA_PROMPT * sum(lambda_i C_i) / (beta - rho), so the precursors
+        obey a 6x6 linear system that is propagated exactly. The approximation
+        degrades towards prompt critical, so above beta/2 the exponential
+        propagator is used instead.
+        """
+        beta = self.BETA_FRACTIONS.sum()
+        if np.any(rho >= 0.5 * beta):
+            return self._exponential(rho, flux, precursors, dt)
+
+        matrix = (self.BETA_FRACTIONS[:, None] * self.LAMBDA[None, :]
+                  / (beta - rho)[..., None, None])
+        matrix = matrix - np.diag(self.LAMBDA)
+        precursors = (_expm(matrix * dt) @ precursors[..., None])[..., 0]
+        flux = self.LAMBDA_PROMPT * (precursors @ self.LAMBDA) / (beta - rho)
+        return flux, precursors
+
+    def _backward_euler(self, rho: np.ndarray, flux: np.ndarray, precursors: np.ndarray,
+                        dt: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Implicit Euler sub-steps of at most max_substep
+
+        Every sub-step applies the same propagator (I - h A)^-1, so it is solved
+        once and raised to the number of sub-steps by repeated squaring. Prompt
+        supercritical states would need prompt-period sub-steps, so they use the
+        exponential propagator instead.
+        """
+        beta = self.BETA_FRACTIONS.sum()
+        if np.any(rho >= beta):
+            return self._exponential(rho, flux, precursors, dt)
+
+        substeps = max(1, int(np.ceil(dt / self.max_substep)))
+        h = dt / substeps
+        step = np.linalg.inv(np.eye(7) - h * self._kinetics_matrix(rho))
+        return self._apply(np.linalg.matrix_power(step, substeps), flux, precursors)
+
+    def equilibrium_precursors(self, neutron_flux: float) -> np.ndarray:
+        """
+        Delayed neutron precursors in equilibrium with a constant flux
+
+        Args:
+            neutron_flux: Neutron flux in n/cm²/s
+
+        Returns:
+            Precursor concentrations in flux units
+        """
+        return self.BETA_FRACTIONS / self.LAMBDA * neutron_flux / self.LAMBDA_PROMPT
 
     def solve_point_kinetics(self, reactivity: float, reactor_state) -> Tuple[float, np.ndarray]:
         """
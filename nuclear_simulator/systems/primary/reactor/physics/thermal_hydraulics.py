@@ -7,6 +7,9 @@ including heat transfer, temperature dynamics, and pressure calculations.
 
 import numpy as np
 from typing import Dict
+from simulator.sim_logging import get_logger
+
+logger = get_logger(__name__)
 
 class ThermalHydraulicsModel:
     """
@@ -260,7 +263,7 @@ class ThermalHydraulicsModel:
             or np.isnan(reactor_state.coolant_temperature)
             or np.isnan(reactor_state.coolant_pressure)
         ):
-            print("Warning: NaN detected, resetting to safe values")
+            logger.warning("NaN detected, resetting to safe values")
             reactor_state.neutron_flux = 1e12
             reactor_state.fuel_temperature = 600.0
             reactor_state.coolant_temperature = 280.0
@@ -70,9 +70,12 @@ class ReactivityModel:
         """Initialize the reactivity model with reactor configuration"""
         self.config = config if config is not None else ReactorConfig()
 
-        # Initialize equilibrium fission product concentrations
-        self._equilibrium_xenon = None
-        self._equilibrium_samarium = None
+        # Full-power equilibrium fission product concentrations (the poison worths
+        # are calibrated to them, so equilibrium states are a fixed point of the
+        # fission product equations)
+        reference = self.equilibrium_fission_products(self.config.flux_normalization)
+        self._equilibrium_xenon = float(reference["xenon"])
+        self._equilibrium_samarium = float(reference["samarium"])
 
     def calculate_total_reactivity(self, state) -> Tuple[float, Dict[str, float]]:
         """
@@ -120,6 +123,9 @@ class ReactivityModel:
             state
         )
 
+        # Core reactivity bias (zero unless set to balance an equilibrium state)
+        components["bias"] = getattr(state, "reactivity_bias", 0.0)
+
         total_reactivity = sum(components.values())
 
         return total_reactivity, components
@@ -234,9 +240,9 @@ class ReactivityModel:
         Returns:
             Reactivity in pcm
         """
-        # Simplified empirical relationship for PWR
+        # Simplified empirical relationship for PWR, relative to full-power equilibrium
         # Reduced for mid-cycle operation to achieve better balance
-        equilibrium_xe_conc = 1.0e15  # atoms/cm³
+        equilibrium_xe_conc = self._equilibrium_xenon  # atoms/cm³
         equilibrium_xe_worth = -1800.0  # pcm (reduced from -2800)
 
         reactivity = (xenon_concentration / equilibrium_xe_conc) * equilibrium_xe_worth
@@ -253,9 +259,9 @@ class ReactivityModel:
         Returns:
             Reactivity in pcm
         """
-        # Simplified empirical relationship for PWR
+        # Simplified empirical relationship for PWR, relative to full-power equilibrium
         # Reduced for mid-cycle operation to achieve better balance
-        equilibrium_sm_conc = 5.0e14  # atoms/cm³
+        equilibrium_sm_conc = self._equilibrium_samarium  # atoms/cm³
         equilibrium_sm_worth = -600.0  # pcm (reduced from -1000)
 
         reactivity = (
@@ -316,6 +322,10 @@ class ReactivityModel:
         """
         Update fission product concentrations using differential equations
 
+        The linear I-135 -> Xe-135 chain and Sm-149 are integrated exactly at
+        constant flux over the step (see propagate_fission_products), so dt
+        can be hours long.
+
         Args:
             state: ReactorState object
             neutron_flux: Neutron flux in n/cm²/s
@@ -324,47 +334,108 @@ class ReactivityModel:
         Returns:
             Dictionary with updated concentrations
         """
-        # Current concentrations
-        iodine = state.iodine_concentration
-        xenon = state.xenon_concentration
-        samarium = state.samarium_concentration
-
-        # Fission rate (simplified)
-        fission_rate = neutron_flux * 1e-12  # Approximate fissions/cm³/s
+        iodine, xenon, samarium = self.propagate_fission_products(
+            state.iodine_concentration,
+            state.xenon_concentration,
+            state.samarium_concentration,
+            neutron_flux,
+            dt,
+        )
+        return {"iodine": float(iodine), "xenon": float(xenon), "samarium": float(samarium)}
 
-        # Iodine-135 balance
-        iodine_production = self.config.iodine_yield * fission_rate
-        iodine_decay = self.config.iodine_decay * iodine
+    def propagate_fission_products(
+        self, iodine, xenon, samarium, neutron_flux, dt: float
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Closed-form fission product update at constant flux over dt
 
-        diodine_dt = iodine_production - iodine_decay
-        new_iodine = iodine + diodine_dt * dt
+        Array-safe: concentrations and flux may be scalars or per-member arrays.
 
-        # Xenon-135 balance
-        xenon_production = self.config.xenon_yield * fission_rate
-        xenon_from_iodine = self.config.iodine_decay * iodine
-        xenon_decay = self.config.xenon_decay * xenon
-        xenon_absorption = self.config.sigma_a_xe135 * 1e-24 * neutron_flux * xenon
+        Args:
+            iodine: I-135 concentration in atoms/cm³
+            xenon: Xe-135 concentration in atoms/cm³
+            samarium: Sm-149 concentration in atoms/cm³
+            neutron_flux: Neutron flux in n/cm²/s
+            dt: Time step in seconds
 
-        dxenon_dt = (
-            xenon_production + xenon_from_iodine - xenon_decay - xenon_absorption
+        Returns:
+            Tuple of (iodine, xenon, samarium) after dt
+        """
+        iodine = np.asarray(iodine, dtype=np.float64)
+        xenon = np.asarray(xenon, dtype=np.float64)
+        samarium = np.asarray(samarium, dtype=np.float64)
+        equilibrium = self.equilibrium_fission_products(neutron_flux)
+
+        # Removal rates (1/s)
+        iodine_removal = self.config.iodine_decay
+        xenon_removal = self.config.xenon_decay + self._xenon_burnout_rate(neutron_flux)
+        samarium_removal = self.config.sigma_a_sm149 * 1e-24 * np.asarray(neutron_flux, dtype=np.float64)
+
+        iodine_excess = iodine - equilibrium["iodine"]
+        iodine_decay = np.exp(-iodine_removal * dt)
+        xenon_decay = np.exp(-xenon_removal * dt)
+
+        new_iodine = equilibrium["iodine"] + iodine_excess * iodine_decay
+
+        # Xenon relaxes to equilibrium plus the decay of the iodine excess feeding it
+        # (exp(-a dt) - exp(-b dt)) / (b - a), written with expm1 to stay exact as b -> a
+        rate_gap = xenon_removal - iodine_removal
+        degenerate = rate_gap == 0.0
+        transfer = iodine_decay * np.where(
+            degenerate,
+            dt,
+            -np.expm1(-rate_gap * dt) / np.where(degenerate, 1.0, rate_gap),
         )
-        new_xenon = xenon + dxenon_dt * dt
-
-        # Samarium-149 balance (stable, only production)
-        samarium_production = self.config.samarium_yield * fission_rate
-        samarium_absorption = (
-            self.config.sigma_a_sm149 * 1e-24 * neutron_flux * samarium
+        new_xenon = (
+            equilibrium["xenon"]
+            + (xenon - equilibrium["xenon"]) * xenon_decay
+            + self.config.iodine_decay * iodine_excess * transfer
         )
 
-        dsamarium_dt = samarium_production - samarium_absorption
-        new_samarium = samarium + dsamarium_dt * dt
+        # Samarium-149 (stable, only production and burnout); linear growth without flux
+        samarium_production = self.config.samarium_yield * self._fission_rate(neutron_flux)
+        exposure = samarium_removal * dt
+        burnout = exposure > 1e-12
+        growth = np.where(burnout, -np.expm1(-exposure) / np.where(burnout, samarium_removal, 1.0), dt)
+        new_samarium = samarium * np.exp(-exposure) + samarium_production * growth
 
         # Ensure non-negative concentrations
-        new_iodine = max(0, new_iodine)
-        new_xenon = max(0, new_xenon)
-        new_samarium = max(0, new_samarium)
+        return (np.maximum(0, new_iodine), np.maximum(0, new_xenon), np.maximum(0, new_samarium))
+
+    def equilibrium_fission_products(self, neutron_flux) -> Dict[str, np.ndarray]:
+        """
+        Equilibrium of the fission product equations at constant flux
+
+        Vectorized over flux; this is the state propagate_fission_products
+        converges to. The xenon and samarium worths are calibrated to its
+        value at full-power flux.
+
+        Args:
+            neutron_flux: Neutron flux in n/cm²/s (scalar or array)
+
+        Returns:
+            Dictionary with equilibrium iodine, xenon and samarium (atoms/cm³);
+            samarium is 0 without flux, where it has no equilibrium
+        """
+        flux = np.asarray(neutron_flux, dtype=np.float64)
+        fission_rate = self._fission_rate(flux)
+
+        iodine = self.config.iodine_yield * fission_rate / self.config.iodine_decay
+        xenon = ((self.config.iodine_yield + self.config.xenon_yield) * fission_rate
+                 / (self.config.xenon_decay + self._xenon_burnout_rate(flux)))
+        samarium_removal = self.config.sigma_a_sm149 * 1e-24 * flux
+        samarium = np.divide(self.config.samarium_yield * fission_rate, samarium_removal,
+                             out=np.zeros_like(fission_rate), where=samarium_removal > 0)
+
+        return {"iodine": iodine, "xenon": xenon, "samarium": samarium}
 
-        return {"iodine": new_iodine, "xenon": new_xenon, "samarium": new_samarium}
+    def _fission_rate(self, neutron_flux):
+        """Fission rate (simplified, fissions/cm³/s)"""
+        return np.asarray(neutron_flux, dtype=np.float64) * 1e-12
+
+    def _xenon_burnout_rate(self, neutron_flux):
+        """Xe-135 removal by neutron absorption (1/s)"""
+        return self.config.sigma_a_xe135 * 1e-24 * np.asarray(neutron_flux, dtype=np.float64)
 
     def calculate_equilibrium_fission_products(
         self, neutron_flux: float
@@ -378,14 +449,10 @@ class ReactivityModel:
         Returns:
             Dictionary with equilibrium concentrations
         """
-        # Use realistic equilibrium concentrations for PWR at full power
-        # These values give approximately -2800 pcm Xe and -1000 pcm Sm
-
-        return {
-            "iodine": 1.5e16,  # atoms/cm³
-            "xenon": 1.0e15,  # atoms/cm³ (gives ~-2650 pcm)
-            "samarium": 5.0e14,  # atoms/cm³ (gives ~-410 pcm)
-        }
+        # Fixed point of the fission product equations, so the state holds at constant flux
+        # (at full power: -1800 pcm Xe and -600 pcm Sm)
+        equilibrium = self.equilibrium_fission_products(neutron_flux)
+        return {name: float(value) for name, value in equilibrium.items()}
 
     def calculate_critical_boron_concentration(
         self, state, target_reactivity: float = 0.0
@@ -409,8 +476,8 @@ class ReactivityModel:
         # Restore original boron concentration
         state.boron_concentration = temp_boron
 
-        # Calculate required boron change
-        reactivity_difference = total_reactivity - target_reactivity
+        # Calculate required boron change (boron worth is negative)
+        reactivity_difference = target_reactivity - total_reactivity
         required_boron_change = reactivity_difference / self.config.boron_worth
 
         return required_boron_change
@@ -444,6 +511,7 @@ def create_equilibrium_state(
     power_level: float = 100.0,
     control_rod_position: float = 95.0,
     auto_balance: bool = True,
+    config: Optional[ReactorConfig] = None,
 ) -> "ReactorState":
     """
     Create a reactor state in equilibrium for the specified conditions
@@ -452,6 +520,7 @@ def create_equilibrium_state(
         power_level: Power level in % rated
         control_rod_position: Control rod position in % withdrawn
         auto_balance: If True, automatically calculate boron for criticality
+        config: Reactor configuration to solve for (default ReactorConfig())
 
     Returns:
         ReactorState object in equilibrium
@@ -460,7 +529,7 @@ def create_equilibrium_state(
     from simulator.core.sim import ReactorState
 
     # Create reactivity model
-    reactivity_model = ReactivityModel()
+    reactivity_model = ReactivityModel(config)
 
     # Calculate equilibrium neutron flux
     # TODO: see if this is realistic. We shouldn't hardcode this value
@@ -522,6 +591,12 @@ def create_equilibrium_state(
         # Fine-tune the neutron flux to ensure exactly 100% power
         state.neutron_flux = 1e13  # Exactly 100% power flux
         state.power_level = 100.0  # Exactly 100% power
+
+        # A core that is subcritical without boron cannot be balanced by boron:
+        # the remaining imbalance is carried as a reactivity bias, so the state
+        # is exactly critical (the stiff point kinetics methods respond to it)
+        residual, _ = reactivity_model.calculate_total_reactivity(state)
+        state.reactivity_bias = -residual
     else:
         # Use default boron concentration
         state.boron_concentration = 1200.0
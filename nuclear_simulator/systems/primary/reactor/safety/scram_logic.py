@@ -6,6 +6,9 @@ including safety parameter monitoring and automatic reactor trip conditions.
 """
 
 from typing import List, Dict, Any
+from simulator.sim_logging import get_logger
+
+logger = get_logger(__name__)
 
 
 class ScramSystem:
@@ -41,19 +44,16 @@ class ScramSystem:
         if any(scram_conditions) and not reactor_state.scram_status:
             # Debug: Print which condition triggered the SCRAM
             if reactor_state.fuel_temperature > self.max_fuel_temp:
-                print(
-                    f"SCRAM: Fuel temperature {reactor_state.fuel_temperature:.1f}°C > {self.max_fuel_temp}°C"
-                )
+                logger.warning("SCRAM: Fuel temperature %.1f°C > %s°C",
+                               reactor_state.fuel_temperature, self.max_fuel_temp)
             if reactor_state.coolant_pressure > self.max_coolant_pressure:
-                print(
-                    f"SCRAM: Coolant pressure {reactor_state.coolant_pressure:.1f} MPa > {self.max_coolant_pressure} MPa"
-                )
+                logger.warning("SCRAM: Coolant pressure %.1f MPa > %s MPa",
+                               reactor_state.coolant_pressure, self.max_coolant_pressure)
             if reactor_state.coolant_flow_rate < self.min_coolant_flow:
-                print(
-                    f"SCRAM: Coolant flow {reactor_state.coolant_flow_rate:.1f} kg/s < {self.min_coolant_flow} kg/s"
-                )
+                logger.warning("SCRAM: Coolant flow %.1f kg/s < %s kg/s",
+                               reactor_state.coolant_flow_rate, self.min_coolant_flow)
             if reactor_state.power_level > self.max_power_level:
-                print(f"SCRAM: Power level {reactor_state.power_level:.1f}% > {self.max_power_level}%")
+                logger.warning("SCRAM: Power level %.1f%% > %s%%", reactor_state.power_level, self.max_power_level)
 
             reactor_state.scram_status = True
             reactor_state.control_rod_position = 0  # All rods in
@@ -6,21 +6,28 @@ combining steam generators, turbines, and condensers into a complete steam cycle
 Enhanced with state management integration for comprehensive data collection.
 """
 
+import copy
 import numpy as np
 from typing import Dict, Any, Optional
 import pandas as pd
 
 # Import state management interfaces
 from simulator.state import auto_register
+from simulator.core.scheduler import MultiRateScheduler
+from simulator.core.equilibrium_cache import cached_config_hash, get_equilibrium_cache, stable_config_hash
+from simulator.core.step_result import StepResult, StepResultLog
 
 # Import heat flow tracking
 from .heat_flow_tracker import HeatFlowTracker, HeatFlowProvider, ThermodynamicProperties
 
 # Import chemistry flow tracking and water chemistry
-from .chemistry_flow_tracker import ChemistryFlowTracker, ChemistryFlowProvider, ChemicalSpecies, ChemistryProperties
-from .water_chemistry import WaterChemistry, WaterChemistryConfig, DegradationCalculator
+from .chemistry_flow_tracker import (ChemistryFlowTracker, ChemistryFlowProvider, ChemicalSpecies, ChemistryProperties,
+                                     BALANCE_SIGNATURE_KEYS)
+from .balance_validation import ValidationPolicy, BalanceHistory
+from .water_chemistry import WaterChemistry, WaterChemistryConfig, DegradationCalculator, chemistry_hours
 from .ph_control_system import PHControlSystem, PHControllerConfig
 from .config import SecondarySystemConfig
+from .steam_properties import SteamProperties, set_exact_properties, steam_properties
 
 from .steam_generator import (
     SteamGenerator, 
@@ -70,6 +77,12 @@ from .feedwater import (
     FeedwaterProtectionSystem,
     FeedwaterProtectionConfig
 )
+from simulator.sim_logging import get_logger
+
+logger = get_logger(__name__)
+
+# Saturation properties used for the integrated operating point
+_STEAM_PROPERTIES = steam_properties('clausius_clapeyron')
 
 __all__ = [
     # Steam Generator System
@@ -127,6 +140,15 @@ __all__ = [
     'PHControlSystem',
     'PHControllerConfig',
     
+    # Balance validation policies
+    'ValidationPolicy',
+    'BalanceHistory',
+    
+    # Water and Steam Properties
+    'SteamProperties',
+    'steam_properties',
+    'set_exact_properties',
+    
     # Integrated System
     'SecondaryReactorPhysics'
 ]
@@ -201,9 +223,9 @@ class SecondaryReactorPhysics:
             # Simple extraction: if secondary_system exists, use it as root
             if 'secondary_system' in config_data:
                 config_data = config_data['secondary_system']  # Drop down one level
-                print(f"[SECONDARY CONFIG] Extracted secondary_system section from comprehensive config")
+                logger.info("[SECONDARY CONFIG] Extracted secondary_system section from comprehensive config")
             else:
-                print(f"[SECONDARY CONFIG] Using flat config structure (legacy format)")
+                logger.info("[SECONDARY CONFIG] Using flat config structure (legacy format)")
             
             # Now treat config_data as if it were the old flat structure
             # Convert to SecondarySystemConfig object
@@ -224,8 +246,8 @@ class SecondaryReactorPhysics:
                     # Store the raw config data for subsystem access
                     self.config._raw_config_data = config_data
             except Exception as e:
-                print(f"[SECONDARY CONFIG] Warning: Could not create SecondarySystemConfig object: {e}")
-                print(f"[SECONDARY CONFIG] Using raw config data directly")
+                logger.warning("[SECONDARY CONFIG] Could not create SecondarySystemConfig object: %s", e)
+                logger.info("[SECONDARY CONFIG] Using raw config data directly")
                 # Store raw config data as a simple object for subsystem access
                 class SimpleConfig:
                     def __init__(self, data):
@@ -239,7 +261,7 @@ class SecondaryReactorPhysics:
                 
         elif config:
             config_data = config['secondary_system']
-            print(config_data)
+            logger.info("%s", config_data)
             self.config = SecondarySystemConfig.from_dict(config_data)
         else:
             # Create default 3000 MW PWR configuration
@@ -272,7 +294,7 @@ class SecondaryReactorPhysics:
         if hasattr(self.config, '_raw_config_data'):
             # Use raw config data extracted from comprehensive config
             raw_config = self.config._raw_config_data
-            print(f"[SECONDARY CONFIG] Using raw config data for subsystem initialization")
+            logger.info("[SECONDARY CONFIG] Using raw config data for subsystem initialization")
             
             # Initialize each subsystem with its section from the raw config
             self.steam_generator_system = EnhancedSteamGeneratorPhysics(raw_config.get('steam_generator', {}))
@@ -282,7 +304,7 @@ class SecondaryReactorPhysics:
             
         elif hasattr(self.config, 'get') and callable(self.config.get):
             # Config is a simple dictionary-like object
-            print(f"[SECONDARY CONFIG] Using dictionary-like config for subsystem initialization")
+            logger.info("[SECONDARY CONFIG] Using dictionary-like config for subsystem initialization")
             feedwater_config_dict = self.config.get('feedwater', {})
             self.steam_generator_system = EnhancedSteamGeneratorPhysics(self.config.get('steam_generator', {}))
             self.turbine = EnhancedTurbinePhysics(self.config.get('turbine', {}))
@@ -291,7 +313,7 @@ class SecondaryReactorPhysics:
             
         else:
             # Config is a SecondarySystemConfig object (legacy format)
-            print(f"[SECONDARY CONFIG] Using SecondarySystemConfig object for subsystem initialization")
+            logger.info("[SECONDARY CONFIG] Using SecondarySystemConfig object for subsystem initialization")
             self.steam_generator_system = EnhancedSteamGeneratorPhysics(self.config.steam_generator)
             self.turbine = EnhancedTurbinePhysics(self.config.turbine)
             self.condenser = EnhancedCondenserPhysics(self.config.condenser)
@@ -337,6 +359,83 @@ class SecondaryReactorPhysics:
         # Initialize total system heat rejection (for energy balance)
         self.total_system_heat_rejection = 0.0
         
+        # Results handed out since the last update (their lazy states expire on the next one)
+        self._step_results = StepResultLog()
+        
+        # Subsystem update rates. Each subsystem declares the dt unit it expects;
+        # chemistry takes plant minutes (converted to its own time base, so both
+        # modes advance it alike) and declares an hourly natural period used once
+        # multi-rate scheduling is enabled (see configure_scheduling)
+        self.scheduler = MultiRateScheduler()
+        self.scheduler.add('feedwater', self.feedwater_system, 'update_state', dt_unit='minutes')
+        self.scheduler.add('steam_generator', self.steam_generator_system, 'update_system', dt_unit='seconds')
+        self.scheduler.add('turbine', self.turbine, 'update_state', dt_unit='hours')
+        self.scheduler.add('condenser', self.condenser, 'update_state', dt_unit='hours')
+        self.scheduler.add('chemistry', self, '_update_chemistry', dt_unit='minutes', period=60.0, slow=True)
+    
+    def configure_scheduling(self, enabled: Optional[bool] = None,
+                             periods: Optional[Dict[str, float]] = None,
+                             max_substeps: Optional[Dict[str, Optional[float]]] = None) -> None:
+        """
+        Configure multi-rate scheduling for the secondary system and its components
+        
+        Settings are applied to this system's scheduler and to the steam generator
+        and condenser degradation schedulers; names a scheduler does not have are
+        ignored.
+        
+        Args:
+            enabled: Enable declared update periods (None leaves the state unchanged)
+            periods: Update periods in plant minutes by subsystem name
+                ('chemistry', 'tsp_fouling', 'tube_interior_fouling',
+                'tube_degradation', 'condenser_fouling', ...)
+            max_substeps: Sub-step limits in plant minutes by subsystem name
+        """
+        schedulers = [self.scheduler, self.condenser.scheduler]
+        schedulers.extend(sg.scheduler for sg in self.steam_generator_system.steam_generators)
+        for scheduler in schedulers:
+            scheduler.configure(enabled=enabled, periods=periods, max_substeps=max_substeps)
+    
+    def configure_balance_validation(self, energy: Any = None, chemistry: Any = None) -> None:
+        """
+        Set how often the energy and chemistry balances are audited
+        
+        The audits are diagnostics (the plant physics does not read them), so
+        long runs can audit periodically, on change, or not at all; between
+        audits the results report the latest audit.
+        
+        Args:
+            energy: Energy balance ValidationPolicy, dict of its fields, mode
+                name or audit interval (None leaves it unchanged)
+            chemistry: Chemistry balance policy, same forms as energy
+        """
+        if energy is not None:
+            self.heat_flow_tracker.set_validation_policy(ValidationPolicy.from_config(energy))
+        if chemistry is not None:
+            self.chemistry_flow_tracker.set_validation_policy(ValidationPolicy.from_config(chemistry))
+    
+    def configure_exact_lags(self, enabled: bool = True) -> None:
+        """
+        Select the exact first-order forms of the SG pressure and steam quality lags
+        
+        The exact forms settle to the same state for any timestep, which
+        adaptive stepping needs; by default the explicit-Euler forms are used.
+        
+        Args:
+            enabled: Use the exact forms
+        """
+        self.steam_generator_system.bank.exact_lags = enabled
+    
+    def validate_balances(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Audit the energy and chemistry balances now, regardless of their policies
+        
+        Returns:
+            Dictionary with the 'energy' and 'chemistry' validation results
+        """
+        _, energy_validation = self.heat_flow_tracker.update_balance(self.operating_hours, force=True)
+        _, chemistry_validation = self.chemistry_flow_tracker.update_balance(self.operating_hours, force=True)
+        return {'energy': energy_validation, 'chemistry': chemistry_validation}
+        
     def update_system(self,
                      primary_conditions: dict,
                      control_inputs: dict,
@@ -361,13 +460,16 @@ class SecondaryReactorPhysics:
             Dictionary with complete system state and performance
             
         Note:
-            Time step unit conversions:
+            Time step unit conversions are done by the scheduler from each
+            subsystem's declared unit:
             - Main simulator passes dt in MINUTES
-            - Turbine system expects dt in HOURS -> convert with dt/60.0
-            - Condenser system expects dt in HOURS -> convert with dt/60.0  
-            - Feedwater system expects dt in MINUTES -> use dt directly
-            - Steam generator system expects dt in SECONDS -> convert with dt*60.0
+            - Turbine system expects dt in HOURS
+            - Condenser system expects dt in HOURS
+            - Feedwater system expects dt in MINUTES
+            - Steam generator system expects dt in SECONDS
         """
+        self._step_results.expire()
+        
         # Extract control inputs
         self.load_demand = control_inputs.get('load_demand', 100.0)
         self.feedwater_temperature = control_inputs.get('feedwater_temp', 227.0)
@@ -482,12 +584,12 @@ class SecondaryReactorPhysics:
         }
         
         # Update feedwater system first
-        feedwater_result = self.feedwater_system.update_state(
+        feedwater_result = self.scheduler.run(
+            'feedwater', dt,
             sg_conditions=self._previous_sg_conditions,
             steam_generator_demands=steam_generator_demands,
             system_conditions=feedwater_system_conditions,
-            control_inputs=control_inputs,
-            dt=dt
+            control_inputs=control_inputs
         )
         
         # STEP 2: UPDATE STEAM GENERATORS WITH ACTUAL FEEDWATER FLOWS
@@ -518,12 +620,12 @@ class SecondaryReactorPhysics:
         }
         
         # Update enhanced steam generator system with actual feedwater flows
-        sg_system_result = self.steam_generator_system.update_system(
+        sg_system_result = self.scheduler.run(
+            'steam_generator', dt,
             primary_conditions=enhanced_primary_conditions,
             steam_demands=steam_demands,
             system_conditions=enhanced_system_conditions,
-            control_inputs=control_inputs,
-            dt=dt*60
+            control_inputs=control_inputs
         )
         
         # Store current SG conditions for next timestep
@@ -559,13 +661,12 @@ class SecondaryReactorPhysics:
         total_steam_flow = sum(sg_result['steam_flow_rate'] for sg_result in sg_results)
         
         # STEP 5: Update turbine with rich SG conditions instead of individual parameters
-        # CRITICAL FIX: Convert dt from minutes to hours for turbine system
-        # The turbine system expects dt in hours, but main simulator passes dt in minutes
-        turbine_result = self.turbine.update_state(
+        # The turbine system expects dt in hours (converted by the scheduler)
+        turbine_result = self.scheduler.run(
+            'turbine', dt,
             sg_conditions=sg_system_result,  # NEW: Pass full SG result dictionary
             load_demand=self.load_demand,
-            condenser_pressure=0.007,  # Will be updated with actual condenser pressure
-            dt=dt/60.0  # Convert minutes to hours for turbine
+            condenser_pressure=0.007  # Will be updated with actual condenser pressure
         )
         
         # Update condenser with ACTUAL LP turbine exhaust conditions from turbine system
@@ -606,7 +707,8 @@ class SecondaryReactorPhysics:
                 lp_exhaust_quality = (lp6_enthalpy - h_f) / h_fg
                 lp_exhaust_quality = max(0.0, min(1.0, lp_exhaust_quality))  # Clamp to valid range
         
-        condenser_result = self.condenser.update_state(
+        condenser_result = self.scheduler.run(
+            'condenser', dt,
             steam_pressure=turbine_result['condenser_pressure'],
             steam_temperature=turbine_result['condenser_temperature'],  # From turbine LP exit
             steam_flow=turbine_result['effective_steam_flow'],  # Actual flow to condenser (after extractions)
@@ -616,8 +718,7 @@ class SecondaryReactorPhysics:
             motive_steam_pressure=motive_steam_pressure,
             motive_steam_temperature=motive_steam_temperature,
             makeup_water_quality=makeup_water_quality,
-            chemical_doses=chemical_doses,
-            dt=dt / 60.0  # Convert seconds to hours for enhanced condenser
+            chemical_doses=chemical_doses  # Enhanced condenser expects dt in hours
         )
         
         # Update condenser system conditions now that we have condenser results
@@ -640,39 +741,12 @@ class SecondaryReactorPhysics:
             'pressure': avg_steam_pressure
         }
         
-        # Update water chemistry
-        water_chemistry_result = self.water_chemistry.update_chemistry(system_conditions, dt)
-        
-        # Update pH control system
-        ph_control_result = self.ph_control_system.update_system(
-            current_ph=water_chemistry_result.get('water_chemistry_ph', 9.2),
-            dt=dt
-        )
-        
-        # Extract controller outputs from pH control result
-        controller_outputs = ph_control_result.get('controller_outputs', {})
-        
-        # Apply pH control effects to water chemistry
-        chemistry_effects = {
-            'ph_setpoint': controller_outputs.get('ph_setpoint', 9.2),
-            'ammonia_dose_rate': controller_outputs.get('ammonia_dose_rate', 0.0),
-            'morpholine_dose_rate': controller_outputs.get('morpholine_dose_rate', 0.0),
-            'chemical_additions': {
-                'ammonia': controller_outputs.get('ammonia_dose_rate', 0.0) / 3600.0,  # Convert kg/hr to kg/s
-                'morpholine': controller_outputs.get('morpholine_dose_rate', 0.0) / 3600.0
-            }
-        }
-        self.water_chemistry.update_chemistry_effects(chemistry_effects)
-        
-        # Update chemistry flow tracker from all providers
-        self.chemistry_flow_tracker.update_from_providers()
-        
-        # Calculate system-wide chemistry flows
-        chemistry_flow_state = self.chemistry_flow_tracker.calculate_system_chemistry_flows()
-        chemistry_flow_validation = self.chemistry_flow_tracker.validate_chemistry_balance()
-        
-        # Add chemistry flow data to tracker history
-        self.chemistry_flow_tracker.add_to_history(self.operating_hours)
+        # Update water chemistry, pH control and chemistry flow tracking
+        chemistry_result = self.scheduler.run('chemistry', dt, system_conditions=system_conditions)
+        water_chemistry_result = chemistry_result['water_chemistry']
+        controller_outputs = chemistry_result['controller_outputs']
+        chemistry_flow_state = chemistry_result['chemistry_flow_state']
+        chemistry_flow_validation = chemistry_result['chemistry_flow_validation']
         
         # UPDATE HEAT FLOW TRACKER WITH COMPONENT DATA
         # Collect heat flows from all components that implement HeatFlowProvider
@@ -736,12 +810,9 @@ class SecondaryReactorPhysics:
         # Update the total system heat rejection to match energy balance
         self.total_system_heat_rejection = required_heat_rejection_mw * 1e6  # Convert to Watts
         
-        # Calculate system-wide heat flows and energy balance
-        heat_flow_state = self.heat_flow_tracker.calculate_system_heat_flows()
-        heat_flow_validation = self.heat_flow_tracker.validate_energy_balance()
-        
-        # Add heat flow data to tracker history
-        self.heat_flow_tracker.add_to_history(self.operating_hours)
+        # Calculate, validate and record the system-wide energy balance (at the
+        # rate set by its validation policy; otherwise the last audit is reported)
+        heat_flow_state, heat_flow_validation = self.heat_flow_tracker.update_balance(self.operating_hours)
         
         # Calculate system performance metrics
         self.total_steam_flow = total_steam_flow
@@ -869,9 +940,9 @@ class SecondaryReactorPhysics:
             power_reduction_factor = 0.0  # Complete shutdown for no feedwater
             power_reduction_reasons.append(f"FEEDWATER_FLOW_TOO_LOW: {actual_feedwater_flow:.1f} kg/s < {MIN_FEEDWATER_FLOW_KGS} kg/s")
             '''
-            print(f"[SECONDARY DEBUG] ELECTRICAL POWER REDUCTION: Complete shutdown due to insufficient feedwater flow")
-            print(f"[SECONDARY DEBUG]   Actual feedwater flow: {actual_feedwater_flow:.1f} kg/s")
-            print(f"[SECONDARY DEBUG]   Minimum required: {MIN_FEEDWATER_FLOW_KGS} kg/s")
+            logger.info("[SECONDARY DEBUG] ELECTRICAL POWER REDUCTION: Complete shutdown due to insufficient feedwater flow")
+            logger.info("[SECONDARY DEBUG]   Actual feedwater flow: %.1f kg/s", actual_feedwater_flow)
+            logger.info("[SECONDARY DEBUG]   Minimum required: %s kg/s", MIN_FEEDWATER_FLOW_KGS)
             '''
         # Check other critical operating conditions only if feedwater is available
         if power_reduction_factor > 0.0:
@@ -880,42 +951,42 @@ class SecondaryReactorPhysics:
                 old_factor = power_reduction_factor
                 power_reduction_factor *= 0.1  # 90% reduction for very low steam flow
                 power_reduction_reasons.append(f"STEAM_FLOW_TOO_LOW: {total_steam_flow:.1f} kg/s < {MIN_STEAM_FLOW_KGS * 0.5:.1f} kg/s")
-                print(f"[SECONDARY DEBUG] ELECTRICAL POWER REDUCTION: Steam flow too low")
-                print(f"[SECONDARY DEBUG]   Actual steam flow: {total_steam_flow:.1f} kg/s")
-                print(f"[SECONDARY DEBUG]   Minimum required: {MIN_STEAM_FLOW_KGS * 0.5:.1f} kg/s")
-                print(f"[SECONDARY DEBUG]   Power reduction factor: {old_factor:.3f} -> {power_reduction_factor:.3f}")
+                logger.info("[SECONDARY DEBUG] ELECTRICAL POWER REDUCTION: Steam flow too low")
+                logger.info("[SECONDARY DEBUG]   Actual steam flow: %.1f kg/s", total_steam_flow)
+                logger.info("[SECONDARY DEBUG]   Minimum required: %.1f kg/s", MIN_STEAM_FLOW_KGS * 0.5)
+                logger.info("[SECONDARY DEBUG]   Power reduction factor: %.3f -> %.3f", old_factor, power_reduction_factor)
             
             if avg_steam_pressure < (MIN_STEAM_PRESSURE_MPA * 0.5):  # Very low steam pressure
                 old_factor = power_reduction_factor
                 power_reduction_factor *= 0.1  # 90% reduction for very low steam pressure
                 power_reduction_reasons.append(f"STEAM_PRESSURE_TOO_LOW: {avg_steam_pressure:.3f} MPa < {MIN_STEAM_PRESSURE_MPA * 0.5:.3f} MPa")
-                print(f"[SECONDARY DEBUG] ELECTRICAL POWER REDUCTION: Steam pressure too low")
-                print(f"[SECONDARY DEBUG]   Actual steam pressure: {avg_steam_pressure:.3f} MPa")
-                print(f"[SECONDARY DEBUG]   Minimum required: {MIN_STEAM_PRESSURE_MPA * 0.5:.3f} MPa")
-                print(f"[SECONDARY DEBUG]   Power reduction factor: {old_factor:.3f} -> {power_reduction_factor:.3f}")
+                logger.info("[SECONDARY DEBUG] ELECTRICAL POWER REDUCTION: Steam pressure too low")
+                logger.info("[SECONDARY DEBUG]   Actual steam pressure: %.3f MPa", avg_steam_pressure)
+                logger.info("[SECONDARY DEBUG]   Minimum required: %.3f MPa", MIN_STEAM_PRESSURE_MPA * 0.5)
+                logger.info("[SECONDARY DEBUG]   Power reduction factor: %.3f -> %.3f", old_factor, power_reduction_factor)
             
             # Energy conservation check - this should rarely trigger if turbine physics is correct
             if thermal_power_mw > (primary_thermal_power * 1.1):  # Allow 10% margin
                 power_reduction_factor = 0.0  # Complete shutdown for major energy violation
                 power_reduction_reasons.append(f"ENERGY_CONSERVATION_VIOLATION: Secondary {thermal_power_mw:.1f} MW > Primary {primary_thermal_power:.1f} MW * 1.1")
-                print(f"[SECONDARY DEBUG] ELECTRICAL POWER REDUCTION: Energy conservation violation")
-                print(f"[SECONDARY DEBUG]   Secondary thermal power: {thermal_power_mw:.1f} MW")
-                print(f"[SECONDARY DEBUG]   Primary thermal power: {primary_thermal_power:.1f} MW")
-                print(f"[SECONDARY DEBUG]   Maximum allowed: {primary_thermal_power * 1.1:.1f} MW")
-                print(f"[SECONDARY DEBUG]   Complete shutdown triggered")
+                logger.info("[SECONDARY DEBUG] ELECTRICAL POWER REDUCTION: Energy conservation violation")
+                logger.info("[SECONDARY DEBUG]   Secondary thermal power: %.1f MW", thermal_power_mw)
+                logger.info("[SECONDARY DEBUG]   Primary thermal power: %.1f MW", primary_thermal_power)
+                logger.info("[SECONDARY DEBUG]   Maximum allowed: %.1f MW", primary_thermal_power * 1.1)
+                logger.info("[SECONDARY DEBUG]   Complete shutdown triggered")
         
         # Debug output for power reduction summary
         if power_reduction_factor < 1.0:
-            print(f"[SECONDARY DEBUG] ELECTRICAL POWER REDUCTION SUMMARY:")
-            print(f"[SECONDARY DEBUG]   Original turbine power: {turbine_electrical_power:.2f} MW")
-            print(f"[SECONDARY DEBUG]   Power reduction factor: {power_reduction_factor:.3f}")
-            print(f"[SECONDARY DEBUG]   Final electrical power: {turbine_electrical_power * power_reduction_factor:.2f} MW")
-            print(f"[SECONDARY DEBUG]   Power reduction: {(1.0 - power_reduction_factor) * 100:.1f}%")
-            print(f"[SECONDARY DEBUG]   Reduction reasons: {', '.join(power_reduction_reasons)}")
+            logger.info("[SECONDARY DEBUG] ELECTRICAL POWER REDUCTION SUMMARY:")
+            logger.info("[SECONDARY DEBUG]   Original turbine power: %.2f MW", turbine_electrical_power)
+            logger.info("[SECONDARY DEBUG]   Power reduction factor: %.3f", power_reduction_factor)
+            logger.info("[SECONDARY DEBUG]   Final electrical power: %.2f MW", turbine_electrical_power * power_reduction_factor)
+            logger.info("[SECONDARY DEBUG]   Power reduction: %.1f%%", (1.0 - power_reduction_factor) * 100)
+            logger.info("[SECONDARY DEBUG]   Reduction reasons: %s", ', '.join(power_reduction_reasons))
         elif len(validation_failures) > 0:
-            print(f"[SECONDARY DEBUG] VALIDATION WARNINGS (no power reduction applied):")
+            logger.warning("[SECONDARY DEBUG] VALIDATION WARNINGS (no power reduction applied):")
             for failure in validation_failures:
-                print(f"[SECONDARY DEBUG]   - {failure}")
+                logger.info("[SECONDARY DEBUG]   - %s", failure)
         
         # Use turbine electrical power with safety reductions
         self.electrical_power_output = turbine_electrical_power * power_reduction_factor
@@ -932,7 +1003,7 @@ class SecondaryReactorPhysics:
             heat_rate = 0.0
         
         # Compile complete system results
-        system_result = {
+        system_result = StepResult({
             # Overall system performance
             'electrical_power_mw': self.electrical_power_output,
             'thermal_efficiency': self.thermal_efficiency,
@@ -1009,17 +1080,92 @@ class SecondaryReactorPhysics:
             'feedwater_temperature': self.feedwater_temperature,
             'cooling_water_inlet_temp': self.cooling_water_temperature,
             'cooling_water_outlet_temp': condenser_result['cooling_water_outlet_temp'],
-            
-            # Detailed component states
-            'steam_generator_system_state': self.steam_generator_system.get_state_dict(),
-            'turbine_state': self.turbine.get_state_dict(),
-            'condenser_state': self.condenser.get_state_dict(),
-            'feedwater_state': self.feedwater_system.get_state_dict(),
-            'water_chemistry_state': self.water_chemistry.get_state_dict(),
-            'chemistry_flow_state': self.chemistry_flow_tracker.get_state_dict()
-        }
+        }, lazy={
+            # Detailed component states (built on first access)
+            'steam_generator_system_state': self.steam_generator_system.get_state_dict,
+            'turbine_state': self.turbine.get_state_dict,
+            'condenser_state': self.condenser.get_state_dict,
+            'feedwater_state': self.feedwater_system.get_state_dict,
+            'water_chemistry_state': self.water_chemistry.get_state_dict,
+            'chemistry_flow_state': self.chemistry_flow_tracker.get_state_dict
+        })
+        self._step_results.append(system_result)
         return system_result
     
+    def advance_degradation(self, dt: float) -> None:
+        """
+        Advance only the slow degradation models at the last operating conditions
+
+        Used by steady-state fast-forward: flows, pressures, levels and
+        temperatures are held from the last update_system call while pump and
+        turbine lubrication/wear, SG fouling, condenser tube wear/fouling and
+        water chemistry are integrated with a large time step. Degradation
+        feeds back into the thermal-hydraulics on the next update_system call.
+
+        Args:
+            dt: Time step (MINUTES; converted to each component's unit, with
+                water chemistry and pH control on the chemistry time base that
+                full physics uses in either scheduling mode)
+        """
+        self._step_results.expire()
+        self.feedwater_system.advance_degradation(dt)
+        for sg in self.steam_generator_system.steam_generators:
+            sg.advance_degradation(dt * 60.0)
+        self.turbine.advance_degradation(dt / 60.0)
+        self.condenser.advance_degradation(dt / 60.0)
+        self.scheduler.advance_degradation(dt)
+
+    def _update_chemistry(self, system_conditions: Dict[str, Any], dt: float) -> Dict[str, Any]:
+        """
+        Update water chemistry, pH control and chemistry flow tracking
+        
+        Args:
+            system_conditions: Chemistry system conditions (makeup water, blowdown, T, P)
+            dt: Time step (MINUTES; the plant step or the scheduler's aggregated
+                chemistry period, converted with chemistry_hours())
+            
+        Returns:
+            Dictionary with water chemistry results, pH controller outputs and
+            chemistry flow state/validation
+        """
+        # Update water chemistry
+        dt_hours = chemistry_hours(dt)
+        water_chemistry_result = self.water_chemistry.update_chemistry(system_conditions, dt_hours, dt_unit='hours')
+        
+        # Update pH control system (dt in hours)
+        ph_control_result = self.ph_control_system.update_system(
+            current_ph=water_chemistry_result.get('water_chemistry_ph', 9.2),
+            dt=dt_hours
+        )
+        
+        # Extract controller outputs from pH control result
+        controller_outputs = ph_control_result.get('controller_outputs', {})
+        
+        # Apply pH control effects to water chemistry
+        chemistry_effects = {
+            'ph_setpoint': controller_outputs.get('ph_setpoint', 9.2),
+            'ammonia_dose_rate': controller_outputs.get('ammonia_dose_rate', 0.0),
+            'morpholine_dose_rate': controller_outputs.get('morpholine_dose_rate', 0.0),
+            'chemical_additions': {
+                'ammonia': controller_outputs.get('ammonia_dose_rate', 0.0) / 3600.0,  # Convert kg/hr to kg/s
+                'morpholine': controller_outputs.get('morpholine_dose_rate', 0.0) / 3600.0
+            }
+        }
+        self.water_chemistry.update_chemistry_effects(chemistry_effects)
+        
+        # Collect provider chemistry, then calculate, validate and record the chemistry
+        # balance (at the rate set by its validation policy; otherwise the last audit is reported)
+        signature = [water_chemistry_result.get(key, 0.0) for key in BALANCE_SIGNATURE_KEYS]
+        chemistry_flow_state, chemistry_flow_validation = self.chemistry_flow_tracker.update_balance(
+            self.operating_hours, signature)
+        
+        return {
+            'water_chemistry': water_chemistry_result,
+            'controller_outputs': controller_outputs,
+            'chemistry_flow_state': chemistry_flow_state,
+            'chemistry_flow_validation': chemistry_flow_validation
+        }
+
     def get_system_state(self) -> dict:
         """Get complete system state for monitoring and logging"""
         return {
@@ -1046,6 +1192,8 @@ class SecondaryReactorPhysics:
             start_at_steady_state: If True, initialize to steady-state operation (default)
             thermal_power_mw: Reactor thermal power for steady-state calculation (default 3000 MW)
         """
+        self._step_results.expire()
+        
         # Always reset components first
         self.turbine.reset()
         self.condenser.reset()
@@ -1054,6 +1202,7 @@ class SecondaryReactorPhysics:
         
         # Reset heat flow tracker
         self.heat_flow_tracker.reset()
+        self.scheduler.reset()
         
         # Reset system-level variables
         self.total_steam_flow = 0.0
@@ -1099,7 +1248,20 @@ class SecondaryReactorPhysics:
         self.load_demand = equilibrium['load_demand']
     
     def _calculate_equilibrium_point(self, thermal_power_mw: float) -> Dict:
-        """Calculate steady-state operating point for given thermal power"""
+        """Calculate steady-state operating point for given thermal power (cached per SG config and state)"""
+        # The solve only reads the steam generators: it steps a copy of them from their
+        # current state (including any configured fouling and degradation)
+        steam_generator_system = self.steam_generator_system
+        steam_generator_state = [tuple(sg.get_state_dict().values())
+                                 for sg in steam_generator_system.steam_generators]
+        return get_equilibrium_cache().get_or_compute(
+            'secondary', thermal_power_mw,
+            stable_config_hash(cached_config_hash(steam_generator_system.config), steam_generator_state),
+            lambda: self._solve_equilibrium_point(thermal_power_mw)
+        )
+    
+    def _solve_equilibrium_point(self, thermal_power_mw: float) -> Dict:
+        """Solve the steady-state operating point for given thermal power"""
         
         # Calculate load demand based on thermal power
         # Assume rated thermal power is 3000 MW for typical PWR
@@ -1177,8 +1339,9 @@ class SecondaryReactorPhysics:
         
         # Get steam conditions from enhanced steam generator system
         try:
-            # Temporarily update the steam generator system to get equilibrium conditions
-            sg_system_result = self.steam_generator_system.update_system(
+            # Step a copy of the steam generator system so the live steam generators are untouched
+            steam_generator_system = copy.deepcopy(self.steam_generator_system)
+            sg_system_result = steam_generator_system.update_system(
                 primary_conditions=enhanced_primary_conditions,
                 steam_demands=steam_demands,
                 system_conditions=enhanced_system_conditions,
@@ -1195,7 +1358,7 @@ class SecondaryReactorPhysics:
             
         except Exception as e:
             # Fallback to calculated values if steam generator system fails
-            print(f"Warning: Steam generator system failed during equilibrium calculation: {e}")
+            logger.warning("Steam generator system failed during equilibrium calculation: %s", e)
             design_steam_flow = 1665.0  # kg/s at 100% power
             total_steam_flow = design_steam_flow * load_demand_fraction
             steam_pressure = 6.895  # MPa typical PWR steam pressure
@@ -1348,7 +1511,7 @@ class SecondaryReactorPhysics:
                 pump.state.trip_active = False
                 pump.state.trip_reason = ""
                 
-                print(f"Pump {pump_id} initialized directly to RUNNING state for steady-state operation")
+                logger.info("Pump %s initialized directly to RUNNING state for steady-state operation", pump_id)
             
             # Initialize system state (will be updated properly on first update cycle)
             pump_system.running_pumps = []  # Will be populated during first update
@@ -1456,40 +1619,10 @@ class SecondaryReactorPhysics:
         """
         Calculate saturation temperature for given pressure
         
-        Using improved correlation for water, valid 0.1-10 MPa
-        Reference: NIST steam tables, simplified correlation
+        Using simplified Clausius-Clapeyron relation from 100°C at 1 atm;
+        for typical PWR steam pressure (6.9 MPa) this gives ~277°C
         """
-        if pressure_mpa <= 0.001:
-            return 10.0  # Very low pressure
-        
-        # FIXED: Use correct correlation for steam saturation temperature
-        # For PWR pressures (6-7 MPa), saturation temperature should be ~280-290°C
-        # Using simplified Clausius-Clapeyron relation
-        
-        # Reference point: 1 atm (0.101325 MPa) -> 100°C
-        p_ref = 0.101325  # MPa
-        t_ref = 100.0     # °C
-        
-        # Latent heat of vaporization (approximate)
-        h_fg = 2257.0  # kJ/kg at 100°C
-        
-        # Gas constant for water vapor
-        r_v = 0.4615  # kJ/kg/K
-        
-        # Clausius-Clapeyron equation: ln(P2/P1) = (h_fg/R_v) * (1/T1 - 1/T2)
-        # Rearranged: T2 = 1 / (1/T1 - (R_v/h_fg) * ln(P2/P1))
-        
-        t_ref_k = t_ref + 273.15  # Convert to Kelvin
-        pressure_ratio = pressure_mpa / p_ref
-        
-        if pressure_ratio > 0:
-            temp_k = 1.0 / (1.0/t_ref_k - (r_v/h_fg) * np.log(pressure_ratio))
-            temp_c = temp_k - 273.15
-        else:
-            temp_c = t_ref
-        
-        # For typical PWR steam pressure (6.9 MPa), this should give ~285°C
-        return np.clip(temp_c, 10.0, 374.0)  # Physical limits for water
+        return _STEAM_PROPERTIES.saturation_temperature(pressure_mpa)
     
     def set_load_demand(self, load: float) -> None:
         """
@@ -1511,7 +1644,7 @@ class SecondaryReactorPhysics:
             Dictionary with system-level state variables and heat flow data
         """
         # Get heat flow summary from tracker
-        heat_flow_summary = self.heat_flow_tracker.get_heat_flow_summary()
+        heat_flow_summary = self.heat_flow_tracker.get_heat_flow_summary(self.heat_flow_tracker.last_validation)
         
         # Return system-level coordination states plus heat flow data
         state_dict = {
@@ -0,0 +1,234 @@
+"""
+Balance Validation Policies
+
+This module decides how often the heat and chemistry flow trackers audit the
+secondary-side balances, and stores the audit history.
+
+The balance audits (system flow calculation, validation, alarm and correction
+generation) are diagnostics: nothing in the plant physics reads them back. A
+ValidationPolicy selects how often they run:
+
+- ``every``: audit on every update (default, matches earlier behaviour)
+- ``interval``: audit every ``interval``-th update
+- ``deadband``: audit when any balance input moved by more than ``tolerance``
+  (relative) since the last audit, and at least every ``max_interval``
+  updates when that is set
+- ``off``: never audit on update; the trackers report their last audit
+
+Any tracker can still be audited on demand regardless of its policy.
+
+Audit summaries go into a BalanceHistory, a fixed-size NumPy ring buffer of
+the numeric summary entries, instead of a list of nested dicts.
+
+Usage:
+    schedule = ValidationSchedule(ValidationPolicy(mode='interval', interval=60))
+    if schedule.due(signature):
+        ...  # calculate and validate the balance
+        schedule.record(signature)
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+VALIDATION_MODES = ('every', 'interval', 'deadband', 'off')
+
+# Summary entries stored in the history (status strings are left out)
+_HISTORY_TYPES = (bool, int, float, np.bool_, np.number)
+
+
+@dataclass
+class ValidationPolicy:
+    """How often a balance is audited"""
+    mode: str = 'every'
+    interval: int = 1           # Updates between audits ('interval')
+    tolerance: float = 0.0      # Relative input change that triggers an audit ('deadband')
+    max_interval: int = 0       # Longest run of updates without an audit ('deadband'; 0 = no limit)
+    history_size: int = 1000    # Audits kept in the history ring buffer
+
+    def __post_init__(self):
+        if self.mode not in VALIDATION_MODES:
+            raise ValueError(f"Unknown validation policy mode '{self.mode}'. "
+                             f"Expected one of {list(VALIDATION_MODES)}")
+        self.interval = max(1, int(self.interval))
+        self.tolerance = abs(float(self.tolerance))
+        self.max_interval = max(0, int(self.max_interval))
+        self.history_size = max(1, int(self.history_size))
+
+    @classmethod
+    def from_config(cls, config: Any) -> 'ValidationPolicy':
+        """
+        Build a policy from a config entry.
+
+        Args:
+            config: ValidationPolicy, dict of fields, a mode name, or an int
+                (audit interval)
+
+        Returns:
+            ValidationPolicy
+        """
+        if isinstance(config, cls):
+            return config
+        if isinstance(config, str):
+            return cls(mode=config)
+        if isinstance(config, int) and not isinstance(config, bool):
+            return cls(mode='interval', interval=config)
+        return cls(**{k: v for k, v in dict(config).items() if k in cls.__dataclass_fields__})
+
+
+class ValidationSchedule:
+    """
+    Applies a ValidationPolicy to a stream of updates
+
+    The caller asks due() on every update, passing the balance inputs as a
+    signature for deadband policies, and calls record() after auditing.
+    """
+
+    def __init__(self, policy: Optional[ValidationPolicy] = None):
+        """
+        Initialize schedule.
+
+        Args:
+            policy: Validation policy (audit on every update if None)
+        """
+        self.policy = policy if policy is not None else ValidationPolicy()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the last audit (the next due() call starts a new run)"""
+        self.updates_since_audit = 0
+        self.audit_count = 0
+        self.last_signature: Optional[Tuple[float, ...]] = None
+        self.requested = False
+
+    def request(self) -> None:
+        """Audit on the next update regardless of the policy"""
+        self.requested = True
+
+    def due(self, signature: Optional[Sequence[float]] = None) -> bool:
+        """
+        Count one update and decide whether it is audited.
+
+        Args:
+            signature: Balance inputs of this update (deadband policies audit
+                every update without one)
+
+        Returns:
+            True if the balance should be audited now
+        """
+        self.updates_since_audit += 1
+        policy = self.policy
+        mode = policy.mode
+        if self.requested or mode == 'every':
+            return True
+        if mode == 'off':
+            return False
+        if mode == 'interval':
+            return self.audit_count == 0 or self.updates_since_audit >= policy.interval
+        if policy.max_interval and self.updates_since_audit >= policy.max_interval:
+            return True
+        last = self.last_signature
+        if signature is None or last is None or len(signature) != len(last):
+            return True
+        tolerance = policy.tolerance
+        for new, old in zip(signature, last):
+            if abs(new - old) > tolerance * abs(old):
+                return True
+        return False
+
+    def record(self, signature: Optional[Sequence[float]] = None) -> None:
+        """
+        Note that the balance was audited.
+
+        Args:
+            signature: Balance inputs the audit used
+        """
+        self.updates_since_audit = 0
+        self.audit_count += 1
+        self.requested = False
+        self.last_signature = tuple(signature) if signature is not None else None
+
+
+class BalanceHistory:
+    """
+    Fixed-size ring buffer of balance audit summaries
+
+    Each audit is one float64 row holding the numeric and boolean entries of
+    its summary; the columns are taken from the first summary appended. Once
+    ``size`` rows are held the oldest row is overwritten.
+    """
+
+    def __init__(self, size: int = 1000):
+        """
+        Initialize history.
+
+        Args:
+            size: Number of audits kept
+        """
+        self.size = max(1, int(size))
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop all rows and the column schema"""
+        self.columns: Tuple[str, ...] = ()
+        self._times = np.empty(self.size)
+        self._rows: Optional[np.ndarray] = None
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, timestamp: float, summary: Dict[str, Any]) -> None:
+        """
+        Add one audit summary.
+
+        Args:
+            timestamp: Audit time (operating hours)
+            summary: Summary dictionary (non-numeric entries are not stored)
+        """
+        if self._rows is None:
+            self.columns = tuple(name for name, value in summary.items() if isinstance(value, _HISTORY_TYPES))
+            self._rows = np.empty((self.size, len(self.columns)))
+        pos = self._next
+        self._times[pos] = timestamp
+        self._rows[pos] = [summary.get(name, np.nan) for name in self.columns]
+        self._next = (pos + 1) % self.size
+        if self._count < self.size:
+            self._count += 1
+
+    def _order(self) -> np.ndarray:
+        """Physical row positions in chronological order"""
+        if self._count < self.size:
+            return np.arange(self._count)
+        return np.roll(np.arange(self.size), -self._next)
+
+    def times(self) -> np.ndarray:
+        """Audit times, oldest first"""
+        return self._times[self._order()]
+
+    def column(self, name: str) -> np.ndarray:
+        """Values of one summary entry, oldest first"""
+        if self._rows is None:
+            return np.empty(0)
+        return self._rows[self._order(), self.columns.index(name)]
+
+    def to_array(self) -> np.ndarray:
+        """All rows (audits x columns), oldest first"""
+        if self._rows is None:
+            return np.empty((0, 0))
+        return self._rows[self._order()]
+
+    def records(self) -> List[Dict[str, float]]:
+        """All rows as dictionaries with a 'timestamp' entry, oldest first"""
+        rows = self.to_array().tolist()
+        return [dict(zip(self.columns, row), timestamp=time) for time, row in zip(self.times().tolist(), rows)]
+
+    def latest(self) -> Optional[Dict[str, float]]:
+        """Most recent row as a dictionary, or None if empty"""
+        if not self._count:
+            return None
+        pos = (self._next - 1) % self.size
+        return dict(zip(self.columns, self._rows[pos].tolist()), timestamp=float(self._times[pos]))
@@ -10,6 +10,7 @@ Key Features:
 3. System-wide mass balance validation
 4. Chemistry transport modeling
 5. Fouling and corrosion rate calculations
+6. Configurable audit rate (see balance_validation.ValidationPolicy)
 
 Design Philosophy:
 - Mirror the heat_flow_tracker.py architecture exactly
@@ -23,6 +24,24 @@ from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 from enum import Enum
+from simulator.sim_logging import get_logger
+from .balance_validation import BalanceHistory, ValidationPolicy, ValidationSchedule
+
+logger = get_logger(__name__)
+
+# Water chemistry results whose change triggers a deadband balance audit
+BALANCE_SIGNATURE_KEYS = (
+    'water_chemistry_ph',
+    'water_chemistry_iron_concentration',
+    'water_chemistry_copper_concentration',
+    'water_chemistry_silica_concentration',
+    'water_chemistry_dissolved_oxygen',
+    'water_chemistry_hardness',
+    'water_chemistry_chloride',
+    'water_chemistry_tds',
+    'water_chemistry_chlorine_residual',
+    'water_chemistry_treatment_efficiency',
+)
 
 
 class ChemicalSpecies(Enum):
@@ -387,16 +406,17 @@ class ChemistryFlowTracker:
     and provides comprehensive mass balance analysis.
     """
     
-    def __init__(self, chemistry_flow_providers: Optional[Dict[str, ChemistryFlowProvider]] = None):
+    def __init__(self, chemistry_flow_providers: Optional[Dict[str, ChemistryFlowProvider]] = None,
+                 validation_policy: Optional[ValidationPolicy] = None):
         """
         Initialize chemistry flow tracker
         
         Args:
             chemistry_flow_providers: Dictionary of component name -> ChemistryFlowProvider instances
+            validation_policy: How often update_balance() audits the chemistry balance
         """
         self.chemistry_flow_state = ChemistryFlowState()
         self.component_chemistry = {}  # Store individual component chemistry
-        self.chemistry_history = []    # Store historical chemistry data
         self.validation_tolerance = 0.05  # 5% tolerance for mass balance
         
         # Store chemistry flow providers for automatic updates
@@ -404,6 +424,40 @@ class ChemistryFlowTracker:
         
         # Initialize default chemistry values
         self._initialize_default_chemistry()
+        
+        # Audit rate and history of audit summaries
+        self.validation = ValidationSchedule(validation_policy)
+        self.chemistry_history = BalanceHistory(self.validation.policy.history_size)
+        self.last_validation = self.validate_chemistry_balance()
+    
+    def set_validation_policy(self, policy: ValidationPolicy) -> None:
+        """Replace the audit policy (the history is rebuilt if its size changes)"""
+        self.validation.policy = policy
+        if policy.history_size != self.chemistry_history.size:
+            self.chemistry_history = BalanceHistory(policy.history_size)
+    
+    def update_balance(self, timestamp: float, signature: Optional[List[float]] = None,
+                       force: bool = False) -> Tuple[ChemistryFlowState, Dict[str, Any]]:
+        """
+        Collect provider chemistry, then calculate, validate and record the
+        chemistry balance if the validation policy says it is due
+        
+        Args:
+            timestamp: Operating hours recorded with the audit
+            signature: Chemistry inputs compared by deadband policies
+                (e.g. the BALANCE_SIGNATURE_KEYS water chemistry results)
+            force: Audit regardless of the policy (on-demand validation)
+            
+        Returns:
+            Chemistry flow state and validation of the latest audit
+        """
+        if force or self.validation.due(signature):
+            self.update_from_providers()
+            self.calculate_system_chemistry_flows()
+            self.last_validation = self.validate_chemistry_balance()
+            self.validation.record(signature)
+            self.add_to_history(timestamp)
+        return self.chemistry_flow_state, self.last_validation
     
     def _initialize_default_chemistry(self) -> None:
         """Initialize default chemistry values for all tracked species"""
@@ -450,7 +504,7 @@ class ChemistryFlowTracker:
                 chemistry_state = provider.get_chemistry_state()
                 self.update_component_chemistry(component_name, chemistry_state, chemistry_flows)
             except Exception as e:
-                print(f"Warning: Failed to get chemistry flows from {component_name}: {e}")
+                logger.warning("Failed to get chemistry flows from %s: %s", component_name, e)
     
     def update_component_chemistry(self, 
                                  component_name: str, 
@@ -913,15 +967,19 @@ class ChemistryFlowTracker:
         else:
             return 'NORMAL'
     
-    def get_chemistry_flow_summary(self) -> Dict[str, Any]:
+    def get_chemistry_flow_summary(self, validation: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Get comprehensive chemistry flow summary
         
+        Args:
+            validation: Validation of the current state (recomputed if None)
+            
         Returns:
             Dictionary with all chemistry flow data
         """
         state = self.chemistry_flow_state
-        validation = self.validate_chemistry_balance()
+        if validation is None:
+            validation = self.validate_chemistry_balance()
         
         return {
             # Primary chemistry parameters
@@ -963,17 +1021,8 @@ class ChemistryFlowTracker:
         }
     
     def add_to_history(self, timestamp: float) -> None:
-        """Add current state to historical data"""
-        history_entry = {
-            'timestamp': timestamp,
-            'chemistry_flows': self.get_chemistry_flow_summary(),
-            'component_chemistry': self.component_chemistry.copy()
-        }
-        self.chemistry_history.append(history_entry)
-        
-        # Limit history size
-        if len(self.chemistry_history) > 1000:
-            self.chemistry_history = self.chemistry_history[-1000:]
+        """Add the current chemistry flow summary to the history ring buffer"""
+        self.chemistry_history.append(timestamp, self.get_chemistry_flow_summary(self.last_validation))
     
     def get_state_dict(self) -> Dict[str, float]:
         """Get current state as dictionary for logging/monitoring"""
@@ -1010,8 +1059,10 @@ class ChemistryFlowTracker:
         """Reset chemistry flow tracker to initial state"""
         self.chemistry_flow_state = ChemistryFlowState()
         self.component_chemistry = {}
-        self.chemistry_history = []
         self._initialize_default_chemistry()
+        self.chemistry_history.clear()
+        self.validation.reset()
+        self.last_validation = self.validate_chemistry_balance()
 
 
 # Example usage and testing
@@ -28,9 +28,11 @@ import numpy as np
 
 # Import state management interfaces
 from simulator.state import auto_register
+from simulator.core.scheduler import MultiRateScheduler
 
 # Import heat flow tracking
 from ..heat_flow_tracker import HeatFlowProvider, ThermodynamicProperties
+from ..steam_properties import H_FG_REFERENCE, T_CRITICAL, liquid_enthalpy, steam_properties
 
 from .vacuum_system import VacuumSystem, VacuumSystemConfig
 from .vacuum_pump import SteamEjectorConfig
@@ -47,6 +49,12 @@ warnings.filterwarnings("ignore")
 # NOTE: TubeDegradationConfig and FoulingConfig moved to condenser/config.py
 # Import them from the centralized configuration system
 from .config import CondenserTubeDegradationConfig, CondenserFoulingConfig
+from simulator.sim_logging import get_logger
+
+logger = get_logger(__name__)
+
+# Saturation properties the condenser models are calibrated against
+_STEAM_PROPERTIES = steam_properties('antoine')
 
 
 class TubeDegradationModel:
@@ -491,25 +499,25 @@ class EnhancedCondenserPhysics(HeatFlowProvider, ChemistryFlowProvider):
                 # Try to create CondenserConfig from dict if possible
                 if hasattr(CondenserConfig, 'from_dict'):
                     self.config = CondenserConfig.from_dict(config_dict)
-                    print(f"CONDENSER: Using unified configuration system")
+                    logger.info("CONDENSER: Using unified configuration system")
                 else:
                     # Fallback: use default config and store raw data
                     from .config import create_standard_condenser_config
                     self.config = create_standard_condenser_config()
                     self.config._raw_config_data = config_dict
-                    print(f"CONDENSER: Using default config with raw config data")
+                    logger.info("CONDENSER: Using default config with raw config data")
             except Exception as e:
-                print(f"CONDENSER: Failed to create config from dict: {e}")
+                logger.warning("CONDENSER: Failed to create config from dict: %s", e)
                 from .config import create_standard_condenser_config
                 self.config = create_standard_condenser_config()
                 self.config._raw_config_data = config_dict
         elif config is not None:
             self.config = config
-            print(f"CONDENSER: Using provided CondenserConfig")
+            logger.info("CONDENSER: Using provided CondenserConfig")
         else:
             from .config import create_standard_condenser_config
             self.config = create_standard_condenser_config()
-            print(f"CONDENSER: Using default configuration")
+            logger.info("CONDENSER: Using default configuration")
         
         # Initialize sub-models using centralized configuration
         tube_config = self.config.tube_degradation
@@ -537,6 +545,14 @@ class EnhancedCondenserPhysics(HeatFlowProvider, ChemistryFlowProvider):
         self.water_treatment = self.water_chemistry  # Use unified water chemistry system
         self.vacuum_system = VacuumSystem(vacuum_config)
         
+        # Tube wear and fouling evolve over hours: with multi-rate scheduling enabled
+        # they update hourly with the accumulated dt (every step otherwise)
+        self.scheduler = MultiRateScheduler()
+        self.scheduler.add('tube_degradation', self.tube_degradation, 'update_tube_failures',
+                           dt_unit='hours', period=60.0, slow=True)
+        self.scheduler.add('condenser_fouling', self.fouling_model, 'update_fouling',
+                           dt_unit='hours', period=60.0, slow=True)
+        
         # Basic condenser state (similar to original model)
         self.steam_inlet_pressure = 0.007      # MPa
         self.steam_inlet_temperature = 39.0    # °C
@@ -805,19 +821,20 @@ class EnhancedCondenserPhysics(HeatFlowProvider, ChemistryFlowProvider):
         cooling_water_velocity = (cooling_water_flow / 1000.0) / total_flow_area  # m/s
         
         # Update tube degradation
-        tube_degradation_results = self.tube_degradation.update_tube_failures(
+        # (dt is in hours; the scheduler runs in minutes)
+        tube_degradation_results = self.scheduler.run(
+            'tube_degradation', dt * 60.0,
             cooling_water_velocity=cooling_water_velocity,
-            water_chemistry_aggressiveness=water_aggressiveness,
-            dt=dt
+            water_chemistry_aggressiveness=water_aggressiveness
         )
         
         # Update fouling model
         avg_cooling_water_temp = (cooling_water_temp_in + self.cooling_water_outlet_temp) / 2.0
-        fouling_results = self.fouling_model.update_fouling(
+        fouling_results = self.scheduler.run(
+            'condenser_fouling', dt * 60.0,
             water_temp=avg_cooling_water_temp,
             water_chemistry=water_quality_results,
-            flow_velocity=cooling_water_velocity,
-            dt=dt
+            flow_velocity=cooling_water_velocity
         )
         
         # Update vacuum system
@@ -1059,7 +1076,7 @@ class EnhancedCondenserPhysics(HeatFlowProvider, ChemistryFlowProvider):
         self.maintenance_system = maintenance_system
         self.component_id = component_id
         
-        print(f"ENHANCED CONDENSER {component_id}: Setting up maintenance integration")
+        logger.info("ENHANCED CONDENSER %s: Setting up maintenance integration", component_id)
         
         # Register main condenser system
         condenser_monitoring_config = {
@@ -1107,7 +1124,7 @@ class EnhancedCondenserPhysics(HeatFlowProvider, ChemistryFlowProvider):
         )
         
         # Register individual vacuum ejectors
-        print(f"  Setting up vacuum system maintenance integration...")
+        logger.info("  Setting up vacuum system maintenance integration...")
         ejector_count = 0
         for ejector_id, ejector in self.vacuum_system.ejectors.items():
             ejector_monitoring_config = {
@@ -1177,12 +1194,12 @@ class EnhancedCondenserPhysics(HeatFlowProvider, ChemistryFlowProvider):
             monitoring_config=vacuum_monitoring_config
         )
         
-        print(f"  Enhanced condenser maintenance integration complete")
-        print(f"  Total Registered Components: {1 + ejector_count + 1}")  # Condenser + ejectors + vacuum system
+        logger.info("  Enhanced condenser maintenance integration complete")
+        logger.info("  Total Registered Components: %s", 1 + ejector_count + 1)  # Condenser + ejectors + vacuum system
     
     def _setup_ejector_maintenance(self, ejector, maintenance_system, component_id: str):
         """Set up maintenance integration for individual ejector"""
-        print(f"VACUUM EJECTOR {component_id}: Setting up maintenance integration")
+        logger.info("VACUUM EJECTOR %s: Setting up maintenance integration", component_id)
     
     
     def perform_maintenance(self, maintenance_type: str, **kwargs):
@@ -1378,134 +1395,134 @@ class EnhancedCondenserPhysics(HeatFlowProvider, ChemistryFlowProvider):
         Args:
             initial_conditions: CondenserInitialConditions object with initial condition parameters
         """
-        print(f"CONDENSER: Applying initial conditions...")
+        logger.info("CONDENSER: Applying initial conditions...")
         initial_conditions = self.config.initial_conditions
         
         # Steam conditions
         if hasattr(initial_conditions, 'steam_inlet_pressure') and initial_conditions.steam_inlet_pressure is not None:
             self.steam_inlet_pressure = initial_conditions.steam_inlet_pressure
-            print(f"  Steam inlet pressure: {self.steam_inlet_pressure} MPa")
+            logger.info("  Steam inlet pressure: %s MPa", self.steam_inlet_pressure)
         
         if hasattr(initial_conditions, 'steam_inlet_temperature') and initial_conditions.steam_inlet_temperature is not None:
             self.steam_inlet_temperature = initial_conditions.steam_inlet_temperature
-            print(f"  Steam inlet temperature: {self.steam_inlet_temperature} °C")
+            logger.info("  Steam inlet temperature: %s °C", self.steam_inlet_temperature)
         
         if hasattr(initial_conditions, 'steam_inlet_flow') and initial_conditions.steam_inlet_flow is not None:
             self.steam_inlet_flow = initial_conditions.steam_inlet_flow
-            print(f"  Steam inlet flow: {self.steam_inlet_flow} kg/s")
+            logger.info("  Steam inlet flow: %s kg/s", self.steam_inlet_flow)
         
         if hasattr(initial_conditions, 'steam_inlet_quality') and initial_conditions.steam_inlet_quality is not None:
             self.steam_inlet_quality = initial_conditions.steam_inlet_quality
-            print(f"  Steam inlet quality: {self.steam_inlet_quality}")
+            logger.info("  Steam inlet quality: %s", self.steam_inlet_quality)
         
         # Condensate conditions
         if hasattr(initial_conditions, 'condensate_temperature') and initial_conditions.condensate_temperature is not None:
             self.condensate_temperature = initial_conditions.condensate_temperature
-            print(f"  Condensate temperature: {self.condensate_temperature} °C")
+            logger.info("  Condensate temperature: %s °C", self.condensate_temperature)
         
         if hasattr(initial_conditions, 'condensate_flow') and initial_conditions.condensate_flow is not None:
             self.condensate_flow = initial_conditions.condensate_flow
-            print(f"  Condensate flow: {self.condensate_flow} kg/s")
+            logger.info("  Condensate flow: %s kg/s", self.condensate_flow)
         
         # Cooling water conditions
         if hasattr(initial_conditions, 'cooling_water_inlet_temp') and initial_conditions.cooling_water_inlet_temp is not None:
             self.cooling_water_inlet_temp = initial_conditions.cooling_water_inlet_temp
-            print(f"  Cooling water inlet temp: {self.cooling_water_inlet_temp} °C")
+            logger.info("  Cooling water inlet temp: %s °C", self.cooling_water_inlet_temp)
         
         if hasattr(initial_conditions, 'cooling_water_outlet_temp') and initial_conditions.cooling_water_outlet_temp is not None:
             self.cooling_water_outlet_temp = initial_conditions.cooling_water_outlet_temp
-            print(f"  Cooling water outlet temp: {self.cooling_water_outlet_temp} °C")
+            logger.info("  Cooling water outlet temp: %s °C", self.cooling_water_outlet_temp)
         
         if hasattr(initial_conditions, 'cooling_water_flow') and initial_conditions.cooling_water_flow is not None:
             self.cooling_water_flow = initial_conditions.cooling_water_flow
-            print(f"  Cooling water flow: {self.cooling_water_flow} kg/s")
+            logger.info("  Cooling water flow: %s kg/s", self.cooling_water_flow)
         
         # Heat transfer conditions
         if hasattr(initial_conditions, 'heat_rejection_rate') and initial_conditions.heat_rejection_rate is not None:
             self.heat_rejection_rate = initial_conditions.heat_rejection_rate
-            print(f"  Heat rejection rate: {self.heat_rejection_rate/1e6:.1f} MW")
+            logger.info("  Heat rejection rate: %.1f MW", self.heat_rejection_rate/1e6)
         
         if hasattr(initial_conditions, 'overall_htc') and initial_conditions.overall_htc is not None:
             self.overall_htc = initial_conditions.overall_htc
-            print(f"  Overall HTC: {self.overall_htc} W/m²/K")
+            logger.info("  Overall HTC: %s W/m²/K", self.overall_htc)
         
         if hasattr(initial_conditions, 'thermal_performance_factor') and initial_conditions.thermal_performance_factor is not None:
             self.thermal_performance_factor = initial_conditions.thermal_performance_factor
-            print(f"  Thermal performance factor: {self.thermal_performance_factor}")
+            logger.info("  Thermal performance factor: %s", self.thermal_performance_factor)
         
         # Vacuum system conditions
         if hasattr(initial_conditions, 'condenser_pressure') and initial_conditions.condenser_pressure is not None:
             # Apply to vacuum system
             self.vacuum_system.condenser_pressure = initial_conditions.condenser_pressure
-            print(f"  Condenser pressure: {initial_conditions.condenser_pressure} MPa")
+            logger.info("  Condenser pressure: %s MPa", initial_conditions.condenser_pressure)
         
         if hasattr(initial_conditions, 'air_partial_pressure') and initial_conditions.air_partial_pressure is not None:
             # Apply to vacuum system
             if hasattr(self.vacuum_system, 'air_partial_pressure'):
                 self.vacuum_system.air_partial_pressure = initial_conditions.air_partial_pressure
-            print(f"  Air partial pressure: {initial_conditions.air_partial_pressure} MPa")
+            logger.info("  Air partial pressure: %s MPa", initial_conditions.air_partial_pressure)
         
         if hasattr(initial_conditions, 'air_removal_rate') and initial_conditions.air_removal_rate is not None:
             # Apply to vacuum system
             if hasattr(self.vacuum_system, 'air_removal_rate'):
                 self.vacuum_system.air_removal_rate = initial_conditions.air_removal_rate
-            print(f"  Air removal rate: {initial_conditions.air_removal_rate} kg/s")
+            logger.info("  Air removal rate: %s kg/s", initial_conditions.air_removal_rate)
         
         # Tube conditions
         if hasattr(initial_conditions, 'active_tube_count') and initial_conditions.active_tube_count is not None:
             self.tube_degradation.active_tube_count = initial_conditions.active_tube_count
-            print(f"  Active tube count: {self.tube_degradation.active_tube_count}")
+            logger.info("  Active tube count: %s", self.tube_degradation.active_tube_count)
         
         if hasattr(initial_conditions, 'plugged_tube_count') and initial_conditions.plugged_tube_count is not None:
             self.tube_degradation.plugged_tube_count = initial_conditions.plugged_tube_count
-            print(f"  Plugged tube count: {self.tube_degradation.plugged_tube_count}")
+            logger.info("  Plugged tube count: %s", self.tube_degradation.plugged_tube_count)
         
         if hasattr(initial_conditions, 'average_wall_thickness') and initial_conditions.average_wall_thickness is not None:
             self.tube_degradation.average_wall_thickness = initial_conditions.average_wall_thickness
-            print(f"  Average wall thickness: {self.tube_degradation.average_wall_thickness} m")
+            logger.info("  Average wall thickness: %s m", self.tube_degradation.average_wall_thickness)
         
         if hasattr(initial_conditions, 'tube_leak_rate') and initial_conditions.tube_leak_rate is not None:
             self.tube_degradation.tube_leak_rate = initial_conditions.tube_leak_rate
-            print(f"  Tube leak rate: {self.tube_degradation.tube_leak_rate} kg/s")
+            logger.info("  Tube leak rate: %s kg/s", self.tube_degradation.tube_leak_rate)
         
         # Fouling conditions
         if hasattr(initial_conditions, 'biofouling_thickness') and initial_conditions.biofouling_thickness is not None:
             self.fouling_model.biofouling_thickness = initial_conditions.biofouling_thickness
-            print(f"  Biofouling thickness: {self.fouling_model.biofouling_thickness} mm")
+            logger.info("  Biofouling thickness: %s mm", self.fouling_model.biofouling_thickness)
         
         if hasattr(initial_conditions, 'scale_thickness') and initial_conditions.scale_thickness is not None:
             self.fouling_model.scale_thickness = initial_conditions.scale_thickness
-            print(f"  Scale thickness: {self.fouling_model.scale_thickness} mm")
+            logger.info("  Scale thickness: %s mm", self.fouling_model.scale_thickness)
         
         if hasattr(initial_conditions, 'corrosion_thickness') and initial_conditions.corrosion_thickness is not None:
             self.fouling_model.corrosion_product_thickness = initial_conditions.corrosion_thickness
-            print(f"  Corrosion thickness: {self.fouling_model.corrosion_product_thickness} mm")
+            logger.info("  Corrosion thickness: %s mm", self.fouling_model.corrosion_product_thickness)
         
         if hasattr(initial_conditions, 'total_fouling_resistance') and initial_conditions.total_fouling_resistance is not None:
             self.fouling_model.total_fouling_resistance = initial_conditions.total_fouling_resistance
-            print(f"  Total fouling resistance: {self.fouling_model.total_fouling_resistance} m²K/W")
+            logger.info("  Total fouling resistance: %s m²K/W", self.fouling_model.total_fouling_resistance)
         
         if hasattr(initial_conditions, 'time_since_cleaning') and initial_conditions.time_since_cleaning is not None:
             self.fouling_model.time_since_cleaning = initial_conditions.time_since_cleaning
-            print(f"  Time since cleaning: {self.fouling_model.time_since_cleaning} hours")
+            logger.info("  Time since cleaning: %s hours", self.fouling_model.time_since_cleaning)
         
         # Water quality conditions (apply to water chemistry system)
         water_quality_updates = {}
         if hasattr(initial_conditions, 'water_ph') and initial_conditions.water_ph is not None:
             water_quality_updates['ph'] = initial_conditions.water_ph
-            print(f"  Water pH: {initial_conditions.water_ph}")
+            logger.info("  Water pH: %s", initial_conditions.water_ph)
         
         if hasattr(initial_conditions, 'water_hardness') and initial_conditions.water_hardness is not None:
             water_quality_updates['hardness'] = initial_conditions.water_hardness
-            print(f"  Water hardness: {initial_conditions.water_hardness} mg/L")
+            logger.info("  Water hardness: %s mg/L", initial_conditions.water_hardness)
         
         if hasattr(initial_conditions, 'chlorine_residual') and initial_conditions.chlorine_residual is not None:
             water_quality_updates['chlorine_residual'] = initial_conditions.chlorine_residual
-            print(f"  Chlorine residual: {initial_conditions.chlorine_residual} mg/L")
+            logger.info("  Chlorine residual: %s mg/L", initial_conditions.chlorine_residual)
         
         if hasattr(initial_conditions, 'dissolved_oxygen') and initial_conditions.dissolved_oxygen is not None:
             water_quality_updates['dissolved_oxygen'] = initial_conditions.dissolved_oxygen
-            print(f"  Dissolved oxygen: {initial_conditions.dissolved_oxygen} mg/L")
+            logger.info("  Dissolved oxygen: %s mg/L", initial_conditions.dissolved_oxygen)
         
         # Apply water quality updates to water chemistry system
         if water_quality_updates:
@@ -1521,12 +1538,12 @@ class EnhancedCondenserPhysics(HeatFlowProvider, ChemistryFlowProvider):
         # Operating conditions
         if hasattr(initial_conditions, 'operating_hours') and initial_conditions.operating_hours is not None:
             self.operating_hours = initial_conditions.operating_hours
-            print(f"  Operating hours: {self.operating_hours}")
+            logger.info("  Operating hours: %s", self.operating_hours)
         
         # Update derived parameters after applying initial conditions
         self._update_derived_parameters()
         
-        print(f"CONDENSER: Initial conditions applied successfully")
+        logger.info("CONDENSER: Initial conditions applied successfully")
     
     def _update_derived_parameters(self) -> None:
         """Update derived parameters after initial conditions are applied"""
@@ -1553,6 +1570,22 @@ class EnhancedCondenserPhysics(HeatFlowProvider, ChemistryFlowProvider):
         
         self.thermal_performance_factor = area_factor * fouling_factor * vacuum_factor
 
+    def advance_degradation(self, dt: float) -> None:
+        """
+        Advance tube wear, fouling and ejector degradation at the last
+        operating conditions
+
+        Used by steady-state fast-forward while the condenser thermal state is held.
+
+        Args:
+            dt: Time step (hours)
+        """
+        self.scheduler.advance_degradation(dt * 60.0)
+        for ejector in self.vacuum_system.ejectors.values():
+            ejector.update_degradation(dt)
+        self.vacuum_system.update_air_leakage(dt)
+        self.operating_hours += dt
+
     def reset(self) -> None:
         """Reset enhanced condenser to initial conditions"""
         # Reset basic state
@@ -1572,6 +1605,7 @@ class EnhancedCondenserPhysics(HeatFlowProvider, ChemistryFlowProvider):
         
         # Reset sub-models
         self.vacuum_system.reset()
+        self.scheduler.reset()
         
         # Reset tube degradation
         self.tube_degradation.active_tube_count = self.tube_degradation.config.initial_tube_count
@@ -1823,35 +1857,26 @@ class EnhancedCondenserPhysics(HeatFlowProvider, ChemistryFlowProvider):
     # Thermodynamic property methods (same as original condenser)
     def _saturation_temperature(self, pressure_mpa: float) -> float:
         """Calculate saturation temperature for given pressure"""
-        if pressure_mpa <= 0.001:
-            return 10.0
-        
-        A, B, C = 8.07131, 1730.63, 233.426
-        pressure_bar = pressure_mpa * 10.0
-        pressure_bar = np.clip(pressure_bar, 0.01, 100.0)
-        
-        temp_c = B / (A - np.log10(pressure_bar)) - C
+        temp_c = _STEAM_PROPERTIES.saturation_temperature(pressure_mpa)
         
         if pressure_mpa >= 0.005 and pressure_mpa <= 0.01:
-            temp_c = np.clip(temp_c, 35.0, 45.0)
+            temp_c = min(max(temp_c, 35.0), 45.0)
         
-        return np.clip(temp_c, 10.0, 374.0)
+        return temp_c
     
     def _saturation_enthalpy_liquid(self, pressure_mpa: float) -> float:
         """Calculate saturation enthalpy of liquid water (kJ/kg)"""
-        temp = self._saturation_temperature(pressure_mpa)
-        return 4.18 * temp
+        return liquid_enthalpy(self._saturation_temperature(pressure_mpa))
     
     def _saturation_enthalpy_vapor(self, pressure_mpa: float) -> float:
         """Calculate saturation enthalpy of steam (kJ/kg)"""
         temp = self._saturation_temperature(pressure_mpa)
-        h_f = self._saturation_enthalpy_liquid(pressure_mpa)
-        h_fg = 2257.0 * (1.0 - temp / 374.0) ** 0.38
-        return h_f + h_fg
+        h_fg = H_FG_REFERENCE * (1.0 - temp / T_CRITICAL) ** 0.38
+        return liquid_enthalpy(temp) + h_fg
     
     def _water_enthalpy(self, temp_c: float, pressure_mpa: float) -> float:
         """Calculate enthalpy of liquid water (kJ/kg)"""
-        return 4.18 * temp_c
+        return liquid_enthalpy(temp_c)
 
 
 # Example usage and testing
@@ -39,6 +39,10 @@ except ImportError:
     class TOMLWizard:
         pass
 
+from simulator.sim_logging import get_logger
+
+logger = get_logger(__name__)
+
 
 @dataclass_json
 @dataclass
@@ -551,7 +555,7 @@ class PWR3000ConfigFactory:
             return PWRConfigManager.load_pwr_config(config_file)
         else:
             # Fallback to programmatic creation if YAML not found
-            print(f"Warning: YAML config file not found at {config_file}, using programmatic defaults")
+            logger.warning("YAML config file not found at %s, using programmatic defaults", config_file)
             return create_standard_secondary_config()
     
     @staticmethod
@@ -601,7 +605,7 @@ class PWR3000ConfigFactory:
                 raise ValueError("No 'secondary_system' section found in comprehensive YAML")
                 
         except Exception as e:
-            print(f"Warning: Could not load from comprehensive YAML: {e}")
+            logger.warning("Could not load from comprehensive YAML: %s", e)
             return PWR3000ConfigFactory.create_standard_pwr3000()
 
 
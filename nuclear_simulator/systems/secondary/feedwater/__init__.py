@@ -12,6 +12,7 @@ This module provides comprehensive feedwater system physics modeling including:
 Components:
 - physics.py: Main enhanced feedwater physics model
 - pump_system.py: Individual pump models and coordination
+- pump_bank.py: Array-backed state and physics of the feedwater pumps
 - level_control.py: Three-element control and steam quality management
 - water_chemistry.py: Water quality monitoring and treatment
 - performance_monitoring.py: Cavitation, wear, and diagnostics
@@ -37,6 +38,7 @@ from .pump_system import (
     FeedwaterPumpState,
     FeedwaterPumpConfig
 )
+from .pump_bank import FeedwaterPumpBank
 
 # Import control system components
 from .level_control import (
@@ -89,6 +91,7 @@ __all__ = [
     'FeedwaterPump',
     'FeedwaterPumpState',
     'FeedwaterPumpConfig',
+    'FeedwaterPumpBank',
     
     # Control system
     'ThreeElementControl',
@@ -36,10 +36,13 @@ from ..chemistry_flow_tracker import ChemistryFlowProvider, ChemicalSpecies
 from ..component_descriptions import FEEDWATER_COMPONENT_DESCRIPTIONS
 from .pump_system import FeedwaterPumpSystem, FeedwaterPumpSystemConfig
 from .level_control import ThreeElementControl
-from ..water_chemistry import WaterChemistry, WaterChemistryConfig
+from ..water_chemistry import WaterChemistry, WaterChemistryConfig, chemistry_hours
 from .performance_monitoring import PerformanceDiagnostics, PerformanceDiagnosticsConfig
 from .protection_system import FeedwaterProtectionSystem, FeedwaterProtectionConfig
 from .config import FeedwaterConfig, create_standard_feedwater_config
+from simulator.sim_logging import get_logger
+
+logger = get_logger(__name__)
 
 warnings.filterwarnings("ignore")
 
@@ -81,22 +84,22 @@ class EnhancedFeedwaterPhysics(HeatFlowProvider, ChemistryFlowProvider):
             # Use unified configuration system with dataclass-wizard
             try:
                 self.config = FeedwaterConfig.from_dict(config_dict)
-                print(f"FEEDWATER: Using unified configuration system with dataclass-wizard")
+                logger.info("FEEDWATER: Using unified configuration system with dataclass-wizard")
             except Exception as e:
-                print(f"FEEDWATER: Failed to deserialize with dataclass-wizard: {e}")
-                print(f"FEEDWATER: Falling back to default configuration")
+                logger.warning("FEEDWATER: Failed to deserialize with dataclass-wizard: %s", e)
+                logger.info("FEEDWATER: Falling back to default configuration")
                 self.config = create_standard_feedwater_config()
         elif config is not None:
             # Use provided configuration
             self.config = config
-            print(f"FEEDWATER: Using provided FeedwaterConfig")
+            logger.info("FEEDWATER: Using provided FeedwaterConfig")
         else:
             # Use defaults
             self.config = create_standard_feedwater_config()
-            print(f"FEEDWATER: Using default configuration")
+            logger.info("FEEDWATER: Using default configuration")
         
-        print(f"FEEDWATER: Initialized with system_id={self.config.system_id}, "
-              f"design_flow={self.config.design_total_flow} kg/s")
+        logger.info("FEEDWATER: Initialized with system_id=%s, design_flow=%s kg/s",
+                    self.config.system_id, self.config.design_total_flow)
         
         # Initialize subsystems with configurations from FeedwaterConfig
         pump_config = self.config.pump_system
@@ -141,6 +144,7 @@ class EnhancedFeedwaterPhysics(HeatFlowProvider, ChemistryFlowProvider):
         # Use unified water chemistry system instead of creating our own
         # The water chemistry is managed at the secondary system level
         self.water_quality = None  # Will be set by parent system if needed
+        self._water_quality_conditions = None  # Conditions of the last water quality update (fast-forward)
         
         # Create compatible diagnostics config from new config structure
         from .performance_monitoring import PerformanceDiagnosticsConfig, CavitationConfig, WearTrackingConfig
@@ -171,7 +175,7 @@ class EnhancedFeedwaterPhysics(HeatFlowProvider, ChemistryFlowProvider):
         # CRITICAL: Apply initial conditions after creating components AND initializing SG attributes
         self._apply_initial_conditions()
         
-        print(f"FEEDWATER: Applied initial conditions from config")
+        logger.info("FEEDWATER: Applied initial conditions from config")
         
         # Performance tracking
         self.performance_factor = 1.0                    # Overall performance factor
@@ -194,13 +198,13 @@ class EnhancedFeedwaterPhysics(HeatFlowProvider, ChemistryFlowProvider):
         """
         ic = self.config.initial_conditions
         
-        print(f"FEEDWATER: Applying initial conditions:")
-        print(f"  System flow rate: {ic.total_flow_rate} kg/s")
-        print(f"  System efficiency: {ic.system_efficiency}")
-        print(f"  Pump oil levels: {ic.pump_oil_levels}")
-        print(f"  Bearing temperatures: {ic.bearing_temperatures}")
-        print(f"  Pump vibrations: {ic.pump_vibrations}")
-        print(f"  Running pumps: {ic.running_pumps}")
+        logger.info("FEEDWATER: Applying initial conditions:")
+        logger.info("  System flow rate: %s kg/s", ic.total_flow_rate)
+        logger.info("  System efficiency: %s", ic.system_efficiency)
+        logger.info("  Pump oil levels: %s", ic.pump_oil_levels)
+        logger.info("  Bearing temperatures: %s", ic.bearing_temperatures)
+        logger.info("  Pump vibrations: %s", ic.pump_vibrations)
+        logger.info("  Running pumps: %s", ic.running_pumps)
 
         # Apply system-level initial conditions
         # CRITICAL FIX: Calculate total flow rate from actual SG steam flows
@@ -212,10 +216,10 @@ class EnhancedFeedwaterPhysics(HeatFlowProvider, ChemistryFlowProvider):
         self.sg_steam_flows = ic.sg_steam_flows.copy()
         self.sg_steam_qualities = ic.sg_steam_qualities.copy()
         
-        print(f"FEEDWATER: Calculated total flow rate from SG conditions:")
-        print(f"  Individual SG flows: {self.sg_steam_flows}")
-        print(f"  Total flow rate: {self.total_flow_rate:.1f} kg/s (calculated from SG flows)")
-        print(f"  Config total flow rate: {ic.total_flow_rate:.1f} kg/s (for comparison)")
+        logger.info("FEEDWATER: Calculated total flow rate from SG conditions:")
+        logger.info("  Individual SG flows: %s", self.sg_steam_flows)
+        logger.info("  Total flow rate: %.1f kg/s (calculated from SG flows)", self.total_flow_rate)
+        logger.info("  Config total flow rate: %.1f kg/s (for comparison)", ic.total_flow_rate)
         
         # Apply initial conditions to pump system
         if hasattr(self.pump_system, 'pumps'):
@@ -224,48 +228,48 @@ class EnhancedFeedwaterPhysics(HeatFlowProvider, ChemistryFlowProvider):
             for i, pump_id in enumerate(pump_ids):
                 pump = self.pump_system.pumps[pump_id]
                 
-                print(f"  Applying initial conditions to pump {pump_id}:")
+                logger.info("  Applying initial conditions to pump %s:", pump_id)
                 
                 # === APPLY TO LUBRICATION SYSTEM (SINGLE SOURCE OF TRUTH) ===
                 if hasattr(pump, 'lubrication_system'):
-                    print(f"    Applying lubrication system parameters:")
+                    logger.info("    Applying lubrication system parameters:")
                     
                     # Oil quality parameters (system-wide, single values)
                     if hasattr(ic, 'pump_oil_contamination'):
                         pump.lubrication_system.oil_contamination_level = ic.pump_oil_contamination
-                        print(f"      Oil contamination: {ic.pump_oil_contamination} ppm")
+                        logger.info("      Oil contamination: %s ppm", ic.pump_oil_contamination)
                     
                     if hasattr(ic, 'pump_oil_water_content'):
                         pump.lubrication_system.oil_moisture_content = ic.pump_oil_water_content
-                        print(f"      Oil moisture: {ic.pump_oil_water_content}%")
+                        logger.info("      Oil moisture: %s%%", ic.pump_oil_water_content)
                     
                     if hasattr(ic, 'pump_oil_acid_number'):
                         pump.lubrication_system.oil_acidity_number = ic.pump_oil_acid_number
-                        print(f"      Oil acidity: {ic.pump_oil_acid_number} mg KOH/g")
+                        logger.info("      Oil acidity: %s mg KOH/g", ic.pump_oil_acid_number)
                     
                     # Oil level and temperature (per-pump)
                     if i < len(ic.pump_oil_levels):
                         pump.lubrication_system.oil_level = ic.pump_oil_levels[i]
-                        print(f"      Oil level: {ic.pump_oil_levels[i]}%")
+                        logger.info("      Oil level: %s%%", ic.pump_oil_levels[i])
                     
                     if hasattr(ic, 'oil_temperature'):
                         pump.lubrication_system.oil_temperature = ic.oil_temperature
-                        print(f"      Oil temperature: {ic.oil_temperature}°C")
+                        logger.info("      Oil temperature: %s°C", ic.oil_temperature)
                     
                 # === INDIVIDUAL BEARING WEAR APPLICATION ===
                 # Apply individual bearing wear parameters directly
                 
                 # Motor bearing wear
                 motor_wear = ic.motor_bearing_wear[i] if i < len(ic.motor_bearing_wear) else 0.0
-                print(f"      Motor bearing wear: {motor_wear:.1f}%")
+                logger.info("      Motor bearing wear: %.1f%%", motor_wear)
                 
                 # Pump bearing wear
                 pump_wear = ic.pump_bearing_wear[i] if i < len(ic.pump_bearing_wear) else 0.0
-                print(f"      Pump bearing wear: {pump_wear:.1f}%")
+                logger.info("      Pump bearing wear: %.1f%%", pump_wear)
                 
                 # Thrust bearing wear
                 thrust_wear = ic.thrust_bearing_wear[i] if i < len(ic.thrust_bearing_wear) else 0.0
-                print(f"      Thrust bearing wear: {thrust_wear:.1f}%")
+                logger.info("      Thrust bearing wear: %.1f%%", thrust_wear)
                 
                 # Seal wear
                 seal_wear_value = ic.seal_face_wear[i] if (hasattr(ic, 'seal_face_wear') and i < len(ic.seal_face_wear)) else 0.0
@@ -276,49 +280,49 @@ class EnhancedFeedwaterPhysics(HeatFlowProvider, ChemistryFlowProvider):
                 pump.lubrication_system.component_wear['thrust_bearing'] = thrust_wear
                 pump.lubrication_system.component_wear['mechanical_seals'] = seal_wear_value
                 
-                print(f"      Seal wear: {seal_wear_value:.1f}%")
+                logger.info("      Seal wear: %.1f%%", seal_wear_value)
                 
                 # Seal leakage (per-pump)
                 if hasattr(ic, 'seal_leakage_rate') and i < len(ic.seal_leakage_rate):
                     pump.lubrication_system.seal_leakage_rate = ic.seal_leakage_rate[i]
-                    print(f"      Seal leakage: {ic.seal_leakage_rate[i]} L/min")
+                    logger.info("      Seal leakage: %s L/min", ic.seal_leakage_rate[i])
                 
                 # Recalculate performance factors after setting initial conditions
                 pump.lubrication_system._calculate_pump_performance_factors()
-                print(f"      Performance factors recalculated")
+                logger.info("      Performance factors recalculated")
                 
                 # === APPLY HYDRAULIC CONDITIONS TO PUMP STATE ===
                 # Hydraulic conditions (pump state only)
                 if hasattr(ic, 'suction_pressure'):
                     pump.state.suction_pressure = ic.suction_pressure
-                    print(f"    Suction pressure: {ic.suction_pressure} MPa")
+                    logger.info("    Suction pressure: %s MPa", ic.suction_pressure)
                 
                 if hasattr(ic, 'discharge_pressure'):
                     pump.state.discharge_pressure = ic.discharge_pressure
-                    print(f"    Discharge pressure: {ic.discharge_pressure} MPa")
+                    logger.info("    Discharge pressure: %s MPa", ic.discharge_pressure)
                 
                 if hasattr(ic, 'npsh_available') and i < len(ic.npsh_available):
                     pump.state.npsh_available = ic.npsh_available[i]
-                    print(f"    NPSH available: {ic.npsh_available[i]} m")
+                    logger.info("    NPSH available: %s m", ic.npsh_available[i])
                 
                 # Cavitation conditions (pump hydraulic specific)
                 if hasattr(ic, 'cavitation_intensity') and i < len(ic.cavitation_intensity):
                     pump.state.cavitation_intensity = ic.cavitation_intensity[i]
-                    print(f"    Cavitation intensity: {ic.cavitation_intensity[i]}")
+                    logger.info("    Cavitation intensity: %s", ic.cavitation_intensity[i])
                 
                 if hasattr(ic, 'impeller_cavitation_damage') and i < len(ic.impeller_cavitation_damage):
                     pump.state.cavitation_damage = ic.impeller_cavitation_damage[i] * 10.0  # Scale to damage units
-                    print(f"    Cavitation damage: {pump.state.cavitation_damage}")
+                    logger.info("    Cavitation damage: %s", pump.state.cavitation_damage)
                 
                 # Motor conditions (pump electrical specific)
                 if hasattr(ic, 'motor_temperature') and i < len(ic.motor_temperature):
                     pump.state.motor_temperature = ic.motor_temperature[i]
-                    print(f"    Motor temperature: {ic.motor_temperature[i]}°C")
+                    logger.info("    Motor temperature: %s°C", ic.motor_temperature[i])
                 
                 # Vibration (pump mechanical specific)
                 if i < len(ic.pump_vibrations):
                     pump.state.vibration_level = ic.pump_vibrations[i]
-                    print(f"    Vibration level: {ic.pump_vibrations[i]} mm/s")
+                    logger.info("    Vibration level: %s mm/s", ic.pump_vibrations[i])
                 
                 # === APPLY OPERATIONAL CONDITIONS ===
                 # Apply running status and speed
@@ -331,27 +335,27 @@ class EnhancedFeedwaterPhysics(HeatFlowProvider, ChemistryFlowProvider):
                             pump.state.speed_percent = ic.pump_speeds[i]
                         else:
                             pump.state.speed_percent = 100.0
-                        print(f"    Status: RUNNING at {pump.state.speed_percent}%")
+                        logger.info("    Status: RUNNING at %s%%", pump.state.speed_percent)
                     else:
                         pump.state.status = PumpStatus.STOPPED
                         pump.state.speed_percent = 0.0
-                        print(f"    Status: STOPPED")
+                        logger.info("    Status: STOPPED")
                 
                 # Apply flow conditions
                 if i < len(ic.pump_flows):
                     pump.state.flow_rate = ic.pump_flows[i]
-                    print(f"    Flow rate: {ic.pump_flows[i]} kg/s")
+                    logger.info("    Flow rate: %s kg/s", ic.pump_flows[i])
                 
                 # Apply power conditions
                 if hasattr(ic, 'pump_power') and i < len(ic.pump_power):
                     # pump_power is a fraction, convert to actual power
                     design_power = pump.config.rated_power if hasattr(pump.config, 'rated_power') else 10.0
                     pump.state.power_consumption = ic.pump_power[i] * design_power
-                    print(f"    Power consumption: {pump.state.power_consumption} MW")
+                    logger.info("    Power consumption: %s MW", pump.state.power_consumption)
                 
                 # CRITICAL: Mark that initial conditions have been applied to prevent overwriting
                 pump._initial_conditions_applied = True
-                print(f"    Initial conditions applied flag set for {pump_id}")
+                logger.info("    Initial conditions applied flag set for %s", pump_id)
                 
                 # NO SYNC NEEDED - unidirectional flow from lubrication system to pump state
                 # The integration function handles this automatically
@@ -361,13 +365,13 @@ class EnhancedFeedwaterPhysics(HeatFlowProvider, ChemistryFlowProvider):
         if hasattr(ic, 'lubrication_system_pressure'):
             # FIXED: Handle single value (system-wide parameter)
             self.lubrication_system_pressure = ic.lubrication_system_pressure
-            print(f"  System lubrication pressure: {ic.lubrication_system_pressure} MPa")
+            logger.info("  System lubrication pressure: %s MPa", ic.lubrication_system_pressure)
         
         if hasattr(ic, 'cooling_water_temperature') and ic.cooling_water_temperature:
             # Apply average cooling water temperature
             avg_cooling_temp = sum(ic.cooling_water_temperature) / len(ic.cooling_water_temperature)
             self.cooling_water_temperature = avg_cooling_temp
-            print(f"  System cooling water temp: {avg_cooling_temp}°C")
+            logger.info("  System cooling water temp: %s°C", avg_cooling_temp)
         
         # Apply control system initial conditions
         self.control_mode = ic.control_mode
@@ -420,18 +424,18 @@ class EnhancedFeedwaterPhysics(HeatFlowProvider, ChemistryFlowProvider):
             'sg_steam_qualities': self.sg_steam_qualities
         }
         
-        print(f"FEEDWATER: Passing SG conditions to pump initialization:")
-        print(f"  SG steam flows: {self.sg_steam_flows}")
-        print(f"  SG levels: {self.sg_levels}")
-        print(f"  Total steam flow: {sum(self.sg_steam_flows):.1f} kg/s")
+        logger.info("FEEDWATER: Passing SG conditions to pump initialization:")
+        logger.info("  SG steam flows: %s", self.sg_steam_flows)
+        logger.info("  SG levels: %s", self.sg_levels)
+        logger.info("  Total steam flow: %.1f kg/s", sum(self.sg_steam_flows))
         
         # Re-initialize pumps with actual conditions (this will override the default initialization)
         if hasattr(self.pump_system, '_initialize_pumps'):
             self.pump_system._initialize_pumps(sg_conditions)
-            print(f"FEEDWATER: Pumps re-initialized with actual SG conditions")
+            logger.info("FEEDWATER: Pumps re-initialized with actual SG conditions")
         
-        print(f"FEEDWATER: Initial conditions applied successfully")
-        print(f"  Applied parameters to pump states, lubrication systems, and diagnostics")
+        logger.info("FEEDWATER: Initial conditions applied successfully")
+        logger.info("  Applied parameters to pump states, lubrication systems, and diagnostics")
         
         # Validate that critical initial conditions were applied
         self._validate_initial_conditions_applied()
@@ -447,7 +451,7 @@ class EnhancedFeedwaterPhysics(HeatFlowProvider, ChemistryFlowProvider):
         """
         ic = self.config.initial_conditions
         
-        print(f"FEEDWATER: Validating initial conditions application:")
+        logger.info("FEEDWATER: Validating initial conditions application:")
         
         validation_errors = []
         validation_successes = []
@@ -636,25 +640,25 @@ class EnhancedFeedwaterPhysics(HeatFlowProvider, ChemistryFlowProvider):
         
         # === PRINT VALIDATION RESULTS ===
         
-        print(f"  Validation Results:")
-        print(f"    ✓ Successful validations: {len(validation_successes)}")
-        print(f"    ⚠ Validation errors: {len(validation_errors)}")
+        logger.info("  Validation Results:")
+        logger.info("    ✓ Successful validations: %s", len(validation_successes))
+        logger.warning("    ⚠ Validation errors: %s", len(validation_errors))
         
         if validation_errors:
-            print(f"  Validation Errors:")
+            logger.warning("  Validation Errors:")
             for error in validation_errors[:5]:  # Show first 5 errors
-                print(f"    ⚠ {error}")
+                logger.warning("    ⚠ %s", error)
             if len(validation_errors) > 5:
-                print(f"    ... and {len(validation_errors) - 5} more errors")
+                logger.info("    ... and %s more errors", len(validation_errors) - 5)
         
         if validation_successes:
-            print(f"  Sample Successful Validations:")
+            logger.info("  Sample Successful Validations:")
             for success in validation_successes[:3]:  # Show first 3 successes
-                print(f"    ✓ {success}")
+                logger.info("    ✓ %s", success)
             if len(validation_successes) > 3:
-                print(f"    ... and {len(validation_successes) - 3} more successful validations")
+                logger.info("    ... and %s more successful validations", len(validation_successes) - 3)
         
-        print(f"FEEDWATER: Initial conditions validation complete")
+        logger.info("FEEDWATER: Initial conditions validation complete")
         
         # Return validation status for testing
         return len(validation_errors) == 0
@@ -673,7 +677,7 @@ class EnhancedFeedwaterPhysics(HeatFlowProvider, ChemistryFlowProvider):
             steam_generator_demands: Steam demands from each SG
             system_conditions: Overall system conditions (temperatures, pressures)
             control_inputs: Control system inputs
-            dt: Time step (hours)
+            dt: Time step (minutes)
             
         Returns:
             Dictionary with enhanced feedwater performance results
@@ -705,12 +709,14 @@ class EnhancedFeedwaterPhysics(HeatFlowProvider, ChemistryFlowProvider):
         
         # Use unified water chemistry system if available, otherwise use defaults
         if self.water_quality is not None:
+            self._water_quality_conditions = {
+                'makeup_water_quality': makeup_water_quality,
+                'blowdown_rate': 0.02  # 2% blowdown rate
+            }
             water_quality_results = self.water_quality.update_chemistry(
-                system_conditions={
-                    'makeup_water_quality': makeup_water_quality,
-                    'blowdown_rate': 0.02  # 2% blowdown rate
-                },
-                dt=dt
+                system_conditions=self._water_quality_conditions,
+                dt=chemistry_hours(dt),
+                dt_unit='hours'
             )
         else:
             # Default water quality results when unified system is not available
@@ -906,7 +912,7 @@ class EnhancedFeedwaterPhysics(HeatFlowProvider, ChemistryFlowProvider):
         """
         from systems.maintenance import AutoMaintenanceSystem
         
-        print(f"FEEDWATER SYSTEM: Setting up maintenance integration")
+        logger.info("FEEDWATER SYSTEM: Setting up maintenance integration")
         
         # Set up pump system maintenance integration (primary integration point)
         self.pump_system.setup_maintenance_integration(maintenance_system)
@@ -916,7 +922,7 @@ class EnhancedFeedwaterPhysics(HeatFlowProvider, ChemistryFlowProvider):
             maintenance_system.event_bus, 
             "FEEDWATER_SYSTEM"
         )
-        print(f"  Connected feedwater protection system to maintenance event bus")
+        logger.info("  Connected feedwater protection system to maintenance event bus")
         
         # Register protection system for maintenance monitoring
         protection_monitoring_config = {
@@ -937,7 +943,7 @@ class EnhancedFeedwaterPhysics(HeatFlowProvider, ChemistryFlowProvider):
         }
         
         maintenance_system.register_component("feedwater_protection", self.protection_system, protection_monitoring_config)
-        print(f"  Registered feedwater protection system for maintenance monitoring")
+        logger.info("  Registered feedwater protection system for maintenance monitoring")
         
         # Register diagnostics system for health monitoring
         diagnostics_monitoring_config = {
@@ -958,7 +964,7 @@ class EnhancedFeedwaterPhysics(HeatFlowProvider, ChemistryFlowProvider):
         }
         
         maintenance_system.register_component("feedwater_diagnostics", self.diagnostics, diagnostics_monitoring_config)
-        print(f"  Registered feedwater diagnostics system for maintenance monitoring")
+        logger.info("  Registered feedwater diagnostics system for maintenance monitoring")
         
         # Store reference for coordination
         self.maintenance_system = maintenance_system
@@ -966,7 +972,7 @@ class EnhancedFeedwaterPhysics(HeatFlowProvider, ChemistryFlowProvider):
         # Subscribe to system-level maintenance events
         maintenance_system.event_bus.subscribe('maintenance_completed', self._handle_maintenance_completed)
         
-        print(f"FEEDWATER SYSTEM: Maintenance integration complete")
+        logger.info("FEEDWATER SYSTEM: Maintenance integration complete")
     
     def _handle_maintenance_completed(self, event):
         """Handle maintenance completion events to update system performance"""
@@ -978,8 +984,8 @@ class EnhancedFeedwaterPhysics(HeatFlowProvider, ChemistryFlowProvider):
             effectiveness = maintenance_data.get('effectiveness_score', 0.8)
             self.maintenance_factor = min(1.0, self.maintenance_factor + effectiveness * 0.1)
             
-            print(f"FEEDWATER SYSTEM: Maintenance completed on {component_id}, "
-                  f"system maintenance factor: {self.maintenance_factor:.3f}")
+            logger.info("FEEDWATER SYSTEM: Maintenance completed on %s, system maintenance factor: %.3f",
+                        component_id, self.maintenance_factor)
     
     def perform_maintenance(self, maintenance_type: str, **kwargs) -> Dict[str, Any]:
         """
@@ -1283,6 +1289,21 @@ class EnhancedFeedwaterPhysics(HeatFlowProvider, ChemistryFlowProvider):
             chemistry_performance_factor = max(0.5, 1.0 - (aggressiveness - 1.0) * 0.1)
             self.performance_factor *= chemistry_performance_factor
     
+    def advance_degradation(self, dt: float) -> None:
+        """
+        Advance pump lubrication and wear, and the water quality update, at
+        the last operating conditions
+        
+        Used by steady-state fast-forward while flows and levels are held.
+        
+        Args:
+            dt: Time step (minutes)
+        """
+        self.pump_system.advance_degradation(dt)
+        if self.water_quality is not None and self._water_quality_conditions is not None:
+            self.water_quality.update_chemistry(self._water_quality_conditions,
+                                                chemistry_hours(dt), dt_unit='hours')
+    
     def reset(self) -> None:
         """Reset enhanced feedwater system to initial conditions"""
         # CRITICAL FIX: Store initial conditions before reset to preserve them
@@ -1318,7 +1339,7 @@ class EnhancedFeedwaterPhysics(HeatFlowProvider, ChemistryFlowProvider):
         self.load_demand = 1.0
         
         # CRITICAL FIX: Re-apply initial conditions after reset to preserve targeted degraded conditions
-        print(f"FEEDWATER: Re-applying initial conditions after reset to preserve targeted degraded conditions")
+        logger.info("FEEDWATER: Re-applying initial conditions after reset to preserve targeted degraded conditions")
         self._apply_initial_conditions()
     
 
@@ -23,6 +23,9 @@ warnings.filterwarnings("ignore")
 
 # Import the unified config from config.py
 from .config import FeedwaterProtectionConfig
+from simulator.sim_logging import get_logger
+
+logger = get_logger(__name__)
 
 
 class NPSHProtection:
@@ -272,7 +275,7 @@ class FeedwaterProtectionSystem:
             priority=priority
         )
         
-        print(f"FEEDWATER PROTECTION: Published trip event - {trip_type} ({severity})")
+        logger.info("FEEDWATER PROTECTION: Published trip event - %s (%s)", trip_type, severity)
     
     def _publish_trip_events(self, trip_types: List[str], pump_results: Dict[str, Dict], 
                             system_conditions: Dict[str, float]):
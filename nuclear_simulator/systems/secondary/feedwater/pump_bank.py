@@ -0,0 +1,566 @@
+"""
+Feedwater Pump Bank
+
+This module provides the array-backed state and vectorized update shared by
+the feedwater pumps of one pump system.
+
+The operating state of every pump (speed, flow, power, suction and discharge
+pressures, NPSH, motor readings, vibration, cavitation) is held as
+structure-of-arrays NumPy buffers, one value per pump; the pump status is
+stored as a code array. FeedwaterPump objects stay the public per-pump
+interface (maintenance, start/stop, state reporting), but their state
+attributes are views onto a slot of the bank, so writes such as
+``pump.state.speed_percent = 80.0`` land in the arrays and the bank sees them.
+
+Each update runs the FeedwaterPump.update_pump chain (speed dynamics, flow,
+power, hydraulic/electrical/vibration sensors, cavitation, mechanical wear)
+for all pumps at once. Steps that belong to other objects stay per pump:
+
+- the lubrication systems hold their own oil and component wear state and
+  are updated one pump at a time before the bank update; their wear and
+  performance factors are gathered into arrays after that loop
+- control inputs are keyed by pump id
+- protection trips are resolved in the per-pump order of checks (the first
+  failing check names the trip), from conditions evaluated for the bank
+
+Pump for pump, the results match the former per-pump update.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from systems.primary.coolant.pump_models import PumpStatus
+from .pump_lubrication import LUBRICATION_RESULT_KEYS, update_pump_lubrication
+
+# Status codes held in the bank's status array
+PUMP_STATUSES = tuple(PumpStatus)
+STATUS_CODES = {status: code for code, status in enumerate(PUMP_STATUSES)}
+_RUNNING = STATUS_CODES[PumpStatus.RUNNING]
+_STARTING = STATUS_CODES[PumpStatus.STARTING]
+_STOPPING = STATUS_CODES[PumpStatus.STOPPING]
+_STOPPED = STATUS_CODES[PumpStatus.STOPPED]
+
+# Dynamic NPSH requirement
+BASE_NPSH_REQUIRED = 12.0       # m, never required below this
+NPSH_REQUIRED_BASELINE = 15.0   # m, reported reference value
+
+# Lubrication state gathered per pump (defaults for a pump without a lubrication system)
+_LUBRICATION_COLUMNS = (
+    'impeller_wear', 'motor_bearing_wear', 'pump_bearing_wear', 'thrust_bearing_wear', 'seal_wear',
+    'flow_factor', 'efficiency_factor', 'head_factor',
+    'oil_level', 'oil_temperature', 'seal_leakage', 'vibration_increase',
+)
+_NO_LUBRICATION = (0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 100.0, 40.0, 0.0, 0.0)
+
+
+def _clip(values, lower, upper):
+    """np.clip without its per-call overhead"""
+    return np.minimum(np.maximum(values, lower), upper)
+
+
+def vapor_pressure(temp_c: float) -> float:
+    """Effective vapor pressure of the (subcooled) feedwater at the pump suction (MPa)"""
+    if temp_c <= 100:
+        # Below boiling point - very low vapor pressure
+        return 0.001 + (temp_c / 100.0) * 0.01
+    # For subcooled feedwater, use much lower effective vapor pressure
+    return 0.05 + (temp_c - 100) * 0.001
+
+
+class PumpField:
+    """
+    Pump attribute stored in its bank's array (one slot per pump)
+
+    Until its owner (a pump or its state) is attached to a bank the value
+    lives in the owner's instance dictionary, so the state dataclass can set
+    its fields before any bank exists.
+    """
+
+    def __init__(self, name: Optional[str] = None):
+        self.name = name
+
+    def __set_name__(self, owner, name):
+        if self.name is None:
+            self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        attributes = obj.__dict__
+        bank = attributes.get('_bank')
+        if bank is None:
+            return attributes[self.name]
+        return bank.__dict__[self.name].item(attributes['_bank_slot'])
+
+    def __set__(self, obj, value):
+        attributes = obj.__dict__
+        bank = attributes.get('_bank')
+        if bank is None:
+            attributes[self.name] = value
+        else:
+            bank.__dict__[self.name][attributes['_bank_slot']] = value
+
+
+class PumpStatusField(PumpField):
+    """Pump status stored as a code in its bank's status array"""
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        attributes = obj.__dict__
+        bank = attributes.get('_bank')
+        if bank is None:
+            return attributes[self.name]
+        return PUMP_STATUSES[bank.status.item(attributes['_bank_slot'])]
+
+    def __set__(self, obj, value):
+        attributes = obj.__dict__
+        bank = attributes.get('_bank')
+        if bank is None:
+            attributes[self.name] = value
+        else:
+            bank.status[attributes['_bank_slot']] = STATUS_CODES[value]
+
+
+def bank_state(state_class):
+    """Class decorator: store the bank's state fields of a pump state dataclass in the bank"""
+    for name in FeedwaterPumpBank.STATE_FIELDS:
+        setattr(state_class, name, PumpField(name))
+    state_class.status = PumpStatusField('status')
+    return state_class
+
+
+class FeedwaterPumpBank:
+    """
+    Structure-of-arrays state and vectorized update of a group of feedwater pumps
+
+    Every field in STATE_FIELDS is an attribute holding one value per pump
+    (``bank.flow_rate[i]``), read and written by the pumps' states; the
+    pumps' flow demands and status codes are held the same way. Config
+    parameters are gathered into arrays when the bank is built.
+    """
+
+    STATE_FIELDS = (
+        'speed_percent', 'speed_setpoint', 'flow_rate', 'power_consumption',
+        'suction_pressure', 'discharge_pressure', 'differential_pressure', 'npsh_available',
+        'motor_temperature', 'motor_current', 'motor_voltage', 'vibration_level',
+        'cavitation_intensity', 'cavitation_damage', 'cavitation_time', 'cavitation_noise_level',
+    )
+
+    PUMP_FIELDS = ('flow_demand',)
+
+    CONFIG_FIELDS = (
+        'max_speed', 'speed_ramp_rate', 'startup_time', 'coastdown_time', 'cavitation_threshold_margin',
+    )
+
+    def __init__(self, pumps: Sequence[Any]):
+        """
+        Build the bank and attach the pumps and their states to it
+
+        State already held by a pump (in its standalone bank or, before
+        that, in the instance) is carried over into the new arrays.
+
+        Args:
+            pumps: FeedwaterPump objects, one slot each
+        """
+        self.members = list(pumps)
+        for name in self.STATE_FIELDS:
+            setattr(self, name, np.array([getattr(pump.state, name) for pump in self.members], dtype=np.float64))
+        for name in self.PUMP_FIELDS:
+            setattr(self, name, np.array([getattr(pump, name) for pump in self.members], dtype=np.float64))
+        self.status = np.array([STATUS_CODES[pump.state.status] for pump in self.members], dtype=np.intp)
+
+        for slot, pump in enumerate(self.members):
+            for owner, names in ((pump.state, self.STATE_FIELDS + ('status',)), (pump, self.PUMP_FIELDS)):
+                for name in names:
+                    owner.__dict__.pop(name, None)
+                owner._bank = self
+                owner._bank_slot = slot
+
+        self.refresh_config()
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def refresh_config(self) -> None:
+        """Gather the members' config parameters into arrays (after a config change)"""
+        for name in self.CONFIG_FIELDS:
+            setattr(self, 'cfg_' + name, np.array([getattr(pump, name) for pump in self.members], dtype=np.float64))
+        self.cfg_rated_flow = np.array([pump.config.rated_flow for pump in self.members], dtype=np.float64)
+        self.cfg_rated_power = np.array([pump.config.rated_power for pump in self.members], dtype=np.float64)
+
+    def _select(self, slots: Optional[Sequence[int]]) -> Tuple[Any, List[Any]]:
+        """Array index and member list of `slots` (None: all)"""
+        if slots is None:
+            return slice(None), self.members
+        index = np.asarray(slots, dtype=np.intp)
+        return index, [self.members[i] for i in index]
+
+    def status_mask(self, *statuses: PumpStatus) -> np.ndarray:
+        """True for the pumps whose status is one of `statuses`"""
+        mask = np.zeros(len(self.members), dtype=bool)
+        for status in statuses:
+            mask |= self.status == STATUS_CODES[status]
+        return mask
+
+    def gather_lubrication(self, members: Sequence[Any]) -> Dict[str, np.ndarray]:
+        """Current wear, performance factors and oil state of `members` as arrays"""
+        rows = []
+        for pump in members:
+            lubrication = getattr(pump, 'lubrication_system', None)
+            if lubrication is None:
+                rows.append(_NO_LUBRICATION)
+                continue
+            wear = lubrication.component_wear
+            rows.append((
+                wear.get('impeller', 0.0), wear.get('motor_bearings', 0.0),
+                wear.get('pump_bearings', 0.0), wear.get('thrust_bearing', 0.0),
+                wear.get('mechanical_seals', 0.0),
+                lubrication.pump_flow_factor, lubrication.pump_efficiency_factor, lubrication.pump_head_factor,
+                lubrication.oil_level, lubrication.oil_temperature, lubrication.seal_leakage_rate,
+                lubrication.vibration_increase,
+            ))
+        return dict(zip(_LUBRICATION_COLUMNS, np.array(rows, dtype=np.float64).reshape(-1, len(_NO_LUBRICATION)).T))
+
+    def set_flow_demand(self, flow_demand: float, slots: Optional[Sequence[int]] = None) -> None:
+        """
+        Set the same flow demand for the pumps in `slots` (FeedwaterPump.set_flow_demand)
+
+        The speed setpoint is the speed that delivers the demand at the pump's
+        degraded capacity, capped at 100% for normal operation.
+        """
+        index, members = self._select(slots)
+        rated_flow = self.cfg_rated_flow[index]
+        self.flow_demand[index] = _clip(flow_demand, 0.0, rated_flow * 1.2)
+        if flow_demand > 0:
+            flow_factor = self.gather_lubrication(members)['flow_factor']
+            effective_capacity = rated_flow * flow_factor
+            with np.errstate(divide='ignore', invalid='ignore'):
+                speed_setpoint = np.where(effective_capacity > 0,
+                                          np.sqrt(flow_demand / effective_capacity) * 100.0, 100.0)
+            self.speed_setpoint[index] = _clip(speed_setpoint, 0.0, 100.0)
+        else:
+            self.speed_setpoint[index] = 0.0
+
+    # Vectorized physics (all arguments are arrays over the selected slots)
+
+    @staticmethod
+    def npsh_required(speed_percent: np.ndarray, flow_ratio: np.ndarray, cavitation_damage: np.ndarray,
+                      lubrication: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Dynamic NPSH requirement (m) and its penalties (FeedwaterPump._calculate_dynamic_npsh_required)
+
+        Args:
+            speed_percent: Pump speeds (%)
+            flow_ratio: Flow rates over rated flow
+            cavitation_damage: Accumulated cavitation damage
+            lubrication: gather_lubrication() of the same pumps
+
+        Returns:
+            Arrays of the requirement and each penalty term
+        """
+        impeller_wear = lubrication['impeller_wear']
+        bearing_wear = np.maximum(np.maximum(lubrication['motor_bearing_wear'], lubrication['pump_bearing_wear']),
+                                  lubrication['thrust_bearing_wear'])
+        penalties = {
+            'impeller_wear': impeller_wear * 0.1,            # 0.1m per 1% impeller wear
+            'cavitation': cavitation_damage * 0.2,           # 0.2m per damage unit (surface roughness)
+            'speed': np.maximum(0.0, (speed_percent - 100.0) * 0.02),   # 0.02m per 1% overspeed
+            'flow': np.maximum(0.0, (flow_ratio - 1.0) * 1.5),          # 1.5m per 100% overflow
+            'bearing': bearing_wear * 0.05,                  # 0.05m per 1% bearing wear (misalignment)
+            'coupling': (impeller_wear * bearing_wear / 10000.0) * 0.3,  # up to 0.3m when both are worn
+        }
+        total = BASE_NPSH_REQUIRED
+        for penalty in penalties.values():
+            total = total + penalty
+        return dict(penalties, required=np.maximum(BASE_NPSH_REQUIRED, total), bearing_wear=bearing_wear)
+
+    # Update
+
+    def update(self, dt: float, system_conditions: Dict, control_inputs: Optional[Dict] = None,
+               slots: Optional[Sequence[int]] = None) -> List[Dict[str, Any]]:
+        """
+        Advance lubrication and then the pumps in `slots` (all by default) by one time step
+
+        Matches the lubrication-integrated FeedwaterPump.update_pump of each pump.
+
+        Returns:
+            One pump update result dict per advanced pump
+        """
+        _, members = self._select(slots)
+        lubrication_states = []
+        for pump in members:
+            lubrication = getattr(pump, 'lubrication_system', None)
+            if lubrication is None:
+                lubrication_states.append(None)
+                continue
+            # Held for degradation-only updates (steady-state fast-forward)
+            pump.last_system_conditions = system_conditions
+            lubrication_states.append(update_pump_lubrication(pump, lubrication, dt, system_conditions))
+
+        results = self.update_pumps(dt, system_conditions, control_inputs, slots)
+        for result, lubrication_state in zip(results, lubrication_states):
+            if lubrication_state is not None:
+                result.update({key: lubrication_state[key] for key in LUBRICATION_RESULT_KEYS})
+        return results
+
+    def update_pumps(self, dt: float, system_conditions: Dict, control_inputs: Optional[Dict] = None,
+                     slots: Optional[Sequence[int]] = None) -> List[Dict[str, Any]]:
+        """
+        Advance the pumps in `slots` (all by default) by one time step, lubrication excluded
+
+        Args:
+            dt: Time step
+            system_conditions: Feedwater temperature, suction/discharge pressure, SG levels
+            control_inputs: Per-pump speed setpoints and start/stop commands (keyed by pump id)
+            slots: Bank slots to advance (None: all)
+
+        Returns:
+            One FeedwaterPump.update_pump result dict per advanced pump
+        """
+        index, members = self._select(slots)
+        if control_inputs is None:
+            control_inputs = {}
+        for pump in members:
+            pump._process_control_inputs(control_inputs)
+
+        rated_flow = self.cfg_rated_flow[index]
+        rated_power = self.cfg_rated_power[index]
+        lubrication = self.gather_lubrication(members)
+
+        # Speed dynamics
+        status = self.status[index]
+        running = status == _RUNNING
+        starting = status == _STARTING
+        stopping = status == _STOPPING
+        speed = self.speed_percent[index]
+        speed_setpoint = self.speed_setpoint[index]
+
+        speed_error = speed_setpoint - speed
+        max_change = self.cfg_speed_ramp_rate[index] * dt
+        ramped = np.where(np.abs(speed_error) <= max_change, speed_setpoint, speed + max_change * np.sign(speed_error))
+        accelerated = speed + 100.0 / self.cfg_startup_time[index] * dt
+        started = starting & (accelerated >= speed_setpoint * 0.95)
+        coasted = speed - 100.0 / self.cfg_coastdown_time[index] * dt
+        stopped = stopping & (coasted <= 5.0)
+        speed = np.where(running, ramped,
+                         np.where(started, speed_setpoint,
+                                  np.where(starting, accelerated,
+                                           np.where(stopped, 0.0, np.where(stopping, coasted, speed)))))
+        speed = _clip(speed, 0.0, self.cfg_max_speed[index])
+        status = np.where(started, _RUNNING, np.where(stopped, _STOPPED, status))
+        running = status == _RUNNING
+        active = running | (status == _STARTING)
+
+        # Flow: the demand at high speed, limited by speed capability below 80%
+        speed_ratio = speed / 100.0
+        flow_demand = self.flow_demand[index]
+        speed_flow = rated_flow * speed_ratio
+        flow = np.where(flow_demand > 0,
+                        np.where(speed_ratio > 0.8, flow_demand, np.minimum(flow_demand, speed_flow)),
+                        speed_flow)
+        feedwater_temp = system_conditions.get('feedwater_temperature', 227.0)
+        temp_factor = 1.0 - (feedwater_temp - 227.0) * 0.0002
+        flow = flow * temp_factor * lubrication['flow_factor']
+        flow = np.where(running & (speed < 20.0), np.maximum(flow, rated_flow * 0.05), flow)
+        flow = np.where(active, np.minimum(flow, rated_flow * 1.2), 0.0)
+        flow_ratio = flow / rated_flow
+
+        # Power: flow x head (head ∝ speed²) over the lubrication efficiency factor
+        power = rated_power * (flow_ratio * speed_ratio ** 2) / lubrication['efficiency_factor']
+        power = np.where(status == _STARTING, np.maximum(power, rated_power * 0.2), power)
+        power = np.where(active, power, 0.0)
+
+        self.speed_percent[index] = speed
+        self.status[index] = status
+        self.flow_rate[index] = flow
+        self.power_consumption[index] = power
+
+        # Hydraulic sensors (pressures and NPSH held while initial conditions apply)
+        held = np.array([hasattr(pump, '_initial_conditions_applied') for pump in members])
+        suction = np.where(held, self.suction_pressure[index], system_conditions.get('suction_pressure', 0.5))
+        discharge = np.where(held, self.discharge_pressure[index], system_conditions.get('discharge_pressure', 8.0))
+        npsh_from_suction = np.maximum(0, (suction - vapor_pressure(feedwater_temp)) * 100.0)
+        npsh_available = np.where(held, self.npsh_available[index], npsh_from_suction)
+        self.suction_pressure[index] = suction
+        self.discharge_pressure[index] = discharge
+        self.differential_pressure[index] = discharge - suction
+        self.npsh_available[index] = npsh_available
+
+        # Electrical sensors (winding temperature from electrical heating only)
+        load_factor = np.where(rated_flow > 0, flow_ratio, 0.0)
+        self.motor_current[index] = 200.0 + 100.0 * load_factor
+        self.motor_voltage[index] = 6.6
+        self.motor_temperature[index] = 60.0 + 20.0 * load_factor
+
+        # Vibration: speed-dependent base + lubrication wear + cavitation
+        cavitation_intensity = self.cavitation_intensity[index]
+        vibration = (1.0 + 0.05 * speed) + lubrication['vibration_increase'] + cavitation_intensity * 2.0
+        vibration = _clip(vibration, 0.5, 15.0)
+
+        cavitation_damage = self.cavitation_damage[index]
+        npsh = self.npsh_required(speed, flow_ratio, cavitation_damage, lubrication)
+        self._check_protection(members, status.tolist(), flow.tolist(), npsh['required'].tolist(),
+                               system_conditions)
+
+        # Cavitation from the NPSH deficit (pumps tripped above no longer cavitate)
+        status = self.status[index]
+        running = status == _RUNNING
+        active = running | (status == _STARTING)
+        cavitation_threshold = npsh['required'] + self.cfg_cavitation_threshold_margin[index]
+        cavitating = active & (npsh_available < cavitation_threshold)
+        severity = np.minimum(1.0, (cavitation_threshold - npsh_available) / cavitation_threshold)
+        cavitation_intensity = np.where(cavitating, severity * flow_ratio ** 2, 0.0)
+        cavitation_time = self.cavitation_time[index]
+        cavitation_time = np.where(cavitating, cavitation_time + dt * 60.0,
+                                   np.where(active, np.maximum(0.0, cavitation_time - dt * 6.0), 0.0))
+        cavitation_noise = np.where(cavitating, 20.0 + cavitation_intensity * 30.0, 0.0)
+        vibration = np.where(cavitating, vibration + cavitation_intensity * 2.0, vibration)
+
+        # Damage accrues continuously, and again from mechanical wear above intensity 0.1
+        damage_rate = (cavitation_intensity ** 2) * dt / 60.0
+        cavitation_damage = np.where(active, cavitation_damage + damage_rate, cavitation_damage)
+        cavitation_damage = np.where(running & (cavitation_intensity > 0.1),
+                                     cavitation_damage + damage_rate, cavitation_damage)
+
+        self.cavitation_intensity[index] = cavitation_intensity
+        self.cavitation_time[index] = cavitation_time
+        self.cavitation_noise_level[index] = cavitation_noise
+        self.cavitation_damage[index] = cavitation_damage
+        self.vibration_level[index] = vibration
+
+        return self._results(index, members, lubrication)
+
+    def _check_protection(self, members: Sequence[Any], status: List[int], flow: List[float],
+                          npsh_required: List[float], system_conditions: Dict) -> None:
+        """
+        Trip the pumps whose protection conditions hold (FeedwaterPump._check_protection_systems)
+
+        A stopped pump has its trip cleared and is then checked like any other
+        pump that is neither tripped nor starting.
+        """
+        high_discharge_pressure = system_conditions.get('discharge_pressure', 8.0)
+        sg_levels = system_conditions.get('sg_levels', [12.5, 12.5, 12.5])
+        max_sg_level = max(sg_levels) if sg_levels else 12.5
+
+        for i, pump in enumerate(members):
+            state = pump.state
+            pump_status = status[i]
+            if pump_status == _STOPPED:
+                state.trip_active = False
+                state.trip_reason = ""
+            elif pump_status == _RUNNING and flow[i] < pump.low_flow_trip:
+                pump._trip_pump("Low Flow")
+                continue
+            if state.trip_active or pump_status == _STARTING:
+                continue
+
+            npsh_available = state.npsh_available
+            reason = None
+            if pump_status == _RUNNING and npsh_available < npsh_required[i]:
+                reason = (f"NPSH Violation (Required: {npsh_required[i]:.1f}m, "
+                          f"Available: {npsh_available:.1f}m)")
+            elif pump_status == _RUNNING and state.suction_pressure < pump.min_suction_pressure:
+                reason = "Low Suction Pressure"
+            elif high_discharge_pressure > pump.max_discharge_pressure:
+                reason = "High Discharge Pressure"
+            elif max_sg_level > 16.0:
+                reason = "Steam Generator High Level"
+            elif state.cavitation_intensity > pump.severe_cavitation_threshold:
+                reason = "Severe Cavitation"
+            elif state.cavitation_damage > pump.cavitation_damage_trip_threshold:
+                reason = "Cavitation Damage Limit"
+            elif npsh_available < pump.min_npsh_required * pump.npsh_critical_factor:
+                reason = "Critical NPSH Violation"
+            elif hasattr(pump, 'lubrication_system'):
+                lubrication_trip = pump.lubrication_system.check_protection_trips()
+                if lubrication_trip:
+                    reason = f"Lubrication: {lubrication_trip}"
+            if reason is not None:
+                pump._trip_pump(reason)
+
+    def _results(self, index: Any, members: Sequence[Any],
+                 lubrication: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+        """Update result dicts of `members` from the bank state after the update"""
+        speed = self.speed_percent[index]
+        flow_ratio = self.flow_rate[index] / self.cfg_rated_flow[index]
+        cavitation_damage = self.cavitation_damage[index]
+        npsh = self.npsh_required(speed, flow_ratio, cavitation_damage, lubrication)
+        impeller_wear = lubrication['impeller_wear']
+        bearing_wear = npsh['bearing_wear']
+        size = len(members)
+
+        columns = {
+            # Cavitation diagnostics
+            'cavitation_intensity': self.cavitation_intensity[index],
+            'cavitation_damage': cavitation_damage,
+            'cavitation_time': self.cavitation_time[index],
+            'cavitation_noise_level': self.cavitation_noise_level[index],
+
+            # Mechanical wear and performance factors from the lubrication systems
+            'impeller_wear': impeller_wear,
+            'motor_bearing_wear': lubrication['motor_bearing_wear'],
+            'pump_bearing_wear': lubrication['pump_bearing_wear'],
+            'thrust_bearing_wear': lubrication['thrust_bearing_wear'],
+            'bearing_wear': bearing_wear,
+            'seal_wear': lubrication['seal_wear'],
+            'seal_leakage': lubrication['seal_leakage'],
+            'flow_factor': lubrication['flow_factor'],
+            'efficiency_factor': lubrication['efficiency_factor'],
+            'head_factor': lubrication['head_factor'],
+
+            # Sensor readings
+            'npsh_available': self.npsh_available[index],
+            'suction_pressure': self.suction_pressure[index],
+            'discharge_pressure': self.discharge_pressure[index],
+            'differential_pressure': self.differential_pressure[index],
+            'oil_level': lubrication['oil_level'],
+            'oil_temperature': lubrication['oil_temperature'],
+            'bearing_temperature': lubrication['oil_temperature'] + 5.0,
+            'motor_temperature': self.motor_temperature[index],
+            'motor_current': self.motor_current[index],
+            'motor_voltage': self.motor_voltage[index],
+            'vibration_level': self.vibration_level[index],
+
+            # Dynamic NPSH diagnostics
+            'npsh_required_dynamic': npsh['required'],
+            'npsh_required_baseline': np.full(size, NPSH_REQUIRED_BASELINE),
+            'npsh_impeller_wear_penalty': npsh['impeller_wear'],
+            'npsh_cavitation_penalty': npsh['cavitation'],
+            'npsh_speed_penalty': npsh['speed'],
+            'npsh_flow_penalty': npsh['flow'],
+            'npsh_bearing_penalty': npsh['bearing'],
+            'npsh_coupling_penalty': npsh['coupling'],
+            'npsh_margin': self.npsh_available[index] - npsh['required'],
+
+            # Coupling diagnostics
+            'bearing_to_impeller_coupling': bearing_wear * 0.3,
+            'impeller_to_bearing_coupling': impeller_wear * 0.4,
+
+            # Legacy compatibility
+            'npsh_wear_penalty': npsh['impeller_wear'],
+            'npsh_damage_penalty': npsh['cavitation'],
+            'impeller_wear_equivalent': cavitation_damage * 2.0,
+        }
+        names = list(columns)
+        rows = zip(*(column.tolist() for column in columns.values()))
+
+        results = []
+        for pump, flow, speed, power, status, row in zip(members, self.flow_rate[index].tolist(), speed.tolist(),
+                                                        self.power_consumption[index].tolist(),
+                                                        self.status[index].tolist(), rows):
+            state = pump.state
+            result = {
+                'pump_id': pump.pump_id,
+                'pump_type': pump.pump_type,
+                'flow_rate': flow,
+                'speed_percent': speed,
+                'power_consumption': power,
+                'status': PUMP_STATUSES[status].value,
+                'available': state.available,
+                'trip_active': state.trip_active,
+            }
+            result.update(zip(names, row))
+            results.append(result)
+        return results
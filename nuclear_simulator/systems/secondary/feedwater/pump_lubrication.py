@@ -1644,6 +1644,212 @@ class FeedwaterPumpLubricationSystem(BaseLubricationSystem):
         return state_dict
 
 
+def update_pump_lubrication(pump, lubrication_system: FeedwaterPumpLubricationSystem,
+                            dt: float, system_conditions: Dict) -> Dict:
+    """
+    Update pump oil quality and component wear and apply the lubrication effects
+    to the pump state
+    
+    Args:
+        pump: Feedwater pump the lubrication system serves
+        lubrication_system: Pump lubrication system
+        dt: Time step (minutes)
+        system_conditions: Pump system conditions (feedwater temperature, suction/discharge pressure)
+        
+    Returns:
+        Lubrication system state dictionary after the update
+    """
+    # Calculate pump operating conditions for lubrication system
+    load_factor = pump.state.flow_rate / pump.config.rated_flow if pump.config.rated_flow > 0 else 0.0
+    speed_factor = pump.state.speed_percent / 100.0
+    electrical_load_factor = pump.state.power_consumption / pump.config.rated_power if pump.config.rated_power > 0 else 0.0
+    
+    pump_conditions = {
+        'load_factor': load_factor,
+        'speed_factor': speed_factor,
+        'electrical_load_factor': electrical_load_factor,
+        'cavitation_intensity': getattr(pump.state, 'cavitation_intensity', 0.0),
+        'head_factor': 1.0,  # Could be calculated from pump curves
+        'pressure_factor': pump.state.differential_pressure / 7.5 if hasattr(pump.state, 'differential_pressure') else 1.0,
+        'seal_water_quality': 1.0,  # Could be input from system
+        'misalignment_factor': 1.0,  # Could be from condition monitoring
+        'torque_variation': 1.0  # Could be calculated from load variations
+    }
+    
+    # Component-specific operating conditions
+    component_conditions = {
+        'motor_bearings': {
+            'load_factor': electrical_load_factor,
+            'speed_factor': speed_factor,
+            'temperature': 60.0 + electrical_load_factor * 25.0,
+            'electrical_load_factor': electrical_load_factor
+        },
+        'pump_bearings': {
+            'load_factor': load_factor,
+            'speed_factor': speed_factor,
+            'temperature': 50.0 + load_factor * 30.0,
+            'cavitation_intensity': pump_conditions['cavitation_intensity']
+        },
+        'thrust_bearing': {
+            'load_factor': load_factor,
+            'speed_factor': speed_factor,
+            'temperature': 45.0 + load_factor * 30.0,
+            'head_factor': pump_conditions['head_factor']
+        },
+        'mechanical_seals': {
+            'load_factor': load_factor,
+            'speed_factor': speed_factor,
+            'temperature': 40.0 + load_factor * 30.0,
+            'pressure_factor': pump_conditions['pressure_factor'],
+            'seal_water_quality': pump_conditions['seal_water_quality'],
+            'cavitation_intensity': pump_conditions['cavitation_intensity']
+        },
+        'coupling_system': {
+            'load_factor': load_factor,
+            'speed_factor': speed_factor,
+            'temperature': 50.0 + load_factor * 20.0,
+            'misalignment_factor': pump_conditions['misalignment_factor'],
+            'torque_variation': pump_conditions['torque_variation']
+        }
+    }
+    
+    # Enhanced oil temperature calculation targeting 55°C normal operation
+    # Base temperature reduced to target 55°C at normal load
+    base_temp = 40.0 + load_factor * 10.0  # 40-50°C range for main effect
+    
+    # Motor heat contribution (electrical losses) - reduced impact
+    motor_heat = electrical_load_factor * 2.0  # Reduced from 5.0
+    
+    # Heat transfer from hot feedwater through pump casing - minimal effect due to insulation
+    feedwater_temp = system_conditions['feedwater_temperature']
+    feedwater_heat_effect = (feedwater_temp - 200.0) * 0.01  # Much reduced, only above 200°C
+    
+    # Pressure effects (higher pressure = more work = more heat) - reduced impact
+    suction_pressure = system_conditions['suction_pressure']
+    discharge_pressure = system_conditions['discharge_pressure']
+    pressure_ratio = discharge_pressure / suction_pressure if suction_pressure > 0 else 16.0
+    pressure_heat = max(0.0, (pressure_ratio - 12.0) * 0.5)  # Much reduced effect
+    
+    # Cavitation effects (energy dissipation) - reduced impact
+    cavitation_heat = pump_conditions['cavitation_intensity'] * 3.0  # Reduced from 8.0
+    
+    # Calculate target oil temperature with conservative limits
+    oil_temp = base_temp + motor_heat + feedwater_heat_effect + pressure_heat + cavitation_heat
+    oil_temp = max(35.0, min(75.0, oil_temp))  # More conservative upper limit
+    
+    # STEP 5: FIXED - Increased contamination generation for realistic maintenance scenarios
+    # FIXED: Increased base contamination input for realistic maintenance scenarios (10x increase)
+    base_contamination_input = load_factor * 0.002  # Increased from 0.0002 to 0.002 (10x increase)
+    
+    # Add wear-based contamination generation
+    bearing_wear_contamination = 0.0
+    seal_wear_contamination = 0.0
+    
+    # Get current component wear levels
+    motor_bearing_wear = lubrication_system.component_wear.get('motor_bearings', 0.0)
+    pump_bearing_wear = lubrication_system.component_wear.get('pump_bearings', 0.0)
+    thrust_bearing_wear = lubrication_system.component_wear.get('thrust_bearing', 0.0)
+    seal_wear = lubrication_system.component_wear.get('mechanical_seals', 0.0)
+    
+    # FIXED: Increased bearing wear contamination (5x increase from ultra-conservative)
+    bearing_wear_contamination = (motor_bearing_wear + pump_bearing_wear + thrust_bearing_wear) * 0.0025
+    
+    # FIXED: Increased seal wear contamination (5x increase from ultra-conservative)
+    seal_wear_contamination = seal_wear * 0.004
+    
+    # FIXED: Increased cavitation contamination (5x increase from ultra-conservative)
+    cavitation_contamination = pump_conditions['cavitation_intensity'] * 0.01
+    
+    # FIXED: Increased temperature contamination (5x increase from ultra-conservative)
+    if oil_temp > 70.0:  # Lower threshold for temperature effects
+        temp_contamination = (oil_temp - 70.0) * 0.0025
+    else:
+        temp_contamination = 0.0
+    
+    # FIXED: More aggressive condition-based scaling for maintenance scenarios
+    lubrication_quality_factor = max(0.3, lubrication_system.lubrication_effectiveness)
+    contamination_scaling = 2.0 - (lubrication_quality_factor * 0.7)  # 1.3 to 2.0 range (more aggressive)
+    
+    # Total contamination input with increased bounds for maintenance scenarios
+    total_contamination_input = (base_contamination_input + 
+                               bearing_wear_contamination + 
+                               seal_wear_contamination + 
+                               cavitation_contamination + 
+                               temp_contamination) * contamination_scaling
+    
+    # FIXED: Increased contamination bounds (cap at 0.5 ppm/hour maximum - 10x increase)
+    total_contamination_input = min(0.5, max(0.0005, total_contamination_input))
+    
+    moisture_input = 0.0001  # Reduced moisture input to realistic level
+    
+    oil_quality_results = lubrication_system.update_oil_quality(
+        oil_temp, total_contamination_input, moisture_input, dt / 60.0  # Convert minutes to hours
+    )
+    
+    # Update component wear
+    wear_results = lubrication_system.update_component_wear(
+        component_conditions, dt / 60.0  # Convert minutes to hours
+    )
+    
+    # Update pump-specific lubrication effects
+    pump_lubrication_results = lubrication_system.update_pump_lubrication_effects(
+        pump_conditions, dt  # dt already in minutes for this method
+    )
+    
+    # Get lubrication state for pump integration
+    lubrication_state = lubrication_system.get_state_dict()
+    
+    # UNIDIRECTIONAL UPDATE: Update pump state with lubrication effects (no sync needed)
+    # Since we removed duplicate state variables, pump state gets values from lubrication system
+    # This is simple value copying, not bidirectional synchronization
+    pump.state.oil_level = lubrication_state['oil_level']
+    pump.state.oil_temperature = lubrication_state['oil_temperature']
+    pump.state.bearing_wear = lubrication_state['pump_bearing_wear']
+    pump.state.seal_wear = lubrication_state['seal_wear']
+    
+    # CRITICAL FIX: Calculate motor temperature from lubrication system data (oil-driven approach)
+    # Motor temperature is calculated from actual data sources with physically realistic relationships
+    
+    # Get values from their actual locations
+    oil_temp = lubrication_system.oil_temperature  # From lubrication system (authoritative)
+    motor_bearing_wear = lubrication_system.component_wear.get('motor_bearings', 0.0)  # From lubrication system
+    lubrication_effectiveness = lubrication_system.lubrication_effectiveness  # From lubrication system
+    electrical_load_factor = pump.state.power_consumption / pump.config.rated_power if pump.config.rated_power > 0 else 0.0  # From pump state
+    
+    # Calculate motor temperature with physically realistic relationships
+    base_motor_temp = oil_temp + 8.0  # Motor always runs 8°C above oil baseline (heat transfer)
+    electrical_load_effect = electrical_load_factor * 12.0  # 0-12°C from electrical losses (faster response than oil)
+    bearing_wear_effect = (motor_bearing_wear / 100.0) * 5.0  # Worn bearings generate more heat (0-5°C)
+    poor_lube_effect = (1.0 - lubrication_effectiveness) * 8.0  # Poor lubrication = more friction heat (0-8°C)
+    
+    # Final motor temperature calculation
+    calculated_motor_temp = base_motor_temp + electrical_load_effect + bearing_wear_effect + poor_lube_effect
+    calculated_motor_temp = max(45.0, min(120.0, calculated_motor_temp))  # Realistic physical bounds
+    
+    # Update pump state with calculated motor temperature (this is what maintenance systems use)
+    pump.state.motor_temperature = calculated_motor_temp
+    
+    # Apply performance factors from lubrication system
+    pump.state.efficiency_factor = lubrication_state['efficiency_factor']
+    pump.state.flow_factor = lubrication_state['flow_factor']
+    pump.state.head_factor = lubrication_state['head_factor']
+    
+    # No sync needed - lubrication system is the single source of truth
+    
+    return lubrication_state
+
+
+# Lubrication state entries added to each pump update result
+LUBRICATION_RESULT_KEYS = (
+    'lubrication_effectiveness',
+    'oil_contamination_level',
+    'system_health_factor',
+    'maintenance_due',
+    'vibration_increase',
+    'npsh_margin_degradation'
+)
+
+
 # Integration functions for existing feedwater pump models
 def integrate_lubrication_with_pump(pump, lubrication_system: FeedwaterPumpLubricationSystem):
     """
@@ -1659,195 +1865,17 @@ def integrate_lubrication_with_pump(pump, lubrication_system: FeedwaterPumpLubri
         def update_with_lubrication(dt: float, system_conditions: Dict, 
                                   control_inputs: Dict = None) -> Dict:
             
-            # Calculate pump operating conditions for lubrication system
-            load_factor = pump.state.flow_rate / pump.config.rated_flow if pump.config.rated_flow > 0 else 0.0
-            speed_factor = pump.state.speed_percent / 100.0
-            electrical_load_factor = pump.state.power_consumption / pump.config.rated_power if pump.config.rated_power > 0 else 0.0
-            
-            pump_conditions = {
-                'load_factor': load_factor,
-                'speed_factor': speed_factor,
-                'electrical_load_factor': electrical_load_factor,
-                'cavitation_intensity': getattr(pump.state, 'cavitation_intensity', 0.0),
-                'head_factor': 1.0,  # Could be calculated from pump curves
-                'pressure_factor': pump.state.differential_pressure / 7.5 if hasattr(pump.state, 'differential_pressure') else 1.0,
-                'seal_water_quality': 1.0,  # Could be input from system
-                'misalignment_factor': 1.0,  # Could be from condition monitoring
-                'torque_variation': 1.0  # Could be calculated from load variations
-            }
-            
-            # Component-specific operating conditions
-            component_conditions = {
-                'motor_bearings': {
-                    'load_factor': electrical_load_factor,
-                    'speed_factor': speed_factor,
-                    'temperature': 60.0 + electrical_load_factor * 25.0,
-                    'electrical_load_factor': electrical_load_factor
-                },
-                'pump_bearings': {
-                    'load_factor': load_factor,
-                    'speed_factor': speed_factor,
-                    'temperature': 50.0 + load_factor * 30.0,
-                    'cavitation_intensity': pump_conditions['cavitation_intensity']
-                },
-                'thrust_bearing': {
-                    'load_factor': load_factor,
-                    'speed_factor': speed_factor,
-                    'temperature': 45.0 + load_factor * 30.0,
-                    'head_factor': pump_conditions['head_factor']
-                },
-                'mechanical_seals': {
-                    'load_factor': load_factor,
-                    'speed_factor': speed_factor,
-                    'temperature': 40.0 + load_factor * 30.0,
-                    'pressure_factor': pump_conditions['pressure_factor'],
-                    'seal_water_quality': pump_conditions['seal_water_quality'],
-                    'cavitation_intensity': pump_conditions['cavitation_intensity']
-                },
-                'coupling_system': {
-                    'load_factor': load_factor,
-                    'speed_factor': speed_factor,
-                    'temperature': 50.0 + load_factor * 20.0,
-                    'misalignment_factor': pump_conditions['misalignment_factor'],
-                    'torque_variation': pump_conditions['torque_variation']
-                }
-            }
-            
-            # Enhanced oil temperature calculation targeting 55°C normal operation
-            # Base temperature reduced to target 55°C at normal load
-            base_temp = 40.0 + load_factor * 10.0  # 40-50°C range for main effect
-            
-            # Motor heat contribution (electrical losses) - reduced impact
-            motor_heat = electrical_load_factor * 2.0  # Reduced from 5.0
-            
-            # Heat transfer from hot feedwater through pump casing - minimal effect due to insulation
-            feedwater_temp = system_conditions['feedwater_temperature']
-            feedwater_heat_effect = (feedwater_temp - 200.0) * 0.01  # Much reduced, only above 200°C
-            
-            # Pressure effects (higher pressure = more work = more heat) - reduced impact
-            suction_pressure = system_conditions['suction_pressure']
-            discharge_pressure = system_conditions['discharge_pressure']
-            pressure_ratio = discharge_pressure / suction_pressure if suction_pressure > 0 else 16.0
-            pressure_heat = max(0.0, (pressure_ratio - 12.0) * 0.5)  # Much reduced effect
-            
-            # Cavitation effects (energy dissipation) - reduced impact
-            cavitation_heat = pump_conditions['cavitation_intensity'] * 3.0  # Reduced from 8.0
-            
-            # Calculate target oil temperature with conservative limits
-            oil_temp = base_temp + motor_heat + feedwater_heat_effect + pressure_heat + cavitation_heat
-            oil_temp = max(35.0, min(75.0, oil_temp))  # More conservative upper limit
-            
-            # STEP 5: FIXED - Increased contamination generation for realistic maintenance scenarios
-            # FIXED: Increased base contamination input for realistic maintenance scenarios (10x increase)
-            base_contamination_input = load_factor * 0.002  # Increased from 0.0002 to 0.002 (10x increase)
-            
-            # Add wear-based contamination generation
-            bearing_wear_contamination = 0.0
-            seal_wear_contamination = 0.0
-            
-            # Get current component wear levels
-            motor_bearing_wear = lubrication_system.component_wear.get('motor_bearings', 0.0)
-            pump_bearing_wear = lubrication_system.component_wear.get('pump_bearings', 0.0)
-            thrust_bearing_wear = lubrication_system.component_wear.get('thrust_bearing', 0.0)
-            seal_wear = lubrication_system.component_wear.get('mechanical_seals', 0.0)
-            
-            # FIXED: Increased bearing wear contamination (5x increase from ultra-conservative)
-            bearing_wear_contamination = (motor_bearing_wear + pump_bearing_wear + thrust_bearing_wear) * 0.0025
-            
-            # FIXED: Increased seal wear contamination (5x increase from ultra-conservative)
-            seal_wear_contamination = seal_wear * 0.004
-            
-            # FIXED: Increased cavitation contamination (5x increase from ultra-conservative)
-            cavitation_contamination = pump_conditions['cavitation_intensity'] * 0.01
-            
-            # FIXED: Increased temperature contamination (5x increase from ultra-conservative)
-            if oil_temp > 70.0:  # Lower threshold for temperature effects
-                temp_contamination = (oil_temp - 70.0) * 0.0025
-            else:
-                temp_contamination = 0.0
-            
-            # FIXED: More aggressive condition-based scaling for maintenance scenarios
-            lubrication_quality_factor = max(0.3, lubrication_system.lubrication_effectiveness)
-            contamination_scaling = 2.0 - (lubrication_quality_factor * 0.7)  # 1.3 to 2.0 range (more aggressive)
-            
-            # Total contamination input with increased bounds for maintenance scenarios
-            total_contamination_input = (base_contamination_input + 
-                                       bearing_wear_contamination + 
-                                       seal_wear_contamination + 
-                                       cavitation_contamination + 
-                                       temp_contamination) * contamination_scaling
-            
-            # FIXED: Increased contamination bounds (cap at 0.5 ppm/hour maximum - 10x increase)
-            total_contamination_input = min(0.5, max(0.0005, total_contamination_input))
-            
-            moisture_input = 0.0001  # Reduced moisture input to realistic level
-            
-            oil_quality_results = lubrication_system.update_oil_quality(
-                oil_temp, total_contamination_input, moisture_input, dt / 60.0  # Convert minutes to hours
-            )
-            
-            # Update component wear
-            wear_results = lubrication_system.update_component_wear(
-                component_conditions, dt / 60.0  # Convert minutes to hours
-            )
-            
-            # Update pump-specific lubrication effects
-            pump_lubrication_results = lubrication_system.update_pump_lubrication_effects(
-                pump_conditions, dt  # dt already in minutes for this method
-            )
-            
-            # Get lubrication state for pump integration
-            lubrication_state = lubrication_system.get_state_dict()
-            
-            # UNIDIRECTIONAL UPDATE: Update pump state with lubrication effects (no sync needed)
-            # Since we removed duplicate state variables, pump state gets values from lubrication system
-            # This is simple value copying, not bidirectional synchronization
-            pump.state.oil_level = lubrication_state['oil_level']
-            pump.state.oil_temperature = lubrication_state['oil_temperature']
-            pump.state.bearing_wear = lubrication_state['pump_bearing_wear']
-            pump.state.seal_wear = lubrication_state['seal_wear']
-            
-            # CRITICAL FIX: Calculate motor temperature from lubrication system data (oil-driven approach)
-            # Motor temperature is calculated from actual data sources with physically realistic relationships
-            
-            # Get values from their actual locations
-            oil_temp = lubrication_system.oil_temperature  # From lubrication system (authoritative)
-            motor_bearing_wear = lubrication_system.component_wear.get('motor_bearings', 0.0)  # From lubrication system
-            lubrication_effectiveness = lubrication_system.lubrication_effectiveness  # From lubrication system
-            electrical_load_factor = pump.state.power_consumption / pump.config.rated_power if pump.config.rated_power > 0 else 0.0  # From pump state
-            
-            # Calculate motor temperature with physically realistic relationships
-            base_motor_temp = oil_temp + 8.0  # Motor always runs 8°C above oil baseline (heat transfer)
-            electrical_load_effect = electrical_load_factor * 12.0  # 0-12°C from electrical losses (faster response than oil)
-            bearing_wear_effect = (motor_bearing_wear / 100.0) * 5.0  # Worn bearings generate more heat (0-5°C)
-            poor_lube_effect = (1.0 - lubrication_effectiveness) * 8.0  # Poor lubrication = more friction heat (0-8°C)
-            
-            # Final motor temperature calculation
-            calculated_motor_temp = base_motor_temp + electrical_load_effect + bearing_wear_effect + poor_lube_effect
-            calculated_motor_temp = max(45.0, min(120.0, calculated_motor_temp))  # Realistic physical bounds
-            
-            # Update pump state with calculated motor temperature (this is what maintenance systems use)
-            pump.state.motor_temperature = calculated_motor_temp
-            
-            # Apply performance factors from lubrication system
-            pump.state.efficiency_factor = lubrication_state['efficiency_factor']
-            pump.state.flow_factor = lubrication_state['flow_factor']
-            pump.state.head_factor = lubrication_state['head_factor']
+            # Held for degradation-only updates (steady-state fast-forward)
+            pump.last_system_conditions = system_conditions
             
-            # No sync needed - lubrication system is the single source of truth
+            # Update oil quality and component wear, apply lubrication effects to the pump
+            lubrication_state = update_pump_lubrication(pump, lubrication_system, dt, system_conditions)
             
             # Call original pump update method
             result = original_update_method(dt, system_conditions, control_inputs)
             
             # Add lubrication results to pump output
-            result.update({
-                'lubrication_effectiveness': lubrication_state['lubrication_effectiveness'],
-                'oil_contamination_level': lubrication_state['oil_contamination_level'],
-                'system_health_factor': lubrication_state['system_health_factor'],
-                'maintenance_due': lubrication_state['maintenance_due'],
-                'vibration_increase': lubrication_state['vibration_increase'],
-                'npsh_margin_degradation': lubrication_state['npsh_margin_degradation']
-            })
+            result.update({key: lubrication_state[key] for key in LUBRICATION_RESULT_KEYS})
             
             return result
         
@@ -29,13 +29,18 @@ from systems.primary.coolant.pump_models import (
 from .pump_lubrication import (
     FeedwaterPumpLubricationSystem, 
     FeedwaterPumpLubricationConfig, 
-    integrate_lubrication_with_pump
+    integrate_lubrication_with_pump,
+    update_pump_lubrication
 )
+from .pump_bank import FeedwaterPumpBank, PumpField, bank_state
 
 # Import chemistry flow interfaces
 from ..chemistry_flow_tracker import ChemistryFlowProvider, ChemicalSpecies
 
 from ..component_descriptions import FEEDWATER_COMPONENT_DESCRIPTIONS
+from simulator.sim_logging import get_logger
+
+logger = get_logger(__name__)
 
 # Import state management - removed StateProviderMixin to prevent double registration
 # The FeedwaterPumpSystem is managed by EnhancedFeedwaterPhysics which handles state collection
@@ -59,9 +64,15 @@ class FeedwaterPumpConfig:
     min_flow_for_start: float = 50.0            # kg/s minimum flow to start
 
 
+@bank_state
 @dataclass
 class FeedwaterPumpState(BasePumpState):
-    """State of a single feedwater pump - inherits from base"""
+    """
+    State of a single feedwater pump - inherits from base
+    
+    The numeric operating fields and the status live in the pump's
+    FeedwaterPumpBank slot once the pump is attached to a bank.
+    """
     # Feedwater-specific defaults
     flow_rate: float = 555.0                    # Actual flow rate (kg/s)
     power_consumption: float = 10.0             # Motor power (MW)
@@ -103,8 +114,14 @@ class FeedwaterPump(BasePump):
     3. NPSH protection for cavitation prevention
     4. Integration with steam generator level control
     5. Advanced diagnostics and wear modeling
+    
+    The pump state and flow demand live in a FeedwaterPumpBank (one slot per
+    pump): a standalone pump owns a one-slot bank, and FeedwaterPumpSystem
+    moves its pumps into one shared bank so they are updated together.
     """
     
+    flow_demand = PumpField()
+    
     def __init__(self, config: FeedwaterPumpConfig):
         """Initialize feedwater pump with configuration"""
         # Initialize base pump with feedwater-specific parameters
@@ -114,7 +131,7 @@ class FeedwaterPump(BasePump):
         # Apply initial oil level from config if provided
         if hasattr(config, 'oil_level'):
             self.state.oil_level = config.initial_oil_level
-            print(f"Pump {config.pump_id} initialized with oil level: {config.initial_oil_level}%")
+            logger.info("Pump %s initialized with oil level: %s%%", config.pump_id, config.initial_oil_level)
         
         # Feedwater-specific performance parameters
         self.rated_power = config.rated_power
@@ -161,6 +178,20 @@ class FeedwaterPump(BasePump):
         self.combined_wear_trip_threshold = 40.0        # % total wear
         self.performance_degradation_trip_threshold = 25.0  # % efficiency loss
         self.seal_leakage_trip_threshold = 10.0         # L/min
+        
+        # State arrays (until a pump system's bank takes this pump over)
+        FeedwaterPumpBank([self])
+    
+    def __getstate__(self) -> Dict:
+        """Pickle support: the lubrication update wrapper is a closure, rebuilt on restore"""
+        state = self.__dict__.copy()
+        state.pop('update_pump', None)
+        return state
+    
+    def __setstate__(self, state: Dict):
+        self.__dict__.update(state)
+        if 'lubrication_system' in state:
+            integrate_lubrication_with_pump(self, self.lubrication_system)
     
     @property
     def seal_leakage(self) -> float:
@@ -169,84 +200,6 @@ class FeedwaterPump(BasePump):
             return self.lubrication_system.seal_leakage_rate
         return 0.0
     
-    def _calculate_flow_rate(self, system_conditions: Dict):
-        """Calculate feedwater pump flow rate based on head-flow curve"""
-        if self.state.status in [PumpStatus.RUNNING, PumpStatus.STARTING]:
-            # FIXED: Simplified flow calculation that properly honors flow demand
-            speed_ratio = self.state.speed_percent / 100.0
-            
-            # Apply flow demand if set by control system
-            if hasattr(self, 'flow_demand') and self.flow_demand > 0:
-                # CRITICAL FIX: At high speeds (>80%), deliver the demanded flow directly
-                # This represents proper pump control where speed is adjusted to meet demand
-                target_flow = self.flow_demand
-                
-                if speed_ratio > 0.8:
-                    # High speed operation - pump can deliver demanded flow
-                    # Speed was already set to achieve this flow demand
-                    self.state.flow_rate = target_flow
-                else:
-                    # Lower speed operation - limited by speed capability
-                    max_flow_at_speed = self.config.rated_flow * speed_ratio
-                    self.state.flow_rate = min(target_flow, max_flow_at_speed)
-                
-            else:
-                # No specific demand, use speed-based flow (fallback)
-                base_flow = self.config.rated_flow * speed_ratio
-                self.state.flow_rate = base_flow
-            
-            # Apply system conditions (temperature effects, etc.)
-            self._apply_system_effects(system_conditions)
-            
-            # Apply performance degradation from wear and cavitation
-            flow_factor = self.lubrication_system.pump_flow_factor if hasattr(self, 'lubrication_system') else 1.0
-            self.state.flow_rate *= flow_factor
-            
-            # Minimum flow constraint only when running at very low speeds
-            if self.state.status == PumpStatus.RUNNING and self.state.speed_percent < 20.0:
-                min_flow = self.config.rated_flow * 0.05  # 5% minimum only at very low speeds
-                self.state.flow_rate = max(self.state.flow_rate, min_flow)
-            
-            # Ensure we don't exceed rated flow significantly
-            max_flow = self.config.rated_flow * 1.2  # 120% maximum
-            self.state.flow_rate = min(self.state.flow_rate, max_flow)
-            
-        else:
-            # Pump stopped or tripped
-            self.state.flow_rate = 0.0
-    
-    def _apply_system_effects(self, system_conditions: Dict):
-        """Apply system conditions to pump performance"""
-        # Temperature effects on pump performance
-        feedwater_temp = system_conditions.get('feedwater_temperature', 227.0)  # °C
-        temp_factor = 1.0 - (feedwater_temp - 227.0) * 0.0002  # Small effect
-        
-        # Suction pressure effects (but respect initial conditions)
-        if not hasattr(self, '_initial_conditions_applied'):
-            suction_pressure = system_conditions.get('suction_pressure', 0.5)  # MPa
-            self.state.suction_pressure = suction_pressure
-        
-        # Calculate NPSH available (simplified)
-        # CRITICAL FIX: Only calculate NPSH if not set by initial conditions
-        if not hasattr(self, '_initial_conditions_applied'):
-            vapor_pressure = self._vapor_pressure(feedwater_temp)  # MPa
-            npsh_available = (self.state.suction_pressure - vapor_pressure) * 100.0  # Convert to meters
-            self.state.npsh_available = max(0, npsh_available)
-        
-        # Apply temperature factor
-        self.state.flow_rate *= temp_factor
-    
-    def _vapor_pressure(self, temp_c: float) -> float:
-        """Calculate vapor pressure of water at given temperature (MPa)"""
-        # For feedwater pump NPSH calculation, effective vapor pressure
-        # Feedwater is typically subcooled, so effective vapor pressure is much lower
-        if temp_c <= 100:
-            # Below boiling point - very low vapor pressure
-            return 0.001 + (temp_c / 100.0) * 0.01  # Very low values
-        else:
-            # For subcooled feedwater, use much lower effective vapor pressure
-            return 0.05 + (temp_c - 100) * 0.001  # Much more conservative
-    
     def _calculate_power_consumption(self):
         """Calculate feedwater pump motor power consumption with efficiency effects"""
         if self.state.status in [PumpStatus.RUNNING, PumpStatus.STARTING]:
@@ -274,91 +227,6 @@ class FeedwaterPump(BasePump):
         else:
             self.state.power_consumption = 0.0
     
-    def _check_protection_systems(self, system_conditions: Dict):
-        """Check feedwater pump protection systems"""
-        # Call base class protection first
-        BasePump._check_protection_systems(self, system_conditions)
-        
-        # If already tripped by base class, don't check further
-        if self.state.trip_active:
-            return
-        
-        # Skip protection checks during startup phase to allow proper equilibrium initialization
-        if self.state.status == PumpStatus.STARTING:
-            return
-        
-        # NPSH protection with dynamic requirement
-        npsh_required_dynamic = self._calculate_dynamic_npsh_required()
-        if (self.state.status == PumpStatus.RUNNING and 
-            self.state.npsh_available < npsh_required_dynamic):
-            self._trip_pump(f"NPSH Violation (Required: {npsh_required_dynamic:.1f}m, Available: {self.state.npsh_available:.1f}m)")
-            return
-        
-        # Suction pressure protection
-        if (self.state.status == PumpStatus.RUNNING and 
-            self.state.suction_pressure < self.min_suction_pressure):
-            self._trip_pump("Low Suction Pressure")
-            return
-        
-        # High discharge pressure protection
-        discharge_pressure = system_conditions.get('discharge_pressure', 8.0)
-        if discharge_pressure > self.max_discharge_pressure:
-            self._trip_pump("High Discharge Pressure")
-            return
-        
-        # Steam generator high level protection
-        sg_levels = system_conditions.get('sg_levels', [12.5, 12.5, 12.5])
-        max_sg_level = max(sg_levels) if sg_levels else 12.5
-        
-        # DEBUG: Print steam generator levels to understand the issue
-        '''
-        if self.state.status == PumpStatus.RUNNING and max_sg_level > 14.0:
-            print(f"DEBUG {self.config.pump_id}: SG levels = {sg_levels}, max = {max_sg_level:.2f}m")
-        '''
-        # FIXED: Increase high level trip setpoint to prevent nuisance trips
-        # Normal operating level is 12.5m, allow operation up to 16.0m
-        if max_sg_level > 16.0:  # High level trip (was 15.0)
-            self._trip_pump("Steam Generator High Level")
-            return
-        
-        # Enhanced protection checks
-        if self._check_cavitation_trips():
-            return
-        
-        # Delegate lubrication protection to lubrication system
-        if hasattr(self, 'lubrication_system'):
-            lub_trip_reason = self.lubrication_system.check_protection_trips()
-            if lub_trip_reason:
-                self._trip_pump(f"Lubrication: {lub_trip_reason}")
-                return
-    
-    def _check_cavitation_trips(self):
-        """Check cavitation-related trip conditions"""
-        # Severe cavitation - immediate trip
-        if self.state.cavitation_intensity > self.severe_cavitation_threshold:
-            self._trip_pump("Severe Cavitation")
-            return True
-            
-        # DISABLED: Sustained cavitation - trip after time limit
-        # Disabled to allow gradual cavitation scenarios for training data generation
-        # if self.state.cavitation_time > self.sustained_cavitation_time_limit:
-        #     self._trip_pump("Sustained Cavitation")
-        #     return True
-            
-        # Cavitation damage threshold
-        if self.state.cavitation_damage > self.cavitation_damage_trip_threshold:
-            self._trip_pump("Cavitation Damage Limit")
-            return True
-            
-        # Critical NPSH - emergency trip
-        npsh_critical = self.min_npsh_required * self.npsh_critical_factor
-        if self.state.npsh_available < npsh_critical:
-            self._trip_pump("Critical NPSH Violation")
-            return True
-            
-        return False
-    
-    
     def _calculate_dynamic_npsh_required(self) -> float:
         """
         Enhanced dynamic NPSH requirement calculation with explicit impeller wear tracking
@@ -448,305 +316,38 @@ class FeedwaterPump(BasePump):
     
     def update_pump(self, dt: float, system_conditions: Dict, 
                    control_inputs: Dict = None) -> Dict:
-        """Enhanced update pump method with cavitation and wear simulation"""
-        if control_inputs is None:
-            control_inputs = {}
-        
-        # Call base class update first
-        result = BasePump.update_pump(self, dt, system_conditions, control_inputs)
-        
-        # CRITICAL FIX: Update sensors FIRST to get current NPSH available
-        self._simulate_sensors(dt, system_conditions)
-        
-        # Run enhanced simulations with updated sensor data
-        self._simulate_cavitation(dt, system_conditions)
-        self._simulate_mechanical_wear(dt, system_conditions)
-        self._apply_performance_degradation()
-        
-        # Add enhanced diagnostics to result - get from lubrication system where applicable
-        # NEW: Explicit impeller wear tracking
-        impeller_wear = self.lubrication_system.component_wear.get('impeller', 0.0) if hasattr(self, 'lubrication_system') else 0.0
-        motor_bearing_wear = self.lubrication_system.component_wear.get('motor_bearings', 0.0) if hasattr(self, 'lubrication_system') else 0.0
-        pump_bearing_wear = self.lubrication_system.component_wear.get('pump_bearings', 0.0) if hasattr(self, 'lubrication_system') else 0.0
-        thrust_bearing_wear = self.lubrication_system.component_wear.get('thrust_bearing', 0.0) if hasattr(self, 'lubrication_system') else 0.0
-        bearing_wear = max(motor_bearing_wear, pump_bearing_wear, thrust_bearing_wear)
-        seal_wear = self.lubrication_system.component_wear.get('mechanical_seals', 0.0) if hasattr(self, 'lubrication_system') else 0.0
-        
-        oil_level = self.lubrication_system.oil_level if hasattr(self, 'lubrication_system') else 100.0
-        oil_temperature = self.lubrication_system.oil_temperature if hasattr(self, 'lubrication_system') else 40.0
-        bearing_temperature = oil_temperature + 5.0  # Bearing temp slightly higher than oil temp
-        
-        flow_factor = self.lubrication_system.pump_flow_factor if hasattr(self, 'lubrication_system') else 1.0
-        efficiency_factor = self.lubrication_system.pump_efficiency_factor if hasattr(self, 'lubrication_system') else 1.0
-        head_factor = self.lubrication_system.pump_head_factor if hasattr(self, 'lubrication_system') else 1.0
-        
-        # Calculate enhanced NPSH diagnostics with explicit impeller wear
-        npsh_required_dynamic = self._calculate_dynamic_npsh_required()
-        npsh_baseline = 15.0
-        
-        # Enhanced NPSH penalty breakdown
-        impeller_wear_penalty = impeller_wear * 0.1 if hasattr(self, 'lubrication_system') else 0.0
-        cavitation_roughness_penalty = self.state.cavitation_damage * 0.2
-        speed_penalty = max(0.0, (self.state.speed_percent - 100.0) * 0.02)
-        flow_penalty = max(0.0, (self.state.flow_rate / self.config.rated_flow - 1.0) * 1.5)
-        bearing_penalty = bearing_wear * 0.05 if hasattr(self, 'lubrication_system') else 0.0
-        coupling_penalty = (impeller_wear * bearing_wear / 10000.0) * 0.3 if hasattr(self, 'lubrication_system') else 0.0
-        
-        # Calculate coupling effects for diagnostics
-        bearing_to_impeller_coupling = bearing_wear * 0.3 if hasattr(self, 'lubrication_system') else 0.0
-        impeller_to_bearing_coupling = impeller_wear * 0.4 if hasattr(self, 'lubrication_system') else 0.0
-        
-        result.update({
-            # Cavitation diagnostics
-            'cavitation_intensity': self.state.cavitation_intensity,
-            'cavitation_damage': self.state.cavitation_damage,
-            'cavitation_time': self.state.cavitation_time,
-            'cavitation_noise_level': self.state.cavitation_noise_level,
-            
-            # Enhanced mechanical wear diagnostics - explicit tracking
-            'impeller_wear': impeller_wear,  # NEW: Explicit impeller wear
-            'motor_bearing_wear': motor_bearing_wear,  # NEW: Individual bearing wear
-            'pump_bearing_wear': pump_bearing_wear,    # NEW: Individual bearing wear
-            'thrust_bearing_wear': thrust_bearing_wear, # NEW: Individual bearing wear
-            'bearing_wear': bearing_wear,  # Maximum bearing wear (legacy compatibility)
-            'seal_wear': seal_wear,
-            'seal_leakage': self.seal_leakage,
-            
-            # Performance factors - from lubrication system
-            'flow_factor': flow_factor,
-            'efficiency_factor': efficiency_factor,
-            'head_factor': head_factor,
-            
-            # Enhanced sensor readings
-            'npsh_available': self.state.npsh_available,
-            'suction_pressure': self.state.suction_pressure,
-            'discharge_pressure': self.state.discharge_pressure,
-            'differential_pressure': self.state.differential_pressure,
-            'oil_level': oil_level,
-            'oil_temperature': oil_temperature,
-            'bearing_temperature': bearing_temperature,
-            'motor_temperature': self.state.motor_temperature,
-            'motor_current': self.state.motor_current,
-            'motor_voltage': self.state.motor_voltage,
-            'vibration_level': self.state.vibration_level,
-            
-            # Enhanced Dynamic NPSH diagnostics with explicit impeller wear
-            'npsh_required_dynamic': npsh_required_dynamic,
-            'npsh_required_baseline': npsh_baseline,
-            'npsh_impeller_wear_penalty': impeller_wear_penalty,  # NEW: Explicit impeller penalty
-            'npsh_cavitation_penalty': cavitation_roughness_penalty,  # RENAMED: Cavitation roughness penalty
-            'npsh_speed_penalty': speed_penalty,
-            'npsh_flow_penalty': flow_penalty,
-            'npsh_bearing_penalty': bearing_penalty,  # NEW: Bearing misalignment penalty
-            'npsh_coupling_penalty': coupling_penalty,  # NEW: Multiplicative coupling penalty
-            'npsh_margin': self.state.npsh_available - npsh_required_dynamic,
-            
-            # Enhanced coupling diagnostics
-            'bearing_to_impeller_coupling': bearing_to_impeller_coupling,  # NEW: Coupling effect
-            'impeller_to_bearing_coupling': impeller_to_bearing_coupling,  # NEW: Coupling effect
-            
-            # Legacy compatibility
-            'npsh_wear_penalty': impeller_wear_penalty,  # Legacy: maps to new impeller penalty
-            'npsh_damage_penalty': cavitation_roughness_penalty,  # Legacy: maps to cavitation penalty
-            'impeller_wear_equivalent': self.state.cavitation_damage * 2.0,  # Legacy: cavitation equivalent
-        })
-        
-        return result
-    
-    def _simulate_cavitation(self, dt: float, system_conditions: Dict):
-        """Simulate enhanced cavitation modeling with damage accumulation"""
-        if self.state.status not in [PumpStatus.RUNNING, PumpStatus.STARTING]:
-            # Reset cavitation only when completely stopped
-            self.state.cavitation_intensity = 0.0
-            self.state.cavitation_time = 0.0
-            self.state.cavitation_noise_level = 0.0
-            return
-        
-        # Calculate dynamic NPSH requirement including wear effects
-        npsh_required_dynamic = self._calculate_dynamic_npsh_required()
-        cavitation_threshold = npsh_required_dynamic + self.cavitation_threshold_margin
-        
-        # Determine cavitation severity based on NPSH deficit
-        if self.state.npsh_available < cavitation_threshold:
-            npsh_deficit = cavitation_threshold - self.state.npsh_available
-            cavitation_severity = min(1.0, npsh_deficit / cavitation_threshold)
-            
-            # Flow factor - higher flow rates increase cavitation intensity
-            flow_factor = (self.state.flow_rate / self.config.rated_flow) ** 2
-            
-            # Calculate cavitation intensity (0-1 scale)
-            self.state.cavitation_intensity = cavitation_severity * flow_factor
-            
-            # Accumulate cavitation time (dt is in minutes)
-            self.state.cavitation_time += dt * 60.0  # Convert minutes to seconds
-            
-            # Calculate acoustic signature (noise increase)
-            self.state.cavitation_noise_level = 20.0 + self.state.cavitation_intensity * 30.0
-            
-            # Add cavitation-induced vibration
-            cavitation_vibration = self.state.cavitation_intensity * 2.0
-            self.state.vibration_level += cavitation_vibration
-            
-        else:
-            # No cavitation - reset intensity and noise
-            self.state.cavitation_intensity = 0.0
-            self.state.cavitation_noise_level = 0.0
-            
-            # Cavitation time decays slowly when not cavitating
-            self.state.cavitation_time = max(0.0, self.state.cavitation_time - dt * 6.0)
-        
-        # Calculate damage accumulation (continuous, no threshold)
-        # Any level of cavitation contributes to damage - matches real pump physics
-        damage_rate = (self.state.cavitation_intensity ** 2) * dt / 60.0  # Convert minutes to hours for damage rate
-        self.state.cavitation_damage += damage_rate
-    
-    def _simulate_mechanical_wear(self, dt: float, system_conditions: Dict):
         """
-        Simplified mechanical wear simulation - DRY principle applied
+        Update pump state for one time step: speed dynamics, flow, power,
+        sensors, protection, cavitation and mechanical wear
         
-        Most wear calculations now handled by lubrication system.
-        This method only handles pump-specific hydraulic effects.
+        Runs in the pump's bank slot (see FeedwaterPumpBank.update_pumps).
         """
-        if self.state.status != PumpStatus.RUNNING:
-            return
-        
-        # Only handle cavitation damage (pump hydraulic specific)
-        # All other wear is handled by lubrication system
-        if self.state.cavitation_intensity > 0.1:
-            damage_rate = (self.state.cavitation_intensity ** 2) * dt / 60.0
-            self.state.cavitation_damage += damage_rate
-    
-    # REMOVED: _get_chemistry_degradation_factors() - DRY principle applied
-    # Chemistry degradation logic moved to lubrication system's calculate_chemistry_degradation_factors()
-    # This eliminates duplicate chemistry calculations and follows single source of truth
-    
-    def _apply_performance_degradation(self):
-        """
-        Simplified performance degradation - DRY principle applied
-        
-        Performance factors now calculated entirely by lubrication system.
-        This method only handles pump-specific hydraulic effects not covered by lubrication.
-        
-        All mechanical wear, chemistry effects, and performance factor calculations
-        are now handled by the lubrication system's comprehensive update method.
-        """
-        # Performance factors are now calculated by lubrication system
-        # No duplicate calculations needed here
-        pass
+        return self._bank.update_pumps(dt, system_conditions, control_inputs, [self._bank_slot])[0]
     
-    def _simulate_sensors(self, dt: float, system_conditions: Dict):
+    def advance_degradation(self, dt: float) -> None:
         """
-        Simulate sensor readings with DRY-compliant delegation architecture
-        
-        ARCHITECTURE:
-        - Hydraulic sensors: Calculated locally (pump responsibility)
-        - Electrical sensors: Calculated locally (pump motor responsibility)
-        - Lubrication sensors: Accessed directly from lubrication system when needed
-        - Vibration sensors: Hybrid approach combining pump and lubrication effects
-        - No duplicate state management or state copying
-        """
-        
-        # === PUMP-SPECIFIC HYDRAULIC SENSORS (Local Responsibility) ===
-        self._simulate_hydraulic_sensors(system_conditions)
-        
-        # === ELECTRICAL SENSORS (Local Responsibility) ===  
-        self._simulate_electrical_sensors(system_conditions)
-        
-        # === VIBRATION SENSORS (Hybrid - Base + Lubrication Effects) ===
-        self._simulate_vibration_sensors()
+        Advance lubrication (oil quality, component wear) and cavitation damage
+        at the last operating conditions
         
-        # NOTE: Lubrication sensors (oil_level, oil_temperature, bearing_temperature,
-        # component_wear, performance_factors) are accessed directly from lubrication_system
-        # when needed. No state copying or duplication.
-    
-    def _simulate_hydraulic_sensors(self, system_conditions: Dict):
-        """
-        Simulate pump-specific hydraulic sensor readings
+        Used by steady-state fast-forward while the pump hydraulic state is held.
         
-        These sensors are pump-specific and not managed by lubrication system:
-        - Suction/discharge pressures
-        - Differential pressure  
-        - NPSH calculations
-        - Cavitation effects on hydraulic performance
-        """
-        # Suction pressure from system conditions (but respect initial conditions)
-        if not hasattr(self, '_initial_conditions_applied'):
-            self.state.suction_pressure = system_conditions.get('suction_pressure', 0.5)
-        
-        # Discharge pressure from system conditions (but respect initial conditions)
-        if not hasattr(self, '_initial_conditions_applied'):
-            self.state.discharge_pressure = system_conditions.get('discharge_pressure', 8.0)
-        
-        # Calculate differential pressure
-        self.state.differential_pressure = self.state.discharge_pressure - self.state.suction_pressure
-        
-        # NPSH calculation (pump hydraulic responsibility)
-        # CRITICAL FIX: Only calculate NPSH if not set by initial conditions
-        if not hasattr(self, '_initial_conditions_applied'):
-            feedwater_temp = system_conditions.get('feedwater_temperature', 227.0)
-            vapor_pressure = self._vapor_pressure(feedwater_temp)
-            npsh_available = (self.state.suction_pressure - vapor_pressure) * 100.0  # Convert to meters
-            self.state.npsh_available = max(0, npsh_available)
-    
-    def _simulate_electrical_sensors(self, system_conditions: Dict):
-        """
-        Simulate electrical sensor readings (pump motor responsibility)
-        
-        These sensors are specific to the pump motor and electrical system:
-        - Motor current based on hydraulic load
-        - Motor voltage (typically constant)
-        - Motor temperature (electrical heating effects only)
-        """
-        # Load factor for electrical calculations
-        load_factor = self.state.flow_rate / self.config.rated_flow if self.config.rated_flow > 0 else 0.0
-        
-        # Motor current based on hydraulic load
-        base_current = 200.0  # Base current at no load
-        load_current = 100.0 * load_factor  # Additional current from hydraulic load
-        self.state.motor_current = base_current + load_current
-        
-        # Motor voltage (typically constant for grid-connected motors)
-        self.state.motor_voltage = 6.6  # kV constant
-        
-        # Motor temperature (electrical heating only - no lubrication effects)
-        # Lubrication system handles bearing temperature; this is winding temperature
-        motor_base_temp = 60.0  # Base winding temperature
-        electrical_heating = 20.0 * load_factor  # Electrical losses heating (reduced from 30.0)
-        self.state.motor_temperature = motor_base_temp + electrical_heating
-    
-    
-    def _simulate_vibration_sensors(self):
-        """
-        Simulate vibration sensors with hybrid approach
-        
-        HYBRID APPROACH:
-        - Base mechanical vibration: Calculated locally from pump operation
-        - Lubrication-induced vibration: From lubrication system wear effects
-        - Cavitation-induced vibration: From pump hydraulic effects
-        - Combined signature: Sum of all vibration sources
+        Args:
+            dt: Time step (minutes)
         """
-        # Base mechanical vibration from pump operation
-        base_vibration = 1.0 + 0.05 * self.state.speed_percent  # Speed-dependent base vibration
+        system_conditions = getattr(self, 'last_system_conditions', None)
+        if system_conditions is None or self.state.status != PumpStatus.RUNNING:
+            return
         
-        # Lubrication-induced vibration (from bearing wear, oil quality, etc.)
-        lubrication_vibration = 0.0
         if hasattr(self, 'lubrication_system'):
-            lub_state = self.lubrication_system.get_state_dict()
-            lubrication_vibration = lub_state.get('vibration_increase', 0.0)
-        
-        # Cavitation-induced vibration (pump hydraulic responsibility)
-        cavitation_vibration = getattr(self.state, 'cavitation_intensity', 0.0) * 2.0
+            update_pump_lubrication(self, self.lubrication_system, dt, system_conditions)
         
-        # Combined vibration signature
-        self.state.vibration_level = base_vibration + lubrication_vibration + cavitation_vibration
-        
-        # Ensure reasonable bounds
-        self.state.vibration_level = max(0.5, min(15.0, self.state.vibration_level))
+        # Cavitation damage accrues at the held intensity, and again from
+        # mechanical wear above intensity 0.1 (as in FeedwaterPumpBank.update_pumps)
+        damage_rate = (self.state.cavitation_intensity ** 2) * dt / 60.0
+        self.state.cavitation_damage += damage_rate
+        if self.state.cavitation_intensity > 0.1:
+            self.state.cavitation_damage += damage_rate
     
-    # REMOVED: All bidirectional sync methods eliminated
-    # Following DRY principles - states now live in single location (lubrication system)
-    # Pump can directly access lubrication system data without sync complexity
-
     def perform_maintenance(self, maintenance_type: str = "general", **kwargs) -> Dict[str, Any]:
         """
         Clean maintenance dispatcher that delegates to lubrication system
@@ -1112,6 +713,10 @@ class FeedwaterPumpSystem(ChemistryFlowProvider):
     3. System-level protection and control
     4. Performance monitoring and diagnostics
     
+    The pumps share one FeedwaterPumpBank, so the pump physics is evaluated
+    once per update for the whole system; the FeedwaterPump objects remain
+    views of their bank slots.
+    
     Note: This class does not inherit from StateProviderMixin to prevent
     double registration. State collection is handled by EnhancedFeedwaterPhysics.
     """
@@ -1161,6 +766,9 @@ class FeedwaterPumpSystem(ChemistryFlowProvider):
             self.pumps[pump_config.pump_id] = pump
             self.pump_lubrication_systems[pump_config.pump_id] = lubrication_system
         
+        # Move the pumps into one shared bank
+        self.bank = FeedwaterPumpBank(list(self.pumps.values()))
+        
         # System parameters
         self.total_design_flow = 555.0 * config.num_steam_generators
         self.minimum_pumps_required = config.num_steam_generators
@@ -1189,18 +797,18 @@ class FeedwaterPumpSystem(ChemistryFlowProvider):
         if sg_conditions:
             total_steam_flow = sum(sg_conditions.get('sg_steam_flows', [555.0] * 3))
             required_total_flow = total_steam_flow * 1.02  # Small margin for level control
-            print(f"PUMP SYSTEM: Calculated flow demand from SG conditions: {required_total_flow:.1f} kg/s total")
+            logger.info("PUMP SYSTEM: Calculated flow demand from SG conditions: %.1f kg/s total", required_total_flow)
         else:
             # Fallback to conservative estimate (80% of design)
             required_total_flow = self.total_design_flow * 0.8
-            print(f"PUMP SYSTEM: Using fallback flow demand: {required_total_flow:.1f} kg/s total")
+            logger.info("PUMP SYSTEM: Using fallback flow demand: %.1f kg/s total", required_total_flow)
         
         # Account for pump degradation
         degradation_factor = self._calculate_system_degradation_factor()
         flow_per_pump = (required_total_flow / self.minimum_pumps_required) / degradation_factor
         
-        print(f"PUMP SYSTEM: System degradation factor: {degradation_factor:.3f}")
-        print(f"PUMP SYSTEM: Flow per pump: {flow_per_pump:.1f} kg/s")
+        logger.info("PUMP SYSTEM: System degradation factor: %.3f", degradation_factor)
+        logger.info("PUMP SYSTEM: Flow per pump: %.1f kg/s", flow_per_pump)
         
         # Start the required number of pumps with proper startup sequence
         for i in range(self.minimum_pumps_required):
@@ -1222,8 +830,8 @@ class FeedwaterPumpSystem(ChemistryFlowProvider):
                     # For steady-state initialization, immediately transition to RUNNING
                     pump.state.status = PumpStatus.RUNNING
                 
-                print(f"Pump {pump_id} initialized: speed={pump.state.speed_percent:.1f}%, "
-                      f"flow_demand={pump.flow_demand:.1f} kg/s, status={pump.state.status}")
+                logger.info("Pump %s initialized: speed=%.1f%%, flow_demand=%.1f kg/s, status=%s",
+                            pump_id, pump.state.speed_percent, pump.flow_demand, pump.state.status)
         
         # Keep spare pumps stopped
         for i in range(self.minimum_pumps_required, len(pump_ids)):
@@ -1256,37 +864,34 @@ class FeedwaterPumpSystem(ChemistryFlowProvider):
         else:
             individual_demands = []
 
-        # Update individual pumps
-        pump_results = {}
+        # Set flow demands for the running pumps (one demand per running pump,
+        # in pump order)
+        bank = self.bank
+        running = bank.status_mask(PumpStatus.RUNNING)
+        if individual_demands and running.any():
+            demanded = running & (np.cumsum(running) <= len(individual_demands))
+            # CRITICAL FIX: Don't override flow demand if it's much lower than design
+            # This prevents control system from setting unrealistically low demands during initialization
+            low_demand = demanded & (flow_per_pump < bank.cfg_rated_flow * 0.2)  # Less than 20% of rated flow
+            for slot in np.flatnonzero(low_demand).tolist():
+                logger.info("DEBUG: Rejecting low flow demand %.1f kg/s for %s, keeping %.1f kg/s",
+                            flow_per_pump, bank.members[slot].config.pump_id, bank.flow_demand[slot])
+            accepted = np.flatnonzero(demanded & ~low_demand)
+            if accepted.size:
+                bank.set_flow_demand(flow_per_pump, accepted)
+        
+        # Update all pumps together
+        pump_results = dict(zip(self.pumps, bank.update(dt, system_conditions, control_inputs)))
+        
+        running_pumps = []
         total_flow = 0.0
         total_power = 0.0
-        running_pumps = []
-        
-        for pump_id, pump in self.pumps.items():
-            # Set flow demand for running pumps
-            if pump.state.status == PumpStatus.RUNNING and individual_demands:
-                pump_index = len(running_pumps)
-                if pump_index < len(individual_demands):
-                    # CRITICAL FIX: Don't override flow demand if it's much lower than design
-                    # This prevents control system from setting unrealistically low demands during initialization
-                    new_demand = individual_demands[pump_index]
-                    if new_demand < pump.config.rated_flow * 0.2:  # Less than 20% of rated flow
-                        print(f"DEBUG: Rejecting low flow demand {new_demand:.1f} kg/s for {pump_id}, keeping {pump.flow_demand:.1f} kg/s")
-                    else:
-                        pump.set_flow_demand(new_demand)
-                        # print(f"PUMP SYSTEM DEBUG: Set {pump_id} flow demand to {individual_demands[pump_index]:.1f} kg/s")
-            
-            result = pump.update_pump(dt, system_conditions, control_inputs)
-            pump_results[pump_id] = result
-            
-            if pump.state.status == PumpStatus.RUNNING:
-                total_flow += pump.state.flow_rate
-                total_power += pump.state.power_consumption
+        for pump_id, is_running, flow_rate, power in zip(self.pumps, bank.status_mask(PumpStatus.RUNNING).tolist(),
+                                                         bank.flow_rate.tolist(), bank.power_consumption.tolist()):
+            if is_running:
+                total_flow += flow_rate
+                total_power += power
                 running_pumps.append(pump_id)
-                # print(f"PUMP SYSTEM DEBUG: {pump_id} actual flow={pump.state.flow_rate:.1f} kg/s, "
-                #      f"speed={pump.state.speed_percent:.1f}%")
-        
-        # print(f"PUMP SYSTEM DEBUG: Total system flow={total_flow:.1f} kg/s from {len(running_pumps)} pumps")
         
         # Update system totals
         self.total_flow = total_flow
@@ -1399,6 +1004,16 @@ class FeedwaterPumpSystem(ChemistryFlowProvider):
         return False
     
     
+    def advance_degradation(self, dt: float) -> None:
+        """
+        Advance lubrication and wear of every pump at its last operating conditions
+        
+        Args:
+            dt: Time step (minutes)
+        """
+        for pump in self.pumps.values():
+            pump.advance_degradation(dt)
+    
     def get_state_dict(self) -> Dict[str, float]:
         """Get current state as dictionary for logging/monitoring"""
         state_dict = {
@@ -9,12 +9,21 @@ Key Features:
 2. Component-level heat flow interfaces
 3. System-wide energy balance validation
 4. Debugging and diagnostic capabilities
+5. Configurable audit rate (see balance_validation.ValidationPolicy)
 """
 
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
+from simulator.sim_logging import get_logger
+from .steam_properties import CP_STEAM, CP_WATER, liquid_enthalpy, steam_properties
+from .balance_validation import BalanceHistory, ValidationPolicy, ValidationSchedule
+
+logger = get_logger(__name__)
+
+# Saturation properties used for the heat flow balance
+_STEAM_PROPERTIES = steam_properties('antoine')
 
 
 @dataclass
@@ -126,9 +135,8 @@ class ThermodynamicProperties:
             Steam enthalpy in kJ/kg
         """
         # Saturation properties
-        sat_temp = ThermodynamicProperties.saturation_temperature(pressure)
-        h_f = ThermodynamicProperties.saturation_enthalpy_liquid(pressure)
-        h_g = ThermodynamicProperties.saturation_enthalpy_vapor(pressure)
+        sat_temp, h_g = _STEAM_PROPERTIES.saturation(pressure)
+        h_f = CP_WATER * sat_temp
         h_fg = h_g - h_f
         
         if quality < 1.0:
@@ -140,8 +148,7 @@ class ThermodynamicProperties:
         else:
             # Superheated steam: h = h_g + cp * (T - T_sat)
             superheat = temperature - sat_temp
-            cp_steam = 2.1  # kJ/kg/K approximate specific heat of steam
-            return h_g + cp_steam * superheat
+            return h_g + CP_STEAM * superheat
     
     @staticmethod
     def liquid_enthalpy(temperature: float, pressure: float = 0.1) -> float:
@@ -157,36 +164,22 @@ class ThermodynamicProperties:
         """
         # Simplified correlation for liquid water
         # h = cp * T (reference at 0°C)
-        cp_water = 4.18  # kJ/kg/K
-        return cp_water * temperature
+        return liquid_enthalpy(temperature)
     
     @staticmethod
     def saturation_temperature(pressure: float) -> float:
         """Calculate saturation temperature for given pressure (°C)"""
-        if pressure <= 0.001:
-            return 10.0
-        
-        # Antoine equation coefficients for water
-        A, B, C = 8.07131, 1730.63, 233.426
-        pressure_bar = pressure * 10.0
-        pressure_bar = np.clip(pressure_bar, 0.01, 100.0)
-        
-        temp_c = B / (A - np.log10(pressure_bar)) - C
-        return np.clip(temp_c, 10.0, 374.0)
+        return _STEAM_PROPERTIES.saturation_temperature(pressure)
     
     @staticmethod
     def saturation_enthalpy_liquid(pressure: float) -> float:
         """Calculate saturation enthalpy of liquid water (kJ/kg)"""
-        temp = ThermodynamicProperties.saturation_temperature(pressure)
-        return 4.18 * temp
+        return _STEAM_PROPERTIES.saturation_enthalpy_liquid(pressure)
     
     @staticmethod
     def saturation_enthalpy_vapor(pressure: float) -> float:
         """Calculate saturation enthalpy of steam (kJ/kg)"""
-        temp = ThermodynamicProperties.saturation_temperature(pressure)
-        h_f = ThermodynamicProperties.saturation_enthalpy_liquid(pressure)
-        h_fg = 2257.0 * (1.0 - temp / 374.0) ** 0.38
-        return h_f + h_fg
+        return _STEAM_PROPERTIES.saturation_enthalpy_vapor(pressure)
     
     @staticmethod
     def enthalpy_flow_mw(mass_flow: float, specific_enthalpy: float) -> float:
@@ -211,20 +204,51 @@ class HeatFlowTracker:
     and provides comprehensive energy balance analysis.
     """
     
-    def __init__(self, heat_flow_providers: Optional[Dict[str, HeatFlowProvider]] = None):
+    def __init__(self, heat_flow_providers: Optional[Dict[str, HeatFlowProvider]] = None,
+                 validation_policy: Optional[ValidationPolicy] = None):
         """
         Initialize heat flow tracker
         
         Args:
             heat_flow_providers: Dictionary of component name -> HeatFlowProvider instances
+            validation_policy: How often update_balance() audits the energy balance
         """
         self.heat_flow_state = HeatFlowState()
         self.component_flows = {}  # Store individual component flows
-        self.flow_history = []     # Store historical flow data
         self.validation_tolerance = 0.01  # 1% tolerance for energy balance
         
+        # Audit rate and history of audit summaries
+        self.validation = ValidationSchedule(validation_policy)
+        self.flow_history = BalanceHistory(self.validation.policy.history_size)
+        self.last_validation = self.validate_energy_balance()
+        
         # Store heat flow providers for automatic updates
         self.heat_flow_providers = heat_flow_providers or {}
+    
+    def set_validation_policy(self, policy: ValidationPolicy) -> None:
+        """Replace the audit policy (the history is rebuilt if its size changes)"""
+        self.validation.policy = policy
+        if policy.history_size != self.flow_history.size:
+            self.flow_history = BalanceHistory(policy.history_size)
+    
+    def update_balance(self, timestamp: float, force: bool = False) -> Tuple[HeatFlowState, Dict[str, float]]:
+        """
+        Calculate, validate and record the energy balance if the validation policy says it is due
+        
+        Args:
+            timestamp: Operating hours recorded with the audit
+            force: Audit regardless of the policy (on-demand validation)
+            
+        Returns:
+            Heat flow state and validation of the latest audit
+        """
+        signature = [value for flows in self.component_flows.values() for value in flows.values()]
+        if force or self.validation.due(signature):
+            self.calculate_system_heat_flows()
+            self.last_validation = self.validate_energy_balance()
+            self.validation.record(signature)
+            self.add_to_history(timestamp)
+        return self.heat_flow_state, self.last_validation
         
     def update_from_providers(self) -> None:
         """Update component flows from all registered heat flow providers"""
@@ -233,7 +257,7 @@ class HeatFlowTracker:
                 flows = provider.get_heat_flows()
                 self.update_component_flows(component_name, flows)
             except Exception as e:
-                print(f"Warning: Failed to get heat flows from {component_name}: {e}")
+                logger.warning("Failed to get heat flows from %s: %s", component_name, e)
     
     def update_component_flows(self, component_name: str, flows: Dict[str, float]) -> None:
         """
@@ -418,15 +442,19 @@ class HeatFlowTracker:
             'balance_ok': abs(condenser_error_percent) < (self.validation_tolerance * 100)
         }
     
-    def get_heat_flow_summary(self) -> Dict[str, float]:
+    def get_heat_flow_summary(self, validation: Optional[Dict[str, float]] = None) -> Dict[str, float]:
         """
         Get comprehensive heat flow summary
         
+        Args:
+            validation: Validation of the current state (recomputed if None)
+            
         Returns:
             Dictionary with all heat flow data
         """
         state = self.heat_flow_state
-        validation = self.validate_energy_balance()
+        if validation is None:
+            validation = self.validate_energy_balance()
         
         return {
             # Primary energy flows
@@ -466,17 +494,8 @@ class HeatFlowTracker:
         }
     
     def add_to_history(self, timestamp: float) -> None:
-        """Add current state to historical data"""
-        history_entry = {
-            'timestamp': timestamp,
-            'heat_flows': self.get_heat_flow_summary(),
-            'component_flows': self.component_flows.copy()
-        }
-        self.flow_history.append(history_entry)
-        
-        # Limit history size
-        if len(self.flow_history) > 1000:
-            self.flow_history = self.flow_history[-1000:]
+        """Add the current heat flow summary to the history ring buffer"""
+        self.flow_history.append(timestamp, self.get_heat_flow_summary(self.last_validation))
     
     def get_state_dict(self) -> Dict[str, float]:
         """Get current state as dictionary for logging/monitoring"""
@@ -505,7 +524,9 @@ class HeatFlowTracker:
         """Reset heat flow tracker to initial state"""
         self.heat_flow_state = HeatFlowState()
         self.component_flows = {}
-        self.flow_history = []
+        self.flow_history.clear()
+        self.validation.reset()
+        self.last_validation = self.validate_energy_balance()
 
 
 # Example usage and testing
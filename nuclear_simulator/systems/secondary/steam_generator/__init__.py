@@ -17,6 +17,7 @@ from .config import (
 
 # Import the physics models (now using new config)
 from .steam_generator import SteamGenerator
+from .bank import SteamGeneratorBank
 from .enhanced_physics import (
     EnhancedSteamGeneratorPhysics,
 )
@@ -27,6 +28,7 @@ from .tsp_fouling_model import TSPFoulingModel, TSPFoulingConfig as TSPConfig
 __all__ = [
     # Main physics models
     'SteamGenerator', 
+    'SteamGeneratorBank',
     'EnhancedSteamGeneratorPhysics',
     
     # New comprehensive configuration system
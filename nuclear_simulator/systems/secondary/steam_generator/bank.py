@@ -0,0 +1,626 @@
+"""
+Steam Generator Bank
+
+This module provides the array-backed state and vectorized physics shared by
+the steam generators of one plant.
+
+The thermal-hydraulic state of every steam generator (pressures, levels,
+qualities, flows, heat transfer) is held as structure-of-arrays NumPy buffers,
+one value per SG. SteamGenerator objects stay the public per-SG interface
+(maintenance, fouling models, state reporting), but their state attributes are
+views onto a slot of the bank, so writes such as ``sg.water_level = 12.0``
+land in the arrays and the bank sees them.
+
+Each update computes heat transfer and secondary-side dynamics for all SGs at
+once. The fouling models are separate objects with their own schedules and
+are still advanced one SG at a time; their heat-transfer degradation,
+thermal resistances and pressure-drop ratios are gathered into arrays before
+and after that loop. SG for SG, the results match the former per-SG update
+to rounding (NumPy's vectorized pow can differ from the scalar one in the
+last bit).
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from ..steam_properties import (
+    CP_WATER,
+    compressed_liquid_enthalpy,
+    liquid_density,
+    steam_density,
+    steam_properties,
+)
+from simulator.sim_logging import get_logger
+
+logger = get_logger(__name__)
+
+# Saturation properties the steam generator models are calibrated against
+_STEAM_PROPERTIES = steam_properties('nist_fit')
+
+# Operating geometry and limits shared by every SG
+NORMAL_LEVEL = 12.5             # m, full heat transfer area at or above
+MIN_HEAT_TRANSFER_LEVEL = 8.0   # m, emergency heat transfer only at or below
+SG_CROSS_SECTION = np.pi * (4.0 / 2.0) ** 2     # m², 4 m diameter shell
+CP_PRIMARY = 5200.0             # J/kg/K primary coolant at PWR conditions
+PRESSURE_TIME_CONSTANT = 60.0   # s
+QUALITY_TIME_CONSTANT = 30.0    # s
+DESIGN_QUALITY = 0.995
+
+# Typical PWR primary chemistry seen by the tube interior fouling model
+PRIMARY_CHEMISTRY = {
+    'boric_acid_concentration': 1000.0,
+    'lithium_concentration': 2.0,
+    'primary_ph': 7.2,
+    'dissolved_oxygen': 0.005
+}
+
+ArrayInput = Union[float, Sequence[float], np.ndarray]
+
+
+def _clip(values, lower, upper):
+    """np.clip without its per-call overhead"""
+    return np.minimum(np.maximum(values, lower), upper)
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray, default: float = 0.0) -> np.ndarray:
+    """numerator / denominator where the denominator is positive, default elsewhere"""
+    out = np.empty(numerator.shape)
+    out.fill(default)
+    return np.divide(numerator, denominator, out=out, where=denominator > 0)
+
+
+class BankField:
+    """Steam generator attribute stored in its bank's array (one slot per SG)"""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return obj._bank.__dict__[self.name].item(obj._bank_slot)
+
+    def __set__(self, obj, value):
+        obj._bank.__dict__[self.name][obj._bank_slot] = value
+
+
+class SteamGeneratorBank:
+    """
+    Structure-of-arrays state and vectorized physics of a group of steam generators
+
+    Every field in STATE_FIELDS is an attribute holding one value per SG
+    (``bank.water_level[i]``). Config parameters are gathered into arrays of
+    the same shape when the bank is built.
+
+    With ``exact_lags`` set (adaptive stepping) the pressure imbalance
+    correction and the steam quality lag use their exact first-order forms,
+    so the settled state does not depend on the timestep. By default they
+    keep the explicit-Euler forms of the original model.
+    """
+
+    exact_lags = False
+
+    STATE_FIELDS = (
+        'primary_inlet_temp', 'primary_outlet_temp',
+        'secondary_pressure', 'secondary_temperature',
+        'steam_quality', 'water_level', 'steam_void_fraction',
+        'steam_flow_rate', 'feedwater_flow_rate', 'feedwater_temperature',
+        'tube_wall_temp', 'heat_transfer_rate', 'overall_htc', 'heat_flux',
+    )
+
+    CONFIG_FIELDS = (
+        'heat_transfer_area_per_sg', 'primary_design_flow', 'primary_htc', 'secondary_htc',
+        'design_pressure_secondary', 'tube_wall_thickness', 'tube_material_conductivity',
+        'design_thermal_power_per_sg', 'secondary_design_flow', 'secondary_water_mass',
+        'design_steam_flow_per_sg', 'design_feedwater_flow_per_sg',
+        'tube_inner_diameter', 'tube_count_per_sg',
+    )
+
+    def __init__(self, steam_generators: Sequence[Any]):
+        """
+        Build the bank and attach the steam generators to it
+
+        State already held by a steam generator (e.g. in its standalone bank)
+        is carried over into the new arrays.
+
+        Args:
+            steam_generators: SteamGenerator objects, one slot each
+        """
+        self.members = list(steam_generators)
+        size = len(self.members)
+        for name in self.STATE_FIELDS:
+            values = np.zeros(size)
+            for slot, sg in enumerate(self.members):
+                if '_bank' in sg.__dict__:
+                    values[slot] = getattr(sg, name)
+            setattr(self, name, values)
+
+        for slot, sg in enumerate(self.members):
+            sg._bank = self
+            sg._bank_slot = slot
+
+        self.refresh_config()
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def refresh_config(self) -> None:
+        """Gather the members' config parameters into arrays (after a config change)"""
+        for name in self.CONFIG_FIELDS:
+            setattr(self, 'cfg_' + name,
+                    np.array([getattr(sg.config, name) for sg in self.members], dtype=np.float64))
+        self.cfg_wall_resistance = self.cfg_tube_wall_thickness / self.cfg_tube_material_conductivity
+        self.cfg_design_heat_input = self.cfg_design_thermal_power_per_sg / 1000.0  # kJ/s
+        tube_cross_section = np.pi * (self.cfg_tube_inner_diameter / 2.0) ** 2
+        self.cfg_tube_flow_area = self.cfg_tube_count_per_sg * tube_cross_section  # m², primary side
+
+    def gather_fouling(self, slots: Union[slice, np.ndarray] = slice(None)) -> Dict[str, np.ndarray]:
+        """Current fouling state of the members in `slots` as arrays"""
+        members = self.members[slots] if isinstance(slots, slice) else [self.members[i] for i in slots]
+        return {
+            'tsp_degradation': np.array([sg.tsp_fouling.heat_transfer_degradation for sg in members]),
+            'tsp_pressure_drop_ratio': np.array([sg.tsp_fouling.pressure_drop_ratio for sg in members]),
+            'tsp_deposit_resistance': np.array([sg._calculate_tsp_scale_thermal_resistance() for sg in members]),
+            'scale_resistance': np.array([sg.tube_interior_fouling.scale_thermal_resistance for sg in members]),
+            'scale_thickness': np.array([sg.tube_interior_fouling.scale_thickness for sg in members]),
+        }
+
+    # Vectorized physics (all arguments are arrays over the selected slots)
+
+    def effective_heat_transfer_area(self, water_level: np.ndarray,
+                                     slots: Union[slice, np.ndarray] = slice(None)) -> np.ndarray:
+        """Wetted heat transfer area (m²): full at normal level, 10% at the minimum level"""
+        level_factor = 0.1 + 0.9 * (water_level - MIN_HEAT_TRANSFER_LEVEL) / (NORMAL_LEVEL - MIN_HEAT_TRANSFER_LEVEL)
+        level_factor = _clip(level_factor, 0.1, 1.0)
+        return self.cfg_heat_transfer_area_per_sg[slots] * level_factor
+
+    def heat_transfer(self, primary_temp_in: np.ndarray, primary_temp_out: np.ndarray,
+                      primary_flow: np.ndarray, secondary_pressure: np.ndarray,
+                      water_level: np.ndarray, fouling: Dict[str, np.ndarray],
+                      slots: Union[slice, np.ndarray] = slice(None),
+                      sat_temp: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        Primary-to-secondary heat transfer, Q = U * A_eff * LMTD
+
+        Args:
+            primary_temp_in: Primary coolant inlet temperatures (°C)
+            primary_temp_out: Primary coolant outlet temperatures (°C)
+            primary_flow: Primary coolant flow rates (kg/s)
+            secondary_pressure: Secondary side pressures (MPa)
+            water_level: Water levels setting the wetted area (m)
+            fouling: gather_fouling() of the same slots
+            slots: Bank slots the arrays belong to
+            sat_temp: Saturation temperatures at secondary_pressure, if already known
+
+        Returns:
+            Arrays of heat transfer rate (W) and the details reported per SG
+        """
+        if sat_temp is None:
+            sat_temp = _STEAM_PROPERTIES.saturation_temperature(secondary_pressure)
+
+        # Log mean temperature difference for counter-current flow
+        delta_t1 = primary_temp_in - sat_temp
+        delta_t2 = primary_temp_out - sat_temp
+        with np.errstate(divide='ignore', invalid='ignore'):
+            lmtd = np.where(np.abs(delta_t1 - delta_t2) < 1.0,
+                            (delta_t1 + delta_t2) / 2.0,
+                            (delta_t1 - delta_t2) / np.log(delta_t1 / delta_t2))
+
+            # Thermal resistance network: 1/U = 1/h_p + t_w/k_w + 1/h_s
+            flow_factor = (primary_flow / self.cfg_primary_design_flow[slots]) ** 0.8
+            h_primary = self.cfg_primary_htc[slots] * flow_factor
+            pressure_factor = (secondary_pressure / self.cfg_design_pressure_secondary[slots]) ** 0.15
+            h_secondary = self.cfg_secondary_htc[slots] * pressure_factor
+            r_wall = self.cfg_wall_resistance[slots]
+            overall_htc = 1.0 / (1.0 / h_primary + r_wall + 1.0 / h_secondary)
+
+            # TSP fouling degradation, then tube interior scale in series
+            overall_htc_with_tsp_fouling = overall_htc * (1.0 - fouling['tsp_degradation'])
+            scale_resistance = fouling['scale_resistance']
+            overall_htc_with_all_fouling = np.where(
+                scale_resistance > 0,
+                1.0 / (1.0 / overall_htc_with_tsp_fouling + scale_resistance),
+                overall_htc_with_tsp_fouling)
+
+        effective_area = self.effective_heat_transfer_area(water_level, slots)
+        heat_transfer_rate = overall_htc_with_all_fouling * effective_area * lmtd
+
+        # Cannot exceed the energy available from the primary coolant
+        max_heat_from_primary = primary_flow * CP_PRIMARY * (primary_temp_in - primary_temp_out)
+        temp_difference = primary_temp_in - primary_temp_out
+        # (severely limited below a 5°C primary temperature drop, none below 1°C or 100 kg/s)
+        heat_transfer_rate = np.minimum(heat_transfer_rate,
+                                        np.where(temp_difference < 5.0, max_heat_from_primary * 0.1,
+                                                 max_heat_from_primary))
+        no_transfer = (temp_difference < 1.0) | (primary_flow < 100.0) | (heat_transfer_rate < 0)
+        heat_transfer_rate = np.where(no_transfer, 0.0, heat_transfer_rate)
+
+        # Tube wall temperature from the resistances between secondary bulk and wall center
+        design_area = self.cfg_heat_transfer_area_per_sg[slots]
+        operating_heat_flux = np.maximum(heat_transfer_rate / design_area, 5000.0)
+        r_scale_primary = fouling['scale_resistance']
+        r_scale_secondary = fouling['tsp_deposit_resistance']
+        r_secondary_to_tube_wall = 1.0 / h_secondary + r_scale_secondary + r_wall / 2.0 + r_scale_primary
+        tube_wall_temp = sat_temp + operating_heat_flux * r_secondary_to_tube_wall
+
+        return {
+            'heat_transfer_rate': heat_transfer_rate,
+            'overall_htc': overall_htc,
+            'lmtd': lmtd,
+            'sat_temp_secondary': sat_temp,
+            'tube_wall_temp': tube_wall_temp,
+            'heat_flux': operating_heat_flux,
+            'h_primary': h_primary,
+            'h_secondary': h_secondary,
+            'delta_t1': delta_t1,
+            'delta_t2': delta_t2,
+            'flow_factor': flow_factor,
+            'pressure_factor': pressure_factor,
+            'primary_scale_thermal_resistance': r_scale_primary,
+            'tsp_scale_thermal_resistance': r_scale_secondary,
+            'scale_temperature_contribution': operating_heat_flux * r_scale_primary,
+            'total_thermal_resistance_to_tube_wall': r_secondary_to_tube_wall,
+            'operating_heat_flux': operating_heat_flux,
+            'overall_htc_with_tsp_fouling': overall_htc_with_tsp_fouling,
+            'overall_htc_with_all_fouling': overall_htc_with_all_fouling,
+        }
+
+    def secondary_dynamics(self, heat_input: np.ndarray, steam_flow_out: np.ndarray,
+                           feedwater_flow_in: np.ndarray, feedwater_temp: np.ndarray, dt: float,
+                           slots: Union[slice, np.ndarray] = slice(None),
+                           saturation: Optional[tuple] = None) -> Dict[str, np.ndarray]:
+        """
+        Secondary side mass and energy balance, pressure, level and quality
+
+        Starts from the bank's current pressure, level, quality and void
+        fraction in `slots` and returns their new values (not stored).
+
+        Args:
+            heat_input: Heat transfer rates from primary (W)
+            steam_flow_out: Steam flow rates leaving the SGs (kg/s)
+            feedwater_flow_in: Feedwater flow rates entering the SGs (kg/s)
+            feedwater_temp: Feedwater temperatures (°C)
+            dt: Time step (s)
+            slots: Bank slots the arrays belong to
+            saturation: (temperature, vapor enthalpy) at the current pressures, if already known
+
+        Returns:
+            Arrays of new state values and balance terms per SG
+        """
+        pressure = self.secondary_pressure[slots]
+        design_power = self.cfg_design_thermal_power_per_sg[slots]
+        design_flow = self.cfg_secondary_design_flow[slots]
+        design_area = self.cfg_heat_transfer_area_per_sg[slots]
+
+        # Current thermodynamic properties
+        sat_temp, h_g = saturation if saturation is not None else _STEAM_PROPERTIES.saturation(pressure)
+        h_f = CP_WATER * sat_temp
+        h_fg = h_g - h_f
+        h_fw = compressed_liquid_enthalpy(feedwater_temp, pressure)
+        rho_f = liquid_density(sat_temp, pressure)
+        rho_g = steam_density(sat_temp, pressure)
+
+        mass_change_rate = feedwater_flow_in - steam_flow_out
+        heat_input_kj = heat_input / 1000.0
+
+        # Steam generation from the energy left after heating feedwater to saturation;
+        # no steam without feedwater
+        steam_generation_rate = np.fmax((heat_input_kj - feedwater_flow_in * (h_f - h_fw)) / h_fg, 0.0)
+        steam_generation_rate = np.where(feedwater_flow_in < 0.1, 0.0, steam_generation_rate)
+
+        # Equilibrium pressure rises with heat input and falls with steam demand
+        heat_input_factor = _ratio(heat_input_kj, self.cfg_design_heat_input[slots])
+        equilibrium_pressure = _clip(self.cfg_design_pressure_secondary[slots] * (0.7 + 0.3 * heat_input_factor),
+                                     3.0, 8.5)
+        steam_demand_factor = _ratio(steam_flow_out, design_flow)
+        equilibrium_pressure = _clip(equilibrium_pressure - steam_demand_factor * 0.5, 3.0, 8.5)
+
+        # First-order approach to equilibrium, exact for any timestep
+        decay_factor = np.exp(-dt / PRESSURE_TIME_CONSTANT)
+        base_new_pressure = equilibrium_pressure + (pressure - equilibrium_pressure) * decay_factor
+
+        # Inventory depletion when steam is drawn without feedwater
+        depleting = (feedwater_flow_in < 0.1) & (steam_flow_out > 100.0)
+        inventory_depletion_rate = -steam_flow_out / self.cfg_secondary_water_mass[slots]
+        pressure_corrections = np.where(depleting, inventory_depletion_rate * pressure * 2.0 * dt, 0.0)
+
+        # Supply/demand imbalance (small short-term effect; integrated over the
+        # pressure lag with exact lags)
+        steam_supply_factor = _ratio(steam_generation_rate, design_flow)
+        supply_demand_imbalance = steam_supply_factor - steam_demand_factor
+        if self.exact_lags:
+            imbalance_correction = supply_demand_imbalance * 0.005 * PRESSURE_TIME_CONSTANT * (1.0 - decay_factor)
+        else:
+            imbalance_correction = supply_demand_imbalance * 0.005 * dt
+        pressure_corrections = pressure_corrections + imbalance_correction
+        pressure_corrections = _clip(pressure_corrections, -0.2, 0.2)
+
+        new_pressure = _clip(base_new_pressure + pressure_corrections, 1.0, 8.0)
+
+        # Water level from inventory change plus swell
+        level_change_mass = mass_change_rate * dt / (rho_f * SG_CROSS_SECTION)
+        volume_expansion = steam_generation_rate * dt * (1.0 / rho_g - 1.0 / rho_f)
+        level_change_swell = volume_expansion / SG_CROSS_SECTION
+        total_level_change = level_change_mass + level_change_swell
+        new_water_level = _clip(self.water_level[slots] + total_level_change, 8.0, 16.0)
+
+        # Separator performance: low level, excess steam flow and heat flux degrade quality
+        quality_degradation = np.fmax(11.0 - new_water_level, 0.0) / 3.0 * 0.02
+        flow_factor = steam_flow_out / design_flow
+        quality_degradation = quality_degradation + np.minimum(np.fmax(flow_factor - 1.1, 0.0) * 0.01, 0.03)
+        heat_flux_ratio = (heat_input / design_area) / (design_power / design_area)
+        quality_degradation = quality_degradation + np.minimum(np.fmax(heat_flux_ratio - 1.2, 0.0) * 0.005, 0.02)
+
+        target_quality = _clip(DESIGN_QUALITY - quality_degradation, 0.90, 1.0)
+        steam_quality = self.steam_quality[slots]
+        if self.exact_lags:
+            quality_decay = np.exp(-dt / QUALITY_TIME_CONSTANT)
+            new_steam_quality = target_quality + (steam_quality - target_quality) * quality_decay
+        else:
+            new_steam_quality = steam_quality + (target_quality - steam_quality) / QUALITY_TIME_CONSTANT * dt
+        new_steam_quality = _clip(new_steam_quality, 0.90, 1.0)
+
+        # Void fraction from quality (homogeneous flow model)
+        new_void_fraction = np.where(
+            new_steam_quality > 0,
+            (new_steam_quality * rho_f) / (new_steam_quality * rho_f + (1 - new_steam_quality) * rho_g),
+            0.0)
+        new_void_fraction = _clip(new_void_fraction, 0.0, 0.8)
+
+        energy_change_rate = feedwater_flow_in * h_fw + heat_input_kj - steam_flow_out * h_g
+
+        return {
+            'pressure_change_rate': (new_pressure - pressure) / dt,
+            'level_change_rate': total_level_change / dt,
+            'steam_quality_change': (new_steam_quality - self.steam_quality[slots]) / dt,
+            'void_fraction_change': (new_void_fraction - self.steam_void_fraction[slots]) / dt,
+            'new_pressure': new_pressure,
+            'new_water_level': new_water_level,
+            'new_steam_quality': new_steam_quality,
+            'new_void_fraction': new_void_fraction,
+            'steam_generation_rate': steam_generation_rate,
+            'energy_balance': energy_change_rate,
+            'level_change_mass': level_change_mass,
+            'level_change_swell': level_change_swell,
+            'mass_change_rate': mass_change_rate,
+            'supply_demand_imbalance': supply_demand_imbalance,
+            'quality_degradation': quality_degradation,
+            'target_quality': target_quality,
+        }
+
+    def tsp_flow_restrictions(self, steam_flow: np.ndarray, feedwater_flow: np.ndarray,
+                              pressure_drop_ratio: np.ndarray,
+                              slots: Union[slice, np.ndarray] = slice(None)):
+        """
+        Cap steam and feedwater flows at what the fouled TSPs pass
+
+        Flow capacity ∝ 1/√(pressure_drop_ratio).
+
+        Returns:
+            (actual steam flows, actual feedwater flows, restriction factors)
+        """
+        flow_capacity_factor = 1.0 / np.sqrt(pressure_drop_ratio)
+        actual_steam_flow = np.minimum(steam_flow, self.cfg_design_steam_flow_per_sg[slots] * flow_capacity_factor)
+        actual_feedwater_flow = np.minimum(feedwater_flow,
+                                           self.cfg_design_feedwater_flow_per_sg[slots] * flow_capacity_factor)
+        restriction = _ratio(actual_steam_flow, steam_flow, default=1.0)
+        return actual_steam_flow, actual_feedwater_flow, restriction
+
+    def primary_flow_restrictions(self, primary_flow: np.ndarray, scale_thickness: np.ndarray,
+                                  slots: Union[slice, np.ndarray] = slice(None)):
+        """
+        Cap primary flows for the tube bore lost to interior scale
+
+        Flow area ∝ D², pressure drop ∝ 1/D⁴; pumps cover up to 3x the
+        clean pressure drop.
+
+        Returns:
+            (actual primary flows, restriction factors)
+        """
+        clean_diameter = self.cfg_tube_inner_diameter[slots]
+        effective_diameter = np.maximum(clean_diameter - 2.0 * (scale_thickness / 1000.0), clean_diameter * 0.5)
+        area_ratio = (np.pi * (effective_diameter / 2.0) ** 2) / (np.pi * (clean_diameter / 2.0) ** 2)
+        pressure_drop_ratio = 1.0 / ((effective_diameter / clean_diameter) ** 4)
+        max_pressure_ratio = 3.0
+        flow_capacity_factor = np.where(pressure_drop_ratio <= max_pressure_ratio, area_ratio,
+                                        area_ratio * (max_pressure_ratio / pressure_drop_ratio) ** 0.5)
+        actual_primary_flow = np.minimum(primary_flow, self.cfg_primary_design_flow[slots] * flow_capacity_factor)
+        restriction = _ratio(actual_primary_flow, primary_flow, default=1.0)
+        return actual_primary_flow, restriction
+
+    @staticmethod
+    def pump_energy(pressure_drop_ratio: ArrayInput) -> Dict[str, Any]:
+        """Feedwater pump power (MW per SG) including the TSP fouling pressure drop penalty"""
+        base_pump_power_mw = 5.0
+        fouling_energy_penalty_mw = base_pump_power_mw * (pressure_drop_ratio - 1.0) * 0.5  # 50% efficiency
+        return {
+            'base_pump_power_mw': base_pump_power_mw,
+            'fouling_energy_penalty_mw': fouling_energy_penalty_mw,
+            'total_pump_power_mw': base_pump_power_mw + fouling_energy_penalty_mw,
+        }
+
+    # Update
+
+    def update(self,
+               primary_temp_in: ArrayInput,
+               primary_temp_out: ArrayInput,
+               primary_flow: ArrayInput,
+               steam_flow_out: ArrayInput,
+               feedwater_flow_in: ArrayInput,
+               feedwater_temp: ArrayInput,
+               dt: float,
+               system_conditions: Optional[Dict[str, Any]] = None,
+               slots: Optional[Sequence[int]] = None) -> List[Dict[str, Any]]:
+        """
+        Advance the steam generators in `slots` (all by default) by one time step
+
+        Args:
+            primary_temp_in: Primary inlet temperature per SG (°C)
+            primary_temp_out: Primary outlet temperature per SG (°C)
+            primary_flow: Primary flow rate per SG (kg/s)
+            steam_flow_out: Requested steam flow per SG (kg/s)
+            feedwater_flow_in: Requested feedwater flow per SG (kg/s)
+            feedwater_temp: Feedwater temperature (°C), scalar or per SG
+            dt: Time step (s)
+            system_conditions: May carry 'water_chemistry_update', applied once per SG
+            slots: Bank slots to advance (None: all)
+
+        Returns:
+            One SteamGenerator.update_state result dict per advanced SG
+        """
+        if slots is None:
+            index = slice(None)
+            members = self.members
+        else:
+            index = np.asarray(slots, dtype=np.intp)
+            members = [self.members[i] for i in index]
+        size = len(members)
+
+        def as_array(values):
+            values = np.asarray(values, dtype=np.float64)
+            return values if values.shape == (size,) else np.full(size, values)
+
+        primary_temp_in = as_array(primary_temp_in)
+        primary_temp_out = as_array(primary_temp_out)
+        primary_flow = as_array(primary_flow)
+        steam_flow_out = as_array(steam_flow_out)
+        feedwater_flow_in = as_array(feedwater_flow_in)
+        feedwater_temp = as_array(feedwater_temp)
+
+        # Heat transfer at the current pressure, level and fouling
+        # (the pressure does not change until the dynamics, so saturation is looked up once)
+        secondary_pressure = self.secondary_pressure[index]
+        saturation = _STEAM_PROPERTIES.saturation(secondary_pressure)
+        fouling = self.gather_fouling(index)
+        ht = self.heat_transfer(primary_temp_in, primary_temp_out, primary_flow,
+                                secondary_pressure, self.water_level[index], fouling, index,
+                                sat_temp=saturation[0])
+        heat_transfer = ht['heat_transfer_rate']
+        self.secondary_temperature[index] = ht['sat_temp_secondary']
+        self.tube_wall_temp[index] = ht['tube_wall_temp']
+        self.overall_htc[index] = ht['overall_htc']
+        self.heat_flux[index] = ht['heat_flux']
+        for sg, wall_temp in zip(members, ht['tube_wall_temp'].tolist()):
+            if wall_temp > 400.0:
+                logger.warning("WARNING: Very high tube wall temperature: %.1f°C - Scale thickness: %.1fmm",
+                               wall_temp, sg.tube_interior_fouling.scale_thickness)
+
+        # Fouling models advance one SG at a time (each on its own schedule)
+        avg_velocity = primary_flow / (1000.0 * self.cfg_tube_flow_area[index])  # m/s, water density ~1000 kg/m³
+        chemistry_update = None
+        if system_conditions is not None and 'water_chemistry_update' in system_conditions:
+            chemistry_update = system_conditions['water_chemistry_update']
+        secondary_temperature = self.secondary_temperature[index].tolist()
+        velocities = avg_velocity.tolist()
+        primary_average = ((primary_temp_in + primary_temp_out) / 2.0).tolist()
+        tsp_results = []
+        tube_interior_results = []
+        for i, sg in enumerate(members):
+            if chemistry_update is not None:
+                sg.water_chemistry.update_chemistry(chemistry_update, dt / 60.0)
+            tsp_results.append(sg.scheduler.run(
+                'tsp_fouling', dt / 60.0,
+                temperature=secondary_temperature[i],
+                flow_velocity=velocities[i]
+            ))
+            tube_interior_results.append(sg.scheduler.run(
+                'tube_interior_fouling', dt / 60.0,
+                primary_conditions={
+                    'temperature': primary_average[i],
+                    'flow_velocity': velocities[i],
+                    'chemistry': dict(PRIMARY_CHEMISTRY)
+                }
+            ))
+
+        # Flow restrictions and pump energy from the updated fouling
+        pressure_drop_ratio = np.array([sg.tsp_fouling.pressure_drop_ratio for sg in members])
+        scale_thickness = np.array([sg.tube_interior_fouling.scale_thickness for sg in members])
+        actual_steam_flow, actual_feedwater_flow, flow_restriction_factor = self.tsp_flow_restrictions(
+            steam_flow_out, feedwater_flow_in, pressure_drop_ratio, index)
+        actual_primary_flow, primary_flow_restriction_factor = self.primary_flow_restrictions(
+            primary_flow, scale_thickness, index)
+        pump_energy = self.pump_energy(pressure_drop_ratio)
+
+        dynamics = self.secondary_dynamics(heat_transfer, actual_steam_flow, actual_feedwater_flow,
+                                           feedwater_temp, dt, index, saturation=saturation)
+
+        # Update state
+        self.primary_inlet_temp[index] = primary_temp_in
+        self.primary_outlet_temp[index] = primary_temp_out
+        self.secondary_pressure[index] = dynamics['new_pressure']
+        self.water_level[index] = dynamics['new_water_level']
+        self.steam_quality[index] = dynamics['new_steam_quality']
+        self.steam_void_fraction[index] = dynamics['new_void_fraction']
+        self.steam_flow_rate[index] = actual_steam_flow
+        self.feedwater_flow_rate[index] = actual_feedwater_flow
+        self.feedwater_temperature[index] = feedwater_temp
+        self.heat_transfer_rate[index] = heat_transfer
+
+        # Performance metrics
+        design_power = self.cfg_design_thermal_power_per_sg[index]
+        max_possible_heat_transfer = primary_flow * CP_PRIMARY * (primary_temp_in - self.secondary_temperature[index])
+        effectiveness = _ratio(heat_transfer, max_possible_heat_transfer)
+        net_thermal_efficiency = _ratio(heat_transfer - pump_energy['total_pump_power_mw'] * 1e6, design_power)
+
+        columns = {
+            'heat_transfer_rate': heat_transfer,
+            'thermal_efficiency': heat_transfer / design_power,
+            'effectiveness': effectiveness,
+            'secondary_pressure': self.secondary_pressure[index],
+            'secondary_temperature': self.secondary_temperature[index],
+            'water_level': self.water_level[index],
+            'steam_quality': self.steam_quality[index],
+            'steam_void_fraction': self.steam_void_fraction[index],
+            'steam_production_rate': dynamics['steam_generation_rate'],
+            'steam_flow_rate': self.steam_flow_rate[index],
+            'feedwater_flow_rate': self.feedwater_flow_rate[index],
+            'requested_steam_flow': steam_flow_out,
+            'actual_steam_flow': actual_steam_flow,
+            'requested_feedwater_flow': feedwater_flow_in,
+            'actual_feedwater_flow': actual_feedwater_flow,
+            'flow_restriction_factor': flow_restriction_factor,
+            'requested_primary_flow': primary_flow,
+            'actual_primary_flow': actual_primary_flow,
+            'primary_flow_restriction_factor': primary_flow_restriction_factor,
+            'base_pump_power_mw': np.full(size, pump_energy['base_pump_power_mw']),
+            'fouling_energy_penalty_mw': pump_energy['fouling_energy_penalty_mw'],
+            'total_pump_power_mw': pump_energy['total_pump_power_mw'],
+            'net_thermal_efficiency': net_thermal_efficiency,
+            'pressure_change_rate': dynamics['pressure_change_rate'],
+            'level_change_rate': dynamics['level_change_rate'],
+            'mass_change_rate': dynamics['mass_change_rate'],
+            'tube_wall_temperature': ht['tube_wall_temp'],
+            'overall_htc': ht['overall_htc'],
+            'heat_flux': ht['heat_flux'],
+            'lmtd': ht['lmtd'],
+            'h_primary': ht['h_primary'],
+            'h_secondary': ht['h_secondary'],
+            'flow_factor': ht['flow_factor'],
+            'pressure_factor': ht['pressure_factor'],
+        }
+        names = list(columns)
+        rows = zip(*(np.asarray(column).tolist() for column in columns.values()))
+
+        results = []
+        for row, tsp_result, tube_interior_result in zip(rows, tsp_results, tube_interior_results):
+            result = dict(zip(names, row))
+            result.update({
+                'tsp_fouling_fraction': tsp_result['fouling_fraction'],
+                'tsp_fouling_stage': tsp_result['fouling_stage'],
+                'tsp_heat_transfer_degradation': tsp_result['heat_transfer_degradation'],
+                'tsp_pressure_drop_ratio': tsp_result['pressure_drop_ratio'],
+                'tsp_operating_years': tsp_result['operating_years'],
+                'tsp_shutdown_required': tsp_result['shutdown_required'],
+                'tsp_replacement_recommended': tsp_result['replacement_recommended'],
+                'tsp_cleaning_cycles': tsp_result['cleaning_cycles'],
+                'tube_scale_thickness_mm': tube_interior_result['scale_thickness_mm'],
+                'tube_scale_thermal_resistance': tube_interior_result['scale_thermal_resistance'],
+                'tube_scale_formation_rate_mm_per_year': tube_interior_result['scale_formation_rate_mm_per_year'],
+                'tube_thermal_efficiency_loss': tube_interior_result['thermal_efficiency_loss'],
+                'tube_fouling_fraction': tube_interior_result['fouling_fraction'],
+                'tube_operating_years': tube_interior_result['operating_years'],
+                'tube_replacement_recommended': tube_interior_result['replacement_recommended']
+            })
+            results.append(result)
+        return results
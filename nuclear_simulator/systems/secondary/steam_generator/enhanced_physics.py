@@ -27,9 +27,13 @@ from ..heat_flow_tracker import HeatFlowProvider, ThermodynamicProperties
 from ..chemistry_flow_tracker import ChemistryFlowProvider, ChemicalSpecies
 
 from .steam_generator import SteamGenerator
+from .bank import SteamGeneratorBank
 from .config import SteamGeneratorConfig
 from ..water_chemistry import WaterChemistry, WaterChemistryConfig
 from ..component_descriptions import STEAM_GENERATOR_COMPONENT_DESCRIPTIONS
+from simulator.sim_logging import get_logger
+
+logger = get_logger(__name__)
 
 
 @auto_register("SECONDARY", "steam_generator", allow_no_id=True,
@@ -130,6 +134,9 @@ class EnhancedSteamGeneratorPhysics(HeatFlowProvider, ChemistryFlowProvider):
             sg = SteamGenerator(sg_config, water_chemistry=self.water_chemistry)
             self.steam_generators.append(sg)
         
+        # Shared state arrays: the SGs become views onto one slot each and are updated together
+        self.bank = SteamGeneratorBank(self.steam_generators)
+        
         # System state variables
         self.total_thermal_power = 0.0                   # W total thermal power
         self.total_steam_flow = 0.0                      # kg/s total steam flow
@@ -151,7 +158,7 @@ class EnhancedSteamGeneratorPhysics(HeatFlowProvider, ChemistryFlowProvider):
         # CRITICAL: Apply initial conditions after creating components
         self._apply_initial_conditions()
         
-        print(f"STEAM GENERATOR: Applied initial conditions from config")
+        logger.info("STEAM GENERATOR: Applied initial conditions from config")
     
     def _apply_tsp_fouling_initial_conditions(self, sg, sg_index, total_thickness):
         """
@@ -165,7 +172,7 @@ class EnhancedSteamGeneratorPhysics(HeatFlowProvider, ChemistryFlowProvider):
         if total_thickness <= 0:
             return
         
-        print(f"    Applying {total_thickness:.3f} mm TSP fouling to SG-{sg_index}")
+        logger.info("    Applying %.3f mm TSP fouling to SG-%s", total_thickness, sg_index)
         
         # Calculate level distribution factors (matches formation rate physics)
         level_factors = []
@@ -193,8 +200,8 @@ class EnhancedSteamGeneratorPhysics(HeatFlowProvider, ChemistryFlowProvider):
         sg.tsp_fouling.heat_transfer_degradation = sg.tsp_fouling.calculate_heat_transfer_degradation(sg.tsp_fouling.fouling_fraction)
         sg.tsp_fouling.fouling_stage = sg.tsp_fouling.determine_fouling_stage(sg.tsp_fouling.fouling_fraction)
         
-        print(f"      -> Fouling fraction: {sg.tsp_fouling.fouling_fraction:.3f}")
-        print(f"      -> Heat transfer degradation: {sg.tsp_fouling.heat_transfer_degradation:.3f}")
+        logger.info("      -> Fouling fraction: %.3f", sg.tsp_fouling.fouling_fraction)
+        logger.info("      -> Heat transfer degradation: %.3f", sg.tsp_fouling.heat_transfer_degradation)
 
     def _apply_scale_initial_conditions(self, sg, sg_index, scale_thickness):
         """
@@ -208,7 +215,7 @@ class EnhancedSteamGeneratorPhysics(HeatFlowProvider, ChemistryFlowProvider):
         if scale_thickness <= 0:
             return
         
-        print(f"    Applying {scale_thickness:.3f} mm scale thickness to SG-{sg_index}")
+        logger.info("    Applying %.3f mm scale thickness to SG-%s", scale_thickness, sg_index)
         
         # Set scale thickness directly
         sg.tube_interior_fouling.scale_thickness = scale_thickness
@@ -225,8 +232,8 @@ class EnhancedSteamGeneratorPhysics(HeatFlowProvider, ChemistryFlowProvider):
         max_resistance = 0.001  # m²K/W - significant thermal resistance
         sg.tube_interior_fouling.fouling_fraction = min(sg.tube_interior_fouling.scale_thermal_resistance / max_resistance, 1.0)
         
-        print(f"      -> Scale thermal resistance: {sg.tube_interior_fouling.scale_thermal_resistance:.6f} m²K/W")
-        print(f"      -> Fouling fraction: {sg.tube_interior_fouling.fouling_fraction:.3f}")
+        logger.info("      -> Scale thermal resistance: %.6f m²K/W", sg.tube_interior_fouling.scale_thermal_resistance)
+        logger.info("      -> Fouling fraction: %.3f", sg.tube_interior_fouling.fouling_fraction)
 
     def _apply_initial_conditions(self):
         """
@@ -238,52 +245,52 @@ class EnhancedSteamGeneratorPhysics(HeatFlowProvider, ChemistryFlowProvider):
         """
         ic = self.config.initial_conditions
         
-        print(f"STEAM GENERATOR: Applying initial conditions:")
-        print(f"  SG levels: {ic.sg_levels}")
-        print(f"  SG pressures: {ic.sg_pressures}")
-        print(f"  SG temperatures: {ic.sg_temperatures}")
-        print(f"  SG steam qualities: {ic.sg_steam_qualities}")
-        print(f"  TSP fouling thicknesses: {ic.tsp_fouling_thicknesses}")
+        logger.info("STEAM GENERATOR: Applying initial conditions:")
+        logger.info("  SG levels: %s", ic.sg_levels)
+        logger.info("  SG pressures: %s", ic.sg_pressures)
+        logger.info("  SG temperatures: %s", ic.sg_temperatures)
+        logger.info("  SG steam qualities: %s", ic.sg_steam_qualities)
+        logger.info("  TSP fouling thicknesses: %s", ic.tsp_fouling_thicknesses)
         
         # Apply initial conditions to individual steam generators
         for i, sg in enumerate(self.steam_generators):
-            print(f"  Applying initial conditions to SG-{i}:")
+            logger.info("  Applying initial conditions to SG-%s:", i)
             
             # Apply operational conditions
             if i < len(ic.sg_levels):
                 sg.water_level = ic.sg_levels[i]
-                print(f"    Water level: {ic.sg_levels[i]} m")
+                logger.info("    Water level: %s m", ic.sg_levels[i])
             
             if i < len(ic.sg_pressures):
                 sg.secondary_pressure = ic.sg_pressures[i]
-                print(f"    Secondary pressure: {ic.sg_pressures[i]} MPa")
+                logger.info("    Secondary pressure: %s MPa", ic.sg_pressures[i])
             
             if i < len(ic.sg_temperatures):
                 sg.secondary_temperature = ic.sg_temperatures[i]
-                print(f"    Secondary temperature: {ic.sg_temperatures[i]}°C")
+                logger.info("    Secondary temperature: %s°C", ic.sg_temperatures[i])
             
             if i < len(ic.sg_steam_qualities):
                 sg.steam_quality = ic.sg_steam_qualities[i]
-                print(f"    Steam quality: {ic.sg_steam_qualities[i]}")
+                logger.info("    Steam quality: %s", ic.sg_steam_qualities[i])
             
             # Apply steam flow conditions
             if i < len(ic.sg_steam_flows):
                 sg.steam_flow_rate = ic.sg_steam_flows[i]
-                print(f"    Steam flow rate: {ic.sg_steam_flows[i]} kg/s")
+                logger.info("    Steam flow rate: %s kg/s", ic.sg_steam_flows[i])
             
             # Apply feedwater flow conditions
             if i < len(ic.sg_feedwater_flows):
                 sg.feedwater_flow_rate = ic.sg_feedwater_flows[i]
-                print(f"    Feedwater flow rate: {ic.sg_feedwater_flows[i]} kg/s")
+                logger.info("    Feedwater flow rate: %s kg/s", ic.sg_feedwater_flows[i])
             
             # Apply primary side conditions (EXPANDED COVERAGE)
             if i < len(ic.primary_inlet_temps):
                 sg.primary_inlet_temp = ic.primary_inlet_temps[i]
-                print(f"    Primary inlet temp: {ic.primary_inlet_temps[i]}°C")
+                logger.info("    Primary inlet temp: %s°C", ic.primary_inlet_temps[i])
             
             if i < len(ic.primary_outlet_temps):
                 sg.primary_outlet_temp = ic.primary_outlet_temps[i]
-                print(f"    Primary outlet temp: {ic.primary_outlet_temps[i]}°C")
+                logger.info("    Primary outlet temp: %s°C", ic.primary_outlet_temps[i])
             
             # TODO: Verify if primary_flow_rate exists as state variable in SteamGenerator
             # if i < len(ic.primary_flow_rates):
@@ -293,7 +300,7 @@ class EnhancedSteamGeneratorPhysics(HeatFlowProvider, ChemistryFlowProvider):
             # Apply heat transfer conditions (EXPANDED COVERAGE)
             if i < len(ic.tube_wall_temperature):
                 sg.tube_wall_temp = ic.tube_wall_temperature[i]
-                print(f"    Tube wall temperature: {ic.tube_wall_temperature[i]}°C")
+                logger.info("    Tube wall temperature: %s°C", ic.tube_wall_temperature[i])
             
             # Apply TSP fouling conditions (physics-first approach)
             if i < len(ic.tsp_fouling_thicknesses) and ic.tsp_fouling_thicknesses[i] > 0:
@@ -304,7 +311,7 @@ class EnhancedSteamGeneratorPhysics(HeatFlowProvider, ChemistryFlowProvider):
                 if hasattr(sg, 'tsp_fouling'):
                     # Always calculate degradation from current fouling fraction (physics-based)
                     sg.tsp_fouling.heat_transfer_degradation = sg.tsp_fouling.calculate_heat_transfer_degradation(sg.tsp_fouling.fouling_fraction)
-                    print(f"    TSP heat transfer degradation (calculated): {sg.tsp_fouling.heat_transfer_degradation:.3f}")
+                    logger.info("    TSP heat transfer degradation (calculated): %.3f", sg.tsp_fouling.heat_transfer_degradation)
             
             # Apply scale thickness conditions (NEW)
             if i < len(ic.scale_thicknesses) and ic.scale_thicknesses[i] > 0:
@@ -315,7 +322,7 @@ class EnhancedSteamGeneratorPhysics(HeatFlowProvider, ChemistryFlowProvider):
                 if hasattr(sg, 'tube_interior_fouling'):
                     # Always calculate thermal resistance from current scale thickness (physics-based)
                     sg.tube_interior_fouling.scale_thermal_resistance = sg.tube_interior_fouling.calculate_thermal_resistance()
-                    print(f"    Scale thermal resistance (calculated): {sg.tube_interior_fouling.scale_thermal_resistance:.6f} m²K/W")
+                    logger.info("    Scale thermal resistance (calculated): %.6f m²K/W", sg.tube_interior_fouling.scale_thermal_resistance)
             
             # NOTE: Explicit tsp_heat_transfer_degradations values are ignored in favor of physics-based calculation
             # This ensures heat transfer degradation always matches the actual fouling state
@@ -328,7 +335,7 @@ class EnhancedSteamGeneratorPhysics(HeatFlowProvider, ChemistryFlowProvider):
         self.average_steam_temperature = sum(ic.sg_temperatures) / len(ic.sg_temperatures) if ic.sg_temperatures else 285.8
         self.average_steam_quality = sum(ic.sg_steam_qualities) / len(ic.sg_steam_qualities) if ic.sg_steam_qualities else 0.99
         
-        print(f"STEAM GENERATOR: Initial conditions applied successfully")
+        logger.info("STEAM GENERATOR: Initial conditions applied successfully")
         
         # Validate that critical initial conditions were applied
         self._validate_initial_conditions_applied()
@@ -337,55 +344,55 @@ class EnhancedSteamGeneratorPhysics(HeatFlowProvider, ChemistryFlowProvider):
         """Validate that initial conditions were properly applied"""
         ic = self.config.initial_conditions
         
-        print(f"STEAM GENERATOR: Validating initial conditions application:")
+        logger.info("STEAM GENERATOR: Validating initial conditions application:")
         
         for i, sg in enumerate(self.steam_generators):
-            print(f"  SG-{i} verification:")
+            logger.info("  SG-%s verification:", i)
             
             # Validate water level application
             if i < len(ic.sg_levels):
                 expected = ic.sg_levels[i]
                 actual = sg.water_level
                 if abs(actual - expected) < 0.1:
-                    print(f"    ✓ Water level: {actual} m (expected {expected} m)")
+                    logger.info("    ✓ Water level: %s m (expected %s m)", actual, expected)
                 else:
-                    print(f"    ✗ Water level mismatch: {actual} m (expected {expected} m)")
+                    logger.info("    ✗ Water level mismatch: %s m (expected %s m)", actual, expected)
             
             # Validate pressure application
             if i < len(ic.sg_pressures):
                 expected = ic.sg_pressures[i]
                 actual = sg.secondary_pressure
                 if abs(actual - expected) < 0.01:
-                    print(f"    ✓ Secondary pressure: {actual} MPa (expected {expected} MPa)")
+                    logger.info("    ✓ Secondary pressure: %s MPa (expected %s MPa)", actual, expected)
                 else:
-                    print(f"    ✗ Secondary pressure mismatch: {actual} MPa (expected {expected} MPa)")
+                    logger.info("    ✗ Secondary pressure mismatch: %s MPa (expected %s MPa)", actual, expected)
             
             # Validate primary inlet temperature application (EXPANDED VALIDATION)
             if i < len(ic.primary_inlet_temps):
                 expected = ic.primary_inlet_temps[i]
                 actual = sg.primary_inlet_temp
                 if abs(actual - expected) < 0.1:
-                    print(f"    ✓ Primary inlet temp: {actual}°C (expected {expected}°C)")
+                    logger.info("    ✓ Primary inlet temp: %s°C (expected %s°C)", actual, expected)
                 else:
-                    print(f"    ✗ Primary inlet temp mismatch: {actual}°C (expected {expected}°C)")
+                    logger.info("    ✗ Primary inlet temp mismatch: %s°C (expected %s°C)", actual, expected)
             
             # Validate primary outlet temperature application (EXPANDED VALIDATION)
             if i < len(ic.primary_outlet_temps):
                 expected = ic.primary_outlet_temps[i]
                 actual = sg.primary_outlet_temp
                 if abs(actual - expected) < 0.1:
-                    print(f"    ✓ Primary outlet temp: {actual}°C (expected {expected}°C)")
+                    logger.info("    ✓ Primary outlet temp: %s°C (expected %s°C)", actual, expected)
                 else:
-                    print(f"    ✗ Primary outlet temp mismatch: {actual}°C (expected {expected}°C)")
+                    logger.info("    ✗ Primary outlet temp mismatch: %s°C (expected %s°C)", actual, expected)
             
             # Validate tube wall temperature application (EXPANDED VALIDATION)
             if i < len(ic.tube_wall_temperature):
                 expected = ic.tube_wall_temperature[i]
                 actual = sg.tube_wall_temp
                 if abs(actual - expected) < 0.1:
-                    print(f"    ✓ Tube wall temp: {actual}°C (expected {expected}°C)")
+                    logger.info("    ✓ Tube wall temp: %s°C (expected %s°C)", actual, expected)
                 else:
-                    print(f"    ✗ Tube wall temp mismatch: {actual}°C (expected {expected}°C)")
+                    logger.info("    ✗ Tube wall temp mismatch: %s°C (expected %s°C)", actual, expected)
             
             # Validate TSP fouling application
             if i < len(ic.tsp_fouling_thicknesses) and hasattr(sg, 'tsp_fouling'):
@@ -399,10 +406,10 @@ class EnhancedSteamGeneratorPhysics(HeatFlowProvider, ChemistryFlowProvider):
                     actual_total_thickness += sg.tsp_fouling.deposits.get_total_thickness(level)
                 
                 if abs(actual_total_thickness - expected_total_thickness) < 0.001:
-                    print(f"    ✓ TSP fouling thickness: {actual_total_thickness:.3f} mm total (avg {actual_avg_thickness:.3f} mm)")
-                    print(f"      Fouling fraction: {actual_fouling_fraction:.3f}")
+                    logger.info("    ✓ TSP fouling thickness: %.3f mm total (avg %.3f mm)", actual_total_thickness, actual_avg_thickness)
+                    logger.info("      Fouling fraction: %.3f", actual_fouling_fraction)
                 else:
-                    print(f"    ✗ TSP fouling thickness mismatch: {actual_total_thickness:.3f} mm total (expected {expected_total_thickness:.3f} mm)")
+                    logger.info("    ✗ TSP fouling thickness mismatch: %.3f mm total (expected %.3f mm)", actual_total_thickness, expected_total_thickness)
             
             # Validate scale thickness application (NEW)
             if i < len(ic.scale_thicknesses) and hasattr(sg, 'tube_interior_fouling'):
@@ -412,23 +419,23 @@ class EnhancedSteamGeneratorPhysics(HeatFlowProvider, ChemistryFlowProvider):
                 actual_fouling_fraction = sg.tube_interior_fouling.fouling_fraction
                 
                 if abs(actual_scale_thickness - expected_scale_thickness) < 0.001:
-                    print(f"    ✓ Scale thickness: {actual_scale_thickness:.3f} mm (expected {expected_scale_thickness:.3f} mm)")
-                    print(f"      Thermal resistance: {actual_thermal_resistance:.6f} m²K/W")
-                    print(f"      Fouling fraction: {actual_fouling_fraction:.3f}")
+                    logger.info("    ✓ Scale thickness: %.3f mm (expected %.3f mm)", actual_scale_thickness, expected_scale_thickness)
+                    logger.info("      Thermal resistance: %.6f m²K/W", actual_thermal_resistance)
+                    logger.info("      Fouling fraction: %.3f", actual_fouling_fraction)
                 else:
-                    print(f"    ✗ Scale thickness mismatch: {actual_scale_thickness:.3f} mm (expected {expected_scale_thickness:.3f} mm)")
+                    logger.info("    ✗ Scale thickness mismatch: %.3f mm (expected %.3f mm)", actual_scale_thickness, expected_scale_thickness)
                 
                 # Validate scale composition distribution
                 total_composition = sum(sg.tube_interior_fouling.scale_composition.values())
                 if abs(total_composition - expected_scale_thickness) < 0.001:
-                    print(f"      ✓ Scale composition total: {total_composition:.3f} mm")
+                    logger.info("      ✓ Scale composition total: %.3f mm", total_composition)
                 else:
-                    print(f"      ✗ Scale composition mismatch: {total_composition:.3f} mm")
+                    logger.info("      ✗ Scale composition mismatch: %.3f mm", total_composition)
             
             # NOTE: TSP heat transfer degradation is now always calculated from fouling physics
             # No validation needed since explicit degradation values are no longer used
         
-        print(f"STEAM GENERATOR: Initial conditions validation complete")
+        logger.info("STEAM GENERATOR: Initial conditions validation complete")
         
     def update_system(self,
                      primary_conditions: dict,
@@ -477,48 +484,47 @@ class EnhancedSteamGeneratorPhysics(HeatFlowProvider, ChemistryFlowProvider):
                 dt / 60.0  # Convert seconds to hours
             )
         
-        # Direct update of individual steam generators with ACTUAL feedwater flows
-        sg_results = []
-
-        for i, sg in enumerate(self.steam_generators):
-            # Prepare system conditions for individual SG (include water chemistry update if provided)
-            sg_system_conditions = None
-            if 'water_chemistry_update' in system_conditions:
-                sg_system_conditions = {
-                    'water_chemistry_update': system_conditions['water_chemistry_update']
-                }
-            
-            # CRITICAL FIX: Use actual feedwater flows from feedwater system
-            if actual_feedwater_flows is not None and i < len(actual_feedwater_flows):
-                # Use actual feedwater flow from feedwater system
-                actual_feedwater_flow = actual_feedwater_flows[i]
-            else:
-                # Fallback: assume perfect mass balance (old behavior)
-                actual_feedwater_flow = individual_demands[i]
-            
-            # Direct parameter extraction - no redundant processing
-            sg_result = sg.update_state(
-                primary_temp_in=primary_conditions.get('inlet_temps', [327.0] * self.config.num_steam_generators)[i],
-                primary_temp_out=primary_conditions.get('outlet_temps', [293.0] * self.config.num_steam_generators)[i],
-                primary_flow=primary_conditions.get('flow_rates', [5700.0] * self.config.num_steam_generators)[i],
-                steam_flow_out=individual_demands[i],
-                feedwater_flow_in=actual_feedwater_flow,  # FIXED: Use actual flow from FW system
-                feedwater_temp=feedwater_temperature,
-                dt=dt,
-                system_conditions=sg_system_conditions
-            )
-            
-            sg_results.append(sg_result)
+        # Per-SG inputs as arrays (defaults for anything the primary side does not provide)
+        num_sgs = len(self.steam_generators)
+        inlet_temps = np.asarray(primary_conditions.get('inlet_temps', [327.0] * num_sgs)[:num_sgs], dtype=np.float64)
+        outlet_temps = np.asarray(primary_conditions.get('outlet_temps', [293.0] * num_sgs)[:num_sgs], dtype=np.float64)
+        primary_flows = np.asarray(primary_conditions.get('flow_rates', [5700.0] * num_sgs)[:num_sgs], dtype=np.float64)
+        steam_flows = np.asarray(individual_demands[:num_sgs], dtype=np.float64)
+        
+        # CRITICAL FIX: Use actual feedwater flows from feedwater system
+        # (fallback for any SG without one: assume perfect mass balance, the old behavior)
+        feedwater_flows = steam_flows.copy()
+        if actual_feedwater_flows is not None:
+            reported = np.asarray(actual_feedwater_flows[:num_sgs], dtype=np.float64)
+            feedwater_flows[:len(reported)] = reported
+        
+        # Update all steam generators at once (chemistry update applied per SG as before)
+        sg_system_conditions = None
+        if 'water_chemistry_update' in system_conditions:
+            sg_system_conditions = {
+                'water_chemistry_update': system_conditions['water_chemistry_update']
+            }
+        sg_results = self.bank.update(
+            primary_temp_in=inlet_temps,
+            primary_temp_out=outlet_temps,
+            primary_flow=primary_flows,
+            steam_flow_out=steam_flows,
+            feedwater_flow_in=feedwater_flows,
+            feedwater_temp=feedwater_temperature,
+            dt=dt,
+            system_conditions=sg_system_conditions
+        )
         
         # Streamlined system aggregation (essential metrics only)
-        self.total_thermal_power = sum(result['heat_transfer_rate'] for result in sg_results)
-        self.total_steam_flow = sum(result['steam_flow_rate'] for result in sg_results)
+        bank = self.bank
+        self.total_thermal_power = float(np.sum(bank.heat_transfer_rate))
+        self.total_steam_flow = float(np.sum(bank.steam_flow_rate))
         
         # Essential system state (removed redundant calculations)
-        if self.steam_generators:
-            self.average_steam_pressure = sum(sg.secondary_pressure for sg in self.steam_generators) / len(self.steam_generators)
-            self.average_steam_temperature = sum(sg.secondary_temperature for sg in self.steam_generators) / len(self.steam_generators)
-            self.average_steam_quality = sum(sg.steam_quality for sg in self.steam_generators) / len(self.steam_generators)
+        if num_sgs:
+            self.average_steam_pressure = float(np.mean(bank.secondary_pressure))
+            self.average_steam_temperature = float(np.mean(bank.secondary_temperature))
+            self.average_steam_quality = float(np.mean(bank.steam_quality))
         
         # Simplified performance tracking (removed complex metrics)
         self.system_availability = self._check_system_availability(sg_results)
@@ -536,10 +542,10 @@ class EnhancedSteamGeneratorPhysics(HeatFlowProvider, ChemistryFlowProvider):
             
             # Individual SG results (essential for downstream systems)
             'sg_individual_results': sg_results,
-            'sg_steam_flows': [result['steam_flow_rate'] for result in sg_results],
-            'sg_pressures': [sg.secondary_pressure for sg in self.steam_generators],
-            'sg_levels': [sg.water_level for sg in self.steam_generators],
-            'sg_steam_qualities': [sg.steam_quality for sg in self.steam_generators],
+            'sg_steam_flows': bank.steam_flow_rate.tolist(),
+            'sg_pressures': bank.secondary_pressure.tolist(),
+            'sg_levels': bank.water_level.tolist(),
+            'sg_steam_qualities': bank.steam_quality.tolist(),
             
             # Essential control data
             'load_demand': self.load_demand,
@@ -930,7 +936,7 @@ class EnhancedSteamGeneratorPhysics(HeatFlowProvider, ChemistryFlowProvider):
         Args:
             maintenance_system: AutoMaintenanceSystem instance
         """
-        print(f"STEAM GENERATOR SYSTEM: Setting up maintenance integration")
+        logger.info("STEAM GENERATOR SYSTEM: Setting up maintenance integration")
         
         # Set up individual steam generator maintenance integration
         for i, sg in enumerate(self.steam_generators):
@@ -963,7 +969,7 @@ class EnhancedSteamGeneratorPhysics(HeatFlowProvider, ChemistryFlowProvider):
         }
         
         maintenance_system.register_component("SG-SYSTEM", self, system_monitoring_config)
-        print(f"  Registered SG-SYSTEM controller for system-level coordination")
+        logger.info("  Registered SG-SYSTEM controller for system-level coordination")
         
         # Store reference for coordination
         self.maintenance_system = maintenance_system
@@ -972,8 +978,8 @@ class EnhancedSteamGeneratorPhysics(HeatFlowProvider, ChemistryFlowProvider):
         maintenance_system.event_bus.subscribe('maintenance_completed', self._handle_maintenance_completed)
         maintenance_system.event_bus.subscribe('maintenance_scheduled', self._handle_maintenance_scheduled)
         
-        print(f"STEAM GENERATOR SYSTEM: Maintenance integration complete")
-        print(f"  Total registered components: {len(self.steam_generators) + 1}")
+        logger.info("STEAM GENERATOR SYSTEM: Maintenance integration complete")
+        logger.info("  Total registered components: %s", len(self.steam_generators) + 1)
     
     def _handle_maintenance_completed(self, event):
         """Handle maintenance completion events for system coordination"""
@@ -991,8 +997,8 @@ class EnhancedSteamGeneratorPhysics(HeatFlowProvider, ChemistryFlowProvider):
             if component_id.startswith('SG-') and component_id != 'SG-SYSTEM':
                 self._check_system_coordination_after_maintenance()
             
-            print(f"SG SYSTEM: Maintenance completed on {component_id}, "
-                  f"system performance factor: {self.performance_factor:.3f}")
+            logger.info("SG SYSTEM: Maintenance completed on %s, system performance factor: %.3f",
+                        component_id, self.performance_factor)
     
     def _handle_maintenance_scheduled(self, event):
         """Handle maintenance scheduling events for system coordination"""
@@ -1006,7 +1012,7 @@ class EnhancedSteamGeneratorPhysics(HeatFlowProvider, ChemistryFlowProvider):
             
             # If too many SGs would be offline, coordinate scheduling
             if maintenance_count >= 2:  # More than 1 SG under maintenance
-                print(f"SG SYSTEM: Coordinating maintenance - {maintenance_count} SGs affected")
+                logger.info("SG SYSTEM: Coordinating maintenance - %s SGs affected", maintenance_count)
                 self._coordinate_maintenance_scheduling(component_id, maintenance_data)
     
     def _count_sgs_under_maintenance(self) -> int:
@@ -1047,7 +1053,7 @@ class EnhancedSteamGeneratorPhysics(HeatFlowProvider, ChemistryFlowProvider):
     
     def _coordinate_maintenance_scheduling(self, component_id: str, maintenance_data: Dict):
         """Coordinate maintenance scheduling to maintain system availability"""
-        print(f"SG SYSTEM: Coordinating maintenance for {component_id}")
+        logger.info("SG SYSTEM: Coordinating maintenance for %s", component_id)
         
         # This would implement intelligent scheduling logic
         # For now, just log the coordination attempt
@@ -1055,9 +1061,9 @@ class EnhancedSteamGeneratorPhysics(HeatFlowProvider, ChemistryFlowProvider):
         priority = maintenance_data.get('priority', 'MEDIUM')
         
         if priority == 'HIGH':
-            print(f"  HIGH priority {maintenance_type} - allowing immediate scheduling")
+            logger.info("  HIGH priority %s - allowing immediate scheduling", maintenance_type)
         else:
-            print(f"  MEDIUM/LOW priority {maintenance_type} - deferring to maintain availability")
+            logger.info("  MEDIUM/LOW priority %s - deferring to maintain availability", maintenance_type)
     
     def perform_maintenance(self, maintenance_type: str = None, **kwargs):
         """
@@ -21,18 +21,27 @@ Physical Basis:
 import warnings
 from typing import Dict, Optional, Tuple, List, Any
 from simulator.state import auto_register
+from simulator.core.scheduler import MultiRateScheduler
 from ..component_descriptions import STEAM_GENERATOR_COMPONENT_DESCRIPTIONS
 from .tsp_fouling_model import TSPFoulingModel, TSPFoulingConfig
 from .tube_interior_fouling import TubeInteriorFouling
 from ..water_chemistry import WaterChemistry, WaterChemistryConfig
+from ..steam_properties import compressed_liquid_enthalpy, liquid_density, steam_density, steam_properties
 
 # Import chemistry flow interfaces
 from ..chemistry_flow_tracker import ChemistryFlowProvider, ChemicalSpecies
 
 # Import the new comprehensive config system
 from .config import SteamGeneratorConfig
+from .bank import BankField, SteamGeneratorBank
 
 import numpy as np
+from simulator.sim_logging import get_logger
+
+logger = get_logger(__name__)
+
+# Saturation properties the steam generator models are calibrated against
+_STEAM_PROPERTIES = steam_properties('nist_fit')
 
 warnings.filterwarnings("ignore")
 
@@ -58,8 +67,28 @@ class SteamGenerator(ChemistryFlowProvider):
     
     Note: This is an individual unit managed by EnhancedSteamGeneratorPhysics.
     Does not inherit from StateProviderMixin to prevent duplicate registration.
+    
+    The state attributes below live in a SteamGeneratorBank (one slot per SG):
+    a standalone steam generator owns a one-slot bank, and
+    EnhancedSteamGeneratorPhysics moves its SGs into one shared bank so they
+    are updated together.
     """
     
+    primary_inlet_temp = BankField()
+    primary_outlet_temp = BankField()
+    secondary_pressure = BankField()
+    secondary_temperature = BankField()
+    steam_quality = BankField()
+    water_level = BankField()
+    steam_void_fraction = BankField()
+    steam_flow_rate = BankField()
+    feedwater_flow_rate = BankField()
+    feedwater_temperature = BankField()
+    tube_wall_temp = BankField()
+    heat_transfer_rate = BankField()
+    overall_htc = BankField()
+    heat_flux = BankField()
+    
     def __init__(self, config: Optional[SteamGeneratorConfig] = None, tsp_fouling_config: Optional[TSPFoulingConfig] = None, water_chemistry: Optional[WaterChemistry] = None):
         """Initialize steam generator physics model"""
         self.config = config if config is not None else SteamGeneratorConfig()
@@ -84,6 +113,17 @@ class SteamGenerator(ChemistryFlowProvider):
         # Initialize tube interior fouling model with unified water chemistry
         self.tube_interior_fouling = TubeInteriorFouling(self.config, self.water_chemistry)
         
+        # Fouling evolves over hours: with multi-rate scheduling enabled both models
+        # update hourly with the accumulated dt (every step otherwise)
+        self.scheduler = MultiRateScheduler()
+        self.scheduler.add('tsp_fouling', self.tsp_fouling, 'update_fouling_state',
+                           dt_unit='hours', dt_arg='dt_hours', period=60.0, slow=True)
+        self.scheduler.add('tube_interior_fouling', self.tube_interior_fouling, 'update_fouling_state',
+                           dt_unit='seconds', dt_arg='dt_seconds', period=60.0, slow=True)
+        
+        # State arrays (until a shared bank takes this SG over)
+        SteamGeneratorBank([self])
+        
         # Initialize state variables to typical PWR operating conditions
         # Primary side (hot leg inlet, cold leg outlet)
         self.primary_inlet_temp = 327.0  # °C (621°F - typical PWR hot leg)
@@ -170,149 +210,24 @@ class SteamGenerator(ChemistryFlowProvider):
         Returns:
             tuple: (heat_transfer_rate_W, heat_transfer_details)
         """
-        # Calculate saturation temperature for secondary pressure
-        # Using Antoine equation for water: log10(P) = A - B/(C + T)
-        # Rearranged: T = B/(A - log10(P)) - C
-        # Simplified correlation valid for 1-10 MPa
-        sat_temp = self._saturation_temperature(secondary_pressure)
-        
-        # Log Mean Temperature Difference (LMTD) calculation
-        # For counter-current flow in U-tube steam generator
-        delta_t1 = primary_temp_in - sat_temp  # Hot end temperature difference
-        delta_t2 = primary_temp_out - sat_temp  # Cold end temperature difference
-        
-        if abs(delta_t1 - delta_t2) < 1.0:
-            # Avoid division by zero for small temperature differences
-            lmtd = (delta_t1 + delta_t2) / 2.0
-        else:
-            lmtd = (delta_t1 - delta_t2) / np.log(delta_t1 / delta_t2)
-        
-        # Overall heat transfer coefficient calculation
-        # Thermal resistance network: R_total = R_primary + R_wall + R_secondary
-        
-        # Primary side heat transfer coefficient (turbulent flow in tubes)
-        # Adjusted for flow rate effects: h ∝ flow^0.8
-        flow_factor = (primary_flow / self.config.primary_design_flow) ** 0.8
-        h_primary = self.config.primary_htc * flow_factor
-        
-        # Secondary side heat transfer coefficient (nucleate boiling)
-        # Pressure effect on boiling: h ∝ P^0.15 (Chen correlation)
-        pressure_factor = (secondary_pressure / self.config.design_pressure_secondary) ** 0.15
-        h_secondary = self.config.secondary_htc * pressure_factor
-        
-        # Thermal resistances
-        r_primary = 1.0 / h_primary
-        r_wall = self.config.tube_wall_thickness / self.config.tube_material_conductivity
-        r_secondary = 1.0 / h_secondary
-        
-        # Overall heat transfer coefficient
-        overall_htc = 1.0 / (r_primary + r_wall + r_secondary)
-        
-        # Apply TSP fouling degradation to heat transfer coefficient
-        tsp_degradation_factor = 1.0 - self.tsp_fouling.heat_transfer_degradation
-        overall_htc_with_tsp_fouling = overall_htc * tsp_degradation_factor
-        
-        # Apply tube interior scale thermal resistance
-        # Thermal resistance from scale adds to the overall thermal resistance
-        scale_thermal_resistance = self.tube_interior_fouling.scale_thermal_resistance
-        if scale_thermal_resistance > 0:
-            # Add scale resistance to overall thermal resistance
-            # 1/U_total = 1/U_clean + R_scale
-            clean_resistance = 1.0 / overall_htc_with_tsp_fouling
-            total_resistance = clean_resistance + scale_thermal_resistance
-            overall_htc_with_all_fouling = 1.0 / total_resistance
-        else:
-            overall_htc_with_all_fouling = overall_htc_with_tsp_fouling
-        
-        # Calculate effective heat transfer area based on current water level
-        effective_area = self.calculate_effective_heat_transfer_area(self.water_level)
-        
-        # Heat transfer rate using effective area (level-dependent) and all fouling effects
-        heat_transfer_rate = overall_htc_with_all_fouling * effective_area * lmtd
-        
-        # ENHANCED PHYSICAL CONSTRAINTS: cannot exceed energy available from primary coolant
-        # Q_max = m_dot * cp * (T_in - T_out)
-        cp_primary = 5200.0  # J/kg/K (specific heat of water at PWR conditions)
-        max_heat_from_primary = primary_flow * cp_primary * (primary_temp_in - primary_temp_out)
-        
-        # STRICT ENERGY CONSERVATION: Additional checks for zero/low thermal power scenarios
-        # If primary temperature difference is very small, severely limit heat transfer
-        temp_difference = primary_temp_in - primary_temp_out
-        if temp_difference < 1.0:  # Less than 1°C difference
-            heat_transfer_rate = 0.0  # No meaningful heat transfer possible
-        elif temp_difference < 5.0:  # Less than 5°C difference  
-            # Severely reduced heat transfer for low temperature differences
-            heat_transfer_rate = min(heat_transfer_rate, max_heat_from_primary * 0.1)
-        else:
-            # Normal operation - limit to available primary energy
-            heat_transfer_rate = min(heat_transfer_rate, max_heat_from_primary)
-        
-        # Additional check: if primary flow is very low, limit heat transfer
-        if primary_flow < 100.0:  # Less than 100 kg/s (very low flow)
-            heat_transfer_rate = 0.0
-        
-        # Final validation: ensure heat transfer is physically reasonable
-        if heat_transfer_rate < 0:
-            heat_transfer_rate = 0.0
-        
-        # SIMPLE APPROACH: Calculate tube wall temperature as secondary temp + thermal resistance effects
-        # This ensures scale always increases tube wall temperature (insulation effect)
-        
-        # Use actual calculated heat flux (no hardcoded values)
-        operating_heat_flux = heat_transfer_rate / self.config.heat_transfer_area_per_sg
-        operating_heat_flux = max(operating_heat_flux, 5000.0)  # Minimum for low-power operation
-        
-        # Get fouling thermal resistances from both sides
-        r_scale_primary = self.tube_interior_fouling.scale_thermal_resistance  # Primary side scale
-        r_scale_secondary = self._calculate_tsp_scale_thermal_resistance()      # Secondary side deposits
-        
-        # Calculate cumulative thermal resistance from secondary bulk to tube wall center
-        r_secondary_to_tube_wall = (
-            1.0 / h_secondary +                    # Secondary boundary layer
-            r_scale_secondary +                    # TSP deposits (if any)
-            (r_wall / 2.0) +                      # Half tube wall thickness
-            r_scale_primary                       # Primary scale (the big effect)
-        )
-        
-        # Tube wall temperature = secondary temperature + temperature rise due to thermal resistance
-        # This guarantees that more scale resistance = higher tube wall temperature
-        self.tube_wall_temp = sat_temp + (operating_heat_flux * r_secondary_to_tube_wall)
-        
-        # For debugging: calculate the scale contribution specifically
-        scale_temperature_contribution = operating_heat_flux * r_scale_primary
-        actual_heat_flux = operating_heat_flux  # For compatibility with existing code
-        
+        bank = self._bank
+        slot = [self._bank_slot]
+        ht = bank.heat_transfer(np.array([primary_temp_in]), np.array([primary_temp_out]),
+                                np.array([primary_flow]), np.array([secondary_pressure]),
+                                bank.water_level[slot], bank.gather_fouling(slot), slot)
+        details = {key: float(value[0]) for key, value in ht.items()}
+        heat_transfer_rate = details.pop('heat_transfer_rate')
+        
+        self.tube_wall_temp = details['tube_wall_temp']
         # Physical validation - warn if tube wall temperature is extremely high
         if self.tube_wall_temp > 400.0:
-            print(f"WARNING: Very high tube wall temperature: {self.tube_wall_temp:.1f}°C - "
-                  f"Scale thickness: {self.tube_interior_fouling.scale_thickness:.1f}mm")
-        self.overall_htc = overall_htc
-        self.heat_flux = actual_heat_flux
-        
-        details = {
-            'overall_htc': overall_htc,
-            'lmtd': lmtd,
-            'sat_temp_secondary': sat_temp,
-            'tube_wall_temp': self.tube_wall_temp,
-            'heat_flux': actual_heat_flux,
-            'h_primary': h_primary,
-            'h_secondary': h_secondary,
-            'delta_t1': delta_t1,
-            'delta_t2': delta_t2,
-            'flow_factor': flow_factor,
-            'pressure_factor': pressure_factor,
-            # NEW: Both-side fouling thermal details for debugging and monitoring
-            'primary_scale_thermal_resistance': r_scale_primary,
-            'tsp_scale_thermal_resistance': r_scale_secondary,
-            'scale_temperature_contribution': scale_temperature_contribution,
-            'total_thermal_resistance_to_tube_wall': r_secondary_to_tube_wall,
-            'operating_heat_flux': operating_heat_flux,
-            'overall_htc_with_tsp_fouling': overall_htc_with_tsp_fouling,
-            'overall_htc_with_all_fouling': overall_htc_with_all_fouling
-        }
+            logger.warning("WARNING: Very high tube wall temperature: %.1f°C - Scale thickness: %.1fmm",
+                           self.tube_wall_temp, self.tube_interior_fouling.scale_thickness)
+        self.overall_htc = details['overall_htc']
+        self.heat_flux = details['heat_flux']
         
         return heat_transfer_rate, details
-    
+
     def calculate_secondary_side_dynamics(self,
                                         heat_input: float,
                                         steam_flow_out: float,
@@ -338,181 +253,11 @@ class SteamGenerator(ChemistryFlowProvider):
         Returns:
             Dictionary with secondary side state changes
         """
-        # Current thermodynamic properties
-        sat_temp = self._saturation_temperature(self.secondary_pressure)
-        h_f = self._saturation_enthalpy_liquid(self.secondary_pressure)  # kJ/kg
-        h_g = self._saturation_enthalpy_vapor(self.secondary_pressure)   # kJ/kg
-        h_fg = h_g - h_f  # Latent heat of vaporization
-        h_fw = self._water_enthalpy(feedwater_temp, self.secondary_pressure)  # kJ/kg
-        
-        # Fluid densities
-        rho_f = self._water_density(sat_temp, self.secondary_pressure)  # kg/m³
-        rho_g = self._steam_density(sat_temp, self.secondary_pressure)  # kg/m³
-        
-        # Mass balance
-        mass_change_rate = feedwater_flow_in - steam_flow_out  # kg/s
-        
-        # Energy balance (convert heat_input to kJ/s)
-        heat_input_kj = heat_input / 1000.0  # Convert W to kJ/s
-        
-        # Steam generation rate from energy balance
-        # Energy available for steam generation = heat input - sensible heating of feedwater
-        energy_for_steam_gen = heat_input_kj - feedwater_flow_in * (h_f - h_fw)
-        steam_generation_rate = energy_for_steam_gen / h_fg  # kg/s
-        steam_generation_rate = max(0, steam_generation_rate)  # Cannot be negative
-        
-        # CRITICAL FIX: If feedwater flow is zero, steam generation must be zero
-        # Cannot generate steam without feedwater input
-        if feedwater_flow_in < 0.1:  # Less than 0.1 kg/s (essentially zero)
-            steam_generation_rate = 0.0
-        
-        # IMPROVED PRESSURE DYNAMICS - Based on thermal equilibrium and steam generation capability
-        # Pressure should stabilize based on heat input and steam generation, not drift linearly
-        
-        # Calculate equilibrium pressure based on current heat input and steam demand
-        design_heat_input = self.config.design_thermal_power_per_sg / 1000.0  # kJ/s
-        heat_input_factor = heat_input_kj / design_heat_input if design_heat_input > 0 else 0.0
-        
-        # Equilibrium pressure scales with heat input capability
-        # Higher heat input -> higher equilibrium pressure
-        equilibrium_pressure = self.config.design_pressure_secondary * (0.7 + 0.3 * heat_input_factor)
-        equilibrium_pressure = np.clip(equilibrium_pressure, 3.0, 8.5)  # Reasonable operating range
-        
-        # Steam demand effect on equilibrium pressure
-        steam_demand_factor = steam_flow_out / self.config.secondary_design_flow if self.config.secondary_design_flow > 0 else 0.0
-        demand_pressure_effect = -steam_demand_factor * 0.5  # Higher demand -> lower equilibrium pressure
-        equilibrium_pressure += demand_pressure_effect
-        equilibrium_pressure = np.clip(equilibrium_pressure, 3.0, 8.5)
-        
-        # FIXED PRESSURE DYNAMICS - Using proper exponential decay for timestep stability
-        # This eliminates oscillations by using mathematically correct first-order system response
-        pressure_time_constant = 60.0  # seconds (realistic for steam generator pressure response)
-        
-        # Calculate base equilibrium pressure approach using exponential decay
-        # This is stable for any timestep size, unlike the previous linear method
-        decay_factor = np.exp(-dt / pressure_time_constant)
-        base_new_pressure = equilibrium_pressure + (self.secondary_pressure - equilibrium_pressure) * decay_factor
-        
-        # Additional pressure effects for transient conditions (applied as corrections)
-        pressure_corrections = 0.0
-        
-        # 1. Inventory depletion effect (only for severe conditions)
-        if feedwater_flow_in < 0.1 and steam_flow_out > 100.0:
-            # Rapid pressure drop when steam is extracted without feedwater replacement
-            inventory_depletion_rate = -steam_flow_out / self.config.secondary_water_mass  # 1/s
-            pressure_drop_correction = inventory_depletion_rate * self.secondary_pressure * 2.0 * dt
-            pressure_corrections += pressure_drop_correction
-        
-        # 2. Steam generation vs demand imbalance (short-term effect)
-        steam_supply_factor = steam_generation_rate / self.config.secondary_design_flow if self.config.secondary_design_flow > 0 else 0.0
-        supply_demand_imbalance = steam_supply_factor - steam_demand_factor
-        imbalance_correction = supply_demand_imbalance * 0.005 * dt  # Small short-term effect
-        pressure_corrections += imbalance_correction
-        
-        # Apply corrections with reasonable limits
-        pressure_corrections = np.clip(pressure_corrections, -0.2, 0.2)  # Limit total corrections
-        
-        # Calculate final pressure with stability margins to prevent boundary oscillations
-        new_pressure = base_new_pressure + pressure_corrections
-        new_pressure = np.clip(new_pressure, 1.0, 8.0)  # Avoid extreme bounds that cause oscillations
-        
-        # Calculate pressure change rate for reporting (backwards compatible)
-        pressure_change_rate = (new_pressure - self.secondary_pressure) / dt
-        
-        # Water level dynamics with swell effects
-        # Cross-sectional area of steam generator (simplified cylindrical geometry)
-        sg_diameter = 4.0  # m (typical large PWR steam generator)
-        sg_cross_section = np.pi * (sg_diameter / 2.0) ** 2  # m²
-        
-        # Level change due to mass inventory change
-        level_change_mass = mass_change_rate * dt / (rho_f * sg_cross_section)
-        
-        # Level change due to steam generation (swell effect)
-        # Steam bubbles increase apparent liquid level
-        specific_volume_liquid = 1.0 / rho_f
-        specific_volume_steam = 1.0 / rho_g
-        volume_expansion = steam_generation_rate * dt * (specific_volume_steam - specific_volume_liquid)
-        level_change_swell = volume_expansion / sg_cross_section
-        
-        total_level_change = level_change_mass + level_change_swell
-        new_water_level = self.water_level + total_level_change
-        new_water_level = np.clip(new_water_level, 8.0, 16.0)  # Physical limits
-        
-        # FIXED STEAM QUALITY CALCULATION - Based on moisture separation physics
-        # Steam quality should be relatively stable in well-designed PWR steam generators
-        # and primarily depend on separator/dryer performance, not energy balance
-        
-        # Design steam quality for PWR (target)
-        design_quality = 0.995  # 99.5% quality for well-designed PWR SG
-        
-        # Quality degradation factors
-        quality_degradation = 0.0
-        
-        # 1. Water level effect - low level reduces separation efficiency
-        if new_water_level < 11.0:  # Below normal operating level
-            level_factor = (11.0 - new_water_level) / 3.0  # Normalized degradation
-            quality_degradation += level_factor * 0.02  # Up to 2% quality loss
-        
-        # 2. Flow rate effect - very high steam flow reduces separation time
-        flow_factor = steam_flow_out / self.config.secondary_design_flow
-        if flow_factor > 1.1:  # Above 110% design flow
-            flow_degradation = (flow_factor - 1.1) * 0.01  # 1% per 10% excess flow
-            quality_degradation += min(flow_degradation, 0.03)  # Max 3% degradation
-        
-        # 3. Heat flux effect - very high heat flux can cause carryover
-        design_heat_flux = self.config.design_thermal_power_per_sg / self.config.heat_transfer_area_per_sg
-        current_heat_flux = heat_input / self.config.heat_transfer_area_per_sg
-        heat_flux_ratio = current_heat_flux / design_heat_flux
-        if heat_flux_ratio > 1.2:  # Above 120% design heat flux
-            heat_flux_degradation = (heat_flux_ratio - 1.2) * 0.005  # 0.5% per 10% excess
-            quality_degradation += min(heat_flux_degradation, 0.02)  # Max 2% degradation
-        
-        # Calculate new steam quality
-        target_quality = design_quality - quality_degradation
-        target_quality = np.clip(target_quality, 0.90, 1.0)  # Physical limits
-        
-        # Smooth transition to target quality (first-order lag)
-        quality_time_constant = 30.0  # seconds (realistic for moisture separator response)
-        quality_change_rate = (target_quality - self.steam_quality) / quality_time_constant
-        new_steam_quality = self.steam_quality + quality_change_rate * dt
-        new_steam_quality = np.clip(new_steam_quality, 0.90, 1.0)
-        
-        # Void fraction from steam quality (homogeneous flow model)
-        # α = x * ρ_f / (x * ρ_f + (1-x) * ρ_g)
-        if new_steam_quality > 0:
-            new_void_fraction = (new_steam_quality * rho_f) / (
-                new_steam_quality * rho_f + (1 - new_steam_quality) * rho_g
-            )
-        else:
-            new_void_fraction = 0.0
-        
-        new_void_fraction = np.clip(new_void_fraction, 0.0, 0.8)  # Physical limits
-        
-        # Calculate energy balance for reporting (not used for state updates)
-        energy_in_feedwater = feedwater_flow_in * h_fw  # kJ/s
-        energy_in_heat = heat_input_kj  # kJ/s
-        energy_out_steam = steam_flow_out * h_g  # kJ/s
-        energy_change_rate = energy_in_feedwater + energy_in_heat - energy_out_steam  # kJ/s
-        
-        return {
-            'pressure_change_rate': pressure_change_rate,
-            'level_change_rate': total_level_change / dt,
-            'steam_quality_change': (new_steam_quality - self.steam_quality) / dt,
-            'void_fraction_change': (new_void_fraction - self.steam_void_fraction) / dt,
-            'new_pressure': new_pressure,
-            'new_water_level': new_water_level,
-            'new_steam_quality': new_steam_quality,
-            'new_void_fraction': new_void_fraction,
-            'steam_generation_rate': steam_generation_rate,
-            'energy_balance': energy_change_rate,
-            'level_change_mass': level_change_mass,
-            'level_change_swell': level_change_swell,
-            'mass_change_rate': mass_change_rate,
-            'supply_demand_imbalance': supply_demand_imbalance,
-            'quality_degradation': quality_degradation,
-            'target_quality': target_quality
-        }
-    
+        dynamics = self._bank.secondary_dynamics(np.array([heat_input]), np.array([steam_flow_out]),
+                                                 np.array([feedwater_flow_in]), np.array([feedwater_temp]),
+                                                 dt, [self._bank_slot])
+        return {key: float(value[0]) for key, value in dynamics.items()}
+
     def _apply_tsp_flow_restrictions(self, requested_steam_flow: float, requested_feedwater_flow: float) -> Tuple[float, float, float]:
         """
         Apply TSP fouling flow restrictions to requested flow rates
@@ -688,257 +433,43 @@ class SteamGenerator(ChemistryFlowProvider):
         Returns:
             Dictionary with updated state and performance metrics
         """
-        # Calculate heat transfer from primary to secondary
-        heat_transfer, ht_details = self.calculate_heat_transfer(
-            primary_temp_in, primary_temp_out, primary_flow, self.secondary_pressure
-        )
-        
-        # Update secondary temperature (saturation temperature at current pressure)
-        self.secondary_temperature = self._saturation_temperature(self.secondary_pressure)
-        
-        # Update unified water chemistry system if conditions provided
-        if system_conditions is not None and 'water_chemistry_update' in system_conditions:
-            self.water_chemistry.update_chemistry(
-                system_conditions['water_chemistry_update'],
-                dt / 60.0  # Convert minutes to hours
-            )
-        
-        # Calculate average flow velocity in steam generator
-        # Simplified calculation based on tube bundle geometry
-        tube_cross_section = np.pi * (self.config.tube_inner_diameter / 2.0) ** 2
-        total_flow_area = self.config.tube_count_per_sg * tube_cross_section
-        avg_velocity = primary_flow / (1000.0 * total_flow_area)  # m/s (assuming water density ~1000 kg/m³)
-        
-        # Update TSP fouling state using unified water chemistry
-        # Note: dt is passed in seconds from the simulation system
-        tsp_result = self.tsp_fouling.update_fouling_state(
-            temperature=self.secondary_temperature,
-            flow_velocity=avg_velocity,
-            dt_hours=dt / 3600.0  # Convert seconds to hours
-        )
-        
-        # Update tube interior fouling state using primary side conditions
-        primary_conditions = {
-            'temperature': (primary_temp_in + primary_temp_out) / 2.0,  # Average primary temperature
-            'flow_velocity': avg_velocity,  # Same velocity calculation
-            'chemistry': {
-                'boric_acid_concentration': 1000.0,  # Typical PWR primary chemistry
-                'lithium_concentration': 2.0,
-                'primary_ph': 7.2,
-                'dissolved_oxygen': 0.005
-            }
-        }
-        
-        tube_interior_result = self.tube_interior_fouling.update_fouling_state(
-            primary_conditions, dt  # dt is already in seconds
-        )
-        
-        # PHASE 1: Apply TSP flow restrictions AFTER TSP fouling update
-        # This ensures we use the current fouling state for flow restrictions
-        actual_steam_flow, actual_feedwater_flow, flow_restriction_factor = self._apply_tsp_flow_restrictions(
-            steam_flow_out, feedwater_flow_in
-        )
-        
-        # NEW: Apply primary flow restriction due to tube interior scale buildup
-        actual_primary_flow, primary_flow_restriction_factor = self._calculate_primary_flow_restriction(primary_flow)
-        
-        # PHASE 2: Calculate pump energy consumption based on current TSP fouling
-        pump_energy = self._calculate_pump_energy_consumption()
-        
-        # Calculate secondary side dynamics using ACTUAL flows (after fouling restrictions)
-        secondary_dynamics = self.calculate_secondary_side_dynamics(
-            heat_transfer, actual_steam_flow, actual_feedwater_flow, feedwater_temp, dt
-        )
-        
-        # Update state variables
-        self.primary_inlet_temp = primary_temp_in
-        self.primary_outlet_temp = primary_temp_out
-        self.secondary_pressure = secondary_dynamics['new_pressure']
-        self.water_level = secondary_dynamics['new_water_level']
-        self.steam_quality = secondary_dynamics['new_steam_quality']
-        self.steam_void_fraction = secondary_dynamics['new_void_fraction']
-        self.steam_flow_rate = actual_steam_flow  # Use actual flow (after fouling restrictions)
-        self.feedwater_flow_rate = actual_feedwater_flow  # Use actual flow (after fouling restrictions)
-        self.feedwater_temperature = feedwater_temp
-        self.heat_transfer_rate = heat_transfer
-        
-        # Calculate performance metrics
-        thermal_efficiency = heat_transfer / self.config.design_thermal_power_per_sg
-        steam_production_rate = secondary_dynamics['steam_generation_rate']
-        
-        # Heat transfer effectiveness
-        max_possible_heat_transfer = (primary_flow * 5200.0 * 
-                                    (primary_temp_in - self.secondary_temperature))
-        if max_possible_heat_transfer > 0:
-            effectiveness = heat_transfer / max_possible_heat_transfer
-        else:
-            effectiveness = 0.0
-        
-        return {
-            # Primary outputs
-            'heat_transfer_rate': heat_transfer,
-            'thermal_efficiency': thermal_efficiency,
-            'effectiveness': effectiveness,
-            
-            # Secondary side state
-            'secondary_pressure': self.secondary_pressure,
-            'secondary_temperature': self.secondary_temperature,
-            'water_level': self.water_level,
-            'steam_quality': self.steam_quality,
-            'steam_void_fraction': self.steam_void_fraction,
-            
-            # Flow and generation rates
-            'steam_production_rate': steam_production_rate,
-            'steam_flow_rate': self.steam_flow_rate,
-            'feedwater_flow_rate': self.feedwater_flow_rate,
-            
-            # PHASE 1: Flow restriction results
-            'requested_steam_flow': steam_flow_out,
-            'actual_steam_flow': actual_steam_flow,
-            'requested_feedwater_flow': feedwater_flow_in,
-            'actual_feedwater_flow': actual_feedwater_flow,
-            'flow_restriction_factor': flow_restriction_factor,
-            
-            # NEW: Primary flow restriction results
-            'requested_primary_flow': primary_flow,
-            'actual_primary_flow': actual_primary_flow,
-            'primary_flow_restriction_factor': primary_flow_restriction_factor,
-            
-            # PHASE 2: Pump energy results
-            'base_pump_power_mw': pump_energy['base_pump_power_mw'],
-            'fouling_energy_penalty_mw': pump_energy['fouling_energy_penalty_mw'],
-            'total_pump_power_mw': pump_energy['total_pump_power_mw'],
-            'net_thermal_efficiency': (heat_transfer - pump_energy['total_pump_power_mw'] * 1e6) / self.config.design_thermal_power_per_sg if self.config.design_thermal_power_per_sg > 0 else 0.0,
-            
-            # Dynamics
-            'pressure_change_rate': secondary_dynamics['pressure_change_rate'],
-            'level_change_rate': secondary_dynamics['level_change_rate'],
-            'mass_change_rate': secondary_dynamics['mass_change_rate'],
-            
-            # Heat transfer details
-            'tube_wall_temperature': self.tube_wall_temp,
-            'overall_htc': ht_details['overall_htc'],
-            'heat_flux': ht_details['heat_flux'],
-            'lmtd': ht_details['lmtd'],
-            
-            # Performance indicators
-            'h_primary': ht_details['h_primary'],
-            'h_secondary': ht_details['h_secondary'],
-            'flow_factor': ht_details['flow_factor'],
-            'pressure_factor': ht_details['pressure_factor'],
-            
-            # TSP fouling results
-            'tsp_fouling_fraction': tsp_result['fouling_fraction'],
-            'tsp_fouling_stage': tsp_result['fouling_stage'],
-            'tsp_heat_transfer_degradation': tsp_result['heat_transfer_degradation'],
-            'tsp_pressure_drop_ratio': tsp_result['pressure_drop_ratio'],
-            'tsp_operating_years': tsp_result['operating_years'],
-            'tsp_shutdown_required': tsp_result['shutdown_required'],
-            'tsp_replacement_recommended': tsp_result['replacement_recommended'],
-            'tsp_cleaning_cycles': tsp_result['cleaning_cycles'],
-            
-            # Tube interior fouling results (NEW)
-            'tube_scale_thickness_mm': tube_interior_result['scale_thickness_mm'],
-            'tube_scale_thermal_resistance': tube_interior_result['scale_thermal_resistance'],
-            'tube_scale_formation_rate_mm_per_year': tube_interior_result['scale_formation_rate_mm_per_year'],
-            'tube_thermal_efficiency_loss': tube_interior_result['thermal_efficiency_loss'],
-            'tube_fouling_fraction': tube_interior_result['fouling_fraction'],
-            'tube_operating_years': tube_interior_result['operating_years'],
-            'tube_replacement_recommended': tube_interior_result['replacement_recommended']
-        }
+        return self._bank.update(primary_temp_in, primary_temp_out, primary_flow,
+                                 steam_flow_out, feedwater_flow_in, feedwater_temp, dt,
+                                 system_conditions, slots=[self._bank_slot])[0]
     
     # Thermodynamic property correlations
     # These are simplified correlations valid for PWR operating conditions
     # For production use, would use NIST REFPROP or similar
-    
+
     def _saturation_temperature(self, pressure_mpa: float) -> float:
         """
         Calculate saturation temperature for given pressure
         
         Using accurate correlation for water, valid 0.1-10 MPa
         Reference: NIST steam tables, simplified polynomial fit
+        (for 6.895 MPa, should give ~285°C)
         """
-        if pressure_mpa <= 0.001:
-            return 10.0  # Very low pressure
-        
-        # CORRECTED: Use accurate polynomial fit for water saturation temperature
-        # Based on NIST data, valid for 0.1-10 MPa
-        # For 6.895 MPa, should give ~285°C
-        
-        # Convert pressure to bar for calculation
-        pressure_bar = pressure_mpa * 10.0
-        
-        # Polynomial fit to NIST saturation data (0.1-10 MPa range)
-        # T_sat = a0 + a1*ln(P) + a2*ln(P)^2 + a3*ln(P)^3
-        # Where P is in bar, T is in °C
-        a0 = 42.6776
-        a1 = 34.5194
-        a2 = 2.8896
-        a3 = 0.1153
-        
-        if pressure_bar > 0:
-            ln_p = np.log(pressure_bar)
-            temp_c = a0 + a1*ln_p + a2*ln_p**2 + a3*ln_p**3
-        else:
-            temp_c = 10.0
-        
-        # Validate result - for 6.895 MPa (68.95 bar), should give ~285°C
-        temp_c = np.clip(temp_c, 10.0, 374.0)  # Physical limits for water
-        
-        return temp_c
+        return _STEAM_PROPERTIES.saturation_temperature(pressure_mpa)
     
     def _saturation_enthalpy_liquid(self, pressure_mpa: float) -> float:
         """Calculate saturation enthalpy of liquid water (kJ/kg)"""
-        temp = self._saturation_temperature(pressure_mpa)
-        # Simplified correlation based on temperature
-        # h_f ≈ cp * T for liquid water
-        return 4.18 * temp  # kJ/kg
+        return _STEAM_PROPERTIES.saturation_enthalpy_liquid(pressure_mpa)
     
     def _saturation_enthalpy_vapor(self, pressure_mpa: float) -> float:
         """Calculate saturation enthalpy of steam (kJ/kg)"""
-        temp = self._saturation_temperature(pressure_mpa)
-        h_f = self._saturation_enthalpy_liquid(pressure_mpa)
-        
-        # Latent heat correlation (simplified)
-        # h_fg decreases with pressure, goes to zero at critical point
-        h_fg = 2257.0 * (1.0 - temp / 374.0) ** 0.38  # Approximate correlation
-        
-        return h_f + h_fg
+        return _STEAM_PROPERTIES.saturation_enthalpy_vapor(pressure_mpa)
     
     def _water_enthalpy(self, temp_c: float, pressure_mpa: float) -> float:
         """Calculate enthalpy of liquid water (kJ/kg)"""
-        # For liquid water, enthalpy is primarily temperature dependent
-        # Small pressure correction for compressed liquid
-        h_sat = 4.18 * temp_c
-        pressure_correction = 0.001 * (pressure_mpa - 0.1) * temp_c  # Small correction
-        return h_sat + pressure_correction
+        return compressed_liquid_enthalpy(temp_c, pressure_mpa)
     
     def _water_density(self, temp_c: float, pressure_mpa: float) -> float:
         """Calculate density of liquid water (kg/m³)"""
-        # Temperature effect dominates for liquid water
-        # ρ = ρ₀ * (1 - β * ΔT) where β is thermal expansion coefficient
-        rho_0 = 1000.0  # kg/m³ at 0°C
-        beta = 0.0003  # 1/°C thermal expansion coefficient
-        
-        rho_temp = rho_0 * (1.0 - beta * temp_c)
-        
-        # Small pressure effect (compressibility)
-        compressibility = 4.5e-10  # 1/Pa
-        pressure_effect = 1.0 + compressibility * pressure_mpa * 1e6
-        
-        return rho_temp * pressure_effect
+        return liquid_density(temp_c, pressure_mpa)
     
     def _steam_density(self, temp_c: float, pressure_mpa: float) -> float:
         """Calculate density of steam (kg/m³)"""
-        # Ideal gas law with steam gas constant
-        temp_k = temp_c + 273.15
-        R_steam = 461.5  # J/kg/K specific gas constant for steam
-        
-        # ρ = P / (R * T)
-        pressure_pa = pressure_mpa * 1e6
-        density = pressure_pa / (R_steam * temp_k)
-        
-        return density
+        return steam_density(temp_c, pressure_mpa)
     
     def get_state_dict(self) -> Dict[str, float]:
         """Get current state as dictionary for logging/monitoring"""
@@ -1046,7 +577,7 @@ class SteamGenerator(ChemistryFlowProvider):
             maintenance_system: AutoMaintenanceSystem instance
             component_id: Unique identifier for this steam generator
         """
-        print(f"STEAM GENERATOR {component_id}: Setting up maintenance integration")
+        logger.info("STEAM GENERATOR %s: Setting up maintenance integration", component_id)
         
         # Define monitoring configuration for steam generator parameters
         monitoring_config = {
@@ -1083,7 +614,7 @@ class SteamGenerator(ChemistryFlowProvider):
         # Register with maintenance system using event bus
         maintenance_system.register_component(component_id, self, monitoring_config)
         
-        print(f"  Registered {component_id} with {len(monitoring_config)} monitoring parameters")
+        logger.info("  Registered %s with %s monitoring parameters", component_id, len(monitoring_config))
         
         # Store reference for coordination
         self.maintenance_system = maintenance_system
@@ -1194,9 +725,9 @@ class SteamGenerator(ChemistryFlowProvider):
                 if scale_removed > 0:
                     # The tube wall temperature will be automatically recalculated in the next
                     # heat transfer calculation based on the reduced scale thermal resistance
-                    print(f"STEAM GENERATOR MAINTENANCE: Scale removal completed - {scale_removed:.3f}mm removed")
-                    print(f"  New scale thickness: {self.tube_interior_fouling.scale_thickness:.3f}mm")
-                    print(f"  New thermal resistance: {self.tube_interior_fouling.scale_thermal_resistance:.6f} m²K/W")
+                    logger.info("STEAM GENERATOR MAINTENANCE: Scale removal completed - %.3fmm removed", scale_removed)
+                    logger.info("  New scale thickness: %.3fmm", self.tube_interior_fouling.scale_thickness)
+                    logger.info("  New thermal resistance: %.6f m²K/W", self.tube_interior_fouling.scale_thermal_resistance)
             
             return result
         
@@ -1325,6 +856,18 @@ class SteamGenerator(ChemistryFlowProvider):
                 'effectiveness_score': 0.0
             }
     
+    def advance_degradation(self, dt: float) -> None:
+        """
+        Advance TSP and tube interior fouling at the last operating conditions
+
+        Used by steady-state fast-forward: thermal-hydraulic state is held and
+        picks up the new fouling on the next full update_state.
+
+        Args:
+            dt: Time step (s)
+        """
+        self.scheduler.advance_degradation(dt / 60.0)
+
     def reset(self) -> None:
         """Reset to initial steady-state conditions"""
         self.primary_inlet_temp = 327.0
@@ -1344,6 +887,7 @@ class SteamGenerator(ChemistryFlowProvider):
         
         # Reset TSP fouling model
         self.tsp_fouling.reset()
+        self.scheduler.reset()
     
     # === CHEMISTRY FLOW PROVIDER INTERFACE METHODS ===
     # These methods enable integration with chemistry_flow_tracker
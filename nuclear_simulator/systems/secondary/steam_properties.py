@@ -0,0 +1,330 @@
+"""
+Unified Water and Steam Property Module
+
+This module provides the water/steam property correlations used across the
+secondary system (steam generators, turbine, condenser, heat flow tracking),
+replacing the per-component copies of _saturation_temperature,
+_saturation_enthalpy_vapor, _water_enthalpy, _steam_enthalpy, etc.
+
+Key Features:
+1. Scalars or NumPy arrays: Python floats are evaluated with plain `math`
+   (no NumPy scalar overhead), arrays element-wise
+2. Precomputed saturation tables over the PWR operating envelope, with the
+   interpolation error measured at build time and bounded by a tolerance
+3. Optional exact-correlation mode (per instance or for all shared instances)
+
+Design Philosophy:
+- One implementation per correlation. The components were calibrated against
+  different saturation correlations, so they are kept as named correlations:
+  'antoine' (turbine, condenser, heat flow tracker), 'nist_fit' (steam
+  generators) and 'clausius_clapeyron' (integrated secondary system)
+- Simple formulas (liquid enthalpy, densities) are plain functions; only the
+  saturation properties, which need logarithms and powers, are tabulated
+
+Usage:
+    properties = steam_properties('antoine')
+    t_sat = properties.saturation_temperature(6.895)
+    h_g = properties.saturation_enthalpy_vapor(np.array([6.8, 6.9, 7.0]))
+"""
+
+import math
+from bisect import bisect_right
+from typing import Callable, Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+ArrayLike = Union[float, np.ndarray]
+
+# Property constants shared by all correlations
+CP_WATER = 4.18             # kJ/kg/K liquid water specific heat
+CP_STEAM = 2.1              # kJ/kg/K superheated steam specific heat
+H_FG_REFERENCE = 2257.0     # kJ/kg latent heat at 100°C
+T_CRITICAL = 374.0          # °C
+R_STEAM = 461.5             # J/kg/K specific gas constant of steam
+
+MIN_PRESSURE = 0.001        # MPa, below this the saturation temperature is T_MIN
+T_MIN = 10.0                # °C
+PWR_ENVELOPE = (MIN_PRESSURE, 22.064)   # MPa, tabulated pressure range
+
+
+# Raw saturation temperature correlations (°C from MPa, p > MIN_PRESSURE).
+# `xp` is `math` for Python floats and `np` for arrays.
+
+def _antoine(pressure_mpa, xp):
+    """Antoine equation (coefficients applied to pressure in bar)"""
+    A, B, C = 8.07131, 1730.63, 233.426
+    return B / (A - xp.log10(pressure_mpa * 10.0)) - C
+
+
+def _nist_fit(pressure_mpa, xp):
+    """Cubic fit in ln(P[bar]) to NIST saturation data"""
+    ln_p = xp.log(pressure_mpa * 10.0)
+    return 42.6776 + ln_p * (34.5194 + ln_p * (2.8896 + ln_p * 0.1153))
+
+
+def _clausius_clapeyron(pressure_mpa, xp):
+    """Clausius-Clapeyron relation from 100°C at 1 atm"""
+    t_ref_k = 373.15
+    r_v = 0.4615  # kJ/kg/K
+    return 1.0 / (1.0 / t_ref_k - (r_v / H_FG_REFERENCE) * xp.log(pressure_mpa / 0.101325)) - 273.15
+
+
+# name -> (correlation, pressure clamp applied before evaluation in MPa, or None)
+CORRELATIONS: Dict[str, Tuple[Callable, Optional[Tuple[float, float]]]] = {
+    'antoine': (_antoine, (0.001, 10.0)),
+    'nist_fit': (_nist_fit, None),
+    'clausius_clapeyron': (_clausius_clapeyron, None),
+}
+
+
+def _latent_heat(temp_c: np.ndarray) -> np.ndarray:
+    """Latent heat (kJ/kg) from saturation temperature; zero at the critical point"""
+    return H_FG_REFERENCE * np.maximum(1.0 - temp_c / T_CRITICAL, 0.0) ** 0.38
+
+
+class SaturationTable:
+    """
+    Saturation temperature and vapor enthalpy tabulated against ln(P)
+
+    Knots are a uniform ln(P) grid plus the pressures where the correlation's
+    clamps engage, so the only interpolation error comes from the smooth
+    segments. The grid is doubled until the error at the interval midpoints
+    and quarter points is within the relative tolerance.
+    """
+
+    def __init__(self, exact_temperature: Callable, pressure_range: Tuple[float, float],
+                 breakpoints: Sequence[float] = (), tolerance: float = 1e-5,
+                 initial_points: int = 64, max_points: int = 1 << 16):
+        """
+        Build the table.
+
+        Args:
+            exact_temperature: Vectorized exact saturation temperature (°C from MPa)
+            pressure_range: Tabulated pressure range (MPa)
+            breakpoints: Pressures (MPa) where exact_temperature has a kink
+            tolerance: Largest relative interpolation error allowed
+            initial_points: Uniform grid points of the first attempt
+            max_points: Give up refining beyond this many points
+        """
+        self.pressure_range = pressure_range
+        self.tolerance = tolerance
+        self._exact_temperature = exact_temperature
+        ln_lo, ln_hi = np.log(pressure_range[0]), np.log(pressure_range[1])
+        breakpoints = np.log([p for p in breakpoints if pressure_range[0] < p < pressure_range[1]])
+
+        points = initial_points
+        while True:
+            ln_p = np.union1d(np.linspace(ln_lo, ln_hi, points), breakpoints)
+            temperature, enthalpy = self._exact(ln_p)
+            self.max_error = self._measure_error(ln_p, temperature, enthalpy)
+            if self.max_error <= tolerance or points >= max_points:
+                break
+            points *= 2
+
+        self.ln_pressure = ln_p
+        self.temperature = temperature
+        self.enthalpy_vapor = enthalpy
+        # Python lists for the scalar path (bisect on a list beats NumPy on a float)
+        self._ln_list = ln_p.tolist()
+        self._temperature_list = temperature.tolist()
+        self._enthalpy_list = enthalpy.tolist()
+        self._last = len(self._ln_list) - 2
+
+    def _exact(self, ln_p: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        temperature = self._exact_temperature(np.exp(ln_p))
+        return temperature, CP_WATER * temperature + _latent_heat(temperature)
+
+    def _measure_error(self, ln_p: np.ndarray, temperature: np.ndarray, enthalpy: np.ndarray) -> float:
+        """Largest relative error of linear interpolation between the knots"""
+        probes = np.concatenate([ln_p[:-1] + f * np.diff(ln_p) for f in (0.25, 0.5, 0.75)])
+        exact_t, exact_h = self._exact(probes)
+        table_t = np.interp(probes, ln_p, temperature)
+        table_h = np.interp(probes, ln_p, enthalpy)
+        return float(max(np.max(np.abs(table_t - exact_t) / np.maximum(np.abs(exact_t), 1.0)),
+                         np.max(np.abs(table_h - exact_h) / np.maximum(np.abs(exact_h), 1.0))))
+
+    def contains(self, pressure_mpa: ArrayLike) -> Union[bool, np.ndarray]:
+        lo, hi = self.pressure_range
+        return (pressure_mpa >= lo) & (pressure_mpa <= hi)
+
+    def lookup(self, pressure_mpa: float) -> Tuple[float, float]:
+        """(temperature, vapor enthalpy) of a scalar pressure inside the range"""
+        x = math.log(pressure_mpa)
+        ln_p = self._ln_list
+        i = min(max(bisect_right(ln_p, x) - 1, 0), self._last)
+        w = (x - ln_p[i]) / (ln_p[i + 1] - ln_p[i])
+        t, h = self._temperature_list, self._enthalpy_list
+        return t[i] + w * (t[i + 1] - t[i]), h[i] + w * (h[i + 1] - h[i])
+
+    def lookup_array(self, pressure_mpa: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(temperature, vapor enthalpy) of pressures inside the range"""
+        x = np.log(pressure_mpa)
+        return (np.interp(x, self.ln_pressure, self.temperature),
+                np.interp(x, self.ln_pressure, self.enthalpy_vapor))
+
+
+class SteamProperties:
+    """
+    Saturation properties of one correlation, from tables or exact
+
+    Every method accepts a Python float (returns a float) or a NumPy array
+    (returns an array). Pressures outside the tabulated envelope are always
+    evaluated exactly.
+    """
+
+    def __init__(self, correlation: str = 'antoine', exact: bool = False,
+                 pressure_range: Tuple[float, float] = PWR_ENVELOPE, tolerance: float = 1e-5):
+        """
+        Initialize the property set.
+
+        Args:
+            correlation: Saturation correlation (key of CORRELATIONS)
+            exact: Evaluate the correlation directly instead of the tables
+            pressure_range: Tabulated pressure range (MPa)
+            tolerance: Relative interpolation error bound of the tables
+        """
+        if correlation not in CORRELATIONS:
+            raise ValueError(f"Unknown saturation correlation '{correlation}' "
+                             f"(expected one of {sorted(CORRELATIONS)})")
+        self.correlation = correlation
+        self.exact = exact
+        self._raw, self._clamp = CORRELATIONS[correlation]
+        self.table = SaturationTable(self._exact_temperature_array, pressure_range,
+                                     self._breakpoints(pressure_range), tolerance)
+
+    # Exact evaluation
+
+    def _breakpoints(self, pressure_range: Tuple[float, float]) -> list:
+        """Pressures where a clamp of the correlation engages (kinks of the exact curve)"""
+        breakpoints = list(self._clamp) if self._clamp is not None else []
+        clamp = self._clamp if self._clamp is not None else pressure_range
+        ln_p = np.linspace(np.log(clamp[0]), np.log(clamp[1]), 1025)
+        raw = self._raw(np.exp(ln_p), np)
+        for limit in (T_MIN, T_CRITICAL):
+            for i in np.flatnonzero(np.diff(np.sign(raw - limit)) != 0):
+                lo, hi = ln_p[i], ln_p[i + 1]
+                rising = raw[i + 1] > raw[i]
+                for _ in range(100):
+                    mid = 0.5 * (lo + hi)
+                    if (self._raw(math.exp(mid), math) > limit) == rising:
+                        hi = mid
+                    else:
+                        lo = mid
+                breakpoints.append(math.exp(0.5 * (lo + hi)))
+        return breakpoints
+
+    def _exact_temperature_scalar(self, pressure_mpa: float) -> float:
+        if pressure_mpa <= MIN_PRESSURE:
+            return T_MIN
+        if self._clamp is not None:
+            pressure_mpa = min(max(pressure_mpa, self._clamp[0]), self._clamp[1])
+        return min(max(self._raw(pressure_mpa, math), T_MIN), T_CRITICAL)
+
+    def _exact_temperature_array(self, pressure_mpa: np.ndarray) -> np.ndarray:
+        low = pressure_mpa <= MIN_PRESSURE
+        pressure = np.maximum(pressure_mpa, MIN_PRESSURE * (1.0 + 1e-12))
+        if self._clamp is not None:
+            pressure = np.clip(pressure, *self._clamp)
+        temperature = np.clip(self._raw(pressure, np), T_MIN, T_CRITICAL)
+        return np.where(low, T_MIN, temperature)
+
+    def saturation(self, pressure_mpa: ArrayLike) -> Tuple[ArrayLike, ArrayLike]:
+        """Saturation temperature (°C) and saturated vapor enthalpy (kJ/kg)"""
+        if isinstance(pressure_mpa, (float, int)):
+            if not self.exact and self.table.contains(pressure_mpa):
+                return self.table.lookup(pressure_mpa)
+            temperature = self._exact_temperature_scalar(float(pressure_mpa))
+            latent_heat = H_FG_REFERENCE * max(1.0 - temperature / T_CRITICAL, 0.0) ** 0.38
+            return temperature, CP_WATER * temperature + latent_heat
+
+        pressure = np.asarray(pressure_mpa, dtype=np.float64)
+        if not self.exact and self.table.contains(pressure).all():
+            return self.table.lookup_array(pressure)
+        temperature = self._exact_temperature_array(pressure)
+        enthalpy = CP_WATER * temperature + _latent_heat(temperature)
+        if not self.exact:
+            inside = self.table.contains(pressure)
+            if np.any(inside):
+                table_t, table_h = self.table.lookup_array(pressure[inside])
+                temperature[inside] = table_t
+                enthalpy[inside] = table_h
+        return temperature, enthalpy
+
+    # Saturation properties
+
+    def saturation_temperature(self, pressure_mpa: ArrayLike) -> ArrayLike:
+        """Saturation temperature (°C)"""
+        return self.saturation(pressure_mpa)[0]
+
+    def saturation_enthalpy_liquid(self, pressure_mpa: ArrayLike) -> ArrayLike:
+        """Saturated liquid enthalpy (kJ/kg)"""
+        return CP_WATER * self.saturation(pressure_mpa)[0]
+
+    def saturation_enthalpy_vapor(self, pressure_mpa: ArrayLike) -> ArrayLike:
+        """Saturated vapor enthalpy (kJ/kg)"""
+        return self.saturation(pressure_mpa)[1]
+
+    def latent_heat(self, pressure_mpa: ArrayLike) -> ArrayLike:
+        """Latent heat of vaporization (kJ/kg)"""
+        temperature, enthalpy = self.saturation(pressure_mpa)
+        return enthalpy - CP_WATER * temperature
+
+    def steam_enthalpy(self, temp_c: ArrayLike, pressure_mpa: ArrayLike,
+                       cp_superheat: ArrayLike = CP_STEAM) -> ArrayLike:
+        """
+        Steam enthalpy (kJ/kg): saturated vapor at or below saturation,
+        superheated with constant cp above
+
+        Args:
+            temp_c: Steam temperature (°C)
+            pressure_mpa: Steam pressure (MPa)
+            cp_superheat: Superheated steam specific heat (kJ/kg/K)
+        """
+        t_sat, h_g = self.saturation(pressure_mpa)
+        if isinstance(temp_c, (float, int)) and isinstance(t_sat, float):
+            return h_g + cp_superheat * (temp_c - t_sat) if temp_c > t_sat else h_g
+        return h_g + cp_superheat * np.maximum(np.asarray(temp_c, dtype=np.float64) - t_sat, 0.0)
+
+
+# Correlation-independent liquid and vapor properties
+
+def liquid_enthalpy(temp_c: ArrayLike) -> ArrayLike:
+    """Liquid water enthalpy (kJ/kg, reference 0°C)"""
+    return CP_WATER * temp_c
+
+
+def compressed_liquid_enthalpy(temp_c: ArrayLike, pressure_mpa: ArrayLike) -> ArrayLike:
+    """Liquid water enthalpy (kJ/kg) with a small compressed-liquid correction"""
+    return CP_WATER * temp_c + 0.001 * (pressure_mpa - 0.1) * temp_c
+
+
+def liquid_density(temp_c: ArrayLike, pressure_mpa: ArrayLike) -> ArrayLike:
+    """Liquid water density (kg/m³): linear thermal expansion and compressibility"""
+    return 1000.0 * (1.0 - 0.0003 * temp_c) * (1.0 + 4.5e-10 * pressure_mpa * 1e6)
+
+
+def steam_density(temp_c: ArrayLike, pressure_mpa: ArrayLike) -> ArrayLike:
+    """Steam density (kg/m³) from the ideal gas law"""
+    return pressure_mpa * 1e6 / (R_STEAM * (temp_c + 273.15))
+
+
+# Shared instances, built on first use
+
+_shared: Dict[str, SteamProperties] = {}
+_exact_mode = False
+
+
+def steam_properties(correlation: str = 'antoine') -> SteamProperties:
+    """Shared property set of a correlation (tables are built once per process)"""
+    properties = _shared.get(correlation)
+    if properties is None:
+        properties = _shared[correlation] = SteamProperties(correlation, exact=_exact_mode)
+    return properties
+
+
+def set_exact_properties(exact: bool = True) -> None:
+    """Switch all shared property sets between tables and exact correlations"""
+    global _exact_mode
+    _exact_mode = exact
+    for properties in _shared.values():
+        properties.exact = exact
@@ -28,12 +28,22 @@ from simulator.state import auto_register
 
 # Import heat flow tracking
 from ..heat_flow_tracker import HeatFlowProvider, ThermodynamicProperties
+from ..steam_properties import steam_properties
 
 from .stage_system import TurbineStageSystem
 from .rotor_dynamics import RotorDynamicsModel
-from .turbine_bearing_lubrication import TurbineBearingLubricationSystem, integrate_lubrication_with_turbine
+from .turbine_bearing_lubrication import (
+    TurbineBearingLubricationSystem, integrate_lubrication_with_turbine, collect_bearing_states,
+    update_lubrication_with_feedback, inject_lubrication_into_bearings
+)
 from .config import TurbineConfig, TurbineThermalStressConfig, TurbineProtectionConfig
 from ..component_descriptions import TURBINE_COMPONENT_DESCRIPTIONS
+from simulator.sim_logging import get_logger
+
+logger = get_logger(__name__)
+
+# Saturation properties the turbine models are calibrated against
+_STEAM_PROPERTIES = steam_properties('antoine')
 
 warnings.filterwarnings("ignore")
 
@@ -287,7 +297,7 @@ class TurbineProtectionSystem:
             priority=priority
         )
         
-        print(f"TURBINE PROTECTION: Published trip event - {trip_type} ({severity})")
+        logger.info("TURBINE PROTECTION: Published trip event - %s (%s)", trip_type, severity)
     
     def _publish_trip_events(self, trip_conditions: Dict[str, bool], 
                             rotor_speed: float, vibration_level: float, 
@@ -431,7 +441,7 @@ class TurbineProtectionSystem:
                                     vacuum_pressure, thermal_stress)
 
         if self.trip_active:
-            print(f"Trip active: {self.trip_reasons}, time: {self.trip_time}")
+            logger.info("Trip active: %s, time: %s", self.trip_reasons, self.trip_time)
 
         return trips
     
@@ -549,13 +559,25 @@ class EnhancedTurbinePhysics(HeatFlowProvider):
         # CRITICAL: Apply initial conditions after creating components
         self._apply_initial_conditions()
         
-        print(f"TURBINE: Applied initial conditions from config")
+        logger.info("TURBINE: Applied initial conditions from config")
+    
+    def __getstate__(self) -> Dict:
+        """Pickle support: the lubrication update wrapper is a closure, rebuilt on restore"""
+        state = self.__dict__.copy()
+        for name in ('update_rotor_dynamics', 'update_state', 'update'):
+            state.pop(name, None)
+        return state
+    
+    def __setstate__(self, state: Dict):
+        self.__dict__.update(state)
+        if 'lubrication_system' in state:
+            integrate_lubrication_with_turbine(self, self.lubrication_system)
     
     def _apply_initial_conditions(self):
         """Apply unified initial conditions - CLEAN VERSION"""
         ic = self.config.initial_conditions
         
-        print(f"TURBINE: Applying unified initial conditions")
+        logger.info("TURBINE: Applying unified initial conditions")
         
         # Apply rotor conditions
         if hasattr(self.rotor_dynamics, 'rotor_speed'):
@@ -585,28 +607,28 @@ class EnhancedTurbinePhysics(HeatFlowProvider):
                 for i, temp in enumerate(ic.rotor_temperatures):
                     if i < len(thermal_tracker.rotor_temperatures):
                         thermal_tracker.rotor_temperatures[i] = temp
-                print(f"    Applied rotor temperatures: {ic.rotor_temperatures}")
+                logger.info("    Applied rotor temperatures: %s", ic.rotor_temperatures)
             
             # Apply casing temperatures
             if hasattr(ic, 'casing_temperatures') and hasattr(thermal_tracker, 'casing_temperatures'):
                 for i, temp in enumerate(ic.casing_temperatures):
                     if i < len(thermal_tracker.casing_temperatures):
                         thermal_tracker.casing_temperatures[i] = temp
-                print(f"    Applied casing temperatures: {ic.casing_temperatures}")
+                logger.info("    Applied casing temperatures: %s", ic.casing_temperatures)
             
             # Apply blade temperatures
             if hasattr(ic, 'blade_temperatures') and hasattr(thermal_tracker, 'blade_temperatures'):
                 for i, temp in enumerate(ic.blade_temperatures):
                     if i < len(thermal_tracker.blade_temperatures):
                         thermal_tracker.blade_temperatures[i] = temp
-                print(f"    Applied blade temperatures: {ic.blade_temperatures}")
+                logger.info("    Applied blade temperatures: %s", ic.blade_temperatures)
         
         # Apply system-level initial conditions
         self.total_power_output = ic.total_power_output
         self.overall_efficiency = ic.overall_efficiency
         self.load_demand = ic.load_demand
         
-        print(f"TURBINE: Initial conditions applied successfully")
+        logger.info("TURBINE: Initial conditions applied successfully")
         
         # Validate that critical initial conditions were applied
         self._validate_initial_conditions_applied()
@@ -615,24 +637,24 @@ class EnhancedTurbinePhysics(HeatFlowProvider):
         """Validate that initial conditions were properly applied"""
         ic = self.config.initial_conditions
         
-        print(f"TURBINE: Validating initial conditions application:")
+        logger.info("TURBINE: Validating initial conditions application:")
         
         # Validate rotor conditions
         if hasattr(self.rotor_dynamics, 'rotor_speed'):
             expected = ic.rotor_speed
             actual = self.rotor_dynamics.rotor_speed
             if abs(actual - expected) < 1.0:
-                print(f"  ✓ Rotor speed: {actual} RPM (expected {expected} RPM)")
+                logger.info("  ✓ Rotor speed: %s RPM (expected %s RPM)", actual, expected)
             else:
-                print(f"  ✗ Rotor speed mismatch: {actual} RPM (expected {expected} RPM)")
+                logger.info("  ✗ Rotor speed mismatch: %s RPM (expected %s RPM)", actual, expected)
         
         if hasattr(self.rotor_dynamics, 'rotor_temperature'):
             expected = ic.rotor_temperature
             actual = self.rotor_dynamics.rotor_temperature
             if abs(actual - expected) < 1.0:
-                print(f"  ✓ Rotor temperature: {actual}°C (expected {expected}°C)")
+                logger.info("  ✓ Rotor temperature: %s°C (expected %s°C)", actual, expected)
             else:
-                print(f"  ✗ Rotor temperature mismatch: {actual}°C (expected {expected}°C)")
+                logger.info("  ✗ Rotor temperature mismatch: %s°C (expected %s°C)", actual, expected)
         
         # Validate bearing conditions
         if hasattr(self.rotor_dynamics, 'bearings'):
@@ -640,34 +662,34 @@ class EnhancedTurbinePhysics(HeatFlowProvider):
             
             for i, bearing_id in enumerate(bearing_ids):
                 bearing = self.rotor_dynamics.bearings[bearing_id]
-                print(f"  Bearing {bearing_id} verification:")
+                logger.info("  Bearing %s verification:", bearing_id)
                 
                 # Validate bearing temperature
                 if i < len(ic.bearing_temperatures):
                     expected = ic.bearing_temperatures[i]
                     actual = bearing.metal_temperature
                     if abs(actual - expected) < 1.0:
-                        print(f"    ✓ Temperature: {actual}°C (expected {expected}°C)")
+                        logger.info("    ✓ Temperature: %s°C (expected %s°C)", actual, expected)
                     else:
-                        print(f"    ✗ Temperature mismatch: {actual}°C (expected {expected}°C)")
+                        logger.info("    ✗ Temperature mismatch: %s°C (expected %s°C)", actual, expected)
                 
                 # Validate bearing vibration
                 if i < len(ic.bearing_vibrations):
                     expected = ic.bearing_vibrations[i]
                     actual = bearing.vibration_displacement
                     if abs(actual - expected) < 0.1:
-                        print(f"    ✓ Vibration: {actual} mm/s (expected {expected} mm/s)")
+                        logger.info("    ✓ Vibration: %s mm/s (expected %s mm/s)", actual, expected)
                     else:
-                        print(f"    ✗ Vibration mismatch: {actual} mm/s (expected {expected} mm/s)")
+                        logger.info("    ✗ Vibration mismatch: %s mm/s (expected %s mm/s)", actual, expected)
                 
                 # Validate oil pressure
                 if i < len(ic.bearing_oil_pressures):
                     expected = ic.bearing_oil_pressures[i]
                     actual = bearing.oil_pressure
                     if abs(actual - expected) < 0.01:
-                        print(f"    ✓ Oil pressure: {actual} MPa (expected {expected} MPa)")
+                        logger.info("    ✓ Oil pressure: %s MPa (expected %s MPa)", actual, expected)
                     else:
-                        print(f"    ✗ Oil pressure mismatch: {actual} MPa (expected {expected} MPa)")
+                        logger.info("    ✗ Oil pressure mismatch: %s MPa (expected %s MPa)", actual, expected)
         
         # Validate unified lubrication system
         if hasattr(self, 'bearing_lubrication_system'):
@@ -677,19 +699,19 @@ class EnhancedTurbinePhysics(HeatFlowProvider):
             expected_contamination = ic.lubrication_system.oil_base_contamination
             actual_contamination = lubrication_system.oil_base_contamination
             if abs(actual_contamination - expected_contamination) < 0.1:
-                print(f"  ✓ Oil base contamination: {actual_contamination:.1f} ppm (expected {expected_contamination:.1f} ppm)")
+                logger.info("  ✓ Oil base contamination: %.1f ppm (expected %.1f ppm)", actual_contamination, expected_contamination)
             else:
-                print(f"  ✗ Oil contamination mismatch: {actual_contamination:.1f} ppm (expected {expected_contamination:.1f} ppm)")
+                logger.info("  ✗ Oil contamination mismatch: %.1f ppm (expected %.1f ppm)", actual_contamination, expected_contamination)
             
             # Validate oil level
             expected_level = ic.lubrication_system.oil_reservoir_level
             actual_level = lubrication_system.oil_level
             if abs(actual_level - expected_level) < 1.0:
-                print(f"  ✓ Oil reservoir level: {actual_level:.1f}% (expected {expected_level:.1f}%)")
+                logger.info("  ✓ Oil reservoir level: %.1f%% (expected %.1f%%)", actual_level, expected_level)
             else:
-                print(f"  ✗ Oil level mismatch: {actual_level:.1f}% (expected {expected_level:.1f}%)")
+                logger.info("  ✗ Oil level mismatch: %.1f%% (expected %.1f%%)", actual_level, expected_level)
         
-        print(f"TURBINE: Initial conditions validation complete")
+        logger.info("TURBINE: Initial conditions validation complete")
         
     def update_state(self,
                     sg_conditions: Dict,
@@ -766,9 +788,8 @@ class EnhancedTurbinePhysics(HeatFlowProvider):
         )
         
         # Get stage temperatures for thermal analysis
-        stage_temps = []
-        for stage_id, stage_result in stage_results['stage_results'].items():
-            stage_temps.append(stage_result['outlet_temperature'])
+        stage_expansion = stage_results['stage_results']
+        stage_temps = stage_expansion.outlet_temperature.tolist()
         
         # Update thermal tracker
         thermal_results = self.thermal_tracker.update_temperatures(
@@ -876,8 +897,8 @@ class EnhancedTurbinePhysics(HeatFlowProvider):
             'condenser_pressure': condenser_pressure,
             'condenser_temperature': self._saturation_temperature(condenser_pressure),
             'effective_steam_flow': steam_flow - stage_results['total_extraction_flow'],
-            'hp_power': sum(result['power_output'] for stage_id, result in stage_results['stage_results'].items() if 'HP' in stage_id),
-            'lp_power': sum(result['power_output'] for stage_id, result in stage_results['stage_results'].items() if 'LP' in stage_id),
+            'hp_power': stage_expansion.section_total('power_output', 'HP'),
+            'lp_power': stage_expansion.section_total('power_output', 'LP'),
             'hp_exhaust_pressure': 1.2,  # MPa typical HP exhaust
             'hp_exhaust_temperature': self._saturation_temperature(1.2),
             'hp_exhaust_quality': 0.92,
@@ -980,7 +1001,7 @@ class EnhancedTurbinePhysics(HeatFlowProvider):
             maintenance_system: AutoMaintenanceSystem instance
             component_id: Unique identifier for this turbine system
         """
-        print(f"ENHANCED TURBINE {component_id}: Setting up maintenance integration")
+        logger.info("ENHANCED TURBINE %s: Setting up maintenance integration", component_id)
         
         # Define monitoring configuration for turbine system parameters
         monitoring_config = {
@@ -1024,10 +1045,10 @@ class EnhancedTurbinePhysics(HeatFlowProvider):
         # Register with maintenance system using event bus
         maintenance_system.register_component(component_id, self, monitoring_config)
         
-        print(f"  Registered {component_id} with {len(monitoring_config)} monitoring parameters")
+        logger.info("  Registered %s with %s monitoring parameters", component_id, len(monitoring_config))
         
         # Set up maintenance integration for subsystems
-        print(f"  Setting up subsystem maintenance integration...")
+        logger.info("  Setting up subsystem maintenance integration...")
         
         # Register individual bearings
         for bearing_id, bearing in self.rotor_dynamics.bearings.items():
@@ -1044,13 +1065,13 @@ class EnhancedTurbinePhysics(HeatFlowProvider):
             maintenance_system.event_bus, 
             component_id
         )
-        print(f"  Connected turbine protection system to maintenance event bus")
+        logger.info("  Connected turbine protection system to maintenance event bus")
         
         # Store reference for coordination
         self.maintenance_system = maintenance_system
         self.component_id = component_id
         
-        print(f"  Enhanced turbine maintenance integration complete")
+        logger.info("  Enhanced turbine maintenance integration complete")
     
     def perform_maintenance(self, maintenance_type: str = None, **kwargs):
         """
@@ -1266,6 +1287,31 @@ class EnhancedTurbinePhysics(HeatFlowProvider):
                 'effectiveness_score': 0.0
             }
 
+    def advance_degradation(self, dt: float) -> None:
+        """
+        Advance bearing lubrication, bearing wear and stage fouling/erosion at
+        the last operating conditions
+
+        Used by steady-state fast-forward while rotor and stage state is held.
+
+        Args:
+            dt: Time step (hours)
+        """
+        operating_conditions = getattr(self, 'last_lubrication_conditions', None)
+        if operating_conditions is not None:
+            bearing_feedback = collect_bearing_states(self, operating_conditions)
+            lubrication_results = update_lubrication_with_feedback(
+                self.bearing_lubrication_system, bearing_feedback, operating_conditions, dt
+            )
+            inject_lubrication_into_bearings(self, lubrication_results)
+        
+        for bearing in self.rotor_dynamics.bearings.values():
+            bearing.update_bearing_wear(bearing.current_load, 5.0, dt)  # Same contamination as update_state
+        for stage in self.stage_system.stages.values():
+            stage.update_degradation(dt)
+        
+        self.operating_hours += dt
+
     def reset(self) -> None:
         """Reset enhanced turbine to initial conditions"""
         self.stage_system.reset()
@@ -1284,30 +1330,15 @@ class EnhancedTurbinePhysics(HeatFlowProvider):
     
     def _steam_enthalpy(self, temp_c: float, pressure_mpa: float) -> float:
         """Calculate steam enthalpy (kJ/kg)"""
-        sat_temp = self._saturation_temperature(pressure_mpa)
-        if temp_c <= sat_temp:
-            return self._saturation_enthalpy_vapor(pressure_mpa)
-        else:
-            h_g = self._saturation_enthalpy_vapor(pressure_mpa)
-            superheat = temp_c - sat_temp
-            return h_g + 2.1 * superheat
+        return _STEAM_PROPERTIES.steam_enthalpy(temp_c, pressure_mpa)
     
     def _saturation_temperature(self, pressure_mpa: float) -> float:
         """Calculate saturation temperature"""
-        if pressure_mpa <= 0.001:
-            return 10.0
-        A, B, C = 8.07131, 1730.63, 233.426
-        pressure_bar = pressure_mpa * 10.0
-        pressure_bar = np.clip(pressure_bar, 0.01, 100.0)
-        temp_c = B / (A - np.log10(pressure_bar)) - C
-        return np.clip(temp_c, 10.0, 374.0)
+        return _STEAM_PROPERTIES.saturation_temperature(pressure_mpa)
     
     def _saturation_enthalpy_vapor(self, pressure_mpa: float) -> float:
         """Calculate saturation enthalpy of steam"""
-        temp = self._saturation_temperature(pressure_mpa)
-        h_f = 4.18 * temp
-        h_fg = 2257.0 * (1.0 - temp / 374.0) ** 0.38
-        return h_f + h_fg
+        return _STEAM_PROPERTIES.saturation_enthalpy_vapor(pressure_mpa)
     
     def _calculate_pressure_variation_effects(self, sg_pressures: List[float]) -> float:
         """
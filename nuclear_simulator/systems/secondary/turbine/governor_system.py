@@ -34,8 +34,57 @@ from ..lubrication_base import BaseLubricationSystem, BaseLubricationConfig, Lub
 warnings.filterwarnings("ignore")
 
 
-# GovernorLubricationConfig is now integrated into the unified TurbineLubricationConfig
-# Governor lubrication parameters are accessed from the unified config system
+# Governor lubrication parameters are accessed from the unified config system;
+# the adapters below map them (module level so governor systems can be pickled)
+
+
+class GovernorLubricationConfig(BaseLubricationConfig):
+    """BaseLubricationConfig-compatible governor lubrication config built from the unified config"""
+
+    def __init__(self, unified_config):
+        # Map unified config parameters to base lubrication config
+        super().__init__(
+            system_id=unified_config.governor_system_id,
+            system_type="governor",
+            oil_reservoir_capacity=unified_config.governor_oil_reservoir_capacity,
+            oil_operating_pressure=unified_config.governor_oil_operating_pressure,
+            oil_temperature_range=unified_config.governor_oil_temperature_range,
+            oil_viscosity_grade=unified_config.governor_oil_viscosity_grade,
+            filter_micron_rating=unified_config.governor_filter_micron_rating,
+            contamination_limit=unified_config.governor_contamination_limit,
+            oil_change_interval=unified_config.governor_oil_change_interval,
+            oil_analysis_interval=unified_config.governor_oil_analysis_interval
+        )
+
+        # Governor-specific parameters
+        self.hydraulic_system_pressure = unified_config.hydraulic_system_pressure
+        self.servo_valve_flow_rate = unified_config.servo_valve_flow_rate
+        self.pilot_valve_flow_rate = unified_config.pilot_valve_flow_rate
+        self.accumulator_capacity = unified_config.accumulator_capacity
+
+        # Store reference to original config for test access
+        self.governor_oil_reservoir_capacity = unified_config.governor_oil_reservoir_capacity
+
+
+class GovernorValveConfig:
+    """Simple governor valve config built from the unified governor config"""
+
+    def __init__(self, config):
+        self.valve_id = "GOV-VALVE-001"
+        self.valve_type = "control"
+        self.valve_stroke = config.valve_stroke
+        self.valve_area = config.valve_area
+        self.valve_cv = config.valve_cv
+        self.valve_response_time = config.valve_response_time
+        self.valve_stroke_time = config.valve_stroke_time
+        self.valve_deadband = config.valve_deadband
+        self.valve_hysteresis = 0.5  # Default hysteresis
+        self.min_position = 0.0
+        self.max_position = 100.0
+        self.max_stroke_rate = 20.0  # %/s
+        self.actuator_pressure = config.actuator_pressure
+        self.actuator_force = config.actuator_force
+        self.actuator_oil_flow = config.actuator_oil_flow
 
 
 class GovernorLubricationSystem(BaseLubricationSystem):
@@ -58,32 +107,6 @@ class GovernorLubricationSystem(BaseLubricationSystem):
     def __init__(self, lubrication_config):
         """Initialize governor lubrication system from unified config"""
         
-        # Create a BaseLubricationConfig-compatible object from unified config
-        class GovernorLubricationConfig(BaseLubricationConfig):
-            def __init__(self, unified_config):
-                # Map unified config parameters to base lubrication config
-                super().__init__(
-                    system_id=unified_config.governor_system_id,
-                    system_type="governor",
-                    oil_reservoir_capacity=unified_config.governor_oil_reservoir_capacity,
-                    oil_operating_pressure=unified_config.governor_oil_operating_pressure,
-                    oil_temperature_range=unified_config.governor_oil_temperature_range,
-                    oil_viscosity_grade=unified_config.governor_oil_viscosity_grade,
-                    filter_micron_rating=unified_config.governor_filter_micron_rating,
-                    contamination_limit=unified_config.governor_contamination_limit,
-                    oil_change_interval=unified_config.governor_oil_change_interval,
-                    oil_analysis_interval=unified_config.governor_oil_analysis_interval
-                )
-                
-                # Governor-specific parameters
-                self.hydraulic_system_pressure = unified_config.hydraulic_system_pressure
-                self.servo_valve_flow_rate = unified_config.servo_valve_flow_rate
-                self.pilot_valve_flow_rate = unified_config.pilot_valve_flow_rate
-                self.accumulator_capacity = unified_config.accumulator_capacity
-                
-                # Store reference to original config for test access
-                self.governor_oil_reservoir_capacity = unified_config.governor_oil_reservoir_capacity
-        
         config = GovernorLubricationConfig(lubrication_config)
         
         # Define governor-specific lubricated components
@@ -599,25 +622,6 @@ class TurbineGovernorSystem:
         self.lubrication_system = GovernorLubricationSystem(lubrication_config)
         
         # Create governor valve model using config parameters
-        # Create a simple valve config object from the unified config
-        class GovernorValveConfig:
-            def __init__(self, config):
-                self.valve_id = "GOV-VALVE-001"
-                self.valve_type = "control"
-                self.valve_stroke = config.valve_stroke
-                self.valve_area = config.valve_area
-                self.valve_cv = config.valve_cv
-                self.valve_response_time = config.valve_response_time
-                self.valve_stroke_time = config.valve_stroke_time
-                self.valve_deadband = config.valve_deadband
-                self.valve_hysteresis = 0.5  # Default hysteresis
-                self.min_position = 0.0
-                self.max_position = 100.0
-                self.max_stroke_rate = 20.0  # %/s
-                self.actuator_pressure = config.actuator_pressure
-                self.actuator_force = config.actuator_force
-                self.actuator_oil_flow = config.actuator_oil_flow
-        
         valve_config = GovernorValveConfig(config)
         self.governor_valve = GovernorValveModel(valve_config)
         
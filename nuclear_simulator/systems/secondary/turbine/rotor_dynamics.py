@@ -22,9 +22,13 @@ Physical Basis:
 
 import warnings
 from dataclasses import dataclass, field
+from types import SimpleNamespace
 from typing import Dict, List, Optional, Tuple
 import numpy as np
 from .config import RotorDynamicsConfig
+from simulator.sim_logging import get_logger
+
+logger = get_logger(__name__)
 
 warnings.filterwarnings("ignore")
 
@@ -46,13 +50,8 @@ class BearingModel:
     
     def __init__(self, bearing_id: str, bearing_config_dict: Dict):
         """Initialize bearing model from config dictionary"""
-        # Create a simple config object from the dictionary
-        class BearingConfig:
-            def __init__(self, **kwargs):
-                for key, value in kwargs.items():
-                    setattr(self, key, value)
-        
-        self.config = BearingConfig(**bearing_config_dict)
+        # Create a simple config object from the dictionary (module-level type so bearings can be pickled)
+        self.config = SimpleNamespace(**bearing_config_dict)
         
         # Bearing state
         self.current_load = 0.0                  # kN current bearing load
@@ -335,7 +334,7 @@ class BearingModel:
             maintenance_system: AutoMaintenanceSystem instance
             component_id: Unique identifier for this bearing
         """
-        print(f"BEARING {component_id}: Setting up maintenance integration")
+        logger.info("BEARING %s: Setting up maintenance integration", component_id)
         
         # Define monitoring configuration for bearing parameters
         monitoring_config = {
@@ -372,7 +371,7 @@ class BearingModel:
         # Register with maintenance system using event bus
         maintenance_system.register_component(component_id, self, monitoring_config)
         
-        print(f"  Registered {component_id} with {len(monitoring_config)} monitoring parameters")
+        logger.info("  Registered %s with %s monitoring parameters", component_id, len(monitoring_config))
         
         # Store reference for coordination
         self.maintenance_system = maintenance_system
@@ -20,11 +20,20 @@ Physical Basis:
 
 import warnings
 from dataclasses import dataclass, field
+from types import SimpleNamespace
 from typing import Dict, List, Optional, Tuple
 import numpy as np
 from simulator.state import auto_register
 from .config import TurbineStageSystemConfig
+from .stage_table import TurbineStageTable
+from ..steam_properties import steam_properties
 from ..component_descriptions import TURBINE_COMPONENT_DESCRIPTIONS
+from simulator.sim_logging import get_logger
+
+logger = get_logger(__name__)
+
+# Saturation properties the turbine models are calibrated against
+_STEAM_PROPERTIES = steam_properties('antoine')
 
 warnings.filterwarnings("ignore")
 
@@ -49,13 +58,8 @@ class TurbineStage:
     
     def __init__(self, stage_id: str, stage_config_dict: Dict):
         """Initialize individual turbine stage from config dictionary"""
-        # Create a simple config object from the dictionary
-        class StageConfig:
-            def __init__(self, **kwargs):
-                for key, value in kwargs.items():
-                    setattr(self, key, value)
-        
-        self.config = StageConfig(**stage_config_dict)
+        # Create a simple config object from the dictionary (module-level type so stages can be pickled)
+        self.config = SimpleNamespace(**stage_config_dict)
         
         # Stage thermodynamic state
         self.inlet_pressure = self.config.design_inlet_pressure      # MPa
@@ -149,10 +153,10 @@ class TurbineStage:
         
         # CRITICAL VALIDATION: Ensure outlet pressure is always less than inlet pressure
         if outlet_pressure >= inlet_pressure:
-            print(f"WARNING: Stage {self.config.stage_id} - Invalid pressure ratio detected!")
-            print(f"  Requested: Inlet {inlet_pressure:.3f} MPa → Outlet {outlet_pressure:.3f} MPa (ratio: {outlet_pressure/inlet_pressure:.4f})")
-            print(f"  Using physics-based: Inlet {inlet_pressure:.3f} MPa → Outlet {physics_based_outlet_pressure:.3f} MPa (ratio: {adjusted_pressure_ratio:.4f})")
-            print(f"  Operating conditions: Load factor {load_factor:.3f}, Temp factor {temp_factor:.3f}")
+            logger.warning("WARNING: Stage %s - Invalid pressure ratio detected!", self.config.stage_id)
+            logger.info("  Requested: Inlet %.3f MPa → Outlet %.3f MPa (ratio: %.4f)", inlet_pressure, outlet_pressure, outlet_pressure/inlet_pressure)
+            logger.info("  Using physics-based: Inlet %.3f MPa → Outlet %.3f MPa (ratio: %.4f)", inlet_pressure, physics_based_outlet_pressure, adjusted_pressure_ratio)
+            logger.info("  Operating conditions: Load factor %.3f, Temp factor %.3f", load_factor, temp_factor)
             
             # Use physics-based pressure
             self.outlet_pressure = physics_based_outlet_pressure
@@ -172,12 +176,12 @@ class TurbineStage:
                 max_allowed_pressure = inlet_pressure * (design_pressure_ratio * 1.3)  # 30% less expansion than design
             
             if outlet_pressure < min_allowed_pressure:
-                print(f"INFO: Stage {self.config.stage_id} - Outlet pressure too low, limiting to reasonable range")
-                print(f"  Requested: {outlet_pressure:.3f} MPa, Limited to: {min_allowed_pressure:.3f} MPa")
+                logger.info("INFO: Stage %s - Outlet pressure too low, limiting to reasonable range", self.config.stage_id)
+                logger.info("  Requested: %.3f MPa, Limited to: %.3f MPa", outlet_pressure, min_allowed_pressure)
                 self.outlet_pressure = min_allowed_pressure
             elif outlet_pressure > max_allowed_pressure:
-                print(f"INFO: Stage {self.config.stage_id} - Outlet pressure too high, limiting to reasonable range")
-                print(f"  Requested: {outlet_pressure:.3f} MPa, Limited to: {max_allowed_pressure:.3f} MPa")
+                logger.info("INFO: Stage %s - Outlet pressure too high, limiting to reasonable range", self.config.stage_id)
+                logger.info("  Requested: %.3f MPa, Limited to: %.3f MPa", outlet_pressure, max_allowed_pressure)
                 self.outlet_pressure = max_allowed_pressure
             else:
                 # Requested pressure is reasonable, use it
@@ -231,23 +235,23 @@ class TurbineStage:
         # But add a safety check just in case
         if isentropic_enthalpy_drop <= 0:
             # This should rarely happen now that pressure is corrected
-            print(f"INFO: Stage {self.config.stage_id} - Enthalpy drop still negative after pressure correction: {isentropic_enthalpy_drop:.2f} kJ/kg")
-            print(f"  Using corrected pressures: Inlet {inlet_pressure:.3f} MPa → Outlet {self.outlet_pressure:.3f} MPa")
+            logger.info("INFO: Stage %s - Enthalpy drop still negative after pressure correction: %.2f kJ/kg", self.config.stage_id, isentropic_enthalpy_drop)
+            logger.info("  Using corrected pressures: Inlet %.3f MPa → Outlet %.3f MPa", inlet_pressure, self.outlet_pressure)
             
             # Force a minimum positive enthalpy drop based on corrected pressure ratio
             pressure_ratio = self.outlet_pressure / inlet_pressure
             min_enthalpy_drop = 50.0 * (1.0 - pressure_ratio)  # Approximate 50 kJ/kg per unit pressure ratio
             isentropic_enthalpy_drop = max(min_enthalpy_drop, 10.0)  # Minimum 10 kJ/kg
             
-            print(f"  Corrected enthalpy drop to: {isentropic_enthalpy_drop:.2f} kJ/kg")
+            logger.info("  Corrected enthalpy drop to: %.2f kJ/kg", isentropic_enthalpy_drop)
         
         actual_enthalpy_drop = total_efficiency * isentropic_enthalpy_drop
         
         # Ensure actual enthalpy drop is also positive
         if actual_enthalpy_drop <= 0:
-            print(f"WARNING: Stage {self.config.stage_id} - Negative actual enthalpy drop: {actual_enthalpy_drop:.2f} kJ/kg")
+            logger.warning("WARNING: Stage %s - Negative actual enthalpy drop: %.2f kJ/kg", self.config.stage_id, actual_enthalpy_drop)
             actual_enthalpy_drop = max(1.0, isentropic_enthalpy_drop * 0.5)  # At least 50% of isentropic
-            print(f"  Corrected to: {actual_enthalpy_drop:.2f} kJ/kg")
+            logger.info("  Corrected to: %.2f kJ/kg", actual_enthalpy_drop)
         
         self.enthalpy_drop = actual_enthalpy_drop
         
@@ -261,7 +265,7 @@ class TurbineStage:
         
         # Ensure power is positive
         if main_power < 0:
-            print(f"WARNING: Stage {self.config.stage_id} - Negative main power: {main_power:.2f} MW")
+            logger.warning("WARNING: Stage %s - Negative main power: %.2f MW", self.config.stage_id, main_power)
             main_power = 0.0
         
         # Power from extraction flow (partial expansion)
@@ -421,26 +425,15 @@ class TurbineStage:
         pressure_mpa = max(0.001, min(pressure_mpa, 22.0))  # Limit to reasonable range
         temp_c = max(0.0, min(temp_c, 800.0))  # Limit to reasonable range
         
-        sat_temp = self._saturation_temperature(pressure_mpa)
-        
-        if temp_c <= sat_temp:
-            # Saturated steam
-            return self._saturation_enthalpy_vapor(pressure_mpa)
+        # Superheated steam specific heat varies with pressure
+        if pressure_mpa > 10.0:
+            cp_superheat = 2.5  # kJ/kg/K at high pressure
+        elif pressure_mpa > 1.0:
+            cp_superheat = 2.2  # kJ/kg/K at medium pressure
         else:
-            # Superheated steam - improved calculation
-            h_g = self._saturation_enthalpy_vapor(pressure_mpa)
-            superheat = temp_c - sat_temp
-            
-            # More accurate specific heat for superheated steam
-            # Varies with pressure and temperature
-            if pressure_mpa > 10.0:
-                cp_superheat = 2.5  # kJ/kg/K at high pressure
-            elif pressure_mpa > 1.0:
-                cp_superheat = 2.2  # kJ/kg/K at medium pressure
-            else:
-                cp_superheat = 2.0  # kJ/kg/K at low pressure
-            
-            return h_g + cp_superheat * superheat
+            cp_superheat = 2.0  # kJ/kg/K at low pressure
+        
+        return _STEAM_PROPERTIES.steam_enthalpy(temp_c, pressure_mpa, cp_superheat)
     
     def _steam_entropy(self, temp_c: float, pressure_mpa: float) -> float:
         """Calculate steam entropy (kJ/kg/K)"""
@@ -457,20 +450,11 @@ class TurbineStage:
     
     def _saturation_temperature(self, pressure_mpa: float) -> float:
         """Calculate saturation temperature"""
-        if pressure_mpa <= 0.001:
-            return 10.0
-        A, B, C = 8.07131, 1730.63, 233.426
-        pressure_bar = pressure_mpa * 10.0
-        pressure_bar = np.clip(pressure_bar, 0.01, 100.0)
-        temp_c = B / (A - np.log10(pressure_bar)) - C
-        return np.clip(temp_c, 10.0, 374.0)
+        return _STEAM_PROPERTIES.saturation_temperature(pressure_mpa)
     
     def _saturation_enthalpy_vapor(self, pressure_mpa: float) -> float:
         """Calculate saturation enthalpy of steam"""
-        temp = self._saturation_temperature(pressure_mpa)
-        h_f = 4.18 * temp
-        h_fg = 2257.0 * (1.0 - temp / 374.0) ** 0.38
-        return h_f + h_fg
+        return _STEAM_PROPERTIES.saturation_enthalpy_vapor(pressure_mpa)
     
     def _isentropic_expansion_temperature(self, inlet_temp: float, inlet_pressure: float, outlet_pressure: float) -> float:
         """Calculate isentropic expansion temperature"""
@@ -682,6 +666,9 @@ class TurbineStageSystem:
             # Create default stage configuration
             self._create_default_stages()
         
+        # Stages in steam-path order with their design parameters as arrays
+        self.stage_table = TurbineStageTable(self.stages)
+        
         # Control system
         self.control_logic = TurbineStageControlLogic(config)
         
@@ -757,6 +744,10 @@ class TurbineStageSystem:
             }
             self.stages[stage_id] = TurbineStage(stage_id, stage_config_dict)
     
+    def refresh_stage_table(self) -> None:
+        """Rebuild the stage table after stages or their configs change"""
+        self.stage_table = TurbineStageTable(self.stages)
+    
     def calculate_stage_by_stage_expansion(self,
                                          inlet_pressure: float,
                                          inlet_temperature: float,
@@ -772,158 +763,12 @@ class TurbineStageSystem:
             extraction_demands: Extraction flow demands
             
         Returns:
-            Dictionary with expansion results
+            Dictionary with expansion results; 'stages' is a StageExpansion
+            that builds per-stage result dictionaries on lookup
         """
-        results = {
-            'stages': {},
-            'total_power': 0.0,
-            'total_extraction': 0.0,
-            'outlet_conditions': {}
-        }
-        
-        # Sort stages by pressure (high to low)
-        sorted_stages = sorted(self.stages.items(), 
-                             key=lambda x: x[1].config.design_inlet_pressure, 
-                             reverse=True)
-        
-        current_pressure = inlet_pressure
-        current_temperature = inlet_temperature
-        current_flow = inlet_flow
-        
-        # Calculate dynamic pressure ratios based on actual steam conditions
-        def get_dynamic_pressure_ratio(stage_id: str, stage_position: int, total_stages: int, 
-                                     current_pressure: float, inlet_pressure: float, 
-                                     inlet_flow: float) -> float:
-            """
-            Calculate dynamic pressure ratio that responds to actual steam conditions:
-            - Higher steam flow = more pressure drop (more work extraction)
-            - Maintains proper pressure progression through turbine
-            - Responds to changes in inlet conditions from steam generators
-            - Ensures realistic pressure ratios that don't trigger validation warnings
-            """
-            # Get the stage object to access design parameters
-            stage = self.stages[stage_id]
-            design_pressure_ratio = stage.config.design_outlet_pressure / stage.config.design_inlet_pressure
-            
-            # Calculate load factor based on actual vs design steam flow
-            design_flow = stage.config.design_steam_flow
-            load_factor = inlet_flow / design_flow if design_flow > 0 else 1.0
-            load_factor = np.clip(load_factor, 0.3, 1.5)  # Reasonable operating range
-            
-            # Calculate pressure factor based on actual vs design inlet pressure
-            design_inlet_pressure = stage.config.design_inlet_pressure
-            pressure_factor = current_pressure / design_inlet_pressure if design_inlet_pressure > 0 else 1.0
-            pressure_factor = np.clip(pressure_factor, 0.5, 1.5)  # Reasonable pressure range
-            
-            # Adjust pressure ratio based on operating conditions
-            # More conservative adjustments to prevent validation warnings
-            load_adjustment = 0.90 + 0.2 * (load_factor - 1.0)  # Range: 0.84 to 1.10
-            pressure_adjustment = 0.95 + 0.1 * (pressure_factor - 1.0)  # Range: 0.90 to 1.05
-            
-            # Calculate dynamic pressure ratio
-            dynamic_ratio = design_pressure_ratio * load_adjustment * pressure_adjustment
-            
-            # Apply stage-specific limits based on turbine design - more conservative
-            if stage_id.startswith('HP'):
-                # HP stages: conservative pressure ratio range
-                min_ratio = 0.70  # Less aggressive expansion
-                max_ratio = 0.95  # Minimum expansion
-            elif stage_id.startswith('LP'):
-                # LP stages: moderate expansion to avoid validation warnings
-                min_ratio = 0.50  # More conservative than before (was 0.35)
-                max_ratio = 0.85  # Moderate expansion
-            else:
-                min_ratio = 0.65
-                max_ratio = 0.90
-            
-            # Special handling for LP stages to ensure smooth pressure progression
-            if stage_id.startswith('LP'):
-                # Calculate remaining pressure drop needed to reach condenser
-                remaining_stages = total_stages - stage_position - 1
-                if remaining_stages > 0:
-                    # Ensure we leave enough pressure drop for remaining stages
-                    target_final_pressure = 0.007  # MPa condenser pressure
-                    min_pressure_per_remaining_stage = 0.85  # Minimum ratio per stage
-                    min_outlet_pressure = target_final_pressure / (min_pressure_per_remaining_stage ** remaining_stages)
-                    max_allowable_ratio = min_outlet_pressure / current_pressure
-                    
-                    # Don't go below this ratio to ensure we can reach condenser
-                    min_ratio = max(min_ratio, max_allowable_ratio)
-            
-            # Ensure final stage reaches condenser pressure
-            if stage_id == "LP-6":
-                # LP-6 must reach condenser vacuum regardless of other factors
-                target_outlet = 0.007  # MPa condenser pressure
-                calculated_ratio = target_outlet / current_pressure
-                # Ensure ratio is reasonable (not too aggressive)
-                dynamic_ratio = max(calculated_ratio, 0.05)  # Minimum 5% of inlet pressure
-            else:
-                dynamic_ratio = np.clip(dynamic_ratio, min_ratio, max_ratio)
-            
-            return dynamic_ratio
-        
-        final_pressure = 0.007  # MPa - typical condenser pressure
-        
-        for i, (stage_id, stage) in enumerate(sorted_stages):
-            # Get dynamic pressure ratio that responds to steam conditions
-            pressure_ratio = get_dynamic_pressure_ratio(stage_id, i, len(sorted_stages), 
-                                                      current_pressure, inlet_pressure, inlet_flow)
-            
-            # Calculate outlet pressure
-            outlet_pressure = current_pressure * pressure_ratio
-            
-            # Ensure we don't go below condenser pressure
-            outlet_pressure = max(outlet_pressure, final_pressure)
-            
-            # For final stages, ensure we actually reach condenser pressure
-            remaining_stages = len(sorted_stages) - i - 1
-            if remaining_stages == 0:
-                # Last stage must reach condenser pressure
-                outlet_pressure = final_pressure
-            elif remaining_stages == 1:
-                # Second to last stage: leave room for final stage
-                min_final_ratio = 0.5  # Minimum ratio for final stage
-                max_pressure_for_next = final_pressure / min_final_ratio
-                outlet_pressure = max(outlet_pressure, max_pressure_for_next)
-            
-            # Validate pressure drop
-            if outlet_pressure >= current_pressure:
-                print(f"WARNING: Stage {stage_id} - No pressure drop! Inlet: {current_pressure:.3f} MPa, Calculated outlet: {outlet_pressure:.3f} MPa")
-                # Force a minimum 5% pressure drop
-                outlet_pressure = current_pressure * 0.95
-                outlet_pressure = max(outlet_pressure, final_pressure)
-            
-            # Get extraction demand for this stage
-            extraction_demand = extraction_demands.get(stage_id, 0.0)
-            
-            # Calculate stage expansion
-            stage_result = stage.calculate_stage_expansion(
-                current_pressure, current_temperature, current_flow,
-                outlet_pressure, extraction_demand
-            )
-            
-            results['stages'][stage_id] = stage_result
-            
-            # Accumulate power and extraction
-            stage_power = stage_result['power_output']
-            stage_extraction = stage_result['extraction_flow']
-            
-            results['total_power'] += stage_power
-            results['total_extraction'] += stage_extraction
-            
-            # Update conditions for next stage
-            current_pressure = stage_result['outlet_pressure']
-            current_temperature = stage_result['outlet_temperature']
-            current_flow = stage_result['outlet_flow']
-         
-        # Final outlet conditions
-        results['outlet_conditions'] = {
-            'pressure': current_pressure,
-            'temperature': current_temperature,
-            'flow': current_flow
-        }
-        
-        return results
+        if len(self.stage_table) != len(self.stages):
+            self.refresh_stage_table()
+        return self.stage_table.expand(inlet_pressure, inlet_temperature, inlet_flow, extraction_demands)
     
     def update_state(self,
                     inlet_pressure: float,
@@ -28,6 +28,9 @@ import numpy as np
 from ..lubrication_base import BaseLubricationSystem, BaseLubricationConfig, LubricationComponent
 from simulator.state import auto_register
 from ..component_descriptions import TURBINE_COMPONENT_DESCRIPTIONS
+from simulator.sim_logging import get_logger
+
+logger = get_logger(__name__)
 
 warnings.filterwarnings("ignore")
 
@@ -189,7 +192,7 @@ class TurbineBearingLubricationSystem(BaseLubricationSystem):
     def apply_unified_initial_conditions(self, unified_ics):
         """Apply unified initial conditions to the lubrication system - NO BACKWARD COMPATIBILITY"""
         
-        print(f"UNIFIED LUBRICATION: Applying initial conditions")
+        logger.info("UNIFIED LUBRICATION: Applying initial conditions")
         
         # System base conditions
         self.oil_base_contamination = unified_ics.oil_base_contamination
@@ -224,10 +227,10 @@ class TurbineBearingLubricationSystem(BaseLubricationSystem):
         self.oil_contamination_level = self.oil_base_contamination
         self.oil_temperature = self.oil_base_temperature
         
-        print(f"  Base contamination: {self.oil_base_contamination:.1f} ppm")
-        print(f"  Base temperature: {self.oil_base_temperature:.1f}°C")
-        print(f"  Component factors: {self.component_contamination_factors}")
-        print(f"  Component wear: {unified_ics.component_wear_levels}")
+        logger.info("  Base contamination: %.1f ppm", self.oil_base_contamination)
+        logger.info("  Base temperature: %.1f°C", self.oil_base_temperature)
+        logger.info("  Component factors: %s", self.component_contamination_factors)
+        logger.info("  Component wear: %s", unified_ics.component_wear_levels)
     
     def get_effective_contamination(self, component_id: str) -> float:
         """Get effective contamination for component"""
@@ -428,7 +431,7 @@ class TurbineBearingLubricationSystem(BaseLubricationSystem):
             maintenance_system: AutoMaintenanceSystem instance
             component_id: Unique identifier for this lubrication system
         """
-        print(f"TURBINE LUBRICATION {component_id}: Setting up maintenance integration")
+        logger.info("TURBINE LUBRICATION %s: Setting up maintenance integration", component_id)
         
         # Define monitoring configuration for lubrication parameters
         monitoring_config = {
@@ -472,7 +475,7 @@ class TurbineBearingLubricationSystem(BaseLubricationSystem):
         # Register with maintenance system using event bus
         maintenance_system.register_component(component_id, self, monitoring_config)
         
-        print(f"  Registered {component_id} with {len(monitoring_config)} monitoring parameters")
+        logger.info("  Registered %s with %s monitoring parameters", component_id, len(monitoring_config))
         
         # Store reference for coordination
         self.maintenance_system = maintenance_system
@@ -763,6 +766,8 @@ def integrate_lubrication_with_turbine(turbine_model, lubrication_system: Turbin
                 'steam_quality': kwargs.get('steam_quality', 0.99),
                 'steam_pressure': kwargs.get('steam_pressure', 6.5)
             }
+            # Held for degradation-only updates (steady-state fast-forward)
+            turbine_model.last_lubrication_conditions = operating_conditions
             
             # PHASE 1: Collect Bearing States for Lubrication Feedback
             bearing_feedback = collect_bearing_states(turbine_model, operating_conditions)
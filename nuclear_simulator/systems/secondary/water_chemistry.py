@@ -66,6 +66,19 @@ except ImportError:
 
 warnings.filterwarnings("ignore")
 
+# Chemistry time base of the plant. Water chemistry and pH control are calibrated
+# to the default 1-minute plant step, where both read dt = 1 as one hour: each
+# plant minute advances chemistry by one hour. Plant-level callers convert with
+# chemistry_hours() and pass dt_unit='hours', so the chemistry trajectory does not
+# depend on how plant time is split into updates (every step, scheduled periods
+# or fast-forward macro steps).
+CHEMISTRY_HOURS_PER_PLANT_MINUTE = 1.0
+
+
+def chemistry_hours(dt_minutes: float) -> float:
+    """Chemistry time (hours) advanced by a plant time step (minutes)"""
+    return dt_minutes * CHEMISTRY_HOURS_PER_PLANT_MINUTE
+
 
 @dataclass
 class WaterChemistryConfig:
@@ -321,19 +334,30 @@ class WaterChemistry(ChemistryFlowProvider):
     
     def update_chemistry(self, 
                         system_conditions: Dict[str, Any],
-                        dt: float) -> Dict[str, float]:
+                        dt: float,
+                        dt_unit: Optional[str] = None) -> Dict[str, float]:
         """
         Update unified water chemistry state
         
         Args:
             system_conditions: System operating conditions
             dt: Time step (hours)
+            dt_unit: Unit of dt ('seconds', 'minutes' or 'hours'). If None the
+                unit is guessed from the magnitude of dt (legacy callers)
             
         Returns:
             Dictionary with chemistry update results
         """
-        # Convert dt to hours based on the magnitude
-        if dt > 100:
+        # Convert dt to hours (explicit unit, or based on the magnitude)
+        if dt_unit == 'hours':
+            dt_hours = dt
+        elif dt_unit == 'minutes':
+            dt_hours = dt / 60.0
+        elif dt_unit == 'seconds':
+            dt_hours = dt / 3600.0
+        elif dt_unit is not None:
+            raise ValueError(f"Invalid dt_unit '{dt_unit}'. Must be 'seconds', 'minutes' or 'hours'")
+        elif dt > 100:
             # dt is in seconds
             dt_hours = dt / 3600.0
         elif dt > 1:
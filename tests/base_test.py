@@ -155,6 +155,19 @@ class BaseTest(ABC):
         pass
 
 
+class StubProvider:
+    """State provider (auto-register style, get_state_dict) whose values are set by the test"""
+    
+    def __init__(self, **values):
+        self.values = values
+    
+    def get_state_dict(self) -> Dict[str, Any]:
+        return dict(self.values)
+    
+    def get_state_variables(self) -> Dict[str, Any]:
+        return {}
+
+
 class TestAssertions:
     """Helper class for test assertions"""
     
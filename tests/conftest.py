@@ -0,0 +1,42 @@
+"""
+Shared pytest fixtures
+
+Fixtures used across the pytest-style test modules. Helpers that are not
+tied to pytest (assertions, stub state providers) live in base_test.py.
+"""
+
+import copy
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nuclear_simulator import ComprehensiveComposer, ConstantHeatSource, NuclearPlantSimulator
+from nuclear_simulator.simulator.sim_logging import verbosity
+
+
+@pytest.fixture(scope='session')
+def plant_config():
+    """Secondary-system config of the plant-level tests (composed once per session)"""
+    with verbosity('silent'):
+        return ComprehensiveComposer().compose_action_test_scenario(
+            target_action="oil_top_off", duration_hours=1.0)
+
+
+@pytest.fixture(scope='session')
+def build_simulator(plant_config):
+    """
+    Factory for plant simulators driven by a constant 3000 MW heat source
+
+    Each simulator gets its own copy of plant_config; keyword arguments go to
+    NuclearPlantSimulator (dt defaults to 1.0). Call it inside verbosity('silent')
+    to keep construction quiet.
+    """
+    def build(**kwargs):
+        kwargs.setdefault('dt', 1.0)
+        return NuclearPlantSimulator(heat_source=ConstantHeatSource(rated_power_mw=3000.0),
+                                     secondary_config=copy.deepcopy(plant_config), **kwargs)
+    return build
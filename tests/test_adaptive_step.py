@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Adaptive Physics Step Tests
+
+Tests for error-controlled physics stepping: steps tile the output interval,
+grow while the plant is quiet and drop to the event step for control actions
+and plant events, while state history stays on the output grid.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nuclear_simulator.simulator.core.adaptive_step import AdaptiveStepConfig, AdaptiveStepController
+from nuclear_simulator.systems.primary import ControlAction
+from nuclear_simulator.simulator.sim_logging import verbosity
+
+
+def _interval(controller, output_dt, signal, events=(False,)):
+    """Advance one output interval of a linear signal; returns the steps taken"""
+    remaining, steps = output_dt, []
+    while remaining > 1e-9:
+        dt = controller.propose(remaining, output_dt)
+        signal['t'] += dt
+        controller.observe([100.0 + signal['t']], events, dt)
+        steps.append(dt)
+        remaining -= dt
+    return steps
+
+
+def test_controller_grows_when_quiet_and_cuts_on_events():
+    controller = AdaptiveStepController(AdaptiveStepConfig(min_dt=0.5, grow_after=2))
+    signal = {'t': 0.0}
+
+    first = _interval(controller, 8.0, signal)
+    assert first[0] == 0.5 and sum(first) == pytest.approx(8.0)
+    for _ in range(4):
+        steps = _interval(controller, 8.0, signal)
+    assert steps == [8.0]
+
+    # A discrete event (e.g. SCRAM) cuts the next step to min_dt
+    assert _interval(controller, 8.0, signal, events=(True,)) == [8.0]
+    steps = _interval(controller, 8.0, signal, events=(True,))
+    assert steps[0] == 0.5 and sum(steps) == pytest.approx(8.0)
+
+
+def test_plant_adaptive_steps_on_output_grid(build_simulator):
+    with verbosity('silent'):
+        simulator = build_simulator(dt=10.0, adaptive=True)
+        infos = [simulator.step()['info'] for _ in range(8)]
+        quiet_power = infos[-1]['electrical_power']
+        action_info = simulator.step(ControlAction.STOP_FEEDWATER_PUMP)['info']
+
+        # Fine fixed steps of the same (exact-lag) SG model
+        reference = build_simulator(dt=1.0)
+        reference.secondary_physics.configure_exact_lags(True)
+        for _ in range(80):
+            reference_info = reference.step()['info']
+
+    assert [info['time'] for info in infos] == pytest.approx([10.0 * (i + 1) for i in range(8)])
+    assert len(simulator.state_manager.data) == 9
+    assert infos[0]['physics_steps'] > 10   # Starts from min_dt
+    assert infos[-1]['physics_steps'] == 1  # Quiet: one step per output interval
+    assert action_info['physics_steps'] >= 10
+    assert quiet_power == pytest.approx(reference_info['electrical_power'], rel=1e-3)
+
+
+def test_exact_lags_only_in_adaptive_mode(build_simulator):
+    """Fixed-step runs keep the explicit SG lags; adaptive runs use the exact ones"""
+    with verbosity('silent'):
+        fixed = build_simulator(dt=1.0)
+        adaptive = build_simulator(dt=10.0, adaptive=True)
+
+    assert not fixed.secondary_physics.steam_generator_system.bank.exact_lags
+    assert adaptive.secondary_physics.steam_generator_system.bank.exact_lags
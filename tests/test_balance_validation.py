@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Balance Validation Policy Tests
+
+Tests for the energy and chemistry balance audit policies: interval and
+deadband scheduling, on-demand audits, the fixed-size history ring buffer,
+and the secondary system reporting its latest audit between audits.
+"""
+
+import pickle
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nuclear_simulator.simulator.sim_logging import verbosity
+from nuclear_simulator.systems.secondary import SecondaryReactorPhysics
+from nuclear_simulator.systems.secondary.balance_validation import (
+    BalanceHistory, ValidationPolicy, ValidationSchedule
+)
+from nuclear_simulator.systems.secondary.heat_flow_tracker import HeatFlowTracker
+
+PRIMARY_CONDITIONS = {}
+for _i in range(1, 4):
+    PRIMARY_CONDITIONS.update({f'sg_{_i}_inlet_temp': 327.0, f'sg_{_i}_outlet_temp': 293.0, f'sg_{_i}_flow': 5700.0})
+
+
+def _audited_updates(schedule, signatures):
+    """Indices of the updates the schedule audits"""
+    audited = []
+    for index, signature in enumerate(signatures):
+        if schedule.due(signature):
+            schedule.record(signature)
+            audited.append(index)
+    return audited
+
+
+def test_policy_from_config():
+    assert ValidationPolicy.from_config(60) == ValidationPolicy(mode='interval', interval=60)
+    assert ValidationPolicy.from_config('off').mode == 'off'
+    assert ValidationPolicy.from_config({'mode': 'deadband', 'tolerance': -0.01, 'unknown': 1}).tolerance == 0.01
+    with pytest.raises(ValueError):
+        ValidationPolicy(mode='sometimes')
+
+
+def test_schedule_modes():
+    signatures = [[100.0, 50.0]] * 10
+    assert _audited_updates(ValidationSchedule(), signatures) == list(range(10))
+    assert _audited_updates(ValidationSchedule(ValidationPolicy('off')), signatures) == []
+    assert _audited_updates(ValidationSchedule(ValidationPolicy('interval', interval=4)), signatures) == [0, 4, 8]
+
+    drifting = [[100.0 + 0.4 * i, 50.0] for i in range(10)]
+    deadband = ValidationPolicy('deadband', tolerance=0.01)
+    assert _audited_updates(ValidationSchedule(deadband), drifting) == [0, 3, 6, 9]
+    assert _audited_updates(ValidationSchedule(deadband), signatures) == [0]
+    capped = ValidationPolicy('deadband', tolerance=0.01, max_interval=5)
+    assert _audited_updates(ValidationSchedule(capped), signatures) == [0, 5]
+
+    schedule = ValidationSchedule(ValidationPolicy('off'))
+    schedule.request()
+    assert _audited_updates(schedule, signatures) == [0]
+
+
+def test_history_ring_buffer():
+    history = BalanceHistory(size=3)
+    for step in range(5):
+        history.append(float(step), {'error': step * 1.5, 'ok': step % 2 == 0, 'status': 'NORMAL'})
+
+    assert len(history) == 3 and history.columns == ('error', 'ok')
+    np.testing.assert_array_equal(history.times(), [2.0, 3.0, 4.0])
+    np.testing.assert_array_equal(history.column('error'), [3.0, 4.5, 6.0])
+    assert history.latest() == {'error': 6.0, 'ok': 1.0, 'timestamp': 4.0}
+    assert history.records()[0] == {'error': 3.0, 'ok': 1.0, 'timestamp': 2.0}
+
+
+def test_tracker_history_is_bounded():
+    tracker = HeatFlowTracker(validation_policy=ValidationPolicy(history_size=10))
+    for step in range(25):
+        tracker.update_component_flows('steam_generator', {'primary_heat_input': 3000.0 + step})
+        state, validation = tracker.update_balance(float(step))
+
+    assert len(tracker.flow_history) == 10
+    assert tracker.flow_history.latest()['sg_heat_input'] == 3024.0 == state.sg_heat_input
+    assert validation['total_input_mw'] == 3024.0
+    assert validation == tracker.validate_energy_balance()
+
+
+def test_secondary_reports_latest_audit():
+    with verbosity('silent'):
+        secondary = SecondaryReactorPhysics()
+        secondary.configure_balance_validation(energy=3, chemistry='off')
+        results = [secondary.update_system(PRIMARY_CONDITIONS, {'load_demand': 100.0 - step}, dt=1.0)
+                   for step in range(5)]
+
+    heat_tracker = secondary.heat_flow_tracker
+    assert heat_tracker.validation.audit_count == 2 and len(heat_tracker.flow_history) == 2
+    assert secondary.chemistry_flow_tracker.validation.audit_count == 0
+    balance = [result['heat_flow_energy_balance_error'] for result in results]
+    assert balance[1] == balance[2] == balance[0] and balance[4] == balance[3]
+
+    with verbosity('silent'):
+        validations = secondary.validate_balances()
+    assert validations['chemistry'] is secondary.chemistry_flow_tracker.last_validation
+    assert secondary.chemistry_flow_tracker.validation.audit_count == 1
+    assert validations['energy'] == heat_tracker.validate_energy_balance()
+
+
+def test_policies_survive_checkpoint():
+    with verbosity('silent'):
+        secondary = SecondaryReactorPhysics()
+        secondary.configure_balance_validation(energy={'mode': 'deadband', 'tolerance': 0.02})
+        secondary.update_system(PRIMARY_CONDITIONS, {'load_demand': 100.0}, dt=1.0)
+        restored = pickle.loads(pickle.dumps(secondary))
+
+    tracker = restored.heat_flow_tracker
+    assert tracker.validation.policy.mode == 'deadband'
+    assert tracker.flow_history.records() == secondary.heat_flow_tracker.flow_history.records()
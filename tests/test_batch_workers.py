@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Scenario Runner Batch Worker Tests
+
+Tests for process-pool batch execution: per-run seeding makes results
+independent of the worker count, unseeded worker runs do not repeat each
+other, results stream back through on_result and failing runs are isolated
+from the rest of the batch.
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Add project root to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nuclear_simulator import ScenarioRunner
+from nuclear_simulator.simulator.sim_logging import verbosity
+
+
+def _simulation_data(result):
+    return pd.read_csv(next(Path(result['run_directory']).glob('*simulation_data.csv')))
+
+
+def _run_batch(output_dir: Path, workers: int):
+    runner = ScenarioRunner(output_dir=str(output_dir), verbose=False, enable_plotting=False)
+    streamed = []
+    results = runner.run_batch_maintenance(
+        ['oil_top_off', 'not_an_action'], duration_hours=0.1, count_per_action=2,
+        workers=workers, seed=42, on_result=lambda result: streamed.append(result['run_name']))
+    return runner, results, streamed
+
+
+def test_parallel_batch_matches_serial_batch(tmp_path):
+    with verbosity('silent'):
+        serial_runner, serial, _ = _run_batch(tmp_path / 'serial', workers=1)
+        parallel_runner, parallel, streamed = _run_batch(tmp_path / 'parallel', workers=2)
+
+    # Unknown actions fail on their own; the other runs complete in run order
+    assert [r['run_name'].rsplit('_', 2)[0] for r in parallel] == ['oil_top_off_run1', 'oil_top_off_run2']
+    assert sorted(streamed) == [r['run_name'] for r in parallel]
+    assert len(parallel_runner.results) == len(serial_runner.results) == 2
+
+    for serial_result, parallel_result in zip(serial, parallel):
+        assert parallel_result['final_power_level'] == serial_result['final_power_level']
+        serial_data, parallel_data = (_simulation_data(r) for r in (serial_result, parallel_result))
+        pd.testing.assert_frame_equal(parallel_data, serial_data)
+
+
+def test_unseeded_worker_runs_differ(tmp_path):
+    """Forked workers inherit one RNG state; unseeded runs must still get their own streams"""
+    with verbosity('silent'):
+        runner = ScenarioRunner(output_dir=str(tmp_path), verbose=False, enable_plotting=False)
+        results = runner.run_batch_maintenance(['oil_top_off'], duration_hours=0.1, count_per_action=2, workers=2)
+
+    first, second = (_simulation_data(r).select_dtypes('number') for r in results)
+    assert not first.equals(second)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Simulator Checkpoint Tests
+
+Tests for binary checkpoint save/restore of the full plant state: forked
+simulators continue exactly like the original and are independent of it.
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add project root to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nuclear_simulator import NuclearPlantSimulator
+from nuclear_simulator.simulator.sim_logging import verbosity
+
+
+@pytest.fixture(scope='module')
+def warmed_simulator(build_simulator):
+    with verbosity('silent'):
+        simulator = build_simulator()
+        for _ in range(30):
+            simulator.step()
+    return simulator
+
+
+def test_restored_simulator_continues_identically(warmed_simulator, tmp_path):
+    """A fork from a checkpoint reproduces the original trajectory"""
+    with verbosity('silent'):
+        checkpoint = warmed_simulator.save_checkpoint(tmp_path / 'plant.ckpt')
+        assert (tmp_path / 'plant.ckpt').read_bytes() == checkpoint
+        original_results = [warmed_simulator.step()['info']['thermal_power'] for _ in range(20)]
+
+        # Restoring the checkpoint also rewinds the global RNGs used by noise models
+        fork = NuclearPlantSimulator.from_checkpoint(tmp_path / 'plant.ckpt')
+        fork_results = [fork.step()['info']['thermal_power'] for _ in range(20)]
+
+    assert fork_results == original_results
+    assert fork.state_manager.current_datetime == warmed_simulator.state_manager.current_datetime
+    pd.testing.assert_frame_equal(fork.state_manager.data, warmed_simulator.state_manager.data)
+
+
+def test_load_checkpoint_rewinds_and_rejects_foreign_payloads(warmed_simulator):
+    with verbosity('silent'):
+        checkpoint = warmed_simulator.save_checkpoint()
+        saved_time = warmed_simulator.state_manager.current_datetime
+        primary = warmed_simulator.primary_physics
+        for _ in range(5):
+            warmed_simulator.step()
+
+        warmed_simulator.load_checkpoint(checkpoint)
+
+    assert warmed_simulator.state_manager.current_datetime == saved_time
+    assert warmed_simulator.primary_physics is not primary
+    with pytest.raises(ValueError):
+        warmed_simulator.load_checkpoint(b'\x80\x05N.')
+
+
+def test_forks_of_a_spilling_checkpoint_do_not_share_the_spill_dataset(build_simulator, tmp_path):
+    """Two forks of one spilling checkpoint leave the original dataset intact"""
+    with verbosity('silent'):
+        simulator = build_simulator()
+        simulator.state_manager.enable_spill(str(tmp_path / 'original'), rows_per_chunk=5,
+                                             file_format='pickle')
+        for _ in range(12):
+            simulator.step()
+        checkpoint = simulator.save_checkpoint()
+        original_files = sorted(p.name for p in (tmp_path / 'original').iterdir())
+
+        forks = [NuclearPlantSimulator.from_checkpoint(checkpoint) for _ in range(2)]
+        for fork in forks:
+            assert fork.state_manager._spill is None
+            with pytest.raises(FileExistsError):
+                fork.state_manager.enable_spill(str(tmp_path / 'original'), rows_per_chunk=5,
+                                                file_format='pickle')
+        for i, fork in enumerate(forks):
+            fork.state_manager.enable_spill(str(tmp_path / f'fork{i}'), rows_per_chunk=5,
+                                            file_format='pickle')
+            for _ in range(12):
+                fork.step()
+            fork.state_manager.clear_data()
+
+    assert sorted(p.name for p in (tmp_path / 'original').iterdir()) == original_files
+    assert len(simulator.state_manager.data) == 12
+    assert all(len(fork.state_manager.data) == 0 for fork in forks)
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Equilibrium Cache Tests
+
+Tests for the steady-state solution cache: config hash stability, isolation
+of cached copies, the LRU bound, sharing through the backing file (including
+concurrent writers), and reuse of the secondary equilibrium solve.
+"""
+
+import multiprocessing
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nuclear_simulator.simulator.sim_logging import verbosity
+
+# The plant systems import the cache as simulator.core.*: use the same module
+from simulator.core import equilibrium_cache
+from simulator.core.equilibrium_cache import EquilibriumCache, cached_config_hash, stable_config_hash
+from systems.primary.reactor.reactivity_model import ReactorConfig, create_equilibrium_state
+
+
+@pytest.fixture
+def fresh_cache(tmp_path):
+    """Process-wide cache backed by a temporary file, restored afterwards"""
+    previous = equilibrium_cache.get_equilibrium_cache()
+    cache = equilibrium_cache.configure_equilibrium_cache(tmp_path / 'equilibrium.pkl')
+    yield cache
+    equilibrium_cache._default_cache = previous
+
+
+def test_config_hash_is_stable():
+    """Equal configs hash equally regardless of identity or dict order"""
+    assert stable_config_hash(ReactorConfig()) == stable_config_hash(ReactorConfig())
+    assert stable_config_hash({'a': 1.0, 'b': [1, 2]}) == stable_config_hash({'b': [1, 2], 'a': 1.0})
+    assert stable_config_hash(np.arange(3.0)) == stable_config_hash(np.arange(3.0))
+
+    changed = ReactorConfig(boron_worth=-9.0)
+    assert stable_config_hash(changed) != stable_config_hash(ReactorConfig())
+    assert stable_config_hash(1.0) != stable_config_hash(1)
+
+
+def test_cached_config_hash_matches_stable_hash():
+    config = ReactorConfig(boron_worth=-9.0)
+    assert cached_config_hash(config) == stable_config_hash(config)
+    assert cached_config_hash(ReactorConfig(boron_worth=-9.0)) == stable_config_hash(config)
+    assert cached_config_hash(ReactorConfig()) == stable_config_hash(ReactorConfig())
+
+
+def test_cached_values_are_independent_copies():
+    cache = EquilibriumCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {'levels': [12.5, 12.5], 'flow': 1665.0}
+
+    first = cache.get_or_compute('secondary', 3000.0, 'abc', compute)
+    first['levels'][0] = 0.0
+    second = cache.get_or_compute('secondary', 3000.0 + 1e-9, 'abc', compute)
+
+    assert len(calls) == 1
+    assert second == {'levels': [12.5, 12.5], 'flow': 1665.0}
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.get('secondary', 2000.0, 'abc') is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = EquilibriumCache(tmp_path / 'bounded.pkl', max_entries=2)
+    cache.put('secondary', 1000.0, 'abc', 1)
+    cache.put('secondary', 2000.0, 'abc', 2)
+    assert cache.get('secondary', 1000.0, 'abc') == 1
+    cache.put('secondary', 3000.0, 'abc', 3)
+
+    assert len(cache) == 2
+    assert cache.get('secondary', 2000.0, 'abc') is None
+    assert cache.get('secondary', 1000.0, 'abc') == 1
+    assert len(EquilibriumCache(tmp_path / 'bounded.pkl', max_entries=2)) == 2
+
+
+def test_backing_file_is_shared(tmp_path):
+    """A second cache on the same file (another worker) reuses the solve"""
+    path = tmp_path / 'shared.pkl'
+    writer = EquilibriumCache(path)
+    reader = EquilibriumCache(path)
+    writer.put('primary', 100.0, 'abc', {'boron': 1200.0})
+    writer.put('primary', 50.0, 'abc', {'boron': 1400.0})
+
+    value = reader.get_or_compute('primary', 50.0, 'abc', lambda: pytest.fail('solved again'))
+
+    assert value == {'boron': 1400.0}
+    assert len(EquilibriumCache(path)) == 2
+
+
+def _put_entries(path, worker):
+    cache = EquilibriumCache(path)
+    for i in range(20):
+        cache.put('primary', float(i), f'worker-{worker}', {'boron': float(i)})
+
+
+@pytest.mark.skipif(equilibrium_cache.fcntl is None, reason="file locking needs fcntl")
+def test_concurrent_writers_keep_every_entry(tmp_path):
+    """Workers merging into the same file do not overwrite each other's entries"""
+    path = tmp_path / 'shared.pkl'
+    context = multiprocessing.get_context('fork')
+    workers = [context.Process(target=_put_entries, args=(path, worker)) for worker in range(4)]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join()
+
+    assert [process.exitcode for process in workers] == [0] * 4
+    assert len(EquilibriumCache(path)) == 80
+
+
+def test_secondary_equilibrium_is_reused(fresh_cache, build_simulator):
+    """Cached and freshly solved operating points agree; the live plant is not stepped"""
+    with verbosity('silent'):
+        simulator = build_simulator()
+        secondary = simulator.secondary_physics
+        steam_generators = secondary.steam_generator_system.steam_generators
+        before = [(sg.secondary_pressure, sg.steam_quality, sg.water_level) for sg in steam_generators]
+
+        solved = secondary._solve_equilibrium_point(3000.0)
+        first = secondary._calculate_equilibrium_point(3000.0)
+        second = secondary._calculate_equilibrium_point(3000.0)
+
+    assert (fresh_cache.hits, fresh_cache.misses) == (1, 1)
+    assert first == second
+    assert first['steam_flow'] == pytest.approx(solved['steam_flow'])
+    assert first['steam_pressure'] == pytest.approx(solved['steam_pressure'])
+    assert [(sg.secondary_pressure, sg.steam_quality, sg.water_level) for sg in steam_generators] == before
+
+
+def test_primary_equilibrium_is_solved_for_its_config(fresh_cache):
+    """The closed-form primary solve bypasses the cache and honours a non-default config"""
+    default = create_equilibrium_state(power_level=100.0)
+    changed = create_equilibrium_state(power_level=100.0, config=ReactorConfig(control_rod_worth=4000.0))
+
+    assert len(fresh_cache) == 0
+    assert changed.boron_concentration != default.boron_concentration
+
+
+def test_secondary_equilibrium_keeps_steam_generator_fouling(fresh_cache, build_simulator):
+    """The solve steps the steam generators as configured; their fouling is part of the key"""
+    with verbosity('silent'):
+        simulator = build_simulator()
+        secondary = simulator.secondary_physics
+        clean = secondary._calculate_equilibrium_point(3000.0)
+
+        for sg in secondary.steam_generator_system.steam_generators:
+            sg.tube_interior_fouling.scale_thickness = 0.5
+            sg.tube_interior_fouling.scale_thermal_resistance = sg.tube_interior_fouling.calculate_thermal_resistance()
+        fouled = secondary._calculate_equilibrium_point(3000.0)
+        solved = secondary._solve_equilibrium_point(3000.0)
+
+    assert (fresh_cache.hits, fresh_cache.misses) == (0, 2)
+    assert fouled == solved
+    assert fouled != clean
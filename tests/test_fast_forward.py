@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Steady-State Fast-Forward Tests
+
+Tests for fast-forwarding through quasi-steady operation: steady-state
+detection, threshold look-ahead, and degradation tracking full physics while
+macro steps are taken.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nuclear_simulator.simulator.core.fast_forward import FastForwardConfig, SteadyStateDetector
+from nuclear_simulator.simulator.state.threshold_plan import ThresholdPlan
+from nuclear_simulator.simulator.sim_logging import verbosity
+from nuclear_simulator.systems.secondary.water_chemistry import chemistry_hours
+
+
+def test_steady_state_detector():
+    detector = SteadyStateDetector(window=3, tolerance=1e-3)
+    for value in [100.0, 100.01, 100.02]:
+        assert not detector.is_steady()
+        detector.observe([value, 5.0])
+    assert detector.is_steady()
+
+    detector.observe([101.0, 5.0])  # 1% load change
+    assert not detector.is_steady()
+    detector.reset()
+    assert not detector.is_steady()
+
+
+def test_minutes_to_violation():
+    plan = ThresholdPlan({'FWP-1': {
+        'impeller_wear': {'threshold': 5.0, 'comparison': 'greater_than'},
+        'oil_level': {'threshold': 60.0, 'comparison': 'less_than'},
+        'vibration_level': {'threshold': 3.0, 'comparison': 'equals'},
+    }})
+    previous = np.array([1.0, 90.0, 0.0])
+    current = np.array([2.0, 89.0, 1.0])
+
+    # Wear reaches 5.0 in 3 more minutes; with wear steady, oil reaches 60 in 29
+    assert plan.minutes_to_violation(0.0, previous, current, 1.0) == pytest.approx(3.0)
+    assert plan.minutes_to_violation(0.0, np.array([2.0, 90.0, 0.0]), current, 1.0) == pytest.approx(29.0)
+    assert plan.minutes_to_violation(0.0, current, previous, 1.0) == np.inf  # Moving away
+    assert plan.minutes_to_violation(0.0, current, np.array([6.0, 89.0, 1.0]), 1.0) == 0.0
+
+    plan.last_violation[:] = 0.0  # All thresholds in cooldown
+    assert plan.minutes_to_violation(1.0, previous, current, 1.0) == np.inf
+
+
+def test_fast_forward_tracks_full_physics_degradation(build_simulator):
+    with verbosity('silent'):
+        full = build_simulator(dt=1.0)
+        for _ in range(6 * 60):
+            full.step()
+
+        fast = build_simulator(dt=1.0, fast_forward_config=FastForwardConfig(macro_dt=30.0))
+        summary = fast.fast_forward(6 * 60.0)
+
+    assert summary['time'] == pytest.approx(360.0)
+    assert summary['fast_forward_steps'] > 0
+    assert summary['physics_steps'] + summary['fast_forward_minutes'] == pytest.approx(360.0)
+
+    full_pump = full.secondary_physics.feedwater_system.pump_system.pumps['FWP-2']
+    fast_pump = fast.secondary_physics.feedwater_system.pump_system.pumps['FWP-2']
+    assert fast_pump.state.bearing_wear == pytest.approx(full_pump.state.bearing_wear, rel=0.02)
+    assert fast_pump.state.oil_level == pytest.approx(full_pump.state.oil_level, rel=0.01)
+    assert fast.secondary_physics.condenser.operating_hours == pytest.approx(
+        full.secondary_physics.condenser.operating_hours)
+
+
+def test_fast_forward_chemistry_time_matches_full_physics(build_simulator):
+    """Macro steps advance chemistry on the time base of full physics"""
+    with verbosity('silent'):
+        full = build_simulator(dt=1.0)
+        for _ in range(6 * 60):
+            full.step()
+
+        fast = build_simulator(dt=1.0, fast_forward_config=FastForwardConfig(macro_dt=240.0))
+        summary = fast.fast_forward(6 * 60.0)
+
+    assert summary['fast_forward_minutes'] >= 240.0
+    full_controller = full.secondary_physics.ph_control_system.controller
+    fast_controller = fast.secondary_physics.ph_control_system.controller
+    assert full_controller.state.operating_hours == pytest.approx(chemistry_hours(6 * 60.0))
+    assert fast_controller.state.operating_hours == pytest.approx(full_controller.state.operating_hours, rel=0.01)
+    # Water chemistry is also advanced by the feedwater water-quality update
+    full_chemistry = full.secondary_physics.water_chemistry
+    fast_chemistry = fast.secondary_physics.water_chemistry
+    assert full_chemistry.operating_hours == pytest.approx(2 * chemistry_hours(6 * 60.0))
+    assert fast_chemistry.operating_hours == pytest.approx(full_chemistry.operating_hours, rel=0.01)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Feedwater Pump Bank Tests
+
+Tests for the array-backed feedwater pump bank: agreement of the bank update
+with independently updated pumps, per-pump views writing through to the bank
+arrays, the vectorized physics against the per-pump reporting helpers, and
+checkpoint round trips.
+"""
+
+import copy
+import pickle
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nuclear_simulator.simulator.sim_logging import verbosity
+from nuclear_simulator.systems.secondary.feedwater.pump_bank import FeedwaterPumpBank
+from nuclear_simulator.systems.secondary.feedwater.pump_system import (
+    FeedwaterPumpSystem, FeedwaterPumpSystemConfig, PumpStatus
+)
+
+
+def _conditions(step):
+    """Varying feedwater conditions, a spare pump start and a pump stop"""
+    system_conditions = {
+        'feedwater_temperature': 227.0 + 10.0 * np.sin(step / 8.0),
+        'suction_pressure': 0.5 + 0.1 * np.cos(step / 5.0),
+        'discharge_pressure': 8.0,
+        'sg_levels': [12.5, 12.6, 12.4],
+    }
+    control_inputs = {'flow_demand': 1665.0 * (1.0 + 0.1 * np.sin(step / 6.0))}
+    if step == 5:
+        control_inputs['FWP-4_start'] = True
+    if step == 25:
+        control_inputs['FWP-2_stop'] = True
+    return system_conditions, control_inputs
+
+
+@pytest.fixture
+def system():
+    with verbosity('silent'):
+        yield FeedwaterPumpSystem(FeedwaterPumpSystemConfig())
+
+
+def test_bank_matches_standalone_pumps(system):
+    """One bank update equals updating each pump on its own"""
+    standalone = copy.deepcopy(system.pumps)
+    for pump in standalone.values():
+        FeedwaterPumpBank([pump])
+
+    with verbosity('silent'):
+        for step in range(40):
+            system_conditions, control_inputs = _conditions(step)
+            demands = len(system.running_pumps)
+            running = [pump for pump in standalone.values() if pump.state.status == PumpStatus.RUNNING]
+            for pump in running[:demands]:
+                pump.set_flow_demand(control_inputs['flow_demand'] / demands)
+
+            result = system.update_system(1.0, system_conditions, control_inputs)
+            expected = {pump_id: pump.update_pump(1.0, system_conditions, control_inputs)
+                        for pump_id, pump in standalone.items()}
+            assert result['pump_details'] == expected
+
+    assert result['total_flow_rate'] == pytest.approx(
+        sum(pump.state.flow_rate for pump in standalone.values()
+            if pump.state.status == PumpStatus.RUNNING))
+    assert [pump.get_state_dict() for pump in system.pumps.values()] == \
+        [pump.get_state_dict() for pump in standalone.values()]
+
+
+def test_pumps_are_views_of_the_bank(system):
+    bank = system.bank
+    pump = system.pumps['FWP-2']
+    assert all(member._bank is bank and member.state._bank is bank for member in system.pumps.values())
+
+    pump.state.cavitation_damage = 3.0
+    pump.state.status = PumpStatus.STOPPING
+    bank.speed_percent[1] = 42.0
+
+    assert bank.cavitation_damage[1] == 3.0
+    assert bank.status_mask(PumpStatus.STOPPING)[:2].tolist() == [False, True]
+    assert pump.state.speed_percent == 42.0
+    assert pump.get_state_dict()['cavitation_damage'] == 3.0
+    assert system.pumps['FWP-1'].state.cavitation_damage != 3.0
+
+
+def test_physics_matches_reporting_helpers(system):
+    """The vectorized NPSH and power calculations agree with the per-pump helpers"""
+    for i, pump in enumerate(system.pumps.values()):
+        pump.lubrication_system.component_wear['impeller'] = 5.0 * i
+        pump.lubrication_system.component_wear['pump_bearings'] = 3.0 * i
+        pump.state.cavitation_damage = 0.5 * i
+        pump.state.speed_percent = 95.0 + 5.0 * i
+        pump.state.flow_rate = 500.0 + 80.0 * i
+    bank = system.bank
+    lubrication = bank.gather_lubrication(bank.members)
+    npsh = bank.npsh_required(bank.speed_percent, bank.flow_rate / bank.cfg_rated_flow,
+                              bank.cavitation_damage, lubrication)
+
+    for i, pump in enumerate(system.pumps.values()):
+        assert pump._calculate_dynamic_npsh_required() == pytest.approx(npsh['required'][i], rel=1e-15)
+
+    with verbosity('silent'):
+        system.update_system(1.0, _conditions(0)[0], {'flow_demand': 1665.0})
+    powers = bank.power_consumption.tolist()
+    for i, pump in enumerate(system.pumps.values()):
+        pump._calculate_power_consumption()
+        assert pump.state.power_consumption == pytest.approx(powers[i], rel=1e-15)
+
+
+def test_checkpoint_round_trip(system):
+    """A pickled system keeps its pumps attached to its own copy of the bank"""
+    system_conditions, control_inputs = _conditions(0)
+    with verbosity('silent'):
+        system.update_system(1.0, system_conditions, control_inputs)
+        restored = pickle.loads(pickle.dumps(system))
+
+        assert restored.bank is not system.bank
+        assert all(pump._bank is restored.bank for pump in restored.pumps.values())
+        assert [pump.state.flow_rate for pump in restored.pumps.values()] == system.bank.flow_rate.tolist()
+
+        original = system.update_system(1.0, system_conditions, control_inputs)
+        resumed = restored.update_system(1.0, system_conditions, control_inputs)
+
+    assert resumed['pump_details'] == original['pump_details']
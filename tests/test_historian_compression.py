@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Historian Compression Tests
+
+Tests for exception-deviation and swinging-door compression of PI tag data:
+reconstruction error bounds, compression ratios, online use through
+StateManager collection subscribers, and PITagConfig-driven export.
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from data.historian_compression import CompressionBank, CompressionSpec, compress_frame
+from data.pi_data_formatter import PIDataFormatter, PITagConfig
+from nuclear_simulator.simulator.state.state_manager import StateManager
+from tests.base_test import StubProvider
+
+T0 = datetime(2025, 1, 1)
+
+
+def _frame(steps: int = 600) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    i = np.arange(steps)
+    return pd.DataFrame({
+        'time': [T0 + timedelta(minutes=int(k)) for k in i],
+        'ramp': 0.05 * i + rng.normal(0.0, 0.01, steps),
+        'constant': np.full(steps, 3.0),
+        'step': np.where(i < steps // 2, 10.0, 20.0),
+        'wave': np.sin(i / 30.0),
+    })
+
+
+def test_reconstruction_error_is_bounded():
+    data = _frame()
+    specs = {
+        'ramp': CompressionSpec(exception_deviation=0.02, compression_deviation=0.05),
+        'wave': CompressionSpec(exception_deviation=0.005, compression_deviation=0.01),
+        'step': CompressionSpec(exception_deviation=0.1, compression_deviation=0.1),
+    }
+    bank = compress_frame(data, specs)
+
+    for tag, spec in specs.items():
+        reconstructed = bank.reconstruct(tag, data['time'])
+        assert np.max(np.abs(reconstructed - data[tag].to_numpy())) <= spec.error_bound + 1e-12
+
+    report = bank.compression_report().set_index('tag')
+    assert (report['raw_points'] == len(data)).all()
+    assert report.loc['ramp', 'compression_ratio'] > 10
+    assert report.loc['step', 'archived_points'] <= 4
+
+
+def test_reconstruction_error_is_bounded_for_noisy_tags():
+    """Random walks and white noise stay within the error bound"""
+    rng = np.random.default_rng(11)
+    steps = 2000
+    data = pd.DataFrame({
+        'time': [T0 + timedelta(minutes=k) for k in range(steps)],
+        'walk': np.cumsum(rng.normal(0.0, 0.5, steps)),
+        'noise': rng.normal(0.0, 1.0, steps),
+        'walk_deadband': np.cumsum(rng.normal(0.0, 0.5, steps)),
+    })
+    specs = {
+        'walk': CompressionSpec(exception_deviation=0.0, compression_deviation=1.0),
+        'noise': CompressionSpec(exception_deviation=0.0, compression_deviation=0.5),
+        'walk_deadband': CompressionSpec(exception_deviation=0.2, compression_deviation=0.5),
+    }
+    bank = compress_frame(data, specs)
+
+    for tag, spec in specs.items():
+        reconstructed = bank.reconstruct(tag, data['time'])
+        assert np.max(np.abs(reconstructed - data[tag].to_numpy())) <= spec.error_bound + 1e-12, tag
+
+    bank = CompressionBank({'x': CompressionSpec(compression_deviation=1.0)})
+    for t, value in [(0.0, 0.0), (1.0, -0.9), (2.0, 1.0)]:
+        bank.update(t, [value])
+    bank.finish()
+    assert bank.archive('x')[1].tolist() == [0.0, -0.9, 1.0]
+
+
+def test_constant_tag_keeps_endpoints_only():
+    data = _frame()
+    bank = compress_frame(data, {'constant': CompressionSpec(compression_max_seconds=1e9,
+                                                             exception_max_seconds=1e9)})
+    seconds, values = bank.archive('constant')
+    assert len(seconds) == 2
+    assert values.tolist() == [3.0, 3.0]
+
+
+def test_max_times_force_archive_points():
+    data = _frame()
+    bank = compress_frame(data, {'constant': CompressionSpec(exception_max_seconds=600.0,
+                                                             compression_max_seconds=3600.0)})
+    seconds, _ = bank.archive('constant')
+    assert np.all(np.diff(seconds) <= 3600.0)
+    assert len(seconds) >= len(data) * 60 / 3600
+
+
+def test_online_compression_matches_offline():
+    data = _frame(200)
+    specs = {'plant.sensor.ramp': CompressionSpec(0.02, 0.05),
+             'plant.sensor.wave': CompressionSpec(0.005, 0.01)}
+
+    manager = StateManager(max_rows=1000)
+    sensor = StubProvider()
+    manager.register_provider(sensor, 'plant.sensor')
+    online = CompressionBank(specs)
+    manager.subscribe_to_collections(online.observe)
+    for _, row in data.iterrows():
+        sensor.values = {'ramp': row['ramp'], 'wave': row['wave']}
+        manager.collect_states(row['time'].to_pydatetime())
+    online.finish()
+
+    offline = compress_frame(manager.data, specs)
+    for tag in specs:
+        np.testing.assert_array_equal(online.archive(tag)[0], offline.archive(tag)[0])
+        np.testing.assert_array_equal(online.archive(tag)[1], offline.archive(tag)[1])
+
+
+def test_tag_config_drives_pi_export():
+    config = PITagConfig("NPP_TEST", "Test", "MW", low_limit=0, high_limit=1000)
+    spec = config.compression_spec()
+    assert spec.exception_deviation == 1.0
+    assert spec.compression_deviation == 2.0
+    assert PITagConfig("NPP_OFF", "Off", "MW", compressing=False).compression_spec() is None
+    assert PITagConfig("NPP_ST", "Status", "", data_type="String").compression_spec() is None
+
+    formatter = PIDataFormatter(plant_code="NPP")
+    data = pd.DataFrame({
+        'time': [T0 + timedelta(minutes=k) for k in range(120)],
+        'primary.reactor.thermal_power_mw': np.linspace(3000.0, 3010.0, 120),
+    })
+    full = formatter.convert_to_pi_format(data)
+    compressed = formatter.convert_to_pi_format(data, compress=True)
+    assert len(full) == 120
+    assert 2 <= len(compressed) < 10
+
+    report = formatter.compression_report(formatter.compress_data(data))
+    assert report['TagName'].tolist() == ['NPP_RX_PWR_THRM']
+    assert report['CompressionRatio'].iloc[0] == 120 / report['ArchivedPoints'].iloc[0]
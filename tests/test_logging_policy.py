@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+State Logging Policy Tests
+
+Tests for per-category/per-variable logging policies on StateManager:
+decimation, deadband, windowed aggregation (including the partial window at
+the end of a run), per-channel cadence of merged frames, YAML configuration
+and spilling.
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nuclear_simulator.simulator.state.state_manager import StateManager
+from nuclear_simulator.simulator.state.logging_policy import LoggingPolicy, match_policy
+from tests.base_test import StubProvider
+
+T0 = datetime(2025, 1, 1)
+
+
+def _manager(**kwargs) -> StateManager:
+    manager = StateManager(max_rows=1000, **kwargs)
+    manager.fast = StubProvider(flux=0.0)
+    manager.slow = StubProvider(deposit=0.0, status='ok')
+    manager.register_provider(manager.fast, 'primary.core')
+    manager.register_provider(manager.slow, 'secondary.steam_generator_SG-1')
+    return manager
+
+
+def _run(manager: StateManager, steps: int, slow_step: float = 0.001) -> None:
+    for i in range(steps):
+        manager.fast.values['flux'] = float(i)
+        manager.slow.values['deposit'] = i * slow_step
+        manager.collect_states(T0 + timedelta(minutes=i))
+
+
+def test_match_policy_prefers_most_specific_pattern():
+    patterns = ['secondary', 'secondary.steam_generator', '*.tsp_deposit']
+    assert match_policy('secondary.steam_generator_SG-1.level', patterns) == 'secondary.steam_generator'
+    assert match_policy('secondary.steam_generator_SG-1.tsp_deposit', patterns) == 'secondary.steam_generator'
+    assert match_policy('secondary.condenser.tsp_deposit', patterns) == '*.tsp_deposit'
+    assert match_policy('secondary.condenser.level', patterns) == 'secondary'
+    assert match_policy('primary.core.flux', patterns) is None
+
+
+def test_decimation_records_every_nth_row_at_its_own_cadence():
+    manager = _manager()
+    manager.set_logging_policy('secondary.steam_generator', {'mode': 'decimate', 'interval': 10})
+    _run(manager, 30)
+
+    info = manager.get_data_info()
+    assert info['logging_channels'] == {'secondary.steam_generator': 3}
+
+    slow = manager.get_variable_history('secondary.steam_generator_SG-1.deposit')
+    assert slow.tolist() == [0.0, 0.01, 0.02]
+
+    frame = manager.data
+    assert len(frame) == 30
+    assert frame['primary.core.flux'].tolist() == [float(i) for i in range(30)]
+    # Decimated variables are not filled in between their records
+    deposit = frame['secondary.steam_generator_SG-1.deposit']
+    assert deposit.notna().tolist() == [i % 10 == 0 for i in range(30)]
+    assert deposit.iloc[10] == 0.01
+    assert frame['secondary.steam_generator_SG-1.status'].iloc[20] == 'ok'
+    assert frame['secondary.steam_generator_SG-1.status'].iloc[15:20].isna().all()
+
+    # Threshold checks and current values still see every collection
+    assert manager.get_current_value('secondary.steam_generator_SG-1', 'deposit') == 0.029
+
+
+def test_deadband_records_only_significant_changes():
+    manager = _manager()
+    manager.set_logging_policy('*.deposit', LoggingPolicy(mode='deadband', deadband=0.0045))
+    _run(manager, 20)
+
+    deposit = manager.get_variable_history('secondary.steam_generator_SG-1.deposit')
+    assert np.allclose(deposit.tolist(), [0.0, 0.005, 0.010, 0.015])
+
+
+def test_aggregate_window_statistics():
+    manager = _manager()
+    manager.set_logging_policy('primary.core', {'mode': 'aggregate', 'interval': 5})
+    _run(manager, 10)
+
+    frame = manager.get_time_series(['primary.core.flux', 'primary.core.flux_min',
+                                     'primary.core.flux_max'])
+    assert frame['primary.core.flux'].tolist() == [2.0, 7.0]
+    assert frame['primary.core.flux_min'].tolist() == [0.0, 5.0]
+    assert frame['primary.core.flux_max'].tolist() == [4.0, 9.0]
+    assert list(frame['time']) == [T0 + timedelta(minutes=4), T0 + timedelta(minutes=9)]
+
+
+def test_partial_aggregate_window_is_flushed_on_export(tmp_path):
+    """Collections after the last complete window are exported, not dropped"""
+    manager = _manager()
+    manager.set_logging_policy('primary.core', {'mode': 'aggregate', 'interval': 5})
+    _run(manager, 12)
+    manager.export_to_csv(str(tmp_path / 'run.csv'))
+
+    frame = manager.get_time_series(['primary.core.flux', 'primary.core.flux_max'])
+    assert frame['primary.core.flux'].tolist() == [2.0, 7.0, 10.5]
+    assert frame['primary.core.flux_max'].tolist() == [4.0, 9.0, 11.0]
+    assert frame['time'].iloc[-1] == T0 + timedelta(minutes=11)
+
+    # Nothing pending: a second export adds no row
+    manager.export_to_csv(str(tmp_path / 'again.csv'))
+    assert manager.get_data_info()['logging_channels'] == {'primary.core': 3}
+
+
+def test_merged_export_leaves_deadband_gaps_empty(tmp_path):
+    manager = _manager()
+    manager.set_logging_policy('*.deposit', LoggingPolicy(mode='deadband', deadband=0.0045))
+    _run(manager, 12)
+    manager.export_to_csv(str(tmp_path / 'run.csv'))
+
+    exported = pd.read_csv(tmp_path / 'run.csv')
+    assert len(exported) == 12
+    assert exported['secondary.steam_generator_SG-1.deposit'].notna().sum() == 3
+
+
+def test_policies_load_from_maintenance_yaml(tmp_path):
+    config = tmp_path / 'plant.yaml'
+    config.write_text(
+        "maintenance_system:\n"
+        "  component_configs: {}\n"
+        "state_logging:\n"
+        "  policies:\n"
+        "    secondary.steam_generator:\n"
+        "      mode: decimate\n"
+        "      interval: 4\n"
+        "    primary.core: 2\n"
+    )
+    manager = _manager()
+    manager.load_maintenance_config(str(config))
+
+    assert manager.logging_policies['secondary.steam_generator'].interval == 4
+    assert manager.logging_policies['primary.core'] == LoggingPolicy(mode='decimate', interval=2)
+    _run(manager, 8)
+    assert manager.get_data_info()['logging_channels'] == {
+        'secondary.steam_generator': 2, 'primary.core': 4}
+
+
+def test_policy_channels_spill_to_subdirectories(tmp_path):
+    manager = _manager(spill_dir=str(tmp_path), spill_rows=4, spill_format='pickle')
+    manager.set_logging_policy('secondary.steam_generator', 3)
+    _run(manager, 30)
+
+    assert list((tmp_path / 'policy-secondary.steam_generator').glob('part-*.pkl'))
+    deposit = manager.get_variable_history('secondary.steam_generator_SG-1.deposit')
+    assert np.allclose(deposit.tolist(), [i * 0.001 for i in range(0, 30, 3)])
+    assert len(manager.data) == 30
+
+    manager.clear_data()
+    assert not list(tmp_path.rglob('part-*'))
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Multi-Rate Scheduler Tests
+
+Tests for subsystem scheduling: slow models accumulate dt and update once per
+period, fast loops sub-cycle, and the plant runs unchanged while scheduling is
+disabled.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nuclear_simulator.simulator.core.scheduler import MultiRateScheduler
+from nuclear_simulator.simulator.sim_logging import verbosity
+from nuclear_simulator.systems.secondary import SecondaryReactorPhysics
+from nuclear_simulator.systems.secondary.water_chemistry import chemistry_hours
+
+
+class _Model:
+    def __init__(self):
+        self.calls = []
+
+    def update(self, dt_hours):
+        self.calls.append(dt_hours)
+        return len(self.calls)
+
+
+def test_slow_subsystem_accumulates_dt():
+    model = _Model()
+    scheduler = MultiRateScheduler(enabled=True)
+    scheduler.add('fouling', model, 'update', dt_unit='hours', dt_arg='dt_hours', period=60.0)
+
+    results = [scheduler.run('fouling', 15.0) for _ in range(9)]
+
+    # First step updates immediately, then once per accumulated hour; results are held between
+    assert model.calls == [0.25, 1.0, 1.0]
+    assert results == [1, 1, 1, 1, 2, 2, 2, 2, 3]
+
+
+def test_fast_subsystem_sub_cycles_and_disabled_runs_every_step():
+    model = _Model()
+    scheduler = MultiRateScheduler(enabled=True)
+    scheduler.add('kinetics', model, 'update', dt_unit='hours', dt_arg='dt_hours', max_substep=1.0)
+
+    scheduler.run('kinetics', 3.0)
+    assert model.calls == pytest.approx([1 / 60] * 3)
+    assert scheduler.steps('kinetics', 2.5) == pytest.approx([2.5 / 3] * 3)
+
+    scheduler.configure(enabled=False)
+    assert scheduler.steps('kinetics', 3.0) == [3.0]
+    with pytest.raises(ValueError):
+        scheduler.add('bad', model, 'update', dt_unit='days')
+
+
+@pytest.mark.parametrize('period', [60.0, 240.0])
+def test_chemistry_advances_on_the_plant_time_base(period):
+    """Chemistry and pH control advance by the aggregated period, whatever its length"""
+    with verbosity('silent'):
+        secondary = SecondaryReactorPhysics()
+        secondary.configure_scheduling(enabled=True, periods={'chemistry': period})
+        chemistry = secondary.water_chemistry
+        controller = secondary.ph_control_system.controller
+        start = (chemistry.operating_hours, controller.state.operating_hours)
+        conditions = {'blowdown_rate': 0.02, 'temperature': 40.0, 'pressure': 6.9}
+        for _ in range(1 + int(period / 5.0)):
+            secondary.scheduler.run('chemistry', 5.0, system_conditions=conditions)
+
+    # First update at 5 minutes, then one update with the whole period
+    assert secondary.scheduler.get_update_counts()['chemistry'] == 2
+    expected_hours = chemistry_hours(5.0 + period)
+    assert chemistry.operating_hours - start[0] == pytest.approx(expected_hours)
+    assert controller.state.operating_hours - start[1] == pytest.approx(expected_hours)
+
+
+def test_plant_multirate_schedule(build_simulator):
+    with verbosity('silent'):
+        simulator = build_simulator(dt=5.0, multirate=True, subsystem_periods={'chemistry': 30.0})
+        for _ in range(12):
+            simulator.step()
+
+    assert simulator.scheduler.get_update_counts()['physics'] == 60  # 1-minute sub-steps
+    secondary_counts = simulator.secondary_physics.scheduler.get_update_counts()
+    assert secondary_counts['turbine'] == 60
+    assert secondary_counts['chemistry'] == 2  # Minutes 1 and 31, held in between
+    sg = simulator.secondary_physics.steam_generator_system.steam_generators[0]
+    assert sg.scheduler.get_update_counts()['tsp_fouling'] == 1  # Hourly
+    assert len(simulator.state_manager.data) == 12
+
+
+@pytest.mark.parametrize('multirate', [False, True])
+def test_chemistry_time_base_does_not_depend_on_scheduling(build_simulator, multirate):
+    """Both modes advance chemistry by one hour per plant minute"""
+    with verbosity('silent'):
+        simulator = build_simulator(multirate=multirate, subsystem_periods={'chemistry': 30.0})
+        chemistry = simulator.secondary_physics.water_chemistry
+        controller = simulator.secondary_physics.ph_control_system.controller
+        start = (chemistry.operating_hours, controller.state.operating_hours)
+        for _ in range(31):
+            simulator.step()
+
+    counts = simulator.secondary_physics.scheduler.get_update_counts()
+    assert counts['chemistry'] == (2 if multirate else 31)  # Minutes 1 and 31 when scheduled
+    # pH control runs with the chemistry update; water chemistry is also advanced by
+    # the feedwater water-quality update every step
+    assert controller.state.operating_hours - start[1] == pytest.approx(chemistry_hours(31.0))
+    assert chemistry.operating_hours - start[0] == pytest.approx(2 * chemistry_hours(31.0))
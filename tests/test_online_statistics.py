@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Online Statistics Tests
+
+Tests for the streaming per-variable statistics maintained by StateManager:
+agreement with batch statistics, P² quantile accuracy, and summaries that
+cover the whole run after the history wraps or when history is disabled.
+"""
+
+import sys
+import warnings
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add project root to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nuclear_simulator.simulator.state.online_statistics import OnlineStatistics
+from nuclear_simulator.simulator.state.state_history import StateHistoryBuffer
+from nuclear_simulator.simulator.state.state_manager import StateManager
+from tests.base_test import StubProvider
+
+T0 = datetime(2025, 1, 1)
+
+
+def test_matches_batch_statistics():
+    """Welford moments are exact and P² quantiles track the sample quantiles"""
+    rng = np.random.default_rng(3)
+    samples = np.column_stack([rng.normal(5.0, 2.0, 4000), rng.exponential(1.0, 4000)])
+    samples[100:300, 1] = np.nan
+
+    buffer = StateHistoryBuffer(max_rows=50)
+    stats = OnlineStatistics(quantiles=(0.1, 0.5, 0.9))
+    for i, (a, b) in enumerate(samples):
+        pos = buffer.append(T0 + timedelta(minutes=i), {'a': a, 'b': None if np.isnan(b) else b,
+                                                        'mode': 'run'})
+        stats.update(buffer.row_view(pos))
+
+    frame = pd.DataFrame(samples, columns=['a', 'b'])
+    summary = stats.summary()
+    for name in ['a', 'b']:
+        column = frame[name]
+        assert summary.loc['count', name] == column.count()
+        assert summary.loc['mean', name] == pytest.approx(column.mean())
+        assert summary.loc['std', name] == pytest.approx(column.std())
+        assert summary.loc['min', name] == column.min()
+        assert summary.loc['max', name] == column.max()
+        for q in (0.1, 0.5, 0.9):
+            assert summary.loc[f'{q * 100:g}%', name] == pytest.approx(column.quantile(q), abs=0.05)
+    assert summary.loc['null_count', 'b'] == 200
+    assert summary.loc['last', 'mode'] == 'run'
+    assert stats.first_time == pd.Timestamp(T0)
+    assert stats.last_time == pd.Timestamp(T0 + timedelta(minutes=3999))
+
+
+def test_short_series_and_plain_mappings():
+    """Up to five values give exact quantiles; dict rows use the same accumulators"""
+    stats = OnlineStatistics()
+    for value in [3.0, 1.0, 2.0]:
+        stats.update({'time': T0, 'x': value, 'flag': True})
+
+    x = stats.get('x')
+    assert x['count'] == 3 and x['mean'] == 2.0 and x['variance'] == 1.0
+    assert x['50%'] == 2.0 and x['25%'] == 1.5
+    assert stats.get('flag')['mean'] == 1.0
+    assert stats.get('missing') is None
+    with pytest.raises(ValueError):
+        OnlineStatistics(quantiles=(0.5, 1.0))
+
+
+@pytest.mark.parametrize('record_history', [True, False])
+def test_summary_covers_whole_run(record_history, tmp_path):
+    """Statistics survive history wrapping and work with history storage disabled"""
+    manager = StateManager(max_rows=10, record_history=record_history)
+    pump = StubProvider(flow=0.0)
+    manager.register_provider(pump, 'secondary.feedwater')
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')  # History wrap warning
+        for minute in range(100):
+            pump.values['flow'] = float(minute)
+            manager.collect_states(T0 + timedelta(minutes=minute))
+
+    assert len(manager.data) == (10 if record_history else 1)
+    stats = manager.get_variable_statistics('secondary.feedwater.flow')
+    assert stats['count'] == 100 and stats['mean'] == 49.5 and stats['last'] == 99.0
+
+    info = manager.get_data_info()
+    assert info['time_range'] == (pd.Timestamp(T0), pd.Timestamp(T0 + timedelta(minutes=99)))
+    assert info['collected_rows'] == 100
+
+    path = tmp_path / 'summary.csv'
+    manager.export_summary_statistics(str(path))
+    exported = pd.read_csv(path, index_col=0)
+    assert float(exported.loc['min', 'secondary.feedwater.flow']) == 0.0
+
+    manager.clear_data()
+    assert manager.get_summary_statistics().empty
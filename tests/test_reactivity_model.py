@@ -183,7 +183,7 @@ class ReactivityModelTests(BaseTest):
         TestAssertions.assert_equal(xenon_0, 0.0, "Zero xenon should give zero reactivity")
         
         # Test equilibrium xenon concentration
-        eq_xenon = 1.0e15  # atoms/cm³
+        eq_xenon = self.model.calculate_equilibrium_fission_products(1e13)["xenon"]
         xenon_eq = self.model.calculate_xenon_reactivity(eq_xenon, 1e13)
         TestAssertions.assert_less(xenon_eq, 0, "Xenon should give negative reactivity")
         TestAssertions.assert_in_range(xenon_eq, -3000, -1000, 
@@ -203,7 +203,7 @@ class ReactivityModelTests(BaseTest):
         TestAssertions.assert_equal(sm_0, 0.0, "Zero samarium should give zero reactivity")
         
         # Test equilibrium samarium concentration
-        eq_sm = 5.0e14  # atoms/cm³
+        eq_sm = self.model.calculate_equilibrium_fission_products(1e13)["samarium"]
         sm_eq = self.model.calculate_samarium_reactivity(eq_sm)
         TestAssertions.assert_less(sm_eq, 0, "Samarium should give negative reactivity")
         TestAssertions.assert_in_range(sm_eq, -1000, -300, 
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Simulator Logging Tests
+
+Tests for the console logging layer: stdout output at normal verbosity,
+quiet/silent levels, lazy message formatting, the verbosity context and
+tracebacks of caught exceptions going through the logger.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nuclear_simulator.simulator import sim_logging
+from nuclear_simulator.simulator.sim_logging import get_logger, get_verbosity, set_verbosity, verbosity
+from nuclear_simulator.simulator.state.interfaces import StateCategory
+from nuclear_simulator.simulator.state.state_manager import StateManager
+
+
+class CountingArg:
+    """Message argument that records how often it is formatted"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __str__(self):
+        self.calls += 1
+        return 'value'
+
+
+@pytest.fixture(autouse=True)
+def restore_verbosity():
+    previous = get_verbosity()
+    yield
+    set_verbosity(previous)
+
+
+def test_normal_verbosity_writes_plain_messages_to_stdout(capsys):
+    set_verbosity('normal')
+    logger = get_logger('tests.sim_logging')
+    logger.info("STATE MANAGER: Applied %d thresholds to %s", 3, 'FWP-1')
+    logger.debug("hidden diagnostic")
+
+    assert capsys.readouterr().out == "STATE MANAGER: Applied 3 thresholds to FWP-1\n"
+    assert logger.name == 'nuclear_simulator.tests.sim_logging'
+
+
+def test_quiet_keeps_warnings_and_skips_formatting(capsys):
+    set_verbosity('normal')
+    logger = get_logger('tests.sim_logging')
+    arg = CountingArg()
+    with verbosity('quiet'):
+        logger.info("expensive %s", arg)
+        assert arg.calls == 0
+        logger.warning("careful %s", arg)
+        assert not sim_logging.is_enabled(sim_logging.INFO)
+
+    assert capsys.readouterr().out == "careful value\n"
+    assert get_verbosity() == sim_logging.INFO
+
+
+def test_silent_and_invalid_levels(capsys):
+    logger = get_logger('tests.sim_logging')
+    set_verbosity('silent')
+    logger.error("not shown")
+    assert capsys.readouterr().out == ""
+
+    assert set_verbosity('debug') == sim_logging.SILENT
+    assert get_verbosity() == sim_logging.DEBUG
+    with pytest.raises(ValueError):
+        set_verbosity('chatty')
+
+
+def test_caught_exceptions_are_logged_with_traceback(capsys, monkeypatch):
+    """Registration failures go through the logger (and its verbosity), not raw stderr prints"""
+    class Pump:
+        def get_state_dict(self):
+            return {'flow': 1.0}
+
+    def broken_metadata(*args):
+        raise RuntimeError("no metadata")
+
+    manager = StateManager(max_rows=10)
+    monkeypatch.setattr(manager, '_generate_component_metadata', broken_metadata)
+
+    set_verbosity('normal')
+    manager.register_instance(Pump(), 'FWP-1A', StateCategory.SECONDARY, 'feedwater')
+    captured = capsys.readouterr()
+    assert "Failed to generate metadata for FWP-1A: no metadata" in captured.out
+    assert "Traceback" in captured.out and "RuntimeError: no metadata" in captured.out
+    assert captured.err == ""
+
+    with verbosity('silent'):
+        manager.register_instance(Pump(), 'FWP-1B', StateCategory.SECONDARY, 'feedwater')
+    assert capsys.readouterr() == ("", "")
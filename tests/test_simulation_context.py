@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Simulation Context Tests
+
+Tests for per-simulator registries: plants built back to back or concurrently
+in threads each discover only their own components, get the same
+auto-generated IDs and keep separate maintenance orchestrators.
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nuclear_simulator.simulator.sim_logging import verbosity
+from nuclear_simulator.simulator.state import SimulationContext, StateManager, auto_register, current_context
+
+
+@auto_register("SECONDARY", "feedwater", "TST", allow_no_id=True)
+class _ContextProbe:
+    def get_state_dict(self):
+        return {'flow_rate': 1.0}
+
+
+def _owned_instances(simulator):
+    return {instance_id: info['instance']
+            for instance_id, info in simulator.state_manager._registered_instances.items()}
+
+
+def test_context_scopes_registration():
+    context = SimulationContext()
+    with context.activate():
+        assert current_context() is context
+        probe = _ContextProbe()
+    assert current_context() is not context
+    assert probe._instance_id == 'TST-001'
+
+    state_manager = StateManager(context=context, online_statistics=False)
+    state_manager.discover_registered_components()
+    assert list(state_manager._registered_instances) == ['TST-001']
+    assert context.component_registry.get_component('TST-001')['instance'] is probe
+    assert not context.pending_registrations
+
+
+def test_back_to_back_simulators_are_isolated(build_simulator):
+    with verbosity('silent'):
+        first = build_simulator()
+        second = build_simulator()
+
+    first_instances, second_instances = _owned_instances(first), _owned_instances(second)
+    assert first_instances and set(first_instances) == set(second_instances)
+    assert all(first_instances[i] is not second_instances[i] for i in first_instances)
+    assert first.context.maintenance_orchestrator is not second.context.maintenance_orchestrator
+
+    with verbosity('silent'):
+        first.step()
+    assert second.state_manager.data.empty
+
+
+def test_concurrent_construction_in_threads(build_simulator):
+    def build(_):
+        simulator = build_simulator()
+        return simulator, _owned_instances(simulator)
+
+    with verbosity('silent'), ThreadPoolExecutor(max_workers=4) as pool:
+        built = list(pool.map(build, range(4)))
+
+    expected = set(built[0][1])
+    owners = {}
+    for simulator, instances in built:
+        assert set(instances) == expected
+        for instance in instances.values():
+            assert owners.setdefault(id(instance), simulator) is simulator
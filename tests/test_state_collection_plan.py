@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+State Collection Plan Tests
+
+Tests for the compiled per-step collection used by StateManager.collect_states:
+plan reuse, fallback on changing keys/types, recompilation when providers
+register or unregister, and rows that stay valid after the buffer wraps.
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nuclear_simulator.simulator.state.state_manager import StateManager
+
+T0 = datetime(2025, 1, 1)
+
+
+class Pump:
+    """Auto-register style provider (get_state_dict, names prefixed by category)"""
+
+    def __init__(self):
+        self.state = {'flow': 1.0, 'running': True, 'status': 'running'}
+
+    def get_state_dict(self):
+        return dict(self.state)
+
+    def get_state_variables(self):
+        return {}
+
+
+class Reactor:
+    """StateProvider style provider (get_current_state, full names)"""
+
+    def __init__(self):
+        self.power = 100.0
+
+    def get_current_state(self):
+        return {'primary.core.power': self.power}
+
+    def get_state_variables(self):
+        return {}
+
+
+def _collect(manager: StateManager, steps: int, start: int = 0) -> None:
+    for i in range(start, start + steps):
+        manager.collect_states(T0 + timedelta(minutes=i))
+
+
+def test_plan_is_compiled_once_and_reused():
+    """Steady providers keep one plan and produce the same rows as before"""
+    manager = StateManager(max_rows=100)
+    pump, reactor = Pump(), Reactor()
+    manager.register_provider(pump, 'secondary.feedwater')
+    manager.register_provider(reactor, 'primary')
+
+    _collect(manager, 1)
+    plan = manager._plan
+    for i in range(1, 5):
+        pump.state['flow'] = float(i)
+        reactor.power = 100.0 + i
+        row = manager.collect_states(T0 + timedelta(minutes=i))
+
+    assert manager._plan is plan
+    assert row['secondary.feedwater.flow'] == 4.0
+    assert row['primary.core.power'] == 104.0
+    frame = manager.data
+    assert frame['secondary.feedwater.flow'].tolist() == [1.0, 1.0, 2.0, 3.0, 4.0]
+    assert frame['secondary.feedwater.running'].dtype == bool
+    assert frame['secondary.feedwater.status'].tolist() == ['running'] * 5
+
+
+def test_changing_keys_and_types_fall_back():
+    """New variables, missing values and type changes go through promotion"""
+    manager = StateManager(max_rows=100)
+    pump = Pump()
+    manager.register_provider(pump, 'secondary.feedwater')
+    _collect(manager, 2)
+
+    pump.state['flow'] = 'tripped'
+    pump.state['vibration'] = 0.5
+    _collect(manager, 1, start=2)
+    pump.state['flow'] = None
+    _collect(manager, 1, start=3)
+    pump.state['flow'] = 7.0
+    _collect(manager, 2, start=4)
+
+    frame = manager.data
+    assert frame['secondary.feedwater.flow'].tolist() == [1.0, 1.0, 'tripped', None, 7.0, 7.0]
+    assert np.isnan(frame['secondary.feedwater.vibration'].iloc[0])
+    assert frame['secondary.feedwater.vibration'].iloc[-1] == 0.5
+
+
+def test_register_and_unregister_recompile():
+    """Provider list changes invalidate the plan"""
+    manager = StateManager(max_rows=100)
+    pump, reactor = Pump(), Reactor()
+    manager.register_provider(pump, 'secondary.feedwater')
+    _collect(manager, 2)
+
+    manager.register_provider(reactor, 'primary')
+    assert manager._plan is None
+    _collect(manager, 2, start=2)
+    assert manager.unregister_provider(reactor)
+    assert not manager.unregister_provider(reactor)
+    _collect(manager, 1, start=4)
+
+    power = manager.data['primary.core.power']
+    assert power.isna().tolist() == [True, True, False, False, True]
+
+
+def test_clear_data_rebinds_columns():
+    """Dropping the buffer schema does not leave stale column slots"""
+    manager = StateManager(max_rows=100)
+    manager.register_provider(Pump(), 'secondary.feedwater')
+    _collect(manager, 3)
+    manager.clear_data()
+    _collect(manager, 2)
+
+    frame = manager.data
+    assert len(frame) == 2
+    assert frame['secondary.feedwater.flow'].tolist() == [1.0, 1.0]
+
+
+def test_time_range_accepts_elapsed_minutes():
+    """Numeric time_range bounds are elapsed minutes since start_datetime"""
+    manager = StateManager(max_rows=100)
+    manager.start_datetime = T0
+    pump = Pump()
+    manager.register_provider(pump, 'secondary.feedwater')
+    for i in range(10):
+        pump.state['flow'] = float(i)
+        manager.collect_states(T0 + timedelta(minutes=i))
+
+    by_minutes = manager.get_variable_history('secondary.feedwater.flow', (3, 6.5))
+    by_datetime = manager.get_variable_history(
+        'secondary.feedwater.flow', (T0 + timedelta(minutes=3), T0 + timedelta(minutes=6.5)))
+    assert by_minutes.tolist() == [3.0, 4.0, 5.0, 6.0]
+    assert by_minutes.index.tolist() == [3, 4, 5, 6]
+    assert by_datetime.equals(by_minutes)
+
+    frame = manager.get_time_series(['secondary.feedwater.flow'], (8, None))
+    assert frame['secondary.feedwater.flow'].tolist() == [8.0, 9.0]
+
+
+def test_retained_row_survives_buffer_wrap():
+    """A returned row keeps its values after its ring buffer slot is overwritten"""
+    manager = StateManager(max_rows=3)
+    pump = Pump()
+    manager.register_provider(pump, 'secondary.feedwater')
+
+    kept = manager.collect_states(T0)
+    for i in range(1, 5):
+        pump.state.update(flow=float(i + 1), status='tripped')
+        manager.collect_states(T0 + timedelta(minutes=i))
+    pump.state['vibration'] = 0.5
+    manager.collect_states(T0 + timedelta(minutes=5))
+
+    assert manager._history.overwritten_rows > 0
+    assert dict(kept) == {'time': T0, 'secondary.feedwater.flow': 1.0,
+                          'secondary.feedwater.running': True, 'secondary.feedwater.status': 'running'}
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+State History Buffer Tests
+
+Tests for the columnar ring buffer that backs StateManager history:
+append, in-place wrapping, schema growth and DataFrame materialization.
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nuclear_simulator.simulator.state.state_history import StateHistoryBuffer
+
+T0 = datetime(2025, 1, 1)
+
+
+def _row(i: int) -> dict:
+    return {
+        'secondary.feedwater.flow': float(i),
+        'secondary.feedwater.running': i % 2 == 0,
+        'secondary.feedwater.starts': i,
+        'secondary.feedwater.status': 'running',
+    }
+
+
+def test_append_and_materialize():
+    """Rows come back in order with the dtypes providers reported"""
+    buffer = StateHistoryBuffer(max_rows=100, initial_capacity=2)
+    for i in range(10):
+        buffer.append(T0 + timedelta(minutes=i), _row(i))
+
+    frame = buffer.to_frame()
+    assert len(frame) == 10
+    assert list(frame.columns) == ['time'] + list(_row(0).keys())
+    assert frame['secondary.feedwater.flow'].tolist() == [float(i) for i in range(10)]
+    assert frame['secondary.feedwater.running'].dtype == bool
+    assert frame['secondary.feedwater.starts'].dtype == np.int64
+    assert frame['secondary.feedwater.status'].iloc[-1] == 'running'
+    assert buffer.latest('secondary.feedwater.starts') == 9
+
+
+def test_wraps_in_place_at_max_rows():
+    """Once full, the oldest rows are overwritten without reallocating"""
+    buffer = StateHistoryBuffer(max_rows=5, initial_capacity=5)
+    for i in range(5):
+        buffer.append(T0 + timedelta(minutes=i), _row(i))
+    block = buffer._numeric
+
+    for i in range(5, 12):
+        buffer.append(T0 + timedelta(minutes=i), _row(i))
+
+    assert buffer._numeric is block
+    assert len(buffer) == 5
+    assert buffer.overwritten_rows == 7
+    assert buffer.column_values('secondary.feedwater.flow').tolist() == [7.0, 8.0, 9.0, 10.0, 11.0]
+    rows = buffer.time_selection(T0 + timedelta(minutes=8), T0 + timedelta(minutes=9))
+    assert buffer.column_values('secondary.feedwater.starts', rows).tolist() == [8, 9]
+
+
+def test_unbounded_when_not_wrapping():
+    """wrap=False keeps every row"""
+    buffer = StateHistoryBuffer(max_rows=3, wrap=False, initial_capacity=1)
+    for i in range(20):
+        buffer.append(T0 + timedelta(minutes=i), _row(i))
+    assert len(buffer) == 20
+    assert buffer.overwritten_rows == 0
+
+
+def test_schema_growth_and_type_promotion():
+    """Late columns read as missing before they appear; mixed types fall back to object"""
+    buffer = StateHistoryBuffer(max_rows=10)
+    buffer.append(T0, {'a.b.x': 1})
+    buffer.append(T0 + timedelta(minutes=1), {'a.b.x': 'tripped', 'a.b.y': 2.5})
+
+    frame = buffer.to_frame()
+    assert frame['a.b.x'].tolist() == [1, 'tripped']
+    assert np.isnan(frame['a.b.y'].iloc[0])
+    assert frame['a.b.y'].iloc[1] == 2.5
+
+
+def test_set_latest():
+    """set_latest overwrites the most recent row only"""
+    buffer = StateHistoryBuffer(max_rows=10)
+    for i in range(3):
+        buffer.append(T0 + timedelta(minutes=i), _row(i))
+    buffer.set_latest('secondary.feedwater.flow', 99.0)
+    assert buffer.column_values('secondary.feedwater.flow').tolist() == [0.0, 1.0, 99.0]
+
+
+def test_time_slice_binary_search_on_wrapped_ring():
+    """Sorted time queries return slices and views that match a full scan"""
+    buffer = StateHistoryBuffer(max_rows=8, initial_capacity=8)
+    for i in range(13):
+        buffer.append(T0 + timedelta(minutes=i), _row(i))
+    assert buffer.time_sorted and buffer._start != 0
+
+    for start, end in [(6, 9), (5, 12), (0, 20), (7, 7), (10, 3), (None, 8), (9, None)]:
+        rows = buffer.time_selection(None if start is None else T0 + timedelta(minutes=start),
+                                     None if end is None else T0 + timedelta(minutes=end))
+        assert isinstance(rows, slice)
+        expected = [float(i) for i in range(13)
+                    if i >= 5 and (start is None or i >= start) and (end is None or i <= end)]
+        assert buffer.column_values('secondary.feedwater.flow', rows).tolist() == expected
+
+    # A window inside one physical segment is a view, not a copy
+    rows = buffer.time_slice(T0 + timedelta(minutes=9), T0 + timedelta(minutes=11))
+    assert np.shares_memory(buffer.column_values('secondary.feedwater.flow', rows), buffer._numeric)
+    assert buffer.time_bounds() == (T0 + timedelta(minutes=5), T0 + timedelta(minutes=12))
+
+
+def test_out_of_order_times_fall_back_to_scan():
+    """Unsorted timestamps disable binary search until the rows are reset or overwritten"""
+    buffer = StateHistoryBuffer(max_rows=10)
+    for i in [0, 1, 5, 2, 3]:
+        buffer.append(T0 + timedelta(minutes=i), _row(i))
+    assert not buffer.time_sorted
+
+    rows = buffer.time_selection(T0 + timedelta(minutes=1), T0 + timedelta(minutes=3))
+    assert rows.tolist() == [1, 3, 4]
+    assert buffer.time_bounds() == (T0, T0 + timedelta(minutes=5))
+
+    buffer.reset_rows()
+    assert buffer.time_sorted
+
+
+def test_wrapping_past_out_of_order_rows_restores_binary_search():
+    """Binary search resumes once the row before the last out-of-order one is overwritten"""
+    buffer = StateHistoryBuffer(max_rows=4, initial_capacity=4)
+    for i in [0, 1, 5, 2, 3, 4]:
+        buffer.append(T0 + timedelta(minutes=i), _row(i))
+    assert not buffer.time_sorted  # Holds 5, 2, 3, 4
+
+    buffer.append(T0 + timedelta(minutes=6), _row(6))
+    assert buffer.time_sorted  # Holds 2, 3, 4, 6
+    rows = buffer.time_selection(T0 + timedelta(minutes=3), T0 + timedelta(minutes=4))
+    assert isinstance(rows, slice)
+    assert buffer.column_values('secondary.feedwater.flow', rows).tolist() == [3.0, 4.0]
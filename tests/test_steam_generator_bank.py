@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Steam Generator Bank Tests
+
+Tests for the array-backed steam generator bank: agreement of the bank update
+with stored results of the per-SG update it replaced, per-SG views writing
+through to the bank arrays, the vectorized flow restrictions against the
+per-SG reporting helpers, and checkpoint round trips.
+"""
+
+import pickle
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nuclear_simulator.simulator.sim_logging import verbosity
+from nuclear_simulator.systems.secondary.steam_generator.enhanced_physics import EnhancedSteamGeneratorPhysics
+
+
+def _conditions(step, num_sgs):
+    """Different primary and feedwater conditions per SG, including low-flow edge cases"""
+    scale = 1.0 + 0.2 * np.sin(step / 10.0)
+    primary_conditions = {
+        'inlet_temps': [327.0 - 4.0 * i for i in range(num_sgs)],
+        'outlet_temps': [293.0 + 2.0 * i for i in range(num_sgs)],
+        'flow_rates': [5700.0 * scale * (1.0 - 0.1 * i) if step < 30 else 50.0 for i in range(num_sgs)],
+    }
+    feedwater_flows = [555.0 * scale * (1.0 + 0.05 * i) if step % 20 else 0.0 for i in range(num_sgs)]
+    return primary_conditions, feedwater_flows, scale
+
+
+# Per-SG results of the scenario in _conditions (dt = 2 minutes) from the
+# EnhancedSteamGeneratorPhysics that updated each SG on its own, before the bank
+BASELINE = {
+    9: {
+        'secondary_pressure': [6.698728301, 6.502026588, 6.348107365],
+        'secondary_temperature': [247.4030516, 245.6556065, 244.2795931],
+        'steam_quality': [0.9924919409, 0.9924919409, 0.9924919409],
+        'heat_transfer_rate': [1165641105, 863945760.4, 603390689.8],
+        'steam_flow_rate': [499.9999996, 499.9999996, 499.9999996],
+    },
+    19: {
+        'secondary_pressure': [6.777650892, 6.418428661, 6.12009919],
+        'secondary_temperature': [248.163905, 244.7718455, 241.8408947],
+        'steam_quality': [0.993731787, 0.9937419279, 0.9937419279],
+        'heat_transfer_rate': [1198488675, 888291606.4, 620394137.8],
+        'steam_flow_rate': [499.9999992, 499.9999992, 499.9999993],
+    },
+    29: {
+        'secondary_pressure': [6.630349953, 6.172130759, 5.79581994],
+        'secondary_temperature': [246.8041854, 242.2600216, 238.2974718],
+        'steam_quality': [0.9943638494, 0.9943689361, 0.9943689361],
+        'heat_transfer_rate': [1055981181, 782668404.6, 546625552.4],
+        'steam_flow_rate': [499.9999987, 499.9999988, 465.7110515],
+    },
+    39: {
+        'secondary_pressure': [5.905986603, 5.577658203, 5.308019719],
+        'secondary_temperature': [240.0036583, 236.2732894, 233.0612033],
+        'steam_quality': [0.9946808993, 0.9946834509, 0.9946834509],
+        'heat_transfer_rate': [0.0, 0.0, 0.0],
+        'steam_flow_rate': [431.2233841, 431.2233841, 431.2233841],
+    },
+}
+
+
+@pytest.fixture
+def system():
+    with verbosity('silent'):
+        yield EnhancedSteamGeneratorPhysics()
+
+
+def test_bank_matches_per_sg_baseline(system):
+    """The bank update reproduces the results of updating each SG on its own"""
+    num_sgs = len(system.steam_generators)
+    with verbosity('silent'):
+        for step in range(40):
+            primary_conditions, feedwater_flows, scale = _conditions(step, num_sgs)
+            result = system.update_system(primary_conditions, {'load_demand_fraction': scale},
+                                          {'actual_feedwater_flows': feedwater_flows}, dt=2.0)
+            if step not in BASELINE:
+                continue
+            for key, expected in BASELINE[step].items():
+                actual = [sg_result[key] for sg_result in result['sg_individual_results']]
+                # Later steam property changes moved temperatures by up to 5e-7
+                assert actual == pytest.approx(expected, rel=1e-6), (step, key)
+
+    assert result['sg_pressures'] == [sg.secondary_pressure for sg in system.steam_generators]
+    assert result['total_thermal_power'] == pytest.approx(
+        sum(r['heat_transfer_rate'] for r in result['sg_individual_results']))
+
+
+def test_generators_are_views_of_the_bank(system):
+    bank = system.bank
+    sg = system.steam_generators[1]
+    assert all(member._bank is bank for member in system.steam_generators)
+
+    sg.water_level = 10.0
+    bank.secondary_pressure[1] = 6.5
+
+    assert bank.water_level[1] == 10.0
+    assert sg.secondary_pressure == 6.5
+    assert sg.get_state_dict()['water_level'] == 10.0
+    assert system.steam_generators[0].water_level != 10.0
+
+
+def test_flow_restrictions_match_reporting_helpers(system):
+    """The vectorized restrictions agree with the per-SG helpers used for state reporting"""
+    for i, sg in enumerate(system.steam_generators):
+        sg.tsp_fouling.pressure_drop_ratio = 1.0 + 0.4 * i
+        sg.tube_interior_fouling.scale_thickness = 2.0 * i
+    bank = system.bank
+    ratios = np.array([sg.tsp_fouling.pressure_drop_ratio for sg in system.steam_generators])
+    thickness = np.array([sg.tube_interior_fouling.scale_thickness for sg in system.steam_generators])
+    requested = np.full(len(bank), 600.0)
+
+    steam, feedwater, restriction = bank.tsp_flow_restrictions(requested, requested, ratios)
+    primary, primary_restriction = bank.primary_flow_restrictions(requested * 10.0, thickness)
+
+    for i, sg in enumerate(system.steam_generators):
+        assert sg._apply_tsp_flow_restrictions(600.0, 600.0) == pytest.approx(
+            (steam[i], feedwater[i], restriction[i]), rel=1e-15)
+        assert sg._calculate_primary_flow_restriction(6000.0) == pytest.approx(
+            (primary[i], primary_restriction[i]), rel=1e-15)
+        assert sg.calculate_effective_heat_transfer_area(9.0 + i) == pytest.approx(
+            bank.effective_heat_transfer_area(np.array([9.0 + i]), [i])[0], rel=1e-15)
+
+
+def test_checkpoint_round_trip(system):
+    """A pickled system keeps its SGs attached to its own copy of the bank"""
+    primary_conditions, feedwater_flows, _ = _conditions(0, len(system.steam_generators))
+    with verbosity('silent'):
+        system.update_system(primary_conditions, {}, {'actual_feedwater_flows': feedwater_flows})
+        restored = pickle.loads(pickle.dumps(system))
+
+        assert restored.bank is not system.bank
+        assert all(sg._bank is restored.bank for sg in restored.steam_generators)
+        assert [sg.water_level for sg in restored.steam_generators] == system.bank.water_level.tolist()
+
+        original = system.update_system(primary_conditions, {}, {'actual_feedwater_flows': feedwater_flows})
+        resumed = restored.update_system(primary_conditions, {}, {'actual_feedwater_flows': feedwater_flows})
+
+    assert resumed['sg_individual_results'] == original['sg_individual_results']
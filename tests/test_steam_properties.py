@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Steam Property Module Tests
+
+Tests for the shared water/steam properties: table interpolation error
+against the exact correlations, scalar/array consistency, and the
+component-calibrated values the tables replace.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nuclear_simulator.systems.secondary.steam_properties import (
+    CORRELATIONS,
+    SteamProperties,
+    compressed_liquid_enthalpy,
+)
+
+
+@pytest.mark.parametrize('correlation', sorted(CORRELATIONS))
+def test_tables_stay_within_tolerance(correlation):
+    table = SteamProperties(correlation, tolerance=1e-5)
+    exact = SteamProperties(correlation, exact=True)
+    pressure = np.exp(np.random.default_rng(0).uniform(np.log(1e-4), np.log(30.0), 50000))
+
+    table_t, table_h = table.saturation(pressure)
+    exact_t, exact_h = exact.saturation(pressure)
+
+    assert table.table.max_error <= 1e-5
+    assert np.max(np.abs(table_t - exact_t) / np.maximum(np.abs(exact_t), 1.0)) <= 2e-5
+    assert np.max(np.abs(table_h - exact_h) / np.maximum(np.abs(exact_h), 1.0)) <= 2e-5
+
+
+@pytest.mark.parametrize('exact', [False, True])
+def test_scalar_and_array_paths_agree(exact):
+    properties = SteamProperties('antoine', exact=exact)
+    pressure = np.array([0.0005, 0.007, 0.5, 0.95, 6.895, 15.0, 40.0])
+    temperature = np.array([30.0, 40.0, 150.0, 20.0, 290.0, 320.0, 400.0])
+
+    scalar = [properties.steam_enthalpy(float(t), float(p)) for t, p in zip(temperature, pressure)]
+    array = properties.steam_enthalpy(temperature, pressure)
+
+    assert isinstance(scalar[0], float)
+    np.testing.assert_allclose(array, scalar, rtol=1e-12)
+
+
+def test_exact_mode_reproduces_component_correlations():
+    """Values the turbine (Antoine) and steam generators (NIST fit) were calibrated on"""
+    antoine = SteamProperties('antoine', exact=True)
+    nist_fit = SteamProperties('nist_fit', exact=True)
+
+    assert antoine.saturation_temperature(6.895) == pytest.approx(1730.63 / (8.07131 - np.log10(68.95)) - 233.426)
+    assert antoine.saturation_temperature(0.0005) == 10.0
+    ln_p = np.log(68.95)
+    assert nist_fit.saturation_temperature(6.895) == pytest.approx(
+        42.6776 + 34.5194 * ln_p + 2.8896 * ln_p ** 2 + 0.1153 * ln_p ** 3)
+
+    t_sat = nist_fit.saturation_temperature(6.895)
+    assert nist_fit.saturation_enthalpy_vapor(6.895) == pytest.approx(
+        4.18 * t_sat + 2257.0 * (1.0 - t_sat / 374.0) ** 0.38)
+    assert compressed_liquid_enthalpy(227.0, 7.0) == pytest.approx(4.18 * 227.0 + 0.001 * 6.9 * 227.0)
+
+
+def test_unknown_correlation_is_rejected():
+    with pytest.raises(ValueError):
+        SteamProperties('iapws')
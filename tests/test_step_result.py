@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Step Result Tests
+
+Tests for the lazily built step results: entries computed once on first
+access, whole-dict operations seeing every entry, expiry dropping unread
+entries when the owning system advances, and pickling of results.
+"""
+
+import gc
+import json
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nuclear_simulator.simulator.core.step_result import StepResult, StepResultLog
+from nuclear_simulator.simulator.sim_logging import verbosity
+from nuclear_simulator.systems.secondary import SecondaryReactorPhysics
+
+# The plant systems import the results as simulator.core.*: use the same module
+from simulator.core import step_result as plant_step_result
+
+
+class Counter:
+    """Factory counting its calls"""
+
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+def test_lazy_entries_are_computed_once():
+    factory = Counter({'pressure': 6.9})
+    result = StepResult({'power': 1000.0}, lazy={'detail': factory})
+
+    assert 'detail' in result and len(result) == 2
+    assert result.pending == ['detail']
+    assert factory.calls == 0
+
+    assert result['detail'] == {'pressure': 6.9}
+    assert result.get('detail') is result['detail']
+    assert result.get('missing', 0.0) == 0.0
+    assert factory.calls == 1 and result.pending == []
+    with pytest.raises(KeyError):
+        result['missing']
+
+
+def test_whole_dict_operations_see_every_entry():
+    result = StepResult({'power': 1000.0}, lazy={'detail': lambda: [1, 2]})
+    assert list(result) == ['power', 'detail']
+    assert dict(StepResult({'a': 1}, lazy={'b': lambda: 2})) == {'a': 1, 'b': 2}
+    assert StepResult({'a': 1}, lazy={'b': lambda: 2}) == StepResult(lazy={'a': lambda: 1, 'b': lambda: 2})
+    assert json.loads(json.dumps(StepResult({'a': 1}, lazy={'b': lambda: 2}))) == {'a': 1, 'b': 2}
+
+    factory = Counter('computed')
+    overridden = StepResult(lazy={'detail': factory})
+    overridden['detail'] = 'stored'
+    overridden.update(extra=1)
+    assert overridden == {'detail': 'stored', 'extra': 1}
+    assert overridden.pop('detail') == 'stored' and factory.calls == 0
+
+
+def test_expiry_drops_unread_entries():
+    read_factory, unread_factory, dropped_factory = Counter(1.0), Counter(2.0), Counter(3.0)
+    log = StepResultLog()
+    retained = StepResult({'power': 1000.0}, lazy={'read': read_factory, 'unread': unread_factory})
+    assert retained['read'] == 1.0
+    log.append(retained)
+    log.append(StepResult(lazy={'detail': dropped_factory}))
+    gc.collect()
+    assert len(log) == 1
+
+    log.expire()
+
+    assert len(log) == 0 and retained.pending == [] and retained.expired == ['unread']
+    assert retained == {'power': 1000.0, 'read': 1.0}
+    assert 'unread' not in retained and retained.get('unread') is None
+    with pytest.raises(KeyError, match='expired'):
+        retained['unread']
+    assert (read_factory.calls, unread_factory.calls, dropped_factory.calls) == (1, 0, 0)
+    assert len(pickle.loads(pickle.dumps(log))) == 0
+
+
+def _primary_conditions():
+    conditions = {}
+    for i in range(3):
+        conditions.update({f'sg_{i + 1}_inlet_temp': 327.0, f'sg_{i + 1}_outlet_temp': 293.0,
+                           f'sg_{i + 1}_flow': 5700.0})
+    return conditions
+
+
+def test_secondary_results_describe_their_own_step():
+    primary_conditions = _primary_conditions()
+    with verbosity('silent'):
+        secondary = SecondaryReactorPhysics()
+        first = secondary.update_system(primary_conditions, {'load_demand': 100.0}, dt=1.0)
+        first_state = first['condenser_state']
+        assert first_state == secondary.condenser.get_state_dict()
+
+        unread = secondary.update_system(primary_conditions, {'load_demand': 90.0}, dt=1.0)
+        system_state = secondary.get_system_state()
+        secondary.update_system(primary_conditions, {'load_demand': 80.0}, dt=1.0)
+
+    assert first['condenser_state'] is first_state
+    assert unread.pending == [] and 'turbine_state' in unread.expired
+    assert system_state['turbine_state']  # Monitoring snapshots are plain dicts that stay valid
+    assert 'electrical_power_mw' in unread  # Stored values stay readable
+    with pytest.raises(KeyError):
+        unread['turbine_state']
+
+
+def test_materialized_results_survive_expiry():
+    """A history of results materialized by the caller still reads every key of every step"""
+    primary_conditions = _primary_conditions()
+    history, expected = [], []
+    with verbosity('silent'):
+        secondary = SecondaryReactorPhysics()
+        for load in (100.0, 95.0, 90.0):
+            result = secondary.update_system(primary_conditions, {'load_demand': load}, dt=1.0)
+            history.append(result.materialize())
+            expected.append(secondary.feedwater_system.get_state_dict())
+        secondary.reset_system()
+
+    assert [result['feedwater_state'] for result in history] == expected
+    assert all('water_chemistry_state' in result for result in history)
+
+
+def test_default_loop_builds_no_detailed_states(build_simulator, monkeypatch):
+    """`result = sim.step()` keeps the last result alive without building its lazy states"""
+    built = []
+    missing = plant_step_result.StepResult.__missing__
+
+    def counting_missing(self, key):
+        built.append(key)
+        return missing(self, key)
+
+    monkeypatch.setattr(plant_step_result.StepResult, '__missing__', counting_missing)
+    with verbosity('silent'):
+        simulator = build_simulator()
+        for _ in range(20):
+            result = simulator.step()
+
+    assert built == []
+    assert result['info']['secondary_system']['electrical_power_mw'] > 0.0
+
+
+def test_pickle_round_trip():
+    result = StepResult({'power': 1000.0}, lazy={'detail': Counter({'pressure': 6.9})})
+    restored = pickle.loads(pickle.dumps(result))
+
+    assert isinstance(restored, StepResult)
+    assert restored == {'power': 1000.0, 'detail': {'pressure': 6.9}}
+    assert restored.pending == []
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Maintenance Threshold Plan Tests
+
+Tests for the compiled, vectorized maintenance threshold evaluation used by
+StateManager: comparison semantics, cooldowns, cooldown resets after
+maintenance, and column rebinding when the history schema changes.
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nuclear_simulator.simulator.state.state_manager import StateManager
+from nuclear_simulator.simulator.state.threshold_plan import ThresholdPlan, parameter_candidates
+from tests.base_test import StubProvider
+
+T0 = datetime(2025, 1, 1)
+
+
+def _manager(pump: StubProvider, thresholds: dict) -> StateManager:
+    manager = StateManager(max_rows=1000)
+    manager.start_datetime = T0
+    manager.register_provider(pump, 'secondary.feedwater_FWP-1')
+    manager.apply_maintenance_thresholds('FWP-1', thresholds)
+    manager.events = []
+    manager.subscribe_to_threshold_events(manager.events.append)
+    return manager
+
+
+def _collect(manager: StateManager, minute: int) -> None:
+    manager.collect_states(T0 + timedelta(minutes=minute))
+
+
+def test_comparisons_match_scalar_evaluation():
+    """Every opcode agrees with the per-threshold condition check"""
+    comparisons = ['greater_than', 'less_than', 'greater_equal', 'less_equal',
+                   'equals', 'not_equals', 'unknown']
+    thresholds = {'FWP-1': {f'p{i}': {'threshold': 2.0, 'comparison': c}
+                            for i, c in enumerate(comparisons)}}
+    plan = ThresholdPlan(thresholds)
+    manager = StateManager(max_rows=10)
+
+    for value in [1.0, 2.0, 2.0005, 3.0]:
+        row = {f'FWP-1.p{i}': value for i in range(len(comparisons))}
+        plan.last_violation[:] = np.nan
+        positions, _ = plan.evaluate(0.0, row)
+        expected = [i for i, config in enumerate(thresholds['FWP-1'].values())
+                    if manager._check_threshold_condition(value, config)]
+        assert positions.tolist() == expected
+
+
+def test_batched_events_and_cooldowns():
+    """One batched event per component; violated thresholds wait out their cooldown"""
+    pump = StubProvider(impeller_wear=0.0, oil_level=100.0)
+    manager = _manager(pump, {
+        'impeller_inspection_wear': {'threshold': 5.0, 'comparison': 'greater_than',
+                                     'action': 'impeller_inspection', 'cooldown_hours': 1.0},
+        'oil_level': {'threshold': 60.0, 'comparison': 'less_than',
+                      'action': 'oil_top_off', 'cooldown_hours': 1.0, 'priority': 'HIGH'},
+    })
+
+    _collect(manager, 0)
+    assert manager.events == []
+
+    pump.values.update(impeller_wear=6.0, oil_level=50.0)
+    _collect(manager, 1)
+    assert len(manager.events) == 1
+    event = manager.events[0]
+    assert event['parameter'] == 'multiple_violations'
+    assert [v['parameter'] for v in event['violations']] == ['impeller_inspection_wear', 'oil_level']
+    assert event['violations'][1]['value'] == 50.0
+    assert event['priority'] == 'HIGH'
+
+    for minute in range(2, 61):
+        _collect(manager, minute)
+    assert len(manager.events) == 1
+    _collect(manager, 61)
+    assert len(manager.events) == 2
+
+    # Maintenance that addresses oil_level ends its cooldown immediately
+    manager._reset_threshold_cooldowns_for_maintenance('FWP-1', 'oil_top_off')
+    _collect(manager, 62)
+    assert [v['parameter'] for v in manager.events[-1]['violations']] == ['oil_level']
+
+
+def test_rebinds_when_parameter_appears_later():
+    """Thresholds on variables added after compilation start evaluating"""
+    pump = StubProvider(flow=1.0)
+    manager = _manager(pump, {'vibration_level': {'threshold': 3.0, 'action': 'vibration_analysis'}})
+    _collect(manager, 0)
+    assert manager.events == []
+
+    pump.values['vibration_level'] = 4.0
+    _collect(manager, 1)
+    assert len(manager.events) == 1
+
+
+def test_status_columns_fall_through_to_later_candidates():
+    """Non-numeric values are skipped in favour of the next naming pattern"""
+    pump = StubProvider(oil_level='unknown')
+    manager = _manager(pump, {'oil_level': {'threshold': 60.0, 'comparison': 'less_than',
+                                            'action': 'oil_top_off'}})
+    manager.register_provider(StubProvider(oil_level=40.0), 'secondary.feedwater')
+    assert parameter_candidates('FWP-1', 'oil_level')[1:3] == (
+        'secondary.feedwater_FWP-1.oil_level', 'secondary.feedwater.oil_level')
+
+    _collect(manager, 0)
+    assert manager.events[0]['violations'][0]['value'] == 40.0
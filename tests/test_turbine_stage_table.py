@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Turbine Stage Table Tests
+
+Tests for the array-based stage-by-stage expansion: agreement with the
+per-stage TurbineStage calculation over normal and near-vacuum inlet
+conditions, the lazily built per-stage results, and checkpoint round trips.
+"""
+
+import copy
+import pickle
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nuclear_simulator.simulator.sim_logging import verbosity
+from nuclear_simulator.systems.secondary.turbine.config import TurbineStageSystemConfig
+from nuclear_simulator.systems.secondary.turbine.stage_system import TurbineStageSystem
+from nuclear_simulator.systems.secondary.turbine.stage_table import StageExpansion
+
+EXTRACTION_DEMANDS = {'HP-3': 25.0, 'HP-4': 30.0, 'HP-5': 20.0, 'LP-1': 15.0, 'LP-2': 10.0}
+
+
+def _per_stage_expansion(system, inlet_pressure, inlet_temperature, inlet_flow, extraction_demands):
+    """Reference: the same pressure schedule, expanded one TurbineStage at a time"""
+    table = system.stage_table
+    ratio_base = table.scheduled_ratio_base(inlet_flow)
+    pressure, temperature, flow = inlet_pressure, inlet_temperature, inlet_flow
+    results = {}
+    for slot, stage_id in enumerate(table.stage_ids):
+        outlet_pressure = table.scheduled_outlet_pressure(slot, pressure, ratio_base[slot])
+        result = system.stages[stage_id].calculate_stage_expansion(
+            pressure, temperature, flow, outlet_pressure, extraction_demands.get(stage_id, 0.0))
+        results[stage_id] = result
+        pressure, temperature, flow = result['outlet_pressure'], result['outlet_temperature'], result['outlet_flow']
+    return results
+
+
+@pytest.fixture
+def system():
+    with verbosity('silent'):
+        yield TurbineStageSystem()
+
+
+@pytest.mark.parametrize('inlet', [
+    (6.895, 285.8, 1665.0),     # Rated conditions
+    (7.2, 300.0, 2200.0),       # High flow, superheated
+    (3.0, 240.0, 400.0),        # Part load
+    (0.2, 150.0, 50.0),         # Near vacuum: last stages per stage
+    (0.005, 30.0, 5.0),         # Below condenser pressure: all stages per stage
+])
+def test_expansion_matches_per_stage_calculation(system, inlet):
+    reference = copy.deepcopy(system)
+    with verbosity('silent'):
+        for step in range(3):
+            demands = {stage_id: demand * (1 + step) for stage_id, demand in EXTRACTION_DEMANDS.items()}
+            result = system.calculate_stage_by_stage_expansion(*inlet, demands)
+            expected = _per_stage_expansion(reference, *inlet, demands)
+
+            assert list(result['stages']) == list(expected)
+            for stage_id, stage_result in expected.items():
+                assert result['stages'][stage_id] == pytest.approx(stage_result, rel=1e-12, abs=1e-12)
+                assert system.stages[stage_id].inlet_entropy == pytest.approx(
+                    reference.stages[stage_id].inlet_entropy, rel=1e-12)
+            assert result['total_power'] == pytest.approx(sum(r['power_output'] for r in expected.values()), rel=1e-12)
+
+
+def test_stage_results_are_built_on_lookup(system):
+    with verbosity('silent'):
+        result = system.update_state(6.895, 285.8, 1665.0, 1.0, EXTRACTION_DEMANDS)
+    expansion = result['stage_results']
+    table = system.stage_table
+
+    assert isinstance(expansion, StageExpansion)
+    assert table.stage_ids == tuple(sorted(system.stages, key=lambda s: -system.stages[s].config.design_inlet_pressure))
+    assert 'LP-6' in expansion and 'LP-7' not in expansion
+    assert set(expansion['HP-3']) == set(StageExpansion.FIELDS)
+    assert expansion['LP-6']['outlet_pressure'] == 0.007
+    assert expansion.section_total('power_output', 'HP') == pytest.approx(
+        sum(expansion[stage_id]['power_output'] for stage_id in expansion if 'HP' in stage_id))
+
+    # Stage objects carry the state of the expansion
+    for slot, stage in enumerate(table.stages):
+        assert stage.power_output == expansion.power_output[slot]
+        assert stage.extraction_flow == expansion.extraction_flow[slot]
+    assert result['outlet_conditions']['temperature'] == expansion.outlet_temperature[-1]
+
+
+def test_table_follows_stage_changes():
+    with verbosity('silent'):
+        system = TurbineStageSystem(TurbineStageSystemConfig(hp_stages=8, lp_stages=6))
+        del system.stages['HP-8']
+        result = system.calculate_stage_by_stage_expansion(6.895, 285.8, 1665.0, {})
+
+    assert len(result['stages']) == 13 and 'HP-8' not in result['stages']
+
+
+def test_checkpoint_round_trip(system):
+    with verbosity('silent'):
+        system.update_state(6.895, 285.8, 1665.0, 1.0, EXTRACTION_DEMANDS)
+        restored = pickle.loads(pickle.dumps(system))
+        assert restored.stage_table.stages[0] is restored.stages['HP-1']
+
+        original = system.update_state(6.8, 284.0, 1600.0, 0.95, EXTRACTION_DEMANDS)
+        resumed = restored.update_state(6.8, 284.0, 1600.0, 0.95, EXTRACTION_DEMANDS)
+
+    assert dict(resumed['stage_results']) == dict(original['stage_results'])
+    np.testing.assert_array_equal(resumed['stage_results'].power_output, original['stage_results'].power_output)